@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 
+from game_simulator import simulate_game as simulate_scores
+
 # Silence TensorFlow/CUDA noise BEFORE import (must be set before TF loads)
 import os
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"  # Suppress TF INFO/WARN/ERROR
@@ -926,22 +928,27 @@ class MatchupSpecificModel:
 
 
 class MonteCarloSimulator:
-    """Model 4: Monte Carlo simulation"""
-    def simulate_game(self, team_a_stats, team_b_stats, num_simulations=10000):
-        results = {'team_a_wins': 0, 'team_b_wins': 0, 'scores': []}
-        for _ in range(num_simulations):
-            score_a = np.random.normal(team_a_stats.get('off_rating', 110), 
-                                      team_a_stats.get('off_rating_std', 10))
-            score_b = np.random.normal(team_b_stats.get('off_rating', 110),
-                                      team_b_stats.get('off_rating_std', 10))
-            results['scores'].append((score_a, score_b))
-            if score_a > score_b:
-                results['team_a_wins'] += 1
-            else:
-                results['team_b_wins'] += 1
-        
-        results['team_a_win_pct'] = results['team_a_wins'] / num_simulations
-        return results
+    """Model 4: Monte Carlo simulation (vectorized, see game_simulator.py)"""
+    def simulate_game(self, team_a_stats, team_b_stats, num_simulations=10000,
+                      game_id=None, correlation=0.0):
+        sim = simulate_scores(
+            team_a_stats.get('off_rating', 110),
+            team_b_stats.get('off_rating', 110),
+            home_std=team_a_stats.get('off_rating_std', 10),
+            away_std=team_b_stats.get('off_rating_std', 10),
+            correlation=correlation,
+            num_sims=num_simulations,
+            game_id=game_id,
+        )
+        team_a_wins = int(np.count_nonzero(sim.margin > 0))
+        return {
+            'team_a_wins': team_a_wins,
+            'team_b_wins': num_simulations - team_a_wins,
+            'team_a_win_pct': team_a_wins / num_simulations,
+            'team_a_mean': float(sim.home.mean()),
+            'scores': np.column_stack([sim.home, sim.away]),
+            'simulation': sim,
+        }
 
 
 class LineMovementAnalyzer:
@@ -1149,14 +1156,18 @@ class MasterPredictionSystem:
         )
         
         # Model 4: Monte Carlo (returns distribution)
+        # Seeded per game + subject so repeated requests simulate identically
         player_stats = game_data.get('player_stats', {})
+        sim_key = (f"{game_data['game_id']}:{game_data.get('player_id', '')}"
+                   if game_data.get('game_id') else None)
         mc_result = self.monte_carlo.simulate_game(
             {'off_rating': player_stats.get('expected_value', 27.5),
              'off_rating_std': player_stats.get('std_dev', 6.5)},
             {'off_rating': line, 'off_rating_std': 5.0},
-            num_simulations=10000
+            num_simulations=10000,
+            game_id=sim_key,
         )
-        model_predictions['monte_carlo'] = np.mean([s[0] for s in mc_result['scores'][:100]])
+        model_predictions['monte_carlo'] = mc_result['team_a_mean']
         
         # Model 5: Line Movement
         line_analysis = self.line_analyzer.analyze_line_movement(
@@ -26,6 +26,8 @@ except ImportError:
     HTTPX_AVAILABLE = False
     httpx = None
 
+from metrics import upstream_call
+
 logger = logging.getLogger("balldontlie")
 
 # =============================================================================
@@ -100,7 +102,9 @@ async def _fetch_bdl(endpoint: str, params: Dict[str, Any] = None) -> Optional[D
 
     try:
         async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(url, headers=headers, params=params)
+            with upstream_call("balldontlie") as _call:
+                resp = await client.get(url, headers=headers, params=params)
+                _call.status(resp.status_code)
 
             if resp.status_code == 200:
                 data = resp.json()
@@ -33,6 +33,8 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 import asyncio
 
+from metrics import upstream_call
+
 logger = logging.getLogger("espn")
 
 # ESPN Sport/League mapping
@@ -97,7 +99,9 @@ async def get_espn_scoreboard(sport: str, date: str = None) -> Dict[str, Any]:
             params["dates"] = date.replace("-", "")
 
         async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(base_url, params=params)
+            with upstream_call("espn") as _call:
+                resp = await client.get(base_url, params=params)
+                _call.status(resp.status_code)
 
             if resp.status_code != 200:
                 logger.warning("ESPN scoreboard error: %d for %s", resp.status_code, sport)
@@ -192,7 +196,9 @@ async def get_officials_for_event(sport: str, event_id: str) -> Dict[str, Any]:
         url = f"https://sports.core.api.espn.com/v2/sports/{mapping['sport']}/leagues/{mapping['league']}/events/{event_id}/competitions/{event_id}/officials"
 
         async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(url)
+            with upstream_call("espn") as _call:
+                resp = await client.get(url)
+                _call.status(resp.status_code)
 
             if resp.status_code == 404:
                 # Officials not yet assigned or endpoint different for this sport
@@ -223,7 +229,9 @@ async def get_officials_for_event(sport: str, event_id: str) -> Dict[str, Any]:
                 if ref:
                     # Fetch official details
                     try:
-                        off_resp = await client.get(ref)
+                        with upstream_call("espn") as _call:
+                            off_resp = await client.get(ref)
+                            _call.status(off_resp.status_code)
                         if off_resp.status_code == 200:
                             off_data = off_resp.json()
                             officials.append({
@@ -358,7 +366,9 @@ async def get_game_details(sport: str, event_id: str) -> Dict[str, Any]:
         params = {"event": event_id}
 
         async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(url, params=params)
+            with upstream_call("espn") as _call:
+                resp = await client.get(url, params=params)
+                _call.status(resp.status_code)
 
             if resp.status_code != 200:
                 return {"error": f"HTTP {resp.status_code}"}
@@ -596,7 +606,9 @@ async def get_espn_injuries(sport: str, event_id: str = None, team_abbrev: str =
             url = f"https://site.api.espn.com/apis/site/v2/sports/{mapping['sport']}/{mapping['league']}/teams/{team_abbrev}"
 
             async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.get(url)
+                with upstream_call("espn") as _call:
+                    resp = await client.get(url)
+                    _call.status(resp.status_code)
                 if resp.status_code == 200:
                     team_data = resp.json()
                     team_injuries = team_data.get("team", {}).get("injuries", [])
@@ -20,6 +20,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 
+from metrics import upstream_call
+
 logger = logging.getLogger("finnhub")
 
 # Config
@@ -75,7 +77,9 @@ def _fetch_finnhub(endpoint: str, params: Optional[Dict] = None) -> Dict[str, An
             request_params.update(params)
 
         with httpx.Client(timeout=10.0) as client:
-            response = client.get(url, params=request_params)
+            with upstream_call("finnhub_api") as _call:
+                response = client.get(url, params=request_params)
+                _call.status(response.status_code)
             response.raise_for_status()
             return response.json()
 
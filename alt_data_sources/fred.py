@@ -20,6 +20,8 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional
 
+from metrics import upstream_call
+
 logger = logging.getLogger("fred")
 
 # Config
@@ -109,7 +111,9 @@ def fetch_fred_series(series_id: str, limit: int = 10) -> Dict[str, Any]:
         }
 
         with httpx.Client(timeout=10.0) as client:
-            response = client.get(FRED_BASE_URL, params=params)
+            with upstream_call("fred_api") as _call:
+                response = client.get(FRED_BASE_URL, params=params)
+                _call.status(response.status_code)
             response.raise_for_status()
             data = response.json()
 
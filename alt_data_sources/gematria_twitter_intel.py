@@ -26,6 +26,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 import json
 
+from metrics import upstream_call
+
 logger = logging.getLogger("gematria_intel")
 
 # =============================================================================
@@ -197,11 +199,13 @@ def _search_twitter_via_serp(query: str, num_results: int = 20) -> List[Dict[str
             "tbm": "nws",  # News/recent results
         }
 
-        response = requests.get(
-            "https://serpapi.com/search",
-            params=params,
-            timeout=10
-        )
+        with upstream_call("serpapi") as _call:
+            response = requests.get(
+                "https://serpapi.com/search",
+                params=params,
+                timeout=10
+            )
+            _call.status(response.status_code)
 
         if response.status_code == 200:
             data = response.json()
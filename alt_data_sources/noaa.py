@@ -30,6 +30,8 @@ except ImportError:
     HTTPX_AVAILABLE = False
     httpx = None  # type: ignore
 
+from metrics import upstream_call
+
 logger = logging.getLogger("noaa")
 
 
@@ -210,7 +212,9 @@ def fetch_kp_index_live() -> Dict[str, Any]:
 
     try:
         with httpx.Client(timeout=10.0) as client:
-            response = client.get(NOAA_KP_URL)
+            with upstream_call("noaa_space_weather") as _call:
+                response = client.get(NOAA_KP_URL)
+                _call.status(response.status_code)
             _record_noaa_call(status_code=response.status_code)  # v20.18: Record HTTP call
             response.raise_for_status()
             data = response.json()
@@ -429,7 +433,9 @@ def get_solar_xray_flux() -> Dict[str, Any]:
 
     try:
         with httpx.Client(timeout=10.0) as client:
-            response = client.get(NOAA_XRAY_URL)
+            with upstream_call("noaa_space_weather") as _call:
+                response = client.get(NOAA_XRAY_URL)
+                _call.status(response.status_code)
             _record_noaa_call(status_code=response.status_code)  # v20.18: Record HTTP call
             response.raise_for_status()
             data = response.json()
@@ -15,6 +15,8 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 
+from metrics import upstream_call
+
 logger = logging.getLogger("serpapi")
 
 # Import guardrails for quota/cache/rate-limit tracking
@@ -102,7 +104,9 @@ def get_search_trend(query: str, location: str = "United States") -> Dict[str, A
 
         timeout_s = SERP_TIMEOUT if GUARDRAILS_AVAILABLE else 2.0
         with httpx.Client(timeout=timeout_s) as client:
-            response = client.get(SERPAPI_BASE, params=params)
+            with upstream_call("serpapi") as _call:
+                response = client.get(SERPAPI_BASE, params=params)
+                _call.status(response.status_code)
             response.raise_for_status()
             data = response.json()
 
@@ -17,6 +17,8 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional, List
 
+from metrics import upstream_call
+
 logger = logging.getLogger("twitter")
 
 # Config
@@ -73,7 +75,9 @@ def _fetch_twitter(endpoint: str, params: Optional[Dict] = None) -> Dict[str, An
         }
 
         with httpx.Client(timeout=15.0) as client:
-            response = client.get(url, headers=headers, params=params)
+            with upstream_call("twitter_api") as _call:
+                response = client.get(url, headers=headers, params=params)
+                _call.status(response.status_code)
             response.raise_for_status()
             return response.json()
 
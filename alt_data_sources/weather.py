@@ -36,6 +36,8 @@ import os
 import time
 import asyncio
 
+from metrics import upstream_call
+
 logger = logging.getLogger("weather")
 
 # API Configuration
@@ -305,7 +307,9 @@ async def get_weather_context(
         }
 
         async with httpx.AsyncClient(timeout=FETCH_TIMEOUT_SECONDS) as client:
-            response = await client.get(WEATHER_API_BASE_URL, params=params)
+            with upstream_call("weather_api") as _call:
+                response = await client.get(WEATHER_API_BASE_URL, params=params)
+                _call.status(response.status_code)
 
             if response.status_code != 200:
                 logger.warning("WeatherAPI error: %d", response.status_code)
@@ -496,7 +500,9 @@ async def fetch_weather_from_api(
         }
 
         async with httpx.AsyncClient(timeout=FETCH_TIMEOUT_SECONDS) as client:
-            response = await client.get(WEATHER_API_BASE_URL, params=params)
+            with upstream_call("weather_api") as _call:
+                response = await client.get(WEATHER_API_BASE_URL, params=params)
+                _call.status(response.status_code)
 
             if response.status_code != 200:
                 logger.warning("WeatherAPI error: %d - %s", response.status_code, response.text[:200])
@@ -0,0 +1,481 @@
+"""
+Cache Warmer - Concurrent, priority-ordered best-bets cache warming
+===================================================================
+
+warm_best_bets_cache used to warm sports one after another, opening a new
+HTTP client per sport just to check the schedule, so the last sport's cache
+could be minutes stale by the time it was warmed. BestBetsWarmer instead:
+
+- Checks every sport's schedule concurrently over one HTTP client, caching
+  the events list (the Odds API events endpoint is free of quota cost).
+- Orders sports by priority: how soon the first game tips off today and how
+  often the sport's best-bets has been requested recently.
+- Warms sports concurrently under a process-wide concurrency limit
+  (WARM_MAX_CONCURRENCY), skips warming when Odds API credits drop below
+  WARM_MIN_QUOTA_REMAINING, and keeps the per-sport distributed lock so
+  several containers do not warm the same sport at once.
+- Refresh-ahead: run_forever() re-warms an active sport (recently requested,
+  or first game within WARM_TIPOFF_HORIZON_HOURS) when its best-bets:{sport}
+  key has less time left than its p95 warm latency x WARM_REFRESH_AHEAD_FACTOR
+  (floored at WARM_REFRESH_AHEAD_S), so user requests keep hitting a warm key.
+- Records per-sport warm latency histograms (stats()).
+
+Usage:
+    from cache_warmer import get_best_bets_warmer, record_best_bets_request
+
+    record_best_bets_request("nba")                   # from the route
+    await get_best_bets_warmer().warm_all()           # scheduled warm
+    asyncio.create_task(get_best_bets_warmer().run_forever())   # lifespan
+"""
+
+import asyncio
+import bisect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("cache_warmer")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+WARM_REFRESH_AHEAD_ENABLED = os.getenv("WARM_REFRESH_AHEAD_ENABLED", "true").lower() == "true"
+WARM_MAX_CONCURRENCY = max(1, int(os.getenv("WARM_MAX_CONCURRENCY", "2")))
+# Refresh-ahead lead: p95 warm latency x factor, never below the floor
+WARM_REFRESH_AHEAD_S = float(os.getenv("WARM_REFRESH_AHEAD_S", "30"))
+WARM_REFRESH_AHEAD_FACTOR = float(os.getenv("WARM_REFRESH_AHEAD_FACTOR", "1.5"))
+WARM_TICK_SECONDS = float(os.getenv("WARM_TICK_SECONDS", "15"))
+WARM_ACTIVE_WINDOW_S = float(os.getenv("WARM_ACTIVE_WINDOW_S", "900"))
+WARM_TIPOFF_HORIZON_HOURS = float(os.getenv("WARM_TIPOFF_HORIZON_HOURS", "3"))
+WARM_MIN_QUOTA_REMAINING = int(os.getenv("WARM_MIN_QUOTA_REMAINING", "500"))
+WARM_EVENTS_TTL_S = float(os.getenv("WARM_EVENTS_TTL_S", "600"))
+WARM_LOCK_TTL_S = int(os.getenv("WARM_LOCK_TTL_S", "300"))
+# Weight of one request/minute relative to a game tipping off right now
+WARM_RATE_WEIGHT = float(os.getenv("WARM_RATE_WEIGHT", "0.25"))
+
+# Must match the TTL _best_bets_inner writes best-bets:{sport} with
+BEST_BETS_CACHE_TTL_S = 120
+
+WARM_LATENCY_BUCKETS_S = (1, 2.5, 5, 10, 20, 30, 45, 60, 90, 120, 180)
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram (Prometheus-style le buckets)."""
+
+    def __init__(self, buckets: Sequence[float] = WARM_LATENCY_BUCKETS_S):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (None if empty or in +Inf)."""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, running = {}, 0
+        for bound, n in zip(self.buckets, self.counts):
+            running += n
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = self.count
+        return {
+            "count": self.count,
+            "sum_s": round(self.total, 3),
+            "max_s": round(self.max, 3),
+            "p50_le_s": self.quantile(0.5),
+            "p95_le_s": self.quantile(0.95),
+            "buckets": cumulative,
+        }
+
+
+class RequestRateTracker:
+    """Sliding-window request counter per sport."""
+
+    def __init__(self, window_s: float = WARM_ACTIVE_WINDOW_S, clock: Callable[[], float] = time.time):
+        self.window_s = window_s
+        self._clock = clock
+        self._hits: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sport: str) -> None:
+        with self._lock:
+            self._hits.setdefault(sport.lower(), deque()).append(self._clock())
+
+    def _prune(self, sport: str) -> deque:
+        hits = self._hits.get(sport.lower(), deque())
+        cutoff = self._clock() - self.window_s
+        while hits and hits[0] < cutoff:
+            hits.popleft()
+        return hits
+
+    def count(self, sport: str) -> int:
+        with self._lock:
+            return len(self._prune(sport))
+
+    def rate_per_minute(self, sport: str) -> float:
+        return self.count(sport) * 60.0 / self.window_s
+
+
+_request_rates = RequestRateTracker()
+
+
+def record_best_bets_request(sport: str) -> None:
+    """Count a best-bets request (cache hit or miss) toward warm priority."""
+    _request_rates.record(sport)
+
+
+# =============================================================================
+# WARMER
+# =============================================================================
+
+async def _default_compute(sport: str) -> None:
+    """Compute best-bets for a sport and populate best-bets:{sport}."""
+    from live_data_router import _best_bets_inner, _best_bets_in_worker, _cache_best_bets
+    from core.scoring_offload import offload_enabled, run_coroutine_in_worker
+
+    cache_key = f"best-bets:{sport}"
+    if offload_enabled():
+        result = await run_coroutine_in_worker(_best_bets_in_worker, sport, sport, False, 6.5)
+        # Same api_cache + precomputed-payload write as the inline path
+        _cache_best_bets(cache_key, result)
+    else:
+        await _best_bets_inner(sport, sport, False, cache_key)
+
+
+async def _default_fetch_events(client, sport: str) -> Optional[List[Dict[str, Any]]]:
+    """Odds API events for a sport (None when unavailable)."""
+    from core.live_http import SPORT_MAPPINGS
+
+    odds_api_key = os.getenv("ODDS_API_KEY", "")
+    odds_base = os.getenv("ODDS_API_BASE", "https://api.the-odds-api.com/v4")
+    odds_sport = SPORT_MAPPINGS.get(sport, {}).get("odds", "")
+    if not odds_api_key or not odds_sport:
+        return None
+    resp = await client.get(f"{odds_base}/sports/{odds_sport}/events", params={"apiKey": odds_api_key})
+    if resp.status_code != 200:
+        logger.warning("WARM events fetch failed for %s: %d", sport, resp.status_code)
+        return None
+    return resp.json()
+
+
+def _default_http_client():
+    import httpx
+    return httpx.AsyncClient(timeout=15)
+
+
+def _default_quota_remaining() -> Optional[int]:
+    try:
+        from odds_api import get_quota_state
+        return get_quota_state().get("requests_remaining")
+    except ImportError:
+        return None
+
+
+def _parse_commence(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class BestBetsWarmer:
+    """Concurrent, priority-ordered warmer for best-bets:{sport} cache keys."""
+
+    def __init__(
+        self,
+        sports: Optional[List[str]] = None,
+        cache=None,
+        compute: Callable[[str], Awaitable[Any]] = _default_compute,
+        fetch_events: Callable[[Any, str], Awaitable[Optional[List[Dict]]]] = _default_fetch_events,
+        http_client: Callable[[], Any] = _default_http_client,
+        quota_remaining: Callable[[], Optional[int]] = _default_quota_remaining,
+        request_rates: Optional[RequestRateTracker] = None,
+        max_concurrency: int = WARM_MAX_CONCURRENCY,
+    ):
+        if sports is None:
+            from data_dir import SUPPORTED_SPORTS
+            sports = [s.lower() for s in SUPPORTED_SPORTS]
+        if cache is None:
+            from core.hybrid_cache import api_cache
+            cache = api_cache
+        self.sports = sports
+        self.cache = cache
+        self.compute = compute
+        self.fetch_events = fetch_events
+        self.http_client = http_client
+        self.quota_remaining = quota_remaining
+        self.request_rates = request_rates or _request_rates
+        self.max_concurrency = max_concurrency
+
+        self._schedule: Dict[str, tuple] = {}  # sport -> (fetched_at, [commence datetimes today])
+        self._warm_expiry: Dict[str, float] = {}  # sport -> local estimate of key expiry
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._last_warm: Dict[str, Dict[str, Any]] = {}
+        self._counters = {"warmed": 0, "failed": 0, "skipped_locked": 0, "skipped_quota": 0, "ticks": 0}
+        self._in_flight = 0
+        self._slots_lock = threading.Lock()
+        self._slot_waiters: deque = deque()  # (loop, future) FIFO, handed a slot on release
+
+    # ---- schedule + priority ---------------------------------------------
+
+    async def _refresh_schedules(self, now: datetime) -> None:
+        """Fetch stale schedules for all sports concurrently over one client."""
+        today_str = now.astimezone(_et()).strftime("%Y-%m-%d")
+        stale = [s for s in self.sports
+                 if s not in self._schedule or time.time() - self._schedule[s][0] > WARM_EVENTS_TTL_S]
+        if not stale:
+            return
+
+        async with self.http_client() as client:
+            results = await asyncio.gather(*(self.fetch_events(client, s) for s in stale),
+                                           return_exceptions=True)
+        for sport, events in zip(stale, results):
+            if isinstance(events, Exception):
+                logger.warning("WARM events check error for %s: %s", sport, events)
+                continue
+            if events is None:
+                self._schedule[sport] = (time.time(), None)
+                continue
+            tips = []
+            for event in events:
+                commence = _parse_commence(event.get("commence_time", ""))
+                if commence and commence.astimezone(_et()).strftime("%Y-%m-%d") == today_str:
+                    tips.append(commence)
+            self._schedule[sport] = (time.time(), sorted(tips))
+
+    def games_today(self, sport: str) -> Optional[List[datetime]]:
+        """Commence times of today's games (None = schedule unknown)."""
+        entry = self._schedule.get(sport)
+        return entry[1] if entry else None
+
+    def hours_to_first_tip(self, sport: str, now: datetime) -> Optional[float]:
+        tips = self.games_today(sport) or []
+        upcoming = [t for t in tips if t >= now]
+        if upcoming:
+            return (upcoming[0] - now).total_seconds() / 3600.0
+        return 0.0 if tips else None  # games already underway count as imminent
+
+    def priority(self, sport: str, now: datetime) -> float:
+        """Higher warms first: imminent first tip-off plus recent request rate."""
+        hours = self.hours_to_first_tip(sport, now)
+        imminence = 0.0 if hours is None else 1.0 / (1.0 + hours)
+        return imminence + WARM_RATE_WEIGHT * self.request_rates.rate_per_minute(sport)
+
+    def ordered(self, sports: List[str], now: datetime) -> List[str]:
+        return sorted(sports, key=lambda s: (-self.priority(s, now), self.sports.index(s)))
+
+    # ---- warming ------------------------------------------------------------
+
+    def _ttl_remaining(self, sport: str) -> float:
+        key = f"best-bets:{sport}"
+        ttl_fn = getattr(self.cache, "ttl_remaining", None)
+        if ttl_fn is not None:
+            remaining = ttl_fn(key)
+            return remaining or 0.0
+        if not self.cache.get(key):
+            return 0.0
+        return max(0.0, self._warm_expiry.get(sport, 0.0) - time.time())
+
+    def refresh_ahead_s(self, sport: str) -> float:
+        """Seconds before expiry to re-warm: p95 warm latency x factor, floored, capped at the TTL."""
+        hist = self._histograms.get(sport)
+        if hist is None or not hist.count:
+            return WARM_REFRESH_AHEAD_S
+        p95 = hist.quantile(0.95)
+        if p95 is None:  # tail is past the last bucket
+            p95 = hist.max
+        return min(BEST_BETS_CACHE_TTL_S, max(WARM_REFRESH_AHEAD_S, p95 * WARM_REFRESH_AHEAD_FACTOR))
+
+    async def _acquire_slot(self) -> None:
+        # Process-wide limit: scheduled warms run on the scheduler thread's loop,
+        # refresh-ahead on the app loop, so waiters are (loop, future) pairs
+        # woken thread-safely rather than one loop's asyncio.Semaphore
+        loop = asyncio.get_running_loop()
+        with self._slots_lock:
+            if self._in_flight < self.max_concurrency:
+                self._in_flight += 1
+                return
+            waiter = loop.create_future()
+            self._slot_waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._slots_lock:
+                if (loop, waiter) in self._slot_waiters:
+                    self._slot_waiters.remove((loop, waiter))
+                    raise
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()  # slot was handed over before the cancel landed
+            raise
+
+    def _hand_off(self, waiter: asyncio.Future) -> None:
+        if waiter.cancelled():
+            self._release_slot()  # waiter gave up after being picked; pass the slot on
+        else:
+            waiter.set_result(None)
+
+    def _release_slot(self) -> None:
+        with self._slots_lock:
+            while self._slot_waiters:
+                loop, waiter = self._slot_waiters.popleft()
+                if loop.is_closed():
+                    continue
+                loop.call_soon_threadsafe(self._hand_off, waiter)
+                return  # slot transfers to the waiter, _in_flight unchanged
+            self._in_flight -= 1
+
+    async def warm_sport(self, sport: str, reason: str) -> bool:
+        """Warm one sport under the concurrency, quota and distributed-lock guards."""
+        remaining = self.quota_remaining()
+        if remaining is not None and remaining < WARM_MIN_QUOTA_REMAINING:
+            self._counters["skipped_quota"] += 1
+            logger.warning("WARM skip quota low (%s remaining): %s", remaining, sport)
+            return False
+
+        lock_key = f"warm_best_bets:{sport}"
+        if not self.cache.acquire_lock(lock_key, ttl=WARM_LOCK_TTL_S):
+            self._counters["skipped_locked"] += 1
+            logger.info("WARM skip locked: %s", sport)
+            return False
+
+        await self._acquire_slot()
+        start = time.perf_counter()
+        try:
+            logger.info("WARM start: %s (%s)", sport, reason)
+            await self.compute(sport)
+        except Exception as e:
+            self._counters["failed"] += 1
+            logger.error("WARM error for %s: %s", sport, e)
+            return False
+        finally:
+            self._release_slot()
+            self.cache.release_lock(lock_key)
+
+        duration = time.perf_counter() - start
+        self._histograms.setdefault(sport, LatencyHistogram()).observe(duration)
+        self._warm_expiry[sport] = time.time() + BEST_BETS_CACHE_TTL_S
+        self._counters["warmed"] += 1
+        meta = {
+            "last_warm_time": datetime.now(_et()).isoformat(),
+            "duration_seconds": round(duration, 1),
+            "reason": reason,
+        }
+        self._last_warm[sport] = meta
+        self.cache.set(f"warm_meta:{sport}", meta, ttl=86400)
+        logger.info("WARM done: %s in %.1fs", sport, duration)
+        return True
+
+    async def _warm_many(self, sports: List[str], reason: str, now: datetime) -> Dict[str, bool]:
+        ordered = self.ordered(sports, now)
+        results = await asyncio.gather(*(self.warm_sport(s, reason) for s in ordered))
+        return dict(zip(ordered, results))
+
+    async def warm_all(self) -> Dict[str, bool]:
+        """Scheduled warm: every sport with games today whose cache is cold or about to expire."""
+        now = datetime.now(timezone.utc)
+        await self._refresh_schedules(now)
+        due = []
+        for sport in self.sports:
+            tips = self.games_today(sport)
+            if tips is None:
+                logger.info("WARM skip no API key, sport config or schedule: %s", sport)
+            elif not tips:
+                logger.info("WARM skip no games: %s", sport)
+            elif self._ttl_remaining(sport) > self.refresh_ahead_s(sport):
+                logger.info("WARM skip cache hot: %s", sport)
+            else:
+                due.append(sport)
+        return await self._warm_many(due, "scheduled", now)
+
+    def _is_active(self, sport: str, now: datetime) -> bool:
+        if not self.games_today(sport):
+            return False
+        if self.request_rates.count(sport) > 0:
+            return True
+        hours = self.hours_to_first_tip(sport, now)
+        return hours is not None and hours <= WARM_TIPOFF_HORIZON_HOURS
+
+    async def refresh_due(self) -> Dict[str, bool]:
+        """One refresh-ahead tick: re-warm active sports whose key is about to expire."""
+        self._counters["ticks"] += 1
+        now = datetime.now(timezone.utc)
+        await self._refresh_schedules(now)
+        due = [s for s in self.sports
+               if self._is_active(s, now) and self._ttl_remaining(s) <= self.refresh_ahead_s(s)]
+        if not due:
+            return {}
+        return await self._warm_many(due, "refresh_ahead", now)
+
+    async def run_forever(self) -> None:
+        """Refresh-ahead loop (started from the app lifespan)."""
+        logger.info("Best-bets refresh-ahead started: tick=%.0fs, ahead>=%.0fs (p95 x %.1f), concurrency=%d",
+                    WARM_TICK_SECONDS, WARM_REFRESH_AHEAD_S, WARM_REFRESH_AHEAD_FACTOR, self.max_concurrency)
+        while True:
+            try:
+                await self.refresh_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Refresh-ahead tick failed: %s", e)
+            await asyncio.sleep(WARM_TICK_SECONDS)
+
+    def stats(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        sports = {}
+        for sport in self.sports:
+            tips = self.games_today(sport)
+            sports[sport] = {
+                "games_today": None if tips is None else len(tips),
+                "hours_to_first_tip": self.hours_to_first_tip(sport, now),
+                "requests_per_min": round(self.request_rates.rate_per_minute(sport), 3),
+                "priority": round(self.priority(sport, now), 4),
+                "last_warm": self._last_warm.get(sport),
+                "latency": self._histograms.get(sport, LatencyHistogram()).snapshot(),
+                "refresh_ahead_s": round(self.refresh_ahead_s(sport), 1),
+            }
+        return {
+            "refresh_ahead_enabled": WARM_REFRESH_AHEAD_ENABLED,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            **self._counters,
+            "sports": sports,
+        }
+
+
+def _et():
+    from zoneinfo import ZoneInfo
+    return ZoneInfo("America/New_York")
+
+
+_warmer: Optional[BestBetsWarmer] = None
+
+
+def get_best_bets_warmer() -> BestBetsWarmer:
+    """Get or create the global best-bets warmer."""
+    global _warmer
+    if _warmer is None:
+        _warmer = BestBetsWarmer()
+    return _warmer
@@ -0,0 +1,386 @@
+"""
+COORDINATION - Leader leases and shared markers across worker processes
+
+API workers and the dedicated scheduler worker (`python -m daily_scheduler
+--worker`) coordinate through a small store instead of HybridCache locks,
+which silently fall back to per-process memory when Redis is down:
+
+1. LeaderLease: a named lease one process holds and renews while alive. The
+   holder of the "scheduler" lease runs DailyScheduler; other candidates
+   stand by and take over once the lease expires (holder crashed, or was
+   stopped without releasing). LeaseKeeper renews it from a daemon thread and
+   fires on_acquired / on_lost callbacks.
+
+2. Markers: small JSON values any process can publish and poll (e.g. "model
+   X retrained at T", so API workers hot-swap models trained elsewhere).
+
+Backends (COORDINATION_BACKEND):
+- sqlite: one SQLite file on the persistent volume. Works across processes
+  that share the volume, no Redis needed. Default without REDIS_URL.
+- redis: SET NX PX plus compare-and-set scripts. Works across hosts. Default
+  when REDIS_URL is configured. Errors are never downgraded to another
+  backend - a process that cannot reach the store simply cannot lead, which
+  is safe, whereas two backends would mean two leaders.
+
+Usage:
+    from core.coordination import LeaderLease, LeaseKeeper
+
+    lease = LeaderLease("scheduler", ttl_s=30)
+    keeper = LeaseKeeper(lease, on_acquired=start_scheduler, on_lost=stop_scheduler).start()
+    lease.holder()          # {"holder": "host:pid:abcd", "expires_in_s": 24.1, "info": {...}}
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, Union
+
+from data_dir import GRADER_DATA_DIR
+
+logger = logging.getLogger("coordination")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+COORDINATION_DB_PATH = os.getenv("COORDINATION_DB_PATH", os.path.join(GRADER_DATA_DIR, "coordination.sqlite3"))
+# auto = redis when REDIS_URL is set, else sqlite
+COORDINATION_BACKEND = os.getenv("COORDINATION_BACKEND", "auto").lower()
+COORDINATION_REDIS_PREFIX = os.getenv("COORDINATION_REDIS_PREFIX", "bookie:coord")
+# SQLite busy timeout: how long a writer waits for another process's transaction
+SQLITE_BUSY_TIMEOUT_S = float(os.getenv("COORDINATION_SQLITE_TIMEOUT_S", "5"))
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    acquired_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    info TEXT
+);
+CREATE TABLE IF NOT EXISTS markers (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def connect_sqlite(path: str = COORDINATION_DB_PATH) -> sqlite3.Connection:
+    """Autocommit connection to a coordination SQLite file (WAL, shared by all processes)."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT_S, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.OperationalError:
+        pass  # e.g. network filesystems without shared memory; rollback journal still works
+    return conn
+
+
+def process_id() -> str:
+    """Identity used as lease holder / job worker: host, pid and a per-process nonce."""
+    global _PROCESS_ID
+    if _PROCESS_ID is None:
+        _PROCESS_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+    return _PROCESS_ID
+
+
+_PROCESS_ID: Optional[str] = None
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class SQLiteCoordinationStore:
+    """Leases and markers in one SQLite file; see module docstring."""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str = COORDINATION_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = connect_sqlite(path)
+        self._conn.executescript(_SQLITE_SCHEMA)
+
+    def lease_acquire(self, name: str, holder: str, ttl_s: float, info: Dict[str, Any]) -> bool:
+        now = time.time()
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT holder, acquired_at, expires_at FROM leases WHERE name = ?", (name,)).fetchone()
+                if row is not None and row["holder"] != holder and row["expires_at"] > now:
+                    conn.execute("ROLLBACK")
+                    return False
+                acquired_at = row["acquired_at"] if row is not None and row["holder"] == holder else now
+                conn.execute(
+                    "INSERT OR REPLACE INTO leases (name, holder, acquired_at, expires_at, info) VALUES (?, ?, ?, ?, ?)",
+                    (name, holder, acquired_at, now + ttl_s, json.dumps(info, default=str)),
+                )
+                conn.execute("COMMIT")
+                return True
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def lease_renew(self, name: str, holder: str, ttl_s: float, info: Dict[str, Any]) -> bool:
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE leases SET expires_at = ?, info = ? WHERE name = ? AND holder = ?",
+                (time.time() + ttl_s, json.dumps(info, default=str), name, holder),
+            )
+            return cur.rowcount == 1
+
+    def lease_release(self, name: str, holder: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM leases WHERE name = ? AND holder = ?", (name, holder))
+
+    def lease_get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT holder, acquired_at, expires_at, info FROM leases WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None or row["expires_at"] <= time.time():
+            return None
+        return {
+            "holder": row["holder"],
+            "acquired_at": row["acquired_at"],
+            "expires_in_s": round(row["expires_at"] - time.time(), 2),
+            "info": json.loads(row["info"]) if row["info"] else {},
+        }
+
+    def put_marker(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO markers (key, value, updated_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), time.time()),
+            )
+
+    def get_marker(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM markers WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row is not None else None
+
+
+class RedisCoordinationStore:
+    """Leases and markers in Redis (compare-and-set scripts keep renew/release holder-safe)."""
+
+    backend = "redis"
+
+    _RENEW = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        redis.call('pexpire', KEYS[1], ARGV[2])
+        redis.call('set', KEYS[2], ARGV[3], 'PX', ARGV[2])
+        return 1
+    end
+    return 0
+    """
+    _RELEASE = """
+    if redis.call('get', KEYS[1]) == ARGV[1] then
+        return redis.call('del', KEYS[1], KEYS[2])
+    end
+    return 0
+    """
+
+    def __init__(self, client, prefix: str = COORDINATION_REDIS_PREFIX):
+        self._client = client
+        self._prefix = prefix
+        self._renew = client.register_script(self._RENEW)
+        self._release = client.register_script(self._RELEASE)
+
+    def _keys(self, name: str):
+        return f"{self._prefix}:lease:{name}", f"{self._prefix}:lease:{name}:info"
+
+    def lease_acquire(self, name: str, holder: str, ttl_s: float, info: Dict[str, Any]) -> bool:
+        key, info_key = self._keys(name)
+        ttl_ms = int(ttl_s * 1000)
+        payload = json.dumps({"acquired_at": time.time(), **info}, default=str)
+        if self._client.set(key, holder, nx=True, px=ttl_ms):
+            self._client.set(info_key, payload, px=ttl_ms)
+            return True
+        return self.lease_renew(name, holder, ttl_s, info)
+
+    def lease_renew(self, name: str, holder: str, ttl_s: float, info: Dict[str, Any]) -> bool:
+        key, info_key = self._keys(name)
+        current = self._client.get(info_key)
+        acquired_at = json.loads(current).get("acquired_at") if current else time.time()
+        payload = json.dumps({"acquired_at": acquired_at, **info}, default=str)
+        return bool(self._renew(keys=[key, info_key], args=[holder, int(ttl_s * 1000), payload]))
+
+    def lease_release(self, name: str, holder: str) -> None:
+        self._release(keys=list(self._keys(name)), args=[holder])
+
+    def lease_get(self, name: str) -> Optional[Dict[str, Any]]:
+        key, info_key = self._keys(name)
+        holder = self._client.get(key)
+        if not holder:
+            return None
+        ttl_ms = self._client.pttl(key)
+        info = json.loads(self._client.get(info_key) or "{}")
+        return {
+            "holder": holder,
+            "acquired_at": info.pop("acquired_at", None),
+            "expires_in_s": round(max(ttl_ms, 0) / 1000, 2),
+            "info": info,
+        }
+
+    def put_marker(self, key: str, value: Any) -> None:
+        self._client.set(f"{self._prefix}:marker:{key}", json.dumps(value, default=str))
+
+    def get_marker(self, key: str) -> Optional[Any]:
+        raw = self._client.get(f"{self._prefix}:marker:{key}")
+        return json.loads(raw) if raw else None
+
+
+CoordinationStore = Union[SQLiteCoordinationStore, RedisCoordinationStore]
+
+_store: Optional[CoordinationStore] = None
+_store_lock = threading.Lock()
+
+
+def redis_client_from_env():
+    """Redis client for REDIS_URL (no connection is made until first use)."""
+    import redis
+    from core.hybrid_cache import REDIS_CONNECT_TIMEOUT_S, REDIS_URL
+    return redis.from_url(REDIS_URL, decode_responses=True, socket_connect_timeout=REDIS_CONNECT_TIMEOUT_S)
+
+
+def get_coordination_store() -> CoordinationStore:
+    """Process-wide coordination store for COORDINATION_BACKEND (chosen once, never switched)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            backend = COORDINATION_BACKEND
+            if backend == "auto":
+                from core.hybrid_cache import REDIS_ENABLED
+                backend = "redis" if REDIS_ENABLED else "sqlite"
+            if backend == "redis":
+                _store = RedisCoordinationStore(redis_client_from_env())
+            else:
+                _store = SQLiteCoordinationStore()
+            logger.info("Coordination store: %s", _store.backend)
+        return _store
+
+
+# =============================================================================
+# LEADER LEASE
+# =============================================================================
+
+class LeaderLease:
+    """A named lease held by at most one process at a time; see module docstring."""
+
+    def __init__(self, name: str, ttl_s: float = 30.0, store: Optional[CoordinationStore] = None,
+                 holder: Optional[str] = None):
+        self.name = name
+        self.ttl_s = ttl_s
+        self.holder_id = holder or process_id()
+        self._store = store
+
+    @property
+    def store(self) -> CoordinationStore:
+        if self._store is None:
+            self._store = get_coordination_store()
+        return self._store
+
+    def try_acquire(self, info: Optional[Dict[str, Any]] = None) -> bool:
+        return self.store.lease_acquire(self.name, self.holder_id, self.ttl_s, info or {})
+
+    def renew(self, info: Optional[Dict[str, Any]] = None) -> bool:
+        """Extend the lease; False if it expired and someone else took it."""
+        return self.store.lease_renew(self.name, self.holder_id, self.ttl_s, info or {})
+
+    def release(self) -> None:
+        self.store.lease_release(self.name, self.holder_id)
+
+    def holder(self) -> Optional[Dict[str, Any]]:
+        """Current holder record, or None when nobody holds an unexpired lease."""
+        return self.store.lease_get(self.name)
+
+
+class LeaseKeeper:
+    """
+    Acquire-or-renew loop for a LeaderLease on a daemon thread.
+
+    Renews every ttl/3. A renew the store rejects (someone else holds the
+    lease) loses leadership at once; store errors only lose it once a full
+    TTL has passed since the last successful renew, since by then another
+    candidate may legitimately have taken over.
+    """
+
+    def __init__(self, lease: LeaderLease,
+                 on_acquired: Optional[Callable[[], None]] = None,
+                 on_lost: Optional[Callable[[], None]] = None,
+                 info: Optional[Callable[[], Dict[str, Any]]] = None,
+                 interval_s: Optional[float] = None):
+        self.lease = lease
+        self.on_acquired = on_acquired
+        self.on_lost = on_lost
+        self.info = info or dict
+        self.interval_s = interval_s if interval_s is not None else max(lease.ttl_s / 3, 0.05)
+        self.is_leader = False
+        self._last_renewed = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LeaseKeeper":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"lease-{self.lease.name}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, release: bool = True) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_s + SQLITE_BUSY_TIMEOUT_S)
+            self._thread = None
+        if self.is_leader:
+            self._set_leader(False)
+            if release:
+                try:
+                    self.lease.release()
+                except Exception as e:
+                    logger.warning("Lease %s release failed: %s", self.lease.name, e)
+
+    def tick(self) -> bool:
+        """One acquire-or-renew step (the thread calls this; tests can too). Returns is_leader."""
+        try:
+            info = self.info()
+            if self.is_leader:
+                if self.lease.renew(info):
+                    self._last_renewed = time.monotonic()
+                else:
+                    logger.warning("Lease %s lost to another holder", self.lease.name)
+                    self._set_leader(False)
+            elif self.lease.try_acquire(info):
+                self._last_renewed = time.monotonic()
+                logger.info("Lease %s acquired by %s", self.lease.name, self.lease.holder_id)
+                self._set_leader(True)
+        except Exception as e:
+            logger.warning("Lease %s store error: %s", self.lease.name, e)
+            if self.is_leader and time.monotonic() - self._last_renewed > self.lease.ttl_s:
+                self._set_leader(False)
+        return self.is_leader
+
+    def _set_leader(self, leader: bool) -> None:
+        self.is_leader = leader
+        callback = self.on_acquired if leader else self.on_lost
+        if callback is not None:
+            try:
+                callback()
+            except Exception as e:
+                logger.exception("Lease %s %s callback failed: %s",
+                                 self.lease.name, "on_acquired" if leader else "on_lost", e)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.tick()
+            self._stop.wait(self.interval_s)
@@ -0,0 +1,272 @@
+"""
+ESOTERIC ENGINES - Jarvis triggers, daily energy and lazy engine singletons
+
+Extracted from live_data_router.py. The scoring pipeline and the astro /
+dashboard routers share these without importing each other.
+
+Usage:
+    from core.esoteric_engines import get_daily_energy, get_jarvis_savant
+
+    energy = get_daily_energy()
+    jarvis = get_jarvis_savant()
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict
+
+logger = logging.getLogger("live_data")
+
+# Import astronomical API for Void of Course detection
+try:
+    from astronomical_api import is_void_moon_now
+    ASTRONOMICAL_API_AVAILABLE = True
+except ImportError:
+    ASTRONOMICAL_API_AVAILABLE = False
+
+    def is_void_moon_now():
+        return (False, 0.0)
+
+# ============================================================================
+# JARVIS TRIGGERS - THE PROVEN EDGE NUMBERS
+# Weight: boost / 5 = max +4.0 points (doubled from original /10)
+# ============================================================================
+
+JARVIS_TRIGGERS = {
+    2178: {"name": "THE IMMORTAL", "boost": 20, "tier": "LEGENDARY", "description": "Only number where n4=reverse AND n4=66^4. Never collapses.", "mathematical": True},
+    201: {"name": "THE ORDER", "boost": 12, "tier": "HIGH", "description": "Jesuit Order gematria. The Event of 201.", "mathematical": False},
+    33: {"name": "THE MASTER", "boost": 10, "tier": "HIGH", "description": "Highest master number. Masonic significance.", "mathematical": False},
+    93: {"name": "THE WILL", "boost": 10, "tier": "HIGH", "description": "Thelema sacred number. Will and Love.", "mathematical": False},
+    322: {"name": "THE SOCIETY", "boost": 10, "tier": "HIGH", "description": "Skull & Bones. Genesis 3:22.", "mathematical": False}
+}
+
+POWER_NUMBERS = [11, 22, 33, 44, 55, 66, 77, 88, 99]
+TESLA_NUMBERS = [3, 6, 9]
+
+# ============================================================================
+# ESOTERIC HELPER FUNCTIONS (exported for main.py)
+# ============================================================================
+
+def calculate_date_numerology() -> Dict[str, Any]:
+    """Calculate numerology for today's date."""
+    today = datetime.now()
+    digits = str(today.year) + str(today.month).zfill(2) + str(today.day).zfill(2)
+
+    # Life path number
+    life_path = sum(int(d) for d in digits)
+    while life_path > 9 and life_path not in [11, 22, 33]:
+        life_path = sum(int(d) for d in str(life_path))
+
+    # Day vibration
+    day_vibe = sum(int(d) for d in str(today.day))
+    while day_vibe > 9:
+        day_vibe = sum(int(d) for d in str(day_vibe))
+
+    # Check for power numbers
+    power_hits = [n for n in POWER_NUMBERS if str(n) in digits]
+    tesla_energy = any(d in "369" for d in digits)
+
+    meanings = {
+        1: "Leadership - favorites dominate",
+        2: "Balance - close games expected",
+        3: "Creative - unexpected outcomes",
+        4: "Stability - chalk hits",
+        5: "Change - underdogs bark",
+        6: "Harmony - totals accurate",
+        7: "Spiritual - trust the model",
+        8: "Power - high scoring",
+        9: "Completion - season trends hold"
+    }
+
+    return {
+        "date": today.strftime("%Y-%m-%d"),
+        "life_path": life_path,
+        "day_vibration": day_vibe,
+        "meaning": meanings.get(life_path % 10, "Standard energy"),
+        "power_numbers_present": power_hits,
+        "tesla_energy": tesla_energy,
+        "is_master_number_day": life_path in [11, 22, 33]
+    }
+
+
+def get_moon_phase() -> Dict[str, Any]:
+    """Get current moon phase and betting implications."""
+    known_new_moon = datetime(2024, 1, 11)
+    days_since = (datetime.now() - known_new_moon).days
+    lunar_cycle = 29.53
+    phase_day = days_since % lunar_cycle
+
+    phases = [
+        (0, 1.85, "New Moon", "Fresh starts - take calculated risks"),
+        (1.85, 7.38, "Waxing Crescent", "Building momentum - follow trends"),
+        (7.38, 11.07, "First Quarter", "Decision time - key matchups"),
+        (11.07, 14.76, "Waxing Gibbous", "Increasing energy - overs favored"),
+        (14.76, 16.61, "Full Moon", "High volatility - expect upsets"),
+        (16.61, 22.14, "Waning Gibbous", "Reflection - fade public"),
+        (22.14, 25.83, "Last Quarter", "Release - unders hit"),
+        (25.83, 29.53, "Waning Crescent", "Rest period - low scoring")
+    ]
+
+    for start, end, name, meaning in phases:
+        if start <= phase_day < end:
+            illumination = abs(14.76 - phase_day) / 14.76 * 100
+            return {
+                "phase": name,
+                "meaning": meaning,
+                "phase_day": round(phase_day, 1),
+                "illumination": round(100 - illumination, 1),
+                "betting_edge": "VOLATILITY" if "Full" in name else "STABILITY" if "New" in name else "NEUTRAL"
+            }
+
+    return {"phase": "Unknown", "meaning": "Check phase", "phase_day": phase_day}
+
+
+def get_daily_energy() -> Dict[str, Any]:
+    """Get overall daily energy reading for betting.
+
+    v17.5 (Phase 2.2): Added Void-of-Course moon penalty.
+    When moon is void-of-course with confidence > 0.5, apply -20 penalty.
+    Traditional astrological wisdom: avoid initiating bets during VOC periods.
+    """
+    numerology = calculate_date_numerology()
+    moon = get_moon_phase()
+
+    energy_score = 50
+
+    if numerology.get("is_master_number_day"):
+        energy_score += 15
+    if numerology.get("tesla_energy"):
+        energy_score += 10
+    if moon.get("phase") == "Full Moon":
+        energy_score += 20
+    elif moon.get("phase") == "New Moon":
+        energy_score -= 10
+
+    dow = datetime.now().weekday()
+    day_modifiers = {
+        0: ("Monday", -5, "Slow start"),
+        1: ("Tuesday", 0, "Neutral"),
+        2: ("Wednesday", 5, "Midweek momentum"),
+        3: ("Thursday", 10, "TNF/Peak energy"),
+        4: ("Friday", 15, "Weekend anticipation"),
+        5: ("Saturday", 20, "Prime time"),
+        6: ("Sunday", 25, "NFL Sunday dominance")
+    }
+    day_name, modifier, day_meaning = day_modifiers[dow]
+    energy_score += modifier
+
+    # ===== v17.5: VOID OF COURSE MOON PENALTY =====
+    # Traditional astrological wisdom: avoid initiating new bets during VOC periods
+    voc_penalty = 0
+    voc_data = {"is_void": False, "confidence": 0.0, "penalty": 0}
+    try:
+        is_void, voc_confidence = is_void_moon_now()
+        voc_data["is_void"] = is_void
+        voc_data["confidence"] = voc_confidence
+        if is_void and voc_confidence > 0.5:
+            voc_penalty = -20  # Significant penalty during void periods
+            energy_score += voc_penalty
+            voc_data["penalty"] = voc_penalty
+            logger.debug("VOC Moon detected (confidence=%.2f) - applying %d penalty", voc_confidence, voc_penalty)
+    except Exception as e:
+        logger.warning("VOC calculation failed: %s", e)
+
+    return {
+        "overall_score": min(100, max(0, energy_score)),
+        "rating": "HIGH" if energy_score >= 70 else "MEDIUM" if energy_score >= 40 else "LOW",
+        "day_of_week": day_name,
+        "day_influence": day_meaning,
+        "recommended_action": "Aggressive betting" if energy_score >= 70 else "Standard sizing" if energy_score >= 40 else "Conservative approach",
+        "numerology_summary": numerology,
+        "moon_summary": moon,
+        "void_of_course": voc_data
+    }
+
+
+# ============================================================================
+# ENGINE SINGLETONS (Lazy Loaded)
+# ============================================================================
+
+# Import engines (lazy load to avoid circular imports)
+_jarvis_savant_engine = None
+_jarvis_hybrid_engine = None
+_vedic_astro_engine = None
+_esoteric_learning_loop = None
+
+# =============================================================================
+# JARVIS IMPLEMENTATION SELECTOR (v2.0)
+# =============================================================================
+# Env var: JARVIS_IMPL
+# Values: "savant" (default), "hybrid"
+# Invalid values default to "savant"
+
+JARVIS_IMPL = os.getenv("JARVIS_IMPL", "savant").lower()
+if JARVIS_IMPL not in ("savant", "hybrid"):
+    logger.warning("Invalid JARVIS_IMPL='%s', defaulting to 'savant'", JARVIS_IMPL)
+    JARVIS_IMPL = "savant"
+
+
+def get_jarvis_impl() -> str:
+    """Return the active Jarvis implementation string."""
+    return JARVIS_IMPL
+
+
+def get_jarvis_savant():
+    """Lazy load JarvisSavantEngine (standalone savant mode)."""
+    global _jarvis_savant_engine
+    if _jarvis_savant_engine is None:
+        try:
+            from jarvis_savant_engine import get_jarvis_engine
+            _jarvis_savant_engine = get_jarvis_engine()
+            logger.info("JarvisSavantEngine initialized (JARVIS_IMPL=%s)", JARVIS_IMPL)
+        except ImportError as e:
+            logger.warning("JarvisSavantEngine not available: %s", e)
+    return _jarvis_savant_engine
+
+
+def get_jarvis_hybrid():
+    """Lazy load Jarvis-Ophis hybrid callable (hybrid mode)."""
+    global _jarvis_hybrid_engine
+    if _jarvis_hybrid_engine is None:
+        try:
+            from core.jarvis_ophis_hybrid import calculate_hybrid_jarvis_score
+            _jarvis_hybrid_engine = calculate_hybrid_jarvis_score
+            logger.info("JarvisOphisHybrid initialized (JARVIS_IMPL=%s)", JARVIS_IMPL)
+        except ImportError as e:
+            logger.warning("JarvisOphisHybrid not available: %s", e)
+    return _jarvis_hybrid_engine
+
+
+def get_jarvis_engine():
+    """Get the active Jarvis engine based on JARVIS_IMPL selector."""
+    if JARVIS_IMPL == "hybrid":
+        return get_jarvis_hybrid()
+    else:
+        return get_jarvis_savant()
+
+
+def get_vedic_astro():
+    """Lazy load VedicAstroEngine."""
+    global _vedic_astro_engine
+    if _vedic_astro_engine is None:
+        try:
+            from jarvis_savant_engine import get_vedic_engine
+            _vedic_astro_engine = get_vedic_engine()
+            logger.info("VedicAstroEngine initialized")
+        except ImportError as e:
+            logger.warning("VedicAstroEngine not available: %s", e)
+    return _vedic_astro_engine
+
+
+def get_esoteric_loop():
+    """Lazy load EsotericLearningLoop."""
+    global _esoteric_learning_loop
+    if _esoteric_learning_loop is None:
+        try:
+            from jarvis_savant_engine import get_learning_loop
+            _esoteric_learning_loop = get_learning_loop()
+            logger.info("EsotericLearningLoop initialized")
+        except ImportError as e:
+            logger.warning("EsotericLearningLoop not available: %s", e)
+    return _esoteric_learning_loop
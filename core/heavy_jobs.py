@@ -0,0 +1,200 @@
+"""
+HEAVY JOBS - On-demand training, audit and grading work run off the request path
+
+Endpoints that used to train, audit or grade inside the request worker now
+enqueue one of these job types and return a job id at once. The scheduler
+lease holder (core.scheduler_worker) runs them; poll GET /live/jobs/{job_id}
+for progress and the result.
+
+Job types:
+    ml.train_ensemble          scripts/train_ensemble.py (POST /live/ml/train-ensemble)
+    grader.train_team_models   scripts.train_team_models.train_all (POST /live/grader/train-team-models)
+    grader.run_audit           AutoGrader.run_daily_audit (POST /grader/run-audit, /live/grader/run-audit)
+    grader.auto_grade          result_fetcher.auto_grade_picks (POST /live/picks/auto-grade)
+    ops.auto_grade             today (+ yesterday before noon ET) (POST /ops/auto-grade/run)
+
+Usage:
+    from core.heavy_jobs import enqueue_heavy_job, JOB_GRADER_RUN_AUDIT
+
+    return enqueue_heavy_job(JOB_GRADER_RUN_AUDIT, {"days_back": 1})
+    # {"status": "queued", "job_id": "...", "poll": "/live/jobs/..."}
+"""
+
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from core.job_queue import JobHandler, ProgressFn, get_job_queue, job_accepted
+
+logger = logging.getLogger("heavy_jobs")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+JOB_TRAIN_ENSEMBLE = "ml.train_ensemble"
+JOB_TRAIN_TEAM_MODELS = "grader.train_team_models"
+JOB_GRADER_RUN_AUDIT = "grader.run_audit"
+JOB_AUTO_GRADE = "grader.auto_grade"
+JOB_OPS_AUTO_GRADE = "ops.auto_grade"
+
+ENSEMBLE_TRAIN_TIMEOUT_S = 300
+ENSEMBLE_PREDICTIONS_FILE = "/data/grader/predictions.jsonl"
+LAST_GRADE_RUN_FILE = "last_grade_run.json"
+
+
+def enqueue_heavy_job(job_type: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Queue a heavy job and build the endpoint response (notes when no process will run it yet)."""
+    job_id = get_job_queue().enqueue(job_type, payload)
+    extra: Dict[str, Any] = {"job_type": job_type}
+    try:
+        from core.scheduler_worker import SCHEDULER_LEASE_NAME
+        from core.coordination import LeaderLease
+        if LeaderLease(SCHEDULER_LEASE_NAME).holder() is None:
+            extra["note"] = "No scheduler worker holds the lease yet; the job runs once one starts"
+    except Exception as e:
+        logger.debug("Lease lookup for job %s failed: %s", job_id, e)
+    return job_accepted(job_id, **extra)
+
+
+# =============================================================================
+# HANDLERS
+# =============================================================================
+
+def _count_graded_picks(predictions_file: str):
+    graded_count = total_count = 0
+    try:
+        if os.path.exists(predictions_file):
+            with open(predictions_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        total_count += 1
+                        try:
+                            pick = json.loads(line)
+                            if pick.get("grade_status", "").upper() == "GRADED":
+                                graded_count += 1
+                        except Exception:
+                            pass
+    except Exception as e:
+        logger.warning("Could not count graded picks: %s", e)
+    return graded_count, total_count
+
+
+def train_ensemble(payload: Dict[str, Any], progress: ProgressFn) -> Dict[str, Any]:
+    """Run scripts/train_ensemble.py; requires at least min_picks graded picks."""
+    script_path = os.path.join(REPO_ROOT, "scripts", "train_ensemble.py")
+    if not os.path.exists(script_path):
+        return {"success": False, "error": "Training script not found", "path": script_path}
+
+    progress(0.05, "counting graded picks")
+    graded_count, total_count = _count_graded_picks(ENSEMBLE_PREDICTIONS_FILE)
+
+    progress(0.1, "training")
+    try:
+        result = subprocess.run(
+            [sys.executable, script_path, "--min-picks", str(payload.get("min_picks", 100))],
+            capture_output=True,
+            text=True,
+            timeout=ENSEMBLE_TRAIN_TIMEOUT_S
+        )
+    except subprocess.TimeoutExpired:
+        return {"success": False, "error": "Training timed out after 5 minutes"}
+
+    if result.returncode == 0:
+        progress(0.95, "hot-swapping model")
+        from core.scheduler_worker import hot_swap_models
+        hot_swap_models("ensemble_hit_predictor")
+    return {
+        "success": result.returncode == 0,
+        "returncode": result.returncode,
+        "graded_picks_found": graded_count,
+        "total_picks": total_count,
+        "predictions_file": ENSEMBLE_PREDICTIONS_FILE,
+        "stdout": result.stdout[-2000:] if result.stdout else None,
+        "stderr": result.stderr[-1000:] if result.stderr else None,
+        "note": "Check /live/ml/status to see if model loaded"
+    }
+
+
+def train_team_models(payload: Dict[str, Any], progress: ProgressFn) -> Dict[str, Any]:
+    """LSTM, Matchup and Ensemble team models from recently graded picks."""
+    from scripts.train_team_models import train_all
+
+    progress(0.05, "training team models")
+    result = train_all(days=payload.get("days", 7), sport=payload.get("sport"))
+    progress(0.95, "hot-swapping models")
+    from core.scheduler_worker import hot_swap_models
+    hot_swap_models("team_lstm", "team_matchup", "game_ensemble")
+    return {
+        "status": "success",
+        "training_result": result,
+        "timestamp": datetime.now().isoformat(),
+        "note": "Check model_status.training_telemetry to verify persistence"
+    }
+
+
+def run_grader_audit(payload: Dict[str, Any], progress: ProgressFn) -> Dict[str, Any]:
+    """Daily bias audit + weight adjustment on the auto-grader singleton."""
+    from auto_grader import get_grader
+
+    days_back = payload.get("days_back", 1)
+    progress(0.05, f"auditing {days_back} day(s)")
+    results = get_grader().run_daily_audit(days_back=days_back)
+    return {
+        "status": "audit_complete",
+        "days_analyzed": days_back,
+        "results": results,
+        "timestamp": datetime.now().isoformat(),
+        "note": "Weights have been adjusted based on prediction performance"
+    }
+
+
+def auto_grade(payload: Dict[str, Any], progress: ProgressFn) -> Any:
+    """Grade pending picks for one date against final results."""
+    from result_fetcher import auto_grade_picks
+
+    progress(0.05, f"grading {payload.get('date') or 'today'}")
+    return asyncio.run(auto_grade_picks(date=payload.get("date"), sports=payload.get("sports")))
+
+
+def ops_auto_grade(payload: Dict[str, Any], progress: ProgressFn) -> Dict[str, Any]:
+    """Grade today (and yesterday before noon ET), persisting the run summary for /ops/grader/status."""
+    import pytz
+    from data_dir import DATA_DIR
+    from result_fetcher import auto_grade_picks
+
+    ET = pytz.timezone("America/New_York")
+    now_et = datetime.now(ET)
+    dates_to_grade = [now_et.strftime("%Y-%m-%d")]
+    if now_et.hour < 12:
+        dates_to_grade.append((now_et - timedelta(days=1)).strftime("%Y-%m-%d"))
+
+    all_results = []
+    for i, date in enumerate(dates_to_grade):
+        progress(i / len(dates_to_grade), f"grading {date}")
+        all_results.append(asyncio.run(auto_grade_picks(date=date)))
+
+    last_grade_run = {
+        "timestamp_et": now_et.isoformat(),
+        "timestamp_utc": datetime.now(tz=timezone.utc).isoformat(),
+        "dates_graded": dates_to_grade,
+        "results": all_results,
+    }
+    try:
+        with open(os.path.join(DATA_DIR, LAST_GRADE_RUN_FILE), "w") as f:
+            json.dump(last_grade_run, f, indent=2, default=str)
+    except Exception:
+        pass
+    return last_grade_run
+
+
+HEAVY_JOB_HANDLERS: Dict[str, JobHandler] = {
+    JOB_TRAIN_ENSEMBLE: train_ensemble,
+    JOB_TRAIN_TEAM_MODELS: train_team_models,
+    JOB_GRADER_RUN_AUDIT: run_grader_audit,
+    JOB_AUTO_GRADE: auto_grade,
+    JOB_OPS_AUTO_GRADE: ops_auto_grade,
+}
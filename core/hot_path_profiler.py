@@ -0,0 +1,209 @@
+"""
+HOT PATH PROFILER - Per-engine spans and opt-in sampling profiles for best-bets
+
+Two tools for "where did this best-bets request spend its time":
+
+1. EngineSpans (always on, ENGINE_SPANS_ENABLED): calculate_pick_score() marks
+   the boundary between engines with lap(), which reads the monotonic clock
+   once and adds the elapsed time to that engine's LatencySketch (the same
+   mergeable sketch as core.latency_sketch / integration rollups). At the end
+   of the request summary() yields count / p50 / p95 / max per engine for the
+   debug output, and metrics.track_engine_spans() merges the sketches into the
+   process-wide ones behind bookie_engine_latency_seconds - one merge per
+   engine, not one observe() per pick. With spans disabled start()/lap()
+   return 0.0 without touching the clock, so the cost is one attribute check
+   per boundary.
+
+2. SamplingProfiler (opt-in per request, BEST_BETS_PROFILE_ENABLED): a daemon
+   thread snapshots the target thread's stack every PROFILE_INTERVAL_MS via
+   sys._current_frames() and aggregates self / cumulative sample counts per
+   function plus the hottest collapsed stacks. No tracing hooks are installed,
+   so the profiled request runs at close to normal speed.
+
+   The target is a thread, not a request: on the API process that is the
+   shared event-loop thread, so anything else the loop runs while the profile
+   is open (other requests, background tasks) is sampled too. Profiles are
+   only meaningful on an otherwise idle instance (a bench run or a dedicated
+   debug replica), which is why the endpoint stays behind
+   BEST_BETS_PROFILE_ENABLED; the report carries this caveat as "scope".
+
+Usage:
+    from core.hot_path_profiler import EngineSpans, SamplingProfiler
+
+    spans = EngineSpans()
+    t = spans.start()
+    ...research engine...
+    t = spans.lap("research", t)
+    spans.summary()  # {"research": {"count": 412, "p50_ms": 0.08, ...}}
+    spans.sketches    # {"research": LatencySketch, ...} for export
+
+    with SamplingProfiler() as prof:
+        await run_request()
+    prof.report()
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from core.latency_sketch import LatencySketch
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+ENGINE_SPANS_ENABLED = os.getenv("ENGINE_SPANS_ENABLED", "true").lower() == "true"
+# Sampling profiles are expensive to return and expose code layout; off unless enabled
+BEST_BETS_PROFILE_ENABLED = os.getenv("BEST_BETS_PROFILE_ENABLED", "false").lower() == "true"
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "2"))
+PROFILE_MAX_DEPTH = int(os.getenv("PROFILE_MAX_DEPTH", "64"))
+PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "25"))
+
+
+# =============================================================================
+# ENGINE SPANS
+# =============================================================================
+
+class EngineSpans:
+    """Per-request engine timings (seconds) as one LatencySketch per engine name."""
+
+    __slots__ = ("enabled", "sketches", "_clock")
+
+    def __init__(self, enabled: Optional[bool] = None, clock=time.perf_counter):
+        self.enabled = ENGINE_SPANS_ENABLED if enabled is None else enabled
+        self.sketches: Dict[str, LatencySketch] = {}
+        self._clock = clock
+
+    def start(self) -> float:
+        return self._clock() if self.enabled else 0.0
+
+    def lap(self, name: str, started: float) -> float:
+        """Record time since `started` under `name`; returns the new start."""
+        if not self.enabled:
+            return 0.0
+        now = self._clock()
+        sketch = self.sketches.get(name)
+        if sketch is None:
+            sketch = self.sketches[name] = LatencySketch()
+        sketch.add(now - started)
+        return now
+
+    def add(self, name: str, seconds: float) -> None:
+        if self.enabled:
+            sketch = self.sketches.get(name)
+            if sketch is None:
+                sketch = self.sketches[name] = LatencySketch()
+            sketch.add(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """count / total / p50 / p95 / max per engine, in milliseconds, slowest total first.
+
+        Percentiles come from the sketch, so they are within its relative
+        accuracy (1% by default) of the exact value.
+        """
+        out = {}
+        for name, sketch in self.sketches.items():
+            out[name] = {
+                "count": sketch.count,
+                "total_ms": round(sketch.total * 1000, 2),
+                "p50_ms": round(sketch.quantile(0.50) * 1000, 3),
+                "p95_ms": round(sketch.quantile(0.95) * 1000, 3),
+                "max_ms": round(sketch.max * 1000, 3),
+            }
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["total_ms"]))
+
+
+# =============================================================================
+# SAMPLING PROFILER
+# =============================================================================
+
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    short = filename.rsplit(os.sep, 2)
+    return f"{'/'.join(short[-2:])}:{code.co_name}:{code.co_firstlineno}"
+
+
+class SamplingProfiler:
+    """Stack-sampling profiler for one thread (the caller's, by default).
+
+    Samples whatever that thread runs, so on an event loop the profile covers
+    every concurrent task, not just the request that opened it.
+    """
+
+    def __init__(self, interval_ms: float = PROFILE_INTERVAL_MS, thread_id: Optional[int] = None,
+                 max_depth: int = PROFILE_MAX_DEPTH):
+        self.interval_s = max(0.0005, interval_ms / 1000.0)
+        self.thread_id = thread_id
+        self.max_depth = max_depth
+        self.samples = 0
+        self.self_counts: Dict[str, int] = {}
+        self.cumulative_counts: Dict[str, int] = {}
+        self.stack_counts: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at = 0.0
+        self.wall_s = 0.0
+
+    def start(self) -> "SamplingProfiler":
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.wall_s = time.perf_counter() - self._started_at
+        return self
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._sample(frame)
+
+    def _sample(self, frame) -> None:
+        labels = []
+        while frame is not None and len(labels) < self.max_depth:
+            labels.append(_frame_label(frame.f_code))
+            frame = frame.f_back
+        if not labels:
+            return
+        self.samples += 1
+        self.self_counts[labels[0]] = self.self_counts.get(labels[0], 0) + 1
+        for label in set(labels):
+            self.cumulative_counts[label] = self.cumulative_counts.get(label, 0) + 1
+        stack = ";".join(reversed(labels))
+        self.stack_counts[stack] = self.stack_counts.get(stack, 0) + 1
+
+    def report(self, top_n: int = PROFILE_TOP_N) -> Dict[str, Any]:
+        """Top functions by self / cumulative samples plus the hottest collapsed stacks."""
+        total = max(self.samples, 1)
+
+        def _top(counts: Dict[str, int]) -> List[Dict[str, Any]]:
+            ranked = sorted(counts.items(), key=lambda kv: -kv[1])[:top_n]
+            return [{"function": k, "samples": v, "pct": round(100.0 * v / total, 1)} for k, v in ranked]
+
+        return {
+            "samples": self.samples,
+            "scope": "thread",  # whole sampled thread: concurrent event-loop work is included
+            "interval_ms": round(self.interval_s * 1000, 3),
+            "wall_s": round(self.wall_s, 3),
+            "top_self": _top(self.self_counts),
+            "top_cumulative": _top(self.cumulative_counts),
+            # Brendan Gregg collapsed format: feed to flamegraph.pl / speedscope
+            "collapsed_stacks": [f"{k} {v}" for k, v in
+                                 sorted(self.stack_counts.items(), key=lambda kv: -kv[1])[:top_n]],
+        }
@@ -0,0 +1,309 @@
+"""
+HTTP REPLAY - Record upstream responses once, replay them offline
+
+Every upstream integration (Odds API, Playbook, ESPN, BallDontLie, SerpAPI,
+weather, NOAA, ...) goes through httpx (sync or async clients) or requests.
+Recording patches the transports' send methods so a real best-bets run is
+captured into a cassette; replaying patches them again to answer from the
+cassette without touching the network. Nothing in the pipeline changes.
+
+- Cassette keys are (method, URL with sorted query, body hash). Credentials
+  (apiKey, api_key, key, token, ...) are dropped from keys and never
+  written to disk; identical requests replay in recorded order.
+- Requests missing from the cassette get a 599 response (the pipeline is
+  fail-soft) and are counted in Cassette.misses.
+- ShiftedClock moves datetime.now() (and so now_et()) to the recording instant so
+  ET-day slate filters select the recorded games, while time.time() and
+  perf_counter() stay real for stage timings.
+
+Usage:
+    from core.http_replay import Cassette, record_http, replay_http, ShiftedClock
+
+    cassette = Cassette(meta={"sport": "NBA"})
+    with record_http(cassette):
+        await run_pipeline()
+    cassette.save("tests/fixtures/replay/nba.json.gz")
+
+    cassette = Cassette.load("tests/fixtures/replay/nba.json.gz")
+    with replay_http(cassette), ShiftedClock(cassette.recorded_at):
+        await run_pipeline()
+"""
+
+import base64
+import contextlib
+import datetime as _dt
+import gzip
+import hashlib
+import json
+import logging
+import sys
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger("http_replay")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CASSETTE_VERSION = 1
+
+# Query parameters that carry credentials (compared case-insensitively)
+SECRET_PARAMS = {"apikey", "api_key", "key", "token", "access_token", "appid", "app_id", "secret"}
+# Response headers kept in the cassette (the rest are transport noise)
+KEPT_HEADERS = {"content-type", "x-requests-remaining", "x-requests-used", "x-requests-last", "etag"}
+
+MISSING_STATUS = 599
+
+
+# =============================================================================
+# CASSETTE
+# =============================================================================
+
+def scrub_url(url: str) -> str:
+    """URL with credentials removed and query parameters sorted."""
+    parts = urlsplit(str(url))
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k.lower() not in SECRET_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    key = f"{method.upper()} {scrub_url(url)}"
+    if body:
+        key += " #" + hashlib.sha1(body).hexdigest()[:12]
+    return key
+
+
+class Cassette:
+    """Recorded responses keyed by request_key, replayed in recorded order."""
+
+    def __init__(self, entries: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+                 meta: Optional[Dict[str, Any]] = None, recorded_at: Optional[str] = None):
+        self.entries: Dict[str, List[Dict[str, Any]]] = entries or {}
+        self.meta = meta or {}
+        self.recorded_at = recorded_at or _dt.datetime.now(_dt.timezone.utc).isoformat()
+        self.misses: List[str] = []
+        self.hits = 0
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: str, status: int, headers: Dict[str, str], content: bytes) -> None:
+        kept = {k.lower(): v for k, v in (headers or {}).items() if k.lower() in KEPT_HEADERS}
+        with self._lock:
+            self.entries.setdefault(key, []).append({
+                "status": status,
+                "headers": kept,
+                "body_b64": base64.b64encode(content or b"").decode("ascii"),
+            })
+
+    def next_response(self, key: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """Next recorded response for key (the last one repeats); None on a miss."""
+        with self._lock:
+            recorded = self.entries.get(key)
+            if not recorded:
+                self.misses.append(key)
+                return None
+            i = self._cursor.get(key, 0)
+            self._cursor[key] = i + 1
+            self.hits += 1
+            entry = recorded[min(i, len(recorded) - 1)]
+        return entry["status"], dict(entry["headers"]), base64.b64decode(entry["body_b64"])
+
+    def rewind(self) -> None:
+        with self._lock:
+            self._cursor.clear()
+            self.misses = []
+            self.hits = 0
+
+    @property
+    def request_count(self) -> int:
+        return sum(len(v) for v in self.entries.values())
+
+    def hosts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for key, recorded in self.entries.items():
+            host = urlsplit(key.split(" ", 2)[1]).netloc
+            counts[host] = counts.get(host, 0) + len(recorded)
+        return counts
+
+    def save(self, path: str) -> None:
+        payload = {
+            "version": CASSETTE_VERSION,
+            "recorded_at": self.recorded_at,
+            "meta": self.meta,
+            "entries": self.entries,
+        }
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, sort_keys=True)
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version {payload.get('version')} in {path}")
+        return cls(payload["entries"], payload.get("meta"), payload.get("recorded_at"))
+
+
+# =============================================================================
+# TRANSPORT PATCHING
+# =============================================================================
+
+def _patch_targets() -> List[Tuple[Any, str, str]]:
+    """(class, attribute, flavour) for every installed HTTP client library."""
+    targets = []
+    try:
+        import httpx
+        targets.append((httpx.AsyncClient, "send", "httpx_async"))
+        targets.append((httpx.Client, "send", "httpx_sync"))
+    except ImportError:
+        pass
+    try:
+        import requests
+        targets.append((requests.Session, "send", "requests"))
+    except ImportError:
+        pass
+    return targets
+
+
+def _request_parts(flavour: str, request: Any) -> Tuple[str, str, bytes]:
+    if flavour == "requests":
+        body = request.body or b""
+        return request.method, request.url, body.encode() if isinstance(body, str) else body
+    return request.method, str(request.url), bytes(request.content or b"")
+
+
+def _build_response(flavour: str, request: Any, status: int, headers: Dict[str, str], content: bytes):
+    if flavour == "requests":
+        import requests
+        resp = requests.Response()
+        resp.status_code = status
+        resp.headers.update(headers)
+        resp._content = content
+        resp.url = request.url
+        resp.request = request
+        return resp
+    import httpx
+    return httpx.Response(status, headers=headers, content=content, request=request)
+
+
+def _replay_response(cassette: Cassette, flavour: str, request: Any):
+    method, url, body = _request_parts(flavour, request)
+    found = cassette.next_response(request_key(method, url, body))
+    if found is None:
+        logger.debug("REPLAY miss: %s %s", method, scrub_url(url))
+        return _build_response(flavour, request, MISSING_STATUS,
+                               {"content-type": "application/json"}, b'{"error": "not in cassette"}')
+    return _build_response(flavour, request, *found)
+
+
+def _record_response(cassette: Cassette, flavour: str, request: Any, resp: Any) -> None:
+    method, url, body = _request_parts(flavour, request)
+    if flavour != "requests":
+        resp.read()
+    cassette.add(request_key(method, url, body), resp.status_code, dict(resp.headers), resp.content)
+
+
+@contextlib.contextmanager
+def _patched(cassette: Cassette, recording: bool) -> Iterator[Cassette]:
+    originals = []
+    for cls, attr, flavour in _patch_targets():
+        original = getattr(cls, attr)
+        originals.append((cls, attr, original))
+
+        if flavour == "httpx_async":
+            async def send(self, request, *args, _original=original, _flavour=flavour, **kwargs):
+                if not recording:
+                    return _replay_response(cassette, _flavour, request)
+                resp = await _original(self, request, *args, **kwargs)
+                await resp.aread()
+                _record_response(cassette, _flavour, request, resp)
+                return resp
+        else:
+            def send(self, request, *args, _original=original, _flavour=flavour, **kwargs):
+                if not recording:
+                    return _replay_response(cassette, _flavour, request)
+                resp = _original(self, request, *args, **kwargs)
+                _record_response(cassette, _flavour, request, resp)
+                return resp
+
+        setattr(cls, attr, send)
+    try:
+        yield cassette
+    finally:
+        for cls, attr, original in originals:
+            setattr(cls, attr, original)
+
+
+def record_http(cassette: Cassette):
+    """Context manager: pass requests through and store every response in cassette."""
+    return _patched(cassette, recording=True)
+
+
+def replay_http(cassette: Cassette):
+    """Context manager: answer every request from cassette, never touching the network."""
+    cassette.rewind()
+    return _patched(cassette, recording=False)
+
+
+# =============================================================================
+# SHIFTED CLOCK
+# =============================================================================
+
+class ShiftedClock:
+    """
+    Shift wall-clock datetime reads to a fixed instant (plus real elapsed time).
+
+    Replaces the datetime class bound in already-imported modules for the
+    duration of the block. time.time() is left
+    alone so elapsed-time measurements and cache TTLs behave normally.
+    """
+
+    def __init__(self, at: str):
+        target = _dt.datetime.fromisoformat(at)
+        if target.tzinfo is None:
+            target = target.replace(tzinfo=_dt.timezone.utc)
+        self.offset = target - _dt.datetime.now(_dt.timezone.utc)
+        self._patched: List[Tuple[Any, str, Any]] = []
+
+    def _datetime_class(self):
+        real, offset = _dt.datetime, self.offset
+
+        class _ShiftedMeta(type):
+            # Datetimes built by the real class (parsing, arithmetic) still pass isinstance()
+            def __instancecheck__(cls, obj):
+                return isinstance(obj, real)
+
+        class ShiftedDatetime(real, metaclass=_ShiftedMeta):
+            @classmethod
+            def now(cls, tz=None):
+                shifted = real.now(_dt.timezone.utc) + offset
+                return shifted.astimezone(tz) if tz is not None else shifted.astimezone().replace(tzinfo=None)
+
+            @classmethod
+            def utcnow(cls):
+                return (real.now(_dt.timezone.utc) + offset).replace(tzinfo=None)
+
+            @classmethod
+            def today(cls):
+                return cls.now()
+
+        return ShiftedDatetime
+
+    def __enter__(self) -> "ShiftedClock":
+        # core.time_et.now_et() reads its module's datetime, so it shifts too
+        shifted = self._datetime_class()
+        for module in list(sys.modules.values()):
+            if getattr(module, "datetime", None) is _dt.datetime and module is not _dt:
+                self._patched.append((module, "datetime", _dt.datetime))
+                setattr(module, "datetime", shifted)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for module, attr, original in reversed(self._patched):
+            setattr(module, attr, original)
+        self._patched.clear()
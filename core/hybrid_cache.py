@@ -0,0 +1,251 @@
+"""
+HYBRID CACHE - Redis-backed response cache with in-memory fallback
+
+Extracted from live_data_router.py. `api_cache` is the process-wide instance
+shared by every /live router, the scheduler and the cache warmers.
+
+Usage:
+    from core.hybrid_cache import api_cache
+
+    cached = api_cache.get(cache_key)
+    api_cache.set(cache_key, result, ttl=300)
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from metrics import cache_namespace, track_cache_lookup
+
+logger = logging.getLogger("live_data")
+
+# Redis import with fallback
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Redis Configuration - Railway provides REDIS_URL when Redis service is attached
+# Falls back to in-memory cache if Redis is not available
+REDIS_URL = os.getenv("REDIS_URL", "")
+REDIS_ENABLED = bool(REDIS_URL) and REDIS_AVAILABLE
+
+# v20.30: Bound the Redis connect and defer it to first use, so importing this
+# module (and cold start) never blocks on a slow or unreachable Redis
+REDIS_CONNECT_TIMEOUT_S = float(os.getenv("REDIS_CONNECT_TIMEOUT_S", "2"))
+REDIS_LAZY_CONNECT = os.getenv("REDIS_LAZY_CONNECT", "true").lower() == "true"
+
+if REDIS_URL and not REDIS_AVAILABLE:
+    logger.warning("REDIS_URL set but redis package not installed - using in-memory cache")
+elif REDIS_URL:
+    logger.info("Redis caching enabled")
+else:
+    logger.info("Redis not configured - using in-memory cache")
+
+
+# ============================================================================
+# HYBRID CACHE (Redis with in-memory fallback)
+# ============================================================================
+
+class HybridCache:
+    """
+    Cache with Redis backend and in-memory fallback.
+    Automatically falls back to in-memory if Redis is unavailable.
+    """
+
+    def __init__(self, default_ttl: int = 300, prefix: str = "bookie", name: str = "api_cache"):
+        """Initialize cache with default TTL in seconds (default 5 minutes)."""
+        self._default_ttl = default_ttl
+        self._prefix = prefix
+        self._name = name
+        self._redis_client: Optional[Any] = None
+        self._memory_cache: Dict[str, tuple] = {}  # key -> (value, expires_at)
+        self._using_redis = False
+        self._lookups: Dict[str, List[int]] = {}  # namespace -> [hits, misses]
+
+        # Try to connect to Redis if configured (on first use with REDIS_LAZY_CONNECT)
+        self._connect_pending = REDIS_ENABLED and REDIS_LAZY_CONNECT
+        if REDIS_ENABLED and not REDIS_LAZY_CONNECT:
+            self._connect()
+
+    def _connect(self) -> None:
+        self._connect_pending = False
+        try:
+            self._redis_client = redis.from_url(
+                REDIS_URL, decode_responses=True,
+                socket_connect_timeout=REDIS_CONNECT_TIMEOUT_S,
+            )
+            self._redis_client.ping()
+            self._using_redis = True
+            logger.info("Redis cache connected successfully")
+        except Exception as e:
+            logger.warning("Redis connection failed, using in-memory cache: %s", e)
+            self._redis_client = None
+            self._using_redis = False
+
+    def _redis_ready(self) -> bool:
+        if self._connect_pending:
+            self._connect()
+        return self._using_redis and self._redis_client is not None
+
+    def _make_key(self, key: str) -> str:
+        """Create prefixed key for Redis."""
+        return f"{self._prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from cache if not expired."""
+        value = self._get(key)
+        self._record_lookup(key, value is not None)
+        return value
+
+    def _record_lookup(self, key: str, hit: bool) -> None:
+        # v20.30: Per-namespace hit ratio (stats() + bookie_cache_lookups_total)
+        namespace = cache_namespace(key)
+        counts = self._lookups.get(namespace)
+        if counts is None:
+            counts = self._lookups.setdefault(namespace, [0, 0])
+        counts[0 if hit else 1] += 1
+        track_cache_lookup(self._name, key, hit)
+
+    def _get(self, key: str) -> Optional[Any]:
+        if self._redis_ready():
+            try:
+                redis_key = self._make_key(key)
+                value = self._redis_client.get(redis_key)
+                if value:
+                    logger.debug("Redis HIT: %s", key)
+                    return json.loads(value)
+                return None
+            except Exception as e:
+                logger.warning("Redis get failed, falling back to memory: %s", e)
+                self._using_redis = False
+
+        # In-memory fallback
+        if key in self._memory_cache:
+            value, expires_at = self._memory_cache[key]
+            if datetime.now() < expires_at:
+                logger.debug("Memory HIT: %s", key)
+                return value
+            else:
+                del self._memory_cache[key]
+                logger.debug("Memory EXPIRED: %s", key)
+        return None
+
+    def set(self, key: str, value: Any, ttl: int = None) -> None:
+        """Set value in cache with optional custom TTL."""
+        ttl = ttl or self._default_ttl
+
+        if self._redis_ready():
+            try:
+                redis_key = self._make_key(key)
+                self._redis_client.setex(redis_key, ttl, json.dumps(value))
+                logger.debug("Redis SET: %s (TTL: %ds)", key, ttl)
+                return
+            except Exception as e:
+                logger.warning("Redis set failed, falling back to memory: %s", e)
+                self._using_redis = False
+
+        # In-memory fallback
+        expires_at = datetime.now() + timedelta(seconds=ttl)
+        self._memory_cache[key] = (value, expires_at)
+        logger.debug("Memory SET: %s (TTL: %ds)", key, ttl)
+
+    def ttl_remaining(self, key: str) -> Optional[float]:
+        """Seconds until key expires (None if missing)."""
+        if self._redis_ready():
+            try:
+                ttl = self._redis_client.ttl(self._make_key(key))
+                return float(ttl) if ttl and ttl > 0 else None
+            except Exception as e:
+                logger.warning("Redis ttl failed, falling back to memory: %s", e)
+                self._using_redis = False
+
+        if key in self._memory_cache:
+            remaining = (self._memory_cache[key][1] - datetime.now()).total_seconds()
+            if remaining > 0:
+                return remaining
+        return None
+
+    def clear(self) -> None:
+        """Clear all cached values."""
+        if self._redis_ready():
+            try:
+                pattern = self._make_key("*")
+                keys = self._redis_client.keys(pattern)
+                if keys:
+                    self._redis_client.delete(*keys)
+                logger.info("Redis cache cleared (%d keys)", len(keys))
+            except Exception as e:
+                logger.warning("Redis clear failed: %s", e)
+
+        # Always clear memory cache too
+        self._memory_cache.clear()
+        logger.info("Memory cache cleared")
+
+    def acquire_lock(self, key: str, ttl: int = 900) -> bool:
+        """Try to acquire a distributed lock. Returns True if acquired."""
+        lock_key = f"lock:{key}"
+        if self._redis_ready():
+            try:
+                return bool(self._redis_client.set(self._make_key(lock_key), "1", nx=True, ex=ttl))
+            except Exception:
+                pass
+        # In-memory fallback
+        if lock_key in self._memory_cache:
+            _, expires_at = self._memory_cache[lock_key]
+            if datetime.now() < expires_at:
+                return False
+        self._memory_cache[lock_key] = ("1", datetime.now() + timedelta(seconds=ttl))
+        return True
+
+    def release_lock(self, key: str):
+        """Release a distributed lock."""
+        lock_key = f"lock:{key}"
+        if self._redis_ready():
+            try:
+                self._redis_client.delete(self._make_key(lock_key))
+            except Exception:
+                pass
+        if lock_key in self._memory_cache:
+            del self._memory_cache[lock_key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        redis_ready = self._redis_ready()
+        stats = {
+            "backend": "redis" if self._using_redis else "memory",
+            "redis_configured": REDIS_ENABLED,
+            "redis_connected": self._using_redis
+        }
+
+        if redis_ready:
+            try:
+                pattern = self._make_key("*")
+                keys = self._redis_client.keys(pattern)
+                stats["redis_keys"] = len(keys)
+            except Exception:
+                stats["redis_keys"] = "error"
+
+        # Memory stats
+        now = datetime.now()
+        valid = sum(1 for _, (_, exp) in self._memory_cache.items() if now < exp)
+        stats["memory_total_keys"] = len(self._memory_cache)
+        stats["memory_valid_keys"] = valid
+        stats["memory_expired_keys"] = len(self._memory_cache) - valid
+        stats["hit_ratio_by_namespace"] = {
+            ns: {"hits": hits, "misses": misses, "hit_ratio": round(hits / (hits + misses), 3)}
+            for ns, (hits, misses) in sorted(self._lookups.items())
+        }
+
+        return stats
+
+
+# Global cache instance - 5 minute TTL for API responses
+api_cache = HybridCache(default_ttl=300, prefix="bookie")
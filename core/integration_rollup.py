@@ -15,14 +15,21 @@ Usage:
     # Query rollups
     rollup = get_rollup(days=7)
     alerts = get_alerts()
+
+Latency is tracked per integration per day in a LatencySketch (mergeable
+streaming quantiles, see core/latency_sketch.py) rather than a raw sample
+list. Today's stats live in memory; past days are read from disk once and
+kept in memory, and multi-day summaries merge the daily sketches, so the
+polled endpoints (/debug/integration-rollup, /health) do no disk I/O and no
+per-sample work.
 """
 
 import os
 import json
 import logging
-import statistics
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from threading import Lock
 from pathlib import Path
@@ -35,6 +42,7 @@ from core.integration_contract import (
     RELEVANCE_GATED_INTEGRATIONS,
     HEALTH_POLICY,
 )
+from core.latency_sketch import LatencySketch
 
 logger = logging.getLogger("integration_rollup")
 
@@ -65,6 +73,9 @@ ROLLUP_DIR = os.path.join(
     "integration_rollups"
 )
 
+# Re-check disk for a past day's rollup file that was missing after this long
+HISTORY_MISS_RETRY_SECONDS = int(os.getenv("INTEGRATION_ROLLUP_MISS_RETRY_S", "300"))
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -98,8 +109,11 @@ class IntegrationDayStats:
     last_error_at: Optional[str] = None
     last_error: Optional[str] = None
 
-    # Latency stats (ms)
-    latencies: List[int] = field(default_factory=list)
+    # Latency stats (ms) - streaming sketch, O(1) memory per integration-day
+    latency: LatencySketch = field(default_factory=LatencySketch)
+
+    # True unless the most recent SUCCESS/CACHE_HIT/ERROR event was an ERROR
+    healthy: bool = True
 
     @property
     def success_rate(self) -> float:
@@ -112,22 +126,18 @@ class IntegrationDayStats:
     @property
     def avg_latency_ms(self) -> float:
         """Average latency in ms."""
-        if not self.latencies:
-            return 0.0
-        return statistics.mean(self.latencies)
+        return self.latency.mean
 
     @property
     def p95_latency_ms(self) -> float:
-        """95th percentile latency in ms."""
-        if len(self.latencies) < 2:
+        """95th percentile latency in ms (within the sketch's relative accuracy)."""
+        if self.latency.count < 2:
             return self.avg_latency_ms
-        sorted_latencies = sorted(self.latencies)
-        idx = int(len(sorted_latencies) * 0.95)
-        return sorted_latencies[min(idx, len(sorted_latencies) - 1)]
+        return self.latency.quantile(0.95)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to JSON-serializable dict."""
-        return {
+    def to_dict(self, include_sketch: bool = False) -> Dict[str, Any]:
+        """Convert to JSON-serializable dict (sketch included for on-disk rollups)."""
+        out = {
             "integration": self.integration,
             "date_et": self.date_et,
             "total_calls": self.total_calls,
@@ -142,8 +152,11 @@ class IntegrationDayStats:
             "last_error": self.last_error,
             "avg_latency_ms": round(self.avg_latency_ms, 2),
             "p95_latency_ms": round(self.p95_latency_ms, 2),
-            "sample_count": len(self.latencies),
+            "sample_count": self.latency.count,
         }
+        if include_sketch:
+            out["latency_sketch"] = self.latency.to_dict()
+        return out
 
 
 @dataclass
@@ -158,7 +171,7 @@ class DailyRollup:
     total_errors: int = 0
     critical_errors: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_sketches: bool = False) -> Dict[str, Any]:
         """Convert to JSON-serializable dict."""
         return {
             "date_et": self.date_et,
@@ -171,7 +184,7 @@ class DailyRollup:
                 "integrations_total": len(INTEGRATIONS),
             },
             "integrations": {
-                name: stats.to_dict()
+                name: stats.to_dict(include_sketch=include_sketches)
                 for name, stats in self.integrations.items()
             },
         }
@@ -186,6 +199,22 @@ _current_day_stats: Dict[str, IntegrationDayStats] = {}
 _current_date_et: Optional[str] = None
 
 
+@dataclass
+class _StoredDay:
+    """A past day's rollup as returned by the API, plus its latency sketches."""
+    rollup: Dict[str, Any]
+    sketches: Dict[str, LatencySketch]
+
+
+# Past days (date_et -> _StoredDay), loaded from disk at most once per day.
+# Lock order: _lock may be held when taking _history_lock, never the reverse.
+_history_lock = Lock()
+_history: Dict[str, _StoredDay] = {}
+_history_misses: Dict[str, float] = {}  # date_et -> monotonic time of last miss
+# (today, days) -> merged totals/sketches for the past days of that window
+_history_summary_cache: Dict[Tuple[str, int], Dict[str, Dict[str, Any]]] = {}
+
+
 def _get_et_date() -> str:
     """Get current date in ET timezone."""
     try:
@@ -219,33 +248,130 @@ def _ensure_day_initialized(date_et: str) -> None:
         }
 
 
+def _build_rollup(date_et: str) -> DailyRollup:
+    """DailyRollup over the current in-memory stats (caller holds _lock)."""
+    rollup = DailyRollup(
+        date_et=date_et,
+        generated_at=_get_timestamp(),
+        integrations=_current_day_stats.copy(),
+    )
+    for stats in rollup.integrations.values():
+        rollup.total_calls += stats.total_calls
+        rollup.total_errors += stats.error_count
+        if stats.integration in CRITICAL_INTEGRATIONS:
+            rollup.critical_errors += stats.error_count
+    return rollup
+
+
 def _flush_to_disk(date_et: str) -> None:
-    """Persist day's rollup to disk."""
+    """Persist day's rollup to disk and keep it in the in-memory history."""
     try:
         os.makedirs(ROLLUP_DIR, exist_ok=True)
 
-        rollup = DailyRollup(
-            date_et=date_et,
-            generated_at=_get_timestamp(),
-            integrations=_current_day_stats.copy(),
-        )
-
-        # Compute summary stats
-        for stats in rollup.integrations.values():
-            rollup.total_calls += stats.total_calls
-            rollup.total_errors += stats.error_count
-            if stats.integration in CRITICAL_INTEGRATIONS:
-                rollup.critical_errors += stats.error_count
+        rollup = _build_rollup(date_et)
+        data = rollup.to_dict(include_sketches=True)
 
         filepath = os.path.join(ROLLUP_DIR, f"rollup_{date_et}.json")
         with open(filepath, "w") as f:
-            json.dump(rollup.to_dict(), f, indent=2)
+            json.dump(data, f, separators=(",", ":"))
 
+        _remember_day(date_et, data)
         logger.info(f"Flushed integration rollup for {date_et} to {filepath}")
     except Exception as e:
         logger.error(f"Failed to flush rollup for {date_et}: {e}")
 
 
+def _remember_day(date_et: str, data: Dict[str, Any]) -> _StoredDay:
+    """Split a persisted rollup into its API shape and sketches, and cache it."""
+    sketches = {}
+    integrations = {}
+    for name, stats in data.get("integrations", {}).items():
+        stats = dict(stats)
+        blob = stats.pop("latency_sketch", None)
+        if blob:
+            sketches[name] = LatencySketch.from_dict(blob)
+        integrations[name] = stats
+    stored = _StoredDay(rollup={**data, "integrations": integrations}, sketches=sketches)
+    with _history_lock:
+        _history[date_et] = stored
+        _history_misses.pop(date_et, None)
+        _history_summary_cache.clear()
+    return stored
+
+
+def _load_day(date_et: str) -> Optional[_StoredDay]:
+    """Past day's rollup from memory, reading its file at most once."""
+    with _history_lock:
+        stored = _history.get(date_et)
+        if stored is not None:
+            return stored
+        missed_at = _history_misses.get(date_et)
+        if missed_at is not None and time.monotonic() - missed_at < HISTORY_MISS_RETRY_SECONDS:
+            return None
+
+    filepath = os.path.join(ROLLUP_DIR, f"rollup_{date_et}.json")
+    try:
+        with open(filepath) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        data = None
+    except Exception as e:
+        logger.error(f"Error loading rollup {filepath}: {e}")
+        data = None
+
+    if data is None:
+        with _history_lock:
+            _history_misses[date_et] = time.monotonic()
+        return None
+    return _remember_day(date_et, data)
+
+
+def _past_dates(date_et: str, days: int) -> List[str]:
+    """The days - 1 ET dates before date_et, newest first."""
+    today = datetime.strptime(date_et, "%Y-%m-%d")
+    return [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(1, days)]
+
+
+def _new_totals() -> Dict[str, Any]:
+    return {
+        "total_calls": 0,
+        "success_count": 0,
+        "error_count": 0,
+        "not_relevant_count": 0,
+        "latency": LatencySketch(),
+    }
+
+
+def _add_totals(totals: Dict[str, Any], stats: Dict[str, Any], sketch: Optional[LatencySketch]) -> None:
+    totals["total_calls"] += stats.get("total_calls", 0)
+    totals["success_count"] += stats.get("success_count", 0)
+    totals["error_count"] += stats.get("error_count", 0)
+    totals["not_relevant_count"] += stats.get("not_relevant_count", 0)
+    if sketch is not None:
+        totals["latency"].merge(sketch)
+
+
+def _history_summary(date_et: str, past: List[Tuple[str, _StoredDay]], days: int) -> Dict[str, Dict[str, Any]]:
+    """Merged totals and sketches over past days, cached until history changes."""
+    key = (date_et, days)
+    with _history_lock:
+        cached = _history_summary_cache.get(key)
+    if cached is not None:
+        return cached
+
+    summary: Dict[str, Dict[str, Any]] = {}
+    for _, stored in past:
+        for name, stats in stored.rollup.get("integrations", {}).items():
+            totals = summary.get(name)
+            if totals is None:
+                totals = summary[name] = _new_totals()
+            _add_totals(totals, stats, stored.sketches.get(name))
+
+    with _history_lock:
+        _history_summary_cache[key] = summary
+    return summary
+
+
 # =============================================================================
 # PUBLIC API
 # =============================================================================
@@ -289,22 +415,22 @@ def record_integration_event(
         if status == "SUCCESS":
             stats.success_count += 1
             stats.last_success_at = timestamp
+            stats.healthy = True
         elif status == "ERROR":
             stats.error_count += 1
             stats.last_error_at = timestamp
             stats.last_error = error_code or "UNKNOWN"
+            stats.healthy = False
         elif status == "NOT_RELEVANT":
             stats.not_relevant_count += 1
         elif status == "CACHE_HIT":
             stats.cache_hit_count += 1
             stats.last_success_at = timestamp  # Cache hit counts as success
+            stats.healthy = True
 
         # Record latency for non-cache calls
         if status != "CACHE_HIT" and latency_ms > 0:
-            stats.latencies.append(latency_ms)
-            # Keep only last 1000 samples to bound memory
-            if len(stats.latencies) > 1000:
-                stats.latencies = stats.latencies[-1000:]
+            stats.latency.add(latency_ms)
 
 
 def flush_daily_rollup(date_et: Optional[str] = None) -> Dict[str, Any]:
@@ -321,19 +447,7 @@ def flush_daily_rollup(date_et: Optional[str] = None) -> Dict[str, Any]:
         target_date = date_et or _get_et_date()
         _ensure_day_initialized(target_date)
         _flush_to_disk(target_date)
-
-        rollup = DailyRollup(
-            date_et=target_date,
-            generated_at=_get_timestamp(),
-            integrations=_current_day_stats.copy(),
-        )
-        for stats in rollup.integrations.values():
-            rollup.total_calls += stats.total_calls
-            rollup.total_errors += stats.error_count
-            if stats.integration in CRITICAL_INTEGRATIONS:
-                rollup.critical_errors += stats.error_count
-
-        return rollup.to_dict()
+        return _build_rollup(target_date).to_dict()
 
 
 def get_rollup(days: int = 7) -> Dict[str, Any]:
@@ -354,57 +468,43 @@ def get_rollup(days: int = 7) -> Dict[str, Any]:
         "critical_failures_24h": [],
     }
 
-    # Get current day's live data
+    # Current day's live data (in memory)
     with _lock:
         date_et = _get_et_date()
         _ensure_day_initialized(date_et)
-
-        current_rollup = DailyRollup(
-            date_et=date_et,
-            generated_at=_get_timestamp(),
-            integrations=_current_day_stats.copy(),
-        )
-        for stats in current_rollup.integrations.values():
-            current_rollup.total_calls += stats.total_calls
-            current_rollup.total_errors += stats.error_count
-            if stats.integration in CRITICAL_INTEGRATIONS:
-                current_rollup.critical_errors += stats.error_count
-
+        current_rollup = _build_rollup(date_et)
+        today_sketches = {name: stats.latency.copy() for name, stats in current_rollup.integrations.items()}
         result["daily_rollups"].append(current_rollup.to_dict())
 
-    # Load historical rollups from disk
+    # Historical rollups: read from disk once, then served from memory
+    past = []
     try:
-        if os.path.exists(ROLLUP_DIR):
-            for i in range(1, days):
-                past_date = (datetime.now(timezone.utc) - timedelta(days=i)).strftime("%Y-%m-%d")
-                filepath = os.path.join(ROLLUP_DIR, f"rollup_{past_date}.json")
-                if os.path.exists(filepath):
-                    with open(filepath) as f:
-                        result["daily_rollups"].append(json.load(f))
+        if days > 1 and os.path.exists(ROLLUP_DIR):
+            for past_date in _past_dates(date_et, days):
+                stored = _load_day(past_date)
+                if stored is not None:
+                    past.append((past_date, stored))
     except Exception as e:
         logger.error(f"Error loading historical rollups: {e}")
-
-    # Compute per-integration summary across all days
-    integration_totals: Dict[str, Dict[str, int]] = {}
-    for rollup in result["daily_rollups"]:
-        for name, stats in rollup.get("integrations", {}).items():
-            if name not in integration_totals:
-                integration_totals[name] = {
-                    "total_calls": 0,
-                    "success_count": 0,
-                    "error_count": 0,
-                    "not_relevant_count": 0,
-                }
-            integration_totals[name]["total_calls"] += stats.get("total_calls", 0)
-            integration_totals[name]["success_count"] += stats.get("success_count", 0)
-            integration_totals[name]["error_count"] += stats.get("error_count", 0)
-            integration_totals[name]["not_relevant_count"] += stats.get("not_relevant_count", 0)
+    result["daily_rollups"].extend(stored.rollup for _, stored in past)
+
+    # Per-integration summary across all days: cached past-day merge + today
+    integration_totals: Dict[str, Dict[str, Any]] = {}
+    for name, hist in _history_summary(date_et, past, days).items():
+        totals = integration_totals[name] = _new_totals()
+        _add_totals(totals, hist, hist["latency"])
+    for name, stats in result["daily_rollups"][0].get("integrations", {}).items():
+        totals = integration_totals.get(name)
+        if totals is None:
+            totals = integration_totals[name] = _new_totals()
+        _add_totals(totals, stats, today_sketches.get(name))
 
     for name, totals in integration_totals.items():
         denom = totals["success_count"] + totals["error_count"]
         success_rate = (totals["success_count"] / denom * 100) if denom > 0 else 100.0
 
         criticality = INTEGRATIONS.get(name, {}).get("criticality", "OPTIONAL")
+        latency = totals["latency"]
 
         result["integration_summary"][name] = {
             "criticality": criticality,
@@ -414,6 +514,10 @@ def get_rollup(days: int = 7) -> Dict[str, Any]:
             "not_relevant_count": totals["not_relevant_count"],
             "success_rate_pct": round(success_rate, 2),
             "is_critical": name in CRITICAL_INTEGRATIONS,
+            "avg_latency_ms": round(latency.mean, 2),
+            "p50_latency_ms": round(latency.quantile(0.50), 2),
+            "p95_latency_ms": round(latency.quantile(0.95), 2),
+            "p99_latency_ms": round(latency.quantile(0.99), 2),
         }
 
     # Find critical failures in last 24h
@@ -592,21 +696,9 @@ def get_integration_health_for_health_endpoint() -> Dict[str, Any]:
             criticality = config.get("criticality", "OPTIONAL")
             stats = _current_day_stats.get(name, IntegrationDayStats(integration=name, date_et=date_et))
 
-            # Determine current status
-            has_recent_success = stats.last_success_at is not None
-            has_recent_error = stats.last_error_at is not None
-
-            # If we have both, check which is more recent
-            integration_ok = True
-            if has_recent_error and has_recent_success:
-                try:
-                    success_time = datetime.fromisoformat(stats.last_success_at.replace("Z", "+00:00"))
-                    error_time = datetime.fromisoformat(stats.last_error_at.replace("Z", "+00:00"))
-                    integration_ok = success_time > error_time
-                except Exception:
-                    integration_ok = True
-            elif has_recent_error and not has_recent_success:
-                integration_ok = False
+            # Healthy unless the latest success/error event was an error
+            # (tracked at record time - no timestamp parsing per poll)
+            integration_ok = stats.healthy
 
             # Apply criticality policy
             if not integration_ok:
@@ -0,0 +1,548 @@
+"""
+JOB QUEUE - Persistent background jobs shared by API and worker processes
+
+API workers enqueue heavy work (training, audits, auto-grade, named
+scheduler jobs) and answer at once with a job id; the scheduler lease holder
+claims and runs it on runner threads. Job records persist, so status,
+progress and results can be fetched by id from any process.
+
+Job lifecycle: queued -> running -> succeeded | failed
+- Concurrency is capped per job type (JOB_CONCURRENCY, default 1 each), so a
+  second retrain request waits instead of training twice in parallel.
+- Enqueueing a job identical (type + payload) to one still queued or running
+  returns the existing job id.
+- Runners heartbeat their jobs; a running job whose heartbeat is older than
+  JOB_STALE_AFTER_S (its worker died) goes back to the queue.
+- Handlers receive (payload, progress) and may call progress(0.5, "msg").
+
+Backends (JOB_QUEUE_BACKEND):
+- sqlite: file on the persistent volume. Default without REDIS_URL.
+- redis: lists / sorted sets with an atomic claim script. Default with REDIS_URL.
+
+Usage:
+    from core.job_queue import get_job_queue, JobRunner
+
+    job_id = get_job_queue().enqueue("grader.run_audit", {"days_back": 1})
+    get_job_queue().get(job_id)     # {"id": ..., "status": "running", "progress": 0.4, ...}
+
+    runner = JobRunner({"grader.run_audit": lambda payload, progress: ...}).start()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from data_dir import GRADER_DATA_DIR
+from core.coordination import connect_sqlite, process_id
+
+logger = logging.getLogger("job_queue")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+JOB_QUEUE_DB_PATH = os.getenv("JOB_QUEUE_DB_PATH", os.path.join(GRADER_DATA_DIR, "jobs.sqlite3"))
+# auto = redis when REDIS_URL is set, else sqlite
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "auto").lower()
+JOB_QUEUE_REDIS_PREFIX = os.getenv("JOB_QUEUE_REDIS_PREFIX", "bookie:jobs")
+JOB_QUEUE_POLL_S = float(os.getenv("JOB_QUEUE_POLL_S", "2"))
+# Jobs one runner executes at once (across all types)
+JOB_RUNNER_THREADS = int(os.getenv("JOB_RUNNER_THREADS", "2"))
+# Running jobs without a heartbeat for this long are requeued
+JOB_STALE_AFTER_S = float(os.getenv("JOB_STALE_AFTER_S", "120"))
+# Finished job records older than this are pruned
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "14"))
+JOB_DEFAULT_CONCURRENCY = int(os.getenv("JOB_DEFAULT_CONCURRENCY", "1"))
+
+
+def _parse_concurrency(raw: str) -> Dict[str, int]:
+    """JOB_CONCURRENCY="grader.auto_grade=2,ml.train_ensemble=1" -> {type: limit}."""
+    limits = {}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        job_type, _, limit = item.partition("=")
+        try:
+            limits[job_type.strip()] = max(1, int(limit))
+        except ValueError:
+            logger.warning("Ignoring JOB_CONCURRENCY entry %r", item)
+    return limits
+
+
+JOB_CONCURRENCY = _parse_concurrency(os.getenv("JOB_CONCURRENCY", ""))
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+ProgressFn = Callable[..., None]
+JobHandler = Callable[[Dict[str, Any], ProgressFn], Any]
+
+
+def concurrency_limit(job_type: str) -> int:
+    return JOB_CONCURRENCY.get(job_type, JOB_DEFAULT_CONCURRENCY)
+
+
+def _dedupe_key(job_type: str, payload_json: str) -> str:
+    return hashlib.sha1(f"{job_type}\n{payload_json}".encode()).hexdigest()
+
+
+def _encode_payload(payload: Optional[Dict[str, Any]]) -> str:
+    return json.dumps(payload or {}, sort_keys=True, default=str)
+
+
+# =============================================================================
+# SQLITE BACKEND
+# =============================================================================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+"""
+
+# Columns added after the first release of the table
+_MIGRATIONS = {
+    "progress": "REAL",
+    "progress_message": "TEXT",
+    "heartbeat_at": "REAL",
+    "dedupe_key": "TEXT",
+}
+
+
+def _row_to_job(row) -> Dict[str, Any]:
+    job = dict(row)
+    job.pop("dedupe_key", None)
+    job["payload"] = json.loads(job["payload"]) if job["payload"] else {}
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    return job
+
+
+class JobQueue:
+    """SQLite-backed job queue; claim() is atomic across processes sharing the file."""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str = JOB_QUEUE_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = connect_sqlite(path)
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, decl in _MIGRATIONS.items():
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {decl}")
+
+    def enqueue(self, job_type: str, payload: Optional[Dict[str, Any]] = None, dedupe: bool = True) -> str:
+        payload_json = _encode_payload(payload)
+        key = _dedupe_key(job_type, payload_json)
+        now = time.time()
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE dedupe_key = ? AND status IN ('queued', 'running')", (key,)
+                ).fetchone() if dedupe else None
+                if row is not None:
+                    conn.execute("COMMIT")
+                    return row["id"]
+                job_id = uuid.uuid4().hex
+                conn.execute(
+                    "INSERT INTO jobs (id, type, payload, status, created_at, dedupe_key) "
+                    "VALUES (?, ?, ?, 'queued', ?, ?)",
+                    (job_id, job_type, payload_json, now, key),
+                )
+                conn.execute(
+                    "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND finished_at < ?",
+                    (now - JOB_RETENTION_DAYS * 86400,),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        logger.info("Enqueued job %s (%s)", job_id, job_type)
+        return job_id
+
+    def claim(self, job_types: Iterable[str], worker: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Mark the oldest queued job of a type below its concurrency limit running (None if idle)."""
+        job_types = list(job_types)
+        if not job_types:
+            return None
+        placeholders = ",".join("?" * len(job_types))
+        now = time.time()
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    f"UPDATE jobs SET status = 'queued', worker = NULL "
+                    f"WHERE status = 'running' AND type IN ({placeholders}) AND heartbeat_at < ?",
+                    (*job_types, now - JOB_STALE_AFTER_S),
+                )
+                running = dict(conn.execute(
+                    f"SELECT type, COUNT(*) FROM jobs WHERE status = 'running' AND type IN ({placeholders}) "
+                    "GROUP BY type",
+                    job_types,
+                ).fetchall())
+                open_types = [t for t in job_types if running.get(t, 0) < concurrency_limit(t)]
+                row = None
+                if open_types:
+                    row = conn.execute(
+                        f"SELECT id FROM jobs WHERE status = 'queued' AND type IN ({','.join('?' * len(open_types))}) "
+                        "ORDER BY created_at LIMIT 1",
+                        open_types,
+                    ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', started_at = ?, heartbeat_at = ?, worker = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (now, now, worker or process_id(), row["id"]),
+                )
+                job = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return _row_to_job(job)
+
+    def heartbeat(self, job_ids: Iterable[str]) -> None:
+        job_ids = list(job_ids)
+        if not job_ids:
+            return
+        with self._lock:
+            self._conn.execute(
+                f"UPDATE jobs SET heartbeat_at = ? WHERE status = 'running' AND id IN ({','.join('?' * len(job_ids))})",
+                (time.time(), *job_ids),
+            )
+
+    def progress(self, job_id: str, fraction: float, message: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET progress = ?, progress_message = ?, heartbeat_at = ? WHERE id = ?",
+                (max(0.0, min(1.0, fraction)), message, time.time(), job_id),
+            )
+
+    def complete(self, job_id: str, result: Any = None) -> None:
+        self._finish(job_id, "succeeded", result=json.dumps(result, default=str))
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._finish(job_id, "failed", error=error[:4000])
+
+    def _finish(self, job_id: str, status: str, result: Optional[str] = None, error: Optional[str] = None) -> None:
+        progress = 1.0 if status == "succeeded" else None
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, result = ?, error = ?, "
+                "progress = COALESCE(?, progress) WHERE id = ?",
+                (status, time.time(), result, error, progress, job_id),
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row is not None else None
+
+    def list(self, status: Optional[str] = None, job_type: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        clauses, args = [], []
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        if job_type:
+            clauses.append("type = ?")
+            args.append(job_type)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ?", (*args, limit)
+            ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+
+# =============================================================================
+# REDIS BACKEND
+# =============================================================================
+
+class RedisJobQueue:
+    """
+    Redis-backed job queue with the JobQueue interface.
+
+    Keys under the prefix: job:{id} (hash), queue:{type} (list, FIFO),
+    running:{type} (zset id -> heartbeat), index (zset id -> created_at)
+    and dedupe:{key} -> id for queued/running jobs.
+    """
+
+    backend = "redis"
+
+    # ARGV: prefix, now, stale_before, worker, then (type, limit) pairs
+    _CLAIM = """
+    local prefix, now, stale, worker = ARGV[1], ARGV[2], tonumber(ARGV[3]), ARGV[4]
+    for i = 5, #ARGV, 2 do
+        local job_type, limit = ARGV[i], tonumber(ARGV[i + 1])
+        local running = prefix .. ':running:' .. job_type
+        local queue = prefix .. ':queue:' .. job_type
+        for _, id in ipairs(redis.call('zrangebyscore', running, '-inf', stale)) do
+            redis.call('zrem', running, id)
+            redis.call('hset', prefix .. ':job:' .. id, 'status', 'queued', 'worker', '')
+            redis.call('rpush', queue, id)
+        end
+        if redis.call('zcard', running) < limit then
+            local id = redis.call('rpop', queue)
+            if id then
+                local key = prefix .. ':job:' .. id
+                redis.call('zadd', running, now, id)
+                redis.call('hset', key, 'status', 'running', 'started_at', now, 'heartbeat_at', now, 'worker', worker)
+                redis.call('hincrby', key, 'attempts', 1)
+                return id
+            end
+        end
+    end
+    return false
+    """
+
+    def __init__(self, client, prefix: str = JOB_QUEUE_REDIS_PREFIX):
+        self._client = client
+        self._prefix = prefix
+        self._claim = client.register_script(self._CLAIM)
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self._prefix, *parts))
+
+    def enqueue(self, job_type: str, payload: Optional[Dict[str, Any]] = None, dedupe: bool = True) -> str:
+        payload_json = _encode_payload(payload)
+        dedupe_key = self._key("dedupe", _dedupe_key(job_type, payload_json))
+        job_id = uuid.uuid4().hex
+        if dedupe and not self._client.set(dedupe_key, job_id, nx=True):
+            existing = self._client.get(dedupe_key)
+            if existing:
+                return existing
+            self._client.set(dedupe_key, job_id)
+        now = time.time()
+        pipe = self._client.pipeline()
+        pipe.hset(self._key("job", job_id), mapping={
+            "id": job_id, "type": job_type, "payload": payload_json, "status": "queued",
+            "created_at": now, "attempts": 0, "dedupe_key": dedupe_key if dedupe else "",
+        })
+        pipe.zadd(self._key("index"), {job_id: now})
+        pipe.lpush(self._key("queue", job_type), job_id)
+        pipe.execute()
+        self._prune(now)
+        logger.info("Enqueued job %s (%s)", job_id, job_type)
+        return job_id
+
+    def _prune(self, now: float) -> None:
+        # Finished job hashes expire on their own; drop their index entries
+        cutoff = now - JOB_RETENTION_DAYS * 86400
+        self._client.zremrangebyscore(self._key("index"), "-inf", cutoff)
+
+    def claim(self, job_types: Iterable[str], worker: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        args: List[Any] = [self._prefix, now, now - JOB_STALE_AFTER_S, worker or process_id()]
+        for job_type in job_types:
+            args += [job_type, concurrency_limit(job_type)]
+        job_id = self._claim(args=args)
+        return self.get(job_id) if job_id else None
+
+    def heartbeat(self, job_ids: Iterable[str]) -> None:
+        now = time.time()
+        for job_id in job_ids:
+            job_type = self._client.hget(self._key("job", job_id), "type")
+            # xx: never re-add a job that finished since (it would later be "reaped" and rerun)
+            if job_type and self._client.zadd(self._key("running", job_type), {job_id: now}, xx=True, ch=True):
+                self._client.hset(self._key("job", job_id), "heartbeat_at", now)
+
+    def progress(self, job_id: str, fraction: float, message: Optional[str] = None) -> None:
+        self._client.hset(self._key("job", job_id), mapping={
+            "progress": max(0.0, min(1.0, fraction)), "progress_message": message or "",
+        })
+        self.heartbeat([job_id])
+
+    def complete(self, job_id: str, result: Any = None) -> None:
+        self._finish(job_id, "succeeded", result=json.dumps(result, default=str), progress=1.0)
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._finish(job_id, "failed", error=error[:4000])
+
+    def _finish(self, job_id: str, status: str, **fields: Any) -> None:
+        key = self._key("job", job_id)
+        job_type, dedupe_key = self._client.hmget(key, "type", "dedupe_key")
+        pipe = self._client.pipeline()
+        pipe.hset(key, mapping={"status": status, "finished_at": time.time(), **fields})
+        pipe.expire(key, JOB_RETENTION_DAYS * 86400)
+        if job_type:
+            pipe.zrem(self._key("running", job_type), job_id)
+        if dedupe_key:
+            pipe.delete(dedupe_key)
+        pipe.execute()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = self._client.hgetall(self._key("job", job_id))
+        if not raw:
+            return None
+        job: Dict[str, Any] = {
+            "id": raw["id"], "type": raw["type"], "status": raw["status"],
+            "payload": json.loads(raw.get("payload") or "{}"),
+            "result": json.loads(raw["result"]) if raw.get("result") else None,
+            "error": raw.get("error") or None,
+            "worker": raw.get("worker") or None,
+            "attempts": int(raw.get("attempts") or 0),
+            "progress_message": raw.get("progress_message") or None,
+        }
+        for field in ("created_at", "started_at", "finished_at", "heartbeat_at", "progress"):
+            job[field] = float(raw[field]) if raw.get(field) else None
+        return job
+
+    def list(self, status: Optional[str] = None, job_type: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        jobs = []
+        for job_id in self._client.zrevrange(self._key("index"), 0, -1):
+            job = self.get(job_id)
+            if job is None or (status and job["status"] != status) or (job_type and job["type"] != job_type):
+                continue
+            jobs.append(job)
+            if len(jobs) >= limit:
+                break
+        return jobs
+
+
+JobStore = Union[JobQueue, RedisJobQueue]
+
+_queue: Optional[JobStore] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobStore:
+    """Process-wide job queue for JOB_QUEUE_BACKEND (chosen once, never switched)."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            backend = JOB_QUEUE_BACKEND
+            if backend == "auto":
+                from core.hybrid_cache import REDIS_ENABLED
+                backend = "redis" if REDIS_ENABLED else "sqlite"
+            if backend == "redis":
+                from core.coordination import redis_client_from_env
+                _queue = RedisJobQueue(redis_client_from_env())
+            else:
+                _queue = JobQueue()
+            logger.info("Job queue backend: %s", _queue.backend)
+        return _queue
+
+
+def job_accepted(job_id: str, **extra: Any) -> Dict[str, Any]:
+    """Response body for endpoints that hand work to the queue."""
+    return {"status": "queued", "job_id": job_id, "poll": f"/live/jobs/{job_id}", **extra}
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+class JobRunner:
+    """
+    Claims jobs on a daemon thread and runs each on its own daemon thread.
+
+    handlers maps job type -> callable(payload, progress) returning a
+    JSON-able result. At most max_workers jobs run at once; per-type limits
+    are enforced by the queue. should_run gates claiming (the scheduler
+    worker only consumes while it holds the scheduler lease). Jobs still
+    running when the process exits are requeued once their heartbeat goes
+    stale.
+    """
+
+    def __init__(self, handlers: Dict[str, JobHandler],
+                 queue: Optional[JobStore] = None,
+                 should_run: Optional[Callable[[], bool]] = None,
+                 poll_s: float = JOB_QUEUE_POLL_S,
+                 worker: Optional[str] = None,
+                 max_workers: int = JOB_RUNNER_THREADS):
+        self.handlers = handlers
+        self._queue = queue
+        self.should_run = should_run or (lambda: True)
+        self.poll_s = poll_s
+        self.worker = worker or process_id()
+        self.max_workers = max(1, max_workers)
+        self._in_flight: Dict[str, threading.Thread] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def queue(self) -> JobStore:
+        if self._queue is None:
+            self._queue = get_job_queue()
+        return self._queue
+
+    def start(self) -> "JobRunner":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="job-runner", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def in_flight(self) -> List[str]:
+        return [job_id for job_id, thread in self._in_flight.items() if thread.is_alive()]
+
+    def _execute(self, job: Dict[str, Any]) -> None:
+        job_id = job["id"]
+
+        def progress(fraction: float, message: Optional[str] = None) -> None:
+            try:
+                self.queue.progress(job_id, fraction, message)
+            except Exception as e:
+                logger.debug("Progress update for job %s failed: %s", job_id, e)
+
+        logger.info("Running job %s (%s)", job_id, job["type"])
+        try:
+            result = self.handlers[job["type"]](job["payload"], progress)
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job_id, job["type"])
+            self.queue.fail(job_id, f"{type(e).__name__}: {e}")
+        else:
+            self.queue.complete(job_id, result)
+
+    def run_once(self) -> Optional[str]:
+        """Claim and run at most one job on the calling thread; returns its id (None when nothing ran)."""
+        if not self.should_run():
+            return None
+        job = self.queue.claim(self.handlers, self.worker)
+        if job is None:
+            return None
+        self._execute(job)
+        return job["id"]
+
+    def _poll(self) -> None:
+        self._in_flight = {job_id: t for job_id, t in self._in_flight.items() if t.is_alive()}
+        self.queue.heartbeat(self._in_flight)
+        while len(self._in_flight) < self.max_workers and self.should_run():
+            job = self.queue.claim(self.handlers, self.worker)
+            if job is None:
+                break
+            thread = threading.Thread(target=self._execute, args=(job,), name=f"job-{job['type']}", daemon=True)
+            self._in_flight[job["id"]] = thread
+            thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._poll()
+            except Exception as e:
+                logger.warning("Job runner poll failed: %s", e)
+            self._stop.wait(self.poll_s)
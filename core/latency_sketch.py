@@ -0,0 +1,180 @@
+"""
+LATENCY SKETCH - Mergeable streaming quantiles for latency tracking
+
+A small DDSketch-style sketch: each value v > 0 lands in the logarithmic
+bucket ceil(log_gamma(v)) with gamma = (1 + alpha) / (1 - alpha), so every
+quantile it returns is within `alpha` relative error of the true value
+(1% by default). Memory is one counter per occupied bucket - a few hundred
+at most for latencies between 1ms and an hour - no matter how many values
+were added, and two sketches merge by adding bucket counts, so daily
+sketches combine into multi-day percentiles without any raw samples.
+
+Usage:
+    from core.latency_sketch import LatencySketch
+
+    sketch = LatencySketch()
+    sketch.add(234)
+    sketch.quantile(0.95)
+
+    week = LatencySketch()
+    for day in daily_sketches:
+        week.merge(day)
+
+    blob = sketch.to_dict()           # compact JSON-safe form
+    LatencySketch.from_dict(blob)
+"""
+
+import math
+import os
+from typing import Any, Dict, Optional
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SKETCH_RELATIVE_ACCURACY = float(os.getenv("LATENCY_SKETCH_ACCURACY", "0.01"))
+# Bucket cap; past it the lowest buckets are collapsed (high quantiles stay exact-ish)
+SKETCH_MAX_BINS = int(os.getenv("LATENCY_SKETCH_MAX_BINS", "2048"))
+
+# Values at or below this are counted as zero (no log bucket)
+_MIN_VALUE = 1e-9
+
+
+# =============================================================================
+# SKETCH
+# =============================================================================
+
+class LatencySketch:
+    """Relative-error quantile sketch; see module docstring."""
+
+    __slots__ = ("alpha", "_gamma", "_log_gamma", "bins", "zero_count",
+                 "count", "total", "min", "max", "_max_bins")
+
+    def __init__(self, alpha: float = SKETCH_RELATIVE_ACCURACY, max_bins: int = SKETCH_MAX_BINS):
+        if not 0 < alpha < 1:
+            raise ValueError(f"alpha must be in (0, 1), got {alpha}")
+        self.alpha = alpha
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self._max_bins = max_bins
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    # --- ingestion ---
+
+    def add(self, value: float, n: int = 1) -> None:
+        if n <= 0:
+            return
+        if value <= _MIN_VALUE:
+            self.zero_count += n
+        else:
+            idx = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[idx] = self.bins.get(idx, 0) + n
+            if len(self.bins) > self._max_bins:
+                self._collapse()
+        self.count += n
+        self.total += value * n
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        """Add `other`'s counts into this sketch (in place); returns self."""
+        if other.count == 0:
+            return self
+        if abs(other.alpha - self.alpha) > 1e-12:
+            raise ValueError(f"cannot merge sketches with alpha {self.alpha} and {other.alpha}")
+        for idx, n in other.bins.items():
+            self.bins[idx] = self.bins.get(idx, 0) + n
+        if len(self.bins) > self._max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        return self
+
+    def _collapse(self) -> None:
+        ordered = sorted(self.bins)
+        excess = len(ordered) - self._max_bins
+        target = ordered[excess]
+        moved = sum(self.bins.pop(idx) for idx in ordered[:excess])
+        self.bins[target] += moved
+
+    # --- queries ---
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile q (0..1), within alpha relative error; 0.0 when empty."""
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for idx in sorted(self.bins):
+            seen += self.bins[idx]
+            if seen > rank:
+                value = 2 * self._gamma ** idx / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def count_at_most(self, value: float) -> int:
+        """Number of added values <= value (bucket-resolution, for histogram export)."""
+        if value < 0:
+            return 0
+        if self.max is not None and value >= self.max:
+            return self.count
+        seen = self.zero_count
+        for idx in sorted(self.bins):
+            if 2 * self._gamma ** idx / (self._gamma + 1) > value:
+                break
+            seen += self.bins[idx]
+        return seen
+
+    # --- serialization ---
+
+    def copy(self) -> "LatencySketch":
+        clone = LatencySketch(self.alpha, self._max_bins)
+        return clone.merge(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON-safe form: bins as sorted [index, count] pairs."""
+        return {
+            "alpha": self.alpha,
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "min": self.min,
+            "max": self.max,
+            "zeros": self.zero_count,
+            "bins": [[idx, self.bins[idx]] for idx in sorted(self.bins)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        sketch = cls(alpha=data.get("alpha", SKETCH_RELATIVE_ACCURACY))
+        sketch.bins = {int(idx): int(n) for idx, n in data.get("bins", [])}
+        sketch.zero_count = int(data.get("zeros", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.total = float(data.get("sum", 0.0))
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        return sketch
+
+    def __repr__(self) -> str:
+        return f"LatencySketch(count={self.count}, p50={self.quantile(0.5):.2f}, p95={self.quantile(0.95):.2f})"
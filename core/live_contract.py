@@ -0,0 +1,691 @@
+"""
+LIVE CONTRACT - Output contract shared by every /live router
+
+Extracted from live_data_router.py. Holds the response normalizers, the public
+payload sanitizer hook, the output boundary (v20.21) and LiveContractRoute, so
+a /live sub-router gets the same contract without importing the monolith.
+
+Usage:
+    from core.live_contract import live_router
+
+    router = live_router()
+
+    @router.get("/cache/stats")
+    async def cache_stats():
+        ...
+"""
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from core.auth import verify_api_key
+
+logger = logging.getLogger("live_data")
+
+try:
+    from zoneinfo import ZoneInfo
+    _ET = ZoneInfo("America/New_York")
+except Exception:
+    _ET = None
+
+# PickContract v1 - canonical normalizer
+try:
+    from utils.pick_normalizer import (
+        normalize_pick as contract_normalize_pick,
+        normalize_best_bets_response as contract_normalize_best_bets_response
+    )
+    PICK_CONTRACT_AVAILABLE = True
+except Exception as e:
+    PICK_CONTRACT_AVAILABLE = False
+    logger.warning("pick_normalizer not available: %s", e)
+
+# Public payload sanitizer (ET-only + remove telemetry/UTC)
+try:
+    from utils.public_payload_sanitizer import sanitize_public_payload
+    PUBLIC_SANITIZER_AVAILABLE = True
+except Exception as e:
+    PUBLIC_SANITIZER_AVAILABLE = False
+    logger.warning("public_payload_sanitizer not available: %s", e)
+
+try:
+    from core.time_et import now_et
+    TIME_ET_AVAILABLE = True
+except ImportError:
+    TIME_ET_AVAILABLE = False
+
+try:
+    from time_filters import get_game_start_time_et
+    TIME_FILTERS_AVAILABLE = True
+except ImportError:
+    TIME_FILTERS_AVAILABLE = False
+
+
+def _sanitize_public(payload: dict) -> dict:
+    if PUBLIC_SANITIZER_AVAILABLE:
+        return sanitize_public_payload(payload)
+    return payload
+
+
+# Anti-cache headers for every /live response
+_LIVE_NO_STORE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0, private",
+    "Pragma": "no-cache",
+    "Expires": "0",
+    # Vary header ensures caches treat requests with different auth as distinct
+    "Vary": "Origin, X-API-Key, Authorization",
+    # CORS headers for API key
+    "Access-Control-Allow-Headers": "Content-Type, X-API-Key, Authorization",
+}
+
+
+# =============================================================================
+# OUTPUT BOUNDARY HARDENING (v20.21)
+# =============================================================================
+# Single enforcement point for ALL output invariants. This catches any bugs
+# where upstream filters are bypassed. Fail-soft: log violations, filter picks.
+
+# Required fields that every pick MUST have (from golden baseline)
+_REQUIRED_PICK_FIELDS = {
+    "pick_id", "sport", "market", "final_score", "tier",
+    "ai_score", "research_score", "esoteric_score", "jarvis_rs",
+    "titanium_triggered"
+}
+
+
+def _enforce_output_boundary(payload: dict) -> dict:
+    """
+    Enforce output invariants at the single output boundary.
+
+    Invariants enforced:
+    1. No picks with final_score below threshold (6.5 props, 7.0 games)
+    2. No picks with hidden tiers (MONITOR, PASS)
+    3. All picks have required fields
+
+    This is a DEFENSIVE check - upstream filters should already handle this,
+    but this catches any bugs where filters are bypassed.
+
+    Returns:
+        Modified payload with violating picks filtered and telemetry added.
+    """
+    # Import here to avoid circular import at module load
+    from core.scoring_contract import (
+        MIN_FINAL_SCORE,
+        MIN_PROPS_SCORE,
+        HIDDEN_TIERS,
+        VALID_OUTPUT_TIERS,
+    )
+
+    violations = {
+        "props_below_threshold": 0,
+        "props_hidden_tier": 0,
+        "props_missing_fields": 0,
+        "games_below_threshold": 0,
+        "games_hidden_tier": 0,
+        "games_missing_fields": 0,
+        "total_filtered": 0,
+    }
+
+    def _validate_pick(pick: dict, min_score: float, pick_type: str) -> bool:
+        """Validate a single pick against output invariants."""
+        # Check 1: Score threshold
+        score = pick.get("final_score") or pick.get("total_score") or 0
+        if score < min_score:
+            violations[f"{pick_type}_below_threshold"] += 1
+            logger.warning(
+                "BOUNDARY: %s pick below threshold: score=%.2f < %.2f, pick_id=%s",
+                pick_type, score, min_score, pick.get("pick_id", "?")
+            )
+            return False
+
+        # Check 2: Hidden tier filter
+        tier = pick.get("tier", "")
+        if tier in HIDDEN_TIERS:
+            violations[f"{pick_type}_hidden_tier"] += 1
+            logger.warning(
+                "BOUNDARY: %s pick has hidden tier: tier=%s, pick_id=%s",
+                pick_type, tier, pick.get("pick_id", "?")
+            )
+            return False
+
+        # Check 3: Tier must be in valid set (if present)
+        if tier and tier not in VALID_OUTPUT_TIERS:
+            violations[f"{pick_type}_hidden_tier"] += 1
+            logger.warning(
+                "BOUNDARY: %s pick has invalid tier: tier=%s, pick_id=%s",
+                pick_type, tier, pick.get("pick_id", "?")
+            )
+            return False
+
+        # Check 4: Required fields (log warning but don't filter)
+        missing = _REQUIRED_PICK_FIELDS - set(pick.keys())
+        if missing:
+            violations[f"{pick_type}_missing_fields"] += 1
+            logger.warning(
+                "BOUNDARY: %s pick missing fields: %s, pick_id=%s",
+                pick_type, missing, pick.get("pick_id", "?")
+            )
+            # Don't filter - just log (missing fields may be added by normalizer)
+
+        return True
+
+    # Filter props picks
+    if "props" in payload and isinstance(payload["props"], dict):
+        props = payload["props"]
+        picks = props.get("picks", [])
+        if picks:
+            original_count = len(picks)
+            filtered = [p for p in picks if _validate_pick(p, MIN_PROPS_SCORE, "props")]
+            props["picks"] = filtered
+            props["count"] = len(filtered)
+            violations["total_filtered"] += (original_count - len(filtered))
+
+    # Filter game picks
+    if "game_picks" in payload and isinstance(payload["game_picks"], dict):
+        game_picks = payload["game_picks"]
+        picks = game_picks.get("picks", [])
+        if picks:
+            original_count = len(picks)
+            filtered = [p for p in picks if _validate_pick(p, MIN_FINAL_SCORE, "games")]
+            game_picks["picks"] = filtered
+            game_picks["count"] = len(filtered)
+            violations["total_filtered"] += (original_count - len(filtered))
+
+    # Add boundary telemetry to debug (will be stripped by sanitizer for non-debug)
+    if violations["total_filtered"] > 0:
+        logger.warning(
+            "BOUNDARY: Filtered %d picks that violated output invariants: %s",
+            violations["total_filtered"], violations
+        )
+        if "debug" not in payload:
+            payload["debug"] = {}
+        payload["debug"]["boundary_violations"] = violations
+        payload["debug"]["boundary_filtered_total"] = violations["total_filtered"]
+
+    return payload
+
+
+# ============================================================================
+# RESPONSE NORMALIZATION
+# ============================================================================
+
+def _normalize_market_label(pick_type: str, stat_type: str = None) -> str:
+    """Derive market_label from pick_type. For props, use stat category."""
+    # Market label is derived from pick_type, NOT from market field
+    if pick_type == "player_prop":
+        # For props, use the stat category
+        stat_labels = {
+            "player_points": "Points",
+            "player_rebounds": "Rebounds",
+            "player_assists": "Assists",
+            "player_threes": "3PT Made",
+            "player_steals": "Steals",
+            "player_blocks": "Blocks",
+            "player_turnovers": "Turnovers",
+            "player_pts_rebs": "Pts + Rebs",
+            "player_pts_asts": "Pts + Asts",
+            "player_rebs_asts": "Rebs + Asts",
+            "player_pts_rebs_asts": "Pts + Rebs + Asts",
+            "player_double_double": "Double Double",
+            "player_triple_double": "Triple Double",
+            "player_first_td": "First TD Scorer",
+            "player_anytime_td": "Anytime TD",
+            "player_goals": "Goals",
+            "player_shots": "Shots on Goal",
+            "player_saves": "Saves",
+        }
+        if stat_type:
+            return stat_labels.get(stat_type, stat_type.replace("_", " ").replace("player ", "").title())
+        return "Player Prop"
+    elif pick_type == "spread":
+        return "Spread"
+    elif pick_type == "moneyline":
+        return "Moneyline"
+    elif pick_type == "total":
+        return "Total"
+    return "Unknown"
+
+
+def _get_signal_label(pick: dict) -> str:
+    """Get signal label (e.g., 'Sharp Signal') separate from market type."""
+    market = pick.get("market", "").lower()
+    if market == "sharp_money":
+        return "Sharp Signal"
+    # Could add more signal types here
+    return None
+
+
+def _normalize_pick_type(pick: dict) -> str:
+    """Determine normalized pick_type from pick data."""
+    existing = pick.get("pick_type", "").upper()
+    market = pick.get("market", "").lower()
+
+    # Already normalized
+    if existing in ("PLAYER_PROP", "MONEYLINE", "SPREAD", "TOTAL"):
+        return existing.lower()
+
+    # Props detection
+    if pick.get("player") or pick.get("player_name") or "player_" in market:
+        return "player_prop"
+
+    # Game pick type detection
+    if existing == "TOTAL" or market in ("totals", "total"):
+        return "total"
+    if existing == "SPREAD" or market in ("spreads", "spread"):
+        return "spread"
+    if existing in ("ML", "MONEYLINE", "H2H") or market in ("h2h", "moneyline"):
+        return "moneyline"
+    if existing == "SHARP" or market == "sharp_money":
+        # Sharp picks are typically spread or ML based on line
+        line = pick.get("line")
+        if line is not None and line != 0:
+            return "spread"
+        return "moneyline"
+
+    # Default based on presence of player
+    return "spread" if pick.get("team") else "player_prop"
+
+
+def _normalize_selection(pick: dict, pick_type: str) -> str:
+    """Get the selection (who/what to bet on) from pick data."""
+    if pick_type == "player_prop":
+        return pick.get("player_name") or pick.get("player") or "Unknown Player"
+    if pick_type == "total":
+        home = pick.get("home_team", "Home")
+        away = pick.get("away_team", "Away")
+        return f"{away}/{home}"
+    # Spread or ML - return team
+    return pick.get("team") or pick.get("side") or pick.get("home_team") or "Unknown Team"
+
+
+def _normalize_side_label(pick: dict, pick_type: str) -> str:
+    """Get the side label for the bet."""
+    side = pick.get("side", "")
+    direction = pick.get("direction", "")
+    over_under = pick.get("over_under", "")
+
+    if pick_type in ("player_prop", "total"):
+        # For props and totals, use Over/Under
+        if side.lower() in ("over", "under"):
+            return side.title()
+        if direction.upper() in ("OVER", "UNDER"):
+            return direction.title()
+        if over_under.lower() in ("over", "under"):
+            return over_under.title()
+        return "Over"  # Default
+
+    # For spread/ML, use team name
+    return pick.get("team") or pick.get("side") or "Unknown"
+
+def _resolve_home_away_intent(pick: dict) -> str:
+    """Derive intended HOME/AWAY from pick_side hints."""
+    pick_side = (pick.get("pick_side") or "").lower()
+    if not pick_side:
+        return ""
+    if "home" in pick_side:
+        return "HOME"
+    if "away" in pick_side or "visitor" in pick_side:
+        return "AWAY"
+    return ""
+
+
+def _build_bet_string(pick: dict, pick_type: str, selection: str, market_label: str, side_label: str, line_signed: str = None) -> str:
+    """Build canonical bet display string."""
+    line = pick.get("line")
+    odds = pick.get("odds") or pick.get("odds_american")
+    units = pick.get("units", 1.0)
+
+    # Format odds - don't fabricate if missing
+    if odds is not None:
+        odds_str = f"+{odds}" if odds > 0 else str(odds)
+    else:
+        odds_str = "N/A"
+    units_str = f"{units}u"
+
+    if pick_type == "player_prop":
+        # "Sam Hauser — 3PT Made Over 4.5 (+130) — 2u"
+        line_str = f" {line}" if line is not None else ""
+        return f"{selection} — {market_label} {side_label}{line_str} ({odds_str}) — {units_str}"
+
+    if pick_type == "total":
+        # "Bucks/Celtics Over 228.5 (-110) — 1u"
+        line_str = f" {line}" if line is not None else ""
+        return f"{selection} {side_label}{line_str} ({odds_str}) — {units_str}"
+
+    if pick_type == "spread":
+        # "Boston Celtics -4.5 (-105) — 1u"
+        if line_signed:
+            return f"{selection} {line_signed} ({odds_str}) — {units_str}"
+        return f"{selection} ({odds_str}) — {units_str}"
+
+    # Moneyline: "Milwaukee Bucks Moneyline (-110) — 1u"
+    return f"{selection} Moneyline ({odds_str}) — {units_str}"
+
+
+def _normalize_pick(pick: dict) -> dict:
+    """
+    PickContract v1: Normalize pick to guarantee all required fields for frontend.
+
+    CORE IDENTITY FIELDS:
+    - id: stable unique pick_id
+    - sport, league
+    - event_id
+    - matchup, home_team, away_team
+    - start_time_et (display string)
+    - start_time_iso (ISO string or null)
+    - status/has_started/is_live flags
+
+    BET INSTRUCTION FIELDS:
+    - pick_type: "spread" | "moneyline" | "total" | "player_prop"
+    - market_label: human label ("Spread", "Points", etc.)
+    - selection: exactly what user bets (team OR player OR "Over"/"Under")
+    - selection_home_away: "HOME" | "AWAY" | null (computed from selection vs home/away teams)
+    - line: numeric line value (null for pure ML)
+    - line_signed: "+1.0" / "-2.5" / "O 220.5" / "U 220.5" (signed string)
+    - odds_american: number or null (NEVER fabricated)
+    - units: recommended bet units
+    - bet_string: final human-readable instruction
+    - book, book_link
+
+    REASONING FIELDS:
+    - tier, score, confidence_label
+    - signals_fired, confluence_reasons
+    - engine_breakdown
+    """
+    if not isinstance(pick, dict):
+        return pick
+    if PICK_CONTRACT_AVAILABLE:
+        return contract_normalize_pick(pick)
+
+    # === CORE IDENTITY ===
+    pick["id"] = pick.get("id") or pick.get("pick_id") or pick.get("event_id") or "unknown"
+    pick["sport"] = pick.get("sport", "").upper() or "UNKNOWN"
+    pick["league"] = pick.get("league") or pick.get("sport", "").upper() or "UNKNOWN"
+    pick["event_id"] = pick.get("event_id") or pick.get("game_id") or pick["id"]
+
+    home_team = pick.get("home_team") or ""
+    away_team = pick.get("away_team") or ""
+    pick["home_team"] = home_team
+    pick["away_team"] = away_team
+    pick["matchup"] = pick.get("matchup") or pick.get("game") or f"{away_team} @ {home_team}"
+
+    # === START TIME ===
+    start_time_display = pick.get("start_time") or pick.get("start_time_et") or pick.get("game_time")
+    pick["start_time_et"] = start_time_display
+    pick["start_time"] = start_time_display  # Alias for backward compat
+    pick["start_time_timezone"] = "ET"
+
+    commence_iso = pick.get("commence_time_iso") or pick.get("commence_time")
+    pick["start_time_iso"] = commence_iso if commence_iso else None
+
+    if commence_iso and isinstance(commence_iso, str) and commence_iso.endswith("Z"):
+        pick["start_time_utc"] = commence_iso
+    elif commence_iso:
+        try:
+            dt = datetime.fromisoformat(str(commence_iso).replace("Z", "+00:00"))
+            pick["start_time_utc"] = dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+        except Exception:
+            pick["start_time_utc"] = commence_iso
+    else:
+        pick["start_time_utc"] = None
+    # Do not expose UTC fields to clients (ET only)
+    pick.pop("start_time_utc", None)
+
+    # Fallback: derive ET display time from commence_time if missing
+    if not start_time_display and commence_iso:
+        try:
+            if TIME_FILTERS_AVAILABLE:
+                start_time_display = get_game_start_time_et(commence_iso)
+            elif _ET is not None:
+                dt = datetime.fromisoformat(str(commence_iso).replace("Z", "+00:00"))
+                start_time_display = dt.astimezone(_ET).strftime("%-I:%M %p ET")
+        except Exception:
+            start_time_display = ""
+        pick["start_time_et"] = start_time_display
+        pick["start_time"] = start_time_display
+        pick["start_time_timezone"] = "ET"
+
+    if not start_time_display or start_time_display == "TBD ET":
+        start_time_display = "TBD ET"
+        pick["start_time_et"] = start_time_display
+        pick["start_time"] = start_time_display
+        pick["start_time_timezone"] = "ET"
+        pick["start_time_status"] = "UNAVAILABLE"
+    else:
+        pick["start_time_status"] = "OK"
+
+    # === STATUS FLAGS ===
+    pick["status"] = pick.get("status") or pick.get("game_status") or "unknown"
+    pick["has_started"] = pick.get("has_started", False)
+    pick["is_started_already"] = pick.get("is_started_already", pick.get("has_started", False))
+    pick["is_live"] = pick.get("is_live", False)
+    pick["is_live_bet_candidate"] = pick.get("is_live_bet_candidate", False)
+
+    # === BET INSTRUCTION FIELDS ===
+    pick_type = _normalize_pick_type(pick)
+    stat_type = pick.get("stat_type", pick.get("prop_type", ""))
+    market_label = _normalize_market_label(pick_type, stat_type)
+    signal_label = _get_signal_label(pick)
+    selection = _normalize_selection(pick, pick_type)
+    side_label = _normalize_side_label(pick, pick_type)
+
+    # Ensure line exists
+    line = pick.get("line")
+    if line is None:
+        for key in ("point", "spread", "total", "line_value", "player_line"):
+            if pick.get(key) is not None:
+                line = pick.get(key)
+                pick["line"] = line
+                break
+
+    # Build line_signed based on pick_type
+    line_signed = None
+    if pick_type == "spread" and line is not None:
+        line_signed = f"+{line}" if line > 0 else str(line)
+    elif pick_type == "total" and line is not None:
+        prefix = "O" if side_label.lower() == "over" else "U"
+        line_signed = f"{prefix} {line}"
+    elif pick_type == "player_prop" and line is not None:
+        prefix = "O" if side_label.lower() == "over" else "U"
+        line_signed = f"{prefix} {line}"
+
+    # Get actual odds - NEVER fabricate
+    raw_odds = pick.get("odds") or pick.get("odds_american")
+    odds_american = raw_odds if raw_odds is not None else None
+
+    # Enforce canonical side resolution for game picks (HOME/AWAY)
+    correction_flags = pick.get("correction_flags") or []
+    if pick_type in ("spread", "moneyline"):
+        intent = _resolve_home_away_intent(pick)
+        if intent and home_team and away_team:
+            desired_team = home_team if intent == "HOME" else away_team
+            if selection and desired_team and selection.strip() != desired_team:
+                correction_flags.append("FIELD_CONTRADICTION_CORRECTED")
+                selection = desired_team
+                pick["team"] = desired_team
+                side_label = desired_team
+    pick["correction_flags"] = correction_flags
+
+    # Build canonical bet string
+    bet_string = _build_bet_string(
+        pick,
+        pick_type,
+        selection,
+        market_label,
+        side_label,
+        line_signed if pick_type == "spread" else None
+    )
+
+    # Compute selection_home_away for semantic consistency
+    selection_home_away = None
+    if selection and home_team and away_team:
+        sel_lower = selection.lower().strip()
+        home_lower = home_team.lower().strip()
+        away_lower = away_team.lower().strip()
+        if sel_lower == home_lower or home_lower in sel_lower or sel_lower in home_lower:
+            selection_home_away = "HOME"
+        elif sel_lower == away_lower or away_lower in sel_lower or sel_lower in away_lower:
+            selection_home_away = "AWAY"
+
+    # Set all bet instruction fields
+    pick["pick_type"] = pick_type
+    pick["market_label"] = market_label
+    pick["signal_label"] = signal_label
+    pick["selection"] = selection
+    pick["selection_home_away"] = selection_home_away
+    pick["side_label"] = side_label
+    pick["line"] = line
+    pick["line_signed"] = line_signed
+    pick["odds_american"] = odds_american
+    pick["units"] = pick.get("units", 1.0)
+    pick["recommended_units"] = pick.get("units", 1.0)  # Alias
+    pick["bet_string"] = bet_string
+    pick["book"] = pick.get("book") or pick.get("sportsbook_name") or "Consensus"
+    pick["book_link"] = pick.get("book_link") or pick.get("sportsbook_event_url") or ""
+
+    # === REASONING FIELDS ===
+    pick["tier"] = pick.get("tier") or pick.get("bet_tier", {}).get("tier") or "EDGE_LEAN"
+    pick["score"] = pick.get("score") or pick.get("final_score") or pick.get("total_score") or 0
+    pick["confidence_label"] = pick.get("confidence_label") or pick.get("confidence") or pick.get("action") or "PLAY"
+    pick["signals_fired"] = pick.get("signals_fired") or pick.get("signals_firing") or []
+    pick["confluence_reasons"] = pick.get("confluence_reasons") or []
+    pick["engine_breakdown"] = pick.get("engine_breakdown") or {
+        "ai": pick.get("ai_score", 0),
+        "research": pick.get("research_score", 0),
+        "esoteric": pick.get("esoteric_score", 0),
+        "jarvis": pick.get("jarvis_score") or pick.get("jarvis_rs", 0)
+    }
+
+    return pick
+
+
+def _normalize_best_bets_response(payload: dict) -> dict:
+    """Normalize all picks in a best-bets response."""
+    if not isinstance(payload, dict):
+        return payload
+    if PICK_CONTRACT_AVAILABLE:
+        return contract_normalize_best_bets_response(payload)
+
+    # Normalize props picks
+    props = payload.get("props", {})
+    if isinstance(props, dict) and "picks" in props:
+        props["picks"] = [_normalize_pick(p) for p in props.get("picks", [])]
+
+    # Normalize game picks
+    game_picks = payload.get("game_picks", {})
+    if isinstance(game_picks, dict) and "picks" in game_picks:
+        game_picks["picks"] = [_normalize_pick(p) for p in game_picks.get("picks", [])]
+
+    return payload
+
+
+def _ensure_live_contract_payload(payload, status_code: int):
+    """Ensure /live responses include required contract fields."""
+    if payload is None:
+        payload = {}
+    if isinstance(payload, list):
+        payload = {"data": payload}
+    if not isinstance(payload, dict):
+        payload = {"data": payload}
+
+    if "source" not in payload:
+        payload["source"] = "unknown"
+    if "generated_at" not in payload:
+        payload["generated_at"] = now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(timezone.utc).isoformat()
+    if "errors" not in payload or payload["errors"] is None:
+        payload["errors"] = []
+
+    if status_code >= 400 and not payload["errors"]:
+        detail = payload.get("detail", "request_failed")
+        payload["errors"] = [{"status": status_code, "message": detail}]
+
+    # Deterministic error ordering (avoid hash churn)
+    if isinstance(payload.get("errors"), list):
+        def _err_key(e):
+            if isinstance(e, dict):
+                return (
+                    str(e.get("code", "")),
+                    str(e.get("status", "")),
+                    str(e.get("message", "")),
+                )
+            return (str(e), "", "")
+        payload["errors"] = sorted(payload["errors"], key=_err_key)
+
+    if "data" not in payload and not ("props" in payload or "game_picks" in payload):
+        payload["data"] = []
+
+    # Normalize best-bets response picks with guaranteed fields
+    if "props" in payload or "game_picks" in payload:
+        payload = _normalize_best_bets_response(payload)
+        # v20.21: Output boundary hardening - enforce invariants at single choke point
+        payload = _enforce_output_boundary(payload)
+
+    return payload
+
+
+class LiveContractRoute(APIRoute):
+    """Wrap /live responses to enforce JSON contract and avoid 500s."""
+    def get_route_handler(self):
+        original_handler = super().get_route_handler()
+
+        async def custom_handler(request):
+            response = await original_handler(request)
+            if not isinstance(response, Response):
+                return response
+            if getattr(response, "precomputed_payload", False):
+                # Body already contract-normalized + sanitized at cache time
+                for k, v in _LIVE_NO_STORE_HEADERS.items():
+                    response.headers[k] = v
+                response.headers["Vary"] = "Origin, X-API-Key, Authorization, Accept-Encoding"
+                return response
+            media_type = (response.media_type or "").lower()
+            if not media_type.startswith("application/json"):
+                return response
+
+            try:
+                payload = json.loads(response.body)
+            except Exception:
+                return response
+
+            payload = _ensure_live_contract_payload(payload, response.status_code)
+
+            # Sanitize member-facing payloads (ET-only, strip telemetry/UTC)
+            # Never sanitize /live/debug/* endpoints
+            path = request.url.path
+            if PUBLIC_SANITIZER_AVAILABLE and not path.startswith("/live/debug"):
+                # Optional: keep api-health untouched
+                if path != "/live/api-health":
+                    payload = sanitize_public_payload(payload)
+            status_code = response.status_code
+            if status_code >= 500:
+                status_code = 200
+
+            # Don't copy Content-Length as the new payload may have different size
+            new_headers = {
+                k: v for k, v in response.headers.items()
+                if k.lower() not in ("content-length", "content-encoding")
+            }
+            # Anti-cache headers - prevent any caching of live data (including Service Worker)
+            new_headers.update(_LIVE_NO_STORE_HEADERS)
+            return JSONResponse(
+                content=payload,
+                status_code=status_code,
+                headers=new_headers,
+            )
+
+        return custom_handler
+
+
+def live_router(tags: Optional[List[str]] = None) -> APIRouter:
+    """APIRouter for /live endpoints: API key auth plus the live output contract."""
+    return APIRouter(
+        prefix="/live",
+        tags=tags or ["live"],
+        dependencies=[Depends(verify_api_key)],
+        route_class=LiveContractRoute,
+    )
@@ -0,0 +1,190 @@
+"""
+LIVE HTTP - Upstream API configuration and the shared HTTP client
+
+Extracted from live_data_router.py so the /live sub-routers, the scheduler and
+the warmers can reach Odds API / Playbook / ESPN without importing the scoring
+monolith.
+
+Usage:
+    from core.live_http import SPORT_MAPPINGS, fetch_with_retries, get_shared_client
+
+    resp = await fetch_with_retries("GET", url, params={"apiKey": ODDS_API_KEY})
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from metrics import upstream_call
+
+logger = logging.getLogger("live_data")
+
+# ============================================================================
+# CONFIGURATION (Environment Variables)
+# ============================================================================
+
+# API Keys - REQUIRED: Set these in Railway environment variables
+ODDS_API_KEY = os.getenv("ODDS_API_KEY", "")
+ODDS_API_BASE = os.getenv("ODDS_API_BASE", "https://api.the-odds-api.com/v4")
+
+PLAYBOOK_API_KEY = os.getenv("PLAYBOOK_API_KEY", "")
+PLAYBOOK_API_BASE = os.getenv("PLAYBOOK_API_BASE", "https://api.playbook-api.com/v1")
+
+# Log warning if API keys are missing
+if not ODDS_API_KEY:
+    logger.warning("ODDS_API_KEY not set - will use fallback data")
+if not PLAYBOOK_API_KEY:
+    logger.warning("PLAYBOOK_API_KEY not set - will use fallback data")
+
+ESPN_API_BASE = "https://site.api.espn.com/apis/site/v2/sports"
+
+# Sport mappings - Playbook uses uppercase league names (NBA, NFL, MLB, NHL, NCAAB)
+SPORT_MAPPINGS = {
+    "nba": {"odds": "basketball_nba", "espn": "basketball/nba", "playbook": "NBA"},
+    "nfl": {"odds": "americanfootball_nfl", "espn": "football/nfl", "playbook": "NFL"},
+    "mlb": {"odds": "baseball_mlb", "espn": "baseball/mlb", "playbook": "MLB"},
+    "nhl": {"odds": "icehockey_nhl", "espn": "hockey/nhl", "playbook": "NHL"},
+    "ncaab": {"odds": "basketball_ncaab", "espn": "basketball/mens-college-basketball", "playbook": "NCAAB"},
+}
+
+
+# ============================================================================
+# SHARED HTTP CLIENT
+# ============================================================================
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get or create a shared httpx AsyncClient for connection pooling."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(timeout=30.0)
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared client (call on app shutdown)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+def reset_shared_client() -> None:
+    """Forget the shared client without closing it (forked workers: it belongs to the parent's loop)."""
+    global _shared_client
+    _shared_client = None
+
+
+# ============================================================================
+# FETCH WITH RETRIES HELPER
+# ============================================================================
+
+def _upstream_api_name(url: str) -> str:
+    """Integration name for upstream metrics (host for anything unnamed)."""
+    if url.startswith(ODDS_API_BASE):
+        return "odds_api"
+    if url.startswith(PLAYBOOK_API_BASE):
+        return "playbook_api"
+    return urlsplit(url).netloc or "unknown"
+
+
+async def fetch_with_retries(
+    method: str,
+    url: str,
+    *,
+    params: Dict[str, Any] = None,
+    headers: Dict[str, str] = None,
+    max_retries: int = 2,
+    backoff_base: float = 0.5,
+    use_cache: bool = True,
+) -> Optional[httpx.Response]:
+    """
+    Fetch URL with retries and exponential backoff.
+    Returns Response on success, None on complete failure.
+    Rate-limited (429) responses are returned directly for caller to handle.
+
+    Odds API GETs go through the shared odds_api response cache (adaptive TTL,
+    single-flight) unless use_cache=False.
+    """
+    if use_cache and method.upper() == "GET" and url.startswith(ODDS_API_BASE):
+        from odds_api import get_odds_response_cache, is_cacheable_url, make_cache_key
+        if is_cacheable_url(url):
+            resp, from_cache = await get_odds_response_cache().get_or_fetch(
+                make_cache_key(url, params),
+                lambda: fetch_with_retries(
+                    method, url, params=params, headers=headers,
+                    max_retries=max_retries, backoff_base=backoff_base, use_cache=False,
+                ),
+            )
+            if from_cache:
+                try:
+                    from integration_registry import record_cache_hit, mark_integration_used
+                    record_cache_hit("odds_api")
+                    mark_integration_used("odds_api")
+                except Exception as e:
+                    logger.debug("odds_api cache hit tracking failed: %s", str(e))
+            return resp
+
+    client = get_shared_client()
+    attempt = 0
+
+    while attempt <= max_retries:
+        try:
+            with upstream_call(_upstream_api_name(url)) as _call:
+                resp = await client.request(method, url, params=params, headers=headers)
+                _call.status(resp.status_code)
+
+            # Return rate-limited responses for caller to handle
+            if resp.status_code == 429:
+                logger.warning("Rate limited by %s (attempt %d): %s",
+                             url, attempt, resp.text[:200] if resp.text else "No body")
+                return resp
+
+            if url.startswith(ODDS_API_BASE):
+                from odds_api import record_quota_headers
+                record_quota_headers(resp)
+
+            # Odds API usage marking (success + valid JSON only)
+            if resp.status_code == 200 and url.startswith(ODDS_API_BASE):
+                try:
+                    _ = resp.json()
+                    try:
+                        from integration_registry import mark_integration_used
+                        mark_integration_used("odds_api")
+                    except Exception as e:
+                        logger.debug("odds_api mark_integration_used failed: %s", str(e))
+                except Exception:
+                    # Invalid JSON should not mark usage
+                    pass
+
+            # v20.28.6: Playbook API usage marking (success + valid JSON only)
+            if resp.status_code == 200 and url.startswith(PLAYBOOK_API_BASE):
+                try:
+                    _ = resp.json()
+                    try:
+                        from integration_registry import mark_integration_used
+                        mark_integration_used("playbook_api")
+                    except Exception as e:
+                        logger.debug("playbook_api mark_integration_used failed: %s", str(e))
+                except Exception:
+                    # Invalid JSON should not mark usage
+                    pass
+
+            return resp
+
+        except httpx.RequestError as e:
+            logger.exception("HTTP request failed (attempt %d/%d) %s: %s",
+                           attempt + 1, max_retries + 1, url, str(e))
+            if attempt < max_retries:
+                sleep_for = backoff_base * (2 ** attempt)
+                await asyncio.sleep(sleep_for)
+            attempt += 1
+
+    logger.error("All retries exhausted for %s", url)
+    return None
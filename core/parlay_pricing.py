@@ -0,0 +1,630 @@
+"""
+Parlay Pricing - Correlation-aware joint probability and best-EV search
+========================================================================
+
+Parlays have been priced as independent legs multiplied together, with
+correlation shown only as a label. This module prices them jointly:
+
+1. Leg correlation matrix
+   - Same-game prop pairs take a latent correlation from the
+     signals/prop_correlation rules ("same" / "weak_same" / "opposite").
+   - Game-total legs vs same-game props use get_total_correlation_adjustment.
+   - Graded history (grader_store) supplies an empirical phi coefficient per
+     same-game prop-type pair, blended with the rule value by sample size.
+     The table is rebuilt off the request path: stale tables are served while
+     a background thread reloads them, and the scheduler refreshes it after
+     auto-grading (refresh_history_correlations).
+   - Signs follow the picked sides (Over/Under), and the matrix is repaired to
+     the nearest valid correlation matrix before use.
+2. Joint hit probability by Gaussian copula: each leg hits when its latent
+   normal falls below Phi^-1(p_leg); one vectorized draw of correlated normals
+   gives the joint hit rate. Draws are seeded per leg set, so prices are
+   stable, and results are LRU-cached per leg set.
+3. search_parlays() prices every N-leg combination of a candidate pool from a
+   single correlated draw of the whole pool, using bit-packed hit vectors so
+   each combination is an AND + popcount.
+
+Legs are dicts. Recognized keys: odds (American), probability /
+hit_probability (0-1 or percent), game_id / event_id / matchup, team,
+player_name / player, prop_type / market, side, line.
+
+Usage:
+    from core.parlay_pricing import price_parlay, search_parlays
+
+    price_parlay(legs, sport="NBA")["joint_probability"]
+    search_parlays(candidates, num_legs=3, sport="NFL", top=10)
+"""
+
+import asyncio
+import hashlib
+import itertools
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from math import comb
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from signals.prop_correlation import (
+    _get_correlation_rules,
+    _normalize_prop_type,
+    get_total_correlation_adjustment,
+)
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PARLAY_SIM_COUNT = int(os.getenv("PARLAY_SIM_COUNT", "20000"))
+PARLAY_PRICE_CACHE_SIZE = int(os.getenv("PARLAY_PRICE_CACHE_SIZE", "1024"))
+PARLAY_SEARCH_MAX_POOL = int(os.getenv("PARLAY_SEARCH_MAX_POOL", "40"))
+PARLAY_SEARCH_MAX_COMBOS = int(os.getenv("PARLAY_SEARCH_MAX_COMBOS", "200000"))
+PARLAY_HISTORY_TTL_SECONDS = int(os.getenv("PARLAY_HISTORY_TTL_SECONDS", "3600"))
+
+# Latent correlation implied by each prop_correlation rule direction
+RULE_CORRELATION = {
+    "same": 0.30,
+    "weak_same": 0.12,
+    "opposite": -0.20,
+}
+
+# Game total vs same-game offensive/defensive prop (sign from the rule check)
+TOTAL_PROP_CORRELATION = 0.20
+
+# Graded pairs needed before history outweighs the rule value
+HISTORY_PRIOR_PAIRS = 30
+
+# Clamp so a pair never makes the matrix (near-)singular
+MAX_ABS_CORRELATION = 0.90
+
+DEFAULT_LEG_ODDS = -110
+
+GAME_MARKETS = {"SPREAD", "SPREADS", "MONEYLINE", "ML", "H2H", "TOTAL", "TOTALS"}
+
+_NORMAL = NormalDist()
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint16)
+
+
+# =============================================================================
+# ODDS HELPERS
+# =============================================================================
+
+def american_to_decimal(american_odds: float) -> float:
+    if american_odds > 0:
+        return 1 + american_odds / 100
+    return 1 + 100 / abs(american_odds)
+
+
+def decimal_to_american(decimal_odds: float) -> int:
+    if decimal_odds <= 1.0:
+        return -10000
+    if decimal_odds >= 2.0:
+        return int(round((decimal_odds - 1) * 100))
+    return int(round(-100 / (decimal_odds - 1)))
+
+
+def leg_probability(leg: Dict[str, Any]) -> float:
+    """Model probability for a leg, falling back to the book's implied probability."""
+    for key in ("probability", "hit_probability", "model_probability"):
+        value = leg.get(key)
+        if value is not None:
+            p = float(value)
+            if p > 1.0:
+                p /= 100.0
+            return min(max(p, 1e-4), 1 - 1e-4)
+    return 1.0 / american_to_decimal(leg.get("odds", DEFAULT_LEG_ODDS))
+
+
+# =============================================================================
+# LEG DESCRIPTORS
+# =============================================================================
+
+def _game_key(leg: Dict[str, Any]) -> Optional[str]:
+    for key in ("game_id", "event_id", "matchup", "game"):
+        if leg.get(key):
+            return str(leg[key]).lower()
+    if leg.get("team"):
+        return f"team:{str(leg['team']).lower()}"
+    return None
+
+
+def _market(leg: Dict[str, Any]) -> str:
+    return str(leg.get("prop_type") or leg.get("market") or leg.get("pick_type") or "").strip()
+
+
+def _is_over(leg: Dict[str, Any]) -> bool:
+    return str(leg.get("side", "Over")).lower() != "under"
+
+
+def _player(leg: Dict[str, Any]) -> str:
+    return str(leg.get("player_name") or leg.get("player") or "").lower()
+
+
+def leg_key(leg: Dict[str, Any]) -> str:
+    """Identity of a leg for caching/dedupe (game, player, market, side, line)."""
+    return "|".join([
+        _game_key(leg) or "",
+        _player(leg),
+        _normalize_prop_type(_market(leg)),
+        "over" if _is_over(leg) else "under",
+        str(leg.get("line", "")),
+    ])
+
+
+def legs_conflict(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """Two legs on the same player/market (or the same game market) can't share a parlay."""
+    if _game_key(a) is None or _game_key(a) != _game_key(b):
+        return False
+    if _normalize_prop_type(_market(a)) != _normalize_prop_type(_market(b)):
+        return False
+    return _player(a) == _player(b)
+
+
+# =============================================================================
+# GRADED HISTORY
+# =============================================================================
+
+class HistoricalCorrelations:
+    """
+    Empirical same-game correlation between prop types from graded picks.
+
+    Each graded prop is reduced to "the stat went over" (an Over WIN or an
+    Under LOSS), and pairs of picks in the same event accumulate a 2x2 table
+    per (sport, type_a, type_b). The phi coefficient of that table is used as
+    the latent correlation (slightly conservative for a Gaussian copula).
+    """
+
+    def __init__(self):
+        self._pairs: Dict[Tuple[str, str, str], List[int]] = {}
+        self.picks_used = 0
+        self.loaded_at: Optional[float] = None
+
+    @classmethod
+    def from_picks(cls, picks: Sequence[Dict[str, Any]]) -> "HistoricalCorrelations":
+        table = cls()
+        by_event: Dict[Tuple[str, str], List[Tuple[str, int]]] = {}
+        for pick in picks:
+            result = str(pick.get("result") or "").upper()
+            if result not in ("WIN", "LOSS"):
+                continue
+            market = _normalize_prop_type(_market(pick))
+            event = pick.get("event_id") or pick.get("game_id")
+            if not event or market.upper() in GAME_MARKETS:
+                continue
+            went_over = int((result == "WIN") == _is_over(pick))
+            sport = str(pick.get("sport", "")).upper()
+            by_event.setdefault((sport, str(event)), []).append((market, went_over))
+            table.picks_used += 1
+
+        for (sport, _event), entries in by_event.items():
+            for (type_a, over_a), (type_b, over_b) in itertools.combinations(entries, 2):
+                if type_a == type_b:
+                    continue
+                if type_b < type_a:
+                    type_a, type_b, over_a, over_b = type_b, type_a, over_b, over_a
+                stats = table._pairs.setdefault((sport, type_a, type_b), [0, 0, 0, 0])
+                stats[0] += 1
+                stats[1] += over_a
+                stats[2] += over_b
+                stats[3] += over_a * over_b
+        table.loaded_at = time.time()
+        return table
+
+    def lookup(self, sport: str, type_a: str, type_b: str) -> Tuple[Optional[float], int]:
+        """(phi, n) for a prop-type pair, or (None, n) when undefined."""
+        if type_b < type_a:
+            type_a, type_b = type_b, type_a
+        stats = self._pairs.get((sport.upper(), type_a, type_b))
+        if not stats:
+            return None, 0
+        n, sa, sb, sab = stats
+        denom = sa * (n - sa) * sb * (n - sb)
+        if denom <= 0:
+            return None, n
+        return (n * sab - sa * sb) / denom ** 0.5, n
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+
+_history: Optional[HistoricalCorrelations] = None
+_history_lock = threading.Lock()
+_history_refreshing = False
+
+
+def _load_history() -> HistoricalCorrelations:
+    try:
+        from grader_store import load_predictions
+        return HistoricalCorrelations.from_picks(load_predictions())
+    except Exception as e:
+        logger.debug("Parlay history correlations unavailable: %s", e)
+        table = HistoricalCorrelations()
+        table.loaded_at = time.time()
+        return table
+
+
+def refresh_history_correlations() -> HistoricalCorrelations:
+    """Rebuild the graded-history table now (blocking; scheduler/startup pre-warm)."""
+    global _history
+    table = _load_history()
+    with _history_lock:
+        _history = table
+    return table
+
+
+def _refresh_history_in_background() -> None:
+    global _history_refreshing
+    with _history_lock:
+        if _history_refreshing:
+            return
+        _history_refreshing = True
+
+    def run():
+        global _history_refreshing
+        try:
+            refresh_history_correlations()
+        finally:
+            with _history_lock:
+                _history_refreshing = False
+
+    threading.Thread(target=run, name="parlay-history-refresh", daemon=True).start()
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def get_history_correlations(refresh: bool = False) -> HistoricalCorrelations:
+    """
+    Graded-history table, rebuilt from grader_store at most every PARLAY_HISTORY_TTL_SECONDS.
+
+    load_predictions() reads the whole grader store, so it never runs on an
+    event-loop thread: a stale table is served while a background thread
+    rebuilds it, and a cold call on the loop gets an empty table until the
+    first build lands. Only a cold call off the loop (or refresh=True) builds
+    inline.
+    """
+    if refresh:
+        return refresh_history_correlations()
+    with _history_lock:
+        table = _history
+    if table is not None and (time.time() - (table.loaded_at or 0)) <= PARLAY_HISTORY_TTL_SECONDS:
+        return table
+    if table is not None or _on_event_loop():
+        _refresh_history_in_background()
+        return table if table is not None else HistoricalCorrelations()
+    return refresh_history_correlations()
+
+
+def set_history_correlations(table: Optional[HistoricalCorrelations]) -> None:
+    """Install a history table (tests, or a precomputed table at startup)."""
+    global _history
+    with _history_lock:
+        _history = table
+    clear_price_cache()
+
+
+# =============================================================================
+# CORRELATION MATRIX
+# =============================================================================
+
+def _rule_correlation(sport: str, a: Dict[str, Any], b: Dict[str, Any]) -> Tuple[float, Optional[str]]:
+    """Latent correlation between two same-game legs' stats (before side signs)."""
+    type_a = _normalize_prop_type(_market(a))
+    type_b = _normalize_prop_type(_market(b))
+
+    total_leg, prop_leg = None, None
+    if type_a.upper() in ("TOTAL", "TOTALS"):
+        total_leg, prop_leg = a, b
+    elif type_b.upper() in ("TOTAL", "TOTALS"):
+        total_leg, prop_leg = b, a
+    if total_leg is not None:
+        # get_total_correlation_adjustment already accounts for both sides
+        adjustment, reasons = get_total_correlation_adjustment(
+            sport, total_leg.get("line") or 0, total_leg.get("side") or "Over",
+            _market(prop_leg), prop_leg.get("side") or "Over",
+        )
+        if adjustment == 0:
+            return 0.0, None
+        rho = TOTAL_PROP_CORRELATION if adjustment > 0 else -TOTAL_PROP_CORRELATION
+        # Undo the side signs applied by the caller
+        sign = (1 if _is_over(a) else -1) * (1 if _is_over(b) else -1)
+        return rho * sign, reasons[0]
+
+    for first, second in ((type_a, type_b), (type_b, type_a)):
+        for correlated_type, direction in _get_correlation_rules(sport, first):
+            if second == correlated_type or correlated_type in second:
+                rho = RULE_CORRELATION.get(direction)
+                if rho is not None:
+                    return rho, f"{first} ~ {second} ({direction})"
+    return 0.0, None
+
+
+def pair_correlation(
+    sport: str,
+    a: Dict[str, Any],
+    b: Dict[str, Any],
+    history: Optional[HistoricalCorrelations] = None,
+) -> Dict[str, Any]:
+    """
+    Correlation between two legs' hit events.
+
+    Returns {"correlation", "source", "reason", "history_n"}.
+    """
+    game_a, game_b = _game_key(a), _game_key(b)
+    if game_a is None or game_a != game_b:
+        return {"correlation": 0.0, "source": "independent", "reason": "Different games", "history_n": 0}
+
+    rho, reason = _rule_correlation(sport, a, b)
+    source = "rule" if reason else "none"
+
+    history_n = 0
+    if history is not None:
+        phi, history_n = history.lookup(sport, _normalize_prop_type(_market(a)), _normalize_prop_type(_market(b)))
+        if phi is not None:
+            weight = history_n / (history_n + HISTORY_PRIOR_PAIRS)
+            rho = weight * phi + (1 - weight) * rho
+            source = "history" if source == "none" else "rule+history"
+            reason = f"{reason + '; ' if reason else ''}graded phi={phi:.2f} (n={history_n})"
+
+    # Correlation of the stats -> correlation of the picked outcomes
+    sign = (1 if _is_over(a) else -1) * (1 if _is_over(b) else -1)
+    rho = max(-MAX_ABS_CORRELATION, min(MAX_ABS_CORRELATION, rho * sign))
+    return {"correlation": round(rho, 4), "source": source, "reason": reason, "history_n": history_n}
+
+
+def nearest_correlation_matrix(matrix: np.ndarray, floor: float = 1e-6) -> np.ndarray:
+    """Clip negative eigenvalues and rescale to a unit diagonal."""
+    sym = (matrix + matrix.T) / 2
+    values, vectors = np.linalg.eigh(sym)
+    if values.min() >= floor:
+        return sym
+    fixed = (vectors * np.clip(values, floor, None)) @ vectors.T
+    d = np.sqrt(np.diag(fixed))
+    fixed = fixed / np.outer(d, d)
+    np.fill_diagonal(fixed, 1.0)
+    return fixed
+
+
+def correlation_matrix(
+    legs: Sequence[Dict[str, Any]],
+    sport: str = "NBA",
+    history: Optional[HistoricalCorrelations] = None,
+) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """Leg correlation matrix (valid for Cholesky) plus the non-zero pair details."""
+    k = len(legs)
+    matrix = np.eye(k)
+    pairs = []
+    for i, j in itertools.combinations(range(k), 2):
+        info = pair_correlation(sport, legs[i], legs[j], history)
+        matrix[i, j] = matrix[j, i] = info["correlation"]
+        if info["correlation"] != 0:
+            pairs.append({"legs": [i, j], **info})
+    return nearest_correlation_matrix(matrix), pairs
+
+
+# =============================================================================
+# COPULA SIMULATION
+# =============================================================================
+
+def _seed_for(key: str) -> int:
+    return int(hashlib.md5(key.encode()).hexdigest()[:8], 16)
+
+
+def _correlated_normals(matrix: np.ndarray, num_sims: int, seed: int) -> np.ndarray:
+    chol = np.linalg.cholesky(matrix)
+    z = np.random.default_rng(seed).standard_normal((num_sims, matrix.shape[0]))
+    return z @ chol.T
+
+
+def _thresholds(probabilities: Sequence[float]) -> np.ndarray:
+    return np.array([_NORMAL.inv_cdf(p) for p in probabilities])
+
+
+def joint_hit_probability(
+    probabilities: Sequence[float],
+    matrix: np.ndarray,
+    num_sims: int = PARLAY_SIM_COUNT,
+    seed: int = 0,
+) -> float:
+    """P(all legs hit) under a Gaussian copula with the given correlation matrix."""
+    z = _correlated_normals(matrix, num_sims, seed)
+    return float(np.all(z < _thresholds(probabilities), axis=1).mean())
+
+
+class _PriceCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._items: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._items), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+_price_cache = _PriceCache(PARLAY_PRICE_CACHE_SIZE)
+
+
+def clear_price_cache() -> None:
+    _price_cache.clear()
+
+
+def get_price_cache_stats() -> Dict[str, int]:
+    return _price_cache.stats()
+
+
+def price_parlay(
+    legs: Sequence[Dict[str, Any]],
+    sport: str = "NBA",
+    num_sims: int = PARLAY_SIM_COUNT,
+    use_history: bool = True,
+) -> Dict[str, Any]:
+    """
+    Correlation-aware price for a parlay.
+
+    Returns the independent and correlated joint hit probabilities, fair vs
+    book odds, expected value per unit staked, and the correlated pairs.
+    """
+    probabilities = [leg_probability(leg) for leg in legs]
+    book_decimal = 1.0
+    for leg in legs:
+        book_decimal *= american_to_decimal(leg.get("odds", DEFAULT_LEG_ODDS))
+
+    keys = sorted(f"{leg_key(leg)}@{p:.4f}" for leg, p in zip(legs, probabilities))
+    leg_set_key = f"{sport.upper()}#{num_sims}#{int(use_history)}#" + "#".join(keys)
+    # Keyed on the history build too, so a TTL reload reprices instead of serving old correlations
+    history = get_history_correlations() if use_history else None
+    cache_key = f"{leg_set_key}#{history.loaded_at if history is not None else 0}"
+    cached = _price_cache.get(cache_key)
+    if cached is not None:
+        return {**cached, "cached": True}
+
+    matrix, pairs = correlation_matrix(legs, sport, history)
+    independent = float(np.prod(probabilities)) if probabilities else 1.0
+    if len(legs) < 2 or not pairs:
+        joint = independent
+    else:
+        joint = joint_hit_probability(probabilities, matrix, num_sims, seed=_seed_for(leg_set_key))
+
+    result = {
+        "leg_count": len(legs),
+        "leg_probabilities": [round(p, 4) for p in probabilities],
+        "independent_probability": round(independent, 5),
+        "joint_probability": round(joint, 5),
+        "correlation_lift": round(joint / independent, 4) if independent > 0 else None,
+        "fair_decimal": round(1 / joint, 3) if joint > 0 else None,
+        "fair_american": decimal_to_american(1 / joint) if joint > 0 else None,
+        "book_decimal": round(book_decimal, 3),
+        "book_american": decimal_to_american(book_decimal),
+        "expected_value": round(joint * book_decimal - 1, 4),
+        "correlated_pairs": pairs,
+        "simulations": num_sims if pairs and len(legs) >= 2 else 0,
+        "method": "gaussian_copula" if pairs and len(legs) >= 2 else "independent",
+    }
+    _price_cache.put(cache_key, result)
+    return {**result, "cached": False}
+
+
+# =============================================================================
+# BEST-EV SEARCH
+# =============================================================================
+
+def _trim_pool(pool: List[Dict[str, Any]], num_legs: int, max_pool: int, max_combos: int) -> List[Dict[str, Any]]:
+    """Keep the highest single-leg EV legs so C(pool, num_legs) stays bounded."""
+    def single_ev(leg):
+        return leg_probability(leg) * american_to_decimal(leg.get("odds", DEFAULT_LEG_ODDS)) - 1
+
+    ranked = sorted(pool, key=single_ev, reverse=True)[:max_pool]
+    while len(ranked) > num_legs and comb(len(ranked), num_legs) > max_combos:
+        ranked.pop()
+    return ranked
+
+
+def search_parlays(
+    pool: Sequence[Dict[str, Any]],
+    num_legs: int = 3,
+    sport: str = "NBA",
+    top: int = 10,
+    num_sims: int = PARLAY_SIM_COUNT,
+    use_history: bool = True,
+    max_pool: int = PARLAY_SEARCH_MAX_POOL,
+    max_combos: int = PARLAY_SEARCH_MAX_COMBOS,
+    chunk_size: int = 4096,
+) -> Dict[str, Any]:
+    """
+    Best-EV N-leg parlays from a candidate pool.
+
+    One correlated draw covers the whole pool (any subset of a multivariate
+    normal is the subset's copula), so every combination is scored from the
+    same bit-packed hit vectors.
+    """
+    start = time.perf_counter()
+    if num_legs < 2:
+        raise ValueError("num_legs must be >= 2")
+    candidates = _trim_pool(list(pool), num_legs, max_pool, max_combos)
+    m = len(candidates)
+    if m < num_legs:
+        return {"parlays": [], "pool_size": m, "combinations_evaluated": 0, "elapsed_ms": 0.0}
+
+    history = get_history_correlations() if use_history else None
+    matrix, _pairs = correlation_matrix(candidates, sport, history)
+    probabilities = [leg_probability(leg) for leg in candidates]
+    decimals = np.array([american_to_decimal(leg.get("odds", DEFAULT_LEG_ODDS)) for leg in candidates])
+
+    seed = _seed_for("#".join(sorted(leg_key(leg) for leg in candidates)))
+    hits = _correlated_normals(matrix, num_sims, seed) < _thresholds(probabilities)
+    packed = np.packbits(hits.T, axis=1)  # (m, num_sims / 8)
+
+    conflicts = np.zeros((m, m), dtype=bool)
+    for i, j in itertools.combinations(range(m), 2):
+        conflicts[i, j] = conflicts[j, i] = legs_conflict(candidates[i], candidates[j])
+
+    combos = np.array(list(itertools.combinations(range(m), num_legs)), dtype=np.intp).reshape(-1, num_legs)
+    if conflicts.any():
+        clash = np.zeros(len(combos), dtype=bool)
+        for a, b in itertools.combinations(range(num_legs), 2):
+            clash |= conflicts[combos[:, a], combos[:, b]]
+        combos = combos[~clash]
+
+    joint = np.empty(len(combos))
+    for lo in range(0, len(combos), chunk_size):
+        chunk = combos[lo:lo + chunk_size]
+        both = np.bitwise_and.reduce(packed[chunk], axis=1)
+        joint[lo:lo + chunk_size] = _POPCOUNT[both].sum(axis=1) / num_sims
+    book = decimals[combos].prod(axis=1)
+    ev = joint * book - 1
+
+    order = np.argsort(-ev)[:top]
+    parlays = []
+    for idx in order:
+        legs = [candidates[i] for i in combos[idx]]
+        independent = float(np.prod([probabilities[i] for i in combos[idx]]))
+        parlays.append({
+            "legs": legs,
+            "joint_probability": round(float(joint[idx]), 5),
+            "independent_probability": round(independent, 5),
+            "book_decimal": round(float(book[idx]), 3),
+            "book_american": decimal_to_american(float(book[idx])),
+            "expected_value": round(float(ev[idx]), 4),
+        })
+
+    return {
+        "parlays": parlays,
+        "pool_size": m,
+        "combinations_evaluated": int(len(combos)),
+        "simulations": num_sims,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
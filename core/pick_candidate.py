@@ -0,0 +1,180 @@
+"""
+PICK CANDIDATE - Compact candidate record for the best-bets pipeline
+
+Every prop and game line scored in _best_bets_inner used to become a ~150-key
+dict: the candidate's own fields, a full copy of calculate_pick_score()'s
+output (**score_data), and a dozen alias keys holding the same values
+(player/player_name, market/stat_type/prop_type, side/over_under, ...).
+Big slates hold thousands of them while only the top few reach the response.
+
+PickCandidate keeps those layers apart instead of merging them:
+
+    overrides  - keys written after construction (pick_id, gate flags, ...)
+    late       - fields that must win over score_data (sharp_signal, context)
+    score      - calculate_pick_score() output, held by reference (no copy)
+    fields     - the candidate's own fields, without aliases
+    aliases    - resolved on read from ALIASES tables, never stored
+
+Lookups walk the layers in that order, which is exactly the precedence of the
+old dict literal ({**fields, **score_data, **late} then mutations), so
+to_dict() reproduces the previous public shape. It is only called for picks
+that survive dedupe, thresholds, gates and top-N.
+
+Reads look like a dict (get, [], in, setdefault) and also like an object
+(getattr), so the contradiction and diversity gates work unchanged.
+
+Usage:
+    from core.pick_candidate import PickCandidate, PROP_ALIASES
+
+    cand = PickCandidate({"player": "LeBron James", "market": "points", ...},
+                         score_data, late={"sharp_signal": "STRONG"},
+                         aliases=PROP_ALIASES)
+    cand["pick_id"] = pid
+    cand.get("player_name")  # "LeBron James"
+    public = cand.to_dict()
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+# =============================================================================
+# ALIAS TABLES
+# =============================================================================
+
+# alias -> (layer, target key, default). "fields" aliases copy a candidate
+# field; "score" aliases copy a calculate_pick_score() output key.
+AliasTable = Dict[str, Tuple[str, str, Any]]
+
+_COMMON_ALIASES: AliasTable = {
+    "league": ("fields", "sport", None),
+    "matchup": ("fields", "game", None),
+    "is_started_already": ("fields", "has_started", None),
+    "is_live_bet_candidate": ("fields", "is_live", None),
+    "signals_firing": ("fields", "signals_fired", None),
+    "pillars_hit": ("score", "pillars_passed", ()),
+    "titanium_reasons": ("score", "smash_reasons", ()),
+}
+
+PROP_ALIASES: AliasTable = {
+    **_COMMON_ALIASES,
+    "player_name": ("fields", "player", None),
+    "stat_type": ("fields", "market", None),
+    "prop_type": ("fields", "market", None),
+    "over_under": ("fields", "side", None),
+    "sportsbook_name": ("fields", "book", None),
+    "best_book": ("fields", "book", None),
+    "sportsbook_event_url": ("fields", "book_link", None),
+    "best_book_link": ("fields", "book_link", None),
+}
+
+# Game picks default "book" to "consensus", so the sportsbook aliases point at
+# the raw best book instead of "book".
+GAME_ALIASES: AliasTable = {
+    **_COMMON_ALIASES,
+    "best_book": ("fields", "sportsbook_name", None),
+    "sportsbook_event_url": ("fields", "book_link", None),
+    "best_book_link": ("fields", "book_link", None),
+}
+
+_MISSING = object()
+
+
+# =============================================================================
+# CANDIDATE RECORD
+# =============================================================================
+
+class PickCandidate:
+    """Layered, alias-aware pick record (see module docstring)."""
+
+    __slots__ = ("_fields", "_score", "_late", "_overrides", "_aliases")
+
+    def __init__(self, fields: Dict[str, Any], score: Optional[Dict[str, Any]] = None,
+                 late: Optional[Dict[str, Any]] = None, aliases: Optional[AliasTable] = None):
+        self._fields = fields
+        self._score = score if score is not None else {}
+        self._late = late
+        self._overrides: Optional[Dict[str, Any]] = None
+        self._aliases = aliases or {}
+
+    # --- lookup ---
+
+    def _lookup(self, key: str) -> Any:
+        if self._overrides is not None and key in self._overrides:
+            return self._overrides[key]
+        if self._late is not None and key in self._late:
+            return self._late[key]
+        if key in self._score:
+            return self._score[key]
+        if key in self._fields:
+            return self._fields[key]
+        if key in self._aliases:
+            return self._resolve_alias(key)
+        return _MISSING
+
+    def _resolve_alias(self, key: str) -> Any:
+        layer, target, default = self._aliases[key]
+        source = self._fields if layer == "fields" else self._score
+        value = source.get(target, _MISSING)
+        if value is _MISSING:
+            return list(default) if isinstance(default, tuple) else default
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __getattr__(self, key: str) -> Any:
+        # Object-style access used by the contradiction gate: getattr(pick, key, default).
+        # Private/dunder names never map to pick fields (and keep copy/pickle probing sane).
+        if key.startswith("_"):
+            raise AttributeError(key)
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise AttributeError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key) is not _MISSING
+
+    # --- mutation ---
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self._overrides is None:
+            self._overrides = {}
+        self._overrides[key] = value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            self[key] = default
+            return default
+        return value
+
+    # --- materialization ---
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public dict shape: fields + aliases, then score_data, late fields, overrides."""
+        out: Dict[str, Any] = dict(self._fields)
+        for alias in self._aliases:
+            if alias not in out:
+                out[alias] = self._resolve_alias(alias)
+        out.update(self._score)
+        if self._late:
+            out.update(self._late)
+        if self._overrides:
+            out.update(self._overrides)
+        return out
+
+    def __repr__(self) -> str:
+        ident = self.get("player") or self.get("pick") or self.get("game", "")
+        return f"PickCandidate({ident!r}, total_score={self.get('total_score')!r})"
+
+
+def materialize(pick: Any) -> Any:
+    """PickCandidate -> public dict; anything else is returned unchanged."""
+    return pick.to_dict() if isinstance(pick, PickCandidate) else pick
@@ -0,0 +1,241 @@
+"""
+PROP SCORE MEMO - Incremental props rescoring between best-bets rebuilds
+
+Keeps the previous run's per-prop input fingerprint and calculate_pick_score()
+output, keyed by (event, player, market, side, book). On the next rebuild the
+props loop asks the memo first: if the fingerprint of the fresh inputs (line,
+odds, spread/total, sharp signal, injuries, weather, game status, the game's
+bookmaker lines) matches the stored one, the previous score is reused instead
+of re-running every engine. The memo is cleared when the prop LSTM is
+hot-swapped (model_registry), since its output feeds every prop score.
+
+Usage:
+    from core.prop_score_memo import get_prop_score_memo, prop_memo_key, fingerprint_inputs
+
+    memo = get_prop_score_memo()
+    run = memo.begin_run("NBA")
+    key = prop_memo_key(event_id, player, market, side, book)
+    fp = fingerprint_inputs(line=line, odds=odds, sharp=sharp_signal,
+                            books=bookmaker_lines(game["bookmakers"], ("spreads", "totals", market)))
+    score_data = run.lookup(key, fp)
+    if score_data is None:
+        score_data = calculate_pick_score(...)
+        run.store(key, fp, score_data)
+    run.finish()
+    run.to_dict()  # {"reused": N, "rescored": M, ...}
+
+Entries also carry a max age so that time-dependent signals (esoteric daily
+energy, live market phase) are always refreshed at least every
+PROPS_MEMO_MAX_AGE_S seconds even when the market has not moved.
+"""
+
+import os
+import copy
+import json
+import time
+import hashlib
+import logging
+from threading import Lock
+from typing import Any, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger("prop_score_memo")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PROPS_INCREMENTAL_ENABLED = os.getenv("PROPS_INCREMENTAL_ENABLED", "true").lower() == "true"
+PROPS_MEMO_MAX_AGE_S = int(os.getenv("PROPS_MEMO_MAX_AGE_S", "900"))  # 15 minutes
+PROPS_MEMO_MAX_ENTRIES = int(os.getenv("PROPS_MEMO_MAX_ENTRIES", "20000"))
+
+# Bump when calculate_pick_score() semantics change so stale entries never match
+MEMO_SCHEMA_VERSION = "1"
+
+MemoKey = Tuple[str, str, str, str, str]
+
+
+# =============================================================================
+# KEYS + FINGERPRINTS
+# =============================================================================
+
+def prop_memo_key(event_id: Any, player: str, market: str, side: str, book: str) -> MemoKey:
+    """Build the stable memo key for one prop candidate."""
+    return (
+        str(event_id or ""),
+        (player or "").lower().strip(),
+        (market or "").lower().strip(),
+        (side or "").lower().strip(),
+        (book or "").lower().strip(),
+    )
+
+
+def fingerprint_inputs(**inputs: Any) -> str:
+    """
+    Hash the scoring inputs of one candidate into a short fingerprint.
+
+    Values are serialized with sorted keys so that dict ordering from upstream
+    APIs does not cause false misses. Non-JSON values (datetimes) use str().
+    """
+    payload = json.dumps(
+        {"_v": MEMO_SCHEMA_VERSION, **inputs},
+        sort_keys=True,
+        default=str,
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def bookmaker_lines(bookmakers: Any, markets: Any) -> list:
+    """
+    Sorted (book, market, outcome, point, price) rows for the given markets.
+
+    Odds API bookmakers are nested lists whose order varies between fetches;
+    flattening and sorting lets the fingerprint see only real line/odds moves.
+    """
+    wanted = set(markets)
+    rows = []
+    for bm in bookmakers or []:
+        book = bm.get("key") or bm.get("title") or ""
+        for market in bm.get("markets", []):
+            key = market.get("key", "")
+            if key not in wanted:
+                continue
+            for outcome in market.get("outcomes", []):
+                rows.append((book, key, outcome.get("name") or "", outcome.get("description") or "",
+                             outcome.get("point"), outcome.get("price")))
+    rows.sort(key=str)
+    return rows
+
+
+# =============================================================================
+# MEMO
+# =============================================================================
+
+class PropMemoRun:
+    """Per-run view over the memo with reused/rescored counters."""
+
+    def __init__(self, memo: "PropScoreMemo", sport: str):
+        self._memo = memo
+        self.sport = sport.upper()
+        self.enabled = memo.enabled
+        self.reused = 0
+        self.rescored = 0
+        self.expired = 0
+        self._seen: Set[MemoKey] = set()
+
+    def lookup(self, key: MemoKey, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return a private copy of the previous score_data, or None on miss."""
+        self._seen.add(key)
+        if not self.enabled:
+            return None
+        hit, expired = self._memo._get(self.sport, key, fingerprint)
+        if expired:
+            self.expired += 1
+        if hit is None:
+            return None
+        self.reused += 1
+        return hit
+
+    def store(self, key: MemoKey, fingerprint: str, score_data: Dict[str, Any]) -> None:
+        """Record a freshly computed score_data for the next run."""
+        self._seen.add(key)
+        self.rescored += 1
+        if self.enabled:
+            self._memo._put(self.sport, key, fingerprint, score_data)
+
+    def finish(self) -> None:
+        """Drop memo entries for props that disappeared from this run's slate."""
+        if self.enabled:
+            self._memo._retain(self.sport, self._seen)
+
+    def to_dict(self) -> Dict[str, Any]:
+        total = self.reused + self.rescored
+        return {
+            "enabled": self.enabled,
+            "reused": self.reused,
+            "rescored": self.rescored,
+            "expired": self.expired,
+            "reuse_rate": round(self.reused / total, 3) if total else 0.0,
+            "memo_size": self._memo.size(self.sport),
+        }
+
+
+class PropScoreMemo:
+    """
+    Process-local memo of prop score outputs, partitioned by sport.
+
+    Thread-safe; entries are deep-copied in and out so that the props loop
+    can keep mutating score_data (weather modifiers, injury downgrades)
+    without corrupting the stored baseline.
+    """
+
+    def __init__(
+        self,
+        max_age_s: int = PROPS_MEMO_MAX_AGE_S,
+        max_entries: int = PROPS_MEMO_MAX_ENTRIES,
+        enabled: bool = PROPS_INCREMENTAL_ENABLED,
+    ):
+        self.max_age_s = max_age_s
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = Lock()
+        # sport -> key -> (fingerprint, score_data, stored_at)
+        self._entries: Dict[str, Dict[MemoKey, Tuple[str, Dict[str, Any], float]]] = {}
+
+    def begin_run(self, sport: str) -> PropMemoRun:
+        return PropMemoRun(self, sport)
+
+    def _get(self, sport: str, key: MemoKey, fingerprint: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        with self._lock:
+            entry = self._entries.get(sport, {}).get(key)
+            if entry is None:
+                return None, False
+            stored_fp, score_data, stored_at = entry
+            if time.time() - stored_at > self.max_age_s:
+                del self._entries[sport][key]
+                return None, True
+            if stored_fp != fingerprint:
+                return None, False
+            return copy.deepcopy(score_data), False
+
+    def _put(self, sport: str, key: MemoKey, fingerprint: str, score_data: Dict[str, Any]) -> None:
+        snapshot = copy.deepcopy(score_data)
+        with self._lock:
+            bucket = self._entries.setdefault(sport, {})
+            if key not in bucket and len(bucket) >= self.max_entries:
+                # Evict the oldest entry to bound memory on huge slates
+                oldest = min(bucket, key=lambda k: bucket[k][2])
+                del bucket[oldest]
+            bucket[key] = (fingerprint, snapshot, time.time())
+
+    def _retain(self, sport: str, keys: Set[MemoKey]) -> None:
+        with self._lock:
+            bucket = self._entries.get(sport)
+            if not bucket:
+                return
+            for stale in [k for k in bucket if k not in keys]:
+                del bucket[stale]
+
+    def size(self, sport: Optional[str] = None) -> int:
+        with self._lock:
+            if sport is not None:
+                return len(self._entries.get(sport.upper(), {}))
+            return sum(len(b) for b in self._entries.values())
+
+    def clear(self, sport: Optional[str] = None) -> None:
+        with self._lock:
+            if sport is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(sport.upper(), None)
+
+
+_memo: Optional[PropScoreMemo] = None
+
+
+def get_prop_score_memo() -> PropScoreMemo:
+    """Get the process-wide prop score memo singleton."""
+    global _memo
+    if _memo is None:
+        _memo = PropScoreMemo()
+    return _memo
@@ -0,0 +1,210 @@
+"""
+REQUEST COALESCER - Single-flight upstream fetches for shared live-data endpoints
+
+get_sharp_money, get_splits, get_injuries, get_lines and get_props are called
+by their own routes and, concurrently, by composite endpoints
+(get_sport_dashboard, get_game_details, get_parlay_builder_init, best-bets,
+debug breakdowns) that asyncio.gather several of them at once. When api_cache
+is cold every caller used to run its own Playbook/Odds API fetch.
+
+The coalescer keys work by (function, sport, ET date):
+
+- Concurrent callers of the same key share one in-flight fetch and its
+  result (or its exception).
+- Successful results are memoized in-process for a short per-function TTL
+  (COALESCE_TTLS), so panels that render a moment apart also share them
+  without another api_cache (Redis) round trip.
+
+Results are shared objects, exactly like api_cache's in-memory backend:
+callers must not mutate them.
+
+In-flight fetches are shared per event loop: the scheduler warms best-bets
+on its own thread and loop, and an asyncio future cannot be awaited from
+another loop. The memo is shared by every loop, under a threading lock.
+
+Usage:
+    from core.request_coalescer import get_request_coalescer
+
+    result = await get_request_coalescer().run("sharp", sport, lambda: fetch(sport))
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("request_coalescer")
+
+try:
+    from core.time_et import format_et_day
+except ImportError:  # pragma: no cover - time_et is part of core
+    format_et_day = None
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+REQUEST_COALESCING_ENABLED = os.getenv("REQUEST_COALESCING_ENABLED", "true").lower() == "true"
+
+# Seconds a finished result is reused; 0 = coalesce in-flight fetches only.
+# Kept well under api_cache's 300s so the memo never extends staleness much.
+COALESCE_TTLS: Dict[str, float] = {
+    "sharp": float(os.getenv("COALESCE_TTL_SHARP_S", "60")),
+    "splits": float(os.getenv("COALESCE_TTL_SPLITS_S", "60")),
+    "lines": float(os.getenv("COALESCE_TTL_LINES_S", "30")),
+    "props": float(os.getenv("COALESCE_TTL_PROPS_S", "60")),
+    "injuries": float(os.getenv("COALESCE_TTL_INJURIES_S", "300")),
+}
+COALESCE_DEFAULT_TTL_S = float(os.getenv("COALESCE_DEFAULT_TTL_S", "30"))
+COALESCE_MAX_ENTRIES = int(os.getenv("COALESCE_MAX_ENTRIES", "256"))
+
+CoalesceKey = Tuple[str, str, str]
+InflightKey = Tuple[int, CoalesceKey]  # (id of the event loop, key)
+
+
+def _today() -> str:
+    return format_et_day() if format_et_day else date.today().isoformat()
+
+
+# =============================================================================
+# COALESCER
+# =============================================================================
+
+class RequestCoalescer:
+    """Single-flight + short-TTL memo keyed by (function, sport, ET date)."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        enabled: bool = REQUEST_COALESCING_ENABLED,
+        max_entries: int = COALESCE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttls = dict(COALESCE_TTLS if ttls is None else ttls)
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: Dict[CoalesceKey, Tuple[Any, float]] = {}  # key -> (result, expires_at)
+        self._inflight: Dict[InflightKey, asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, name: str, sport: str, day: Optional[str] = None) -> CoalesceKey:
+        return (name, (sport or "").lower(), day or _today())
+
+    def _count(self, name: str, field: str) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(name, {"fetches": 0, "memo_hits": 0, "coalesced": 0, "errors": 0})
+            counts[field] += 1
+
+    def _memo_get(self, key: CoalesceKey) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            result, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return False, None
+            return True, result
+
+    def _memo_put(self, key: CoalesceKey, result: Any) -> None:
+        ttl = self.ttls.get(key[0], COALESCE_DEFAULT_TTL_S)
+        if ttl <= 0:
+            return
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k][1])
+                del self._entries[oldest]
+            self._entries[key] = (result, self._clock() + ttl)
+
+    async def run(self, name: str, sport: str, fetch: Callable[[], Awaitable[Any]], day: Optional[str] = None) -> Any:
+        """
+        Return fetch()'s result, running fetch() at most once per key at a time.
+
+        Exceptions raised by the leader propagate to every waiter of that
+        flight and are not memoized.
+        """
+        if not self.enabled:
+            return await fetch()
+
+        key = self.make_key(name, sport, day)
+        hit, result = self._memo_get(key)
+        if hit:
+            self._count(name, "memo_hits")
+            return result
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            self._count(name, "coalesced")
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The leader was cancelled, not us: fetch ourselves
+
+        self._count(name, "fetches")
+        future: asyncio.Future = loop.create_future()
+        with self._lock:
+            self._inflight[flight_key] = future
+        try:
+            result = await fetch()
+        except Exception as e:
+            self._count(name, "errors")
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody was waiting
+            raise
+        else:
+            self._memo_put(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                if self._inflight.get(flight_key) is future:
+                    del self._inflight[flight_key]
+            if not future.done():
+                future.cancel()
+
+    def invalidate(self, name: str = "", sport: str = "") -> int:
+        with self._lock:
+            keys = [k for k in self._entries
+                    if (not name or k[0] == name) and (not sport or k[1] == sport.lower())]
+            for k in keys:
+                del self._entries[k]
+        return len(keys)
+
+    def reset(self) -> None:
+        """Drop memo and in-flight futures (forked workers must not await the parent's)."""
+        # A forked child may inherit the lock held; it is never shared with the parent
+        self._lock = threading.Lock()
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "ttls_s": self.ttls,
+                "live_entries": sum(1 for _, exp in self._entries.values() if exp > now),
+                "inflight": len(self._inflight),
+                "by_function": {name: dict(counts) for name, counts in self._stats.items()},
+            }
+
+
+_coalescer: Optional[RequestCoalescer] = None
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Get the process-wide request coalescer."""
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = RequestCoalescer()
+    return _coalescer
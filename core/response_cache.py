@@ -0,0 +1,320 @@
+"""
+RESPONSE CACHE - Pre-serialized public payloads for hot /live endpoints
+
+Large read endpoints (best-bets) used to re-sanitize, re-normalize and
+re-encode the same cached dict with the stdlib json encoder on every hit.
+This module stores the final member-facing payload once, as bytes, with a
+content-hash ETag and lazily built compressed variants, so that a cache hit
+is a dict lookup plus an If-None-Match comparison.
+
+Usage:
+    from core.response_cache import get_payload_store
+
+    store = get_payload_store()
+    pre = store.put("best-bets:nba", public_payload, ttl=120)
+    pre = store.get("best-bets:nba")
+    status, body, headers = pre.render(
+        if_none_match=request.headers.get("if-none-match"),
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+
+    # Cheap change detection for pollers (bumped only when bytes change)
+    store.version("nba")  # {"scope": "nba", "seq": 3, "version": '"..."', ...}
+
+Framework-free on purpose: callers wrap (status, body, headers) in their
+own Response class.
+"""
+
+import gzip
+import json
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger("response_cache")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# Bodies smaller than this are never compressed (header overhead dominates)
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+DEFAULT_TTL_S = 120
+MAX_ENTRIES = 256
+
+
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for types neither encoder handles natively (sets, numpy scalars)."""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "item"):
+        return obj.item()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps_bytes(payload: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                payload,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError as e:
+            # orjson rejects some inputs the stdlib accepts (e.g. >64-bit ints)
+            logger.debug("orjson failed, falling back to stdlib json: %s", e)
+    return json.dumps(
+        payload, default=_json_default, ensure_ascii=False, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def loads_bytes(body: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag from the exact response bytes."""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+
+def select_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick br > gzip from an Accept-Encoding header (None = identity)."""
+    if not accept_encoding:
+        return None
+    offered = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        offered[token.strip().lower()] = q
+    if BROTLI_AVAILABLE and offered.get("br", 0) > 0:
+        return "br"
+    if offered.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+# =============================================================================
+# PRECOMPUTED PAYLOAD
+# =============================================================================
+
+@dataclass
+class PrecomputedPayload:
+    """Final public payload bytes + ETag, with compressed variants built on demand."""
+    body: bytes
+    etag: str
+    created_at: float
+    expires_at: float
+    _variants: Dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_payload(cls, payload: Any, ttl: int = DEFAULT_TTL_S) -> "PrecomputedPayload":
+        body = dumps_bytes(payload)
+        now = time.time()
+        return cls(body=body, etag=compute_etag(body), created_at=now, expires_at=now + ttl)
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires_at
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """Body for a content-coding; compressed variants are built once and reused."""
+        if encoding is None or len(self.body) < MIN_COMPRESS_BYTES:
+            return self.body
+        variant = self._variants.get(encoding)
+        if variant is None:
+            if encoding == "br" and BROTLI_AVAILABLE:
+                variant = brotli.compress(self.body, quality=BROTLI_QUALITY)
+            elif encoding == "gzip":
+                variant = gzip.compress(self.body, compresslevel=GZIP_LEVEL, mtime=0)
+            else:
+                return self.body
+            self._variants[encoding] = variant
+        return variant
+
+    def payload(self) -> Any:
+        """Decode back to Python (for internal callers that need the dict)."""
+        return loads_bytes(self.body)
+
+    def render(
+        self,
+        if_none_match: Optional[str] = None,
+        accept_encoding: Optional[str] = None,
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        """
+        Return (status_code, body, headers) for an HTTP response.
+
+        304 with an empty body when If-None-Match matches; otherwise 200 with
+        the best compressed variant the client accepts.
+        """
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding"}
+        if etag_matches(if_none_match, self.etag):
+            return 304, b"", headers
+        encoding = select_encoding(accept_encoding)
+        body = self.encoded(encoding)
+        if body is not self.body:
+            headers["Content-Encoding"] = encoding
+        return 200, body, headers
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+def scope_for_key(key: str) -> Optional[str]:
+    """Version scope (sport) of a cache key shaped like "endpoint:sport[:...]"."""
+    parts = key.split(":")
+    return parts[1].lower() if len(parts) > 1 and parts[1] else None
+
+
+class PayloadStore:
+    """
+    Process-local TTL store of PrecomputedPayload by cache key.
+
+    Also keeps a per-scope (sport) change counter: it is bumped only when a
+    key's ETag actually changes, so a poller can compare one small value
+    instead of refetching every endpoint.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: Dict[str, PrecomputedPayload] = {}
+        self._etags: Dict[str, str] = {}
+        self._seq: Dict[str, int] = {}
+        self._changed_at: Dict[str, float] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[PrecomputedPayload]:
+        with self._lock:
+            pre = self._entries.get(key)
+            if pre is None or pre.expired:
+                if pre is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self.hits += 1
+            return pre
+
+    def put(self, key: str, payload: Any, ttl: int = DEFAULT_TTL_S) -> PrecomputedPayload:
+        pre = PrecomputedPayload.from_payload(payload, ttl=ttl)
+        scope = scope_for_key(key)
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k].expires_at)
+                del self._entries[oldest]
+            self._entries[key] = pre
+            # _etags outlives expiry so re-storing identical bytes is not a change
+            if self._etags.get(key) != pre.etag:
+                self._etags[key] = pre.etag
+                if scope is not None:
+                    self._seq[scope] = self._seq.get(scope, 0) + 1
+                    self._changed_at[scope] = pre.created_at
+        return pre
+
+    def discard(self, key: str) -> None:
+        """Drop one key (its source data was replaced outside the store)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, prefix: str = "") -> int:
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def version(self, scope: str) -> Dict[str, Any]:
+        """
+        Change token for every payload stored under a scope (sport).
+
+        seq is a process-local counter; version is a hash of the current
+        per-key ETags, so it matches across workers serving identical bytes.
+        """
+        scope = scope.lower()
+        with self._lock:
+            etags = {k: e for k, e in self._etags.items() if scope_for_key(k) == scope}
+            seq = self._seq.get(scope, 0)
+            changed_at = self._changed_at.get(scope)
+        token = "|".join(f"{k}={etags[k]}" for k in sorted(etags)).encode("utf-8")
+        return {
+            "scope": scope,
+            "seq": seq,
+            "version": compute_etag(token),
+            "changed_at": changed_at,
+            "etags": etags,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "scopes": dict(self._seq),
+                "bytes": sum(len(p.body) for p in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "orjson": ORJSON_AVAILABLE,
+                "brotli": BROTLI_AVAILABLE,
+            }
+
+
+_store: Optional[PayloadStore] = None
+
+
+def get_payload_store() -> PayloadStore:
+    """Get the process-wide public payload store."""
+    global _store
+    if _store is None:
+        _store = PayloadStore()
+    return _store
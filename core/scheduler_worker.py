@@ -0,0 +1,346 @@
+"""
+SCHEDULER WORKER - Run DailyScheduler in one process, outside the API workers
+
+Retrain, grading and snapshot jobs used to run inside every API worker and
+compete with request handling for CPU and the GIL. Process roles
+(WORKER_ROLE) split that work off:
+
+- all (default): serves HTTP and is a scheduler candidate. Every candidate
+  contends for the "scheduler" leader lease; only the holder runs
+  DailyScheduler, so N API workers no longer mean N schedulers.
+- api: serves HTTP only. Never starts the scheduler; on-demand scheduler
+  work is enqueued for the worker, and models retrained there are hot-swapped
+  here via published model-update markers.
+- worker: `python -m daily_scheduler --worker`. No HTTP; holds the lease,
+  runs DailyScheduler and consumes scheduler and heavy on-demand jobs
+  (core.heavy_jobs) from the job queue.
+
+Leases and markers use core.coordination (Redis or a SQLite file on the
+shared volume), so this works without Redis as long as processes share the
+volume. Multi-host deploys need COORDINATION_BACKEND=redis.
+
+Usage:
+    # Web processes
+    WORKER_ROLE=api uvicorn main:app --workers 4
+    # Scheduler / grader process
+    WORKER_ROLE=worker python -m daily_scheduler --worker
+
+    from core.scheduler_worker import scheduler_summary
+    scheduler_summary()     # {"role": "api", "running": True, "local": False, "leader": {...}}
+"""
+
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from core.coordination import LeaderLease, LeaseKeeper, get_coordination_store, process_id
+from core.heavy_jobs import HEAVY_JOB_HANDLERS
+from core.job_queue import JobHandler, JobRunner, ProgressFn
+
+logger = logging.getLogger("scheduler_worker")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+WORKER_ROLES = ("all", "api", "worker")
+SCHEDULER_LEASE_NAME = "scheduler"
+SCHEDULER_LEASE_TTL_S = float(os.getenv("SCHEDULER_LEASE_TTL_S", "30"))
+# How often API processes check for models retrained by the scheduler worker
+MODEL_UPDATE_POLL_S = float(os.getenv("MODEL_UPDATE_POLL_S", "30"))
+
+# Job types consumed by the scheduler lease holder
+JOB_RUN_AUDIT = "scheduler.run_audit"
+JOB_RUN_CLEANUP = "scheduler.run_cleanup"
+JOB_RUN_JOB = "scheduler.run_job"
+
+
+def get_worker_role() -> str:
+    role = os.getenv("WORKER_ROLE", "all").lower()
+    if role not in WORKER_ROLES:
+        logger.warning("Unknown WORKER_ROLE=%r, using 'all'", role)
+        return "all"
+    return role
+
+
+def role_runs_scheduler(role: Optional[str] = None) -> bool:
+    return (role or get_worker_role()) in ("all", "worker")
+
+
+def role_serves_http(role: Optional[str] = None) -> bool:
+    return (role or get_worker_role()) in ("all", "api")
+
+
+# =============================================================================
+# JOB HANDLERS
+# =============================================================================
+
+def _local_scheduler():
+    from daily_scheduler import get_scheduler
+    scheduler = get_scheduler()
+    if scheduler is None:
+        raise RuntimeError("Scheduler not initialized in this process")
+    return scheduler
+
+
+def _handle_run_audit(payload: Dict[str, Any], progress: ProgressFn) -> Any:
+    return _local_scheduler().run_audit_now()
+
+
+def _handle_run_cleanup(payload: Dict[str, Any], progress: ProgressFn) -> Any:
+    return _local_scheduler().cleanup_job.run()
+
+
+def _handle_run_job(payload: Dict[str, Any], progress: ProgressFn) -> Any:
+    progress(0.0, f"running {payload['job']}")
+    return _local_scheduler().run_job_now(payload["job"])
+
+
+SCHEDULER_JOB_HANDLERS: Dict[str, JobHandler] = {
+    JOB_RUN_AUDIT: _handle_run_audit,
+    JOB_RUN_CLEANUP: _handle_run_cleanup,
+    JOB_RUN_JOB: _handle_run_job,
+}
+
+
+# =============================================================================
+# SCHEDULER LEADERSHIP
+# =============================================================================
+
+class SchedulerLeadership:
+    """
+    Runs DailyScheduler while this process holds the scheduler lease.
+
+    The lease info carries a compact scheduler status, so processes without
+    a local scheduler can still report what the leader is doing.
+    """
+
+    def __init__(self, auto_grader=None, ttl_s: float = SCHEDULER_LEASE_TTL_S):
+        self.auto_grader = auto_grader
+        self.role = get_worker_role()
+        self.lease = LeaderLease(SCHEDULER_LEASE_NAME, ttl_s=ttl_s)
+        self.keeper = LeaseKeeper(self.lease, on_acquired=self._on_acquired,
+                                  on_lost=self._on_lost, info=self._info)
+        # The lease holder also runs on-demand heavy jobs (training, audits, auto-grade)
+        self.runner = JobRunner({**SCHEDULER_JOB_HANDLERS, **HEAVY_JOB_HANDLERS},
+                                should_run=lambda: self.keeper.is_leader)
+
+    @property
+    def is_leader(self) -> bool:
+        return self.keeper.is_leader
+
+    def start(self) -> "SchedulerLeadership":
+        self.keeper.start()
+        self.runner.start()
+        logger.info("Scheduler leadership started (role=%s, holder=%s)", self.role, self.lease.holder_id)
+        return self
+
+    def stop(self) -> None:
+        self.runner.stop()
+        self.keeper.stop(release=True)
+
+    def _on_acquired(self) -> None:
+        from daily_scheduler import get_scheduler, init_scheduler
+        scheduler = get_scheduler() or init_scheduler(auto_grader=self.auto_grader)
+        scheduler.start()
+
+    def _on_lost(self) -> None:
+        # Runs on the keeper thread: stop scheduling new runs without waiting for
+        # running jobs (they re-check the lease via holds_scheduler_lease)
+        from daily_scheduler import get_scheduler
+        scheduler = get_scheduler()
+        if scheduler is not None and scheduler.running:
+            scheduler.stop(wait=False)
+
+    def _info(self) -> Dict[str, Any]:
+        info: Dict[str, Any] = {"role": self.role, "pid": os.getpid()}
+        if self.keeper.is_leader:
+            from daily_scheduler import get_scheduler
+            scheduler = get_scheduler()
+            if scheduler is not None:
+                status = scheduler.get_status()
+                status.pop("last_results", None)
+                info["scheduler"] = status
+        return info
+
+
+_leadership: Optional[SchedulerLeadership] = None
+
+
+def start_scheduler_leadership(auto_grader=None) -> SchedulerLeadership:
+    global _leadership
+    if _leadership is None:
+        _leadership = SchedulerLeadership(auto_grader).start()
+    return _leadership
+
+
+def get_scheduler_leadership() -> Optional[SchedulerLeadership]:
+    return _leadership
+
+
+def stop_scheduler_leadership() -> None:
+    global _leadership
+    if _leadership is not None:
+        _leadership.stop()
+        _leadership = None
+
+
+def holds_scheduler_lease() -> bool:
+    """
+    Whether scheduler jobs in this process may run.
+
+    True without a lease (scheduler started directly, tests); otherwise only
+    while the keeper considers us leader and the store still names us holder.
+    """
+    leadership = _leadership
+    if leadership is None:
+        return True
+    if not leadership.is_leader:
+        return False
+    try:
+        holder = leadership.lease.holder()
+    except Exception as e:
+        logger.warning("Scheduler lease check failed: %s", e)
+        return False
+    return holder is not None and holder.get("holder") == leadership.lease.holder_id
+
+
+def scheduler_summary() -> Dict[str, Any]:
+    """
+    Scheduler health from this process's point of view.
+
+    running is True when the local scheduler runs, or (for processes that
+    don't lead) when some process holds an unexpired scheduler lease.
+    """
+    from daily_scheduler import get_scheduler
+    scheduler = get_scheduler()
+    local = bool(scheduler is not None and scheduler.running)
+    summary: Dict[str, Any] = {"role": get_worker_role(), "local": local, "leader": None}
+    try:
+        summary["leader"] = LeaderLease(SCHEDULER_LEASE_NAME).holder()
+    except Exception as e:
+        summary["leader_error"] = str(e)
+    summary["running"] = local or summary["leader"] is not None
+    return summary
+
+
+# =============================================================================
+# MODEL UPDATE BROADCAST
+# =============================================================================
+
+def _model_marker(name: str) -> str:
+    return f"model_updated:{name}"
+
+
+def hot_swap_models(*names: str) -> None:
+    """
+    Reload retrained models in this process, then tell the others to do the same.
+
+    A worker that serves no HTTP only publishes: reloading would import and
+    build models (and live_data_router) it never uses.
+    """
+    if not role_serves_http():
+        publish_model_update(*names)
+        return
+    try:
+        from model_registry import get_model_registry
+        results = get_model_registry().reload(*names)
+        logger.info("Hot-swapped models after retrain: %s", results)
+    except Exception as e:
+        logger.warning("Model hot-swap after retrain failed: %s", e)
+    publish_model_update(*names)
+
+
+def publish_model_update(*names: str) -> None:
+    """Tell other processes these models were retrained (they reload on next poll)."""
+    try:
+        store = get_coordination_store()
+        for name in names:
+            store.put_marker(_model_marker(name), {"at": time.time(), "by": process_id()})
+    except Exception as e:
+        logger.warning("Model update publish failed: %s", e)
+
+
+class ModelUpdateWatcher:
+    """Polls model-update markers and hot-swaps models retrained in another process."""
+
+    def __init__(self, poll_s: float = MODEL_UPDATE_POLL_S):
+        self.poll_s = poll_s
+        self._seen: Dict[str, float] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "ModelUpdateWatcher":
+        if self._thread is None:
+            self.poll_once(reload=False)  # models loaded at startup are already current
+            self._thread = threading.Thread(target=self._run, name="model-update-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def poll_once(self, reload: bool = True) -> Dict[str, bool]:
+        from model_registry import get_model_registry
+        registry = get_model_registry()
+        store = get_coordination_store()
+        changed = []
+        for name in registry.names:
+            marker = store.get_marker(_model_marker(name))
+            if not marker or marker["at"] <= self._seen.get(name, 0):
+                continue
+            self._seen[name] = marker["at"]
+            if marker.get("by") != process_id():
+                changed.append(name)
+        if not (reload and changed):
+            return {}
+        results = registry.reload(*changed)
+        logger.info("Hot-swapped models retrained elsewhere: %s", results)
+        return results
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_s):
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning("Model update poll failed: %s", e)
+
+
+# =============================================================================
+# WORKER ENTRYPOINT
+# =============================================================================
+
+def run_worker() -> None:
+    """`python -m daily_scheduler --worker`: lead the scheduler until SIGTERM/SIGINT."""
+    os.environ.setdefault("WORKER_ROLE", "worker")
+    from storage_paths import ensure_persistent_storage_ready
+    from data_dir import ensure_dirs
+    import database
+
+    ensure_persistent_storage_ready()
+    ensure_dirs()
+    database.init_database()
+
+    from auto_grader import get_grader
+    leadership = start_scheduler_leadership(auto_grader=get_grader())
+
+    stopping = threading.Event()
+
+    def _handle_signal(signum, frame):
+        logger.info("Scheduler worker received signal %s, shutting down", signum)
+        stopping.set()
+
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
+    logger.info("Scheduler worker %s running (waiting for lease if another worker leads)", leadership.lease.holder_id)
+    while not stopping.wait(1.0):
+        pass
+    stop_scheduler_leadership()
+    logger.info("Scheduler worker stopped")
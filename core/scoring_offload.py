@@ -0,0 +1,219 @@
+"""
+SCORING OFFLOAD - Keep the event loop responsive during CPU-bound scoring
+
+Best-bets scoring (calculate_pick_score, esoteric/GLITCH math, Jarvis
+gematria, tiering, dedup) is synchronous Python. Run on the event loop it
+blocks every other request on the worker (health checks, /live/lines, SSE)
+until the slate is scored. Two mechanisms, selected by SCORING_OFFLOAD_MODE:
+
+- "inline" (default): scoring stays on the event loop but the scoring loops
+  call ScoringYielder.maybe_yield(), which hands control back to the loop
+  whenever SCORING_YIELD_INTERVAL_MS of CPU time has passed. Other requests
+  wait at most one yield interval (plus one candidate) instead of the whole
+  slate.
+- "process": whole scoring runs are dispatched to a small ProcessPoolExecutor
+  of dedicated scoring workers. Each worker keeps one persistent event loop
+  for the coroutines it runs and preloads the models itself at start-up.
+
+Workers start with forkserver (spawn where unavailable), not fork: the API
+process already runs scheduler, model-watcher and to_thread threads when
+the pool is first created, and forking a threaded process can deadlock on
+locks held by those threads. SCORING_PROCESS_START_METHOD=fork is still
+accepted. Modules owning loop-bound state (HTTP clients) register a reset
+hook with register_worker_reset(); hooks are passed to each worker and run
+once at start-up (needed for fork, harmless otherwise).
+
+Workers hold their own copies of the models, so a hot-swap in the API
+process (model_registry reload) recycles the pool: running calls finish on
+the old workers and the next call starts workers that load the new models.
+
+Usage:
+    from core.scoring_offload import ScoringYielder, offload_enabled, run_coroutine_in_worker
+
+    yielder = ScoringYielder()
+    for candidate in candidates:
+        await yielder.maybe_yield()
+        ...
+
+    if offload_enabled():
+        result = await run_coroutine_in_worker(module_level_async_fn, *args)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("scoring_offload")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SCORING_OFFLOAD_MODE = os.getenv("SCORING_OFFLOAD_MODE", "inline").lower()
+SCORING_OFFLOAD_WORKERS = max(1, int(os.getenv("SCORING_OFFLOAD_WORKERS", "2")))
+SCORING_PROCESS_START_METHOD = os.getenv(
+    "SCORING_PROCESS_START_METHOD",
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn",
+)
+# 0 disables cooperative yielding
+SCORING_YIELD_INTERVAL_MS = float(os.getenv("SCORING_YIELD_INTERVAL_MS", "20"))
+
+
+# =============================================================================
+# COOPERATIVE YIELDING
+# =============================================================================
+
+class ScoringYielder:
+    """Yield to the event loop at most once per interval from a synchronous scoring loop."""
+
+    def __init__(self, interval_ms: float = SCORING_YIELD_INTERVAL_MS):
+        self.interval_s = interval_ms / 1000.0
+        self._last = time.perf_counter()
+        self.yields = 0
+
+    async def maybe_yield(self) -> bool:
+        if self.interval_s <= 0:
+            return False
+        now = time.perf_counter()
+        if now - self._last < self.interval_s:
+            return False
+        await asyncio.sleep(0)
+        self._last = time.perf_counter()
+        self.yields += 1
+        return True
+
+
+# =============================================================================
+# SCORING WORKER PROCESSES
+# =============================================================================
+
+_reset_hooks: List[Callable[[], None]] = []
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_stats = {"dispatched": 0, "completed": 0, "failed": 0, "pool_restarts": 0, "pool_recycles": 0}
+
+
+def register_worker_reset(hook: Callable[[], None]) -> None:
+    """Register a module-level callable that drops loop-bound state inherited by a worker."""
+    if hook not in _reset_hooks:
+        _reset_hooks.append(hook)
+
+
+def _init_worker(hooks: tuple = ()) -> None:
+    """Worker start-up: reset inherited loop-bound state, then make sure models are loaded."""
+    global _worker_loop
+    for hook in hooks:
+        try:
+            hook()
+        except Exception as e:
+            logger.warning("Scoring worker reset hook %s failed: %s", getattr(hook, "__name__", hook), e)
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    try:
+        # No-op for models already preloaded in a forked parent
+        from model_registry import get_model_registry
+        get_model_registry().preload()
+    except Exception as e:
+        logger.debug("Scoring worker model preload skipped: %s", e)
+
+
+def _run_coroutine(fn: Callable, args: tuple, kwargs: dict) -> Any:
+    """Executed in the worker: run fn(*args, **kwargs) on the worker's persistent loop."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+    return _worker_loop.run_until_complete(fn(*args, **kwargs))
+
+
+def offload_enabled() -> bool:
+    return SCORING_OFFLOAD_MODE == "process"
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=SCORING_OFFLOAD_WORKERS,
+                mp_context=multiprocessing.get_context(SCORING_PROCESS_START_METHOD),
+                initializer=_init_worker,
+                initargs=(tuple(_reset_hooks),),
+            )
+            logger.info("Scoring process pool started: %d workers (%s)",
+                        SCORING_OFFLOAD_WORKERS, SCORING_PROCESS_START_METHOD)
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+            _stats["pool_restarts"] += 1
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def recycle_scoring_pool() -> None:
+    """
+    Replace the workers after a model hot-swap (they hold the old models).
+
+    Running calls finish on the old pool; the next call starts a new one.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        _stats["pool_recycles"] += 1
+        pool.shutdown(wait=False)
+        logger.info("Scoring process pool recycled after model hot-swap")
+
+
+async def run_coroutine_in_worker(fn: Callable, *args, **kwargs) -> Any:
+    """
+    Run a module-level coroutine function in a scoring worker process.
+
+    fn, its arguments and its result must be picklable. A crashed worker
+    pool is replaced on the next call; the failing call raises.
+    """
+    pool = _get_pool()
+    _stats["dispatched"] += 1
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(pool, _run_coroutine, fn, args, kwargs)
+    except BrokenProcessPool:
+        _stats["failed"] += 1
+        _discard_pool(pool)
+        raise
+    except Exception:
+        _stats["failed"] += 1
+        raise
+    _stats["completed"] += 1
+    return result
+
+
+def shutdown_scoring_pool(wait: bool = True) -> None:
+    """Stop the scoring workers (call on app shutdown)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def get_offload_stats() -> Dict[str, Any]:
+    return {
+        "mode": SCORING_OFFLOAD_MODE,
+        "workers": SCORING_OFFLOAD_WORKERS if offload_enabled() else 0,
+        "start_method": SCORING_PROCESS_START_METHOD,
+        "pool_running": _pool is not None,
+        "yield_interval_ms": SCORING_YIELD_INTERVAL_MS,
+        **_stats,
+    }
@@ -141,6 +141,27 @@ def compute_final_score_option_a(
     return final_score, context_modifier
 
 
+def compute_score_ceiling(base_score: float, context_modifier: float) -> float:
+    """
+    Upper bound on compute_final_score_option_a() once BASE_4 and the context
+    modifier are known.
+
+    Every remaining term is capped: the boost sum by TOTAL_BOOST_CAP, hook
+    penalty <= 0, expert consensus <= EXPERT_CONSENSUS_CAP, prop correlation
+    <= PROP_CORRELATION_CAP. Later multipliers (Kp-Index) only lower the score.
+    A candidate whose ceiling is below a threshold can never reach it.
+    """
+    try:
+        from core.scoring_contract import (
+            CONTEXT_MODIFIER_CAP, TOTAL_BOOST_CAP, EXPERT_CONSENSUS_CAP, PROP_CORRELATION_CAP,
+        )
+    except Exception:
+        CONTEXT_MODIFIER_CAP, TOTAL_BOOST_CAP, EXPERT_CONSENSUS_CAP, PROP_CORRELATION_CAP = 0.35, 1.5, 0.35, 0.20
+    context_modifier = clamp_context_modifier(context_modifier, cap=CONTEXT_MODIFIER_CAP)
+    ceiling = base_score + context_modifier + TOTAL_BOOST_CAP + EXPERT_CONSENSUS_CAP + PROP_CORRELATION_CAP
+    return max(0.0, min(10.0, ceiling))
+
+
 def compute_harmonic_boost(research_score: float, esoteric_score: float) -> float:
     """Return harmonic convergence boost when both scores meet threshold."""
     try:
@@ -0,0 +1,266 @@
+"""
+STARTUP - Fast-startup mode, deferred heavy imports and a startup report
+
+Importing live_data_router (and everything it drags in: esoteric engines,
+context layer, signals, ML modules, redis, ...) dominates cold start. With
+FAST_STARTUP=true main.py binds the server with only its light endpoints
+(/health, /status, /metrics, ...) and imports the heavy subsystems in a
+background thread right after, then registers their routers and starts the
+scheduler / warmers. Until that finishes the heavy routes answer 503 with
+Retry-After, so deploy health checks pass as soon as the port is open.
+
+This module holds the framework-free pieces:
+
+1. StartupReport: named phase timings (module import, storage, database,
+   heavy imports, background services), per-heavy-module import timings and
+   the ready flag. Served by GET /debug/startup.
+
+2. ImportProfiler (opt-in, STARTUP_IMPORT_PROFILE=true): a meta path hook
+   that times every module executed after it is installed and reports self /
+   cumulative milliseconds per module, like `python -X importtime` but
+   readable from a running server.
+
+Usage:
+    from core.startup import get_startup_report
+
+    report = get_startup_report()
+    with report.phase("database"):
+        database.init_database()
+    report.import_modules(["live_data_router", "routers"])
+    report.mark_ready()
+    report.to_dict()
+"""
+
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("startup")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+FAST_STARTUP = os.getenv("FAST_STARTUP", "false").lower() == "true"
+STARTUP_IMPORT_PROFILE = os.getenv("STARTUP_IMPORT_PROFILE", "false").lower() == "true"
+# Budget for "process start -> server can answer /health" (checked by tests, logged at startup)
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "5"))
+STARTUP_REPORT_TOP_N = int(os.getenv("STARTUP_REPORT_TOP_N", "30"))
+
+
+# =============================================================================
+# IMPORT PROFILER
+# =============================================================================
+
+class _TimedLoader:
+    """Wraps a loader so exec_module() is timed; everything else is delegated."""
+
+    def __init__(self, loader, profiler: "ImportProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportProfiler:
+    """Meta path hook recording self / cumulative import time per module."""
+
+    def __init__(self):
+        self.modules: Dict[str, Dict[str, float]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._installed = False
+
+    # --- meta path finder protocol ---
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self)
+                    return spec
+            return None
+        finally:
+            self._local.finding = False
+
+    def install(self) -> "ImportProfiler":
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+        return self
+
+    def uninstall(self) -> None:
+        if self._installed:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self._installed = False
+
+    # --- timing stack (per thread: imports can run on the loader thread) ---
+
+    def _enter(self) -> None:
+        stack = getattr(self._local, "children", None)
+        if stack is None:
+            stack = self._local.children = []
+        stack.append(0.0)
+
+    def _exit(self, name: str, elapsed: float) -> None:
+        stack = self._local.children
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        with self._lock:
+            self.modules[name] = {"self_ms": (elapsed - children) * 1000, "cumulative_ms": elapsed * 1000}
+
+    def report(self, top_n: int = STARTUP_REPORT_TOP_N) -> Dict[str, Any]:
+        with self._lock:
+            items = list(self.modules.items())
+
+        def _top(key: str) -> List[Dict[str, Any]]:
+            ranked = sorted(items, key=lambda kv: -kv[1][key])[:top_n]
+            return [{"module": name, "self_ms": round(t["self_ms"], 2),
+                     "cumulative_ms": round(t["cumulative_ms"], 2)} for name, t in ranked]
+
+        return {
+            "modules_timed": len(items),
+            "top_self": _top("self_ms"),
+            "top_cumulative": _top("cumulative_ms"),
+        }
+
+
+# =============================================================================
+# STARTUP REPORT
+# =============================================================================
+
+class StartupReport:
+    """Phase and heavy-import timings for this process; see module docstring."""
+
+    def __init__(self, fast_startup: bool = FAST_STARTUP, profile_imports: bool = STARTUP_IMPORT_PROFILE):
+        self.fast_startup = fast_startup
+        self.created_at = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.imports: Dict[str, Dict[str, Any]] = {}
+        self.ready_after_s: Optional[float] = None
+        self.error: Optional[str] = None
+        self._loaded: set = set()
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self.profiler = ImportProfiler().install() if profile_imports else None
+
+    def _since_start(self) -> float:
+        return time.perf_counter() - self.created_at
+
+    @contextmanager
+    def phase(self, name: str):
+        started = self._since_start()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases.append({
+                    "phase": name,
+                    "started_s": round(started, 4),
+                    "seconds": round(self._since_start() - started, 4),
+                    "thread": threading.current_thread().name,
+                })
+
+    def mark(self, name: str) -> None:
+        """Record a phase spanning from report creation to now (e.g. main module imported)."""
+        with self._lock:
+            self.phases.append({
+                "phase": name,
+                "started_s": 0.0,
+                "seconds": round(self._since_start(), 4),
+                "thread": threading.current_thread().name,
+            })
+
+    def import_module(self, name: str):
+        """Import (or fetch) a module, recording how long it took and what it pulled in."""
+        before = len(sys.modules)
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            if name not in self.imports:
+                self.imports[name] = {
+                    "seconds": round(elapsed, 4),
+                    "new_modules": len(sys.modules) - before,
+                }
+            self._loaded.add(name)
+        return module
+
+    def import_modules(self, names: Iterable[str]) -> None:
+        for name in names:
+            self.import_module(name)
+
+    def is_loaded(self, name: str) -> bool:
+        """True once `name` was fully imported through this report (never triggers an import)."""
+        return name in self._loaded
+
+    def mark_ready(self) -> None:
+        if not self._ready.is_set():
+            self.ready_after_s = round(self._since_start(), 4)
+            self._ready.set()
+            logger.info("Startup complete in %.2fs (fast_startup=%s)", self.ready_after_s, self.fast_startup)
+
+    def mark_failed(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def to_dict(self, top_n: int = STARTUP_REPORT_TOP_N) -> Dict[str, Any]:
+        with self._lock:
+            phases = list(self.phases)
+            imports = dict(self.imports)
+        out = {
+            "fast_startup": self.fast_startup,
+            "ready": self.ready,
+            "ready_after_s": self.ready_after_s,
+            "uptime_s": round(self._since_start(), 3),
+            "budget_s": STARTUP_BUDGET_SECONDS,
+            "error": self.error,
+            "phases": phases,
+            "heavy_imports": dict(sorted(imports.items(), key=lambda kv: -kv[1]["seconds"])),
+            "modules_loaded": len(sys.modules),
+        }
+        if self.profiler is not None:
+            out["import_profile"] = self.profiler.report(top_n)
+        return out
+
+
+_startup_report: Optional[StartupReport] = None
+
+
+def get_startup_report() -> StartupReport:
+    """Process-wide startup report (created on first call - import this early)."""
+    global _startup_report
+    if _startup_report is None:
+        _startup_report = StartupReport()
+    return _startup_report
@@ -26,13 +26,15 @@ __all__ = [
 import os
 import json
 import asyncio
+import functools
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import logging
 logger = logging.getLogger(__name__)
 import threading
 import time
 from core.time_et import now_et
+from metrics import jobs_running, track_job
 
 # v20.12: Set TZ environment variable fallback for ET canonical clock
 if not os.getenv("TZ"):
@@ -57,12 +59,15 @@ except ImportError:
     logger.warning("result_fetcher not available - auto-grading disabled")
 
 # Best-bets cache pre-warm (v15.0)
+# v20.30: cache_warmer imports live_data_router only when it computes a
+# sport, so the scheduler worker does not load the router monolith at import
 WARM_AVAILABLE = False
 try:
-    from live_data_router import _best_bets_inner, api_cache, SPORT_MAPPINGS
+    from cache_warmer import get_best_bets_warmer
+    from core.hybrid_cache import api_cache
     WARM_AVAILABLE = True
 except ImportError:
-    logger.warning("live_data_router not available - cache pre-warm disabled")
+    logger.warning("cache_warmer not available - cache pre-warm disabled")
 
 # v16.1: ML Model Retraining
 ML_RETRAIN_AVAILABLE = False
@@ -73,88 +78,59 @@ except ImportError:
     logger.warning("ml_integration not available - ML retraining disabled")
 
 
-async def warm_best_bets_cache():
-    """Pre-warm best-bets cache for sports with games today. Called by scheduler."""
-    if not WARM_AVAILABLE:
-        logger.warning("WARM skipped: live_data_router not available")
-        return
+def _hot_swap_models(*names: str) -> None:
+    """Reload retrained models here and in the API processes (atomic swap, old model kept on failure)."""
+    from core.scheduler_worker import hot_swap_models
+    hot_swap_models(*names)
 
-    import pytz
-    ET = pytz.timezone("America/New_York")
-    now_et = datetime.now(ET)
-    today_str = now_et.strftime("%Y-%m-%d")
-    from data_dir import SUPPORTED_SPORTS
-    sports = [s.lower() for s in SUPPORTED_SPORTS]
 
-    for sport in sports:
-        cache_key = f"best-bets:{sport}"
-        try:
-            # Skip if cache already warm
-            cached = api_cache.get(cache_key)
-            if cached:
-                logger.info("WARM skip cache hot: %s", sport)
-                continue
-
-            # Distributed lock so multiple containers don't warm simultaneously
-            lock_key = f"warm_best_bets:{sport}:{today_str}"
-            if not api_cache.acquire_lock(lock_key, ttl=900):
-                logger.info("WARM skip locked: %s", sport)
-                continue
+# v20.30: One retrain decision per day, shared by the 7:00 and 7:15 jobs
+# (the first full retrain clears the drift flag the second job would read)
+_retrain_decision: Dict[str, Any] = {}
 
-            # Check if sport has games today (lightweight events fetch)
-            try:
-                import httpx
-                odds_api_key = os.getenv("ODDS_API_KEY", "")
-                odds_base = os.getenv("ODDS_API_BASE", "https://api.the-odds-api.com/v4")
-                sport_config = SPORT_MAPPINGS.get(sport, {})
-                odds_sport = sport_config.get("odds", "")
-                if odds_api_key and odds_sport:
-                    async with httpx.AsyncClient(timeout=15) as client:
-                        resp = await client.get(
-                            f"{odds_base}/sports/{odds_sport}/events",
-                            params={"apiKey": odds_api_key}
-                        )
-                        if resp.status_code == 200:
-                            events = resp.json()
-                            # Filter to today's games (simple date check)
-                            today_events = [e for e in events
-                                          if e.get("commence_time", "")[:10] == today_str]
-                            if not today_events:
-                                logger.info("WARM skip no games: %s", sport)
-                                api_cache.release_lock(lock_key)
-                                continue
-                        else:
-                            logger.warning("WARM events fetch failed for %s: %d", sport, resp.status_code)
-                            api_cache.release_lock(lock_key)
-                            continue
-                else:
-                    logger.info("WARM skip no API key or sport config: %s", sport)
-                    api_cache.release_lock(lock_key)
-                    continue
-            except Exception as e:
-                logger.warning("WARM events check error for %s: %s", sport, e)
-                api_cache.release_lock(lock_key)
-                continue
 
-            # Warm the cache by calling _best_bets_inner directly
-            logger.info("WARM start: %s", sport)
-            _start = time.time()
-            await _best_bets_inner(sport, sport, False, cache_key)
-            duration = time.time() - _start
-            logger.info("WARM done: %s in %.1fs", sport, duration)
+def leader_only(func):
+    """v20.30: Skip a scheduler job once this process has lost the scheduler lease."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        from core.scheduler_worker import holds_scheduler_lease
+        if not holds_scheduler_lease():
+            logger.warning("%s skipped: this process no longer holds the scheduler lease", func.__name__)
+            return None
+        return func(*args, **kwargs)
+    return wrapper
 
-            # Store warm metadata
-            api_cache.set(f"warm_meta:{sport}", {
-                "last_warm_time": datetime.now(ET).isoformat(),
-                "duration_seconds": round(duration, 1)
-            }, ttl=86400)
 
+def _full_retrain_due(job: str) -> bool:
+    """Whether today's scheduled full retrain should run (always True without online updates)."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    if _retrain_decision.get("date") != today:
+        try:
+            from team_ml_models import needs_full_retrain
+            due, reason = needs_full_retrain()
         except Exception as e:
-            logger.error("WARM error for %s: %s", sport, e)
-            try:
-                api_cache.release_lock(f"warm_best_bets:{sport}:{today_str}")
-            except Exception:
-                pass
+            due, reason = True, f"check_failed: {e}"
+        _retrain_decision.update(date=today, due=due, reason=reason)
+    if not _retrain_decision["due"]:
+        logger.info("%s skipped: models updated online (%s)", job, _retrain_decision["reason"])
+    else:
+        logger.info("%s: full retrain (%s)", job, _retrain_decision["reason"])
+    return _retrain_decision["due"]
+
+
+async def warm_best_bets_cache():
+    """
+    Pre-warm best-bets cache for sports with games today. Called by scheduler.
+
+    v20.30: Delegates to cache_warmer.BestBetsWarmer - sports are warmed
+    concurrently, most imminent / most requested first.
+    """
+    if not WARM_AVAILABLE:
+        logger.warning("WARM skipped: cache_warmer not available")
+        return
+
+    results = await get_best_bets_warmer().warm_all()
+    logger.info("WARM pass complete: %s", results or "nothing due")
 
 
 # ============================================
@@ -204,6 +180,8 @@ class DailyAuditJob:
         self.last_run = None
         self.last_results = {}
     
+    @track_job("daily_audit")
+    @leader_only
     def run(self):
         """Execute daily audit for all sports."""
         logger.info("=" * 50)
@@ -482,6 +460,8 @@ class CleanupJob:
     def __init__(self, auto_grader=None):
         self.auto_grader = auto_grader
     
+    @track_job("weekly_cleanup")
+    @leader_only
     def run(self):
         """Remove predictions older than configured days."""
         logger.info("🧹 Running cleanup job...")
@@ -722,6 +702,8 @@ class DailyScheduler:
         self.scheduler.start()
         logger.info("APScheduler started with daily audit at 6 AM")
 
+    @track_job("auto_grade")
+    @leader_only
     def _run_auto_grade(self):
         """Run auto-grading in an async context."""
         if not RESULT_FETCHER_AVAILABLE:
@@ -738,7 +720,19 @@ class DailyScheduler:
                 loop.close()
         except Exception as e:
             logger.error(f"Auto-grade failed: {e}")
+            return
+
+        # v20.30: New grades change the parlay history correlations; rebuild
+        # them here so request handlers never load the grader store inline
+        try:
+            from core.parlay_pricing import refresh_history_correlations
+            table = refresh_history_correlations()
+            logger.info("Parlay history correlations rebuilt: %d pairs from %d picks", len(table), table.picks_used)
+        except Exception as e:
+            logger.warning("Parlay history refresh failed: %s", e)
 
+    @track_job("team_model_train")
+    @leader_only
     def _run_team_model_train(self):
         """
         v20.16: Train team ML models from graded picks.
@@ -749,11 +743,18 @@ class DailyScheduler:
         - Ensemble weights (learns what combinations work)
 
         Runs daily at 7 AM ET, after grading is complete.
+
+        v20.30: With online updates enabled, graded games already update the
+        models as they are graded; the full retrain only runs on drift or
+        when the last retrain is older than TEAM_MODEL_MAX_RETRAIN_AGE_DAYS.
         """
+        if not _full_retrain_due("team_model_train"):
+            return
         try:
             from scripts.train_team_models import train_all
             result = train_all(days=7)  # Process last 7 days
             logger.info(f"Team model training complete: {result}")
+            _hot_swap_models("team_lstm", "team_matchup", "game_ensemble")
         except ImportError:
             # Fallback to direct call
             try:
@@ -777,6 +778,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error(f"Team model training failed: {e}")
 
+    @track_job("ensemble_regressor_train")
+    @leader_only
     def _run_ensemble_regressor_train(self):
         """
         v20.22: Train sklearn ensemble regressors from graded picks.
@@ -788,12 +791,13 @@ class DailyScheduler:
         - Target: binary hit classification (WIN=1, LOSS=0)
 
         Saves trained models to /data/models/ensemble_sklearn_regressors.joblib
-        for EnsembleStackingModel to load on next restart.
+        and hot-swaps them into the running MasterPredictionSystem.
 
         NOTE: Models are trained in SHADOW MODE by default (telemetry only).
         Set ENSEMBLE_SKLEARN_ENABLED=true to use for live predictions.
 
-        Runs daily at 7:15 AM ET (after team model training at 7 AM).
+        Runs daily at 7:15 AM ET (after team model training at 7 AM). Unlike
+        the team models it has no online update path, so it retrains nightly.
         """
         logger.info("🎯 Starting ensemble sklearn regressor training...")
         try:
@@ -820,6 +824,7 @@ class DailyScheduler:
                 meta_acc = result['training_metrics'].get('meta_accuracy', 0)
                 logger.info(f"   Meta model accuracy: {meta_acc:.2%}")
                 logger.info("   NOTE: Models in SHADOW MODE (telemetry only)")
+                _hot_swap_models("master_prediction")
             elif result.get('error'):
                 logger.warning("   Error: %s", result.get('error'))
 
@@ -828,6 +833,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error(f"Ensemble regressor training failed: {e}")
 
+    @track_job("training_verification")
+    @leader_only
     def _run_training_verification(self):
         """
         v20.16.4: Verify that 7 AM training job actually ran.
@@ -953,6 +960,8 @@ class DailyScheduler:
             except Exception as e:
                 logger.error("   Failed to write alert file: %s", e)
     
+    @track_job("player_cache_warm")
+    @leader_only
     def _run_player_cache_warm(self):
         """
         v20.23: Pre-warm NBA player data cache before picks generation.
@@ -1017,6 +1026,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error("Player cache warm failed: %s", e)
 
+    @track_job("warm_cache")
+    @leader_only
     def _run_warm_cache(self):
         """Pre-warm best-bets cache in an async context."""
         if not WARM_AVAILABLE:
@@ -1031,6 +1042,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error("Cache warm failed: %s", e)
 
+    @track_job("lstm_retrain_weekly")
+    @leader_only
     def _run_lstm_retrain(self):
         """
         v18.1: Weekly LSTM model retraining (enhanced).
@@ -1062,6 +1075,7 @@ class DailyScheduler:
                         return
                     results = pipeline.retrain_all_models(min_samples=100)
                     logger.info("🧠 LSTM retrain complete (legacy): %s", results)
+                    _hot_swap_models("prop_lstm")
                 except ImportError:
                     logger.warning("LSTM training pipeline not available")
                 return
@@ -1077,6 +1091,7 @@ class DailyScheduler:
             if result.returncode == 0:
                 logger.info("🧠 LSTM retrain complete (enhanced):\n%s",
                           result.stdout[-1000:] if result.stdout else "")
+                _hot_swap_models("prop_lstm")
             else:
                 logger.warning("LSTM retrain exited with code %d: %s",
                              result.returncode, result.stderr[-500:] if result.stderr else "")
@@ -1086,6 +1101,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error("LSTM retrain failed: %s", e)
 
+    @track_job("ensemble_retrain_daily")
+    @leader_only
     def _run_ensemble_retrain(self):
         """
         v18.1: Daily ensemble model retraining (enhanced).
@@ -1136,6 +1153,7 @@ class DailyScheduler:
 
             if result.returncode == 0:
                 logger.info("🎯 Ensemble retrain complete:\n%s", result.stdout[-500:] if result.stdout else "")
+                _hot_swap_models("ensemble_hit_predictor", "game_ensemble")
             else:
                 logger.warning("Ensemble retrain exited with code %d: %s",
                              result.returncode, result.stderr[-500:] if result.stderr else "")
@@ -1145,6 +1163,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error("Ensemble retrain failed: %s", e)
 
+    @track_job("line_snapshot_capture")
+    @leader_only
     def _run_line_snapshot_capture(self):
         """
         v17.6: Capture line snapshots for Hurst Exponent analysis.
@@ -1264,6 +1284,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error("Line snapshot capture failed: %s", e)
 
+    @track_job("update_season_extremes")
+    @leader_only
     def _run_update_season_extremes(self):
         """
         v17.6: Update season extremes for Fibonacci Retracement.
@@ -1374,6 +1396,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error("Season extremes update failed: %s", e)
 
+    @track_job("officials_tendency_update")
+    @leader_only
     def _run_officials_tendency_update(self):
         """
         v18.0: Weekly officials tendency recalculation.
@@ -1415,6 +1439,8 @@ class DailyScheduler:
         except Exception as e:
             logger.error("Officials tendency update failed: %s", e)
 
+    @track_job("trap_evaluation")
+    @leader_only
     def _run_trap_evaluation(self):
         """
         v19.0: Post-game trap evaluation.
@@ -1636,12 +1662,12 @@ class DailyScheduler:
         self._thread.start()
         logger.info("Simple scheduler started (APScheduler not available)")
     
-    def stop(self):
-        """Stop the scheduler."""
+    def stop(self, wait: bool = True):
+        """Stop the scheduler (wait=False returns without waiting for running jobs)."""
         self.running = False
         
         if self.scheduler:
-            self.scheduler.shutdown()
+            self.scheduler.shutdown(wait=wait)
             self.scheduler = None
         
         logger.info("⏰ Daily scheduler stopped")
@@ -1650,6 +1676,30 @@ class DailyScheduler:
         """Manually trigger audit."""
         logger.info("Manual audit triggered")
         return self.audit_job.run()
+
+    # v20.30: Jobs ops can run on demand (POST /scheduler/run-job/{name}) -> method
+    RUNNABLE_JOBS = {
+        "auto_grade": "_run_auto_grade",
+        "team_model_train": "_run_team_model_train",
+        "ensemble_regressor_train": "_run_ensemble_regressor_train",
+        "training_verification": "_run_training_verification",
+        "player_cache_warm": "_run_player_cache_warm",
+        "warm_cache": "_run_warm_cache",
+        "lstm_retrain": "_run_lstm_retrain",
+        "ensemble_retrain": "_run_ensemble_retrain",
+        "line_snapshot_capture": "_run_line_snapshot_capture",
+        "update_season_extremes": "_run_update_season_extremes",
+        "officials_tendency_update": "_run_officials_tendency_update",
+        "trap_evaluation": "_run_trap_evaluation",
+    }
+
+    def run_job_now(self, name: str):
+        """Run a scheduled job immediately in this process."""
+        method = self.RUNNABLE_JOBS.get(name)
+        if method is None:
+            raise ValueError(f"Unknown job {name!r}; expected one of {sorted(self.RUNNABLE_JOBS)}")
+        logger.info("Manual job triggered: %s", name)
+        return getattr(self, method)()
     
     def get_status(self) -> Dict:
         """Get scheduler status."""
@@ -1658,7 +1708,8 @@ class DailyScheduler:
             "scheduler_type": "apscheduler" if SCHEDULER_AVAILABLE else "simple",
             "last_audit": self.audit_job.last_run.isoformat() if self.audit_job.last_run else None,
             "next_audit": f"{SchedulerConfig.AUDIT_HOUR:02d}:{SchedulerConfig.AUDIT_MINUTE:02d} daily",
-            "last_results": self.audit_job.last_results
+            "last_results": self.audit_job.last_results,
+            "jobs_running": jobs_running(),
         }
         
         if SCHEDULER_AVAILABLE and self.scheduler:
@@ -1702,20 +1753,39 @@ def get_scheduler() -> Optional[DailyScheduler]:
 get_daily_scheduler = get_scheduler
 
 
+def _scheduler_runs_here() -> bool:
+    return _scheduler is not None and _scheduler.running
+
+
+def _enqueue_for_worker(job_type: str, payload: Optional[Dict] = None) -> Dict:
+    """v20.30: Hand the work to the scheduler lease holder (this process or the worker)."""
+    from core.heavy_jobs import enqueue_heavy_job
+    response = enqueue_heavy_job(job_type, payload)
+    response["poll"] = f"/scheduler/jobs/{response['job_id']}"
+    return response
+
+
 @scheduler_router.get("/status")
 async def scheduler_status():
-    """Get scheduler status."""
+    """Get scheduler status (local scheduler, or the lease holder's published status)."""
+    from core.scheduler_worker import scheduler_summary
+    summary = scheduler_summary()
+    if _scheduler_runs_here():
+        return {"status": "success", "scheduler": _scheduler.get_status(), **summary}
+    leader = summary.get("leader")
+    if leader:
+        return {"status": "success", "scheduler": leader.get("info", {}).get("scheduler"), **summary}
     if not _scheduler:
-        return {"status": "not_initialized"}
-    return {
-        "status": "success",
-        "scheduler": _scheduler.get_status()
-    }
+        return {"status": "not_initialized", **summary}
+    return {"status": "success", "scheduler": _scheduler.get_status(), **summary}
 
 
 @scheduler_router.post("/start")
 async def start_scheduler():
     """Start the scheduler."""
+    from core.scheduler_worker import get_worker_role, role_runs_scheduler
+    if not role_runs_scheduler():
+        raise HTTPException(409, f"Scheduler runs in the worker process (WORKER_ROLE={get_worker_role()})")
     if not _scheduler:
         raise HTTPException(500, "Scheduler not initialized")
     
@@ -1726,6 +1796,9 @@ async def start_scheduler():
 @scheduler_router.post("/stop")
 async def stop_scheduler():
     """Stop the scheduler."""
+    from core.scheduler_worker import get_worker_role, role_runs_scheduler
+    if not role_runs_scheduler():
+        raise HTTPException(409, f"Scheduler runs in the worker process (WORKER_ROLE={get_worker_role()})")
     if not _scheduler:
         raise HTTPException(500, "Scheduler not initialized")
     
@@ -1735,22 +1808,17 @@ async def stop_scheduler():
 
 @scheduler_router.post("/run-audit")
 async def run_audit_now():
-    """Manually trigger daily audit."""
-    if not _scheduler:
-        raise HTTPException(500, "Scheduler not initialized")
-    
-    result = _scheduler.run_audit_now()
-    return {
-        "status": "success",
-        "result": result
-    }
+    """Manually trigger daily audit (queued; the lease holder runs it off the request path)."""
+    from core.scheduler_worker import JOB_RUN_AUDIT
+    return _enqueue_for_worker(JOB_RUN_AUDIT)
 
 
 @scheduler_router.post("/run-cleanup")
 async def run_cleanup_now():
     """Manually trigger cleanup."""
-    if not _scheduler:
-        raise HTTPException(500, "Scheduler not initialized")
+    from core.scheduler_worker import JOB_RUN_CLEANUP
+    if not _scheduler_runs_here():
+        return _enqueue_for_worker(JOB_RUN_CLEANUP)
     
     result = _scheduler.cleanup_job.run()
     return {
@@ -1759,11 +1827,43 @@ async def run_cleanup_now():
     }
 
 
+@scheduler_router.post("/run-job/{name}")
+async def run_job(name: str):
+    """v20.30: Queue a scheduled job (e.g. lstm_retrain) for the scheduler lease holder."""
+    from core.scheduler_worker import JOB_RUN_JOB
+    if name not in DailyScheduler.RUNNABLE_JOBS:
+        raise HTTPException(404, f"Unknown job {name!r}")
+    return _enqueue_for_worker(JOB_RUN_JOB, {"job": name})
+
+
+@scheduler_router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """v20.30: Status and result of a queued scheduler job."""
+    from core.job_queue import get_job_queue
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(404, "Job not found")
+    return job
+
+
 # ============================================
 # STANDALONE TEST
 # ============================================
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Daily scheduler")
+    parser.add_argument("--worker", action="store_true",
+                        help="Run as the dedicated scheduler/grader process (see core.scheduler_worker)")
+    args = parser.parse_args()
+
+    if args.worker:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+        from core.scheduler_worker import run_worker
+        run_worker()
+        raise SystemExit(0)
+
     logger.info("Testing Daily Scheduler...")
 
     scheduler = DailyScheduler()
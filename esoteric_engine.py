@@ -1219,7 +1219,17 @@ def analyze_parlay_correlations(legs: List[Dict[str, Any]], sport: str = "NBA")
 
     avg_biorhythm = sum(player_bios) / len(player_bios) if player_bios else None
 
+    # Correlation-aware joint probability (replaces multiplying legs as independent)
+    pricing = None
+    if len(legs) >= 2:
+        try:
+            from core.parlay_pricing import price_parlay
+            pricing = price_parlay(legs, sport=sport)
+        except Exception as e:
+            logger.debug("Parlay pricing unavailable: %s", e)
+
     return {
+        "pricing": pricing,
         "teammate_void_warnings": teammate_warnings,
         "has_warnings": len(teammate_warnings) > 0,
         "warning_count": len(teammate_warnings),
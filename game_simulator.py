@@ -0,0 +1,295 @@
+"""
+Game Simulator - Vectorized Monte Carlo for spreads, totals and moneylines
+=========================================================================
+
+Draws every simulated score for a game (or a whole slate) in one NumPy array
+operation instead of a per-iteration Python loop, so a 10,000-run simulation
+costs well under a millisecond and can run on every game pick.
+
+- Deterministic: each game id gets its own np.random.Generator seeded the same
+  way as live_data_router.deterministic_rng_for_game_id, so a game simulates
+  identically across requests and workers.
+- Reusable RNG streams: the standard-normal draws for a (game_id, num_sims)
+  pair are cached and re-scaled for new means/stds, so re-pricing a game after
+  a line move does not redraw anything (common random numbers also keep the
+  probabilities for two nearby lines consistent with each other).
+- One draw, many lines: a GameSimulation answers cover / over / moneyline
+  probabilities for any number of lines from the same samples.
+- Correlated scores: team scores can share a correlation coefficient (pace,
+  weather and officiating move both teams' scoring together).
+
+Spread convention: `spread` is the home line (home -3.5 => spread=-3.5); the
+home side covers when (home - away) + spread > 0.
+
+Usage:
+    from game_simulator import simulate_game, simulate_slate
+
+    sim = simulate_game(112.0, 108.5, home_std=11.0, away_std=11.0,
+                        correlation=0.2, game_id="nba_123")
+    sim.cover_probability([-3.5, -4.5])   # array for both lines
+    sim.summary(spread=-3.5, total=221.5)
+
+    slate = simulate_slate([{"game_id": "g1", "home_mean": 110, "away_mean": 104,
+                             "spread": -5.5, "total": 214.5}, ...])
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger("game_simulator")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+SIM_DEFAULT_NUM_SIMS = int(os.getenv("SIM_DEFAULT_NUM_SIMS", "10000"))
+SIM_STREAM_CACHE_SIZE = int(os.getenv("SIM_STREAM_CACHE_SIZE", "128"))
+
+DEFAULT_SCORE_STD = 10.0
+
+
+# =============================================================================
+# RNG STREAMS
+# =============================================================================
+
+def seed_for_game_id(game_id: Any) -> int:
+    """Stable seed for a game id (same derivation as deterministic_rng_for_game_id)."""
+    return int(hashlib.md5(str(game_id).encode()).hexdigest()[:8], 16)
+
+
+def rng_for_game_id(game_id: Any) -> np.random.Generator:
+    """Deterministic NumPy Generator for a game id."""
+    return np.random.default_rng(seed_for_game_id(game_id))
+
+
+class _StreamCache:
+    """LRU of read-only (2, num_sims) standard-normal draws keyed by (game_id, num_sims)."""
+
+    def __init__(self, max_size: int = SIM_STREAM_CACHE_SIZE):
+        self.max_size = max_size
+        self._streams: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, game_id: Any, num_sims: int) -> np.ndarray:
+        key = (str(game_id), num_sims)
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is not None:
+                self._streams.move_to_end(key)
+                self.hits += 1
+                return stream
+        stream = rng_for_game_id(game_id).standard_normal((2, num_sims)).astype(np.float32)
+        stream.setflags(write=False)
+        with self._lock:
+            self.misses += 1
+            self._streams[key] = stream
+            while len(self._streams) > self.max_size:
+                self._streams.popitem(last=False)
+        return stream
+
+    def clear(self) -> None:
+        with self._lock:
+            self._streams.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._streams), "max_size": self.max_size,
+                "hits": self.hits, "misses": self.misses}
+
+
+_stream_cache = _StreamCache()
+
+
+def standard_normals(game_id: Any = None, num_sims: int = SIM_DEFAULT_NUM_SIMS) -> np.ndarray:
+    """
+    (2, num_sims) standard-normal base draws for a game.
+
+    Cached and deterministic when game_id is given; fresh draws otherwise.
+    """
+    if game_id is None:
+        return np.random.default_rng().standard_normal((2, num_sims)).astype(np.float32)
+    return _stream_cache.get(game_id, num_sims)
+
+
+def get_stream_cache_stats() -> Dict[str, int]:
+    return _stream_cache.stats()
+
+
+# =============================================================================
+# SIMULATION RESULT
+# =============================================================================
+
+class GameSimulation:
+    """
+    Simulated home/away scores for one game (shape (n,)) or a slate (shape (G, n)).
+
+    Probability methods broadcast line arguments against the leading axes: for a
+    single game a list of k lines returns k probabilities; for a slate pass one
+    line per game (shape (G,)).
+    """
+
+    def __init__(self, home_scores: np.ndarray, away_scores: np.ndarray):
+        self.home = home_scores
+        self.away = away_scores
+        self.margin = home_scores - away_scores
+        self.total = home_scores + away_scores
+
+    @property
+    def num_sims(self) -> int:
+        return self.home.shape[-1]
+
+    @staticmethod
+    def _prob(mask: np.ndarray):
+        p = mask.mean(axis=-1)
+        return float(p) if np.ndim(p) == 0 else p
+
+    @staticmethod
+    def _line(line) -> np.ndarray:
+        return np.asarray(line, dtype=np.float64)[..., None]
+
+    def cover_probability(self, spread, side: str = "home"):
+        """P(side covers) for the home spread line(s)."""
+        adjusted = self.margin + self._line(spread)
+        if side.lower() == "away":
+            return self._prob(adjusted < 0)
+        return self._prob(adjusted > 0)
+
+    def spread_push_probability(self, spread):
+        return self._prob(self.margin + self._line(spread) == 0)
+
+    def over_probability(self, total):
+        """P(combined score > total line)."""
+        return self._prob(self.total > self._line(total))
+
+    def under_probability(self, total):
+        return self._prob(self.total < self._line(total))
+
+    def win_probability(self, side: str = "home"):
+        """Moneyline win probability (ties, if any, count for neither side)."""
+        if side.lower() == "away":
+            return self._prob(self.margin < 0)
+        return self._prob(self.margin > 0)
+
+    def summary(self, spread: Optional[float] = None, total: Optional[float] = None) -> Dict[str, Any]:
+        """Probabilities (as percentages) for a single game's lines."""
+        if self.home.ndim != 1:
+            raise ValueError("summary() is for a single game; use slate_summaries() for a slate")
+        result = {
+            "home_win_pct": round(100 * self.win_probability("home"), 1),
+            "away_win_pct": round(100 * self.win_probability("away"), 1),
+            "projected_home": round(float(self.home.mean()), 1),
+            "projected_away": round(float(self.away.mean()), 1),
+            "projected_margin": round(float(self.margin.mean()), 1),
+            "projected_total": round(float(self.total.mean()), 1),
+            "total_std": round(float(self.total.std()), 2),
+            "num_sims": self.num_sims,
+        }
+        if spread is not None:
+            result["home_cover_pct"] = round(100 * self.cover_probability(spread, "home"), 1)
+            result["away_cover_pct"] = round(100 * self.cover_probability(spread, "away"), 1)
+        if total is not None:
+            result["over_pct"] = round(100 * self.over_probability(total), 1)
+            result["under_pct"] = round(100 * self.under_probability(total), 1)
+        return result
+
+    def game(self, index: int) -> "GameSimulation":
+        """One game of a slate simulation."""
+        return GameSimulation(self.home[index], self.away[index])
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+
+def _scale(z: np.ndarray, home_mean, away_mean, home_std, away_std, correlation, discrete: bool):
+    """Turn (..., 2, n) standard normals into correlated home/away scores."""
+    rho = np.clip(np.asarray(correlation, dtype=np.float64), -0.999, 0.999)[..., None]
+    z_home = z[..., 0, :]
+    z_away = rho * z_home + np.sqrt(1.0 - rho ** 2) * z[..., 1, :]
+    home = np.asarray(home_mean, dtype=np.float64)[..., None] + np.asarray(home_std, dtype=np.float64)[..., None] * z_home
+    away = np.asarray(away_mean, dtype=np.float64)[..., None] + np.asarray(away_std, dtype=np.float64)[..., None] * z_away
+    if discrete:
+        home = np.maximum(np.rint(home), 0)
+        away = np.maximum(np.rint(away), 0)
+    return home, away
+
+
+def simulate_game(
+    home_mean: float,
+    away_mean: float,
+    home_std: float = DEFAULT_SCORE_STD,
+    away_std: float = DEFAULT_SCORE_STD,
+    correlation: float = 0.0,
+    num_sims: int = SIM_DEFAULT_NUM_SIMS,
+    game_id: Any = None,
+    discrete: bool = False,
+) -> GameSimulation:
+    """
+    Simulate one game's scores as (optionally correlated) normals.
+
+    Args:
+        correlation: Pearson correlation between the two teams' scores.
+        game_id: Seeds a cached, deterministic RNG stream; None draws fresh.
+        discrete: Round scores to non-negative integers (enables pushes).
+    """
+    z = standard_normals(game_id, num_sims)
+    home, away = _scale(z, home_mean, away_mean, home_std, away_std, correlation, discrete)
+    return GameSimulation(home, away)
+
+
+def simulate_slate(
+    games: Sequence[Dict[str, Any]],
+    num_sims: int = SIM_DEFAULT_NUM_SIMS,
+    discrete: bool = False,
+) -> GameSimulation:
+    """
+    Simulate a whole slate in one batched array op.
+
+    Each game dict needs home_mean/away_mean and may set home_std, away_std,
+    correlation and game_id. Games without a game_id get fresh draws.
+    Returns a GameSimulation with (len(games), num_sims) arrays.
+    """
+    if not games:
+        empty = np.empty((0, num_sims))
+        return GameSimulation(empty, empty)
+    z = np.stack([standard_normals(g.get("game_id"), num_sims) for g in games])
+
+    def column(key, default=None):
+        values = [g.get(key) for g in games]
+        return np.array([default if v is None else v for v in values], dtype=np.float64)
+
+    home, away = _scale(
+        z,
+        column("home_mean"),
+        column("away_mean"),
+        column("home_std", DEFAULT_SCORE_STD),
+        column("away_std", DEFAULT_SCORE_STD),
+        column("correlation", 0.0),
+        discrete,
+    )
+    return GameSimulation(home, away)
+
+
+def slate_summaries(
+    games: Sequence[Dict[str, Any]],
+    num_sims: int = SIM_DEFAULT_NUM_SIMS,
+    discrete: bool = False,
+) -> List[Dict[str, Any]]:
+    """simulate_slate() plus per-game summary() using each game's spread/total keys."""
+    sim = simulate_slate(games, num_sims=num_sims, discrete=discrete)
+    summaries = []
+    for i, game in enumerate(games):
+        summary = sim.game(i).summary(spread=game.get("spread"), total=game.get("total"))
+        if game.get("game_id") is not None:
+            summary["game_id"] = game["game_id"]
+        summaries.append(summary)
+    return summaries
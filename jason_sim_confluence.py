@@ -38,6 +38,12 @@ from datetime import datetime, timedelta, date
 
 logger = logging.getLogger("jason_sim")
 
+try:
+    from game_simulator import simulate_game as _simulate_scores
+    GAME_SIMULATOR_AVAILABLE = True
+except ImportError:
+    GAME_SIMULATOR_AVAILABLE = False
+
 # =============================================================================
 # CONFIGURATION (unchanged from v11.08)
 # =============================================================================
@@ -77,6 +83,12 @@ ELO_HOME_ADV = 65.0
 ELO_K_FACTOR = 20.0
 ELO_DEFAULT = 1500.0
 
+# Monte Carlo line pricing (0 = keep the closed-form cover/total estimates).
+# When > 0, cover % is read from a vectorized score simulation around the
+# Elo/spread margin and projected total instead of the linear approximations.
+JASON_SIM_NUM_SIMS = int(os.getenv("JASON_SIM_NUM_SIMS", "0"))
+JASON_SIM_SCORE_CORRELATION = float(os.getenv("JASON_SIM_SCORE_CORRELATION", "0.2"))
+
 # Prop stat mapping from Protocol 33
 PROP_TO_STAT = {
     "points": "pts", "rebounds": "reb", "assists": "ast",
@@ -482,6 +494,43 @@ class JasonSimConfluence:
             "source": "spread_estimate",
         }
 
+    def _simulate_lines(
+        self,
+        sim_results: Dict[str, Any],
+        margin: float,
+        spread: float,
+        total: float,
+        num_sims: int,
+        game_key: str,
+    ) -> Dict[str, Any]:
+        """
+        Re-price cover/over percentages from a score simulation.
+
+        Team score std is derived from total_std so the simulated total keeps
+        the variance flag's spread: var(total) = 2 * sd^2 * (1 + rho).
+        """
+        rho = JASON_SIM_SCORE_CORRELATION
+        team_std = sim_results["total_std"] / math.sqrt(2.0 * (1.0 + rho))
+        projected_total = sim_results["projected_total"]
+        sim = _simulate_scores(
+            (projected_total + margin) / 2.0,
+            (projected_total - margin) / 2.0,
+            home_std=team_std,
+            away_std=team_std,
+            correlation=rho,
+            num_sims=num_sims,
+            game_id=game_key,
+        )
+        summary = sim.summary(spread=spread, total=total)
+        sim_results.update({
+            "home_cover_pct": summary["home_cover_pct"],
+            "away_cover_pct": summary["away_cover_pct"],
+            "over_pct": summary["over_pct"],
+            "under_pct": summary["under_pct"],
+            "num_sims": summary["num_sims"],
+        })
+        return sim_results
+
     def simulate_game(
         self,
         home_team: str,
@@ -495,7 +544,25 @@ class JasonSimConfluence:
         """
         Get game probabilities using Protocol 33 Elo model.
         Falls back to spread-based estimation if API unavailable.
+
+        With num_sims > 0 (default JASON_SIM_NUM_SIMS) cover/over percentages
+        come from a seeded score simulation around the same margin and total.
         """
+        results = self._simulate_game_closed_form(home_team, away_team, spread, total)
+        margin = results.pop("_margin")
+        num_sims = num_sims or JASON_SIM_NUM_SIMS
+        if num_sims > 0 and GAME_SIMULATOR_AVAILABLE:
+            try:
+                return self._simulate_lines(results, margin, spread, total, num_sims,
+                                            game_key=f"{away_team}@{home_team}")
+            except Exception as e:
+                logger.debug("Score simulation failed, using closed form: %s", e)
+        return results
+
+    def _simulate_game_closed_form(
+        self, home_team: str, away_team: str, spread: float, total: float
+    ) -> Dict[str, Any]:
+        """Elo / spread estimates; carries the expected home margin as _margin."""
         # Try Protocol 33 Elo model first
         elo_result = self._get_elo_win_prob(home_team, away_team)
 
@@ -543,10 +610,13 @@ class JasonSimConfluence:
                 "total_std": round(total_std, 2),
                 "num_sims": 0,
                 "source": "protocol33_elo",
+                "_margin": margin,
             }
 
         # Fallback to spread-based estimation
-        return self._estimate_from_spread(spread, total)
+        results = self._estimate_from_spread(spread, total)
+        results["_margin"] = -spread
+        return results
 
     def evaluate_spread_ml(
         self,
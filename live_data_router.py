@@ -3,11 +3,9 @@
 # Production-safe with retries, logging, rate-limit handling, deterministic fallbacks
 # v11.08: Single source of truth for tiers via tiering.py
 
-from fastapi import APIRouter, HTTPException, Depends, Header, Response, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, BackgroundTasks
 from fastapi.responses import JSONResponse
-from fastapi.routing import APIRoute
 from typing import Optional, List, Dict, Any, Tuple
-import httpx
 import time
 import logging
 
@@ -47,27 +45,16 @@ try:
 except Exception:
     _ET = None
 import math
+import heapq
 import json
 import numpy as np
 
-# PickContract v1 - canonical normalizer
-try:
-    from utils.pick_normalizer import (
-        normalize_pick as contract_normalize_pick,
-        normalize_best_bets_response as contract_normalize_best_bets_response
-    )
-    PICK_CONTRACT_AVAILABLE = True
-except Exception as e:
-    PICK_CONTRACT_AVAILABLE = False
-    logger.warning("pick_normalizer not available: %s", e)
-
-# Public payload sanitizer (ET-only + remove telemetry/UTC)
-try:
-    from utils.public_payload_sanitizer import sanitize_public_payload
-    PUBLIC_SANITIZER_AVAILABLE = True
-except Exception as e:
-    PUBLIC_SANITIZER_AVAILABLE = False
-    logger.warning("public_payload_sanitizer not available: %s", e)
+# v20.30: Live output contract (normalizers, sanitizer, output boundary,
+# LiveContractRoute) lives in core/live_contract.py, shared by the /live sub-routers
+from core.live_contract import (
+    LiveContractRoute, _ensure_live_contract_payload, _normalize_pick, _sanitize_public,
+)
+from core.live_contract import _enforce_output_boundary  # noqa: F401 - re-exported for existing importers
 
 # Import AFFILIATE_LINKS from community router (moved in v20.28.6 refactor)
 try:
@@ -78,136 +65,65 @@ except ImportError:
     logger.debug("AFFILIATE_LINKS not available from routers.community, using empty fallback")
 
 
-def _sanitize_public(payload: dict) -> dict:
-    if PUBLIC_SANITIZER_AVAILABLE:
-        return sanitize_public_payload(payload)
-    return payload
-
-
 # =============================================================================
-# OUTPUT BOUNDARY HARDENING (v20.21)
+# PRECOMPUTED PUBLIC PAYLOADS (v20.29)
 # =============================================================================
-# Single enforcement point for ALL output invariants. This catches any bugs
-# where upstream filters are bypassed. Fail-soft: log violations, filter picks.
-
-# Required fields that every pick MUST have (from golden baseline)
-_REQUIRED_PICK_FIELDS = {
-    "pick_id", "sport", "market", "final_score", "tier",
-    "ai_score", "research_score", "esoteric_score", "jarvis_rs",
-    "titanium_triggered"
-}
+# Hot cached endpoints store their final member-facing body as bytes + ETag so
+# a cache hit skips sanitize/normalize/encode entirely. LiveContractRoute passes
+# these responses through untouched (they already went through the contract).
 
+from core.response_cache import get_payload_store, dumps_bytes, loads_bytes
 
-def _enforce_output_boundary(payload: dict) -> dict:
-    """
-    Enforce output invariants at the single output boundary.
+# Redis hits computed by another worker are precomputed locally with a short TTL
+PAYLOAD_REHYDRATE_TTL_S = 30
 
-    Invariants enforced:
-    1. No picks with final_score below threshold (6.5 props, 7.0 games)
-    2. No picks with hidden tiers (MONITOR, PASS)
-    3. All picks have required fields
 
-    This is a DEFENSIVE check - upstream filters should already handle this,
-    but this catches any bugs where filters are bypassed.
+def _build_public_payload(payload: dict) -> Any:
+    """Apply, once, the same transforms LiveContractRoute applies to a /live JSON body."""
+    public = loads_bytes(dumps_bytes(_sanitize_public(payload)))
+    public = _ensure_live_contract_payload(public, 200)
+    return _sanitize_public(public)
 
-    Returns:
-        Modified payload with violating picks filtered and telemetry added.
-    """
-    # Import here to avoid circular import at module load
-    from core.scoring_contract import (
-        MIN_FINAL_SCORE,
-        MIN_PROPS_SCORE,
-        HIDDEN_TIERS,
-        VALID_OUTPUT_TIERS,
-    )
 
-    violations = {
-        "props_below_threshold": 0,
-        "props_hidden_tier": 0,
-        "props_missing_fields": 0,
-        "games_below_threshold": 0,
-        "games_hidden_tier": 0,
-        "games_missing_fields": 0,
-        "total_filtered": 0,
-    }
+def _store_public_payload(cache_key: str, payload: dict, ttl: int):
+    """Build and store the precomputed public payload for a cache key."""
+    return get_payload_store().put(cache_key, _build_public_payload(payload), ttl=ttl)
+
+
+def _precomputed_response(pre, request: Optional[Request] = None) -> Response:
+    """Serve a PrecomputedPayload, answering 304 when If-None-Match matches."""
+    if_none_match = request.headers.get("if-none-match") if request is not None else None
+    accept_encoding = request.headers.get("accept-encoding") if request is not None else None
+    status_code, body, headers = pre.render(if_none_match=if_none_match, accept_encoding=accept_encoding)
+    response = Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
+    response.precomputed_payload = True
+    return response
 
-    def _validate_pick(pick: dict, min_score: float, pick_type: str) -> bool:
-        """Validate a single pick against output invariants."""
-        # Check 1: Score threshold
-        score = pick.get("final_score") or pick.get("total_score") or 0
-        if score < min_score:
-            violations[f"{pick_type}_below_threshold"] += 1
-            logger.warning(
-                "BOUNDARY: %s pick below threshold: score=%.2f < %.2f, pick_id=%s",
-                pick_type, score, min_score, pick.get("pick_id", "?")
-            )
-            return False
-
-        # Check 2: Hidden tier filter
-        tier = pick.get("tier", "")
-        if tier in HIDDEN_TIERS:
-            violations[f"{pick_type}_hidden_tier"] += 1
-            logger.warning(
-                "BOUNDARY: %s pick has hidden tier: tier=%s, pick_id=%s",
-                pick_type, tier, pick.get("pick_id", "?")
-            )
-            return False
-
-        # Check 3: Tier must be in valid set (if present)
-        if tier and tier not in VALID_OUTPUT_TIERS:
-            violations[f"{pick_type}_hidden_tier"] += 1
-            logger.warning(
-                "BOUNDARY: %s pick has invalid tier: tier=%s, pick_id=%s",
-                pick_type, tier, pick.get("pick_id", "?")
-            )
-            return False
-
-        # Check 4: Required fields (log warning but don't filter)
-        missing = _REQUIRED_PICK_FIELDS - set(pick.keys())
-        if missing:
-            violations[f"{pick_type}_missing_fields"] += 1
-            logger.warning(
-                "BOUNDARY: %s pick missing fields: %s, pick_id=%s",
-                pick_type, missing, pick.get("pick_id", "?")
-            )
-            # Don't filter - just log (missing fields may be added by normalizer)
-
-        return True
-
-    # Filter props picks
-    if "props" in payload and isinstance(payload["props"], dict):
-        props = payload["props"]
-        picks = props.get("picks", [])
-        if picks:
-            original_count = len(picks)
-            filtered = [p for p in picks if _validate_pick(p, MIN_PROPS_SCORE, "props")]
-            props["picks"] = filtered
-            props["count"] = len(filtered)
-            violations["total_filtered"] += (original_count - len(filtered))
-
-    # Filter game picks
-    if "game_picks" in payload and isinstance(payload["game_picks"], dict):
-        game_picks = payload["game_picks"]
-        picks = game_picks.get("picks", [])
-        if picks:
-            original_count = len(picks)
-            filtered = [p for p in picks if _validate_pick(p, MIN_FINAL_SCORE, "games")]
-            game_picks["picks"] = filtered
-            game_picks["count"] = len(filtered)
-            violations["total_filtered"] += (original_count - len(filtered))
-
-    # Add boundary telemetry to debug (will be stripped by sanitizer for non-debug)
-    if violations["total_filtered"] > 0:
-        logger.warning(
-            "BOUNDARY: Filtered %d picks that violated output invariants: %s",
-            violations["total_filtered"], violations
-        )
-        if "debug" not in payload:
-            payload["debug"] = {}
-        payload["debug"]["boundary_violations"] = violations
-        payload["debug"]["boundary_filtered_total"] = violations["total_filtered"]
 
-    return payload
+def _live_cache_hit(cache_key: str, cached: Any, request: Optional[Request] = None):
+    """
+    Serve an api_cache hit.
+
+    Internal callers (request is None) get the dict back unchanged; HTTP
+    callers get the precomputed bytes, or a 304 when their ETag still matches.
+    """
+    if request is None:
+        return cached
+    pre = get_payload_store().get(cache_key)
+    if pre is None:
+        pre = _store_public_payload(cache_key, cached, ttl=PAYLOAD_REHYDRATE_TTL_S)
+    return _precomputed_response(pre, request)
+
+
+def _live_cache_set(cache_key: str, result: Any, request: Optional[Request] = None, ttl: int = None):
+    """Cache a freshly built result and serve it (see _live_cache_hit)."""
+    api_cache.set(cache_key, result, ttl)
+    if request is None:
+        # Don't let an older precomputed body outlive the data it was built from
+        get_payload_store().discard(cache_key)
+        return result
+    pre = _store_public_payload(cache_key, result, ttl=ttl or api_cache._default_ttl)
+    return _precomputed_response(pre, request)
 
 
 # Import grader_store - SINGLE SOURCE OF TRUTH for persistence
@@ -274,9 +190,17 @@ except ImportError:
 
 # Import Scoring Contract - SINGLE SOURCE OF TRUTH for scoring constants
 from core.scoring_contract import ENGINE_WEIGHTS, MIN_FINAL_SCORE, MIN_PROPS_SCORE, GOLD_STAR_THRESHOLD, GOLD_STAR_GATES, HARMONIC_CONVERGENCE_THRESHOLD, MSRF_BOOST_CAP, SERP_BOOST_CAP_TOTAL, TOTALS_SIDE_CALIBRATION, SPORT_TOTALS_CALIBRATION, ENSEMBLE_ADJUSTMENT_STEP, ODDS_STALENESS_THRESHOLD_SECONDS, CONFLUENCE_LEVELS, PERSIST_TIERS, HIDDEN_TIERS, VALID_OUTPUT_TIERS
-from core.scoring_pipeline import compute_final_score_option_a, compute_harmonic_boost
+from core.scoring_pipeline import compute_final_score_option_a, compute_harmonic_boost, compute_score_ceiling
 from core.telemetry import apply_used_integrations_debug, attach_integration_telemetry_debug, record_daily_integration_rollup
 from core.jarvis_score_api import calculate_jarvis_engine_score  # v2.2: SINGLE SOURCE OF TRUTH for Jarvis scoring
+from core.prop_score_memo import get_prop_score_memo, prop_memo_key, fingerprint_inputs, bookmaker_lines
+from core.pick_candidate import PickCandidate, PROP_ALIASES, GAME_ALIASES, materialize
+from core.hot_path_profiler import EngineSpans, SamplingProfiler, BEST_BETS_PROFILE_ENABLED
+from cache_warmer import record_best_bets_request
+from core.request_coalescer import get_request_coalescer
+from core.scoring_offload import (
+    ScoringYielder, offload_enabled, register_worker_reset, run_coroutine_in_worker,
+)
 
 # Import Time ET - SINGLE SOURCE OF TRUTH for ET timezone
 try:
@@ -340,9 +264,6 @@ try:
     from pick_logger import (
         get_pick_logger,
         log_published_pick,
-        grade_pick as grade_logged_pick,
-        run_daily_audit_report,
-        get_today_picks
     )
     PICK_LOGGER_AVAILABLE = True
 except ImportError:
@@ -352,9 +273,6 @@ except ImportError:
 # Import Result Fetcher - Automatic result fetching and grading (v14.9)
 try:
     from result_fetcher import (
-        auto_grade_picks,
-        fetch_completed_games,
-        fetch_nba_player_stats,
         scheduled_auto_grade,
         # v20.28.2: Live scores from Odds API (paid API prioritized)
         fetch_live_scores,
@@ -514,7 +432,7 @@ except ImportError:
 
 # Import Ensemble Model for Game Picks (v17.0)
 try:
-    from ml_integration import get_ensemble_ai_score
+    from ml_integration import get_ensemble_ai_scores_batch
     ENSEMBLE_AVAILABLE = True
 except ImportError:
     ENSEMBLE_AVAILABLE = False
@@ -560,12 +478,6 @@ except ImportError:
     def is_void_moon_now():
         return (False, 0.0)
 
-# Redis import with fallback
-try:
-    import redis
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
 
 # ============================================================================
 # LOGGING SETUP (logger already defined at top for early import handlers)
@@ -585,54 +497,20 @@ if not logger.handlers:
 # CONFIGURATION (Environment Variables)
 # ============================================================================
 
-# API Keys - REQUIRED: Set these in Railway environment variables
-ODDS_API_KEY = os.getenv("ODDS_API_KEY", "")
-ODDS_API_BASE = os.getenv("ODDS_API_BASE", "https://api.the-odds-api.com/v4")
-
-PLAYBOOK_API_KEY = os.getenv("PLAYBOOK_API_KEY", "")
-PLAYBOOK_API_BASE = os.getenv("PLAYBOOK_API_BASE", "https://api.playbook-api.com/v1")
-
-# Log warning if API keys are missing
-if not ODDS_API_KEY:
-    logger.warning("ODDS_API_KEY not set - will use fallback data")
-if not PLAYBOOK_API_KEY:
-    logger.warning("PLAYBOOK_API_KEY not set - will use fallback data")
-
-# Authentication - Optional API key for endpoint protection
-# Set API_AUTH_KEY in Railway to enable authentication
-# Set API_AUTH_ENABLED=true to require auth (default: false)
-API_AUTH_KEY = os.getenv("API_AUTH_KEY", "")
-API_AUTH_ENABLED = os.getenv("API_AUTH_ENABLED", "false").lower() == "true"
-
-if API_AUTH_ENABLED and not API_AUTH_KEY:
-    logger.warning("API_AUTH_ENABLED is true but API_AUTH_KEY not set - auth disabled")
-    API_AUTH_ENABLED = False
-
-# Redis Configuration - Railway provides REDIS_URL when Redis service is attached
-# Falls back to in-memory cache if Redis is not available
-REDIS_URL = os.getenv("REDIS_URL", "")
-REDIS_ENABLED = bool(REDIS_URL) and REDIS_AVAILABLE
-
-if REDIS_URL and not REDIS_AVAILABLE:
-    logger.warning("REDIS_URL set but redis package not installed - using in-memory cache")
-elif REDIS_URL:
-    logger.info("Redis caching enabled")
-else:
-    logger.info("Redis not configured - using in-memory cache")
-
-ESPN_API_BASE = "https://site.api.espn.com/apis/site/v2/sports"
-
-# Sport mappings - Playbook uses uppercase league names (NBA, NFL, MLB, NHL, NCAAB)
-SPORT_MAPPINGS = {
-    "nba": {"odds": "basketball_nba", "espn": "basketball/nba", "playbook": "NBA"},
-    "nfl": {"odds": "americanfootball_nfl", "espn": "football/nfl", "playbook": "NFL"},
-    "mlb": {"odds": "baseball_mlb", "espn": "baseball/mlb", "playbook": "MLB"},
-    "nhl": {"odds": "icehockey_nhl", "espn": "hockey/nhl", "playbook": "NHL"},
-    "ncaab": {"odds": "basketball_ncaab", "espn": "basketball/mens-college-basketball", "playbook": "NCAAB"},
-}
+# v20.30: API keys, sport mappings and the shared HTTP client live in core/live_http.py
+from core.live_http import (
+    ODDS_API_KEY, ODDS_API_BASE, PLAYBOOK_API_KEY, PLAYBOOK_API_BASE, ESPN_API_BASE, SPORT_MAPPINGS,
+)
 
-# Sportsbook configurations - shared module
-from core.sportsbooks import SPORTSBOOK_CONFIGS, SMASH_LINK_SCHEMES
+
+# v20.30: Score upper-bound pruning - once BASE_4 is known, candidates whose
+# best possible final score is below the output threshold skip post-base
+# enrichment (Jason sim, officials, hook, expert consensus, ensemble, ...)
+BEST_BETS_PRUNE_ENABLED = os.getenv("BEST_BETS_PRUNE_ENABLED", "true").lower() == "true"
+# >0 also prunes candidates that cannot beat the current (factor x max picks)-th
+# best score. Off by default: diversity/concentration limits drop ranked picks,
+# so rank pruning is a heuristic, unlike threshold pruning.
+BEST_BETS_PRUNE_RANK_FACTOR = int(os.getenv("BEST_BETS_PRUNE_RANK_FACTOR", "0"))
 
 # ============================================================================
 # v20.22: SHADOW CONFLUENCE LOGGING
@@ -695,251 +573,31 @@ def log_shadow_confluence(pick_data: dict, shadow_confluence: dict):
 
 
 # ============================================================================
-# SHARED HTTP CLIENT
-# ============================================================================
-
-_shared_client: Optional[httpx.AsyncClient] = None
-
-
-def get_shared_client() -> httpx.AsyncClient:
-    """Get or create a shared httpx AsyncClient for connection pooling."""
-    global _shared_client
-    if _shared_client is None or _shared_client.is_closed:
-        _shared_client = httpx.AsyncClient(timeout=30.0)
-    return _shared_client
-
-
-#
-
-
-async def close_shared_client():
-    """Close the shared client (call on app shutdown)."""
-    global _shared_client
-    if _shared_client is not None:
-        await _shared_client.aclose()
-        _shared_client = None
-
-
-# ============================================================================
-# FETCH WITH RETRIES HELPER
+# SHARED HTTP CLIENT - core/live_http.py
 # ============================================================================
 
-async def fetch_with_retries(
-    method: str,
-    url: str,
-    *,
-    params: Dict[str, Any] = None,
-    headers: Dict[str, str] = None,
-    max_retries: int = 2,
-    backoff_base: float = 0.5
-) -> Optional[httpx.Response]:
-    """
-    Fetch URL with retries and exponential backoff.
-    Returns Response on success, None on complete failure.
-    Rate-limited (429) responses are returned directly for caller to handle.
-    """
-    client = get_shared_client()
-    attempt = 0
-
-    while attempt <= max_retries:
-        try:
-            resp = await client.request(method, url, params=params, headers=headers)
-
-            # Return rate-limited responses for caller to handle
-            if resp.status_code == 429:
-                logger.warning("Rate limited by %s (attempt %d): %s",
-                             url, attempt, resp.text[:200] if resp.text else "No body")
-                return resp
-
-            # Odds API usage marking (success + valid JSON only)
-            if resp.status_code == 200 and url.startswith(ODDS_API_BASE):
-                try:
-                    _ = resp.json()
-                    try:
-                        from integration_registry import mark_integration_used
-                        mark_integration_used("odds_api")
-                    except Exception as e:
-                        logger.debug("odds_api mark_integration_used failed: %s", str(e))
-                except Exception:
-                    # Invalid JSON should not mark usage
-                    pass
+from core.live_http import (
+    get_shared_client, fetch_with_retries, reset_shared_client,
+)
+from core.live_http import close_shared_client  # noqa: F401 - re-exported for existing importers
 
-            # v20.28.6: Playbook API usage marking (success + valid JSON only)
-            if resp.status_code == 200 and url.startswith(PLAYBOOK_API_BASE):
-                try:
-                    _ = resp.json()
-                    try:
-                        from integration_registry import mark_integration_used
-                        mark_integration_used("playbook_api")
-                    except Exception as e:
-                        logger.debug("playbook_api mark_integration_used failed: %s", str(e))
-                except Exception:
-                    # Invalid JSON should not mark usage
-                    pass
 
-            return resp
+def _reset_loop_state_in_worker():
+    """Scoring workers (when forked) must drop HTTP clients and futures bound to the parent's event loop."""
+    reset_shared_client()
+    if IDENTITY_RESOLVER_AVAILABLE:
+        get_player_resolver()._http_client = None
+    get_request_coalescer().reset()
 
-        except httpx.RequestError as e:
-            logger.exception("HTTP request failed (attempt %d/%d) %s: %s",
-                           attempt + 1, max_retries + 1, url, str(e))
-            if attempt < max_retries:
-                sleep_for = backoff_base * (2 ** attempt)
-                await asyncio.sleep(sleep_for)
-            attempt += 1
 
-    logger.error("All retries exhausted for %s", url)
-    return None
+register_worker_reset(_reset_loop_state_in_worker)
 
 
 # ============================================================================
-# HYBRID CACHE (Redis with in-memory fallback)
+# HYBRID CACHE - core/hybrid_cache.py
 # ============================================================================
 
-class HybridCache:
-    """
-    Cache with Redis backend and in-memory fallback.
-    Automatically falls back to in-memory if Redis is unavailable.
-    """
-
-    def __init__(self, default_ttl: int = 300, prefix: str = "bookie"):
-        """Initialize cache with default TTL in seconds (default 5 minutes)."""
-        self._default_ttl = default_ttl
-        self._prefix = prefix
-        self._redis_client: Optional[Any] = None
-        self._memory_cache: Dict[str, tuple] = {}  # key -> (value, expires_at)
-        self._using_redis = False
-
-        # Try to connect to Redis if configured
-        if REDIS_ENABLED:
-            try:
-                self._redis_client = redis.from_url(REDIS_URL, decode_responses=True)
-                self._redis_client.ping()
-                self._using_redis = True
-                logger.info("Redis cache connected successfully")
-            except Exception as e:
-                logger.warning("Redis connection failed, using in-memory cache: %s", e)
-                self._redis_client = None
-                self._using_redis = False
-
-    def _make_key(self, key: str) -> str:
-        """Create prefixed key for Redis."""
-        return f"{self._prefix}:{key}"
-
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache if not expired."""
-        if self._using_redis and self._redis_client:
-            try:
-                redis_key = self._make_key(key)
-                value = self._redis_client.get(redis_key)
-                if value:
-                    logger.debug("Redis HIT: %s", key)
-                    return json.loads(value)
-                return None
-            except Exception as e:
-                logger.warning("Redis get failed, falling back to memory: %s", e)
-                self._using_redis = False
-
-        # In-memory fallback
-        if key in self._memory_cache:
-            value, expires_at = self._memory_cache[key]
-            if datetime.now() < expires_at:
-                logger.debug("Memory HIT: %s", key)
-                return value
-            else:
-                del self._memory_cache[key]
-                logger.debug("Memory EXPIRED: %s", key)
-        return None
-
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
-        """Set value in cache with optional custom TTL."""
-        ttl = ttl or self._default_ttl
-
-        if self._using_redis and self._redis_client:
-            try:
-                redis_key = self._make_key(key)
-                self._redis_client.setex(redis_key, ttl, json.dumps(value))
-                logger.debug("Redis SET: %s (TTL: %ds)", key, ttl)
-                return
-            except Exception as e:
-                logger.warning("Redis set failed, falling back to memory: %s", e)
-                self._using_redis = False
-
-        # In-memory fallback
-        expires_at = datetime.now() + timedelta(seconds=ttl)
-        self._memory_cache[key] = (value, expires_at)
-        logger.debug("Memory SET: %s (TTL: %ds)", key, ttl)
-
-    def clear(self) -> None:
-        """Clear all cached values."""
-        if self._using_redis and self._redis_client:
-            try:
-                pattern = self._make_key("*")
-                keys = self._redis_client.keys(pattern)
-                if keys:
-                    self._redis_client.delete(*keys)
-                logger.info("Redis cache cleared (%d keys)", len(keys))
-            except Exception as e:
-                logger.warning("Redis clear failed: %s", e)
-
-        # Always clear memory cache too
-        self._memory_cache.clear()
-        logger.info("Memory cache cleared")
-
-    def acquire_lock(self, key: str, ttl: int = 900) -> bool:
-        """Try to acquire a distributed lock. Returns True if acquired."""
-        lock_key = f"lock:{key}"
-        if self._using_redis and self._redis_client:
-            try:
-                return bool(self._redis_client.set(self._make_key(lock_key), "1", nx=True, ex=ttl))
-            except Exception:
-                pass
-        # In-memory fallback
-        if lock_key in self._memory_cache:
-            _, expires_at = self._memory_cache[lock_key]
-            if datetime.now() < expires_at:
-                return False
-        self._memory_cache[lock_key] = ("1", datetime.now() + timedelta(seconds=ttl))
-        return True
-
-    def release_lock(self, key: str):
-        """Release a distributed lock."""
-        lock_key = f"lock:{key}"
-        if self._using_redis and self._redis_client:
-            try:
-                self._redis_client.delete(self._make_key(lock_key))
-            except Exception:
-                pass
-        if lock_key in self._memory_cache:
-            del self._memory_cache[lock_key]
-
-    def stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        stats = {
-            "backend": "redis" if self._using_redis else "memory",
-            "redis_configured": REDIS_ENABLED,
-            "redis_connected": self._using_redis
-        }
-
-        if self._using_redis and self._redis_client:
-            try:
-                pattern = self._make_key("*")
-                keys = self._redis_client.keys(pattern)
-                stats["redis_keys"] = len(keys)
-            except Exception:
-                stats["redis_keys"] = "error"
-
-        # Memory stats
-        now = datetime.now()
-        valid = sum(1 for _, (_, exp) in self._memory_cache.items() if now < exp)
-        stats["memory_total_keys"] = len(self._memory_cache)
-        stats["memory_valid_keys"] = valid
-        stats["memory_expired_keys"] = len(self._memory_cache) - valid
-
-        return stats
-
-
-# Global cache instance - 5 minute TTL for API responses
-api_cache = HybridCache(default_ttl=300, prefix="bookie")
+from core.hybrid_cache import api_cache
 
 
 # ============================================================================
@@ -1012,493 +670,13 @@ def generate_fallback_betslip(sport: str, game_id: str, bet_type: str, selection
 # AUTHENTICATION DEPENDENCY
 # ============================================================================
 
-async def verify_api_key(x_api_key: Optional[str] = Header(None, alias="X-API-Key")):
-    """
-    Verify API key if authentication is enabled.
-    Pass X-API-Key header to authenticate.
-    """
-    if not API_AUTH_ENABLED:
-        return True  # Auth disabled, allow all
-
-    if not x_api_key:
-        raise HTTPException(status_code=401, detail="Missing X-API-Key header")
-
-    if x_api_key != API_AUTH_KEY:
-        raise HTTPException(status_code=403, detail="Invalid API key")
-
-    return True
+from core.auth import verify_api_key
 
 
 # ============================================================================
 # ROUTER SETUP
 # ============================================================================
 
-def _normalize_market_label(pick_type: str, stat_type: str = None) -> str:
-    """Derive market_label from pick_type. For props, use stat category."""
-    # Market label is derived from pick_type, NOT from market field
-    if pick_type == "player_prop":
-        # For props, use the stat category
-        stat_labels = {
-            "player_points": "Points",
-            "player_rebounds": "Rebounds",
-            "player_assists": "Assists",
-            "player_threes": "3PT Made",
-            "player_steals": "Steals",
-            "player_blocks": "Blocks",
-            "player_turnovers": "Turnovers",
-            "player_pts_rebs": "Pts + Rebs",
-            "player_pts_asts": "Pts + Asts",
-            "player_rebs_asts": "Rebs + Asts",
-            "player_pts_rebs_asts": "Pts + Rebs + Asts",
-            "player_double_double": "Double Double",
-            "player_triple_double": "Triple Double",
-            "player_first_td": "First TD Scorer",
-            "player_anytime_td": "Anytime TD",
-            "player_goals": "Goals",
-            "player_shots": "Shots on Goal",
-            "player_saves": "Saves",
-        }
-        if stat_type:
-            return stat_labels.get(stat_type, stat_type.replace("_", " ").replace("player ", "").title())
-        return "Player Prop"
-    elif pick_type == "spread":
-        return "Spread"
-    elif pick_type == "moneyline":
-        return "Moneyline"
-    elif pick_type == "total":
-        return "Total"
-    return "Unknown"
-
-
-def _get_signal_label(pick: dict) -> str:
-    """Get signal label (e.g., 'Sharp Signal') separate from market type."""
-    market = pick.get("market", "").lower()
-    if market == "sharp_money":
-        return "Sharp Signal"
-    # Could add more signal types here
-    return None
-
-
-def _normalize_pick_type(pick: dict) -> str:
-    """Determine normalized pick_type from pick data."""
-    existing = pick.get("pick_type", "").upper()
-    market = pick.get("market", "").lower()
-
-    # Already normalized
-    if existing in ("PLAYER_PROP", "MONEYLINE", "SPREAD", "TOTAL"):
-        return existing.lower()
-
-    # Props detection
-    if pick.get("player") or pick.get("player_name") or "player_" in market:
-        return "player_prop"
-
-    # Game pick type detection
-    if existing == "TOTAL" or market in ("totals", "total"):
-        return "total"
-    if existing == "SPREAD" or market in ("spreads", "spread"):
-        return "spread"
-    if existing in ("ML", "MONEYLINE", "H2H") or market in ("h2h", "moneyline"):
-        return "moneyline"
-    if existing == "SHARP" or market == "sharp_money":
-        # Sharp picks are typically spread or ML based on line
-        line = pick.get("line")
-        if line is not None and line != 0:
-            return "spread"
-        return "moneyline"
-
-    # Default based on presence of player
-    return "spread" if pick.get("team") else "player_prop"
-
-
-def _normalize_selection(pick: dict, pick_type: str) -> str:
-    """Get the selection (who/what to bet on) from pick data."""
-    if pick_type == "player_prop":
-        return pick.get("player_name") or pick.get("player") or "Unknown Player"
-    if pick_type == "total":
-        home = pick.get("home_team", "Home")
-        away = pick.get("away_team", "Away")
-        return f"{away}/{home}"
-    # Spread or ML - return team
-    return pick.get("team") or pick.get("side") or pick.get("home_team") or "Unknown Team"
-
-
-def _normalize_side_label(pick: dict, pick_type: str) -> str:
-    """Get the side label for the bet."""
-    side = pick.get("side", "")
-    direction = pick.get("direction", "")
-    over_under = pick.get("over_under", "")
-
-    if pick_type in ("player_prop", "total"):
-        # For props and totals, use Over/Under
-        if side.lower() in ("over", "under"):
-            return side.title()
-        if direction.upper() in ("OVER", "UNDER"):
-            return direction.title()
-        if over_under.lower() in ("over", "under"):
-            return over_under.title()
-        return "Over"  # Default
-
-    # For spread/ML, use team name
-    return pick.get("team") or pick.get("side") or "Unknown"
-
-def _resolve_home_away_intent(pick: dict) -> str:
-    """Derive intended HOME/AWAY from pick_side hints."""
-    pick_side = (pick.get("pick_side") or "").lower()
-    if not pick_side:
-        return ""
-    if "home" in pick_side:
-        return "HOME"
-    if "away" in pick_side or "visitor" in pick_side:
-        return "AWAY"
-    return ""
-
-
-def _build_bet_string(pick: dict, pick_type: str, selection: str, market_label: str, side_label: str, line_signed: str = None) -> str:
-    """Build canonical bet display string."""
-    line = pick.get("line")
-    odds = pick.get("odds") or pick.get("odds_american")
-    units = pick.get("units", 1.0)
-
-    # Format odds - don't fabricate if missing
-    if odds is not None:
-        odds_str = f"+{odds}" if odds > 0 else str(odds)
-    else:
-        odds_str = "N/A"
-    units_str = f"{units}u"
-
-    if pick_type == "player_prop":
-        # "Sam Hauser — 3PT Made Over 4.5 (+130) — 2u"
-        line_str = f" {line}" if line is not None else ""
-        return f"{selection} — {market_label} {side_label}{line_str} ({odds_str}) — {units_str}"
-
-    if pick_type == "total":
-        # "Bucks/Celtics Over 228.5 (-110) — 1u"
-        line_str = f" {line}" if line is not None else ""
-        return f"{selection} {side_label}{line_str} ({odds_str}) — {units_str}"
-
-    if pick_type == "spread":
-        # "Boston Celtics -4.5 (-105) — 1u"
-        if line_signed:
-            return f"{selection} {line_signed} ({odds_str}) — {units_str}"
-        return f"{selection} ({odds_str}) — {units_str}"
-
-    # Moneyline: "Milwaukee Bucks Moneyline (-110) — 1u"
-    return f"{selection} Moneyline ({odds_str}) — {units_str}"
-
-
-def _normalize_pick(pick: dict) -> dict:
-    """
-    PickContract v1: Normalize pick to guarantee all required fields for frontend.
-
-    CORE IDENTITY FIELDS:
-    - id: stable unique pick_id
-    - sport, league
-    - event_id
-    - matchup, home_team, away_team
-    - start_time_et (display string)
-    - start_time_iso (ISO string or null)
-    - status/has_started/is_live flags
-
-    BET INSTRUCTION FIELDS:
-    - pick_type: "spread" | "moneyline" | "total" | "player_prop"
-    - market_label: human label ("Spread", "Points", etc.)
-    - selection: exactly what user bets (team OR player OR "Over"/"Under")
-    - selection_home_away: "HOME" | "AWAY" | null (computed from selection vs home/away teams)
-    - line: numeric line value (null for pure ML)
-    - line_signed: "+1.0" / "-2.5" / "O 220.5" / "U 220.5" (signed string)
-    - odds_american: number or null (NEVER fabricated)
-    - units: recommended bet units
-    - bet_string: final human-readable instruction
-    - book, book_link
-
-    REASONING FIELDS:
-    - tier, score, confidence_label
-    - signals_fired, confluence_reasons
-    - engine_breakdown
-    """
-    if not isinstance(pick, dict):
-        return pick
-    if PICK_CONTRACT_AVAILABLE:
-        return contract_normalize_pick(pick)
-
-    # === CORE IDENTITY ===
-    pick["id"] = pick.get("id") or pick.get("pick_id") or pick.get("event_id") or "unknown"
-    pick["sport"] = pick.get("sport", "").upper() or "UNKNOWN"
-    pick["league"] = pick.get("league") or pick.get("sport", "").upper() or "UNKNOWN"
-    pick["event_id"] = pick.get("event_id") or pick.get("game_id") or pick["id"]
-
-    home_team = pick.get("home_team") or ""
-    away_team = pick.get("away_team") or ""
-    pick["home_team"] = home_team
-    pick["away_team"] = away_team
-    pick["matchup"] = pick.get("matchup") or pick.get("game") or f"{away_team} @ {home_team}"
-
-    # === START TIME ===
-    start_time_display = pick.get("start_time") or pick.get("start_time_et") or pick.get("game_time")
-    pick["start_time_et"] = start_time_display
-    pick["start_time"] = start_time_display  # Alias for backward compat
-    pick["start_time_timezone"] = "ET"
-
-    commence_iso = pick.get("commence_time_iso") or pick.get("commence_time")
-    pick["start_time_iso"] = commence_iso if commence_iso else None
-
-    if commence_iso and isinstance(commence_iso, str) and commence_iso.endswith("Z"):
-        pick["start_time_utc"] = commence_iso
-    elif commence_iso:
-        try:
-            dt = datetime.fromisoformat(str(commence_iso).replace("Z", "+00:00"))
-            pick["start_time_utc"] = dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
-        except Exception:
-            pick["start_time_utc"] = commence_iso
-    else:
-        pick["start_time_utc"] = None
-    # Do not expose UTC fields to clients (ET only)
-    pick.pop("start_time_utc", None)
-
-    # Fallback: derive ET display time from commence_time if missing
-    if not start_time_display and commence_iso:
-        try:
-            if TIME_FILTERS_AVAILABLE:
-                start_time_display = get_game_start_time_et(commence_iso)
-            elif _ET is not None:
-                dt = datetime.fromisoformat(str(commence_iso).replace("Z", "+00:00"))
-                start_time_display = dt.astimezone(_ET).strftime("%-I:%M %p ET")
-        except Exception:
-            start_time_display = ""
-        pick["start_time_et"] = start_time_display
-        pick["start_time"] = start_time_display
-        pick["start_time_timezone"] = "ET"
-
-    if not start_time_display or start_time_display == "TBD ET":
-        start_time_display = "TBD ET"
-        pick["start_time_et"] = start_time_display
-        pick["start_time"] = start_time_display
-        pick["start_time_timezone"] = "ET"
-        pick["start_time_status"] = "UNAVAILABLE"
-    else:
-        pick["start_time_status"] = "OK"
-
-    # === STATUS FLAGS ===
-    pick["status"] = pick.get("status") or pick.get("game_status") or "unknown"
-    pick["has_started"] = pick.get("has_started", False)
-    pick["is_started_already"] = pick.get("is_started_already", pick.get("has_started", False))
-    pick["is_live"] = pick.get("is_live", False)
-    pick["is_live_bet_candidate"] = pick.get("is_live_bet_candidate", False)
-
-    # === BET INSTRUCTION FIELDS ===
-    pick_type = _normalize_pick_type(pick)
-    stat_type = pick.get("stat_type", pick.get("prop_type", ""))
-    market_label = _normalize_market_label(pick_type, stat_type)
-    signal_label = _get_signal_label(pick)
-    selection = _normalize_selection(pick, pick_type)
-    side_label = _normalize_side_label(pick, pick_type)
-
-    # Ensure line exists
-    line = pick.get("line")
-    if line is None:
-        for key in ("point", "spread", "total", "line_value", "player_line"):
-            if pick.get(key) is not None:
-                line = pick.get(key)
-                pick["line"] = line
-                break
-
-    # Build line_signed based on pick_type
-    line_signed = None
-    if pick_type == "spread" and line is not None:
-        line_signed = f"+{line}" if line > 0 else str(line)
-    elif pick_type == "total" and line is not None:
-        prefix = "O" if side_label.lower() == "over" else "U"
-        line_signed = f"{prefix} {line}"
-    elif pick_type == "player_prop" and line is not None:
-        prefix = "O" if side_label.lower() == "over" else "U"
-        line_signed = f"{prefix} {line}"
-
-    # Get actual odds - NEVER fabricate
-    raw_odds = pick.get("odds") or pick.get("odds_american")
-    odds_american = raw_odds if raw_odds is not None else None
-
-    # Enforce canonical side resolution for game picks (HOME/AWAY)
-    correction_flags = pick.get("correction_flags") or []
-    if pick_type in ("spread", "moneyline"):
-        intent = _resolve_home_away_intent(pick)
-        if intent and home_team and away_team:
-            desired_team = home_team if intent == "HOME" else away_team
-            if selection and desired_team and selection.strip() != desired_team:
-                correction_flags.append("FIELD_CONTRADICTION_CORRECTED")
-                selection = desired_team
-                pick["team"] = desired_team
-                side_label = desired_team
-    pick["correction_flags"] = correction_flags
-
-    # Build canonical bet string
-    bet_string = _build_bet_string(
-        pick,
-        pick_type,
-        selection,
-        market_label,
-        side_label,
-        line_signed if pick_type == "spread" else None
-    )
-
-    # Compute selection_home_away for semantic consistency
-    selection_home_away = None
-    if selection and home_team and away_team:
-        sel_lower = selection.lower().strip()
-        home_lower = home_team.lower().strip()
-        away_lower = away_team.lower().strip()
-        if sel_lower == home_lower or home_lower in sel_lower or sel_lower in home_lower:
-            selection_home_away = "HOME"
-        elif sel_lower == away_lower or away_lower in sel_lower or sel_lower in away_lower:
-            selection_home_away = "AWAY"
-
-    # Set all bet instruction fields
-    pick["pick_type"] = pick_type
-    pick["market_label"] = market_label
-    pick["signal_label"] = signal_label
-    pick["selection"] = selection
-    pick["selection_home_away"] = selection_home_away
-    pick["side_label"] = side_label
-    pick["line"] = line
-    pick["line_signed"] = line_signed
-    pick["odds_american"] = odds_american
-    pick["units"] = pick.get("units", 1.0)
-    pick["recommended_units"] = pick.get("units", 1.0)  # Alias
-    pick["bet_string"] = bet_string
-    pick["book"] = pick.get("book") or pick.get("sportsbook_name") or "Consensus"
-    pick["book_link"] = pick.get("book_link") or pick.get("sportsbook_event_url") or ""
-
-    # === REASONING FIELDS ===
-    pick["tier"] = pick.get("tier") or pick.get("bet_tier", {}).get("tier") or "EDGE_LEAN"
-    pick["score"] = pick.get("score") or pick.get("final_score") or pick.get("total_score") or 0
-    pick["confidence_label"] = pick.get("confidence_label") or pick.get("confidence") or pick.get("action") or "PLAY"
-    pick["signals_fired"] = pick.get("signals_fired") or pick.get("signals_firing") or []
-    pick["confluence_reasons"] = pick.get("confluence_reasons") or []
-    pick["engine_breakdown"] = pick.get("engine_breakdown") or {
-        "ai": pick.get("ai_score", 0),
-        "research": pick.get("research_score", 0),
-        "esoteric": pick.get("esoteric_score", 0),
-        "jarvis": pick.get("jarvis_score") or pick.get("jarvis_rs", 0)
-    }
-
-    return pick
-
-
-def _normalize_best_bets_response(payload: dict) -> dict:
-    """Normalize all picks in a best-bets response."""
-    if not isinstance(payload, dict):
-        return payload
-    if PICK_CONTRACT_AVAILABLE:
-        return contract_normalize_best_bets_response(payload)
-
-    # Normalize props picks
-    props = payload.get("props", {})
-    if isinstance(props, dict) and "picks" in props:
-        props["picks"] = [_normalize_pick(p) for p in props.get("picks", [])]
-
-    # Normalize game picks
-    game_picks = payload.get("game_picks", {})
-    if isinstance(game_picks, dict) and "picks" in game_picks:
-        game_picks["picks"] = [_normalize_pick(p) for p in game_picks.get("picks", [])]
-
-    return payload
-
-
-def _ensure_live_contract_payload(payload, status_code: int):
-    """Ensure /live responses include required contract fields."""
-    if payload is None:
-        payload = {}
-    if isinstance(payload, list):
-        payload = {"data": payload}
-    if not isinstance(payload, dict):
-        payload = {"data": payload}
-
-    if "source" not in payload:
-        payload["source"] = "unknown"
-    if "generated_at" not in payload:
-        payload["generated_at"] = now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(timezone.utc).isoformat()
-    if "errors" not in payload or payload["errors"] is None:
-        payload["errors"] = []
-
-    if status_code >= 400 and not payload["errors"]:
-        detail = payload.get("detail", "request_failed")
-        payload["errors"] = [{"status": status_code, "message": detail}]
-
-    # Deterministic error ordering (avoid hash churn)
-    if isinstance(payload.get("errors"), list):
-        def _err_key(e):
-            if isinstance(e, dict):
-                return (
-                    str(e.get("code", "")),
-                    str(e.get("status", "")),
-                    str(e.get("message", "")),
-                )
-            return (str(e), "", "")
-        payload["errors"] = sorted(payload["errors"], key=_err_key)
-
-    if "data" not in payload and not ("props" in payload or "game_picks" in payload):
-        payload["data"] = []
-
-    # Normalize best-bets response picks with guaranteed fields
-    if "props" in payload or "game_picks" in payload:
-        payload = _normalize_best_bets_response(payload)
-        # v20.21: Output boundary hardening - enforce invariants at single choke point
-        payload = _enforce_output_boundary(payload)
-
-    return payload
-
-
-class LiveContractRoute(APIRoute):
-    """Wrap /live responses to enforce JSON contract and avoid 500s."""
-    def get_route_handler(self):
-        original_handler = super().get_route_handler()
-
-        async def custom_handler(request):
-            response = await original_handler(request)
-            if not isinstance(response, Response):
-                return response
-            media_type = (response.media_type or "").lower()
-            if not media_type.startswith("application/json"):
-                return response
-
-            try:
-                payload = json.loads(response.body)
-            except Exception:
-                return response
-
-            payload = _ensure_live_contract_payload(payload, response.status_code)
-
-            # Sanitize member-facing payloads (ET-only, strip telemetry/UTC)
-            # Never sanitize /live/debug/* endpoints
-            path = request.url.path
-            if PUBLIC_SANITIZER_AVAILABLE and not path.startswith("/live/debug"):
-                # Optional: keep api-health untouched
-                if path != "/live/api-health":
-                    payload = sanitize_public_payload(payload)
-            status_code = response.status_code
-            if status_code >= 500:
-                status_code = 200
-
-            # Don't copy Content-Length as the new payload may have different size
-            new_headers = {
-                k: v for k, v in response.headers.items()
-                if k.lower() not in ("content-length", "content-encoding")
-            }
-            # Anti-cache headers - prevent any caching of live data (including Service Worker)
-            new_headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0, private"
-            new_headers["Pragma"] = "no-cache"
-            new_headers["Expires"] = "0"
-            # Vary header ensures caches treat requests with different auth as distinct
-            new_headers["Vary"] = "Origin, X-API-Key, Authorization"
-            # CORS headers for API key
-            new_headers["Access-Control-Allow-Headers"] = "Content-Type, X-API-Key, Authorization"
-            return JSONResponse(
-                content=payload,
-                status_code=status_code,
-                headers=new_headers,
-            )
-
-        return custom_handler
-
 
 router = APIRouter(prefix="/live", tags=["live"], dependencies=[Depends(verify_api_key)], route_class=LiveContractRoute)
 
@@ -1521,591 +699,107 @@ def get_master_prediction_system():
 
 
 # ============================================================================
-# JARVIS TRIGGERS - THE PROVEN EDGE NUMBERS
-# Weight: boost / 5 = max +4.0 points (doubled from original /10)
+# JARVIS TRIGGERS / DAILY ENERGY - core/esoteric_engines.py
 # ============================================================================
 
-JARVIS_TRIGGERS = {
-    2178: {"name": "THE IMMORTAL", "boost": 20, "tier": "LEGENDARY", "description": "Only number where n4=reverse AND n4=66^4. Never collapses.", "mathematical": True},
-    201: {"name": "THE ORDER", "boost": 12, "tier": "HIGH", "description": "Jesuit Order gematria. The Event of 201.", "mathematical": False},
-    33: {"name": "THE MASTER", "boost": 10, "tier": "HIGH", "description": "Highest master number. Masonic significance.", "mathematical": False},
-    93: {"name": "THE WILL", "boost": 10, "tier": "HIGH", "description": "Thelema sacred number. Will and Love.", "mathematical": False},
-    322: {"name": "THE SOCIETY", "boost": 10, "tier": "HIGH", "description": "Skull & Bones. Genesis 3:22.", "mathematical": False}
-}
+from core.esoteric_engines import get_daily_energy
 
-POWER_NUMBERS = [11, 22, 33, 44, 55, 66, 77, 88, 99]
-TESLA_NUMBERS = [3, 6, 9]
 
 # ============================================================================
-# ESOTERIC HELPER FUNCTIONS (exported for main.py)
+# MOVED to routers/live_ops.py
 # ============================================================================
-
-def calculate_date_numerology() -> Dict[str, Any]:
-    """Calculate numerology for today's date."""
-    today = datetime.now()
-    digits = str(today.year) + str(today.month).zfill(2) + str(today.day).zfill(2)
-
-    # Life path number
-    life_path = sum(int(d) for d in digits)
-    while life_path > 9 and life_path not in [11, 22, 33]:
-        life_path = sum(int(d) for d in str(life_path))
-
-    # Day vibration
-    day_vibe = sum(int(d) for d in str(today.day))
-    while day_vibe > 9:
-        day_vibe = sum(int(d) for d in str(day_vibe))
-
-    # Check for power numbers
-    power_hits = [n for n in POWER_NUMBERS if str(n) in digits]
-    tesla_energy = any(d in "369" for d in digits)
-
-    meanings = {
-        1: "Leadership - favorites dominate",
-        2: "Balance - close games expected",
-        3: "Creative - unexpected outcomes",
-        4: "Stability - chalk hits",
-        5: "Change - underdogs bark",
-        6: "Harmony - totals accurate",
-        7: "Spiritual - trust the model",
-        8: "Power - high scoring",
-        9: "Completion - season trends hold"
-    }
-
-    return {
-        "date": today.strftime("%Y-%m-%d"),
-        "life_path": life_path,
-        "day_vibration": day_vibe,
-        "meaning": meanings.get(life_path % 10, "Standard energy"),
-        "power_numbers_present": power_hits,
-        "tesla_energy": tesla_energy,
-        "is_master_number_day": life_path in [11, 22, 33]
-    }
-
-
-def get_moon_phase() -> Dict[str, Any]:
-    """Get current moon phase and betting implications."""
-    known_new_moon = datetime(2024, 1, 11)
-    days_since = (datetime.now() - known_new_moon).days
-    lunar_cycle = 29.53
-    phase_day = days_since % lunar_cycle
-
-    phases = [
-        (0, 1.85, "New Moon", "Fresh starts - take calculated risks"),
-        (1.85, 7.38, "Waxing Crescent", "Building momentum - follow trends"),
-        (7.38, 11.07, "First Quarter", "Decision time - key matchups"),
-        (11.07, 14.76, "Waxing Gibbous", "Increasing energy - overs favored"),
-        (14.76, 16.61, "Full Moon", "High volatility - expect upsets"),
-        (16.61, 22.14, "Waning Gibbous", "Reflection - fade public"),
-        (22.14, 25.83, "Last Quarter", "Release - unders hit"),
-        (25.83, 29.53, "Waning Crescent", "Rest period - low scoring")
-    ]
-
-    for start, end, name, meaning in phases:
-        if start <= phase_day < end:
-            illumination = abs(14.76 - phase_day) / 14.76 * 100
-            return {
-                "phase": name,
-                "meaning": meaning,
-                "phase_day": round(phase_day, 1),
-                "illumination": round(100 - illumination, 1),
-                "betting_edge": "VOLATILITY" if "Full" in name else "STABILITY" if "New" in name else "NEUTRAL"
-            }
-
-    return {"phase": "Unknown", "meaning": "Check phase", "phase_day": phase_day}
-
-
-def get_daily_energy() -> Dict[str, Any]:
-    """Get overall daily energy reading for betting.
-
-    v17.5 (Phase 2.2): Added Void-of-Course moon penalty.
-    When moon is void-of-course with confidence > 0.5, apply -20 penalty.
-    Traditional astrological wisdom: avoid initiating bets during VOC periods.
-    """
-    numerology = calculate_date_numerology()
-    moon = get_moon_phase()
-
-    energy_score = 50
-
-    if numerology.get("is_master_number_day"):
-        energy_score += 15
-    if numerology.get("tesla_energy"):
-        energy_score += 10
-    if moon.get("phase") == "Full Moon":
-        energy_score += 20
-    elif moon.get("phase") == "New Moon":
-        energy_score -= 10
-
-    dow = datetime.now().weekday()
-    day_modifiers = {
-        0: ("Monday", -5, "Slow start"),
-        1: ("Tuesday", 0, "Neutral"),
-        2: ("Wednesday", 5, "Midweek momentum"),
-        3: ("Thursday", 10, "TNF/Peak energy"),
-        4: ("Friday", 15, "Weekend anticipation"),
-        5: ("Saturday", 20, "Prime time"),
-        6: ("Sunday", 25, "NFL Sunday dominance")
-    }
-    day_name, modifier, day_meaning = day_modifiers[dow]
-    energy_score += modifier
-
-    # ===== v17.5: VOID OF COURSE MOON PENALTY =====
-    # Traditional astrological wisdom: avoid initiating new bets during VOC periods
-    voc_penalty = 0
-    voc_data = {"is_void": False, "confidence": 0.0, "penalty": 0}
-    try:
-        is_void, voc_confidence = is_void_moon_now()
-        voc_data["is_void"] = is_void
-        voc_data["confidence"] = voc_confidence
-        if is_void and voc_confidence > 0.5:
-            voc_penalty = -20  # Significant penalty during void periods
-            energy_score += voc_penalty
-            voc_data["penalty"] = voc_penalty
-            logger.debug("VOC Moon detected (confidence=%.2f) - applying %d penalty", voc_confidence, voc_penalty)
-    except Exception as e:
-        logger.warning("VOC calculation failed: %s", e)
-
-    return {
-        "overall_score": min(100, max(0, energy_score)),
-        "rating": "HIGH" if energy_score >= 70 else "MEDIUM" if energy_score >= 40 else "LOW",
-        "day_of_week": day_name,
-        "day_influence": day_meaning,
-        "recommended_action": "Aggressive betting" if energy_score >= 70 else "Standard sizing" if energy_score >= 40 else "Conservative approach",
-        "numerology_summary": numerology,
-        "moon_summary": moon,
-        "void_of_course": voc_data
-    }
+# - GET /health
+# - GET /version/{sport}
+# - GET /cache/stats
+# - GET /cache/clear
+# - GET /playbook/usage
+# - GET /playbook/health
+# - GET /odds-api/usage
+# - GET /api-usage
+# - GET /api-health
 
 
 # ============================================================================
 # LIVE DATA ENDPOINTS
 # ============================================================================
 
-@router.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "14.4",
-        "codename": "JARVIS_SAVANT_v10.1",
-        "features": [
-            "Phase 1: Confluence Core",
-            "Phase 2: Vedic/Astro",
-            "Phase 3: Learning Loop",
-            "v10.1 Dual-Score Confluence",
-            "v10.1 Bet Tier System"
-        ],
-        "timestamp": datetime.now().isoformat()
-    }
-
-
-# Smoke test endpoint moved to main.py to avoid route conflicts
-# See main.py line 64-66 for /live/smoke-test/alert-status endpoint
-
+@router.get("/sharp/{sport}")
+async def get_sharp_money(sport: str, request: Request = None):
+    """
+    Get sharp money signals using Playbook API with Odds API fallback.
 
-@router.get("/cache/stats")
-async def cache_stats():
-    """Get cache statistics for debugging."""
-    return {
-        "cache": api_cache.stats(),
-        "timestamp": datetime.now().isoformat()
+    Response Schema:
+    {
+        "sport": "NBA",
+        "source": "playbook" | "odds_api",
+        "count": N,
+        "data": [...]
     }
-
-
-@router.get("/cache/clear")
-async def cache_clear():
-    """Clear the API cache."""
-    api_cache.clear()
-    return {"status": "cache_cleared", "timestamp": datetime.now().isoformat()}
-
-
-@router.get("/playbook/usage")
-async def get_playbook_usage():
     """
-    Get Playbook API plan and usage info.
-    Useful for monitoring API quota.
-    """
-    if not PLAYBOOK_API_KEY:
-        return {"error": "PLAYBOOK_API_KEY not configured", "status": "unavailable"}
+    sport_lower = sport.lower()
+    result = await get_request_coalescer().run("sharp", sport_lower, lambda: _fetch_sharp_money(sport))
+    if request is None:
+        return result
+    return _live_cache_hit(f"sharp:{sport_lower}", result, request)
 
-    try:
-        playbook_url = f"{PLAYBOOK_API_BASE}/me"
-        resp = await fetch_with_retries(
-            "GET", playbook_url,
-            params={"api_key": PLAYBOOK_API_KEY}
-        )
 
-        if resp and resp.status_code == 200:
-            data = resp.json()
-            return {
-                "status": "ok",
-                "source": "playbook",
-                "data": data,
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            return {
-                "status": "error",
-                "error": f"Playbook returned {resp.status_code if resp else 'no response'}",
-                "timestamp": datetime.now().isoformat()
-            }
+async def _fetch_sharp_money(sport: str):
+    """Uncoalesced get_sharp_money (call through get_sharp_money, which shares in-flight fetches)."""
+    sport_lower = sport.lower()
+    if sport_lower not in SPORT_MAPPINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
 
-    except Exception as e:
-        logger.exception("Failed to fetch Playbook usage: %s", e)
-        return {
-            "status": "error",
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
+    # Check cache first
+    cache_key = f"sharp:{sport_lower}"
+    cached = api_cache.get(cache_key)
+    if cached:
+        # v20.28.6: Track cache hits for usage monitoring
+        try:
+            from integration_registry import record_cache_hit, mark_integration_used
+            record_cache_hit("playbook_api")
+            mark_integration_used("playbook_api")  # Update last_used_at even on cache hits
+        except Exception:
+            pass
+        return _live_cache_hit(cache_key, cached)
 
+    sport_config = SPORT_MAPPINGS[sport_lower]
+    data = []
+    odds_data_used = False
+    playbook_data_used = False
 
-@router.get("/playbook/health")
-async def get_playbook_health():
-    """Check Playbook API health status."""
-    try:
-        playbook_url = f"{PLAYBOOK_API_BASE}/health"
-        resp = await fetch_with_retries("GET", playbook_url)
+    # Derive sharp signals from Playbook splits data (sharp = money% differs significantly from ticket%)
+    if PLAYBOOK_API_KEY:
+        try:
+            playbook_url = f"{PLAYBOOK_API_BASE}/splits"
+            resp = await fetch_with_retries(
+                "GET", playbook_url,
+                params={"league": sport_config['playbook'], "api_key": PLAYBOOK_API_KEY}
+            )
 
-        if resp and resp.status_code == 200:
-            return {"status": "healthy", "playbook_status": resp.json() if resp.text else "ok"}
-        else:
-            return {"status": "unhealthy", "code": resp.status_code if resp else None}
+            if resp and resp.status_code == 200:
+                try:
+                    json_body = resp.json()
+                    splits = json_body if isinstance(json_body, list) else json_body.get("data", json_body.get("games", []))
 
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+                    # v15.1: Include ALL games with splits data so research engine
+                    # always has ticket_pct/money_pct. Signal strength varies by diff.
+                    for game in splits:
+                        # Handle Playbook v1 nested splits format:
+                        # { "splits": { "spread": { "bets": { "homePercent": N }, "money": { "homePercent": N } } } }
+                        _sp = game.get("splits", {})
+                        _sp_spread = _sp.get("spread", {}) if isinstance(_sp, dict) else {}
+                        _sp_bets = _sp_spread.get("bets", {})
+                        _sp_money = _sp_spread.get("money", {})
 
-
-def calculate_usage_warning(remaining: int, used: int) -> Dict[str, Any]:
-    """
-    Calculate usage warning level based on remaining vs used.
-
-    Returns warning levels:
-    - HEALTHY: < 25% used
-    - CAUTION_25: 25-49% used
-    - CAUTION_50: 50-74% used
-    - CAUTION_75: 75-89% used
-    - CRITICAL: >= 90% used (10% or less remaining)
-    """
-    if remaining is None or used is None:
-        return {"level": "UNKNOWN", "message": "Could not determine usage", "percent_used": None}
-
-    total = remaining + used
-    if total == 0:
-        return {"level": "UNKNOWN", "message": "No quota data", "percent_used": None}
-
-    percent_used = round((used / total) * 100, 1)
-    percent_remaining = round((remaining / total) * 100, 1)
-
-    if percent_remaining <= 10:
-        return {
-            "level": "CRITICAL",
-            "emoji": "🚨",
-            "message": f"CRITICAL: Only {percent_remaining}% remaining! Consider upgrading NOW.",
-            "percent_used": percent_used,
-            "percent_remaining": percent_remaining,
-            "action_needed": True
-        }
-    elif percent_used >= 75:
-        return {
-            "level": "CAUTION_75",
-            "emoji": "🟠",
-            "message": f"Warning: {percent_used}% used. Running low on API calls.",
-            "percent_used": percent_used,
-            "percent_remaining": percent_remaining,
-            "action_needed": True
-        }
-    elif percent_used >= 50:
-        return {
-            "level": "CAUTION_50",
-            "emoji": "🟡",
-            "message": f"Notice: {percent_used}% used. Half of monthly quota consumed.",
-            "percent_used": percent_used,
-            "percent_remaining": percent_remaining,
-            "action_needed": False
-        }
-    elif percent_used >= 25:
-        return {
-            "level": "CAUTION_25",
-            "emoji": "🟢",
-            "message": f"Info: {percent_used}% used. Healthy usage so far.",
-            "percent_used": percent_used,
-            "percent_remaining": percent_remaining,
-            "action_needed": False
-        }
-    else:
-        return {
-            "level": "HEALTHY",
-            "emoji": "✅",
-            "message": f"Healthy: Only {percent_used}% used. Plenty of quota remaining.",
-            "percent_used": percent_used,
-            "percent_remaining": percent_remaining,
-            "action_needed": False
-        }
-
-
-@router.get("/odds-api/usage")
-async def get_odds_api_usage():
-    """
-    Get Odds API usage info from response headers with threshold warnings.
-
-    Warning Levels:
-    - HEALTHY: < 25% used
-    - CAUTION_25: 25-49% used
-    - CAUTION_50: 50-74% used
-    - CAUTION_75: 75-89% used
-    - CRITICAL: >= 90% used (10% or less remaining)
-    """
-    if not ODDS_API_KEY:
-        return {"error": "ODDS_API_KEY not configured", "status": "unavailable"}
-
-    try:
-        # Make a lightweight request to get usage headers
-        odds_url = f"{ODDS_API_BASE}/sports"
-        resp = await fetch_with_retries(
-            "GET", odds_url,
-            params={"apiKey": ODDS_API_KEY}
-        )
-
-        if resp:
-            # Extract usage from headers
-            requests_remaining = resp.headers.get("x-requests-remaining")
-            requests_used = resp.headers.get("x-requests-used")
-
-            remaining = int(requests_remaining) if requests_remaining else None
-            used = int(requests_used) if requests_used else None
-
-            # Calculate warning level
-            warning = calculate_usage_warning(remaining, used)
-
-            return {
-                "status": "ok",
-                "source": "odds_api",
-                "usage": {
-                    "requests_remaining": remaining,
-                    "requests_used": used,
-                    "total_quota": (remaining + used) if remaining and used else None,
-                    "note": "Resets monthly. Check https://the-odds-api.com for plan limits."
-                },
-                "warning": warning,
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            return {
-                "status": "error",
-                "error": "No response from Odds API",
-                "timestamp": datetime.now().isoformat()
-            }
-
-    except Exception as e:
-        logger.exception("Failed to fetch Odds API usage: %s", e)
-        return {
-            "status": "error",
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
-
-
-@router.get("/api-usage")
-async def get_all_api_usage():
-    """
-    Get combined usage for all paid APIs (Playbook + Odds API) with threshold warnings.
-
-    Warning Levels for each API:
-    - HEALTHY: < 25% used
-    - CAUTION_25: 25-49% used
-    - CAUTION_50: 50-74% used
-    - CAUTION_75: 75-89% used
-    - CRITICAL: >= 90% used (10% or less remaining)
-
-    Overall status shows the WORST status across all APIs.
-    """
-    result = {
-        "timestamp": datetime.now().isoformat(),
-        "apis": {},
-        "overall_status": "HEALTHY",
-        "action_needed": False,
-        "alerts": []
-    }
-
-    warning_priority = {"CRITICAL": 5, "CAUTION_75": 4, "CAUTION_50": 3, "CAUTION_25": 2, "HEALTHY": 1, "UNKNOWN": 0}
-    worst_level = "HEALTHY"
-
-    # Get Playbook usage
-    if PLAYBOOK_API_KEY:
-        try:
-            playbook_url = f"{PLAYBOOK_API_BASE}/me"
-            resp = await fetch_with_retries(
-                "GET", playbook_url,
-                params={"api_key": PLAYBOOK_API_KEY}
-            )
-            if resp and resp.status_code == 200:
-                data = resp.json()
-                result["apis"]["playbook"] = {"status": "ok", "data": data}
-                # Check if Playbook returns usage info
-                if "usage" in data or "requests" in data:
-                    pb_used = data.get("usage", {}).get("used", data.get("requests", {}).get("used", 0))
-                    pb_limit = data.get("usage", {}).get("limit", data.get("requests", {}).get("limit", 1000))
-                    pb_remaining = pb_limit - pb_used
-                    pb_warning = calculate_usage_warning(pb_remaining, pb_used)
-                    result["apis"]["playbook"]["warning"] = pb_warning
-                    if warning_priority.get(pb_warning["level"], 0) > warning_priority.get(worst_level, 0):
-                        worst_level = pb_warning["level"]
-                    if pb_warning.get("action_needed"):
-                        result["alerts"].append(f"Playbook: {pb_warning['message']}")
-            elif resp and resp.status_code == 429:
-                result["apis"]["playbook"] = {"status": "rate_limited", "warning": {"level": "CRITICAL", "message": "Rate limited!"}}
-                worst_level = "CRITICAL"
-                result["alerts"].append("🚨 Playbook API is RATE LIMITED!")
-            else:
-                result["apis"]["playbook"] = {"status": "error", "code": resp.status_code if resp else None}
-        except Exception as e:
-            result["apis"]["playbook"] = {"status": "error", "error": str(e)}
-    else:
-        result["apis"]["playbook"] = {"status": "not_configured"}
-
-    # Get Odds API usage
-    if ODDS_API_KEY:
-        try:
-            odds_url = f"{ODDS_API_BASE}/sports"
-            resp = await fetch_with_retries(
-                "GET", odds_url,
-                params={"apiKey": ODDS_API_KEY}
-            )
-            if resp:
-                remaining = int(resp.headers.get("x-requests-remaining", 0))
-                used = int(resp.headers.get("x-requests-used", 0))
-                warning = calculate_usage_warning(remaining, used)
-
-                result["apis"]["odds_api"] = {
-                    "status": "ok",
-                    "requests_remaining": remaining,
-                    "requests_used": used,
-                    "total_quota": remaining + used,
-                    "warning": warning
-                }
-
-                if warning_priority.get(warning["level"], 0) > warning_priority.get(worst_level, 0):
-                    worst_level = warning["level"]
-                if warning.get("action_needed"):
-                    result["alerts"].append(f"Odds API: {warning['message']}")
-            else:
-                result["apis"]["odds_api"] = {"status": "error", "error": "No response"}
-        except Exception as e:
-            result["apis"]["odds_api"] = {"status": "error", "error": str(e)}
-    else:
-        result["apis"]["odds_api"] = {"status": "not_configured"}
-
-    # Set overall status
-    result["overall_status"] = worst_level
-    result["action_needed"] = worst_level in ["CRITICAL", "CAUTION_75"]
-
-    # Add summary message
-    if worst_level == "CRITICAL":
-        result["summary"] = "🚨 CRITICAL: One or more APIs running very low! Upgrade needed."
-    elif worst_level == "CAUTION_75":
-        result["summary"] = "🟠 WARNING: High API usage. Consider upgrading soon."
-    elif worst_level == "CAUTION_50":
-        result["summary"] = "🟡 NOTICE: 50%+ of API quota used this month."
-    elif worst_level == "CAUTION_25":
-        result["summary"] = "🟢 HEALTHY: Normal API usage levels."
-    else:
-        result["summary"] = "✅ HEALTHY: API usage looks good!"
-
-    return result
-
-
-@router.get("/api-health")
-async def get_api_health_quick():
-    """
-    Quick health check for all APIs - lightweight status for dashboards.
-
-    Returns simple status:
-    - overall: HEALTHY | CAUTION | CRITICAL
-    - action_needed: true/false
-    - alerts: list of any warnings
-
-    Use /api-usage for full details.
-    """
-    # Get full usage data
-    full_usage = await get_all_api_usage()
-
-    return {
-        "overall_status": full_usage["overall_status"],
-        "action_needed": full_usage["action_needed"],
-        "summary": full_usage.get("summary", ""),
-        "alerts": full_usage["alerts"],
-        "timestamp": full_usage["timestamp"],
-        "detail_endpoint": "/live/api-usage"
-    }
-
-
-@router.get("/sharp/{sport}")
-async def get_sharp_money(sport: str):
-    """
-    Get sharp money signals using Playbook API with Odds API fallback.
-
-    Response Schema:
-    {
-        "sport": "NBA",
-        "source": "playbook" | "odds_api",
-        "count": N,
-        "data": [...]
-    }
-    """
-    sport_lower = sport.lower()
-    if sport_lower not in SPORT_MAPPINGS:
-        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
-
-    # Check cache first
-    cache_key = f"sharp:{sport_lower}"
-    cached = api_cache.get(cache_key)
-    if cached:
-        # v20.28.6: Track cache hits for usage monitoring
-        try:
-            from integration_registry import record_cache_hit, mark_integration_used
-            record_cache_hit("playbook_api")
-            mark_integration_used("playbook_api")  # Update last_used_at even on cache hits
-        except Exception:
-            pass
-        return cached  # Return dict, FastAPI auto-serializes for endpoints
-
-    sport_config = SPORT_MAPPINGS[sport_lower]
-    data = []
-    odds_data_used = False
-    playbook_data_used = False
-
-    # Derive sharp signals from Playbook splits data (sharp = money% differs significantly from ticket%)
-    if PLAYBOOK_API_KEY:
-        try:
-            playbook_url = f"{PLAYBOOK_API_BASE}/splits"
-            resp = await fetch_with_retries(
-                "GET", playbook_url,
-                params={"league": sport_config['playbook'], "api_key": PLAYBOOK_API_KEY}
-            )
-
-            if resp and resp.status_code == 200:
-                try:
-                    json_body = resp.json()
-                    splits = json_body if isinstance(json_body, list) else json_body.get("data", json_body.get("games", []))
-
-                    # v15.1: Include ALL games with splits data so research engine
-                    # always has ticket_pct/money_pct. Signal strength varies by diff.
-                    for game in splits:
-                        # Handle Playbook v1 nested splits format:
-                        # { "splits": { "spread": { "bets": { "homePercent": N }, "money": { "homePercent": N } } } }
-                        _sp = game.get("splits", {})
-                        _sp_spread = _sp.get("spread", {}) if isinstance(_sp, dict) else {}
-                        _sp_bets = _sp_spread.get("bets", {})
-                        _sp_money = _sp_spread.get("money", {})
-
-                        if _sp_bets or _sp_money:
-                            ticket_pct = _sp_bets.get("homePercent", _sp_bets.get("home_pct", 50))
-                            money_pct = _sp_money.get("homePercent", _sp_money.get("home_pct", 50))
-                            public_pct = ticket_pct
-                        else:
-                            # Flat field fallback
-                            money_pct = game.get("money_pct", game.get("moneyPct", 50))
-                            ticket_pct = game.get("ticket_pct", game.get("ticketPct", 50))
-                            public_pct = game.get("public_pct", game.get("publicPct", ticket_pct))
+                        if _sp_bets or _sp_money:
+                            ticket_pct = _sp_bets.get("homePercent", _sp_bets.get("home_pct", 50))
+                            money_pct = _sp_money.get("homePercent", _sp_money.get("home_pct", 50))
+                            public_pct = ticket_pct
+                        else:
+                            # Flat field fallback
+                            money_pct = game.get("money_pct", game.get("moneyPct", 50))
+                            ticket_pct = game.get("ticket_pct", game.get("ticketPct", 50))
+                            public_pct = game.get("public_pct", game.get("publicPct", ticket_pct))
 
                         diff = abs(money_pct - ticket_pct)
                         sharp_side = "home" if money_pct > ticket_pct else "away"
@@ -2199,8 +893,7 @@ async def get_sharp_money(sport: str):
 
                         logger.info("Playbook sharp signals derived for %s: %d signals", sport, len(data))
                         result = {"sport": sport.upper(), "source": "playbook+odds_api", "count": len(data), "data": data, "movements": data}
-                        api_cache.set(cache_key, result)
-                        return result  # Return dict, FastAPI auto-serializes for endpoints
+                        return _live_cache_set(cache_key, result)
                 except ValueError as e:
                     logger.error("Failed to parse Playbook response: %s", e)
 
@@ -2225,8 +918,7 @@ async def get_sharp_money(sport: str):
             logger.warning("Odds API unavailable for sharp, using fallback data")
             data = generate_fallback_sharp(sport_lower)
             result = {"sport": sport.upper(), "source": "fallback", "count": len(data), "data": data, "movements": data}
-            api_cache.set(cache_key, result)
-            return result  # Return dict, FastAPI auto-serializes for endpoints
+            return _live_cache_set(cache_key, result)
 
         if resp.status_code == 429:
             raise HTTPException(status_code=503, detail="Odds API rate limited (429). Try again later.")
@@ -2238,8 +930,7 @@ async def get_sharp_money(sport: str):
             # Use fallback on parse error
             data = generate_fallback_sharp(sport_lower)
             result = {"sport": sport.upper(), "source": "fallback", "count": len(data), "data": data, "movements": data}
-            api_cache.set(cache_key, result)
-            return result  # Return dict, FastAPI auto-serializes for endpoints
+            return _live_cache_set(cache_key, result)
 
         for game in games:
             spreads = []
@@ -2286,12 +977,10 @@ async def get_sharp_money(sport: str):
         # Return fallback on any error
         data = generate_fallback_sharp(sport_lower)
         result = {"sport": sport.upper(), "source": "fallback", "count": len(data), "data": data, "movements": data}
-        api_cache.set(cache_key, result)
-        return result  # Return dict, FastAPI auto-serializes for endpoints
+        return _live_cache_set(cache_key, result)
 
     result = {"sport": sport.upper(), "source": "odds_api", "count": len(data), "data": data, "movements": data}  # movements alias for frontend
-    api_cache.set(cache_key, result)
-    return result  # Return dict, FastAPI auto-serializes for endpoints
+    return _live_cache_set(cache_key, result)
 
 
 @router.get("/splits/{sport}")
@@ -2307,6 +996,12 @@ async def get_splits(sport: str):
         "data": [...]
     }
     """
+    result = await get_request_coalescer().run("splits", sport.lower(), lambda: _fetch_splits(sport))
+    return JSONResponse(_sanitize_public(result))
+
+
+async def _fetch_splits(sport: str):
+    """Uncoalesced get_splits (call through get_splits, which shares in-flight fetches)."""
     sport_lower = sport.lower()
     if sport_lower not in SPORT_MAPPINGS:
         raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
@@ -2322,7 +1017,7 @@ async def get_splits(sport: str):
             mark_integration_used("playbook_api")  # Update last_used_at even on cache hits
         except Exception:
             pass
-        return JSONResponse(_sanitize_public(cached))
+        return cached
 
     sport_config = SPORT_MAPPINGS[sport_lower]
     data = []
@@ -2344,7 +1039,7 @@ async def get_splits(sport: str):
                     logger.info("Playbook splits data retrieved for %s: %d games", sport, len(games))
                     result = {"sport": sport.upper(), "source": "playbook", "count": len(games), "data": games}
                     api_cache.set(cache_key, result)
-                    return JSONResponse(_sanitize_public(result))
+                    return result
                 except ValueError as e:
                     logger.error("Failed to parse Playbook splits response: %s", e)
 
@@ -2410,11 +1105,11 @@ async def get_splits(sport: str):
 
     result = {"sport": sport.upper(), "source": "estimated", "count": len(data), "data": data}
     api_cache.set(cache_key, result)
-    return JSONResponse(_sanitize_public(result))
+    return result
 
 
 @router.get("/injuries/{sport}")
-async def get_injuries(sport: str):
+async def get_injuries(sport: str, request: Request = None):
     """
     Get injury report for a sport using Playbook API.
 
@@ -2427,6 +1122,15 @@ async def get_injuries(sport: str):
     }
     """
     sport_lower = sport.lower()
+    result = await get_request_coalescer().run("injuries", sport_lower, lambda: _fetch_injuries(sport))
+    if request is None:
+        return result
+    return _live_cache_hit(f"injuries:{sport_lower}", result, request)
+
+
+async def _fetch_injuries(sport: str):
+    """Uncoalesced get_injuries (call through get_injuries, which shares in-flight fetches)."""
+    sport_lower = sport.lower()
     if sport_lower not in SPORT_MAPPINGS:
         raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
 
@@ -2444,7 +1148,7 @@ async def get_injuries(sport: str):
                 mark_integration_used("playbook_api")  # Update last_used_at even on cache hits
             except Exception:
                 pass
-        return cached  # Return dict for dual-use compatibility
+        return _live_cache_hit(cache_key, cached)
 
     sport_config = SPORT_MAPPINGS[sport_lower]
     data = []
@@ -2464,8 +1168,7 @@ async def get_injuries(sport: str):
                     injuries = json_body if isinstance(json_body, list) else json_body.get("data", json_body.get("injuries", []))
                     logger.info("Playbook injuries retrieved for %s: %d records", sport, len(injuries))
                     result = {"sport": sport.upper(), "source": "playbook", "count": len(injuries), "data": injuries, "injuries": injuries}  # injuries alias for frontend
-                    api_cache.set(cache_key, result)
-                    return result  # v17.2: Return dict for dual-use compatibility
+                    return _live_cache_set(cache_key, result)
                 except ValueError as e:
                     logger.error("Failed to parse Playbook injuries response: %s", e)
 
@@ -2506,12 +1209,11 @@ async def get_injuries(sport: str):
         logger.exception("ESPN injuries fetch failed for %s: %s", sport, e)
 
     result = {"sport": sport.upper(), "source": "espn" if data else "none", "count": len(data), "data": data, "injuries": data}  # injuries alias for frontend
-    api_cache.set(cache_key, result)
-    return result  # v17.2: Return dict for dual-use compatibility
+    return _live_cache_set(cache_key, result)
 
 
 @router.get("/lines/{sport}")
-async def get_lines(sport: str):
+async def get_lines(sport: str, request: Request = None):
     """
     Get current betting lines (spread/total/ML) using Playbook API.
 
@@ -2524,6 +1226,15 @@ async def get_lines(sport: str):
     }
     """
     sport_lower = sport.lower()
+    result = await get_request_coalescer().run("lines", sport_lower, lambda: _fetch_lines(sport))
+    if request is None:
+        return result
+    return _live_cache_hit(f"lines:{sport_lower}", result, request)
+
+
+async def _fetch_lines(sport: str):
+    """Uncoalesced get_lines (call through get_lines, which shares in-flight fetches)."""
+    sport_lower = sport.lower()
     if sport_lower not in SPORT_MAPPINGS:
         raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
 
@@ -2547,7 +1258,7 @@ async def get_lines(sport: str):
                 mark_integration_used("odds_api")
             except Exception:
                 pass
-        return cached  # Return dict for internal callers, FastAPI auto-serializes for endpoints
+        return _live_cache_hit(cache_key, cached)
 
     sport_config = SPORT_MAPPINGS[sport_lower]
     data = []
@@ -2567,8 +1278,7 @@ async def get_lines(sport: str):
                     lines = json_body if isinstance(json_body, list) else json_body.get("data", json_body.get("lines", []))
                     logger.info("Playbook lines retrieved for %s: %d games", sport, len(lines))
                     result = {"sport": sport.upper(), "source": "playbook", "count": len(lines), "data": lines}
-                    api_cache.set(cache_key, result)
-                    return result  # Return dict for internal callers, FastAPI auto-serializes for endpoints
+                    return _live_cache_set(cache_key, result)
                 except ValueError as e:
                     logger.error("Failed to parse Playbook lines response: %s", e)
 
@@ -2637,12 +1347,11 @@ async def get_lines(sport: str):
         logger.exception("Odds API lines fetch failed for %s: %s", sport, e)
 
     result = {"sport": sport.upper(), "source": "odds_api" if data else "none", "count": len(data), "data": data}
-    api_cache.set(cache_key, result)
-    return result  # Return dict for internal callers, FastAPI auto-serializes for endpoints
+    return _live_cache_set(cache_key, result)
 
 
 @router.get("/props/{sport}")
-async def get_props(sport: str):
+async def get_props(sport: str, request: Request = None):
     """
     Get player props for a sport.
 
@@ -2655,6 +1364,15 @@ async def get_props(sport: str):
     }
     """
     sport_lower = sport.lower()
+    result = await get_request_coalescer().run("props", sport_lower, lambda: _fetch_props(sport))
+    if request is None:
+        return result
+    return _live_cache_hit(f"props:{sport_lower}", result, request)
+
+
+async def _fetch_props(sport: str):
+    """Uncoalesced get_props (call through get_props, which shares in-flight fetches)."""
+    sport_lower = sport.lower()
     if sport_lower == "ncaab":
         return _sanitize_public({"sport": "NCAAB", "source": "disabled", "count": 0, "data": [],
                 "note": "NCAAB player props disabled — state legality varies"})
@@ -2669,14 +1387,18 @@ async def get_props(sport: str):
 
     sport_config = SPORT_MAPPINGS[sport_lower]
     data = []
+    odds_data_used = False
+    playbook_data_used = False
+    _fetch_stats = None
 
     # Try Odds API first for props - must fetch per event using /events/{eventId}/odds
     try:
-        from odds_api import odds_api_get
+        from odds_api import odds_api_get_cached
+        from services.props_fetcher import fetch_props_for_events, prop_markets_for_sport
         _client = get_shared_client()
         # Step 1: Get list of events for this sport
         events_url = f"{ODDS_API_BASE}/sports/{sport_config['odds']}/events"
-        events_resp, _events_used = await odds_api_get(
+        events_resp, _events_used = await odds_api_get_cached(
             events_url,
             params={"apiKey": ODDS_API_KEY},
             client=_client,
@@ -2686,24 +1408,12 @@ async def get_props(sport: str):
             events = events_resp.json()
             logger.info("Found %d events for %s props", len(events), sport)
 
-            # Step 2: Fetch props for each event (limit to first 5 to avoid rate limits)
-            # v20.15: Expanded prop markets - bet on all available prop types for complete learning
-            prop_markets = "player_points,player_rebounds,player_assists,player_threes,player_blocks,player_steals,player_turnovers"
-            if sport_lower == "nfl":
-                prop_markets = "player_pass_tds,player_pass_yds,player_rush_yds,player_reception_yds,player_receptions,player_anytime_td"
-            elif sport_lower == "mlb":
-                prop_markets = "batter_total_bases,batter_hits,batter_rbis,batter_runs,batter_home_runs,pitcher_strikeouts,pitcher_outs"
-            elif sport_lower == "nhl":
-                prop_markets = "player_points,player_shots_on_goal,player_assists,player_goals,player_saves"
-
-            for event in events[:5]:
-                event_id = event.get("id")
-                if not event_id:
-                    continue
+            # Step 2: Fetch props per event concurrently (bounded semaphore + per-event deadline)
+            prop_markets = prop_markets_for_sport(sport_lower)
 
-                # Fetch props for this specific event
+            async def _fetch_event_odds(event_id: str):
                 event_odds_url = f"{ODDS_API_BASE}/sports/{sport_config['odds']}/events/{event_id}/odds"
-                event_resp, _event_used = await odds_api_get(
+                event_resp, _event_used = await odds_api_get_cached(
                     event_odds_url,
                     params={
                         "apiKey": ODDS_API_KEY,
@@ -2713,43 +1423,16 @@ async def get_props(sport: str):
                     },
                     client=_client,
                 )
+                return event_resp
 
-                if event_resp and event_resp.status_code == 200:
-                    try:
-                        event_data = event_resp.json()
-                        game_props = {
-                            "game_id": event_data.get("id"),
-                            "home_team": event_data.get("home_team"),
-                            "away_team": event_data.get("away_team"),
-                            "commence_time": event.get("commence_time"),  # From events list, not event_data
-                            "props": []
-                        }
-
-                        for bm in event_data.get("bookmakers", []):
-                            for market in bm.get("markets", []):
-                                market_key = market.get("key", "")
-                                if "player" in market_key or "batter" in market_key or "pitcher" in market_key:
-                                    for outcome in market.get("outcomes", []):
-                                        game_props["props"].append({
-                                            "player": outcome.get("description", ""),
-                                            "market": market_key,
-                                            "line": outcome.get("point", 0),
-                                            "odds": outcome.get("price", -110),
-                                            "side": outcome.get("name"),
-                                            "book": bm.get("key")
-                                        })
-
-                        if game_props["props"]:
-                            data.append(game_props)
-                            odds_data_used = True
-                            logger.info("Got %d props for %s vs %s", len(game_props["props"]), game_props["away_team"], game_props["home_team"])
-
-                    except ValueError as e:
-                        logger.warning("Failed to parse event %s props: %s", event_id, e)
-                else:
-                    logger.debug("No props for event %s (status %s)", event_id, event_resp.status_code if event_resp else "no response")
+            data, _fetch_stats = await fetch_props_for_events(sport_lower, events, _fetch_event_odds)
+            for game_props in data:
+                logger.info("Got %d props for %s vs %s", len(game_props["props"]), game_props["away_team"], game_props["home_team"])
+            if data:
+                odds_data_used = True
 
-            logger.info("Props data retrieved from Odds API for %s: %d games with props", sport, len(data))
+            logger.info("Props data retrieved from Odds API for %s: %d games with props (%s)",
+                        sport, len(data), _fetch_stats.to_dict())
         else:
             logger.warning("Odds API events returned %s for %s, trying Playbook API", events_resp.status_code if events_resp else "no response", sport)
 
@@ -2809,7 +1492,10 @@ async def get_props(sport: str):
         source = "generated"
 
     result = {"sport": sport.upper(), "source": source, "count": len(data), "data": data}
+    if _fetch_stats is not None:
+        result["fetch_stats"] = _fetch_stats.to_dict()
     api_cache.set(cache_key, result)
+    get_payload_store().discard(cache_key)
     return _sanitize_public(result)
 
 
@@ -2823,6 +1509,8 @@ async def get_best_bets(
     max_events: Optional[int] = None,
     max_props: Optional[int] = None,
     max_games: Optional[int] = None,
+    profile: Optional[int] = None,
+    request: Request = None,
 ):
     """
     Get best bets using full 8 AI Models + 8 Pillars + JARVIS + Esoteric scoring.
@@ -2838,6 +1526,8 @@ async def get_best_bets(
     - max_events: Max events to process (default 12). Applied before props fetch.
     - max_props: Max prop picks in output (default 10)
     - max_games: Max game picks in output (default 10)
+    - profile: With debug=1, set to 1 to attach a sampling profile of this request
+      (requires BEST_BETS_PROFILE_ENABLED=true)
     """
     sport_lower = sport.lower()
     if sport_lower not in SPORT_MAPPINGS:
@@ -2854,10 +1544,16 @@ async def get_best_bets(
 
     # Skip cache in debug mode
     if not debug_mode:
+        record_best_bets_request(sport_lower)  # drives warm priority / refresh-ahead
         cache_key = f"best-bets:{sport_lower}" + (":live" if live_mode else "")
+        # Fast path: pre-serialized public bytes (no sanitize/normalize/encode)
+        pre = get_payload_store().get(cache_key)
+        if pre is not None:
+            return _precomputed_response(pre, request)
         cached = api_cache.get(cache_key)
         if cached:
-            return JSONResponse(_sanitize_public(cached))
+            pre = _store_public_payload(cache_key, cached, ttl=PAYLOAD_REHYDRATE_TTL_S)
+            return _precomputed_response(pre, request)
     else:
         cache_key = None  # Don't cache debug responses
 
@@ -2870,19 +1566,44 @@ async def get_best_bets(
     request_id = _uuid.uuid4().hex[:12]
     _start = time.time()
     try:
-        result = await _best_bets_inner(
-            sport, sport_lower, live_mode,
-            cache_key, effective_min_score, debug_mode,
-            date_str=date,
-            max_events=effective_max_events,
-            max_props=effective_max_props,
-            max_games=effective_max_games,
-        )
+        if offload_enabled() and not debug_mode:
+            # Score in a dedicated worker process so this event loop keeps serving
+            result = await run_coroutine_in_worker(
+                _best_bets_in_worker,
+                sport, sport_lower, live_mode, effective_min_score,
+                date_str=date,
+                max_events=effective_max_events,
+                max_props=effective_max_props,
+                max_games=effective_max_games,
+            )
+            api_cache.set(cache_key, result, ttl=120)
+        else:
+            # v20.30: Opt-in sampling profile of a single (debug, never cached) request
+            profiler = SamplingProfiler() if (debug_mode and profile == 1 and BEST_BETS_PROFILE_ENABLED) else None
+            if profiler:
+                profiler.start()
+            try:
+                result = await _best_bets_inner(
+                    sport, sport_lower, live_mode,
+                    cache_key, effective_min_score, debug_mode,
+                    date_str=date,
+                    max_events=effective_max_events,
+                    max_props=effective_max_props,
+                    max_games=effective_max_games,
+                )
+            finally:
+                if profiler:
+                    profiler.stop()
+            if profiler and isinstance(result.get("debug"), dict):
+                result["debug"]["profile"] = profiler.report()
         logger.info("best-bets %s completed in %.1fs (request_id=%s, debug=%s, min=%.1f)",
                      sport, time.time() - _start, request_id, debug_mode, effective_min_score)
         if debug_mode:
             return result
-        return JSONResponse(_sanitize_public(result))
+        pre = get_payload_store().get(cache_key)
+        if pre is None:
+            pre = _store_public_payload(cache_key, result, ttl=120)
+        return _precomputed_response(pre, request)
     except HTTPException:
         raise
     except Exception as e:
@@ -2899,6 +1620,11 @@ async def get_best_bets(
         raise HTTPException(status_code=500, detail=detail)
 
 
+async def _best_bets_in_worker(sport, sport_lower, live_mode, min_score, **kwargs):
+    """Scoring-worker entry point: no caching here, the parent process owns the caches."""
+    return await _best_bets_inner(sport, sport_lower, live_mode, None, min_score, False, **kwargs)
+
+
 async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                            min_score=6.5, debug_mode=False, date_str=None,
                            max_events=12, max_props=10, max_games=10):
@@ -3028,6 +1754,7 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
     _t0 = time.time()
     _deadline = _t0 + TIME_BUDGET_S
     _timings = {}  # stage_name → elapsed_seconds
+    _spans = EngineSpans()  # v20.30: per-engine, per-pick timing samples
     _timed_out_components = []
 
     def _elapsed():
@@ -3042,6 +1769,29 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
     def _record(stage, start):
         _timings[stage] = round(time.time() - start, 3)
 
+    # v20.30: Upper-bound pruning state (per-kind running top-N of scored candidates)
+    _prune_stats = {"enabled": BEST_BETS_PRUNE_ENABLED, "rank_factor": BEST_BETS_PRUNE_RANK_FACTOR,
+                    "scored": 0, "pruned_threshold": 0, "pruned_rank": 0}
+    _rank_heaps = {"PROP": [], "GAME": []}
+
+    def _rank_floor(kind):
+        """Score a candidate must beat to enter the current top (factor x max picks), or None."""
+        if BEST_BETS_PRUNE_RANK_FACTOR <= 0:
+            return None
+        heap = _rank_heaps[kind]
+        keep = (max_props if kind == "PROP" else max_games) * BEST_BETS_PRUNE_RANK_FACTOR
+        return heap[0] if len(heap) >= keep else None
+
+    def _note_scored(kind, score):
+        if BEST_BETS_PRUNE_RANK_FACTOR <= 0:
+            return
+        heap = _rank_heaps[kind]
+        keep = (max_props if kind == "PROP" else max_games) * BEST_BETS_PRUNE_RANK_FACTOR
+        if len(heap) < keep:
+            heapq.heappush(heap, score)
+        elif score > heap[0]:
+            heapq.heapreplace(heap, score)
+
     _s = time.time()
     # Get MasterPredictionSystem
     mps = get_master_prediction_system()
@@ -3884,7 +2634,20 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
     # v16.1: Added market parameter for LSTM model routing
     # v17.6: Added game_bookmakers parameter for Benford analysis
     # v20.0: Added game_status parameter for live signals, event_id for line history
-    def calculate_pick_score(game_str, sharp_signal, base_ai=5.0, player_name="", home_team="", away_team="", spread=0, total=220, public_pct=50, pick_type="GAME", pick_side="", prop_line=0, market="", game_datetime=None, game_bookmakers=None, book_count: int = 0, market_book_count: int = 0, event_id: str | None = None, game_status: str = "", odds: int = -110):
+    def calculate_pick_score(*args, **kwargs):
+        """Score one pick end to end; a game pick's ensemble row is predicted on its own."""
+        steps = _pick_score_steps(*args, **kwargs)
+        row, score_data = _start_pick_score(steps)
+        if row is None:
+            return score_data
+        return _finish_pick_score(steps, _ensemble_scores_batch([row])[0])
+
+    def _pick_score_steps(game_str, sharp_signal, base_ai=5.0, player_name="", home_team="", away_team="", spread=0, total=220, public_pct=50, pick_type="GAME", pick_side="", prop_line=0, market="", game_datetime=None, game_bookmakers=None, book_count: int = 0, market_book_count: int = 0, event_id: str | None = None, game_status: str = "", odds: int = -110, prune_floor: float | None = None, prune_rank_floor: float | None = None):
+        """
+        calculate_pick_score as a generator. A game pick that reaches the
+        ensemble yields its feature row once and resumes with
+        (ensemble_ai, ensemble_metadata); the score dict is the return value.
+        """
         # =====================================================================
         # v15.0 FOUR-ENGINE ARCHITECTURE (Clean Separation)
         # =====================================================================
@@ -3925,6 +2688,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         lstm_metadata = None
         weather_data = None
 
+        _sp = _sp_pick = _spans.start()  # v20.30: per-engine spans (see core/hot_path_profiler)
+
         # --- AI SCORE (Dynamic Model - 0-8 scale) ---
         # v16.1: Use LSTM for props if available, otherwise fallback to heuristics
         # v17.0: Wire real context data from Pillars 13-15 (Defensive Rank, Pace, Vacuum)
@@ -3987,6 +2752,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             except Exception as e:
                 logger.debug(f"Context lookup failed, using defaults: {e}")
 
+        _sp = _spans.lap("context_layer", _sp)
+
         # Initialize AI telemetry (for debug output)
         _ai_telemetry = {"ai_mode": "UNKNOWN", "models_used_count": 0}
 
@@ -4140,6 +2907,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         # Scale AI to 0-10 for use in base_score formula
         ai_scaled = scale_ai_score_to_10(ai_score, max_ai=8.0) if TIERING_AVAILABLE else ai_score * 1.25
 
+        _sp = _spans.lap("ai_models", _sp)  # LSTM for props, 8-model ensemble for games
+
         # --- RESEARCH SCORE (Market Intelligence - 0-10 scale) ---
         # Pillar 1: Sharp Money Detection (0-3 pts)
         # v20.16: Use sharp_strength (Playbook splits ONLY) - NOT signal_strength (was contaminated by lv)
@@ -4379,6 +3148,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         # Pillar score for backwards compatibility (used in scoring_breakdown)
         pillar_score = sharp_boost + line_boost + public_boost
 
+        _sp = _spans.lap("research", _sp)
+
         # =================================================================
         # v15.1 JARVIS ENGINE (0-10) - Savant or Hybrid based on JARVIS_IMPL
         # =================================================================
@@ -4449,6 +3220,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         jarvis_version = jarvis_data.get("version", "JARVIS_SAVANT_v11.08")
         jarvis_blend_type = jarvis_data.get("blend_type", "SAVANT")
 
+        _sp = _spans.lap("jarvis", _sp)
+
         # =================================================================
         # v15.2 ESOTERIC SCORE (0-10) - Per-Pick Differentiation
         # =================================================================
@@ -4577,6 +3350,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             trap_mod              # Modifier (negative)
         )
 
+        _sp = _spans.lap("esoteric", _sp)
+
         # ===== GLITCH PROTOCOL SIGNALS (v17.2) =====
         # Integrate orphaned esoteric signals: Chrome Resonance, Void Moon, Hurst, Kp-Index
         glitch_adjustment = 0.0
@@ -4954,6 +3729,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         # NOTE: planetary_hour exists in jarvis_savant_engine.VedicAstroEngine but is
         # NOT wired into scoring (present but not wired - see ESOTERIC_TRUTH_TABLE.md)
 
+        _sp = _spans.lap("glitch", _sp)
+
         # ===== WEATHER IMPACT (v20.0 Phase 9) =====
         # Weather only affects outdoor sports (NFL, MLB, NCAAF)
         # Indoor sports (NBA, NHL, NCAAB) and dome stadiums are skipped
@@ -5146,6 +3923,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         logger.debug("Esoteric[%s]: mag=%.1f num=%.2f astro=%.2f fib=%.2f vortex=%.2f daily=%.2f trap=%.2f → raw=%.2f",
                      game_str[:30], _eso_magnitude, numerology_score, astro_score, fib_score, vortex_score, daily_edge_score, trap_mod, esoteric_raw)
 
+        _sp = _spans.lap("situational", _sp)
+
         # --- v15.3 FOUR-ENGINE CONFLUENCE (with STRONG eligibility gate) ---
         _research_sharp_present = bool(sharp_signal and sharp_signal.get("signal_strength", "NONE") != "NONE")
         if jarvis:
@@ -5242,6 +4021,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             msrf_reasons.append(f"MSRF error: {e}")
             logger.warning("MSRF calculation failed: %s", e)
 
+        _sp = _spans.lap("confluence_msrf", _sp)
+
         # ===== v17.4 SERP BETTING INTELLIGENCE =====
         # Search trend signals from SerpAPI mapped to boost layers
         # SHADOW MODE by default: logs signals but applies 0 boost
@@ -5328,6 +4109,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             reasons_count=len(serp_reasons),
         )
 
+        _sp = _spans.lap("serp", _sp)
+
         # ===== v17.9 GEMATRIA TWITTER INTELLIGENCE =====
         # Community consensus signals from gematria Twitter accounts
         # Monitors: GematriaClub, ScriptLeaker, ZachHubbard, archaix138, etc.
@@ -5381,6 +4164,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         if harmonic_boost > 0:
             confluence_reasons.append(f"Harmonic Convergence (+{harmonic_boost:.2f})")
 
+        _sp = _spans.lap("gematria", _sp)
+
         # --- v18.0 CONTEXT SCORE (Pillars 13-15) ---
         # Calculate context_score (0-10) from defensive rank, pace, and vacuum
         # Context is a bounded modifier layer (NOT a weighted engine)
@@ -5430,6 +4215,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         except Exception as e:
             logger.debug("Travel fatigue failed: %s", e)
 
+        _sp = _spans.lap("context_score", _sp)
+
         # --- v18.0 BASE SCORE FORMULA (4 Engines + Context Modifier) ---
         # BASE_4 = (ai × 0.25) + (research × 0.35) + (esoteric × 0.20) + (jarvis × 0.20)
         # CONTEXT_MOD = bounded modifier (NOT an engine weight)
@@ -5454,10 +4241,29 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         if context_modifier != 0:
             context_reasons.append(f"Context modifier: {context_modifier:+.3f} (score={context_score:.2f})")
 
+        # --- v20.30 UPPER-BOUND PRUNING ---
+        # Everything after BASE_4 is capped, so the final score cannot exceed
+        # score_ceiling. Candidates that cannot reach the caller's floor skip
+        # the post-base enrichment below; their (lower) final score stays below
+        # the floor either way, so returned picks are unchanged.
+        score_ceiling = compute_score_ceiling(base_score, context_modifier)
+        pruned_reason = None
+        if BEST_BETS_PRUNE_ENABLED:
+            _prune_stats["scored"] += 1
+            if prune_floor is not None and score_ceiling < prune_floor:
+                pruned_reason = "threshold"
+            elif prune_rank_floor is not None and score_ceiling < prune_rank_floor:
+                pruned_reason = "rank"
+            if pruned_reason:
+                _prune_stats[f"pruned_{pruned_reason}"] += 1
+        _score_pruned = pruned_reason is not None
+
+        _sp = _spans.lap("base_score", _sp)
+
         # --- v11.08 JASON SIM CONFLUENCE (runs after base score, before tier assignment) ---
         # Jason simulates game outcomes and applies boost/downgrade based on win probability
         jason_output = {}
-        if JASON_SIM_AVAILABLE:
+        if JASON_SIM_AVAILABLE and not _score_pruned:
             try:
                 # Determine actual pick_type from context if not provided
                 actual_pick_type = pick_type
@@ -5492,10 +4298,13 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                 "projected_pace": "NEUTRAL",
                 "variance_flag": "MED",
                 "injury_state": "UNKNOWN",
-                "confluence_reasons": ["Jason module not available"],
+                "confluence_reasons": [f"Jason skipped: score ceiling {score_ceiling:.2f} ({pruned_reason})"
+                                       if _score_pruned else "Jason module not available"],
                 "base_score": base_score
             }
 
+        _sp = _spans.lap("jason_sim", _sp)
+
         # FINAL = BASE_4 + CONTEXT_MOD + CONFLUENCE + MSRF + JASON + SERP + ENSEMBLE + TOTALS_CAL
         jason_sim_boost = jason_output.get("jason_sim_boost", 0.0)
 
@@ -5536,13 +4345,15 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             totals_calibration_adj=totals_calibration_adj,
         )
 
+        _sp = _spans.lap("totals_calibration", _sp)
+
         # ===== v17.8 PILLAR 16: OFFICIALS TENDENCY INTEGRATION =====
         # Referee/Umpire tendencies impact totals, spreads, and props
         # v17.8: Now uses real referee tendency database (officials_data.py)
         officials_adjustment = 0.0
         officials_reasons = []
 
-        if sport_upper in ["NBA", "NFL", "NHL"] and CONTEXT_LAYER_AVAILABLE:
+        if sport_upper in ["NBA", "NFL", "NHL"] and CONTEXT_LAYER_AVAILABLE and not _score_pruned:
             try:
                 # v17.2: Lookup officials from ESPN prefetched data
                 # _officials_by_game keys are (home_team_lower, away_team_lower)
@@ -5651,12 +4462,14 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             except Exception as e:
                 logger.debug(f"Officials adjustment failed: {e}")
 
+        _sp = _spans.lap("officials", _sp)
+
         # ===== v17.0 PILLAR 17: PARK FACTORS (MLB ONLY) =====
         # Stadium characteristics affect hitting/pitching performance
         park_adjustment = 0.0
         park_reason = None
 
-        if sport_upper == "MLB" and home_team and CONTEXT_LAYER_AVAILABLE:
+        if sport_upper == "MLB" and home_team and CONTEXT_LAYER_AVAILABLE and not _score_pruned:
             try:
                 # Determine if batter stat (vs pitcher stat)
                 is_batter = True  # default
@@ -5696,7 +4509,7 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         is_bad_hook = False
         is_key_number = False
 
-        if HOOK_DISCIPLINE_AVAILABLE and pick_type == "SPREAD" and spread is not None:
+        if HOOK_DISCIPLINE_AVAILABLE and pick_type == "SPREAD" and spread is not None and not _score_pruned:
             try:
                 # Determine bet side: favorite vs underdog
                 # Negative spread = favorite, positive = underdog
@@ -5730,7 +4543,7 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         expert_consensus_adjustment = 0.0
         expert_consensus_reasons: List[str] = []
 
-        if EXPERT_CONSENSUS_AVAILABLE and pick_type in {"SPREAD", "TOTAL", "MONEYLINE"}:
+        if EXPERT_CONSENSUS_AVAILABLE and pick_type in {"SPREAD", "TOTAL", "MONEYLINE"} and not _score_pruned:
             try:
                 # Build pick_data for expert consensus check
                 expert_pick_data = {
@@ -5780,7 +4593,7 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         total_correlation_adjustment = 0.0
         total_correlation_reasons: List[str] = []
 
-        if PROP_CORRELATION_AVAILABLE and pick_type == "TOTAL" and total is not None:
+        if PROP_CORRELATION_AVAILABLE and pick_type == "TOTAL" and total is not None and not _score_pruned:
             try:
                 total_corr_result = get_total_correlation_adjustment(
                     sport=sport_upper,
@@ -5808,6 +4621,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         # Check if Jason blocked this pick
         jason_blocked = jason_output.get("jason_blocked", False)
 
+        _sp = _spans.lap("post_base_signals", _sp)  # park, hook, expert, total correlation
+
         # ===== v17.0 ENSEMBLE MODEL FOR GAME PICKS =====
         # Use trained ensemble model to predict hit probability for game picks
         # Game pick types: SPREAD, TOTAL, MONEYLINE, SHARP (not "GAME" - that's the default)
@@ -5820,23 +4635,28 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         # v20.28.10: Get coverage_status from ai_audit - gate ensemble boost by coverage
         _ai_coverage_status = _ai_telemetry.get("ai_audit", {}).get("coverage_status", "OK")
 
-        if pick_type in _GAME_PICK_TYPES and ENSEMBLE_AVAILABLE and ML_INTEGRATION_AVAILABLE:
+        if _score_pruned:
+            ensemble_skipped_reason = f"pruned ({pruned_reason})"
+        elif pick_type in _GAME_PICK_TYPES and ENSEMBLE_AVAILABLE and ML_INTEGRATION_AVAILABLE:
             try:
-                ensemble_ai, ensemble_metadata = get_ensemble_ai_score(
-                    ai_score=ai_scaled,
-                    research_score=research_score,
-                    esoteric_score=esoteric_score,
-                    jarvis_score=jarvis_rs if jarvis_rs is not None else 4.5,
-                    line=float(spread) if spread else float(total) if total else 0.0,
-                    odds=-110,  # Default odds (could be passed from outer scope)
-                    confluence_boost=confluence_boost,
-                    jason_sim_boost=jason_sim_boost,
-                    titanium_triggered=False,  # Not yet calculated
-                    sport=sport_upper,
-                    pick_type="GAME",
-                    side=pick_side if pick_side else "Home",
-                    base_ai=ai_scaled
-                )
+                # v20.30: hand the feature row to the caller, which batches the
+                # predict_proba call per sport and market (see _start_pick_score)
+                ensemble_ai, ensemble_metadata = yield {
+                    "ai_score": ai_scaled,
+                    "research_score": research_score,
+                    "esoteric_score": esoteric_score,
+                    "jarvis_score": jarvis_rs if jarvis_rs is not None else 4.5,
+                    "line": float(spread) if spread else float(total) if total else 0.0,
+                    "odds": -110,  # Default odds (could be passed from outer scope)
+                    "confluence_boost": confluence_boost,
+                    "jason_sim_boost": jason_sim_boost,
+                    "titanium_triggered": False,  # Not yet calculated
+                    "sport": sport_upper,
+                    "pick_type": "GAME",
+                    "side": pick_side if pick_side else "Home",
+                    "base_ai": ai_scaled,
+                }
+                _sp = _spans.start()  # time spent suspended belongs to other picks
 
                 if ensemble_metadata and ensemble_metadata.get("source") == "ensemble":
                     # Ensemble predicts hit probability - use to adjust confidence
@@ -5863,6 +4683,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             except Exception as e:
                 logger.debug(f"Ensemble prediction unavailable: {e}")
 
+        _sp = _spans.lap("ensemble", _sp)
+
         # ===== v20.3 FINAL SCORE RECOMPUTATION WITH ALL POST-BASE SIGNALS =====
         # Combine prop_correlation_adjustment + total_correlation_adjustment
         combined_prop_correlation = prop_correlation_adjustment + total_correlation_adjustment
@@ -5926,6 +4748,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         # jarvis_rs, jarvis_active, jarvis_hits_count, jarvis_triggers_hit, jarvis_reasons
         # are all set from calculate_jarvis_engine_score() call
 
+        _sp = _spans.lap("final_score", _sp)
+
         # --- v18.0 TITANIUM CHECK (STRICT 3 of 4 engines >= 8.0) ---
         # Context NEVER counts toward Titanium.
         try:
@@ -6076,6 +4900,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                 elif gate == "esoteric_gte_4.0":
                     tier_reason.append(f"  - Esoteric {esoteric_score:.1f} < 4.0")
 
+        _sp = _spans.lap("tiering", _sp)
+
         # v20.15 Pre-extract GLITCH/Kp-Index data for debug fields (Python scope fix)
         # The pattern 'glitch_result' in dir() doesn't work inside dict literals/lambdas
         # because dir() checks the wrong scope. Extract data BEFORE the dict literal.
@@ -6191,11 +5017,16 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         else:
             _market_phase = "PRE_GAME"
 
+        _spans.lap("breakdown", _sp)
+        _spans.lap("calculate_pick_score", _sp_pick)
+
         return {
             "total_score": round(final_score, 2),
             "final_score": round(final_score, 2),  # Alias for frontend
             "inputs_hash": _inputs_hash,  # v20.26: Determinism verification
             "market_phase": _market_phase,  # v20.26: PRE_GAME|IN_PLAY|HALFTIME|FINAL
+            "score_ceiling": round(score_ceiling, 3),  # v20.30: upper bound after BASE_4
+            "pruned": pruned_reason,  # v20.30: None | "threshold" | "rank"
             "confidence": confidence,
             "confidence_score": confidence_score,
             "confluence_level": confluence_level,
@@ -6557,8 +5388,8 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
 
     async def _fetch_game_odds():
         try:
-            from odds_api import odds_api_get
-            resp, used = await odds_api_get(
+            from odds_api import odds_api_get_cached
+            resp, used = await odds_api_get_cached(
                 odds_url,
                 params={
                     "apiKey": ODDS_API_KEY,
@@ -6599,17 +5430,18 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             logger.debug("ESPN scoreboard fetch failed: %s", e)
             return {"events": []}
 
-    props_data, game_odds_resp, injuries_data, espn_scoreboard = await asyncio.gather(
-        _fetch_props(),
+    # v20.30: props are the slowest fetch (one round-trip per event). Start
+    # them with the rest, but wait for them only where the props pipeline
+    # begins, so the injuries/ESPN enrichment below runs while they download
+    _props_task = asyncio.ensure_future(_fetch_props())
+    _props_task.add_done_callback(lambda t: t.cancelled() or t.exception())  # never "unretrieved"
+    game_odds_resp, injuries_data, espn_scoreboard = await asyncio.gather(
         _fetch_game_odds(),
         _fetch_injuries(),
         _fetch_espn_scoreboard(),
         return_exceptions=True
     )
     # Handle exceptions from gather
-    if isinstance(props_data, Exception):
-        logger.warning("Props fetch failed in parallel: %s", props_data)
-        props_data = {"data": []}
     if isinstance(game_odds_resp, Exception):
         logger.warning("Game odds fetch failed in parallel: %s", game_odds_resp)
         game_odds_resp = None
@@ -6629,12 +5461,6 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
 
     # Integration usage telemetry (best-bets scoring cycle, request-scoped)
     # v20.26: Pass fetched_at_et for conservative staleness calculation
-    if isinstance(props_data, dict):
-        src = props_data.get("source", "")
-        if src == "odds_api":
-            _mark_integration_used("odds_api", fetched_at_et=_odds_fetched_at)
-        elif src == "playbook":
-            _mark_integration_used("playbook_api", fetched_at_et=_odds_fetched_at)
     if isinstance(injuries_data, dict):
         if injuries_data.get("source") == "playbook":
             _mark_integration_used("playbook_api", fetched_at_et=_odds_fetched_at)
@@ -7094,6 +5920,21 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
 
     logger.info("INJURIES LOOKUP (merged): %d teams with injuries", len(_injuries_by_team))
 
+    # v20.30: props started with the parallel fetch; collect them now
+    _s = time.time()
+    try:
+        props_data = await _props_task
+    except Exception as e:
+        logger.warning("Props fetch failed in parallel: %s", e)
+        props_data = {"data": []}
+    if isinstance(props_data, dict):
+        src = props_data.get("source", "")
+        if src == "odds_api":
+            _mark_integration_used("odds_api", fetched_at_et=_odds_fetched_at)
+        elif src == "playbook":
+            _mark_integration_used("playbook_api", fetched_at_et=_odds_fetched_at)
+    _record("props_wait", _s)
+
     # ============================================
     # APPLY ET DAY GATE to both datasets
     # ============================================
@@ -7358,12 +6199,20 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
     _weather_fetched = 0
     _weather_cache_hits = 0
 
+    # Hand the event loop back to other requests periodically while scoring
+    _scoring_yielder = ScoringYielder()
+
+    # v20.30: picks are scored up to their ensemble row first (pass 1) so the
+    # ensemble runs batched; entries are (steps, row, score_data, market, context)
+    _pending_game_scores = []
+
     try:
         if raw_games:
             for game in raw_games:
+                await _scoring_yielder.maybe_yield()
                 if _past_deadline():
                     _timed_out_components.append("game_picks_scoring")
-                    logger.warning("TIME BUDGET: Game picks hit deadline after %d picks", len(game_picks))
+                    logger.warning("TIME BUDGET: Game picks hit deadline after %d picks", len(_pending_game_scores))
                     break
                 home_team = game.get("home_team", "")
                 away_team = game.get("away_team", "")
@@ -7526,7 +6375,9 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                                 continue
 
                             market_book_count = market_book_counts.get(market_key, 0)
-                            score_data = calculate_pick_score(
+                            _weather_mod = _game_weather.get("weather_modifier", 0.0) if _game_weather else 0.0
+                            _rank_floor_game = _rank_floor("GAME")
+                            _pick_steps = _pick_score_steps(
                                 game_str,
                                 sharp_signal,
                                 base_ai=4.5,
@@ -7545,111 +6396,132 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                                 market_book_count=market_book_count,
                                 event_id=game.get("id"),
                                 game_status=_game_status,  # v20.0: Pass for live signals
-                                odds=best_odds  # v20.27: Pass actual odds for moneyline scoring
+                                odds=best_odds,  # v20.27: Pass actual odds for moneyline scoring
+                                # v20.30: weather is added after scoring, so it shifts the floors
+                                prune_floor=min_score - _weather_mod,
+                                prune_rank_floor=_rank_floor_game - _weather_mod if _rank_floor_game is not None else None,
                             )
+                            _ensemble_row, score_data = _start_pick_score(_pick_steps)
+                            _pending_game_scores.append((_pick_steps, _ensemble_row, score_data, market_key, (
+                                home_team, away_team, game_key, commence_time, start_time_et, sharp_signal,
+                                _game_weather, _weather_mod, game_book_count, market_book_count,
+                                market_key, pick_type, pick_side, pick_name, display, point,
+                                best_odds, best_book, best_book_key, best_link,
+                            )))
+
+            # v20.30: one ensemble predict_proba per market, then finish every
+            # pick and build its candidate in the original order
+            _ensemble_results = _ensemble_scores_by_group(
+                [p[1] for p in _pending_game_scores],
+                [p[3] for p in _pending_game_scores],
+                _spans,
+            )
+            for (_pick_steps, _ensemble_row, score_data, _, _pick_ctx), _ensemble_result in zip(
+                    _pending_game_scores, _ensemble_results):
+                await _scoring_yielder.maybe_yield()
+                (
+                    home_team, away_team, game_key, commence_time, start_time_et, sharp_signal,
+                    _game_weather, _weather_mod, game_book_count, market_book_count,
+                    market_key, pick_type, pick_side, pick_name, display, point,
+                    best_odds, best_book, best_book_key, best_link
+                ) = _pick_ctx
+                if _ensemble_row is not None:
+                    score_data = _finish_pick_score(_pick_steps, _ensemble_result)
+
+                # v16.0: Apply weather modifier to score (capped at ±1.0)
+                _weather_reasons = _game_weather.get("weather_reasons", []) if _game_weather else []
+                _weather_available = _game_weather.get("available", False) if _game_weather else False
 
-                            # v16.0: Apply weather modifier to score (capped at ±1.0)
-                            _weather_mod = _game_weather.get("weather_modifier", 0.0) if _game_weather else 0.0
-                            _weather_reasons = _game_weather.get("weather_reasons", []) if _game_weather else []
-                            _weather_available = _game_weather.get("available", False) if _game_weather else False
-
-                            # Apply weather modifier to total_score and final_score
-                            if _weather_mod != 0.0:
-                                _old_score = score_data.get("total_score", 0)
-                                _old_final = score_data.get("final_score", _old_score)
-                                score_data["total_score"] = round(_old_score + _weather_mod, 2)
-                                score_data["final_score"] = round(_old_final + _weather_mod, 2)
-                                logger.debug("Weather modifier applied: %s -> %.2f + %.2f = %.2f",
-                                           game_key, _old_score, _weather_mod, score_data["total_score"])
-
-                            # Add weather fields to score_data
-                            score_data["weather_modifier"] = round(_weather_mod, 2)
-                            score_data["weather_reasons"] = _weather_reasons
-                            score_data["weather_available"] = _weather_available
-
-                            game_status = "PRE_GAME"
-                            if TIME_FILTERS_AVAILABLE and commence_time:
-                                game_status = get_game_status(commence_time)
-
-                            # v20.28.5: Sync game_status from market_phase (more authoritative from Odds API)
-                            _market_phase = score_data.get("market_phase", "PRE_GAME")
-                            if _market_phase in ("IN_PLAY", "HALFTIME"):
-                                game_status = "IN_PROGRESS"
-                            elif _market_phase == "FINAL":
-                                game_status = "FINAL"
-
-                            signals_fired = score_data.get("pillars_passed", []).copy()
-                            if sharp_signal.get("signal_strength") in ["STRONG", "MODERATE"]:
-                                signals_fired.append(f"SHARP_{sharp_signal.get('signal_strength')}")
-                            has_started = game_status in ["IN_PROGRESS", "LIVE", "FINAL"]
-
-                            # v16.0: Compute context modifiers for this game pick
-                            # v17.2: Pass injuries data for vacuum calculation
-                            _rest_override = _rest_days_for_team(away_team)
-                            _game_ctx_mods = await compute_context_modifiers(
-                                sport=sport.upper(),
-                                home_team=home_team,
-                                away_team=away_team,
-                                player_team="",
-                                pick_type="GAME",
-                                pick_side=pick_side,
-                                injuries_data=_injuries_by_team,
-                                rest_days_override=_rest_override
-                            )
+                # Apply weather modifier to total_score and final_score
+                if _weather_mod != 0.0:
+                    _old_score = score_data.get("total_score", 0)
+                    _old_final = score_data.get("final_score", _old_score)
+                    score_data["total_score"] = round(_old_score + _weather_mod, 2)
+                    score_data["final_score"] = round(_old_final + _weather_mod, 2)
+                    logger.debug("Weather modifier applied: %s -> %.2f + %.2f = %.2f",
+                               game_key, _old_score, _weather_mod, score_data["total_score"])
 
-                            game_picks.append({
-                                "sport": sport.upper(),
-                                "league": sport.upper(),
-                                "event_id": game_key,
-                                "pick_type": pick_type,
-                                "pick": display,
-                                "pick_side": pick_side,
-                                "side": pick_name,  # Required for contradiction gate: team name for spreads/ML, Over/Under for totals
-                                "team": pick_name if market_key != "totals" else None,
-                                "line": point,
-                                "odds": best_odds,
-                                "book": best_book or "consensus",
-                                "book_key": best_book_key or "consensus",  # FIX: Never empty
-                                "book_link": best_link,
-                                "sportsbook_name": best_book,
-                                "sportsbook_event_url": best_link,
-                                "game": f"{away_team} @ {home_team}",
-                                "matchup": f"{away_team} @ {home_team}",
-                                "home_team": home_team,
-                                "away_team": away_team,
-                                "start_time_et": start_time_et,
-                                "game_status": game_status,
-                                "status": game_status.lower() if game_status else "scheduled",
-                                "has_started": has_started,
-                                "is_started_already": has_started,
-                                "is_live": game_status == "IN_PROGRESS",
-                                "is_live_bet_candidate": game_status == "IN_PROGRESS",
-                                "market": market_key,
-                                "recommendation": display,
-                                "best_book": best_book,
-                                "best_book_link": best_link,
-                                "book_count": game_book_count,
-                                "market_book_count": market_book_count,
-                                "signals_fired": signals_fired,
-                                "signals_firing": signals_fired,
-                                "pillars_hit": score_data.get("pillars_passed", []),
-                                "engine_breakdown": {
-                                    "ai": score_data.get("ai_score", 0),
-                                    "research": score_data.get("research_score", 0),
-                                    "esoteric": score_data.get("esoteric_score", 0),
-                                    "jarvis": score_data.get("jarvis_rs", 0),
-                                },
-                                "titanium_reasons": score_data.get("smash_reasons", []),
-                                "graded": False,
-                                "grade_status": "PENDING",
-                                **score_data,
-                                "sharp_signal": sharp_signal.get("signal_strength", "NONE"),
-                                # v16.0: Context Modifiers (REQUIRED - Session 4 Hard Gate)
-                                "weather_context": _game_ctx_mods.get("weather_context"),
-                                "rest_days": _game_ctx_mods.get("rest_days"),
-                                "home_away": _game_ctx_mods.get("home_away"),
-                                "vacuum_score": _game_ctx_mods.get("vacuum_score"),
-                            })
+                # Add weather fields to score_data
+                score_data["weather_modifier"] = round(_weather_mod, 2)
+                score_data["weather_reasons"] = _weather_reasons
+                score_data["weather_available"] = _weather_available
+
+                game_status = "PRE_GAME"
+                if TIME_FILTERS_AVAILABLE and commence_time:
+                    game_status = get_game_status(commence_time)
+
+                # v20.28.5: Sync game_status from market_phase (more authoritative from Odds API)
+                _market_phase = score_data.get("market_phase", "PRE_GAME")
+                if _market_phase in ("IN_PLAY", "HALFTIME"):
+                    game_status = "IN_PROGRESS"
+                elif _market_phase == "FINAL":
+                    game_status = "FINAL"
+
+                signals_fired = score_data.get("pillars_passed", []).copy()
+                if sharp_signal.get("signal_strength") in ["STRONG", "MODERATE"]:
+                    signals_fired.append(f"SHARP_{sharp_signal.get('signal_strength')}")
+                has_started = game_status in ["IN_PROGRESS", "LIVE", "FINAL"]
+
+                # v16.0: Compute context modifiers for this game pick
+                # v17.2: Pass injuries data for vacuum calculation
+                _rest_override = _rest_days_for_team(away_team)
+                _sp_ctx = _spans.start()
+                _game_ctx_mods = await compute_context_modifiers(
+                    sport=sport.upper(),
+                    home_team=home_team,
+                    away_team=away_team,
+                    player_team="",
+                    pick_type="GAME",
+                    pick_side=pick_side,
+                    injuries_data=_injuries_by_team,
+                    rest_days_override=_rest_override
+                )
+                _spans.lap("context_modifiers", _sp_ctx)
+
+                _note_scored("GAME", score_data.get("total_score", 0))
+                game_picks.append(PickCandidate({
+                    "sport": sport.upper(),
+                    "event_id": game_key,
+                    "pick_type": pick_type,
+                    "pick": display,
+                    "pick_side": pick_side,
+                    "side": pick_name,  # Required for contradiction gate: team name for spreads/ML, Over/Under for totals
+                    "team": pick_name if market_key != "totals" else None,
+                    "line": point,
+                    "odds": best_odds,
+                    "book": best_book or "consensus",
+                    "book_key": best_book_key or "consensus",  # FIX: Never empty
+                    "book_link": best_link,
+                    "sportsbook_name": best_book,
+                    "game": f"{away_team} @ {home_team}",
+                    "home_team": home_team,
+                    "away_team": away_team,
+                    "start_time_et": start_time_et,
+                    "game_status": game_status,
+                    "status": game_status.lower() if game_status else "scheduled",
+                    "has_started": has_started,
+                    "is_live": game_status == "IN_PROGRESS",
+                    "market": market_key,
+                    "recommendation": display,
+                    "book_count": game_book_count,
+                    "market_book_count": market_book_count,
+                    "signals_fired": signals_fired,
+                    "engine_breakdown": {
+                        "ai": score_data.get("ai_score", 0),
+                        "research": score_data.get("research_score", 0),
+                        "esoteric": score_data.get("esoteric_score", 0),
+                        "jarvis": score_data.get("jarvis_rs", 0),
+                    },
+                    "graded": False,
+                    "grade_status": "PENDING",
+                }, score_data, late={
+                    "sharp_signal": sharp_signal.get("signal_strength", "NONE"),
+                    # v16.0: Context Modifiers (REQUIRED - Session 4 Hard Gate)
+                    "weather_context": _game_ctx_mods.get("weather_context"),
+                    "rest_days": _game_ctx_mods.get("rest_days"),
+                    "home_away": _game_ctx_mods.get("home_away"),
+                    "vacuum_score": _game_ctx_mods.get("vacuum_score"),
+                }, aliases=GAME_ALIASES))
     except Exception as e:
         _game_scoring_error = True
         logger.warning("Game picks scoring failed: %s", e)
@@ -7707,7 +6579,9 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                 game_datetime=_sharp_game_dt,
                 game_bookmakers=_sharp_bookmakers,  # v17.6: Multi-book for Benford
                 event_id=signal_game_id,
-                game_status=_sharp_game_status  # v20.0: Pass for live signals
+                game_status=_sharp_game_status,  # v20.0: Pass for live signals
+                prune_floor=min_score,
+                prune_rank_floor=_rank_floor("GAME"),
             )
 
             # v20.28.5: Sync game_status from market_phase (more authoritative from Odds API)
@@ -7731,6 +6605,7 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
             # v16.0: Compute context modifiers for sharp fallback picks
             # v17.2: Pass injuries data for vacuum calculation
             _rest_override = _rest_days_for_team(away_team)
+            _sp_ctx = _spans.start()
             _sharp_ctx_mods = await compute_context_modifiers(
                 sport=sport.upper(),
                 home_team=home_team,
@@ -7741,10 +6616,11 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                 injuries_data=_injuries_by_team,
                 rest_days_override=_rest_override
             )
+            _spans.lap("context_modifiers", _sp_ctx)
 
-            game_picks.append({
+            _note_scored("GAME", score_data.get("total_score", 0))
+            game_picks.append(PickCandidate({
                 "sport": sport.upper(),
-                "league": sport.upper(),
                 "event_id": signal.get("game_id", ""),
                 "pick_type": "SHARP",
                 "pick": f"Sharp on {signal.get('sharp_side', 'home')}",
@@ -7757,42 +6633,33 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                 "book_key": "",
                 "book_link": "",
                 "sportsbook_name": "",
-                "sportsbook_event_url": "",
                 "game": f"{away_team} @ {home_team}",
-                "matchup": f"{away_team} @ {home_team}",
                 "home_team": home_team,
                 "away_team": away_team,
                 "start_time_et": start_time_et,
                 "game_status": _sharp_game_status,
                 "status": _sharp_game_status.lower() if _sharp_game_status else "pre_game",
                 "has_started": _sharp_game_status in ["IN_PROGRESS", "LIVE", "FINAL"],
-                "is_started_already": _sharp_game_status in ["IN_PROGRESS", "LIVE", "FINAL"],
                 "is_live": _sharp_game_status == "IN_PROGRESS",
-                "is_live_bet_candidate": _sharp_game_status == "IN_PROGRESS",
                 "market": "sharp_money",
                 "recommendation": f"SHARP ON {signal.get('sharp_side', 'home').upper()}",
-                "best_book": "",
-                "best_book_link": "",
                 "signals_fired": signals_fired,
-                "signals_firing": signals_fired,
-                "pillars_hit": score_data.get("pillars_passed", []),
                 "engine_breakdown": {
                     "ai": score_data.get("ai_score", 0),
                     "research": score_data.get("research_score", 0),
                     "esoteric": score_data.get("esoteric_score", 0),
                     "jarvis": score_data.get("jarvis_rs", 0),
                 },
-                "titanium_reasons": score_data.get("smash_reasons", []),
                 "graded": False,
                 "grade_status": "PENDING",
-                **score_data,
+            }, score_data, late={
                 "sharp_signal": signal.get("signal_strength", "MODERATE"),
                 # v16.0: Context Modifiers (REQUIRED - Session 4 Hard Gate)
                 "weather_context": _sharp_ctx_mods.get("weather_context"),
                 "rest_days": _sharp_ctx_mods.get("rest_days"),
                 "home_away": _sharp_ctx_mods.get("home_away"),
                 "vacuum_score": _sharp_ctx_mods.get("vacuum_score"),
-            })
+            }, aliases=GAME_ALIASES))
 
     # ============================================
     # CATEGORY 2: PLAYER PROPS (uses pre-resolved player cache — instant lookups)
@@ -7805,8 +6672,10 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
     props_picks = []
     _props_scoring_error = False
     invalid_injury_count = 0
+    # Incremental rescoring: reuse last run's score when a prop's inputs are unchanged
+    _prop_memo_run = get_prop_score_memo().begin_run(sport_upper)
+    _props_deadline_hit = False
     try:
-        _props_deadline_hit = False
         for game in prop_games:
             if _past_deadline():
                 _timed_out_components.append("props_scoring")
@@ -7888,8 +6757,12 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                     if _market_key:
                         _prop_books_by_market.setdefault(_market_key, set()).add(_book_norm)
             _prop_book_count = len(_prop_books_all)
+            # Benford inputs for calculate_pick_score come from the game's spreads/totals
+            _game_bookmakers = game.get("bookmakers", [])
+            _game_book_lines = bookmaker_lines(_game_bookmakers, ("spreads", "totals"))
 
             for prop in _props_list:
+                await _scoring_yielder.maybe_yield()
                 if _past_deadline():
                     _timed_out_components.append("props_scoring")
                     logger.warning("TIME BUDGET: Props scoring hit deadline after %d picks (%.1fs)", len(props_picks), _elapsed())
@@ -7913,33 +6786,60 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                     continue
 
                 market_book_count = len(_prop_books_by_market.get(market, set()))
-                score_data = calculate_pick_score(
-                    game_str + player,
-                    sharp_signal,
-                    base_ai=5.0,
-                    player_name=player,
-                    home_team=home_team,
-                    away_team=away_team,
+                _memo_key = prop_memo_key(game.get("id") or game_key, player, market, side, prop.get("book") or book_key or book_name)
+                _memo_fp = fingerprint_inputs(
+                    line=line,
+                    odds=odds,
+                    injury_status=injury_status,
                     spread=_game_spread,
                     total=_game_total,
-                    public_pct=sharp_signal.get("public_pct", sharp_signal.get("ticket_pct", 50)),
-                    pick_type="PROP",
-                    pick_side=side,
-                    prop_line=line,
-                    market=market,  # v16.1: Pass market for LSTM model routing
-                    game_datetime=_prop_game_datetime,
-                    game_bookmakers=game.get("bookmakers", []),  # v17.6: Multi-book for Benford
+                    sharp=sharp_signal,
+                    injuries_home=_injuries_by_team.get(home_team, []),
+                    injuries_away=_injuries_by_team.get(away_team, []),
+                    weather=_prop_game_weather,
+                    game_status=_prop_game_status,
+                    commence_time=commence_time,
                     book_count=_prop_book_count,
                     market_book_count=market_book_count,
-                    event_id=game.get("id"),
-                    game_status=_prop_game_status  # v20.0: Pass for live signals
+                    game_book_lines=_game_book_lines,
+                    market_book_lines=bookmaker_lines(_game_bookmakers, (market,)),
                 )
+                score_data = _prop_memo_run.lookup(_memo_key, _memo_fp)
+                _prop_weather_mod = _prop_game_weather.get("weather_modifier", 0.0) if _prop_game_weather else 0.0
+                if score_data is None:
+                    _rank_floor_prop = _rank_floor("PROP")
+                    score_data = calculate_pick_score(
+                        game_str + player,
+                        sharp_signal,
+                        base_ai=5.0,
+                        player_name=player,
+                        home_team=home_team,
+                        away_team=away_team,
+                        spread=_game_spread,
+                        total=_game_total,
+                        public_pct=sharp_signal.get("public_pct", sharp_signal.get("ticket_pct", 50)),
+                        pick_type="PROP",
+                        pick_side=side,
+                        prop_line=line,
+                        market=market,  # v16.1: Pass market for LSTM model routing
+                        game_datetime=_prop_game_datetime,
+                        game_bookmakers=_game_bookmakers,  # v17.6: Multi-book for Benford
+                        book_count=_prop_book_count,
+                        market_book_count=market_book_count,
+                        event_id=game.get("id"),
+                        game_status=_prop_game_status,  # v20.0: Pass for live signals
+                        # v20.30: weather is added after scoring, so it shifts the floors
+                        prune_floor=MIN_PROPS_SCORE - _prop_weather_mod,
+                        prune_rank_floor=_rank_floor_prop - _prop_weather_mod if _rank_floor_prop is not None else None,
+                    )
+                    # Rank floors depend on the rest of the slate; only store run-independent results
+                    if score_data.get("pruned") != "rank":
+                        _prop_memo_run.store(_memo_key, _memo_fp, score_data)
 
                 # Lineup confirmation guard (props only)
                 lineup_guard = _lineup_risk_guard(commence_time, injury_status)
 
                 # v16.0: Apply weather modifier to props (capped at ±1.0)
-                _prop_weather_mod = _prop_game_weather.get("weather_modifier", 0.0) if _prop_game_weather else 0.0
                 _prop_weather_reasons = _prop_game_weather.get("weather_reasons", []) if _prop_game_weather else []
                 _prop_weather_available = _prop_game_weather.get("available", False) if _prop_game_weather else False
 
@@ -8022,6 +6922,7 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                 # v16.0: Compute context modifiers for this prop
                 # v17.2: Pass injuries data for vacuum calculation
                 _rest_override = _rest_days_for_team(player_team or away_team)
+                _sp_ctx = _spans.start()
                 _ctx_mods = await compute_context_modifiers(
                     sport=sport.upper(),
                     home_team=home_team,
@@ -8032,34 +6933,28 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                     injuries_data=_injuries_by_team,
                     rest_days_override=_rest_override
                 )
+                _spans.lap("context_modifiers", _sp_ctx)
 
-                props_picks.append({
+                _note_scored("PROP", score_data.get("total_score", 0))
+                props_picks.append(PickCandidate({
                     "sport": sport.upper(),
-                    "league": sport.upper(),  # v14.9: Consistent league field
                     "event_id": game_key,  # v14.9: For prop availability tracking
                     "player": player,
-                    "player_name": player,
                     "player_team": player_team,  # v14.9: Resolved team
                     # v14.9 CANONICAL PLAYER ID - required for grading
                     "canonical_player_id": canonical_player_id,
                     "provider_ids": provider_ids,
                     "position": player_position,
                     "market": market,
-                    "stat_type": market,
-                    "prop_type": market,
                     "line": line,
                     "side": side,
                     "direction": side.upper(),  # v14.9: Alias for frontend consistency
-                    "over_under": side,
                     "odds": odds,
                     "book": book_name,  # v14.9: Consistent sportsbook field
                     "book_key": book_key,
                     "book_link": book_link,
-                    # v14.11: Sportsbook aliases for output contract
-                    "sportsbook_name": book_name,
-                    "sportsbook_event_url": book_link,
+                    # v14.11: Sportsbook/alias fields for output contract come from PROP_ALIASES
                     "game": f"{away_team} @ {home_team}",
-                    "matchup": f"{away_team} @ {home_team}",
                     "home_team": home_team,
                     "away_team": away_team,
                     "start_time_et": start_time_et,  # Human-readable (e.g., "7:30 PM ET")
@@ -8067,20 +6962,14 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                     "game_status": game_status,
                     "status": game_status.lower() if game_status else "scheduled",  # v14.11: Status field
                     "has_started": has_started,  # v14.9: Boolean for frontend
-                    "is_started_already": has_started,  # v14.11: Alias for frontend
                     "is_live": game_status == "IN_PROGRESS",  # v14.11: Live mode flag
-                    "is_live_bet_candidate": game_status == "IN_PROGRESS",
                     "recommendation": f"{side.upper()} {line}",
                     "injury_status": resolved_injury_status,
                     "injury_checked": True,  # v14.9: Injury was checked via identity resolver
                     "lineup_status": lineup_guard,
-                    "best_book": book_name,
-                    "best_book_link": book_link,
                     "book_count": _prop_book_count,
                     "market_book_count": market_book_count,
                     "signals_fired": signals_fired,  # v14.9: Array of all triggered signals
-                    "signals_firing": signals_fired,  # v14.11: Alias for output contract
-                    "pillars_hit": score_data.get("pillars_passed", []),  # v14.11: Alias
                     # v14.11: Engine breakdown for frontend
                     "engine_breakdown": {
                         "ai": score_data.get("ai_score", 0),
@@ -8088,19 +6977,17 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
                         "esoteric": score_data.get("esoteric_score", 0),
                         "jarvis": score_data.get("jarvis_rs", 0),
                     },
-                    # v14.11: Titanium reasons alias
-                    "titanium_reasons": score_data.get("smash_reasons", []),
                     # v14.11: Grading fields (populated by pick_logger)
                     "graded": False,
                     "grade_status": "PENDING",
-                    **score_data,
+                }, score_data, late={
                     "sharp_signal": sharp_signal.get("signal_strength", "NONE"),
                     # v16.0: Context Modifiers (REQUIRED - Session 4 Hard Gate)
                     "weather_context": _ctx_mods.get("weather_context"),
                     "rest_days": _ctx_mods.get("rest_days"),
                     "home_away": _ctx_mods.get("home_away"),
                     "vacuum_score": _ctx_mods.get("vacuum_score"),
-                })
+                }, aliases=PROP_ALIASES))
             if _props_deadline_hit:
                 break
     except HTTPException:
@@ -8110,6 +6997,9 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         _props_scoring_error = True
         logger.warning("Props scoring failed for %s: %s", sport, e)
 
+    # Only prune memo entries when the whole slate was visited
+    if not _props_deadline_hit and not _props_scoring_error:
+        _prop_memo_run.finish()
     _record("props_scoring", _s)
 
     if invalid_injury_count > 0:
@@ -8271,6 +7161,11 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         logger.warning("CONCENTRATION_LIMIT: Failed to apply sport limit: %s", e)
         # Continue without enforcement
 
+    # v20.30: Candidates are compact PickCandidate records up to here; only the
+    # survivors are materialized into the public dict shape (aliases + score_data)
+    top_props = [materialize(p) for p in top_props]
+    top_game_picks = [materialize(g) for g in top_game_picks]
+
     # CRITICAL FIX: Enforce book_key defaults before API response (BOTH props and games)
     # Applied UNCONDITIONALLY - never allow empty book_key in response
     try:
@@ -8615,6 +7510,13 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
     except Exception:
         pass
 
+    # v20.30: Export per-engine spans as Prometheus histograms (debug output adds the summary)
+    try:
+        from metrics import track_engine_spans
+        track_engine_spans(sport_upper, _spans.sketches)
+    except Exception as e:
+        logger.debug("Engine span export failed: %s", e)
+
     # === DEBUG MODE: Return top 25 candidates with full engine breakdown ===
     if debug_mode:
         def _debug_pick(p):
@@ -8699,10 +7601,14 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
         result["debug"] = {
             # Timing breakdown
             "debug_timings": _timings,
+            "pruning": _prune_stats,
+            "engine_spans": _spans.summary(),
             "total_elapsed_s": round(_elapsed(), 2),
             "timed_out_components": _timed_out_components,
             "time_budget_s": TIME_BUDGET_S,
             "props_time_budget_s": PROPS_TIME_BUDGET_S,
+            "incremental_props": _prop_memo_run.to_dict(),
+            "props_fetch": props_data.get("fetch_stats") if isinstance(props_data, dict) else None,
             "max_events": max_events,
             "max_props": max_props,
             "max_games": max_games,
@@ -8934,10 +7840,64 @@ async def _best_bets_inner(sport, sport_lower, live_mode, cache_key,
 
     record_daily_integration_rollup(date_et, integration_calls, integration_impact)
     if cache_key:
-        api_cache.set(cache_key, result, ttl=120)  # 2 minute TTL
+        _cache_best_bets(cache_key, result)
     return result
 
 
+def _cache_best_bets(cache_key: str, result: dict) -> None:
+    """Cache a best-bets result and precompute its public payload (inline and offloaded warms)."""
+    api_cache.set(cache_key, result, ttl=120)  # 2 minute TTL
+    # Precompute public bytes now so warm + first hit are both fast paths
+    try:
+        _store_public_payload(cache_key, result, ttl=120)
+    except Exception as e:
+        logger.warning("Precomputing public payload failed for %s: %s", cache_key, e)
+        get_payload_store().invalidate(cache_key)
+
+
+def _start_pick_score(steps):
+    """Run a pick-score generator to its ensemble row: (row, None), or (None, score_data) if it needs none."""
+    try:
+        return next(steps), None
+    except StopIteration as done:
+        return None, done.value
+
+
+def _finish_pick_score(steps, ensemble_result):
+    """Resume a pick with its (ensemble_ai, ensemble_metadata) and return its score_data."""
+    try:
+        steps.send(ensemble_result)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("pick scoring yielded more than one ensemble row")
+
+
+def _ensemble_scores_batch(rows):
+    """(ensemble_ai, ensemble_metadata) per row from one predict_proba call."""
+    try:
+        return get_ensemble_ai_scores_batch(rows)
+    except Exception as e:
+        logger.debug("Ensemble prediction unavailable: %s", e)
+        return [(row["base_ai"], {"source": "heuristic", "reason": f"Ensemble batch failed: {e}"})
+                for row in rows]
+
+
+def _ensemble_scores_by_group(rows, groups, spans=None):
+    """Score ensemble rows with one batch per group (e.g. market); None rows stay None."""
+    results = [None] * len(rows)
+    by_group: Dict[str, List[int]] = {}
+    for i, row in enumerate(rows):
+        if row is not None:
+            by_group.setdefault(groups[i], []).append(i)
+    for indices in by_group.values():
+        started = time.perf_counter()
+        for i, result in zip(indices, _ensemble_scores_batch([rows[i] for i in indices])):
+            results[i] = result
+        if spans is not None:
+            spans.add("ensemble_batch", time.perf_counter() - started)
+    return results
+
+
 # ============================================================================
 # LIVE BETTING ENDPOINT (v12.0 Production Hardened)
 # ============================================================================
@@ -9996,7 +8956,11 @@ async def debug_today_games(sport: str):
 async def lstm_status():
     """Check LSTM model availability and status."""
     try:
-        from lstm_brain import LSTMBrain, TF_AVAILABLE
+        from lstm_brain import LSTMBrain, TF_AVAILABLE, LSTM_RUNTIME, NUMPY_RUNTIME_AVAILABLE
+        if LSTM_RUNTIME != "tensorflow" and NUMPY_RUNTIME_AVAILABLE:
+            _lstm_mode = "numpy_lstm"
+        else:
+            _lstm_mode = "tensorflow" if TF_AVAILABLE else "numpy_fallback"
 
         # v16.1: Also check ml_integration module for enhanced status
         if ML_INTEGRATION_AVAILABLE:
@@ -10004,7 +8968,7 @@ async def lstm_status():
             return {
                 "available": True,
                 "tensorflow_available": TF_AVAILABLE,
-                "mode": "tensorflow" if TF_AVAILABLE else "numpy_fallback",
+                "mode": _lstm_mode,
                 "note": "LSTM active for props. Models loaded on-demand.",
                 "ml_integration": ml_status,
                 "timestamp": datetime.now().isoformat()
@@ -10013,7 +8977,7 @@ async def lstm_status():
             return {
                 "available": True,
                 "tensorflow_available": TF_AVAILABLE,
-                "mode": "tensorflow" if TF_AVAILABLE else "numpy_fallback",
+                "mode": _lstm_mode,
                 "note": "LSTM brain available but ml_integration not loaded.",
                 "timestamp": datetime.now().isoformat()
             }
@@ -10147,1637 +9111,96 @@ async def ml_status():
 
 
 # ============================================================================
-# PICK LOGGER ENDPOINTS (v14.9) - Production Pick Persistence & Audit
+# MOVED to routers/live_picks.py
 # ============================================================================
+# - GET /picks/today
+# - GET /picks/graded
+# - POST /picks/grade
+# - POST /picks/bulk-grade
+# - GET /picks/audit-report
+# - GET /picks/validation-status
+# - POST /picks/auto-grade
+# - GET /picks/grading-summary
+# - GET /results/completed-games
+# - GET /results/player-stats
+# - GET /scheduler/status
+# - POST /ml/train-ensemble
 
-@router.get("/picks/today")
-async def get_logged_picks_today(sport: Optional[str] = None):
-    """
-    Get all picks logged today.
-
-    Used for monitoring what picks have been published.
-    """
-    if not PICK_LOGGER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Pick logger not available")
-
-    try:
-        picks = get_today_picks(sport)
-        payload = {
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "sport": sport.upper() if sport else "ALL",
-            "count": len(picks),
-            "picks": [
-                {
-                    "pick_id": p.pick_id,
-                    "sport": p.sport,
-                    "player": p.player_name,
-                    "matchup": p.matchup,
-                    "line": p.line,
-                    "side": p.side,
-                    "tier": p.tier,
-                    "final_score": p.final_score,
-                    "already_started": p.already_started,
-                    "book_validated": p.book_validated,
-                    "result": p.result
-                }
-                for p in picks
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
-        return JSONResponse(_sanitize_public(payload))
-    except Exception as e:
-        logger.exception("Failed to get today's picks: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.get("/picks/graded")
-async def get_graded_picks(date: Optional[str] = None, sport: Optional[str] = None):
-    """
-    Get all picks with grading status for the Grading page.
-
-    Returns both pending and graded picks from grader_store.
-    Frontend uses the 'graded' boolean to split into tabs.
-
-    Query params:
-    - date: Date filter (YYYY-MM-DD), defaults to today ET
-    - sport: Sport filter (NBA, NFL, etc.), defaults to all
-    """
-    if not GRADER_STORE_AVAILABLE:
-        return {"picks": [], "error": "Grader store not available"}
-
-    try:
-        # Default to today in ET
-        if not date:
-            from core.time_et import now_et
-            date = now_et().strftime("%Y-%m-%d")
-
-        # Load all predictions with grade records merged
-        all_picks = grader_store.load_predictions(date_et=date)
-
-        # Optional sport filter
-        if sport:
-            all_picks = [p for p in all_picks if p.get("sport", "").upper() == sport.upper()]
-
-        # Map to frontend format expected by Grading.jsx
-        picks_out = []
-        for p in all_picks:
-            is_graded = p.get("grade_status") == "GRADED"
-            side = p.get("side", "")
-            recommendation = side if side else ""
-            # Build recommendation string (OVER/UNDER for props)
-            if not recommendation and p.get("market", ""):
-                market = p.get("market", "").upper()
-                if "OVER" in market:
-                    recommendation = "OVER"
-                elif "UNDER" in market:
-                    recommendation = "UNDER"
-
-            picks_out.append({
-                "id": p.get("pick_id"),
-                "pick_id": p.get("pick_id"),
-                "player": p.get("player_name") or p.get("side") or "Game",
-                "team": p.get("home_team") or p.get("team", ""),
-                "opponent": p.get("away_team") or "",
-                "matchup": p.get("matchup", ""),
-                "sport": p.get("sport", ""),
-                "stat": p.get("stat_type") or p.get("market", ""),
-                "line": p.get("line"),
-                "projection": p.get("projection") or p.get("line"),
-                "edge": p.get("edge") or 0,
-                "recommendation": recommendation,
-                "final_score": p.get("final_score"),
-                "tier": p.get("tier", "STANDARD"),
-                "units": p.get("units", 1.0),
-                "graded": is_graded,
-                "result": p.get("result") if is_graded else None,
-                "actual": p.get("actual_value") if is_graded else None,
-                "graded_at": p.get("graded_at") if is_graded else None,
-                "date_et": p.get("date_et"),
-                "pick_type": p.get("pick_type", ""),
-            })
-
-        return {
-            "picks": picks_out,
-            "date": date,
-            "total": len(picks_out),
-            "graded_count": sum(1 for p in picks_out if p["graded"]),
-            "pending_count": sum(1 for p in picks_out if not p["graded"]),
-            "timestamp": datetime.now().isoformat()
-        }
-
-    except Exception as e:
-        logger.exception("Failed to get graded picks: %s", e)
-        return {"picks": [], "error": str(e)}
-
-
-@router.post("/picks/grade")
-async def grade_published_pick(grade_data: Dict[str, Any]):
-    """
-    Grade a published pick with actual result.
-
-    Request body:
-    {
-        "pick_id": "abc123def456",
-        "result": "WIN",  // WIN, LOSS, or PUSH
-        "actual_value": 27.5  // Optional: actual stat value for props
-    }
-    """
-    if not PICK_LOGGER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Pick logger not available")
-
-    pick_id = grade_data.get("pick_id")
-    result = grade_data.get("result")
-    actual_value = grade_data.get("actual_value")
-
-    if not pick_id or not result:
-        raise HTTPException(status_code=400, detail="pick_id and result are required")
-
-    if result.upper() not in ("WIN", "LOSS", "PUSH"):
-        raise HTTPException(status_code=400, detail="result must be WIN, LOSS, or PUSH")
-
-    try:
-        grade_result = grade_logged_pick(pick_id, result, actual_value)
-
-        if grade_result:
-            return {
-                "status": "graded",
-                **grade_result,
-                "timestamp": datetime.now().isoformat()
-            }
-        else:
-            raise HTTPException(status_code=404, detail=f"Pick not found: {pick_id}")
-
-    except Exception as e:
-        logger.exception("Failed to grade pick: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.post("/picks/bulk-grade")
-async def bulk_grade_picks(grade_data: Dict[str, Any]):
-    """
-    Grade multiple picks at once.
-
-    Request body:
-    {
-        "grades": [
-            {"pick_id": "abc123", "result": "WIN"},
-            {"pick_id": "def456", "result": "LOSS", "actual_value": 22.5}
-        ]
-    }
-    """
-    if not PICK_LOGGER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Pick logger not available")
-
-    grades = grade_data.get("grades", [])
-    if not grades:
-        raise HTTPException(status_code=400, detail="grades array is required")
-
-    results = []
-    errors = []
-
-    for grade in grades:
-        pick_id = grade.get("pick_id")
-        result = grade.get("result")
-        actual_value = grade.get("actual_value")
-
-        if not pick_id or not result:
-            errors.append({"pick_id": pick_id, "error": "Missing required fields"})
-            continue
-
-        try:
-            grade_result = grade_logged_pick(pick_id, result, actual_value)
-            if grade_result:
-                results.append(grade_result)
-            else:
-                errors.append({"pick_id": pick_id, "error": "Pick not found"})
-        except Exception as e:
-            errors.append({"pick_id": pick_id, "error": str(e)})
-
-    return {
-        "status": "bulk_grade_complete",
-        "graded": len(results),
-        "errors": len(errors),
-        "results": results,
-        "error_details": errors,
-        "timestamp": datetime.now().isoformat()
-    }
-
-
-@router.get("/picks/audit-report")
-async def get_pick_audit_report(date: Optional[str] = None):
-    """
-    Generate comprehensive audit report for pick performance.
-
-    Includes:
-    - Record by tier and sport
-    - ROI by tier
-    - Top 10 false positives (high score loses)
-    - Top 10 missed opportunities (low score wins)
-    - Pillar hit-rate breakdown
-    - Jarvis trigger performance
-    - Jason sim accuracy
-
-    Date format: YYYY-MM-DD (defaults to yesterday)
-    """
-    if not PICK_LOGGER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Pick logger not available")
-
-    try:
-        report = run_daily_audit_report(date)
-        return report
-    except Exception as e:
-        logger.exception("Failed to generate audit report: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.get("/picks/validation-status")
-async def get_pick_validation_status():
-    """
-    Get validation status for today's picks.
-
-    Shows:
-    - Total picks logged
-    - Picks with validation errors (injury/book issues)
-    - Already started (late pull) picks
-    """
-    if not PICK_LOGGER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Pick logger not available")
-
-    try:
-        picks = get_today_picks()
-
-        validation_errors = [p for p in picks if p.validation_errors]
-        late_pulls = [p for p in picks if p.already_started]
-        graded = [p for p in picks if p.result is not None]
-
-        return {
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "total_logged": len(picks),
-            "valid_picks": len(picks) - len(validation_errors),
-            "validation_errors": {
-                "count": len(validation_errors),
-                "picks": [
-                    {
-                        "pick_id": p.pick_id,
-                        "player": p.player_name,
-                        "errors": p.validation_errors
-                    }
-                    for p in validation_errors
-                ]
-            },
-            "late_pulls": {
-                "count": len(late_pulls),
-                "picks": [
-                    {
-                        "pick_id": p.pick_id,
-                        "matchup": p.matchup,
-                        "reason": p.late_pull_reason
-                    }
-                    for p in late_pulls
-                ]
-            },
-            "grading_status": {
-                "graded": len(graded),
-                "pending": len(picks) - len(graded)
-            },
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.exception("Failed to get validation status: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# =============================================================================
-# AUTO-GRADING ENDPOINTS (v14.9)
-# =============================================================================
-
-@router.post("/picks/auto-grade")
-async def trigger_auto_grade(
-    date: Optional[str] = None,
-    sports: Optional[str] = None
-):
-    """
-    Trigger automatic grading of picks against actual game results.
-
-    This endpoint:
-    1. Fetches completed game scores from Odds API
-    2. Fetches actual player stats (NBA from balldontlie/ESPN)
-    3. Grades all pending picks for the specified date
-    4. Updates pick_logger with WIN/LOSS/PUSH results
-
-    Query params:
-    - date: Date to grade (default: today in ET). Format: YYYY-MM-DD
-    - sports: Comma-separated sports to grade (default: NBA,NHL,NFL,MLB)
 
-    Returns grading summary with results.
-    """
-    if not RESULT_FETCHER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Result fetcher not available")
+# ESOTERIC ENDPOINTS: Moved to routers/esoteric.py
+# (esoteric-edge, esoteric-accuracy, noosphere/status, gann-physics-status)
 
-    if not PICK_LOGGER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Pick logger not available")
 
-    try:
-        sports_list = sports.split(",") if sports else None
-        result = await auto_grade_picks(date=date, sports=sports_list)
-        return result
-    except Exception as e:
-        logger.exception("Auto-grade failed: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
+# ============================================================================
+# LEVEL 17 - PARLAY ARCHITECT CORRELATION ENGINE - Moved to routers/betting.py
+# ============================================================================
+# CORRELATION_MATRIX and VOID_IMPACT_MULTIPLIERS are now in routers/betting.py
+# Import from there if needed:
+#   from routers.betting import CORRELATION_MATRIX, VOID_IMPACT_MULTIPLIERS
 
+# ============================================================================
+# SPORTSBOOK DEEP LINKS - Moved to routers/line_shop.py
+# ============================================================================
+# SMASH_LINK_SCHEMES and SPORTSBOOK_CONFIGS are now in core/sportsbooks.py
+# LINE SHOP ENDPOINTS: Moved to routers/line_shop.py
+# - /line-shop/{sport}
+# - /betslip/generate
+# - /sportsbooks
+# Helper functions: generate_sportsbook_link, generate_true_deep_link
 
-@router.get("/picks/grading-summary")
-async def get_grading_summary(date: Optional[str] = None):
-    """
-    Get a summary of grading results for a date.
 
-    Shows:
-    - Total picks graded
-    - Record (wins/losses/pushes)
-    - Hit rate by tier
-    - Units profit/loss
+# ============================================================================
+# LEVEL 17 - PARLAY ARCHITECT, VOID CHECK, SMASH CARD - Moved to routers/betting.py
+# ============================================================================
+# Endpoints moved to routers/betting.py:
+# - POST /parlay-architect (correlation calculation)
+# - GET /void-check/{player} (void player impact)
+# - POST /smash-card (deep link generation)
+# - GET /correlations (list all correlations)
 
-    Query params:
-    - date: Date to summarize (default: today in ET)
-    """
-    if not GRADER_STORE_AVAILABLE:
-        return {
-            "error": "Grader store not available",
-            "date": date or "unknown",
-            "total_picks": 0,
-            "graded": 0,
-            "pending": 0
-        }
 
-    try:
-        # Get date (default to today in ET)
-        if not date:
-            from core.time_et import now_et
-            date = now_et().strftime("%Y-%m-%d")
-
-        # Load picks from grader_store (SINGLE SOURCE OF TRUTH)
-        picks = grader_store.load_predictions(date_et=date)
-        graded = [p for p in picks if p.get("grade_status") == "GRADED"]
-        pending = [p for p in picks if p.get("grade_status") != "GRADED"]
-
-        # Calculate by tier
-        tier_results = {}
-        for pick in graded:
-            tier = pick.get("tier", "UNKNOWN")
-            if tier not in tier_results:
-                tier_results[tier] = {"wins": 0, "losses": 0, "pushes": 0, "units_won": 0, "units_lost": 0}
-
-            result = pick.get("result")
-            units = pick.get("units", 1.0)
-
-            if result == "WIN":
-                tier_results[tier]["wins"] += 1
-                tier_results[tier]["units_won"] += units
-            elif result == "LOSS":
-                tier_results[tier]["losses"] += 1
-                tier_results[tier]["units_lost"] += units
-            else:
-                tier_results[tier]["pushes"] += 1
+# ============================================================================
+# ESOTERIC ENGINES (lazy singletons) - core/esoteric_engines.py
+# ============================================================================
 
-        # Overall summary
-        total_wins = sum(t["wins"] for t in tier_results.values())
-        total_losses = sum(t["losses"] for t in tier_results.values())
-        total_pushes = sum(t["pushes"] for t in tier_results.values())
-        units_won = sum(t["units_won"] for t in tier_results.values())
-        units_lost = sum(t["units_lost"] for t in tier_results.values())
+from core.esoteric_engines import (
+    JARVIS_IMPL, get_jarvis_impl, get_jarvis_savant, get_jarvis_hybrid, get_vedic_astro, get_esoteric_loop,
+)
 
-        return {
-            "date": date,
-            "total_picks": len(picks),
-            "graded": len(graded),
-            "pending": len(pending),
-            "overall": {
-                "record": f"{total_wins}-{total_losses}-{total_pushes}",
-                "wins": total_wins,
-                "losses": total_losses,
-                "pushes": total_pushes,
-                "hit_rate": f"{(total_wins / (total_wins + total_losses) * 100):.1f}%" if (total_wins + total_losses) > 0 else "N/A",
-                "units_profit": round(units_won - units_lost, 2),
-                "units_won": round(units_won, 2),
-                "units_lost": round(units_lost, 2)
-            },
-            "by_tier": tier_results,
-            "graded_picks": [
-                {
-                    "pick_id": p.get("pick_id"),
-                    "player": p.get("player_name") or "Game",
-                    "matchup": p.get("matchup"),
-                    "line": p.get("line"),
-                    "side": p.get("side"),
-                    "tier": p.get("tier"),
-                    "result": p.get("result"),
-                    "actual_value": p.get("actual_value"),
-                    "units": p.get("units", 1.0)
-                }
-                for p in graded
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.exception("Failed to get grading summary: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
 
+# ============================================================================
+# MOVED to routers/live_astro.py
+# ============================================================================
+# - GET /validate-immortal
+# - GET /jarvis-triggers
+# - GET /check-trigger/{value}
+# - GET /confluence/{sport}
+# - GET /astro-status
+# - GET /planetary-hour
+# - GET /nakshatra
+# - GET /retrograde-status
 
-@router.get("/results/completed-games")
-async def get_completed_games(sport: str = "NBA", days_back: int = 1):
-    """
-    Fetch completed games from Odds API.
 
-    Query params:
-    - sport: Sport code (NBA, NFL, NHL, MLB)
-    - days_back: How many days back to fetch (default: 1)
-    """
-    if not RESULT_FETCHER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Result fetcher not available")
+# ESOTERIC ANALYSIS: Moved to routers/esoteric.py
 
-    try:
-        games = await fetch_completed_games(sport, days_back)
-        return {
-            "sport": sport.upper(),
-            "days_back": days_back,
-            "count": len(games),
-            "games": [
-                {
-                    "game_id": g.game_id,
-                    "home_team": g.home_team,
-                    "away_team": g.away_team,
-                    "home_score": g.home_score,
-                    "away_score": g.away_score,
-                    "commence_time": g.commence_time
-                }
-                for g in games
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.exception("Failed to fetch completed games: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
 
+# ============================================================================
+# CLICK-TO-BET ENHANCEMENTS v2.0 - Moved to routers/betting.py
+# ============================================================================
+# Endpoints moved to routers/betting.py:
+# - GET /user/preferences/{user_id} (user sportsbook preferences)
+# - POST /user/preferences/{user_id} (save preferences)
+# - POST /bets/track (track a placed bet)
+# - POST /bets/grade/{bet_id} (grade a bet)
+# - GET /bets/history (bet history with filters)
 
-@router.get("/results/player-stats")
-async def get_player_stats(sport: str = "NBA", date: Optional[str] = None):
-    """
-    Fetch actual player stats from external APIs.
-
-    Query params:
-    - sport: Sport code (currently only NBA supported)
-    - date: Date to fetch stats for (default: today in ET)
-    """
-    if not RESULT_FETCHER_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Result fetcher not available")
-
-    if sport.upper() != "NBA":
-        raise HTTPException(status_code=400, detail="Only NBA player stats currently supported")
-
-    try:
-        if not date:
-            import pytz
-            ET = pytz.timezone("America/New_York")
-            date = datetime.now(ET).strftime("%Y-%m-%d")
-
-        stats = await fetch_nba_player_stats(date)
-        return {
-            "sport": sport.upper(),
-            "date": date,
-            "count": len(stats),
-            "players": [
-                {
-                    "player_name": s.player_name,
-                    "team": s.team,
-                    "points": s.points,
-                    "rebounds": s.rebounds,
-                    "assists": s.assists,
-                    "pra": s.points + s.rebounds + s.assists,
-                    "threes": s.three_pointers_made,
-                    "steals": s.steals,
-                    "blocks": s.blocks
-                }
-                for s in stats[:100]  # Limit to 100 for response size
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.exception("Failed to fetch player stats: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.get("/scheduler/status")
-async def scheduler_status():
-    """
-    Check daily scheduler status with detailed job information.
-
-    v20.16.3: Enhanced to show all registered jobs with next_run_time,
-    last_run_time, trigger, and misfire_grace_time.
-
-    Returns:
-        - available: bool
-        - jobs: list of job details (id, name, next_run_time_et, trigger, etc.)
-        - training_job_registered: bool - confirms team_model_train job exists
-    """
-    try:
-        from daily_scheduler import SCHEDULER_AVAILABLE, SchedulerConfig, get_scheduler
-        import pytz
-
-        ET = pytz.timezone("America/New_York")
-        scheduler_instance = get_scheduler()
-
-        jobs_info = []
-        training_job_registered = False
-
-        if scheduler_instance and scheduler_instance.scheduler:
-            for job in scheduler_instance.scheduler.get_jobs():
-                # Convert next_run_time to ET for display
-                next_run_et = None
-                if job.next_run_time:
-                    next_run_et = job.next_run_time.astimezone(ET).isoformat()
-
-                # Get trigger type
-                trigger_type = type(job.trigger).__name__ if job.trigger else "unknown"
-                trigger_str = str(job.trigger) if job.trigger else "N/A"
-
-                # Get misfire grace time
-                misfire_grace = getattr(job, 'misfire_grace_time', None)
-
-                job_info = {
-                    "id": job.id,
-                    "name": job.name,
-                    "next_run_time_et": next_run_et,
-                    "trigger_type": trigger_type,
-                    "trigger": trigger_str,
-                    "misfire_grace_time": misfire_grace,
-                }
-                jobs_info.append(job_info)
-
-                # Check if training job is registered
-                if job.id == "team_model_train":
-                    training_job_registered = True
-
-        return {
-            "available": True,
-            "apscheduler_available": SCHEDULER_AVAILABLE,
-            "scheduler_running": scheduler_instance.running if scheduler_instance else False,
-            "audit_time": f"{SchedulerConfig.AUDIT_HOUR:02d}:{SchedulerConfig.AUDIT_MINUTE:02d} ET",
-            "supported_sports": list(SchedulerConfig.SPORT_STATS.keys()),
-            "retrain_thresholds": {
-                "mae": SchedulerConfig.RETRAIN_MAE_THRESHOLD,
-                "hit_rate": SchedulerConfig.RETRAIN_HIT_RATE_THRESHOLD
-            },
-            "jobs": jobs_info,
-            "jobs_count": len(jobs_info),
-            "training_job_registered": training_job_registered,
-            "note": "Daily audit at 6 AM ET, team model training at 7 AM ET",
-            "timestamp": datetime.now().isoformat()
-        }
-    except ImportError as e:
-        return {
-            "available": False,
-            "note": f"Scheduler module not available: {e}",
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.warning("Scheduler status error: %s", e)
-        return {
-            "available": False,
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
-
-
-# /debug/training-status endpoint MOVED to routers/debug.py
-
-# ENGINE 3 ESOTERIC SEMANTIC AUDIT ENDPOINT: Moved to routers/esoteric.py
-
-
-@router.post("/ml/train-ensemble")
-async def trigger_ensemble_training(background: bool = False):
-    """
-    Manually trigger ensemble model training.
-
-    Args:
-        background: If True, run in background. If False (default), run sync and return output.
-
-    Requires at least 100 graded picks.
-    """
-    import subprocess
-    import sys
-
-    script_path = os.path.join(os.path.dirname(__file__), "scripts", "train_ensemble.py")
-
-    if not os.path.exists(script_path):
-        return {"success": False, "error": "Training script not found", "path": script_path}
-
-    # First, count graded picks
-    predictions_file = "/data/grader/predictions.jsonl"
-    graded_count = 0
-    total_count = 0
-
-    try:
-        if os.path.exists(predictions_file):
-            import json
-            with open(predictions_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        total_count += 1
-                        try:
-                            pick = json.loads(line)
-                            if pick.get("grade_status", "").upper() == "GRADED":
-                                graded_count += 1
-                        except Exception:
-                            pass
-    except Exception as e:
-        logger.warning("Could not count graded picks: %s", e)
-
-    # Run training synchronously (so we can see output)
-    try:
-        result = subprocess.run(
-            [sys.executable, script_path, "--min-picks", "100"],
-            capture_output=True,
-            text=True,
-            timeout=300
-        )
-
-        return {
-            "success": result.returncode == 0,
-            "returncode": result.returncode,
-            "graded_picks_found": graded_count,
-            "total_picks": total_count,
-            "predictions_file": predictions_file,
-            "stdout": result.stdout[-2000:] if result.stdout else None,
-            "stderr": result.stderr[-1000:] if result.stderr else None,
-            "note": "Check /live/ml/status to see if model loaded"
-        }
-    except subprocess.TimeoutExpired:
-        return {"success": False, "error": "Training timed out after 5 minutes"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
-
-
-# ESOTERIC ENDPOINTS: Moved to routers/esoteric.py
-# (esoteric-edge, esoteric-accuracy, noosphere/status, gann-physics-status)
-
-
-# ============================================================================
-# LEVEL 17 - PARLAY ARCHITECT CORRELATION ENGINE - Moved to routers/betting.py
-# ============================================================================
-# CORRELATION_MATRIX and VOID_IMPACT_MULTIPLIERS are now in routers/betting.py
-# Import from there if needed:
-#   from routers.betting import CORRELATION_MATRIX, VOID_IMPACT_MULTIPLIERS
-
-# ============================================================================
-# SPORTSBOOK DEEP LINKS - Moved to routers/line_shop.py
-# ============================================================================
-# SMASH_LINK_SCHEMES and SPORTSBOOK_CONFIGS are now in core/sportsbooks.py
-# LINE SHOP ENDPOINTS: Moved to routers/line_shop.py
-# - /line-shop/{sport}
-# - /betslip/generate
-# - /sportsbooks
-# Helper functions: generate_sportsbook_link, generate_true_deep_link
-
-
-# ============================================================================
-# LEVEL 17 - PARLAY ARCHITECT, VOID CHECK, SMASH CARD - Moved to routers/betting.py
-# ============================================================================
-# Endpoints moved to routers/betting.py:
-# - POST /parlay-architect (correlation calculation)
-# - GET /void-check/{player} (void player impact)
-# - POST /smash-card (deep link generation)
-# - GET /correlations (list all correlations)
-
-
-# ============================================================================
-# PHASE 3: LEARNING LOOP ENDPOINTS
-# ============================================================================
-
-# Import engines (lazy load to avoid circular imports)
-_jarvis_savant_engine = None
-_jarvis_hybrid_engine = None
-_vedic_astro_engine = None
-_esoteric_learning_loop = None
-
-# =============================================================================
-# JARVIS IMPLEMENTATION SELECTOR (v2.0)
-# =============================================================================
-# Env var: JARVIS_IMPL
-# Values: "savant" (default), "hybrid"
-# Invalid values default to "savant"
-
-JARVIS_IMPL = os.getenv("JARVIS_IMPL", "savant").lower()
-if JARVIS_IMPL not in ("savant", "hybrid"):
-    logger.warning("Invalid JARVIS_IMPL='%s', defaulting to 'savant'", JARVIS_IMPL)
-    JARVIS_IMPL = "savant"
-
-
-def get_jarvis_impl() -> str:
-    """Return the active Jarvis implementation string."""
-    return JARVIS_IMPL
-
-
-def get_jarvis_savant():
-    """Lazy load JarvisSavantEngine (standalone savant mode)."""
-    global _jarvis_savant_engine
-    if _jarvis_savant_engine is None:
-        try:
-            from jarvis_savant_engine import get_jarvis_engine
-            _jarvis_savant_engine = get_jarvis_engine()
-            logger.info("JarvisSavantEngine initialized (JARVIS_IMPL=%s)", JARVIS_IMPL)
-        except ImportError as e:
-            logger.warning("JarvisSavantEngine not available: %s", e)
-    return _jarvis_savant_engine
-
-
-def get_jarvis_hybrid():
-    """Lazy load Jarvis-Ophis hybrid callable (hybrid mode)."""
-    global _jarvis_hybrid_engine
-    if _jarvis_hybrid_engine is None:
-        try:
-            from core.jarvis_ophis_hybrid import calculate_hybrid_jarvis_score
-            _jarvis_hybrid_engine = calculate_hybrid_jarvis_score
-            logger.info("JarvisOphisHybrid initialized (JARVIS_IMPL=%s)", JARVIS_IMPL)
-        except ImportError as e:
-            logger.warning("JarvisOphisHybrid not available: %s", e)
-    return _jarvis_hybrid_engine
-
-
-def get_jarvis_engine():
-    """Get the active Jarvis engine based on JARVIS_IMPL selector."""
-    if JARVIS_IMPL == "hybrid":
-        return get_jarvis_hybrid()
-    else:
-        return get_jarvis_savant()
-
-
-def get_vedic_astro():
-    """Lazy load VedicAstroEngine."""
-    global _vedic_astro_engine
-    if _vedic_astro_engine is None:
-        try:
-            from jarvis_savant_engine import get_vedic_engine
-            _vedic_astro_engine = get_vedic_engine()
-            logger.info("VedicAstroEngine initialized")
-        except ImportError as e:
-            logger.warning("VedicAstroEngine not available: %s", e)
-    return _vedic_astro_engine
-
-
-def get_esoteric_loop():
-    """Lazy load EsotericLearningLoop."""
-    global _esoteric_learning_loop
-    if _esoteric_learning_loop is None:
-        try:
-            from jarvis_savant_engine import get_learning_loop
-            _esoteric_learning_loop = get_learning_loop()
-            logger.info("EsotericLearningLoop initialized")
-        except ImportError as e:
-            logger.warning("EsotericLearningLoop not available: %s", e)
-    return _esoteric_learning_loop
-
-
-# ============================================================================
-# PHASE 1: CONFLUENCE CORE ENDPOINTS
-# ============================================================================
-
-@router.get("/validate-immortal")
-async def validate_immortal():
-    """
-    Validate 2178 as THE IMMORTAL number.
-
-    Mathematical proof that 2178 is the only 4-digit number where:
-    - n^4 contains n
-    - reverse(n)^4 contains reverse(n)
-    - Digital root = 9 (Tesla completion)
-    """
-    jarvis = get_jarvis_savant()
-    if not jarvis:
-        raise HTTPException(status_code=503, detail="JarvisSavantEngine not available")
-
-    return jarvis.validate_2178()
-
-
-@router.get("/jarvis-triggers")
-async def list_jarvis_triggers():
-    """List all JARVIS trigger numbers with their properties."""
-    jarvis = get_jarvis_savant()
-    if not jarvis:
-        raise HTTPException(status_code=503, detail="JarvisSavantEngine not available")
-
-    return {
-        "triggers": jarvis.triggers,
-        "power_numbers": jarvis.power_numbers,
-        "tesla_numbers": jarvis.tesla_numbers,
-        "timestamp": datetime.now().isoformat()
-    }
-
-
-@router.get("/check-trigger/{value}")
-async def check_trigger(value: str):
-    """
-    Check if a value triggers any JARVIS numbers.
-
-    Supports:
-    - Direct number matches (e.g., 2178)
-    - Gematria reduction of strings (e.g., "Lakers")
-    """
-    jarvis = get_jarvis_savant()
-    if not jarvis:
-        raise HTTPException(status_code=503, detail="JarvisSavantEngine not available")
-
-    # Try to parse as number first
-    try:
-        numeric_value = int(value)
-        return jarvis.check_jarvis_trigger(numeric_value)
-    except ValueError:
-        return jarvis.check_jarvis_trigger(value)
-
-
-@router.get("/confluence/{sport}")
-async def get_confluence_analysis(
-    sport: str,
-    player: str = "Player",
-    team: str = "Team",
-    opponent: str = "Opponent",
-    spread: float = 0,
-    total: float = 220,
-    public_pct: float = 50,
-    research_score: float = 7.0  # v10.1: Allow passing external research score
-):
-    """
-    Calculate v10.1 dual-score confluence analysis for a pick.
-
-    THE HEART - v10.1 Alignment System:
-    - IMMORTAL (+10): 2178 + both ≥7.5 + alignment ≥80%
-    - JARVIS_PERFECT (+7): Trigger + both ≥7.5 + alignment ≥80%
-    - PERFECT (+5): both ≥7.5 + alignment ≥80%
-    - STRONG (+3): Both high OR aligned ≥70%
-    - MODERATE (+1): Aligned ≥60%
-    - DIVERGENT (+0): Models disagree
-
-    Alignment = 1 - |research - esoteric| / 10
-    """
-    sport_lower = sport.lower()
-    if sport_lower not in SPORT_MAPPINGS:
-        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
-
-    jarvis = get_jarvis_savant()
-    vedic = get_vedic_astro()
-    learning = get_esoteric_loop()
-
-    if not jarvis or not vedic:
-        raise HTTPException(status_code=503, detail="Esoteric engines not available")
-
-    esoteric_weights = learning.get_weights()["weights"] if learning else {}
-
-    # Calculate all signals
-    gematria = jarvis.calculate_gematria_signal(player, team, opponent)
-    public_fade = jarvis.calculate_public_fade_signal(public_pct)
-    mid_spread = jarvis.calculate_mid_spread_signal(spread)
-    trap = jarvis.calculate_large_spread_trap(spread, total)
-    astro = vedic.calculate_astro_score()
-
-    # v10.1: Fibonacci alignment and Vortex pattern
-    fib_alignment = jarvis.calculate_fibonacci_alignment(float(spread) if spread else 0)
-    vortex_value = int(abs(spread * 10)) if spread else 0
-    vortex_pattern = jarvis.calculate_vortex_pattern(vortex_value)
-
-    # Check for JARVIS triggers in player/team names
-    game_str = f"{player}{team}{opponent}"
-    trigger_result = jarvis.check_jarvis_trigger(game_str)
-    jarvis_triggered = len(trigger_result.get("triggers_hit", [])) > 0
-    immortal_detected = any(t["number"] == 2178 for t in trigger_result.get("triggers_hit", []))
-
-    # Calculate JARVIS score from triggers
-    jarvis_score = 0.0
-    for trig in trigger_result.get("triggers_hit", []):
-        jarvis_score += trig["boost"] / 5
-    jarvis_score = min(4.0, jarvis_score)
-
-    # v10.1: Calculate esoteric score
-    gematria_contribution = gematria.get("influence", 0) * 0.52 * 2 if gematria.get("triggered") else 0
-    astro_contribution = (astro["overall_score"] - 50) / 50 * esoteric_weights.get("astro", 0.13) * 2
-
-    esoteric_raw = (
-        jarvis_score +
-        gematria_contribution +
-        max(0, astro_contribution) +
-        mid_spread.get("modifier", 0) +
-        fib_alignment.get("modifier", 0) +
-        vortex_pattern.get("modifier", 0) +
-        public_fade.get("influence", 0) +
-        trap.get("modifier", 0)
-    )
-    esoteric_score = max(0, min(10, esoteric_raw * 1.25))
-
-    # v10.1: Calculate dual-score confluence
-    confluence = jarvis.calculate_confluence(
-        research_score=research_score,
-        esoteric_score=esoteric_score,
-        immortal_detected=immortal_detected,
-        jarvis_triggered=jarvis_triggered
-    )
-
-    # v10.1: Calculate final score and bet tier (Option A weights)
-    ai_score = 0.0  # No AI engine inputs in this legacy endpoint
-    jarvis_score_10 = min(10.0, jarvis_score * 2.5)
-    base_score = (
-        (ai_score * ENGINE_WEIGHTS["ai"]) +
-        (research_score * ENGINE_WEIGHTS["research"]) +
-        (esoteric_score * ENGINE_WEIGHTS["esoteric"]) +
-        (jarvis_score_10 * ENGINE_WEIGHTS["jarvis"])
-    )
-    context_modifier = 0.0
-    jason_sim_boost = 0.0
-    final_score, context_modifier = compute_final_score_option_a(
-        base_score=base_score,
-        context_modifier=context_modifier,
-        confluence_boost=confluence.get("boost", 0),
-        msrf_boost=0.0,
-        jason_sim_boost=jason_sim_boost,
-        serp_boost=0.0,
-    )
-    bet_tier = jarvis.determine_bet_tier(final_score, confluence)
-
-    return {
-        "sport": sport.upper(),
-        "version": "v10.1",
-        "input": {
-            "player": player,
-            "team": team,
-            "opponent": opponent,
-            "spread": spread,
-            "total": total,
-            "public_pct": public_pct,
-            "research_score": research_score
-        },
-        "signals": {
-            "gematria": gematria,
-            "public_fade": public_fade,
-            "mid_spread": mid_spread,
-            "trap": trap,
-            "astro": astro,
-            "fibonacci": fib_alignment,
-            "vortex": vortex_pattern
-        },
-        "jarvis_triggers": trigger_result.get("triggers_hit", []),
-        "scoring": {
-            "research_score": round(research_score, 2),
-            "esoteric_score": round(esoteric_score, 2),
-            "final_score": round(final_score, 2),
-            "formula": "FINAL = BASE_4 + context_modifier + confluence_boost + jason_sim_boost (+ msrf/serp if enabled)"
-        },
-        "confluence": confluence,
-        "bet_tier": bet_tier,
-        "timestamp": datetime.now().isoformat()
-    }
-
-
-# ============================================================================
-# PHASE 2: VEDIC/ASTRO ENDPOINTS
 # ============================================================================
-
-@router.get("/astro-status")
-async def get_astro_status():
-    """Get full astrological analysis for current moment."""
-    vedic = get_vedic_astro()
-    if not vedic:
-        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
-
-    return vedic.calculate_astro_score()
-
-
-@router.get("/planetary-hour")
-async def get_planetary_hour():
-    """Get current planetary hour ruler (Chaldean order)."""
-    vedic = get_vedic_astro()
-    if not vedic:
-        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
-
-    return vedic.calculate_planetary_hour()
-
-
-@router.get("/nakshatra")
-async def get_nakshatra():
-    """Get current Nakshatra (lunar mansion)."""
-    vedic = get_vedic_astro()
-    if not vedic:
-        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
-
-    return vedic.calculate_nakshatra()
-
-
-@router.get("/retrograde-status")
-async def get_retrograde_status():
-    """Check retrograde status for Mercury, Venus, and Mars."""
-    vedic = get_vedic_astro()
-    if not vedic:
-        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
-
-    return {
-        "mercury": vedic.is_planet_retrograde("Mercury"),
-        "venus": vedic.is_planet_retrograde("Venus"),
-        "mars": vedic.is_planet_retrograde("Mars"),
-        "timestamp": datetime.now().isoformat()
-    }
-
-
-# ESOTERIC ANALYSIS: Moved to routers/esoteric.py
-
-
+# MOVED to routers/live_dashboard.py
 # ============================================================================
-# CLICK-TO-BET ENHANCEMENTS v2.0 - Moved to routers/betting.py
-# ============================================================================
-# Endpoints moved to routers/betting.py:
-# - GET /user/preferences/{user_id} (user sportsbook preferences)
-# - POST /user/preferences/{user_id} (save preferences)
-# - POST /bets/track (track a placed bet)
-# - POST /bets/grade/{bet_id} (grade a bet)
-# - GET /bets/history (bet history with filters)
-
-# Fallback for quick-betslip endpoint (actual preferences stored in routers/betting.py)
-_user_preferences: Dict[str, Dict[str, Any]] = {}
-
-
-@router.get("/quick-betslip/{sport}/{game_id}")
-async def quick_betslip(
-    sport: str,
-    game_id: str,
-    user_id: Optional[str] = None
-):
-    """
-    Generate a quick betslip for a game with user's preferred sportsbooks prioritized.
-
-    One-click flow for SMASH picks:
-    1. Gets current best odds across all books
-    2. Prioritizes user's favorite books
-    3. Returns ready-to-click betslip with deep links
-    """
-    sport_lower = sport.lower()
-    if sport_lower not in SPORT_MAPPINGS:
-        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
-
-    # Get user preferences
-    user_prefs = _user_preferences.get(user_id, {}) if user_id else {}
-    favorite_books = user_prefs.get("favorite_books", ["draftkings", "fanduel", "betmgm"])
-    default_stake = user_prefs.get("default_bet_amount", 25)
-
-    # Get line shopping data
-    cache_key = f"line-shop:{sport_lower}:{game_id}"
-    cached = api_cache.get(cache_key)
-
-    if cached and "data" in cached:
-        game_data = next((g for g in cached["data"] if g.get("game_id") == game_id), None)
-    else:
-        game_data = None
-
-    if not game_data:
-        # Use fallback
-        game_data = {
-            "game_id": game_id,
-            "home_team": "Home Team",
-            "away_team": "Away Team",
-            "markets": {}
-        }
-
-    # Build quick betslip with prioritized books
-    betslip_options = []
-
-    for book_key in favorite_books:
-        if book_key in SPORTSBOOK_CONFIGS:
-            config = SPORTSBOOK_CONFIGS[book_key]
-            betslip_options.append({
-                "book_key": book_key,
-                "book_name": config["name"],
-                "book_color": config["color"],
-                "book_logo": config.get("logo", ""),
-                "is_favorite": True,
-                "priority": favorite_books.index(book_key) + 1,
-                "deep_link": generate_enhanced_deep_link(book_key, sport_lower, game_id, game_data)
-            })
-
-    # Add remaining books
-    for book_key, config in SPORTSBOOK_CONFIGS.items():
-        if book_key not in favorite_books:
-            betslip_options.append({
-                "book_key": book_key,
-                "book_name": config["name"],
-                "book_color": config["color"],
-                "book_logo": config.get("logo", ""),
-                "is_favorite": False,
-                "priority": 99,
-                "deep_link": generate_enhanced_deep_link(book_key, sport_lower, game_id, game_data)
-            })
-
-    return {
-        "sport": sport.upper(),
-        "game_id": game_id,
-        "game": game_data,
-        "default_stake": default_stake,
-        "sportsbooks": betslip_options,
-        "user_preferences_applied": user_id is not None,
-        "timestamp": datetime.now().isoformat()
-    }
-
-
-# ============================================================================
-# PARLAY BUILDER - Moved to routers/betting.py
-# ============================================================================
-# Endpoints moved to routers/betting.py:
-# - GET /parlay/{user_id} (get parlay slip)
-# - POST /parlay/add (add leg to parlay)
-# - DELETE /parlay/remove/{user_id}/{leg_id} (remove leg)
-# - DELETE /parlay/clear/{user_id} (clear slip)
-# - POST /parlay/place (place parlay bet)
-# - POST /parlay/grade/{parlay_id} (grade parlay)
-# - GET /parlay/history (parlay history)
-# - POST /parlay/calculate (preview calculation)
-
-
-# ============================================================================
-# COMMUNITY FEATURES: Moved to routers/community.py
-# ============================================================================
-
-
-# ============================================================================
-# HELPER FUNCTIONS
-# ============================================================================
-
-def calculate_payout(stake: float, odds: int) -> float:
-    """Calculate potential payout from American odds."""
-    if stake <= 0:
-        return 0
-    if odds > 0:
-        return stake + (stake * odds / 100)
-    else:
-        return stake + (stake * 100 / abs(odds))
-
-
-def generate_enhanced_deep_link(book_key: str, sport: str, game_id: str, game_data: Dict) -> Dict[str, str]:
-    """Generate enhanced deep links with sport-specific URLs."""
-    config = SPORTSBOOK_CONFIGS.get(book_key)
-    if not config:
-        return {"web": "#", "note": "Unknown sportsbook"}
-
-    sport_paths = {
-        "nba": {
-            "draftkings": "basketball/nba",
-            "fanduel": "navigation/nba",
-            "betmgm": "sports/basketball/104/nba",
-            "caesars": "us/nba",
-            "pointsbetus": "sports/basketball/nba",
-            "williamhill_us": "sports/basketball/nba",
-            "barstool": "sports/basketball/nba",
-            "betrivers": "sports/basketball/nba"
-        },
-        "nfl": {
-            "draftkings": "football/nfl",
-            "fanduel": "navigation/nfl",
-            "betmgm": "sports/football/100/nfl",
-            "caesars": "us/nfl",
-            "pointsbetus": "sports/football/nfl",
-            "williamhill_us": "sports/football/nfl",
-            "barstool": "sports/football/nfl",
-            "betrivers": "sports/football/nfl"
-        },
-        "mlb": {
-            "draftkings": "baseball/mlb",
-            "fanduel": "navigation/mlb",
-            "betmgm": "sports/baseball/103/mlb",
-            "caesars": "us/mlb",
-            "pointsbetus": "sports/baseball/mlb",
-            "williamhill_us": "sports/baseball/mlb",
-            "barstool": "sports/baseball/mlb",
-            "betrivers": "sports/baseball/mlb"
-        },
-        "nhl": {
-            "draftkings": "hockey/nhl",
-            "fanduel": "navigation/nhl",
-            "betmgm": "sports/hockey/102/nhl",
-            "caesars": "us/nhl",
-            "pointsbetus": "sports/hockey/nhl",
-            "williamhill_us": "sports/hockey/nhl",
-            "barstool": "sports/hockey/nhl",
-            "betrivers": "sports/hockey/nhl"
-        }
-    }
-
-    sport_path = sport_paths.get(sport, {}).get(book_key, sport)
-
-    home_team = game_data.get("home_team", "").replace(" ", "-").lower()
-    away_team = game_data.get("away_team", "").replace(" ", "-").lower()
-
-    # Build URL with game context when possible
-    base_url = config["web_base"]
-    full_url = f"{base_url}/{sport_path}"
-
-    return {
-        "web": full_url,
-        "app_scheme": config.get("app_scheme", ""),
-        "sport_path": sport_path,
-        "note": f"Opens {config['name']} {sport.upper()} page"
-    }
-
-
-# ============================================================================
-# CONSOLIDATED ENDPOINTS (Server-Side Data Fetching)
-# Reduces client-side waterfalls by combining multiple API calls into one
-# ============================================================================
-
-@router.get("/sport-dashboard/{sport}")
-async def get_sport_dashboard(sport: str, auth: bool = Depends(verify_api_key)):
-    """
-    Consolidated endpoint for sport dashboard page.
-    Replaces 6 separate API calls with a single request.
-
-    Combines: best-bets, splits, lines, props, injuries, sharp
-
-    Response Schema:
-    {
-        "sport": "NBA",
-        "best_bets": { props: [], game_picks: [] },
-        "market_overview": {
-            "lines": [...],
-            "splits": [...],
-            "sharp_signals": [...]
-        },
-        "context": {
-            "injuries": [...],
-            "props": [...]
-        },
-        "daily_energy": {...},
-        "timestamp": "ISO timestamp",
-        "cache_info": { sources: {...} }
-    }
-    """
-    sport_lower = sport.lower()
-    if sport_lower not in SPORT_MAPPINGS:
-        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
-
-    # Check cache first
-    cache_key = f"sport-dashboard:{sport_lower}"
-    cached = api_cache.get(cache_key)
-    if cached:
-        cached["cache_info"] = {"hit": True}
-        return cached
-
-    # Fetch all data in parallel
-    try:
-        results = await asyncio.gather(
-            get_best_bets(sport),
-            get_splits(sport),
-            get_lines(sport),
-            get_injuries(sport),
-            get_sharp_money(sport),
-            return_exceptions=True
-        )
-
-        best_bets, splits, lines, injuries, sharp = results
-
-        # Handle any exceptions gracefully
-        cache_sources = {}
-
-        if isinstance(best_bets, Exception):
-            logger.warning("sport-dashboard: best_bets failed: %s", best_bets)
-            best_bets = {"props": [], "game_picks": []}
-            cache_sources["best_bets"] = "error"
-        else:
-            cache_sources["best_bets"] = best_bets.get("source", "unknown")
-
-        if isinstance(splits, Exception):
-            logger.warning("sport-dashboard: splits failed: %s", splits)
-            splits = {"data": []}
-            cache_sources["splits"] = "error"
-        else:
-            cache_sources["splits"] = splits.get("source", "unknown")
-
-        if isinstance(lines, Exception):
-            logger.warning("sport-dashboard: lines failed: %s", lines)
-            lines = {"data": []}
-            cache_sources["lines"] = "error"
-        else:
-            cache_sources["lines"] = lines.get("source", "unknown")
-
-        if isinstance(injuries, Exception):
-            logger.warning("sport-dashboard: injuries failed: %s", injuries)
-            injuries = {"data": []}
-            cache_sources["injuries"] = "error"
-        else:
-            cache_sources["injuries"] = injuries.get("source", "unknown")
-
-        if isinstance(sharp, Exception):
-            logger.warning("sport-dashboard: sharp failed: %s", sharp)
-            sharp = {"data": []}
-            cache_sources["sharp"] = "error"
-        else:
-            cache_sources["sharp"] = sharp.get("source", "unknown")
-
-        result = {
-            "sport": sport.upper(),
-            "best_bets": {
-                "props": best_bets.get("props", []),
-                "game_picks": best_bets.get("game_picks", [])
-            },
-            "market_overview": {
-                "lines": lines.get("data", []),
-                "splits": splits.get("data", []),
-                "sharp_signals": sharp.get("data", [])
-            },
-            "context": {
-                "injuries": injuries.get("data", [])
-            },
-            "daily_energy": best_bets.get("daily_energy", get_daily_energy()),
-            "timestamp": now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(tz=timezone.utc).isoformat(),
-            "cache_info": {"hit": False, "sources": cache_sources}
-        }
-
-        # Cache for 2 minutes (limited by best-bets TTL)
-        api_cache.set(cache_key, result, ttl=120)
-        return result
-
-    except Exception as e:
-        logger.exception("sport-dashboard failed: %s", e)
-        raise HTTPException(status_code=500, detail=f"Dashboard fetch failed: {str(e)}")
-
-
-@router.get("/game-details/{sport}/{game_id}")
-async def get_game_details(sport: str, game_id: str, auth: bool = Depends(verify_api_key)):
-    """
-    Consolidated endpoint for single game detail view.
-    Replaces 4+ separate API calls with a single request.
-
-    Combines: lines, props (filtered), sharp signals, injuries for specific game
-
-    Response Schema:
-    {
-        "sport": "NBA",
-        "game_id": "abc123",
-        "game": { home_team, away_team, commence_time },
-        "lines": { spreads: [], totals: [], moneylines: [] },
-        "props": [...],
-        "sharp_signals": {...},
-        "injuries": { home: [], away: [] },
-        "ai_pick": {...},
-        "timestamp": "ISO timestamp"
-    }
-    """
-    sport_lower = sport.lower()
-    if sport_lower not in SPORT_MAPPINGS:
-        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
-
-    # Check cache first
-    cache_key = f"game-details:{sport_lower}:{game_id}"
-    cached = api_cache.get(cache_key)
-    if cached:
-        return cached
-
-    # Fetch all data in parallel
-    try:
-        results = await asyncio.gather(
-            get_lines(sport),
-            get_props(sport),
-            get_sharp_money(sport),
-            get_injuries(sport),
-            get_best_bets(sport),
-            return_exceptions=True
-        )
-
-        lines_data, props_data, sharp_data, injuries_data, best_bets_data = results
-
-        # Find specific game in lines
-        game_info = None
-        game_lines = {"spreads": [], "totals": [], "moneylines": []}
-
-        if not isinstance(lines_data, Exception):
-            for game in lines_data.get("data", []):
-                if game.get("game_id") == game_id or game.get("id") == game_id:
-                    game_info = {
-                        "home_team": game.get("home_team"),
-                        "away_team": game.get("away_team"),
-                        "commence_time": game.get("commence_time")
-                    }
-                    game_lines = {
-                        "spreads": game.get("spreads", []),
-                        "totals": game.get("totals", []),
-                        "moneylines": game.get("moneylines", [])
-                    }
-                    break
-
-        # Filter props for this game
-        game_props = []
-        if not isinstance(props_data, Exception):
-            for prop in props_data.get("data", []):
-                if prop.get("game_id") == game_id or prop.get("event_id") == game_id:
-                    game_props.append(prop)
-
-        # Find sharp signal for this game
-        game_sharp = {}
-        if not isinstance(sharp_data, Exception):
-            for signal in sharp_data.get("data", []):
-                if signal.get("game_id") == game_id:
-                    game_sharp = signal
-                    break
-
-        # Filter injuries for this game's teams
-        game_injuries = {"home": [], "away": []}
-        if not isinstance(injuries_data, Exception) and game_info:
-            for inj in injuries_data.get("data", []):
-                team = inj.get("team", "")
-                if team == game_info.get("home_team"):
-                    game_injuries["home"].append(inj)
-                elif team == game_info.get("away_team"):
-                    game_injuries["away"].append(inj)
-
-        # Find AI pick for this game
-        ai_pick = None
-        if not isinstance(best_bets_data, Exception):
-            for pick in best_bets_data.get("game_picks", []):
-                if pick.get("game_id") == game_id:
-                    ai_pick = pick
-                    break
-            # Also check props
-            for prop in best_bets_data.get("props", []):
-                if prop.get("game_id") == game_id or prop.get("event_id") == game_id:
-                    if ai_pick is None:
-                        ai_pick = {"props": [prop]}
-                    elif "props" in ai_pick:
-                        ai_pick["props"].append(prop)
-                    else:
-                        ai_pick["props"] = [prop]
-
-        result = {
-            "sport": sport.upper(),
-            "game_id": game_id,
-            "game": game_info or {"home_team": "Unknown", "away_team": "Unknown"},
-            "lines": game_lines,
-            "props": game_props,
-            "sharp_signals": game_sharp,
-            "injuries": game_injuries,
-            "ai_pick": ai_pick,
-            "timestamp": now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(tz=timezone.utc).isoformat()
-        }
-
-        # Cache for 2 minutes
-        api_cache.set(cache_key, result, ttl=120)
-        return result
-
-    except Exception as e:
-        logger.exception("game-details failed: %s", e)
-        raise HTTPException(status_code=500, detail=f"Game details fetch failed: {str(e)}")
-
-
-@router.get("/parlay-builder-init/{sport}")
-async def get_parlay_builder_init(
-    sport: str,
-    user_id: Optional[str] = None,
-    auth: bool = Depends(verify_api_key)
-):
-    """
-    Consolidated endpoint for parlay builder page initialization.
-    Replaces 3-4 separate API calls with a single request.
-
-    Combines: best-bets (recommended props), props (full market), correlations, user parlay
-
-    Response Schema:
-    {
-        "sport": "NBA",
-        "recommended_props": [...],
-        "all_props": [...],
-        "correlations": {...},
-        "current_parlay": { legs: [], calculated_odds: null },
-        "user_history": { recent_parlays: [] },
-        "timestamp": "ISO timestamp"
-    }
-    """
-    sport_lower = sport.lower()
-    if sport_lower not in SPORT_MAPPINGS:
-        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
-
-    # Check cache first (only cache non-user-specific data)
-    cache_key = f"parlay-builder:{sport_lower}"
-    cached_base = api_cache.get(cache_key)
-
-    # Fetch base data if not cached
-    if not cached_base:
-        try:
-            results = await asyncio.gather(
-                get_best_bets(sport),
-                get_props(sport),
-                return_exceptions=True
-            )
-
-            best_bets_data, props_data = results
-
-            recommended_props = []
-            if not isinstance(best_bets_data, Exception):
-                recommended_props = best_bets_data.get("props", [])
-
-            all_props = []
-            if not isinstance(props_data, Exception):
-                all_props = props_data.get("data", [])
-
-            cached_base = {
-                "recommended_props": recommended_props,
-                "all_props": all_props
-            }
-            api_cache.set(cache_key, cached_base, ttl=180)  # 3 minutes
-
-        except Exception as e:
-            logger.exception("parlay-builder-init fetch failed: %s", e)
-            cached_base = {"recommended_props": [], "all_props": []}
-
-    # Get correlation matrix (static, cached separately)
-    correlations = get_parlay_correlations()
-
-    # Get user-specific data if user_id provided
-    current_parlay = {"legs": [], "calculated_odds": None}
-    user_history = {"recent_parlays": []}
-
-    if user_id:
-        # Get current parlay slip
-        parlay_slip = parlay_slips.get(user_id, {"legs": []})
-        current_parlay = {
-            "legs": parlay_slip.get("legs", []),
-            "calculated_odds": None
-        }
-
-        # Calculate odds if legs exist
-        if current_parlay["legs"]:
-            try:
-                calc_result = calculate_parlay_odds_internal(current_parlay["legs"])
-                current_parlay["calculated_odds"] = calc_result
-            except Exception:
-                pass
-
-        # Get recent parlay history
-        user_parlays = [p for p in parlay_history if p.get("user_id") == user_id]
-        user_history["recent_parlays"] = sorted(
-            user_parlays,
-            key=lambda x: x.get("placed_at", ""),
-            reverse=True
-        )[:5]
-
-    result = {
-        "sport": sport.upper(),
-        "recommended_props": cached_base.get("recommended_props", []),
-        "all_props": cached_base.get("all_props", []),
-        "correlations": correlations,
-        "current_parlay": current_parlay,
-        "user_history": user_history,
-        "timestamp": now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(tz=timezone.utc).isoformat()
-    }
-
-    return result
-
-
-def get_parlay_correlations() -> Dict[str, Any]:
-    """Get static parlay correlation matrix."""
-    return {
-        "same_game": {
-            "QB_WR": 0.88,
-            "QB_TE": 0.75,
-            "RB_DST": -0.45,
-            "WR_WR": 0.35,
-            "QB_RB": 0.25
-        },
-        "cross_game": {
-            "same_position": 0.15,
-            "division_rivalry": 0.10
-        },
-        "warning_threshold": 0.70,
-        "boost_threshold": -0.30
-    }
-
-
-def calculate_parlay_odds_internal(legs: List[Dict]) -> Dict[str, Any]:
-    """Calculate parlay odds from legs (internal helper)."""
-    if not legs:
-        return {"decimal_odds": 1.0, "american_odds": "+100", "implied_probability": 1.0}
-
-    decimal_odds = 1.0
-    for leg in legs:
-        leg_odds = leg.get("odds", -110)
-        if leg_odds > 0:
-            decimal = 1 + (leg_odds / 100)
-        else:
-            decimal = 1 + (100 / abs(leg_odds))
-        decimal_odds *= decimal
-
-    # Convert to American
-    if decimal_odds >= 2.0:
-        american = f"+{int((decimal_odds - 1) * 100)}"
-    else:
-        american = f"-{int(100 / (decimal_odds - 1))}"
-
-    implied_prob = 1 / decimal_odds
-
-    return {
-        "decimal_odds": round(decimal_odds, 3),
-        "american_odds": american,
-        "implied_probability": round(implied_prob, 4),
-        "leg_count": len(legs)
-    }
+# - GET /quick-betslip/{sport}/{game_id}
+# - GET /sport-dashboard/{sport}
+# - GET /game-details/{sport}/{game_id}
+# - GET /parlay-builder-init/{sport}
 
 
 # ============================================================================
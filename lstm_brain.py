@@ -1,7 +1,9 @@
 """
 LSTM Brain - The Neural Core of Bookie-o-em
 ============================================
-Real TensorFlow LSTM inference for sports betting predictions.
+Real LSTM inference for sports betting predictions. Trained weights run
+through the TensorFlow-free lstm_runtime by default (LSTM_RUNTIME=numpy);
+set LSTM_RUNTIME=tensorflow to use Keras for inference.
 
 Input Shape: (15, 6) - 15 game history, 6 context features per game
 Features (aligned with spec):
@@ -15,6 +17,7 @@ Features (aligned with spec):
 Output: Prediction adjustment value for the waterfall
 """
 
+import importlib.util
 import logging
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Union
@@ -27,18 +30,50 @@ os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")  # Suppress TF INFO/WARN/ERRO
 os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")   # Force CPU-only (no GPU probing)
 os.environ.setdefault("XLA_FLAGS", "--xla_gpu_cuda_data_dir=")  # Reduce XLA GPU probing
 
-# TensorFlow import with fallback
+# Inference runtime: "numpy" (default) runs the shipped weights through
+# lstm_runtime without importing TensorFlow; "tensorflow" keeps Keras inference.
+LSTM_RUNTIME = os.getenv("LSTM_RUNTIME", "numpy").lower()
+
 try:
-    import tensorflow as tf
-    tf.get_logger().setLevel('ERROR')  # Additional Python-level suppression
-    from tensorflow.keras.models import Sequential, load_model
-    from tensorflow.keras.layers import LSTM, Dense, Dropout, BatchNormalization, Bidirectional
-    from tensorflow.keras.optimizers import Adam
-    from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
-    TF_AVAILABLE = True
+    from lstm_runtime import NumpyLSTMModel
+    NUMPY_RUNTIME_AVAILABLE = True
 except ImportError:
-    TF_AVAILABLE = False
-    logger.warning("TensorFlow not available - using numpy fallback")
+    NUMPY_RUNTIME_AVAILABLE = False
+
+
+def _import_tensorflow() -> bool:
+    """Import TensorFlow/Keras into module globals. Returns availability."""
+    global tf, Sequential, load_model, LSTM, Dense, Dropout, BatchNormalization, Bidirectional
+    global Adam, EarlyStopping, ModelCheckpoint
+    try:
+        import tensorflow as tf
+        tf.get_logger().setLevel('ERROR')  # Additional Python-level suppression
+        from tensorflow.keras.models import Sequential, load_model
+        from tensorflow.keras.layers import LSTM, Dense, Dropout, BatchNormalization, Bidirectional
+        from tensorflow.keras.optimizers import Adam
+        from tensorflow.keras.callbacks import EarlyStopping, ModelCheckpoint
+        return True
+    except ImportError:
+        return False
+
+
+# TensorFlow import with fallback. With the numpy runtime TF is only imported
+# when something needs a Keras model (training, or no weights file to load).
+if LSTM_RUNTIME == "tensorflow":
+    TF_AVAILABLE = _import_tensorflow()
+else:
+    TF_AVAILABLE = importlib.util.find_spec("tensorflow") is not None
+_TF_IMPORTED = LSTM_RUNTIME == "tensorflow" and TF_AVAILABLE
+if not TF_AVAILABLE:
+    logger.warning("TensorFlow not available - using numpy runtime/fallback")
+
+
+def _ensure_tensorflow() -> bool:
+    """Lazily import TensorFlow the first time a Keras model is needed."""
+    global _TF_IMPORTED, TF_AVAILABLE
+    if not _TF_IMPORTED and TF_AVAILABLE:
+        TF_AVAILABLE = _TF_IMPORTED = _import_tensorflow()
+    return TF_AVAILABLE
 
 
 class LSTMBrain:
@@ -87,10 +122,21 @@ class LSTMBrain:
         """
         self.sport = sport.upper()
         self.model = None
+        self.runtime = None  # NumpyLSTMModel when the numpy runtime is active
         self.model_path = model_path
         self.is_trained = False
         
-        if TF_AVAILABLE:
+        if (LSTM_RUNTIME != "tensorflow" and NUMPY_RUNTIME_AVAILABLE
+                and model_path and os.path.exists(model_path)):
+            try:
+                self.runtime = NumpyLSTMModel.load(model_path)
+                self.is_trained = True
+                logger.info("LSTM Brain (%s) loaded %s into numpy runtime", sport, model_path)
+                return
+            except Exception as e:
+                logger.warning("Numpy runtime could not load %s: %s", model_path, e)
+        
+        if _ensure_tensorflow():
             self._build_model()
             if model_path and os.path.exists(model_path):
                 self._load_weights(model_path)
@@ -99,7 +145,7 @@ class LSTMBrain:
     
     def _build_model(self) -> None:
         """Build the LSTM architecture."""
-        if not TF_AVAILABLE:
+        if not _ensure_tensorflow():
             return
             
         self.model = Sequential([
@@ -271,6 +317,9 @@ class LSTMBrain:
         if sequence.shape[1:] != self.INPUT_SHAPE:
             raise ValueError(f"Expected shape (batch, 15, 6), got {sequence.shape}")
         
+        if self.runtime is not None:
+            return self._runtime_result(float(self.runtime.predict(sequence)[0]), scale_factor)
+        
         if TF_AVAILABLE and self.model is not None:
             # Real TensorFlow inference
             raw_output = self.model.predict(sequence, verbose=0)
@@ -290,6 +339,40 @@ class LSTMBrain:
             # Numpy fallback - weighted feature analysis
             return self._numpy_fallback_predict(sequence, scale_factor)
     
+    def predict_batch(
+        self,
+        sequences: np.ndarray,
+        scale_factor: float = 5.0
+    ) -> List[Dict]:
+        """
+        Run inference on a (batch, 15, 6) array in a single forward pass.
+        
+        Returns one result dict per row, same shape as predict().
+        """
+        sequences = np.asarray(sequences, dtype=np.float32)
+        if sequences.ndim == 2:
+            sequences = np.expand_dims(sequences, axis=0)
+        if sequences.shape[1:] != self.INPUT_SHAPE:
+            raise ValueError(f"Expected shape (batch, 15, 6), got {sequences.shape}")
+        
+        if self.runtime is not None:
+            raw = self.runtime.predict(sequences)
+        elif TF_AVAILABLE and self.model is not None:
+            raw = self.model.predict(sequences, verbose=0)[:, 0]
+        else:
+            return [self._numpy_fallback_predict(seq[np.newaxis], scale_factor) for seq in sequences]
+        return [self._runtime_result(float(r), scale_factor) for r in raw]
+    
+    def _runtime_result(self, raw: float, scale_factor: float) -> Dict:
+        """Result dict for a raw tanh output from the trained network."""
+        return {
+            "adjustment": round(raw * scale_factor, 2),
+            "raw_output": raw,
+            "confidence": round(min(abs(raw) * 100, 100), 1),
+            "method": "numpy_lstm" if self.runtime is not None else "tensorflow_lstm",
+            "is_trained": self.is_trained
+        }
+    
     def _numpy_fallback_predict(
         self, 
         sequence: np.ndarray, 
@@ -371,8 +454,12 @@ class LSTMBrain:
         Returns:
             Training history dict
         """
-        if not TF_AVAILABLE:
+        if not _ensure_tensorflow():
             return {"error": "TensorFlow not available"}
+        if self.model is None:
+            self._build_model()
+            if self.model_path and os.path.exists(self.model_path):
+                self._load_weights(self.model_path)
         
         callbacks = [
             EarlyStopping(
@@ -402,6 +489,7 @@ class LSTMBrain:
         )
         
         self.is_trained = True
+        self.runtime = None  # Freshly trained Keras weights supersede the loaded arrays
         
         return {
             "final_loss": float(history.history['loss'][-1]),
@@ -487,9 +575,10 @@ class MultiSportLSTMBrain:
         """Get status of all sport models."""
         return {
             sport: {
-                "initialized": brain.model is not None or not TF_AVAILABLE,
+                "initialized": brain.model is not None or brain.runtime is not None or not TF_AVAILABLE,
                 "is_trained": brain.is_trained,
-                "method": "tensorflow_lstm" if TF_AVAILABLE and brain.model else "numpy_fallback"
+                "method": ("numpy_lstm" if brain.runtime is not None
+                           else "tensorflow_lstm" if TF_AVAILABLE and brain.model else "numpy_fallback")
             }
             for sport, brain in self.brains.items()
         }
@@ -0,0 +1,228 @@
+"""
+LSTM Runtime - TensorFlow-free inference for the shipped prop models
+=====================================================================
+Loads the Keras 3 `models/lstm_*.weights.h5` files (or a converted `.npz`)
+into plain NumPy arrays and runs the LSTMBrain forward pass in vectorized
+NumPy. Output matches Keras inference (dropout off, BatchNorm on moving
+statistics) for the architecture built in LSTMBrain._build_model:
+
+    Bidirectional(LSTM(64, return_sequences=True))  -> BatchNormalization
+    Bidirectional(LSTM(32))                         -> BatchNormalization
+    Dense(32, relu) -> Dense(16, relu) -> Dense(1, tanh)
+
+Keras conventions reproduced here:
+- LSTM kernel columns are gate-ordered [i, f, c, o]; recurrent activation is
+  sigmoid, cell/output activation tanh.
+- Bidirectional merge is concat([forward, backward]); with return_sequences
+  the backward outputs are flipped back to forward time order.
+- BatchNormalization vars are [gamma, beta, moving_mean, moving_variance]
+  with epsilon=1e-3.
+
+Usage:
+    from lstm_runtime import NumpyLSTMModel
+    model = NumpyLSTMModel.load("models/lstm_nba_points.weights.h5")
+    raw = model.predict(batch)          # (batch, 15, 6) -> (batch,)
+
+Convert every .weights.h5 to .npz (drops the h5py dependency at runtime):
+    python lstm_runtime.py models/
+"""
+
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h5py
+    H5PY_AVAILABLE = True
+except ImportError:
+    H5PY_AVAILABLE = False
+
+# Keras BatchNormalization default
+BN_EPSILON = 1e-3
+
+# Layer groups in the saved weights file, in forward order
+_LSTM_LAYERS = ("bidirectional", "bidirectional_1")
+_BN_LAYERS = ("batch_normalization", "batch_normalization_1")
+_DENSE_LAYERS = ("dense", "dense_1", "dense_2")
+
+
+# ============================================
+# WEIGHT LOADING
+# ============================================
+
+def read_keras_weights(path: str) -> Dict[str, np.ndarray]:
+    """
+    Read a Keras 3 `.weights.h5` file into a flat {name: array} dict.
+
+    Names are the HDF5 paths under `layers/` with the `vars/` segment
+    dropped, e.g. "bidirectional/forward_layer/cell/0" or "dense_2/1".
+    Optimizer slots are ignored.
+    """
+    if not H5PY_AVAILABLE:
+        raise ImportError("h5py is required to read .weights.h5 files (or convert them to .npz)")
+
+    weights: Dict[str, np.ndarray] = {}
+
+    def _visit(name, obj):
+        if isinstance(obj, h5py.Dataset):
+            weights[name.replace("/vars/", "/")] = np.asarray(obj[()], dtype=np.float32)
+
+    with h5py.File(path, "r") as f:
+        if "layers" not in f:
+            raise ValueError(f"Not a Keras 3 weights file (no 'layers' group): {path}")
+        f["layers"].visititems(_visit)
+    return weights
+
+
+def npz_path_for(h5_path: str) -> str:
+    """Sibling `.npz` path for a `.weights.h5` file."""
+    base = h5_path[:-len(".weights.h5")] if h5_path.endswith(".weights.h5") else os.path.splitext(h5_path)[0]
+    return base + ".weights.npz"
+
+
+def convert_to_npz(h5_path: str, npz_path: Optional[str] = None) -> str:
+    """Export a `.weights.h5` file to `.npz` for h5py-free loading."""
+    npz_path = npz_path or npz_path_for(h5_path)
+    np.savez(npz_path, **read_keras_weights(h5_path))
+    return npz_path
+
+
+def load_weights(path: str) -> Dict[str, np.ndarray]:
+    """
+    Load weights from `.npz` or `.weights.h5`.
+
+    A sibling `.npz` at least as new as the `.h5` is preferred, so a converted
+    file can be shipped alongside the original without code changes.
+    """
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            return {k: data[k].astype(np.float32) for k in data.files}
+    npz = npz_path_for(path)
+    if os.path.exists(npz) and (not os.path.exists(path) or os.path.getmtime(npz) >= os.path.getmtime(path)):
+        return load_weights(npz)
+    return read_keras_weights(path)
+
+
+# ============================================
+# FORWARD PASS
+# ============================================
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def lstm_forward(
+    x: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    bias: np.ndarray,
+    reverse: bool = False,
+    return_sequences: bool = False,
+) -> np.ndarray:
+    """
+    Keras LSTM over a batch.
+
+    Args:
+        x: (batch, timesteps, features)
+        kernel: (features, 4*units); recurrent_kernel: (units, 4*units); bias: (4*units,)
+        reverse: process timesteps last-to-first (go_backwards)
+        return_sequences: return (batch, timesteps, units) in processing order,
+            else the final hidden state (batch, units)
+    """
+    batch, steps, _ = x.shape
+    units = recurrent_kernel.shape[0]
+    # Input projection for every timestep in one matmul
+    x_proj = x @ kernel + bias
+    h = np.zeros((batch, units), dtype=x.dtype)
+    c = np.zeros((batch, units), dtype=x.dtype)
+    outputs = np.empty((batch, steps, units), dtype=x.dtype) if return_sequences else None
+
+    order = range(steps - 1, -1, -1) if reverse else range(steps)
+    for i, t in enumerate(order):
+        z = x_proj[:, t] + h @ recurrent_kernel
+        gate_i = _sigmoid(z[:, :units])
+        gate_f = _sigmoid(z[:, units:2 * units])
+        cand = np.tanh(z[:, 2 * units:3 * units])
+        gate_o = _sigmoid(z[:, 3 * units:])
+        c = gate_f * c + gate_i * cand
+        h = gate_o * np.tanh(c)
+        if outputs is not None:
+            outputs[:, i] = h
+    return outputs if outputs is not None else h
+
+
+def bidirectional_forward(x: np.ndarray, fwd: List[np.ndarray], bwd: List[np.ndarray],
+                          return_sequences: bool) -> np.ndarray:
+    """Keras Bidirectional(LSTM) with merge_mode='concat'."""
+    y_fwd = lstm_forward(x, *fwd, reverse=False, return_sequences=return_sequences)
+    y_bwd = lstm_forward(x, *bwd, reverse=True, return_sequences=return_sequences)
+    if return_sequences:
+        # Backward outputs come out last-to-first; realign to forward time
+        y_bwd = y_bwd[:, ::-1]
+    return np.concatenate([y_fwd, y_bwd], axis=-1)
+
+
+class NumpyLSTMModel:
+    """
+    Inference-only LSTMBrain network backed by NumPy arrays.
+
+    BatchNormalization is folded into a per-channel scale/shift at load time.
+    """
+
+    def __init__(self, weights: Dict[str, np.ndarray], source: Optional[str] = None):
+        self.source = source
+        self.lstm = []
+        for name in _LSTM_LAYERS:
+            self.lstm.append((
+                [weights[f"{name}/forward_layer/cell/{i}"] for i in range(3)],
+                [weights[f"{name}/backward_layer/cell/{i}"] for i in range(3)],
+            ))
+        self.bn = []
+        for name in _BN_LAYERS:
+            gamma, beta, mean, var = (weights[f"{name}/{i}"] for i in range(4))
+            scale = gamma / np.sqrt(var + BN_EPSILON)
+            self.bn.append((scale.astype(np.float32), (beta - mean * scale).astype(np.float32)))
+        self.dense = [(weights[f"{name}/0"], weights[f"{name}/1"]) for name in _DENSE_LAYERS]
+        self.input_features = self.lstm[0][0][0].shape[0]
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyLSTMModel":
+        return cls(load_weights(path), source=path)
+
+    def predict(self, sequences: np.ndarray) -> np.ndarray:
+        """
+        Raw tanh outputs in [-1, 1].
+
+        Args:
+            sequences: (timesteps, features) or (batch, timesteps, features)
+
+        Returns:
+            (batch,) float array
+        """
+        x = np.asarray(sequences, dtype=np.float32)
+        if x.ndim == 2:
+            x = x[np.newaxis]
+        if x.ndim != 3 or x.shape[2] != self.input_features:
+            raise ValueError(f"Expected (batch, timesteps, {self.input_features}), got {x.shape}")
+
+        (fwd1, bwd1), (fwd2, bwd2) = self.lstm
+        (s1, b1), (s2, b2) = self.bn
+        x = bidirectional_forward(x, fwd1, bwd1, return_sequences=True) * s1 + b1
+        x = bidirectional_forward(x, fwd2, bwd2, return_sequences=False) * s2 + b2
+        (w1, c1), (w2, c2), (w3, c3) = self.dense
+        x = np.maximum(x @ w1 + c1, 0.0)
+        x = np.maximum(x @ w2 + c2, 0.0)
+        return np.tanh(x @ w3 + c3)[:, 0]
+
+
+if __name__ == "__main__":
+    models_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "models")
+    for fname in sorted(os.listdir(models_dir)):
+        if fname.endswith(".weights.h5"):
+            out = convert_to_npz(os.path.join(models_dir, fname))
+            print(f"{fname} -> {os.path.basename(out)}")
@@ -16,25 +16,26 @@ Features:
 Total: 18 esoteric modules
 """
 
+# v20.30: First import, so the startup report (and optional import profiler) sees everything
+from core.startup import FAST_STARTUP, STARTUP_BUDGET_SECONDS, get_startup_report
+
+_startup = get_startup_report()
+
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import uvicorn
 import os as _os
+import sys as _sys
 import logging
 import time
 
 from fastapi.responses import Response, JSONResponse, HTMLResponse
 from fastapi import Request
-from live_data_router import router as live_router, close_shared_client
-from streaming_router import router as streaming_router
-from routers import community_router, esoteric_router, line_shop_router, betting_router, debug_router, grader_router
 from collections import defaultdict
 from datetime import datetime, timezone
 import database
-from daily_scheduler import scheduler_router, init_scheduler, get_scheduler
-from trap_router import trap_router
-from auto_grader import get_grader
 from data_dir import ensure_dirs, DATA_DIR
 from metrics import get_metrics_response, get_metrics_status, PROMETHEUS_AVAILABLE
 import grader_store
@@ -60,6 +61,105 @@ configure_structured_logging()
 _logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# HEAVY SUBSYSTEMS (imported eagerly, or after bind with FAST_STARTUP=true)
+# =============================================================================
+
+# (module, router attribute, prefix) in registration order
+HEAVY_ROUTERS = (
+    ("live_data_router", "router", None),  # Best-bets, sharp, splits, lines, props, in-game
+    ("routers.live_ops", "router", None),  # v20.30: /live health, cache & API usage
+    ("routers.live_picks", "router", None),  # v20.30: /live picks, results & grading
+    ("routers.live_astro", "router", None),  # v20.30: /live Jarvis triggers & confluence core
+    ("routers.live_dashboard", "router", None),  # v20.30: /live dashboards & parlay builder
+    ("routers.community", "router", "/live"),  # Community voting & affiliate links
+    ("routers.esoteric", "router", "/live"),  # Esoteric analysis & debug endpoints
+    ("routers.line_shop", "router", "/live"),  # Line shopping & betslip generation
+    ("routers.betting", "router", "/live"),  # User betting, tracking, parlays
+    ("routers.debug", "router", "/live"),  # Debug & diagnostic endpoints
+    ("routers.grader", "router", "/live"),  # Grader & picks management endpoints
+    ("routers.jobs", "router", "/live"),  # v20.30: Background job status & results
+    ("daily_scheduler", "scheduler_router", None),
+    ("trap_router", "trap_router", None),  # v19.0: Trap Learning Loop
+    ("streaming_router", "router", None),  # v20.0 Phase 9 - Real-time streaming
+)
+HEAVY_MODULES = tuple(dict.fromkeys(module for module, _, _ in HEAVY_ROUTERS)) + ("auto_grader",)
+
+
+def get_grader():
+    """Auto-grader singleton (auto_grader is imported on first use)."""
+    from auto_grader import get_grader as _get_grader
+    return _get_grader()
+
+
+def get_scheduler():
+    """Daily scheduler, or None while heavy subsystems are still loading (never imports them)."""
+    if not _startup.is_loaded("daily_scheduler"):
+        return None
+    return _sys.modules["daily_scheduler"].get_scheduler()
+
+
+def get_scheduler_summary() -> dict:
+    """v20.30: Scheduler health across processes (local scheduler or the lease holder)."""
+    if not _startup.is_loaded("daily_scheduler"):
+        return {"running": False, "local": False, "leader": None, "loading": True}
+    from core.scheduler_worker import scheduler_summary
+    return scheduler_summary()
+
+
+def _heavy_loaded() -> bool:
+    return _startup.is_loaded("live_data_router")
+
+
+def _start_background_services(app: FastAPI) -> None:
+    """Scheduler, model preload and cache warming (needs the heavy subsystems imported)."""
+    from core.scheduler_worker import (
+        ModelUpdateWatcher, get_worker_role, role_runs_scheduler, start_scheduler_leadership,
+    )
+
+    # v20.30: The scheduler runs only in the process holding the scheduler lease.
+    # WORKER_ROLE=api leaves it to `python -m daily_scheduler --worker`.
+    # CRITICAL: Pass grader so scheduler can adjust weights on audit
+    if role_runs_scheduler():
+        start_scheduler_leadership(auto_grader=get_grader())
+    else:
+        _logger.info("✓ WORKER_ROLE=%s: scheduler runs in the worker process", get_worker_role())
+
+    # Hot-swap models retrained by whichever process leads the scheduler
+    app.state.model_watcher = ModelUpdateWatcher().start()
+
+    # Preload + warm every ML model off the event loop (first request pays nothing)
+    from model_registry import get_model_registry, MODEL_PRELOAD_ENABLED
+    if MODEL_PRELOAD_ENABLED:
+        app.state.model_preload_task = asyncio.create_task(get_model_registry().preload_async())
+        _logger.info("✓ Model preload started in background")
+
+    # Parlay history correlations read the whole grader store; build them off the loop
+    from core.parlay_pricing import refresh_history_correlations
+    app.state.parlay_history_task = asyncio.create_task(asyncio.to_thread(refresh_history_correlations))
+
+    # Refresh-ahead best-bets warming (re-warms active sports before their cache expires)
+    from cache_warmer import WARM_REFRESH_AHEAD_ENABLED, get_best_bets_warmer
+    if WARM_REFRESH_AHEAD_ENABLED:
+        app.state.warm_task = asyncio.create_task(get_best_bets_warmer().run_forever())
+        _logger.info("✓ Best-bets refresh-ahead warming started")
+
+
+async def _load_heavy_subsystems(app: FastAPI) -> None:
+    """FAST_STARTUP: import heavy modules off the event loop, then register and start them."""
+    try:
+        with _startup.phase("import_heavy"):
+            await asyncio.to_thread(_startup.import_modules, HEAVY_MODULES)
+        with _startup.phase("include_heavy_routers"):
+            _include_heavy_routers(app)
+        with _startup.phase("background_services"):
+            _start_background_services(app)
+        _startup.mark_ready()
+    except Exception as e:
+        _startup.mark_failed(e)
+        _logger.exception("FATAL: heavy subsystem load failed: %s", e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -74,7 +174,8 @@ async def lifespan(app: FastAPI):
     _logger.info("=" * 60)
 
     try:
-        ensure_persistent_storage_ready()
+        with _startup.phase("storage_validation"):
+            ensure_persistent_storage_ready()
         _logger.info("✓ Storage validation PASSED")
     except Exception as e:
         _logger.error("FATAL: Storage validation FAILED: %s", e)
@@ -82,27 +183,43 @@ async def lifespan(app: FastAPI):
         raise
 
     # Initialize database and directories
-    ensure_dirs()
-    database.init_database()
-
-    # Initialize and start daily scheduler with auto_grader connection
-    # CRITICAL: Pass grader so scheduler can adjust weights on audit
-    grader = get_grader()
-    scheduler = init_scheduler(auto_grader=grader)
-    scheduler.start()
+    with _startup.phase("database"):
+        ensure_dirs()
+        database.init_database()
 
     # v20.21: Mark service started for integration uptime tracking
     from integration_registry import mark_service_started
     mark_service_started()
     _logger.info("✓ Service start time recorded for integration tracking")
 
+    if FAST_STARTUP:
+        # Bind now; heavy routers, scheduler and warmers come up in the background
+        app.state.heavy_load_task = asyncio.create_task(_load_heavy_subsystems(app))
+        _logger.info("✓ FAST_STARTUP: heavy subsystems loading in background")
+    else:
+        with _startup.phase("background_services"):
+            _start_background_services(app)
+        _startup.mark_ready()
+    if _startup.ready and _startup.ready_after_s > STARTUP_BUDGET_SECONDS:
+        _logger.warning("Startup took %.2fs (budget %.2fs)", _startup.ready_after_s, STARTUP_BUDGET_SECONDS)
+
     yield  # App runs here
 
     # ========== SHUTDOWN ==========
+    if getattr(app.state, "heavy_load_task", None):
+        app.state.heavy_load_task.cancel()
+    if getattr(app.state, "warm_task", None):
+        app.state.warm_task.cancel()
+    from core.live_http import close_shared_client
     await close_shared_client()
-    scheduler = get_scheduler()
-    if scheduler:
-        scheduler.stop()
+    from core.scoring_offload import shutdown_scoring_pool
+    shutdown_scoring_pool(wait=False)
+    if getattr(app.state, "model_watcher", None):
+        app.state.model_watcher.stop()
+    if _startup.is_loaded("daily_scheduler"):
+        # Stops the local scheduler and releases the lease so a standby takes over at once
+        from core.scheduler_worker import stop_scheduler_leadership
+        stop_scheduler_leadership()
 
 
 app = FastAPI(
@@ -120,7 +237,12 @@ async def _live_no_store_headers(request: Request, call_next):
         response.headers.setdefault("Cache-Control", "no-store, no-cache, must-revalidate, max-age=0, private")
         response.headers.setdefault("Pragma", "no-cache")
         response.headers.setdefault("Expires", "0")
-        response.headers.setdefault("Vary", "Origin, X-API-Key, Authorization")
+        # Keep route-supplied Vary (e.g. Accept-Encoding on pre-serialized bodies)
+        vary = response.headers.get("Vary")
+        if not vary:
+            response.headers["Vary"] = "Origin, X-API-Key, Authorization"
+        elif "origin" not in vary.lower():
+            response.headers["Vary"] = f"Origin, X-API-Key, Authorization, {vary}"
     return response
 
 # CORS - Allow all origins for development
@@ -130,6 +252,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # Pollers read it back for If-None-Match
 )
 
 # v20.21: Request correlation middleware for distributed tracing
@@ -157,17 +280,48 @@ def _require_admin(x_admin_token: str = Header(None, alias="X-Admin-Token")):
 def alert_status():
     return {"ok": True}
 
-# Include routers
-app.include_router(live_router)
-app.include_router(community_router, prefix="/live")  # Community voting & affiliate links
-app.include_router(esoteric_router, prefix="/live")  # Esoteric analysis & debug endpoints
-app.include_router(line_shop_router, prefix="/live")  # Line shopping & betslip generation
-app.include_router(betting_router, prefix="/live")  # User betting, tracking, parlays
-app.include_router(debug_router, prefix="/live")  # Debug & diagnostic endpoints
-app.include_router(grader_router, prefix="/live")  # Grader & picks management endpoints
-app.include_router(scheduler_router)
-app.include_router(trap_router)  # v19.0: Trap Learning Loop
-app.include_router(streaming_router)  # v20.0 Phase 9 - Real-time streaming
+# Include routers. Heavy routers keep this position in the route table even when
+# FAST_STARTUP registers them after bind, so route precedence never changes.
+_HEAVY_ROUTES_AT = len(app.router.routes)
+
+
+def _include_heavy_routers(app: FastAPI) -> None:
+    before = len(app.router.routes)
+    for module_name, attr, prefix in HEAVY_ROUTERS:
+        router = getattr(_startup.import_module(module_name), attr)
+        if prefix:
+            app.include_router(router, prefix=prefix)
+        else:
+            app.include_router(router)
+    added = app.router.routes[before:]
+    del app.router.routes[before:]
+    app.router.routes[_HEAVY_ROUTES_AT:_HEAVY_ROUTES_AT] = added
+    app.openapi_schema = None  # rebuild /openapi.json with the new routes
+
+
+if FAST_STARTUP:
+    from starlette.routing import Match
+
+    @app.middleware("http")
+    async def _warming_up_gate(request: Request, call_next):
+        """Until heavy routers are registered, answer their paths with 503 + Retry-After."""
+        if not _startup.ready and request.scope["type"] == "http":
+            if not any(route.matches(request.scope)[0] == Match.FULL for route in app.router.routes):
+                if _startup.error:
+                    return JSONResponse(
+                        status_code=503,
+                        content={"status": "startup_failed", "detail": "Heavy subsystems failed to load",
+                                 "error": _startup.error},
+                    )
+                return JSONResponse(
+                    status_code=503,
+                    content={"status": "warming_up", "detail": "Service is starting, retry shortly"},
+                    headers={"Retry-After": "5"},
+                )
+        return await call_next(request)
+else:
+    with _startup.phase("import_heavy"):
+        _include_heavy_routers(app)
 
 # Root endpoint
 @app.get("/")
@@ -221,31 +375,51 @@ async def health():
         db_status = {"enabled": False, "configured": False, "error": str(e)}
         degraded_reasons.append("database_status_exception")
 
+    # v20.30 FAST_STARTUP: a failed background load never becomes ready; fail health checks
+    if _startup.error:
+        errors.append("heavy_subsystems_failed")
+
     # Redis cache
-    try:
-        from live_data_router import api_cache
-        if api_cache:
-            cache_status = api_cache.stats()
-            redis_ok = cache_status.get("redis_connected", False)
-        else:
-            cache_status = {"redis_connected": False}
-            redis_ok = False
-        if not redis_ok:
-            degraded_reasons.append("redis_not_connected")
-    except Exception as e:
-        cache_status = {"redis_connected": False, "error": str(e)}
-        degraded_reasons.append("redis_status_exception")
+    if not _heavy_loaded():
+        # v20.30 FAST_STARTUP: health probes don't open the Redis connection during warm-up
+        cache_status = {"redis_connected": False, "loading": not _startup.error}
+        if not _startup.error:
+            degraded_reasons.append("heavy_subsystems_loading")
+    else:
+        try:
+            from core.hybrid_cache import api_cache
+            if api_cache:
+                cache_status = api_cache.stats()
+                redis_ok = cache_status.get("redis_connected", False)
+            else:
+                cache_status = {"redis_connected": False}
+                redis_ok = False
+            if not redis_ok:
+                degraded_reasons.append("redis_not_connected")
+        except Exception as e:
+            cache_status = {"redis_connected": False, "error": str(e)}
+            degraded_reasons.append("redis_status_exception")
 
     # Scheduler
     try:
-        sched = get_scheduler()
-        scheduler_ok = sched is not None and sched.running
+        scheduler_summary = get_scheduler_summary()
+        scheduler_ok = scheduler_summary["running"]
         if not scheduler_ok:
             degraded_reasons.append("scheduler_not_running")
     except Exception as e:
         scheduler_ok = False
+        scheduler_summary = {}
         degraded_reasons.append(f"scheduler_exception:{e}")
 
+    # ML model registry (preload runs in background after startup)
+    try:
+        from model_registry import get_model_registry, MODEL_PRELOAD_ENABLED
+        models_status = get_model_registry().status()
+        if MODEL_PRELOAD_ENABLED and not models_status["ready"]:
+            degraded_reasons.append("models_preloading")
+    except Exception as e:
+        models_status = {"ready": False, "error": str(e)}
+
     # Integrations (env-only check; no external probes)
     try:
         integrations_summary = get_integrations_summary()
@@ -282,7 +456,7 @@ async def health():
         status = "healthy"
         overall_ok = True
 
-    return {
+    body = {
         "status": status,
         "ok": overall_ok,
         "version": "20.25",
@@ -293,13 +467,19 @@ async def health():
         "database_status": db_status,
         "storage": storage_health,
         "redis": cache_status,
-        "scheduler": {"running": scheduler_ok},
+        "scheduler": {"running": scheduler_ok, "role": scheduler_summary.get("role"), "local": scheduler_summary.get("local")},
+        "models": models_status,
         "integrations": integrations_summary,
         "integrations_health": integrations_health,
         "errors": errors,
         "degraded_reasons": degraded_reasons,
         "timestamp_utc": datetime.now(tz=timezone.utc).isoformat(),
     }
+    if _startup.error:
+        # Non-2xx so deploy health checks fail instead of routing to an instance that 503s forever
+        body["startup_error"] = _startup.error
+        return JSONResponse(status_code=503, content=body)
+    return body
 
 
 # =============================================================================
@@ -382,21 +562,23 @@ async def public_status(request: Request):
     except Exception:
         checks["database"] = False
 
-    # 3. Redis check (from live_data_router cache)
+    # 3. Redis check (shared api_cache; not connected while FAST_STARTUP is loading)
     try:
-        from live_data_router import api_cache
-        if api_cache:
-            cache_status = api_cache.stats()
-            checks["redis"] = cache_status.get("redis_connected", False)
-        else:
+        if not _heavy_loaded():
             checks["redis"] = False
+        else:
+            from core.hybrid_cache import api_cache
+            if api_cache:
+                cache_status = api_cache.stats()
+                checks["redis"] = cache_status.get("redis_connected", False)
+            else:
+                checks["redis"] = False
     except Exception:
         checks["redis"] = False
 
     # 4. Scheduler check
     try:
-        sched = get_scheduler()
-        checks["scheduler"] = sched is not None and sched.running
+        checks["scheduler"] = get_scheduler_summary()["running"]
     except Exception:
         checks["scheduler"] = False
 
@@ -656,15 +838,10 @@ async def grader_bias(sport: str, stat_type: str = "all", days_back: int = 1):
 # Public run-audit endpoint (no auth required)
 @app.post("/grader/run-audit")
 async def grader_run_audit():
-    """Run the daily audit to analyze bias and adjust weights (public, no auth required)."""
+    """Queue the daily audit to analyze bias and adjust weights (public, no auth required)."""
     try:
-        grader = get_grader()
-        results = grader.run_daily_audit()
-        return {
-            "audit": "complete",
-            "results": results,
-            "timestamp": datetime.now().isoformat()
-        }
+        from core.heavy_jobs import JOB_GRADER_RUN_AUDIT, enqueue_heavy_job
+        return enqueue_heavy_job(JOB_GRADER_RUN_AUDIT, {"days_back": 1})
     except Exception as e:
         return {"error": str(e)}
 
@@ -750,6 +927,12 @@ async def metrics():
 async def metrics_status():
     return get_metrics_status()
 
+
+# v20.30: Startup phases, heavy-import timings and (STARTUP_IMPORT_PROFILE=true) per-module import times
+@app.get("/debug/startup", dependencies=[Depends(_require_admin)])
+async def debug_startup(top_n: int = 30):
+    return _startup.to_dict(top_n=max(1, min(top_n, 200)))
+
 # Esoteric today energy (frontend expects this at /esoteric/today-energy)
 @app.get("/esoteric/today-energy")
 async def esoteric_today_energy():
@@ -1497,7 +1680,7 @@ async def ops_cache_status():
     """Per-sport cache status for best-bets pre-warm verification."""
     import time as _time
     try:
-        from live_data_router import api_cache
+        from core.hybrid_cache import api_cache
         sports = ["nba", "nhl", "ncaab", "nfl", "mlb"]
         result = {}
         for sport in sports:
@@ -1647,17 +1830,17 @@ async def ops_integrations():
 # =============================================================================
 # OPS ENDPOINTS — Autograder visibility (v15.1)
 # =============================================================================
-_last_grade_run = {}
-
-# Load persisted grade run metadata on startup
-try:
-    import json as _json
-    _grade_run_path = _os.path.join(DATA_DIR, "last_grade_run.json")
-    if _os.path.exists(_grade_run_path):
-        with open(_grade_run_path, "r") as _f:
-            _last_grade_run = _json.load(_f)
-except Exception:
-    pass
+def _read_last_grade_run() -> dict:
+    """Persisted grade run metadata (v20.30: written by the ops.auto_grade job in whichever process ran it)."""
+    try:
+        import json as _json
+        _grade_run_path = _os.path.join(DATA_DIR, "last_grade_run.json")
+        if _os.path.exists(_grade_run_path):
+            with open(_grade_run_path, "r") as _f:
+                return _json.load(_f)
+    except Exception:
+        pass
+    return {}
 
 
 @app.get("/ops/latest-audit", dependencies=[Depends(_require_admin)])
@@ -1701,45 +1884,12 @@ async def ops_latest_audit():
 
 @app.post("/ops/auto-grade/run", dependencies=[Depends(_require_admin)])
 async def ops_auto_grade_run():
-    """Trigger autograde immediately. Returns full grading summary."""
-    global _last_grade_run
-    import json
-    from datetime import datetime, timedelta
-    import pytz
-    try:
-        from result_fetcher import auto_grade_picks
-    except ImportError:
+    """Queue autograde now (v20.30: runs in the scheduler worker; poll /live/jobs/{job_id})."""
+    import importlib.util
+    if importlib.util.find_spec("result_fetcher") is None:
         return {"error": "result_fetcher not available"}
-
-    ET = pytz.timezone("America/New_York")
-    now_et = datetime.now(ET)
-    today = now_et.strftime("%Y-%m-%d")
-
-    dates_to_grade = [today]
-    if now_et.hour < 12:
-        yesterday = (now_et - timedelta(days=1)).strftime("%Y-%m-%d")
-        dates_to_grade.append(yesterday)
-
-    all_results = []
-    for date in dates_to_grade:
-        result = await auto_grade_picks(date=date)
-        all_results.append(result)
-
-    # Persist metadata
-    _last_grade_run = {
-        "timestamp_et": now_et.isoformat(),
-        "timestamp_utc": datetime.now(tz=timezone.utc).isoformat(),
-        "dates_graded": dates_to_grade,
-        "results": all_results,
-    }
-    try:
-        grade_run_path = _os.path.join(DATA_DIR, "last_grade_run.json")
-        with open(grade_run_path, "w") as f:
-            json.dump(_last_grade_run, f, indent=2, default=str)
-    except Exception:
-        pass
-
-    return _last_grade_run
+    from core.heavy_jobs import JOB_OPS_AUTO_GRADE, enqueue_heavy_job
+    return enqueue_heavy_job(JOB_OPS_AUTO_GRADE)
 
 
 @app.get("/ops/grader/status", dependencies=[Depends(_require_admin)])
@@ -1792,6 +1942,7 @@ async def ops_grader_status():
             reverse=True
         )[:10]
 
+    last_grade_run = _read_last_grade_run()
     return {
         "predictions_total": counts["total"],
         "predictions_pending": counts["pending"],
@@ -1800,9 +1951,9 @@ async def ops_grader_status():
         "predictions_waiting_final": counts["waiting"],
         "by_sport": by_sport,
         "dates_checked": [today, yesterday],
-        "last_grade_run_timestamp": _last_grade_run.get("timestamp_et"),
-        "last_grade_run_timestamp_utc": _last_grade_run.get("timestamp_utc"),
-        "last_grade_run_summary": _last_grade_run.get("results"),
+        "last_grade_run_timestamp": last_grade_run.get("timestamp_et"),
+        "last_grade_run_timestamp_utc": last_grade_run.get("timestamp_utc"),
+        "last_grade_run_summary": last_grade_run.get("results"),
         "storage_backend": "jsonl_file",
         "predictions_store_path": PICK_LOGS,
         "recent_pick_files": pick_files,
@@ -2143,15 +2294,21 @@ async def ops_verify():
     # 6. Scheduler check
     try:
         sched = get_scheduler()
-        sched_ok = sched is not None and sched.running
+        summary = get_scheduler_summary()
+        sched_ok = summary["running"]
         jobs_count = 0
         if sched and sched.scheduler:
             try:
                 jobs_count = len(sched.scheduler.get_jobs())
             except Exception:
                 jobs_count = -1  # APScheduler not available
+        elif summary.get("leader"):
+            # v20.30: Scheduler runs in another process - count the jobs it published
+            jobs_count = len((summary["leader"].get("info", {}).get("scheduler") or {}).get("scheduled_jobs", []))
         results["checks"]["scheduler"] = {
-            "running": sched.running if sched else False,
+            "running": sched_ok,
+            "local": summary.get("local", False),
+            "role": summary.get("role"),
             "jobs_count": jobs_count,
             "passed": sched_ok
         }
@@ -2169,6 +2326,9 @@ async def ops_verify():
     return results
 
 
+_startup.mark("main_module_imported")
+
+
 if __name__ == "__main__":
     import os
     port = int(os.environ.get("PORT", 8000))
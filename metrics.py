@@ -4,12 +4,16 @@
 import os
 import time
 import logging
+import threading
 from functools import wraps
-from typing import Callable
+from typing import Callable, Dict, Optional
+
+from core.latency_sketch import LatencySketch
 
 # Prometheus metrics
 try:
-    from prometheus_client import Counter, Histogram, Gauge, Info, generate_latest, CONTENT_TYPE_LATEST
+    from prometheus_client import Counter, Histogram, Gauge, Info, generate_latest, CONTENT_TYPE_LATEST, REGISTRY
+    from prometheus_client.core import HistogramMetricFamily
     PROMETHEUS_AVAILABLE = True
 except ImportError:
     PROMETHEUS_AVAILABLE = False
@@ -107,6 +111,61 @@ if PROMETHEUS_AVAILABLE:
         ['sport']
     )
 
+    # Model registry metrics
+    MODEL_LOAD_SECONDS = Histogram(
+        'bookie_model_load_seconds',
+        'ML model load + warm-up time',
+        ['model'],
+        buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+    )
+
+    MODEL_READY = Gauge(
+        'bookie_model_ready',
+        'Whether an ML model is loaded and serving (1) or not (0)',
+        ['model']
+    )
+
+    # Upstream integrations (one series per api; outcome = ok/http_error/rate_limited/error)
+    UPSTREAM_LATENCY = Histogram(
+        'bookie_upstream_latency_seconds',
+        'Upstream integration request latency',
+        ['api', 'outcome'],
+        buckets=[0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+    )
+
+    UPSTREAM_INFLIGHT = Gauge(
+        'bookie_upstream_inflight',
+        'Upstream integration requests currently in flight',
+        ['api']
+    )
+
+    # Cache lookups by cache and key namespace (hit ratio = hit / (hit + miss))
+    CACHE_LOOKUPS = Counter(
+        'bookie_cache_lookups_total',
+        'Cache lookups by namespace',
+        ['cache', 'namespace', 'result']
+    )
+
+    # Scheduler jobs
+    JOB_DURATION = Histogram(
+        'bookie_scheduler_job_duration_seconds',
+        'Scheduler job wall time',
+        ['job_type', 'status'],
+        buckets=[0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 1800.0, 3600.0]
+    )
+
+    JOB_RUNNING = Gauge(
+        'bookie_scheduler_jobs_running',
+        'Scheduler jobs currently running',
+        ['job_type']
+    )
+
+    JOB_OVERLAPS = Counter(
+        'bookie_scheduler_job_overlaps_total',
+        'Scheduler job starts while a previous run of the same job was still running',
+        ['job_type']
+    )
+
     # App info
     APP_INFO = Info(
         'bookie_app',
@@ -181,6 +240,188 @@ def update_hit_rate(sport: str, rate: float):
     HIT_RATE.labels(sport=sport).set(rate)
 
 
+def track_model_load(model: str, seconds, ready: bool):
+    """Track a model registry load (seconds is None when the load failed)."""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    if seconds is not None:
+        MODEL_LOAD_SECONDS.labels(model=model).observe(seconds)
+    MODEL_READY.labels(model=model).set(1 if ready else 0)
+
+
+# Best-bets hot path: per-engine time inside calculate_pick_score (per pick).
+# bookie_engine_latency_seconds is served from merged LatencySketches by
+# _EngineLatencyCollector, so a request costs one sketch merge per engine
+# instead of one Histogram.observe() per pick.
+ENGINE_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+_engine_sketches: Dict[tuple, LatencySketch] = {}
+_engine_sketches_lock = threading.Lock()
+
+
+def track_engine_spans(sport: str, sketches: dict):
+    """Merge one request's EngineSpans sketches ({engine: LatencySketch}) into the exported ones."""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    with _engine_sketches_lock:
+        for engine, sketch in sketches.items():
+            key = (sport, engine)
+            total = _engine_sketches.get(key)
+            if total is None:
+                _engine_sketches[key] = sketch.copy()
+            else:
+                total.merge(sketch)
+
+
+def _engine_latency_buckets(sketch: LatencySketch) -> list:
+    """Cumulative Prometheus buckets for a sketch at ENGINE_LATENCY_BUCKETS bounds."""
+    buckets = [(repr(bound), sketch.count_at_most(bound)) for bound in ENGINE_LATENCY_BUCKETS]
+    buckets.append(("+Inf", sketch.count))
+    return buckets
+
+
+if PROMETHEUS_AVAILABLE:
+    class _EngineLatencyCollector:
+        """Serves bookie_engine_latency_seconds from the merged engine sketches at scrape time."""
+
+        def collect(self):
+            family = HistogramMetricFamily(
+                'bookie_engine_latency_seconds',
+                'Per-pick engine time inside best-bets scoring',
+                labels=['sport', 'engine'],
+            )
+            with _engine_sketches_lock:
+                snapshot = [(key, sketch.copy()) for key, sketch in _engine_sketches.items()]
+            for (sport, engine), sketch in snapshot:
+                family.add_metric([sport, engine], _engine_latency_buckets(sketch), sketch.total)
+            yield family
+
+    REGISTRY.register(_EngineLatencyCollector())
+
+
+# ============================================================================
+# INSTRUMENTATION (upstream calls, caches, scheduler jobs)
+# ============================================================================
+
+def _http_outcome(status_code: Optional[int]) -> str:
+    if status_code is None:
+        return "ok"
+    if status_code == 429:
+        return "rate_limited"
+    return "ok" if status_code < 400 else "http_error"
+
+
+class _UpstreamCall:
+    """Context manager timing one upstream request (see upstream_call)."""
+
+    __slots__ = ("api", "outcome", "_started")
+
+    def __init__(self, api: str):
+        self.api = api
+        self.outcome = "ok"
+        self._started = 0.0
+
+    def status(self, status_code: Optional[int]) -> None:
+        """Record the HTTP status of the response (optional; default outcome is ok)."""
+        self.outcome = _http_outcome(status_code)
+
+    def __enter__(self) -> "_UpstreamCall":
+        UPSTREAM_INFLIGHT.labels(api=self.api).inc()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        latency = time.perf_counter() - self._started
+        if exc_type is not None:
+            self.outcome = "error"
+        UPSTREAM_INFLIGHT.labels(api=self.api).dec()
+        UPSTREAM_LATENCY.labels(api=self.api, outcome=self.outcome).observe(latency)
+        track_external_api(self.api, self.outcome, latency)
+
+
+class _NoopUpstreamCall:
+    __slots__ = ()
+
+    def status(self, status_code: Optional[int]) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopUpstreamCall":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NOOP_UPSTREAM_CALL = _NoopUpstreamCall()
+
+
+def upstream_call(api: str):
+    """
+    Time one upstream request: latency histogram, in-flight gauge, outcome counter.
+
+        with upstream_call("balldontlie") as call:
+            resp = await client.get(url)
+            call.status(resp.status_code)
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return _NOOP_UPSTREAM_CALL
+    return _UpstreamCall(api)
+
+
+def cache_namespace(key: str) -> str:
+    """Namespace of a cache key: the segment before the first ':' ("best-bets:nba" -> "best-bets")."""
+    return key.split(":", 1)[0] if key else ""
+
+
+def track_cache_lookup(cache: str, key: str, hit: bool):
+    """Track a cache lookup under its key namespace."""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    CACHE_LOOKUPS.labels(cache=cache, namespace=cache_namespace(key), result="hit" if hit else "miss").inc()
+
+
+_jobs_running: Dict[str, int] = {}
+_jobs_lock = threading.Lock()
+
+
+def track_job(job_type: str) -> Callable:
+    """Decorator for scheduler jobs: duration, running gauge, overlap counter, run counter."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _jobs_lock:
+                running = _jobs_running.get(job_type, 0)
+                _jobs_running[job_type] = running + 1
+            if running:
+                logger.warning("Scheduler job %s started while %d previous run(s) still running", job_type, running)
+            if PROMETHEUS_AVAILABLE:
+                if running:
+                    JOB_OVERLAPS.labels(job_type=job_type).inc()
+                JOB_RUNNING.labels(job_type=job_type).inc()
+            start = time.perf_counter()
+            success = False
+            try:
+                result = func(*args, **kwargs)
+                success = True
+                return result
+            finally:
+                with _jobs_lock:
+                    _jobs_running[job_type] = max(0, _jobs_running.get(job_type, 1) - 1)
+                if PROMETHEUS_AVAILABLE:
+                    JOB_RUNNING.labels(job_type=job_type).dec()
+                    JOB_DURATION.labels(job_type=job_type, status="success" if success else "failure").observe(
+                        time.perf_counter() - start)
+                track_scheduler_run(job_type, success)
+        return wrapper
+    return decorator
+
+
+def jobs_running() -> Dict[str, int]:
+    """Scheduler jobs currently running in this process (job_type -> runs)."""
+    with _jobs_lock:
+        return {k: v for k, v in _jobs_running.items() if v}
+
+
 # ============================================================================
 # MIDDLEWARE
 # ============================================================================
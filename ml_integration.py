@@ -8,12 +8,14 @@ This module provides:
 3. Feature building from prop context
 4. Integration with the scoring pipeline
 
-The 13 pre-trained LSTM weight files are loaded on-demand and cached.
+The 13 pre-trained LSTM weight files are preloaded at startup by
+model_registry (and otherwise loaded on-demand and cached).
 """
 
 import os
 import json
 import logging
+import time
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -97,7 +99,8 @@ class PropLSTMManager:
     Manages sport+stat specific LSTM models with lazy loading.
 
     Models are loaded on first access and cached for subsequent predictions.
-    This avoids loading all 13 models at startup (slow + memory intensive).
+    At startup model_registry calls preload() off the event loop so the first
+    request does not pay the load cost.
     """
 
     def __init__(self, models_dir: str = None):
@@ -209,6 +212,20 @@ class PropLSTMManager:
             logger.error(f"Failed to load LSTM model {model_key}: {e}")
             return None
 
+    def preload(self) -> int:
+        """
+        Eagerly load every model that has a weight file.
+
+        Used by model_registry at startup so no request pays the load cost.
+        Returns the number of models loaded.
+        """
+        stat_types = {stat for sport_map in SPORT_MARKET_TO_STAT.values() for stat in sport_map.values()}
+        for sport in SUPPORTED_SPORTS:
+            for stat_type in stat_types:
+                if self.has_model(sport, stat_type):
+                    self._load_model(sport, stat_type)
+        return len(self._models)
+
     def predict(
         self,
         sport: str,
@@ -502,6 +519,83 @@ def get_lstm_ai_score(
     return round(ai_score, 2), metadata
 
 
+# ============================================
+# ENSEMBLE FEATURE ENCODING
+# ============================================
+
+# Column order the ensemble hit predictor was trained on (scripts/train_ensemble.py)
+ENSEMBLE_FEATURE_COLUMNS = [
+    "ai_score", "research_score", "esoteric_score", "jarvis_score", "line", "odds",
+    "confluence_boost", "jason_sim_boost", "titanium_triggered", "sport", "pick_type", "side",
+]
+
+ENSEMBLE_FEATURE_DEFAULTS = {
+    "line": 0.0,
+    "odds": -110,
+    "confluence_boost": 0.0,
+    "jason_sim_boost": 0.0,
+    "titanium_triggered": False,
+    "sport": "NBA",
+    "pick_type": "GAME",
+    "side": "Home",
+}
+
+SPORT_ENCODING = {"NBA": 0, "NFL": 1, "MLB": 2, "NHL": 3, "NCAAB": 4}
+
+
+def encode_ensemble_features(rows) -> np.ndarray:
+    """
+    Build the (n, 12) float32 ensemble feature matrix for a slate.
+
+    Accepts a dict of columns or a list of per-pick dicts. Categorical columns
+    are encoded with array operations (same codes as the per-pick encoder):
+    sport -> SPORT_ENCODING (unknown = NBA), pick_type PROP/SPREAD/TOTAL/other
+    -> 0/1/2/3, side Over/Under/Home/other -> 0/1/2/3.
+    """
+    if isinstance(rows, (list, tuple)):
+        columns = {
+            name: [r.get(name, ENSEMBLE_FEATURE_DEFAULTS.get(name)) for r in rows]
+            for name in ENSEMBLE_FEATURE_COLUMNS
+        }
+        n = len(rows)
+    else:
+        columns = dict(rows)
+        lengths = {len(v) for v in columns.values() if np.ndim(v) > 0}
+        if len(lengths) > 1:
+            raise ValueError(f"Ensemble feature columns have different lengths: {sorted(lengths)}")
+        n = lengths.pop() if lengths else 1
+
+    def column(name):
+        value = columns.get(name, ENSEMBLE_FEATURE_DEFAULTS.get(name))
+        if value is None:
+            raise ValueError(f"Missing ensemble feature column: {name}")
+        arr = np.asarray(value)
+        return np.broadcast_to(arr, (n,)) if arr.ndim == 0 else arr
+
+    numeric = [column(name).astype(np.float32) for name in ENSEMBLE_FEATURE_COLUMNS[:9]]
+
+    sport = np.char.upper(column("sport").astype(str))
+    sport_encoded = np.zeros(n, dtype=np.float32)
+    for name, code in SPORT_ENCODING.items():
+        sport_encoded[sport == name] = code
+
+    pick_type = np.char.upper(column("pick_type").astype(str))
+    pick_type_encoded = np.select(
+        [np.char.find(pick_type, "PROP") >= 0,
+         np.char.find(pick_type, "SPREAD") >= 0,
+         np.char.find(pick_type, "TOTAL") >= 0],
+        [0, 1, 2], default=3,
+    ).astype(np.float32)
+
+    side = column("side").astype(str)
+    side_encoded = np.select(
+        [np.isin(side, ["Over", "OVER"]), np.isin(side, ["Under", "UNDER"]), side == "Home"],
+        [0, 1, 2], default=3,
+    ).astype(np.float32)
+
+    return np.column_stack(numeric + [sport_encoded, pick_type_encoded, side_encoded]).astype(np.float32)
+
+
 # ============================================
 # ENSEMBLE MODEL MANAGER (For Game Picks)
 # ============================================
@@ -530,6 +624,14 @@ class EnsembleModelManager:
         self.metadata_path = os.path.join(models_dir, "ensemble_hit_predictor_metadata.json")
         self._load_error = None
         self._prediction_count = 0
+        self.reset_batch_stats()
+
+    def reset_batch_stats(self) -> None:
+        """Clear batch telemetry (e.g. after a synthetic warm-up call)."""
+        self._batch_stats = {
+            "batches": 0, "rows": 0, "max_batch_size": 0, "last_batch_size": 0,
+            "last_latency_ms": None, "total_latency_ms": 0.0,
+        }
 
     def is_available(self) -> bool:
         """Check if ensemble model file exists."""
@@ -581,66 +683,76 @@ class EnsembleModelManager:
 
         Returns dict with hit_probability and metadata, or None if model unavailable.
         """
+        results = self.predict_hit_probability_batch({
+            "ai_score": [ai_score],
+            "research_score": [research_score],
+            "esoteric_score": [esoteric_score],
+            "jarvis_score": [jarvis_score],
+            "line": [line],
+            "odds": [odds],
+            "confluence_boost": [confluence_boost],
+            "jason_sim_boost": [jason_sim_boost],
+            "titanium_triggered": [titanium_triggered],
+            "sport": [sport],
+            "pick_type": [pick_type],
+            "side": [side],
+        })
+        return results[0] if results else None
+
+    def predict_hit_probability_batch(self, rows) -> Optional[List[Dict]]:
+        """
+        Predict hit probabilities for a whole slate with one predict_proba call.
+
+        Args:
+            rows: Either a dict of columns (name -> sequence or scalar, using the
+                  predict_hit_probability argument names) or a list of per-pick
+                  dicts with those keys. Missing columns take the same defaults
+                  as predict_hit_probability.
+
+        Returns:
+            One result dict per row (same shape as predict_hit_probability),
+            or None if the model is unavailable or prediction fails.
+        """
         if not self._load_model():
             return None
 
         try:
-            import numpy as np
-
-            # Encode categorical variables
-            sport_encoding = {"NBA": 0, "NFL": 1, "MLB": 2, "NHL": 3, "NCAAB": 4}
-            sport_encoded = sport_encoding.get(sport.upper(), 0)
-
-            if "PROP" in pick_type.upper():
-                pick_type_encoded = 0
-            elif "SPREAD" in pick_type.upper():
-                pick_type_encoded = 1
-            elif "TOTAL" in pick_type.upper():
-                pick_type_encoded = 2
-            else:
-                pick_type_encoded = 3
-
-            if side in ["Over", "OVER"]:
-                side_encoded = 0
-            elif side in ["Under", "UNDER"]:
-                side_encoded = 1
-            elif side == "Home":
-                side_encoded = 2
-            else:
-                side_encoded = 3
-
-            # Build feature vector
-            features = np.array([[
-                ai_score,
-                research_score,
-                esoteric_score,
-                jarvis_score,
-                float(line),
-                float(odds),
-                confluence_boost,
-                jason_sim_boost,
-                1.0 if titanium_triggered else 0.0,
-                sport_encoded,
-                pick_type_encoded,
-                side_encoded
-            ]], dtype=np.float32)
-
-            # Predict
-            hit_prob = self.model.predict_proba(features)[0][1]
-            self._prediction_count += 1
-
-            return {
-                "hit_probability": round(float(hit_prob), 4),
-                "predicted_hit": hit_prob >= 0.5,
-                "confidence": round(abs(hit_prob - 0.5) * 200, 1),  # Scale to 0-100%
-                "model_type": type(self.model).__name__,
-                "trained_at": self.metadata.get("trained_at") if self.metadata else None
-            }
+            features = encode_ensemble_features(rows)
+            if len(features) == 0:
+                return []
+
+            start = time.perf_counter()
+            hit_probs = self.model.predict_proba(features)[:, 1]
+            self._record_batch(len(features), (time.perf_counter() - start) * 1000)
+
+            model_type = type(self.model).__name__
+            trained_at = self.metadata.get("trained_at") if self.metadata else None
+            return [
+                {
+                    "hit_probability": round(float(p), 4),
+                    "predicted_hit": bool(p >= 0.5),
+                    "confidence": round(abs(float(p) - 0.5) * 200, 1),  # Scale to 0-100%
+                    "model_type": model_type,
+                    "trained_at": trained_at
+                }
+                for p in hit_probs
+            ]
 
         except Exception as e:
             logger.error(f"Ensemble prediction error: {e}")
             return None
 
+    def _record_batch(self, size: int, latency_ms: float) -> None:
+        """Track batch sizes and per-batch predict_proba latency for /ml/status."""
+        stats = self._batch_stats
+        stats["batches"] += 1
+        stats["rows"] += size
+        stats["last_batch_size"] = size
+        stats["max_batch_size"] = max(stats["max_batch_size"], size)
+        stats["last_latency_ms"] = round(latency_ms, 3)
+        stats["total_latency_ms"] += latency_ms
+        self._prediction_count += size
+
     def get_status(self) -> Dict:
         """Get ensemble model status."""
         return {
@@ -648,10 +760,25 @@ class EnsembleModelManager:
             "loaded": self.model is not None,
             "model_path": self.model_path,
             "predictions": self._prediction_count,
+            "batching": self.get_batch_stats(),
             "load_error": self._load_error,
             "metadata": self.metadata
         }
 
+    def get_batch_stats(self) -> Dict:
+        """Batch size and per-batch latency summary."""
+        stats = self._batch_stats
+        batches = stats["batches"]
+        return {
+            "batches": batches,
+            "rows": stats["rows"],
+            "avg_batch_size": round(stats["rows"] / batches, 2) if batches else None,
+            "max_batch_size": stats["max_batch_size"],
+            "last_batch_size": stats["last_batch_size"],
+            "last_latency_ms": stats["last_latency_ms"],
+            "avg_latency_ms": round(stats["total_latency_ms"] / batches, 3) if batches else None,
+        }
+
 
 # Global ensemble manager singleton
 _ensemble_manager: Optional[EnsembleModelManager] = None
@@ -686,29 +813,44 @@ def get_ensemble_ai_score(
     Converts hit probability to an AI score in [2, 8] range.
     Falls back to heuristic if ensemble model unavailable.
     """
-    manager = get_ensemble_manager()
-    prediction = manager.predict_hit_probability(
-        ai_score=ai_score,
-        research_score=research_score,
-        esoteric_score=esoteric_score,
-        jarvis_score=jarvis_score,
-        line=line,
-        odds=odds,
-        confluence_boost=confluence_boost,
-        jason_sim_boost=jason_sim_boost,
-        titanium_triggered=titanium_triggered,
-        sport=sport,
-        pick_type=pick_type,
-        side=side
-    )
+    return get_ensemble_ai_scores_batch([{
+        "ai_score": ai_score,
+        "research_score": research_score,
+        "esoteric_score": esoteric_score,
+        "jarvis_score": jarvis_score,
+        "line": line,
+        "odds": odds,
+        "confluence_boost": confluence_boost,
+        "jason_sim_boost": jason_sim_boost,
+        "titanium_triggered": titanium_triggered,
+        "sport": sport,
+        "pick_type": pick_type,
+        "side": side,
+        "base_ai": base_ai,
+    }])[0]
+
+
+def get_ensemble_ai_scores_batch(rows: List[Dict]) -> List[Tuple[float, Dict]]:
+    """
+    Batched get_ensemble_ai_score: one predict_proba call for a whole slate.
 
-    if prediction is None:
-        return base_ai, {
+    Each row holds get_ensemble_ai_score's keyword arguments (base_ai
+    included, default 4.5). Returns one (ai_score, metadata) pair per row.
+    """
+    if not rows:
+        return []
+    predictions = get_ensemble_manager().predict_hit_probability_batch(rows)
+    if predictions is None:
+        return [(row.get("base_ai", 4.5), {
             "source": "heuristic",
             "reason": "Ensemble model not available"
-        }
+        }) for row in rows]
+    return [_ensemble_ai_score(prediction, row.get("base_ai", 4.5))
+            for row, prediction in zip(rows, predictions)]
+
 
-    # Convert hit probability to AI score
+def _ensemble_ai_score(prediction: Dict, base_ai: float) -> Tuple[float, Dict]:
+    """Convert an ensemble hit probability to an AI score in [2, 8]."""
     # hit_prob 0.5 -> base_ai, 1.0 -> 8.0, 0.0 -> 2.0
     hit_prob = prediction["hit_probability"]
     adjusted_ai = base_ai + (hit_prob - 0.5) * 6.0  # Maps [0,1] to [-3, 3] adjustment
@@ -745,9 +887,16 @@ def get_ml_status() -> Dict:
     except ImportError:
         tf_available = False
 
+    try:
+        from model_registry import get_model_registry
+        registry_status = get_model_registry().status()
+    except ImportError:
+        registry_status = None
+
     return {
         "timestamp": datetime.now().isoformat(),
         "tensorflow_available": tf_available,
+        "registry": registry_status,
         "lstm": lstm_status,
         "ensemble": ensemble_status,
         "supported_sports": list(SUPPORTED_SPORTS),
@@ -0,0 +1,318 @@
+"""
+Model Registry - Eager preload, warm-up and hot-swap for ML components
+======================================================================
+
+The ML components (prop LSTMs, ensemble hit predictor, team LSTM, game
+ensemble, MasterPredictionSystem) each load lazily on first use, which puts
+joblib/h5 deserialization and first-inference costs on the first best-bets
+request after a deploy. The registry loads them up front instead:
+
+- preload_async() runs every loader in a worker thread during main.lifespan,
+  so the event loop keeps serving while models load.
+- Each loader builds a complete new instance, runs a synthetic warm-up
+  inference, and only then installs it into the module singleton the rest of
+  the code already reads (get_lstm_manager(), get_game_ensemble(), ...).
+  Installing is a single reference assignment, so concurrent requests see the
+  old model or the new one, never a half-loaded one.
+- reload(name) uses the same path to hot-swap after daily_scheduler retrains.
+
+Usage:
+    from model_registry import get_model_registry
+
+    registry = get_model_registry()
+    await registry.preload_async()       # startup
+    registry.reload("prop_lstm")         # after retrain
+    registry.status()                    # readiness + load/warm-up timings
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("model_registry")
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+MODEL_PRELOAD_ENABLED = os.getenv("MODEL_PRELOAD_ENABLED", "true").lower() == "true"
+
+# Model states
+PENDING = "PENDING"
+LOADING = "LOADING"
+READY = "READY"
+FAILED = "FAILED"
+
+
+@dataclass
+class ModelEntry:
+    """One registered component: how to build, warm and install it, plus telemetry."""
+    name: str
+    loader: Callable[[], Any]
+    warmup: Optional[Callable[[Any], None]] = None
+    install: Optional[Callable[[Any], None]] = None
+    state: str = PENDING
+    instance: Any = None
+    version: int = 0
+    load_ms: Optional[float] = None
+    warmup_ms: Optional[float] = None
+    loaded_at: Optional[str] = None
+    error: Optional[str] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "version": self.version,
+            "load_ms": self.load_ms,
+            "warmup_ms": self.warmup_ms,
+            "loaded_at": self.loaded_at,
+            "error": self.error,
+        }
+
+
+class ModelRegistry:
+    """Registry of ML components with eager loading and atomic hot-swap."""
+
+    def __init__(self):
+        self._entries: Dict[str, ModelEntry] = {}
+        self._preload_started_at: Optional[float] = None
+        self._preload_ms: Optional[float] = None
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        warmup: Optional[Callable[[Any], None]] = None,
+        install: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """
+        Register a component.
+
+        Args:
+            loader: Builds and fully loads a new instance (blocking is fine).
+            warmup: Runs one synthetic inference on the new instance.
+            install: Publishes the instance (e.g. sets a module singleton).
+        """
+        self._entries[name] = ModelEntry(name=name, loader=loader, warmup=warmup, install=install)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._entries)
+
+    def get(self, name: str) -> Any:
+        entry = self._entries.get(name)
+        return entry.instance if entry is not None else None
+
+    def load(self, name: str) -> bool:
+        """
+        Build, warm up and install one component.
+
+        On failure the previously installed instance (if any) stays live.
+        """
+        entry = self._entries[name]
+        # Serialize loads of the same component; a reload during preload waits
+        with entry._lock:
+            previous_state = entry.state
+            entry.state = LOADING
+            start = time.perf_counter()
+            try:
+                instance = entry.loader()
+                load_ms = (time.perf_counter() - start) * 1000
+
+                warm_start = time.perf_counter()
+                if entry.warmup is not None and instance is not None:
+                    entry.warmup(instance)
+                warmup_ms = (time.perf_counter() - warm_start) * 1000
+
+                if entry.install is not None:
+                    entry.install(instance)
+                entry.instance = instance
+            except Exception as e:
+                entry.error = f"{type(e).__name__}: {e}"
+                entry.state = READY if previous_state == READY else FAILED
+                logger.warning("Model %s failed to load: %s", name, entry.error)
+                _track_model_load(name, None, ready=entry.state == READY)
+                return False
+
+            entry.version += 1
+            entry.load_ms = round(load_ms, 1)
+            entry.warmup_ms = round(warmup_ms, 1)
+            entry.loaded_at = datetime.now().isoformat()
+            entry.error = None
+            entry.state = READY
+        logger.info("Model %s ready v%d (load %.0fms, warm-up %.0fms)",
+                    name, entry.version, entry.load_ms, entry.warmup_ms)
+        _track_model_load(name, (load_ms + warmup_ms) / 1000, ready=True)
+        return True
+
+    def reload(self, *names: str) -> Dict[str, bool]:
+        """Hot-swap components after retraining (all when no names given)."""
+        results = {name: self.load(name) for name in (names or self.names) if name in self._entries}
+        if any(results.values()):
+            # v20.30: Scoring worker processes hold their own copies of the models
+            from core.scoring_offload import recycle_scoring_pool
+            recycle_scoring_pool()
+        return results
+
+    def preload(self, names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Load every registered component (blocking)."""
+        self._preload_started_at = time.perf_counter()
+        results = {name: self.load(name) for name in (names or self.names)}
+        self._preload_ms = round((time.perf_counter() - self._preload_started_at) * 1000, 1)
+        logger.info("Model preload finished in %.0fms: %s", self._preload_ms, results)
+        return results
+
+    async def preload_async(self, names: Optional[List[str]] = None) -> Dict[str, bool]:
+        """Run preload() in a worker thread so the event loop is not blocked."""
+        return await asyncio.to_thread(self.preload, names)
+
+    def is_ready(self) -> bool:
+        """True once every component has been attempted and none is mid-load."""
+        return bool(self._entries) and all(e.state in (READY, FAILED) for e in self._entries.values())
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ready": self.is_ready(),
+            "preload_enabled": MODEL_PRELOAD_ENABLED,
+            "preload_ms": self._preload_ms,
+            "models": {name: e.to_dict() for name, e in self._entries.items()},
+        }
+
+
+def _track_model_load(name: str, seconds: Optional[float], ready: bool) -> None:
+    try:
+        from metrics import track_model_load
+        track_model_load(name, seconds, ready)
+    except ImportError:
+        pass
+
+
+# =============================================================================
+# DEFAULT COMPONENTS
+# =============================================================================
+
+def _load_prop_lstm():
+    from ml_integration import PropLSTMManager
+    manager = PropLSTMManager()
+    manager.preload()
+    return manager
+
+
+def _warm_prop_lstm(manager) -> None:
+    import numpy as np
+    for brain in list(manager._models.values()):
+        brain.predict_batch(np.zeros((1,) + brain.INPUT_SHAPE, dtype=np.float32))
+
+
+def _install_prop_lstm(manager) -> None:
+    import ml_integration
+    from core.prop_score_memo import get_prop_score_memo
+    ml_integration._lstm_manager = manager
+    # Memoized prop scores came from the previous model
+    get_prop_score_memo().clear()
+
+
+def _load_ensemble_hit_predictor():
+    from ml_integration import EnsembleModelManager
+    manager = EnsembleModelManager()
+    manager._load_model()
+    return manager
+
+
+def _warm_ensemble_hit_predictor(manager) -> None:
+    if manager.model is None:
+        return
+    manager.predict_hit_probability(ai_score=5.0, research_score=5.0, esoteric_score=5.0, jarvis_score=5.0)
+    manager._prediction_count = 0  # Warm-up is not a real prediction
+    manager.reset_batch_stats()
+
+
+def _install_ensemble_hit_predictor(manager) -> None:
+    import ml_integration
+    ml_integration._ensemble_manager = manager
+
+
+def _load_team_lstm():
+    # Fresh cache from disk: a retrain in the scheduler worker rewrites team_data_cache.json
+    from team_ml_models import TeamDataCache, TeamLSTMModel
+    return TeamLSTMModel(TeamDataCache())
+
+
+def _warm_team_lstm(model) -> None:
+    if model.model is None:
+        return
+    import numpy as np
+    model.model.predict(np.zeros((1, 10, 4), dtype=np.float32), verbose=0)
+
+
+def _install_team_lstm(model) -> None:
+    import team_ml_models
+    team_ml_models._team_cache = model.team_cache
+    team_ml_models._team_lstm = model
+
+
+def _load_team_matchup():
+    from team_ml_models import TeamMatchupModel
+    return TeamMatchupModel()
+
+
+def _install_team_matchup(model) -> None:
+    import team_ml_models
+    team_ml_models._team_matchup = model
+
+
+def _load_game_ensemble():
+    from team_ml_models import GameEnsembleModel
+    return GameEnsembleModel()
+
+
+def _warm_game_ensemble(model) -> None:
+    import numpy as np
+    model.predict({"lstm": 0.5, "matchup": 0.5, "monte_carlo": 0.5},
+                  features=np.zeros(12, dtype=np.float32) if model.model is not None else None)
+
+
+def _install_game_ensemble(model) -> None:
+    import team_ml_models
+    team_ml_models._game_ensemble = model
+
+
+def _load_master_prediction_system():
+    from advanced_ml_backend import MasterPredictionSystem
+    return MasterPredictionSystem()
+
+
+def _install_master_prediction_system(system) -> None:
+    import live_data_router
+    live_data_router._master_prediction_system = system
+
+
+def register_default_models(registry: ModelRegistry) -> ModelRegistry:
+    """Register the app's ML components. Order matters: game_ensemble before master."""
+    registry.register("prop_lstm", _load_prop_lstm, _warm_prop_lstm, _install_prop_lstm)
+    registry.register("ensemble_hit_predictor", _load_ensemble_hit_predictor,
+                      _warm_ensemble_hit_predictor, _install_ensemble_hit_predictor)
+    registry.register("team_lstm", _load_team_lstm, _warm_team_lstm, _install_team_lstm)
+    registry.register("team_matchup", _load_team_matchup, install=_install_team_matchup)
+    registry.register("game_ensemble", _load_game_ensemble, _warm_game_ensemble, _install_game_ensemble)
+    # EnsembleStackingModel (sklearn regressors) is loaded by MasterPredictionSystem
+    registry.register("master_prediction", _load_master_prediction_system,
+                      install=_install_master_prediction_system)
+    return registry
+
+
+_registry: Optional[ModelRegistry] = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide registry with the default components registered."""
+    global _registry
+    if _registry is None:
+        _registry = register_default_models(ModelRegistry())
+    return _registry
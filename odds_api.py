@@ -5,17 +5,54 @@ Responsibilities:
 - Make Odds API requests with consistent timeout/retry
 - Mark integration usage on successful JSON response
 - Record events to integration rollup for monitoring
+- Cache raw responses per (endpoint, params) with commence-time aware TTLs
+- Deduplicate concurrent identical requests (single-flight)
+- Track quota from x-requests-remaining / x-requests-used headers
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
+import os
 import time
-from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from metrics import upstream_call
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# RESPONSE CACHE CONFIGURATION
+# =============================================================================
+
+ODDS_CACHE_ENABLED = os.getenv("ODDS_API_CACHE_ENABLED", "true").lower() == "true"
+
+# TTL ladder keyed by time until the earliest commence_time in the payload.
+# Games in progress refresh fastest; games days out are polled rarely.
+ODDS_CACHE_TTL_IN_PLAY_S = int(os.getenv("ODDS_API_CACHE_TTL_IN_PLAY_S", "30"))
+ODDS_CACHE_TTL_LADDER = [
+    (3600, 60),         # starts within 1h  -> 1 min
+    (6 * 3600, 180),    # starts within 6h  -> 3 min
+    (24 * 3600, 300),   # starts within 24h -> 5 min
+    (72 * 3600, 900),   # starts within 3d  -> 15 min
+]
+ODDS_CACHE_TTL_FAR_S = int(os.getenv("ODDS_API_CACHE_TTL_FAR_S", "1800"))
+ODDS_CACHE_TTL_DEFAULT_S = int(os.getenv("ODDS_API_CACHE_TTL_DEFAULT_S", "120"))
+
+# Quota-aware stretching: when remaining credits run low, every TTL is multiplied
+ODDS_QUOTA_LOW_REMAINING = int(os.getenv("ODDS_API_QUOTA_LOW_REMAINING", "2000"))
+ODDS_QUOTA_CRITICAL_REMAINING = int(os.getenv("ODDS_API_QUOTA_CRITICAL_REMAINING", "300"))
+ODDS_QUOTA_LOW_MULTIPLIER = 2.0
+ODDS_QUOTA_CRITICAL_MULTIPLIER = 5.0
+
+ODDS_CACHE_MAX_ENTRIES = int(os.getenv("ODDS_API_CACHE_MAX_ENTRIES", "500"))
+
+# Params that never affect the response body (excluded from cache keys)
+_UNKEYED_PARAMS = {"apiKey", "api_key"}
+
 
 def _record_rollup_event(status: str, latency_ms: int, error_code: Optional[str] = None):
     """Record integration event to rollup (fail-soft)."""
@@ -55,11 +92,14 @@ async def odds_api_get(
             except ImportError:
                 logger.debug("httpx not available for odds_api_get")
                 return None, used
-            if client is None:
-                async with httpx.AsyncClient(timeout=timeout_s) as local_client:
-                    resp = await local_client.get(url, params=params)
-            else:
-                resp = await client.get(url, params=params, timeout=timeout_s)
+            with upstream_call("odds_api") as _call:
+                if client is None:
+                    async with httpx.AsyncClient(timeout=timeout_s) as local_client:
+                        resp = await local_client.get(url, params=params)
+                else:
+                    resp = await client.get(url, params=params, timeout=timeout_s)
+                if resp is not None:
+                    _call.status(resp.status_code)
 
             if resp is None:
                 continue
@@ -99,3 +139,307 @@ async def odds_api_get(
         error_type = type(last_exc).__name__
         _record_rollup_event("ERROR", latency_ms, error_type)
     return None, used
+
+
+# =============================================================================
+# QUOTA TRACKING
+# =============================================================================
+
+_quota_state: Dict[str, Any] = {
+    "requests_remaining": None,
+    "requests_used": None,
+    "requests_last": None,
+    "updated_at": None,
+}
+
+
+def record_quota_headers(resp: Any) -> None:
+    """Parse x-requests-* headers from an Odds API response (fail-soft)."""
+    headers = getattr(resp, "headers", None)
+    if not headers:
+        return
+    try:
+        remaining = headers.get("x-requests-remaining")
+        used = headers.get("x-requests-used")
+        last = headers.get("x-requests-last")
+    except Exception:
+        return
+    if remaining is None and used is None:
+        return
+    try:
+        if remaining is not None:
+            _quota_state["requests_remaining"] = int(float(remaining))
+        if used is not None:
+            _quota_state["requests_used"] = int(float(used))
+        if last is not None:
+            _quota_state["requests_last"] = int(float(last))
+        _quota_state["updated_at"] = datetime.now(timezone.utc).isoformat()
+    except (TypeError, ValueError):
+        logger.debug("Unparseable Odds API quota headers: %s / %s", remaining, used)
+
+
+def get_quota_state() -> Dict[str, Any]:
+    """Return the last quota numbers seen on any Odds API response."""
+    state = dict(_quota_state)
+    state["ttl_multiplier"] = quota_ttl_multiplier()
+    return state
+
+
+def quota_ttl_multiplier() -> float:
+    """TTL stretch factor based on remaining credits (1.0 when healthy/unknown)."""
+    remaining = _quota_state.get("requests_remaining")
+    if remaining is None:
+        return 1.0
+    if remaining <= ODDS_QUOTA_CRITICAL_REMAINING:
+        return ODDS_QUOTA_CRITICAL_MULTIPLIER
+    if remaining <= ODDS_QUOTA_LOW_REMAINING:
+        return ODDS_QUOTA_LOW_MULTIPLIER
+    return 1.0
+
+
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+
+class CachedOddsResponse:
+    """Minimal httpx.Response stand-in served from the Odds API cache."""
+
+    from_cache = True
+
+    def __init__(self, status_code: int, content: bytes, headers: Dict[str, str], url: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {k.lower(): v for k, v in headers.items()}
+        self.url = url
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+
+def _parse_commence(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _earliest_commence(body: Any) -> Optional[datetime]:
+    """Earliest commence_time in an events/odds payload (list or single event)."""
+    items: List[Any] = body if isinstance(body, list) else [body]
+    earliest = None
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        dt = _parse_commence(item.get("commence_time"))
+        if dt is not None and (earliest is None or dt < earliest):
+            earliest = dt
+    return earliest
+
+
+def compute_adaptive_ttl(body: Any, now: Optional[datetime] = None) -> int:
+    """
+    Pick a cache TTL from how soon the payload's games start.
+
+    In-play games get ODDS_CACHE_TTL_IN_PLAY_S; games days out get
+    ODDS_CACHE_TTL_FAR_S. The result is stretched when quota is low.
+    """
+    now = now or datetime.now(timezone.utc)
+    earliest = _earliest_commence(body)
+    if earliest is None:
+        ttl = ODDS_CACHE_TTL_DEFAULT_S
+    else:
+        seconds_until = (earliest - now).total_seconds()
+        if seconds_until <= 0:
+            ttl = ODDS_CACHE_TTL_IN_PLAY_S
+        else:
+            ttl = ODDS_CACHE_TTL_FAR_S
+            for horizon_s, horizon_ttl in ODDS_CACHE_TTL_LADDER:
+                if seconds_until <= horizon_s:
+                    ttl = horizon_ttl
+                    break
+    return int(ttl * quota_ttl_multiplier())
+
+
+def make_cache_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Cache key from endpoint path + response-affecting params (apiKey excluded)."""
+    parts = sorted(
+        f"{k}={v}" for k, v in (params or {}).items() if k not in _UNKEYED_PARAMS
+    )
+    return url + "?" + "&".join(parts)
+
+
+def is_cacheable_url(url: str) -> bool:
+    """The /sports listing is free and used to read quota headers - never cache it."""
+    return not url.rstrip("/").endswith("/sports")
+
+
+class OddsResponseCache:
+    """
+    In-process cache of raw Odds API responses with single-flight fetches.
+
+    Only HTTP 200 responses with a valid JSON body are stored. Concurrent
+    callers for the same key share one upstream request.
+    """
+
+    def __init__(self, max_entries: int = ODDS_CACHE_MAX_ENTRIES, enabled: bool = ODDS_CACHE_ENABLED):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: Dict[str, Tuple[CachedOddsResponse, float, int]] = {}  # key -> (resp, expires_at, ttl)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key: str) -> Optional[CachedOddsResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        resp, expires_at, _ = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return resp
+
+    def put(self, key: str, resp: Any) -> Optional[CachedOddsResponse]:
+        """Snapshot a successful response into the cache; returns the snapshot."""
+        if getattr(resp, "status_code", None) != 200:
+            return None
+        try:
+            body = resp.json()
+        except Exception:
+            return None
+        content = getattr(resp, "content", None)
+        if not isinstance(content, (bytes, bytearray)):
+            content = json.dumps(body).encode()
+        headers = dict(getattr(resp, "headers", None) or {})
+        snapshot = CachedOddsResponse(200, bytes(content), headers, url=str(getattr(resp, "url", "")))
+        ttl = compute_adaptive_ttl(body)
+        if ttl <= 0:
+            return snapshot
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k][1])
+            del self._entries[oldest]
+        self._entries[key] = (snapshot, time.monotonic() + ttl, ttl)
+        return snapshot
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Return (response, from_cache). On a miss, run fetch() once per key
+        even if many callers arrive concurrently.
+        """
+        if not self.enabled:
+            return await fetch(), False
+
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached, True
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            resp, snapshot = await asyncio.shield(inflight)
+            if snapshot is not None:
+                return snapshot, True
+            # Leader got an error/non-200: share it rather than spending quota again
+            return resp, False
+
+        self.misses += 1
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        resp = None
+        snapshot = None
+        try:
+            resp = await fetch()
+            snapshot = self.put(key, resp)
+            return resp, False
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                future.set_result((resp, snapshot))
+
+    def invalidate(self, prefix: str = "") -> int:
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for k in keys:
+            del self._entries[k]
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        live = sum(1 for _, exp, _ in self._entries.values() if exp > now)
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "live_entries": live,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "inflight": len(self._inflight),
+        }
+
+
+_response_cache: Optional[OddsResponseCache] = None
+
+
+def get_odds_response_cache() -> OddsResponseCache:
+    """Get the process-wide Odds API response cache."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = OddsResponseCache()
+    return _response_cache
+
+
+async def odds_api_get_cached(
+    url: str,
+    params: Dict[str, Any],
+    client: Optional[httpx.AsyncClient] = None,
+    timeout_s: float = 10.0,
+    retries: int = 2,
+    backoff_s: float = 0.5,
+) -> Tuple[Optional[Any], bool]:
+    """
+    Cached + coalesced variant of odds_api_get().
+
+    Returns the same (resp, used) tuple. Cache hits return a
+    CachedOddsResponse and count as used without spending quota.
+    """
+    if not is_cacheable_url(url):
+        resp, used = await odds_api_get(url, params, client, timeout_s, retries, backoff_s)
+        record_quota_headers(resp)
+        return resp, used
+
+    result: Dict[str, bool] = {"used": False}
+
+    async def _fetch():
+        resp, used = await odds_api_get(url, params, client, timeout_s, retries, backoff_s)
+        record_quota_headers(resp)
+        result["used"] = used
+        return resp
+
+    cache = get_odds_response_cache()
+    resp, from_cache = await cache.get_or_fetch(make_cache_key(url, params), _fetch)
+    if from_cache:
+        try:
+            from integration_registry import record_cache_hit, mark_integration_used
+            record_cache_hit("odds_api")
+            mark_integration_used("odds_api")
+        except Exception:
+            pass
+        _record_rollup_event("CACHE_HIT", 0)
+        return resp, True
+    return resp, result["used"]
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
 from core.log_sanitizer import sanitize_url, sanitize_dict
+from metrics import upstream_call
 
 logger = logging.getLogger(__name__)
 
@@ -224,7 +225,9 @@ async def playbook_fetch(
         # Log request without exposing API key
         logger.debug("Playbook API request: %s params=%s", url, sanitize_dict(query_params))
 
-        resp = await client.get(url, params=query_params, timeout=30.0)
+        with upstream_call("playbook_api") as _call:
+            resp = await client.get(url, params=query_params, timeout=30.0)
+            _call.status(resp.status_code)
         latency_ms = int((time.time() - start_time) * 1000)
 
         if resp.status_code == 200:
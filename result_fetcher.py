@@ -1409,6 +1409,7 @@ async def auto_grade_picks(
             results["stats_fetched"] += len(stats)
 
     # Grade each pending pick
+    newly_graded: List[Dict] = []
     for pick in pending_picks:
         try:
             sport = pick.get("sport", "").upper()
@@ -1535,6 +1536,10 @@ async def auto_grade_picks(
 
             if grade_result:
                 results["picks_graded"] += 1
+                newly_graded.append({**pick, "grade_status": "GRADED", "result": result,
+                                     "actual_value": actual_value,
+                                     "actual_home_score": home_score,
+                                     "actual_away_score": away_score})
 
                 # Build human-readable description and infer side if missing
                 matchup = pick.get("matchup") or f"{pick.get('away_team', '')} @ {pick.get('home_team', '')}"
@@ -1598,6 +1603,22 @@ async def auto_grade_picks(
 
     # Note: grader_store updates picks in-place, no need to rewrite log
 
+    # v20.30: Materialize training features for the newly graded picks
+    if newly_graded:
+        try:
+            from services.feature_store import FEATURE_STORE_ENABLED, get_feature_store
+            if FEATURE_STORE_ENABLED:
+                get_feature_store().append(newly_graded)
+        except Exception as e:
+            logger.warning("Feature store append skipped: %s", e)
+
+        # v20.30: Online updates for the team matchup/ensemble models
+        try:
+            from team_ml_models import apply_graded_picks
+            results["online_model_updates"] = apply_graded_picks(newly_graded)
+        except Exception as e:
+            logger.warning("Online model updates skipped: %s", e)
+
     # Calculate summary stats
     graded = results["graded_picks"]
     if graded:
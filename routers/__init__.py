@@ -4,6 +4,9 @@ ROUTERS - FastAPI Router Modules
 This package contains FastAPI routers split from the monolithic live_data_router.py
 for better maintainability and separation of concerns.
 
+Routers are imported on first access (PEP 562 module __getattr__), so importing
+the package is free and a process only pays for the routers it registers.
+
 Usage:
     from routers import community_router, esoteric_router, line_shop_router, betting_router
 
@@ -11,20 +14,41 @@ Usage:
     app.include_router(esoteric_router, prefix="/live")
     app.include_router(line_shop_router, prefix="/live")
     app.include_router(betting_router, prefix="/live")
+
+    # v20.30: live_* routers carry their own /live prefix and output contract
+    from routers import live_ops_router
+    app.include_router(live_ops_router)
 """
 
-from .community import router as community_router
-from .esoteric import router as esoteric_router
-from .line_shop import router as line_shop_router
-from .betting import router as betting_router
-from .debug import router as debug_router
-from .grader import router as grader_router
-
-__all__ = [
-    'community_router',
-    'esoteric_router',
-    'line_shop_router',
-    'betting_router',
-    'debug_router',
-    'grader_router',
-]
+import importlib
+
+# Exported name -> submodule defining `router`
+_ROUTER_MODULES = {
+    'community_router': 'community',
+    'esoteric_router': 'esoteric',
+    'line_shop_router': 'line_shop',
+    'betting_router': 'betting',
+    'debug_router': 'debug',
+    'grader_router': 'grader',
+    'jobs_router': 'jobs',
+    'live_ops_router': 'live_ops',
+    'live_picks_router': 'live_picks',
+    'live_astro_router': 'live_astro',
+    'live_dashboard_router': 'live_dashboard',
+}
+
+
+def __getattr__(name):
+    module = _ROUTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = importlib.import_module(f"{__name__}.{module}").router
+    globals()[name] = router
+    return router
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_ROUTER_MODULES))
+
+
+__all__ = list(_ROUTER_MODULES)
@@ -8,12 +8,14 @@ Endpoints for:
 - User preferences management (/user/preferences/{user_id})
 - Bet tracking and grading (/bets/*)
 - Parlay building and management (/parlay/*)
+- Correlation-aware parlay search (/parlay/optimize)
 - Quick betslip generation (/quick-betslip/{sport}/{game_id})
 - Correlation listing (/correlations)
 
 Extracted from live_data_router.py for maintainability.
 """
 
+import asyncio
 import logging
 import random
 from datetime import datetime
@@ -40,6 +42,13 @@ try:
 except ImportError:
     PYDANTIC_MODELS_AVAILABLE = False
 
+# Correlation-aware parlay pricing (needs numpy)
+try:
+    from core.parlay_pricing import price_parlay, search_parlays
+    PARLAY_PRICING_AVAILABLE = True
+except ImportError:
+    PARLAY_PRICING_AVAILABLE = False
+
 
 router = APIRouter(tags=["betting"])
 
@@ -146,6 +155,22 @@ def calculate_parlay_odds(legs: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def calculate_correlated_parlay(legs: List[Dict[str, Any]], sport: str = "NBA") -> Optional[Dict[str, Any]]:
+    """
+    Joint hit probability and EV with same-game correlation (Gaussian copula).
+
+    Returns None when the pricing engine is unavailable or fails, so callers
+    can keep returning the independent-leg odds.
+    """
+    if not PARLAY_PRICING_AVAILABLE or len(legs) < 2:
+        return None
+    try:
+        return price_parlay(legs, sport=sport)
+    except Exception as e:
+        logger.warning("Correlated parlay pricing failed: %s", e)
+        return None
+
+
 def calculate_payout(stake: float, odds: int) -> float:
     """Calculate potential payout from American odds."""
     if stake <= 0:
@@ -309,12 +334,16 @@ async def parlay_architect(leg1: Dict[str, Any], leg2: Dict[str, Any]):
     else:
         recommendation = "INDEPENDENT - No Correlation Edge"
 
+    # Copula simulation is CPU-bound; keep it off the event loop
+    pricing = await asyncio.to_thread(calculate_correlated_parlay, [leg1, leg2], sport=leg1.get("sport", "NFL"))
+
     return {
         "stack_type": stack_type,
         "correlation": round(correlation, 2),
         "glitch_score": round(min(10, max(0, base_score)), 1),
         "recommendation": recommendation,
         "edge_explanation": description,
+        "pricing": pricing,
         "leg1": leg1,
         "leg2": leg2,
         "timestamp": datetime.now().isoformat()
@@ -1117,6 +1146,7 @@ async def calculate_parlay(calc_data: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="At least one leg required")
 
     combined = calculate_parlay_odds(legs)
+    correlated = await asyncio.to_thread(calculate_correlated_parlay, legs, sport=calc_data.get("sport", "NBA"))
 
     if stake > 0:
         potential_payout = round(stake * combined["decimal"], 2)
@@ -1128,6 +1158,7 @@ async def calculate_parlay(calc_data: Dict[str, Any]):
     return {
         "leg_count": len(legs),
         "combined_odds": combined,
+        "correlated_pricing": correlated,
         "stake": stake,
         "potential_payout": potential_payout,
         "profit_if_win": profit,
@@ -1141,6 +1172,49 @@ async def calculate_parlay(calc_data: Dict[str, Any]):
     }
 
 
+@router.post("/parlay/optimize")
+async def optimize_parlay(optimize_data: Dict[str, Any]):
+    """
+    Find the best-EV N-leg parlays in a candidate pool, priced with
+    same-game correlation.
+
+    Request Body:
+    {
+        "sport": "NBA",
+        "candidates": [
+            {"game_id": "...", "player_name": "...", "prop_type": "player_points",
+             "side": "Over", "line": 24.5, "odds": -110, "probability": 0.56},
+            ...
+        ],
+        "num_legs": 3,
+        "top": 10
+    }
+
+    Legs without a probability use the book's implied probability.
+    """
+    if not PARLAY_PRICING_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Parlay pricing engine unavailable")
+
+    candidates = optimize_data.get("candidates") or optimize_data.get("legs") or []
+    num_legs = int(optimize_data.get("num_legs", 3))
+    top = min(max(1, int(optimize_data.get("top", 10))), 50)
+
+    if num_legs < 2 or num_legs > 6:
+        raise HTTPException(status_code=400, detail="num_legs must be between 2 and 6")
+    if len(candidates) < num_legs:
+        raise HTTPException(status_code=400, detail=f"At least {num_legs} candidates required")
+
+    # Combination search is CPU-bound; keep it off the event loop
+    result = await asyncio.to_thread(
+        search_parlays, candidates, num_legs=num_legs, sport=optimize_data.get("sport", "NBA"), top=top
+    )
+    return {
+        **result,
+        "num_legs": num_legs,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 __all__ = [
     'router',
     'CORRELATION_MATRIX',
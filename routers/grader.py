@@ -419,28 +419,10 @@ async def run_grader_audit(audit_config: Dict[str, Any] = None):
     if not AUTO_GRADER_AVAILABLE:
         raise HTTPException(status_code=503, detail="Auto-grader module not available")
 
-    try:
-        grader = get_grader()  # Use singleton
-
-        config = audit_config or {}
-        days_back = config.get("days_back", 1)
-        apply_changes = config.get("apply_changes", True)
-
-        # Run full audit
-        results = grader.run_daily_audit(days_back=days_back)
-
-        return {
-            "status": "audit_complete",
-            "days_analyzed": days_back,
-            "changes_applied": apply_changes,
-            "results": results,
-            "timestamp": datetime.now().isoformat(),
-            "note": "Weights have been adjusted based on prediction performance"
-        }
-
-    except Exception as e:
-        logger.exception("Audit failed: %s", e)
-        raise HTTPException(status_code=500, detail=str(e))
+    # v20.30: The audit runs in the scheduler worker; poll GET /live/jobs/{job_id} for results
+    from core.heavy_jobs import JOB_GRADER_RUN_AUDIT, enqueue_heavy_job
+    config = audit_config or {}
+    return enqueue_heavy_job(JOB_GRADER_RUN_AUDIT, {"days_back": config.get("days_back", 1)})
 
 
 # =============================================================================
@@ -679,36 +661,12 @@ async def train_team_models_endpoint(config: Dict[str, Any] = None):
         "sport": "NBA"       # Filter to specific sport (default: all)
     }
 
-    Returns training results including telemetry proving execution.
+    Returns a queued job id; the job result holds the training results
+    including telemetry proving execution.
     """
-    try:
-        from scripts.train_team_models import train_all
-
-        cfg = config or {}
-        days = cfg.get("days", 7)
-        sport = cfg.get("sport")
-
-        result = train_all(days=days, sport=sport)
-
-        return {
-            "status": "success",
-            "training_result": result,
-            "timestamp": datetime.now().isoformat(),
-            "note": "Check model_status.training_telemetry to verify persistence"
-        }
-    except ImportError as e:
-        return {
-            "status": "error",
-            "error": f"Training module not available: {e}",
-            "timestamp": datetime.now().isoformat()
-        }
-    except Exception as e:
-        logger.error(f"Team model training failed: {e}")
-        return {
-            "status": "error",
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
+    from core.heavy_jobs import JOB_TRAIN_TEAM_MODELS, enqueue_heavy_job
+    cfg = config or {}
+    return enqueue_heavy_job(JOB_TRAIN_TEAM_MODELS, {"days": cfg.get("days", 7), "sport": cfg.get("sport")})
 
 
 # =============================================================================
@@ -0,0 +1,47 @@
+"""
+JOBS ROUTER - Background job status and results
+
+Heavy on-demand endpoints (training, audits, auto-grade) return a job id
+instead of blocking the request; these endpoints report status, progress
+and the result of those jobs (see core/job_queue.py, core/heavy_jobs.py).
+
+Endpoints (mounted under /live):
+    GET /jobs             - Recent jobs (filter by status / type)
+    GET /jobs/{job_id}    - One job: status, progress, result or error
+"""
+
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+import logging
+
+# Auth dependency
+from core.auth import verify_api_key
+from core.job_queue import JOB_STATUSES, get_job_queue
+
+logger = logging.getLogger("jobs_router")
+
+router = APIRouter(tags=["jobs"])
+
+
+@router.get("/jobs")
+async def list_jobs(
+    status: Optional[str] = None,
+    job_type: Optional[str] = None,
+    limit: int = 50,
+    api_key: str = Depends(verify_api_key),
+):
+    """Most recent jobs first."""
+    if status and status not in JOB_STATUSES:
+        raise HTTPException(status_code=400, detail=f"status must be one of {list(JOB_STATUSES)}")
+    queue = get_job_queue()
+    jobs = queue.list(status=status, job_type=job_type, limit=max(1, min(limit, 500)))
+    return {"backend": queue.backend, "count": len(jobs), "jobs": jobs}
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str, api_key: str = Depends(verify_api_key)):
+    """Status, progress (0-1 plus message) and, once finished, result or error."""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
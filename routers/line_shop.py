@@ -4,7 +4,7 @@ LINE_SHOP.PY - Line Shopping & Betslip Router
 Line shopping, betslip generation, and sportsbook configuration.
 
 Endpoints:
-    GET  /line-shop/{sport}   - Get odds from multiple sportsbooks for line shopping
+    GET  /line-shop/{sport}   - Get odds from multiple sportsbooks for line shopping (ETag / 304)
     GET  /betslip/generate    - Generate deep links for placing a specific bet
     GET  /sportsbooks         - List all supported sportsbooks with branding info
 """
@@ -14,10 +14,11 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
 
 from core.auth import verify_api_key
+from core.response_cache import get_payload_store
 from core.sportsbooks import SPORTSBOOK_CONFIGS
 
 logger = logging.getLogger(__name__)
@@ -51,11 +52,25 @@ def _cache_get(key: str) -> Optional[Dict]:
 
 
 def _cache_set(key: str, data: Dict, ttl: int = 120):
-    """Set cache value with TTL in seconds."""
+    """Set cache value with TTL in seconds (and its pre-serialized public body)."""
     _line_shop_cache[key] = {
         "data": data,
         "expires_at": datetime.now().timestamp() + ttl
     }
+    get_payload_store().put(key, _sanitize_public(data), ttl=ttl)
+
+
+def _payload_response(key: str, data: Dict, request: Request, ttl: int = 120) -> Response:
+    """Serve the pre-serialized body for key; 304 when If-None-Match still matches."""
+    store = get_payload_store()
+    pre = store.get(key)
+    if pre is None:
+        pre = store.put(key, _sanitize_public(data), ttl=ttl)
+    status_code, body, headers = pre.render(
+        if_none_match=request.headers.get("if-none-match"),
+        accept_encoding=request.headers.get("accept-encoding"),
+    )
+    return Response(content=body, status_code=status_code, media_type="application/json", headers=headers)
 
 
 def _sanitize_public(payload: dict) -> dict:
@@ -216,8 +231,8 @@ def generate_fallback_betslip(sport: str, game_id: str, bet_type: str, selection
 async def _fetch_odds_api(url: str, params: Dict[str, Any]) -> Optional[Dict]:
     """Fetch from Odds API with retry logic."""
     try:
-        from odds_api import odds_api_get
-        resp, used = await odds_api_get(url, params)
+        from odds_api import odds_api_get_cached
+        resp, used = await odds_api_get_cached(url, params)
         if resp and resp.status_code == 200:
             return resp.json()
         return None
@@ -227,7 +242,7 @@ async def _fetch_odds_api(url: str, params: Dict[str, Any]) -> Optional[Dict]:
 
 
 @router.get("/line-shop/{sport}")
-async def get_line_shopping(sport: str, game_id: Optional[str] = None):
+async def get_line_shopping(request: Request, sport: str, game_id: Optional[str] = None):
     """
     Get odds from multiple sportsbooks for line shopping.
     Returns best odds for each side of each bet.
@@ -242,7 +257,7 @@ async def get_line_shopping(sport: str, game_id: Optional[str] = None):
     cache_key = f"line-shop:{sport_lower}:{game_id or 'all'}"
     cached = _cache_get(cache_key)
     if cached:
-        return JSONResponse(_sanitize_public(cached))
+        return _payload_response(cache_key, cached, request)
 
     sport_config = SPORT_MAPPINGS[sport_lower]
 
@@ -273,7 +288,7 @@ async def get_line_shopping(sport: str, game_id: Optional[str] = None):
                 "timestamp": datetime.now().isoformat()
             }
             _cache_set(cache_key, result, ttl=120)
-            return JSONResponse(_sanitize_public(result))
+            return _payload_response(cache_key, result, request)
 
         games = data if isinstance(data, list) else data.get("data", [])
         line_shop_data = []
@@ -358,7 +373,7 @@ async def get_line_shopping(sport: str, game_id: Optional[str] = None):
         }
 
         _cache_set(cache_key, result, ttl=120)  # 2 min cache for line shopping
-        return JSONResponse(_sanitize_public(result))
+        return _payload_response(cache_key, result, request)
 
     except HTTPException:
         raise
@@ -375,7 +390,7 @@ async def get_line_shopping(sport: str, game_id: Optional[str] = None):
             "timestamp": datetime.now().isoformat()
         }
         _cache_set(cache_key, result, ttl=120)
-        return JSONResponse(_sanitize_public(result))
+        return _payload_response(cache_key, result, request)
 
 
 @router.get("/betslip/generate")
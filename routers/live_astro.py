@@ -0,0 +1,277 @@
+"""
+LIVE ASTRO ROUTER - Jarvis trigger and confluence core endpoints
+
+Extracted from live_data_router.py. Uses the lazily created engines in
+core/esoteric_engines.py.
+
+Endpoints (all under /live):
+    GET /validate-immortal
+    GET /jarvis-triggers
+    GET /check-trigger/{value}
+    GET /confluence/{sport}
+    GET /astro-status
+    GET /planetary-hour
+    GET /nakshatra
+    GET /retrograde-status
+"""
+
+import logging
+from datetime import datetime
+
+from fastapi import HTTPException
+
+from core.esoteric_engines import get_esoteric_loop, get_jarvis_savant, get_vedic_astro
+from core.live_contract import live_router
+from core.live_http import SPORT_MAPPINGS
+from core.scoring_contract import ENGINE_WEIGHTS
+from core.scoring_pipeline import compute_final_score_option_a
+
+logger = logging.getLogger("live_data")
+
+router = live_router()
+
+
+# ============================================================================
+# PHASE 1: CONFLUENCE CORE ENDPOINTS
+# ============================================================================
+
+@router.get("/validate-immortal")
+async def validate_immortal():
+    """
+    Validate 2178 as THE IMMORTAL number.
+
+    Mathematical proof that 2178 is the only 4-digit number where:
+    - n^4 contains n
+    - reverse(n)^4 contains reverse(n)
+    - Digital root = 9 (Tesla completion)
+    """
+    jarvis = get_jarvis_savant()
+    if not jarvis:
+        raise HTTPException(status_code=503, detail="JarvisSavantEngine not available")
+
+    return jarvis.validate_2178()
+
+
+@router.get("/jarvis-triggers")
+async def list_jarvis_triggers():
+    """List all JARVIS trigger numbers with their properties."""
+    jarvis = get_jarvis_savant()
+    if not jarvis:
+        raise HTTPException(status_code=503, detail="JarvisSavantEngine not available")
+
+    return {
+        "triggers": jarvis.triggers,
+        "power_numbers": jarvis.power_numbers,
+        "tesla_numbers": jarvis.tesla_numbers,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.get("/check-trigger/{value}")
+async def check_trigger(value: str):
+    """
+    Check if a value triggers any JARVIS numbers.
+
+    Supports:
+    - Direct number matches (e.g., 2178)
+    - Gematria reduction of strings (e.g., "Lakers")
+    """
+    jarvis = get_jarvis_savant()
+    if not jarvis:
+        raise HTTPException(status_code=503, detail="JarvisSavantEngine not available")
+
+    # Try to parse as number first
+    try:
+        numeric_value = int(value)
+        return jarvis.check_jarvis_trigger(numeric_value)
+    except ValueError:
+        return jarvis.check_jarvis_trigger(value)
+
+
+@router.get("/confluence/{sport}")
+async def get_confluence_analysis(
+    sport: str,
+    player: str = "Player",
+    team: str = "Team",
+    opponent: str = "Opponent",
+    spread: float = 0,
+    total: float = 220,
+    public_pct: float = 50,
+    research_score: float = 7.0  # v10.1: Allow passing external research score
+):
+    """
+    Calculate v10.1 dual-score confluence analysis for a pick.
+
+    THE HEART - v10.1 Alignment System:
+    - IMMORTAL (+10): 2178 + both ≥7.5 + alignment ≥80%
+    - JARVIS_PERFECT (+7): Trigger + both ≥7.5 + alignment ≥80%
+    - PERFECT (+5): both ≥7.5 + alignment ≥80%
+    - STRONG (+3): Both high OR aligned ≥70%
+    - MODERATE (+1): Aligned ≥60%
+    - DIVERGENT (+0): Models disagree
+
+    Alignment = 1 - |research - esoteric| / 10
+    """
+    sport_lower = sport.lower()
+    if sport_lower not in SPORT_MAPPINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+
+    jarvis = get_jarvis_savant()
+    vedic = get_vedic_astro()
+    learning = get_esoteric_loop()
+
+    if not jarvis or not vedic:
+        raise HTTPException(status_code=503, detail="Esoteric engines not available")
+
+    esoteric_weights = learning.get_weights()["weights"] if learning else {}
+
+    # Calculate all signals
+    gematria = jarvis.calculate_gematria_signal(player, team, opponent)
+    public_fade = jarvis.calculate_public_fade_signal(public_pct)
+    mid_spread = jarvis.calculate_mid_spread_signal(spread)
+    trap = jarvis.calculate_large_spread_trap(spread, total)
+    astro = vedic.calculate_astro_score()
+
+    # v10.1: Fibonacci alignment and Vortex pattern
+    fib_alignment = jarvis.calculate_fibonacci_alignment(float(spread) if spread else 0)
+    vortex_value = int(abs(spread * 10)) if spread else 0
+    vortex_pattern = jarvis.calculate_vortex_pattern(vortex_value)
+
+    # Check for JARVIS triggers in player/team names
+    game_str = f"{player}{team}{opponent}"
+    trigger_result = jarvis.check_jarvis_trigger(game_str)
+    jarvis_triggered = len(trigger_result.get("triggers_hit", [])) > 0
+    immortal_detected = any(t["number"] == 2178 for t in trigger_result.get("triggers_hit", []))
+
+    # Calculate JARVIS score from triggers
+    jarvis_score = 0.0
+    for trig in trigger_result.get("triggers_hit", []):
+        jarvis_score += trig["boost"] / 5
+    jarvis_score = min(4.0, jarvis_score)
+
+    # v10.1: Calculate esoteric score
+    gematria_contribution = gematria.get("influence", 0) * 0.52 * 2 if gematria.get("triggered") else 0
+    astro_contribution = (astro["overall_score"] - 50) / 50 * esoteric_weights.get("astro", 0.13) * 2
+
+    esoteric_raw = (
+        jarvis_score +
+        gematria_contribution +
+        max(0, astro_contribution) +
+        mid_spread.get("modifier", 0) +
+        fib_alignment.get("modifier", 0) +
+        vortex_pattern.get("modifier", 0) +
+        public_fade.get("influence", 0) +
+        trap.get("modifier", 0)
+    )
+    esoteric_score = max(0, min(10, esoteric_raw * 1.25))
+
+    # v10.1: Calculate dual-score confluence
+    confluence = jarvis.calculate_confluence(
+        research_score=research_score,
+        esoteric_score=esoteric_score,
+        immortal_detected=immortal_detected,
+        jarvis_triggered=jarvis_triggered
+    )
+
+    # v10.1: Calculate final score and bet tier (Option A weights)
+    ai_score = 0.0  # No AI engine inputs in this legacy endpoint
+    jarvis_score_10 = min(10.0, jarvis_score * 2.5)
+    base_score = (
+        (ai_score * ENGINE_WEIGHTS["ai"]) +
+        (research_score * ENGINE_WEIGHTS["research"]) +
+        (esoteric_score * ENGINE_WEIGHTS["esoteric"]) +
+        (jarvis_score_10 * ENGINE_WEIGHTS["jarvis"])
+    )
+    context_modifier = 0.0
+    jason_sim_boost = 0.0
+    final_score, context_modifier = compute_final_score_option_a(
+        base_score=base_score,
+        context_modifier=context_modifier,
+        confluence_boost=confluence.get("boost", 0),
+        msrf_boost=0.0,
+        jason_sim_boost=jason_sim_boost,
+        serp_boost=0.0,
+    )
+    bet_tier = jarvis.determine_bet_tier(final_score, confluence)
+
+    return {
+        "sport": sport.upper(),
+        "version": "v10.1",
+        "input": {
+            "player": player,
+            "team": team,
+            "opponent": opponent,
+            "spread": spread,
+            "total": total,
+            "public_pct": public_pct,
+            "research_score": research_score
+        },
+        "signals": {
+            "gematria": gematria,
+            "public_fade": public_fade,
+            "mid_spread": mid_spread,
+            "trap": trap,
+            "astro": astro,
+            "fibonacci": fib_alignment,
+            "vortex": vortex_pattern
+        },
+        "jarvis_triggers": trigger_result.get("triggers_hit", []),
+        "scoring": {
+            "research_score": round(research_score, 2),
+            "esoteric_score": round(esoteric_score, 2),
+            "final_score": round(final_score, 2),
+            "formula": "FINAL = BASE_4 + context_modifier + confluence_boost + jason_sim_boost (+ msrf/serp if enabled)"
+        },
+        "confluence": confluence,
+        "bet_tier": bet_tier,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+# ============================================================================
+# PHASE 2: VEDIC/ASTRO ENDPOINTS
+# ============================================================================
+
+@router.get("/astro-status")
+async def get_astro_status():
+    """Get full astrological analysis for current moment."""
+    vedic = get_vedic_astro()
+    if not vedic:
+        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
+
+    return vedic.calculate_astro_score()
+
+
+@router.get("/planetary-hour")
+async def get_planetary_hour():
+    """Get current planetary hour ruler (Chaldean order)."""
+    vedic = get_vedic_astro()
+    if not vedic:
+        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
+
+    return vedic.calculate_planetary_hour()
+
+
+@router.get("/nakshatra")
+async def get_nakshatra():
+    """Get current Nakshatra (lunar mansion)."""
+    vedic = get_vedic_astro()
+    if not vedic:
+        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
+
+    return vedic.calculate_nakshatra()
+
+
+@router.get("/retrograde-status")
+async def get_retrograde_status():
+    """Check retrograde status for Mercury, Venus, and Mars."""
+    vedic = get_vedic_astro()
+    if not vedic:
+        raise HTTPException(status_code=503, detail="VedicAstroEngine not available")
+
+    return {
+        "mercury": vedic.is_planet_retrograde("Mercury"),
+        "venus": vedic.is_planet_retrograde("Venus"),
+        "mars": vedic.is_planet_retrograde("Mars"),
+        "timestamp": datetime.now().isoformat()
+    }
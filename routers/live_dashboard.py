@@ -0,0 +1,667 @@
+"""
+LIVE DASHBOARD ROUTER - Sport dashboard, game details and parlay builder
+
+Extracted from live_data_router.py. These endpoints aggregate the best-bets,
+sharp, splits, injuries, lines and props endpoints, which stay with the
+scoring pipeline; live_data_router is imported on first request.
+
+Endpoints (all under /live):
+    GET /quick-betslip/{sport}/{game_id}
+    GET /sport-dashboard/{sport}
+    GET /game-details/{sport}/{game_id}
+    GET /parlay-builder-init/{sport}
+"""
+
+import asyncio
+import importlib
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi import Depends, HTTPException
+
+from core.auth import verify_api_key
+from core.esoteric_engines import get_daily_energy
+from core.hybrid_cache import api_cache
+from core.live_contract import live_router
+from core.live_http import SPORT_MAPPINGS
+from core.sportsbooks import SPORTSBOOK_CONFIGS
+
+logger = logging.getLogger("live_data")
+
+try:
+    from core.time_et import now_et
+    TIME_ET_AVAILABLE = True
+except ImportError:
+    TIME_ET_AVAILABLE = False
+
+
+def _live():
+    """live_data_router, imported on first use (the dashboards aggregate its data endpoints)."""
+    return importlib.import_module("live_data_router")
+
+
+def _betting():
+    """routers.betting, owner of the in-memory parlay slips and placed-parlay history."""
+    return importlib.import_module("routers.betting")
+
+
+router = live_router()
+
+
+# ============================================================================
+# QUICK BETSLIP
+# ============================================================================
+
+# Fallback for quick-betslip endpoint (actual preferences stored in routers/betting.py)
+_user_preferences: Dict[str, Dict[str, Any]] = {}
+
+
+@router.get("/quick-betslip/{sport}/{game_id}")
+async def quick_betslip(
+    sport: str,
+    game_id: str,
+    user_id: Optional[str] = None
+):
+    """
+    Generate a quick betslip for a game with user's preferred sportsbooks prioritized.
+
+    One-click flow for SMASH picks:
+    1. Gets current best odds across all books
+    2. Prioritizes user's favorite books
+    3. Returns ready-to-click betslip with deep links
+    """
+    sport_lower = sport.lower()
+    if sport_lower not in SPORT_MAPPINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+
+    # Get user preferences
+    user_prefs = _user_preferences.get(user_id, {}) if user_id else {}
+    favorite_books = user_prefs.get("favorite_books", ["draftkings", "fanduel", "betmgm"])
+    default_stake = user_prefs.get("default_bet_amount", 25)
+
+    # Get line shopping data
+    cache_key = f"line-shop:{sport_lower}:{game_id}"
+    cached = api_cache.get(cache_key)
+
+    if cached and "data" in cached:
+        game_data = next((g for g in cached["data"] if g.get("game_id") == game_id), None)
+    else:
+        game_data = None
+
+    if not game_data:
+        # Use fallback
+        game_data = {
+            "game_id": game_id,
+            "home_team": "Home Team",
+            "away_team": "Away Team",
+            "markets": {}
+        }
+
+    # Build quick betslip with prioritized books
+    betslip_options = []
+
+    for book_key in favorite_books:
+        if book_key in SPORTSBOOK_CONFIGS:
+            config = SPORTSBOOK_CONFIGS[book_key]
+            betslip_options.append({
+                "book_key": book_key,
+                "book_name": config["name"],
+                "book_color": config["color"],
+                "book_logo": config.get("logo", ""),
+                "is_favorite": True,
+                "priority": favorite_books.index(book_key) + 1,
+                "deep_link": generate_enhanced_deep_link(book_key, sport_lower, game_id, game_data)
+            })
+
+    # Add remaining books
+    for book_key, config in SPORTSBOOK_CONFIGS.items():
+        if book_key not in favorite_books:
+            betslip_options.append({
+                "book_key": book_key,
+                "book_name": config["name"],
+                "book_color": config["color"],
+                "book_logo": config.get("logo", ""),
+                "is_favorite": False,
+                "priority": 99,
+                "deep_link": generate_enhanced_deep_link(book_key, sport_lower, game_id, game_data)
+            })
+
+    return {
+        "sport": sport.upper(),
+        "game_id": game_id,
+        "game": game_data,
+        "default_stake": default_stake,
+        "sportsbooks": betslip_options,
+        "user_preferences_applied": user_id is not None,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+# ============================================================================
+# PARLAY BUILDER - Moved to routers/betting.py
+# ============================================================================
+# Endpoints moved to routers/betting.py:
+# - GET /parlay/{user_id} (get parlay slip)
+# - POST /parlay/add (add leg to parlay)
+# - DELETE /parlay/remove/{user_id}/{leg_id} (remove leg)
+# - DELETE /parlay/clear/{user_id} (clear slip)
+# - POST /parlay/place (place parlay bet)
+# - POST /parlay/grade/{parlay_id} (grade parlay)
+# - GET /parlay/history (parlay history)
+# - POST /parlay/calculate (preview calculation)
+
+
+# ============================================================================
+# COMMUNITY FEATURES: Moved to routers/community.py
+# ============================================================================
+
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def calculate_payout(stake: float, odds: int) -> float:
+    """Calculate potential payout from American odds."""
+    if stake <= 0:
+        return 0
+    if odds > 0:
+        return stake + (stake * odds / 100)
+    else:
+        return stake + (stake * 100 / abs(odds))
+
+
+def generate_enhanced_deep_link(book_key: str, sport: str, game_id: str, game_data: Dict) -> Dict[str, str]:
+    """Generate enhanced deep links with sport-specific URLs."""
+    config = SPORTSBOOK_CONFIGS.get(book_key)
+    if not config:
+        return {"web": "#", "note": "Unknown sportsbook"}
+
+    sport_paths = {
+        "nba": {
+            "draftkings": "basketball/nba",
+            "fanduel": "navigation/nba",
+            "betmgm": "sports/basketball/104/nba",
+            "caesars": "us/nba",
+            "pointsbetus": "sports/basketball/nba",
+            "williamhill_us": "sports/basketball/nba",
+            "barstool": "sports/basketball/nba",
+            "betrivers": "sports/basketball/nba"
+        },
+        "nfl": {
+            "draftkings": "football/nfl",
+            "fanduel": "navigation/nfl",
+            "betmgm": "sports/football/100/nfl",
+            "caesars": "us/nfl",
+            "pointsbetus": "sports/football/nfl",
+            "williamhill_us": "sports/football/nfl",
+            "barstool": "sports/football/nfl",
+            "betrivers": "sports/football/nfl"
+        },
+        "mlb": {
+            "draftkings": "baseball/mlb",
+            "fanduel": "navigation/mlb",
+            "betmgm": "sports/baseball/103/mlb",
+            "caesars": "us/mlb",
+            "pointsbetus": "sports/baseball/mlb",
+            "williamhill_us": "sports/baseball/mlb",
+            "barstool": "sports/baseball/mlb",
+            "betrivers": "sports/baseball/mlb"
+        },
+        "nhl": {
+            "draftkings": "hockey/nhl",
+            "fanduel": "navigation/nhl",
+            "betmgm": "sports/hockey/102/nhl",
+            "caesars": "us/nhl",
+            "pointsbetus": "sports/hockey/nhl",
+            "williamhill_us": "sports/hockey/nhl",
+            "barstool": "sports/hockey/nhl",
+            "betrivers": "sports/hockey/nhl"
+        }
+    }
+
+    sport_path = sport_paths.get(sport, {}).get(book_key, sport)
+
+    home_team = game_data.get("home_team", "").replace(" ", "-").lower()
+    away_team = game_data.get("away_team", "").replace(" ", "-").lower()
+
+    # Build URL with game context when possible
+    base_url = config["web_base"]
+    full_url = f"{base_url}/{sport_path}"
+
+    return {
+        "web": full_url,
+        "app_scheme": config.get("app_scheme", ""),
+        "sport_path": sport_path,
+        "note": f"Opens {config['name']} {sport.upper()} page"
+    }
+
+
+# ============================================================================
+# CONSOLIDATED ENDPOINTS (Server-Side Data Fetching)
+# Reduces client-side waterfalls by combining multiple API calls into one
+# ============================================================================
+
+@router.get("/sport-dashboard/{sport}")
+async def get_sport_dashboard(sport: str, auth: bool = Depends(verify_api_key)):
+    """
+    Consolidated endpoint for sport dashboard page.
+    Replaces 6 separate API calls with a single request.
+
+    Combines: best-bets, splits, lines, props, injuries, sharp
+
+    Response Schema:
+    {
+        "sport": "NBA",
+        "best_bets": { props: [], game_picks: [] },
+        "market_overview": {
+            "lines": [...],
+            "splits": [...],
+            "sharp_signals": [...]
+        },
+        "context": {
+            "injuries": [...],
+            "props": [...]
+        },
+        "daily_energy": {...},
+        "timestamp": "ISO timestamp",
+        "cache_info": { sources: {...} }
+    }
+    """
+    sport_lower = sport.lower()
+    if sport_lower not in SPORT_MAPPINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+
+    # Check cache first
+    cache_key = f"sport-dashboard:{sport_lower}"
+    cached = api_cache.get(cache_key)
+    if cached:
+        cached["cache_info"] = {"hit": True}
+        return cached
+
+    # Fetch all data in parallel
+    try:
+        results = await asyncio.gather(
+            _live().get_best_bets(sport),
+            _live().get_splits(sport),
+            _live().get_lines(sport),
+            _live().get_injuries(sport),
+            _live().get_sharp_money(sport),
+            return_exceptions=True
+        )
+
+        best_bets, splits, lines, injuries, sharp = results
+
+        # Handle any exceptions gracefully
+        cache_sources = {}
+
+        if isinstance(best_bets, Exception):
+            logger.warning("sport-dashboard: best_bets failed: %s", best_bets)
+            best_bets = {"props": [], "game_picks": []}
+            cache_sources["best_bets"] = "error"
+        else:
+            cache_sources["best_bets"] = best_bets.get("source", "unknown")
+
+        if isinstance(splits, Exception):
+            logger.warning("sport-dashboard: splits failed: %s", splits)
+            splits = {"data": []}
+            cache_sources["splits"] = "error"
+        else:
+            cache_sources["splits"] = splits.get("source", "unknown")
+
+        if isinstance(lines, Exception):
+            logger.warning("sport-dashboard: lines failed: %s", lines)
+            lines = {"data": []}
+            cache_sources["lines"] = "error"
+        else:
+            cache_sources["lines"] = lines.get("source", "unknown")
+
+        if isinstance(injuries, Exception):
+            logger.warning("sport-dashboard: injuries failed: %s", injuries)
+            injuries = {"data": []}
+            cache_sources["injuries"] = "error"
+        else:
+            cache_sources["injuries"] = injuries.get("source", "unknown")
+
+        if isinstance(sharp, Exception):
+            logger.warning("sport-dashboard: sharp failed: %s", sharp)
+            sharp = {"data": []}
+            cache_sources["sharp"] = "error"
+        else:
+            cache_sources["sharp"] = sharp.get("source", "unknown")
+
+        result = {
+            "sport": sport.upper(),
+            "best_bets": {
+                "props": best_bets.get("props", []),
+                "game_picks": best_bets.get("game_picks", [])
+            },
+            "market_overview": {
+                "lines": lines.get("data", []),
+                "splits": splits.get("data", []),
+                "sharp_signals": sharp.get("data", [])
+            },
+            "context": {
+                "injuries": injuries.get("data", [])
+            },
+            "daily_energy": best_bets.get("daily_energy", get_daily_energy()),
+            "timestamp": now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(tz=timezone.utc).isoformat(),
+            "cache_info": {"hit": False, "sources": cache_sources}
+        }
+
+        # Cache for 2 minutes (limited by best-bets TTL)
+        api_cache.set(cache_key, result, ttl=120)
+        return result
+
+    except Exception as e:
+        logger.exception("sport-dashboard failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Dashboard fetch failed: {str(e)}")
+
+
+@router.get("/game-details/{sport}/{game_id}")
+async def get_game_details(sport: str, game_id: str, auth: bool = Depends(verify_api_key)):
+    """
+    Consolidated endpoint for single game detail view.
+    Replaces 4+ separate API calls with a single request.
+
+    Combines: lines, props (filtered), sharp signals, injuries for specific game
+
+    Response Schema:
+    {
+        "sport": "NBA",
+        "game_id": "abc123",
+        "game": { home_team, away_team, commence_time },
+        "lines": { spreads: [], totals: [], moneylines: [] },
+        "props": [...],
+        "sharp_signals": {...},
+        "injuries": { home: [], away: [] },
+        "ai_pick": {...},
+        "timestamp": "ISO timestamp"
+    }
+    """
+    sport_lower = sport.lower()
+    if sport_lower not in SPORT_MAPPINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+
+    # Check cache first
+    cache_key = f"game-details:{sport_lower}:{game_id}"
+    cached = api_cache.get(cache_key)
+    if cached:
+        return cached
+
+    # Fetch all data in parallel
+    try:
+        results = await asyncio.gather(
+            _live().get_lines(sport),
+            _live().get_props(sport),
+            _live().get_sharp_money(sport),
+            _live().get_injuries(sport),
+            _live().get_best_bets(sport),
+            return_exceptions=True
+        )
+
+        lines_data, props_data, sharp_data, injuries_data, best_bets_data = results
+
+        # Find specific game in lines
+        game_info = None
+        game_lines = {"spreads": [], "totals": [], "moneylines": []}
+
+        if not isinstance(lines_data, Exception):
+            for game in lines_data.get("data", []):
+                if game.get("game_id") == game_id or game.get("id") == game_id:
+                    game_info = {
+                        "home_team": game.get("home_team"),
+                        "away_team": game.get("away_team"),
+                        "commence_time": game.get("commence_time")
+                    }
+                    game_lines = {
+                        "spreads": game.get("spreads", []),
+                        "totals": game.get("totals", []),
+                        "moneylines": game.get("moneylines", [])
+                    }
+                    break
+
+        # Filter props for this game
+        game_props = []
+        if not isinstance(props_data, Exception):
+            for prop in props_data.get("data", []):
+                if prop.get("game_id") == game_id or prop.get("event_id") == game_id:
+                    game_props.append(prop)
+
+        # Find sharp signal for this game
+        game_sharp = {}
+        if not isinstance(sharp_data, Exception):
+            for signal in sharp_data.get("data", []):
+                if signal.get("game_id") == game_id:
+                    game_sharp = signal
+                    break
+
+        # Filter injuries for this game's teams
+        game_injuries = {"home": [], "away": []}
+        if not isinstance(injuries_data, Exception) and game_info:
+            for inj in injuries_data.get("data", []):
+                team = inj.get("team", "")
+                if team == game_info.get("home_team"):
+                    game_injuries["home"].append(inj)
+                elif team == game_info.get("away_team"):
+                    game_injuries["away"].append(inj)
+
+        # Find AI pick for this game
+        ai_pick = None
+        if not isinstance(best_bets_data, Exception):
+            for pick in best_bets_data.get("game_picks", []):
+                if pick.get("game_id") == game_id:
+                    ai_pick = pick
+                    break
+            # Also check props
+            for prop in best_bets_data.get("props", []):
+                if prop.get("game_id") == game_id or prop.get("event_id") == game_id:
+                    if ai_pick is None:
+                        ai_pick = {"props": [prop]}
+                    elif "props" in ai_pick:
+                        ai_pick["props"].append(prop)
+                    else:
+                        ai_pick["props"] = [prop]
+
+        result = {
+            "sport": sport.upper(),
+            "game_id": game_id,
+            "game": game_info or {"home_team": "Unknown", "away_team": "Unknown"},
+            "lines": game_lines,
+            "props": game_props,
+            "sharp_signals": game_sharp,
+            "injuries": game_injuries,
+            "ai_pick": ai_pick,
+            "timestamp": now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(tz=timezone.utc).isoformat()
+        }
+
+        # Cache for 2 minutes
+        api_cache.set(cache_key, result, ttl=120)
+        return result
+
+    except Exception as e:
+        logger.exception("game-details failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Game details fetch failed: {str(e)}")
+
+
+@router.get("/parlay-builder-init/{sport}")
+async def get_parlay_builder_init(
+    sport: str,
+    user_id: Optional[str] = None,
+    auth: bool = Depends(verify_api_key)
+):
+    """
+    Consolidated endpoint for parlay builder page initialization.
+    Replaces 3-4 separate API calls with a single request.
+
+    Combines: best-bets (recommended props), props (full market), correlations, user parlay
+
+    Response Schema:
+    {
+        "sport": "NBA",
+        "recommended_props": [...],
+        "all_props": [...],
+        "correlations": {...},
+        "current_parlay": { legs: [], calculated_odds: null },
+        "user_history": { recent_parlays: [] },
+        "timestamp": "ISO timestamp"
+    }
+    """
+    sport_lower = sport.lower()
+    if sport_lower not in SPORT_MAPPINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+
+    # Check cache first (only cache non-user-specific data)
+    cache_key = f"parlay-builder:{sport_lower}"
+    cached_base = api_cache.get(cache_key)
+
+    # Fetch base data if not cached
+    if not cached_base:
+        try:
+            results = await asyncio.gather(
+                _live().get_best_bets(sport),
+                _live().get_props(sport),
+                return_exceptions=True
+            )
+
+            best_bets_data, props_data = results
+
+            recommended_props = []
+            if not isinstance(best_bets_data, Exception):
+                recommended_props = best_bets_data.get("props", [])
+
+            all_props = []
+            if not isinstance(props_data, Exception):
+                all_props = props_data.get("data", [])
+
+            cached_base = {
+                "recommended_props": recommended_props,
+                "all_props": all_props
+            }
+            api_cache.set(cache_key, cached_base, ttl=180)  # 3 minutes
+
+        except Exception as e:
+            logger.exception("parlay-builder-init fetch failed: %s", e)
+            cached_base = {"recommended_props": [], "all_props": []}
+
+    # Get correlation matrix (static, cached separately)
+    correlations = get_parlay_correlations()
+
+    # Get user-specific data if user_id provided
+    current_parlay = {"legs": [], "calculated_odds": None}
+    user_history = {"recent_parlays": []}
+
+    if user_id:
+        # Get current parlay slip (routers.betting keeps user_id -> list of legs)
+        current_parlay = {
+            "legs": list(_betting()._parlay_slips.get(user_id, [])),
+            "calculated_odds": None
+        }
+
+        # Calculate odds if legs exist
+        if current_parlay["legs"]:
+            try:
+                # Copula pricing (and a cold history load) stay off the event loop
+                calc_result = await asyncio.to_thread(calculate_parlay_odds_internal, current_parlay["legs"])
+                current_parlay["calculated_odds"] = calc_result
+            except Exception:
+                pass
+
+        # Get recent parlay history
+        user_parlays = [p for p in _betting()._placed_parlays if p.get("user_id") == user_id]
+        user_history["recent_parlays"] = sorted(
+            user_parlays,
+            key=lambda x: x.get("placed_at", ""),
+            reverse=True
+        )[:5]
+
+    result = {
+        "sport": sport.upper(),
+        "recommended_props": cached_base.get("recommended_props", []),
+        "all_props": cached_base.get("all_props", []),
+        "correlations": correlations,
+        "current_parlay": current_parlay,
+        "user_history": user_history,
+        "timestamp": now_et().isoformat() if TIME_ET_AVAILABLE else datetime.now(tz=timezone.utc).isoformat()
+    }
+
+    return result
+
+
+def get_parlay_correlations() -> Dict[str, Any]:
+    """Get static parlay correlation matrix."""
+    return {
+        "same_game": {
+            "QB_WR": 0.88,
+            "QB_TE": 0.75,
+            "RB_DST": -0.45,
+            "WR_WR": 0.35,
+            "QB_RB": 0.25
+        },
+        "cross_game": {
+            "same_position": 0.15,
+            "division_rivalry": 0.10
+        },
+        "warning_threshold": 0.70,
+        "boost_threshold": -0.30
+    }
+
+
+def calculate_parlay_odds_internal(legs: List[Dict]) -> Dict[str, Any]:
+    """
+    Price a parlay slip through the correlation-aware pricer (internal helper).
+
+    decimal/american odds are the book payout; implied_probability is the
+    joint hit probability with same-game correlation (Gaussian copula), not
+    the product of the legs. Falls back to independent legs only when the
+    pricer is unavailable.
+    """
+    if not legs:
+        return {"decimal_odds": 1.0, "american_odds": "+100", "implied_probability": 1.0}
+
+    try:
+        from core.parlay_pricing import price_parlay
+        priced = price_parlay(legs, sport=legs[0].get("sport") or "NBA")
+    except Exception as e:
+        logger.debug("Correlated parlay pricing unavailable: %s", e)
+        return _independent_parlay_odds(legs)
+
+    american = priced["book_american"]
+    return {
+        "decimal_odds": priced["book_decimal"],
+        "american_odds": f"+{american}" if american > 0 else str(american),
+        "implied_probability": round(priced["joint_probability"], 4),
+        "independent_probability": priced["independent_probability"],
+        "joint_probability": priced["joint_probability"],
+        "fair_american_odds": priced["fair_american"],
+        "expected_value": priced["expected_value"],
+        "correlated_pairs": priced["correlated_pairs"],
+        "pricing_method": priced["method"],
+        "leg_count": len(legs)
+    }
+
+
+def _independent_parlay_odds(legs: List[Dict]) -> Dict[str, Any]:
+    """Legs multiplied as independent events (fallback when the pricer is unavailable)."""
+    decimal_odds = 1.0
+    for leg in legs:
+        leg_odds = leg.get("odds", -110)
+        if leg_odds > 0:
+            decimal = 1 + (leg_odds / 100)
+        else:
+            decimal = 1 + (100 / abs(leg_odds))
+        decimal_odds *= decimal
+
+    # Convert to American
+    if decimal_odds >= 2.0:
+        american = f"+{int((decimal_odds - 1) * 100)}"
+    else:
+        american = f"-{int(100 / (decimal_odds - 1))}"
+
+    return {
+        "decimal_odds": round(decimal_odds, 3),
+        "american_odds": american,
+        "implied_probability": round(1 / decimal_odds, 4),
+        "pricing_method": "independent",
+        "leg_count": len(legs)
+    }
@@ -0,0 +1,434 @@
+"""
+LIVE OPS ROUTER - Health, cache and upstream API usage endpoints
+
+Extracted from live_data_router.py. Light endpoints for probes and ops
+dashboards: they only need the shared cache and HTTP client, never the
+scoring pipeline.
+
+Endpoints (all under /live):
+    GET /health
+    GET /version/{sport}
+    GET /cache/stats
+    GET /cache/clear
+    GET /playbook/usage
+    GET /playbook/health
+    GET /odds-api/usage
+    GET /api-usage
+    GET /api-health
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict
+
+from fastapi import HTTPException
+
+from cache_warmer import get_best_bets_warmer
+from core.hybrid_cache import api_cache
+from core.live_contract import live_router
+from core.live_http import (
+    ODDS_API_BASE, ODDS_API_KEY, PLAYBOOK_API_BASE, PLAYBOOK_API_KEY, SPORT_MAPPINGS, fetch_with_retries,
+)
+from core.request_coalescer import get_request_coalescer
+from core.response_cache import get_payload_store
+from core.scoring_offload import get_offload_stats
+
+logger = logging.getLogger("live_data")
+
+router = live_router()
+
+
+# ============================================================================
+# HEALTH & CACHE
+# ============================================================================
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint."""
+    return {
+        "status": "healthy",
+        "version": "14.4",
+        "codename": "JARVIS_SAVANT_v10.1",
+        "features": [
+            "Phase 1: Confluence Core",
+            "Phase 2: Vedic/Astro",
+            "Phase 3: Learning Loop",
+            "v10.1 Dual-Score Confluence",
+            "v10.1 Bet Tier System"
+        ],
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+# Smoke test endpoint moved to main.py to avoid route conflicts
+# See main.py line 64-66 for /live/smoke-test/alert-status endpoint
+
+
+@router.get("/version/{sport}")
+async def get_payload_version(sport: str):
+    """
+    Cheap change token for a sport's cached /live payloads.
+
+    Poll this instead of the full endpoints: "version" changes only when one of
+    best-bets / props / lines / sharp / injuries / line-shop bodies changes.
+    Then refetch with If-None-Match to get 304s for the unchanged ones.
+    """
+    sport_lower = sport.lower()
+    if sport_lower not in SPORT_MAPPINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sport: {sport}")
+    info = get_payload_store().version(sport_lower)
+    return {
+        "sport": sport.upper(),
+        "version": info["version"],
+        "seq": info["seq"],
+        "etags": info["etags"],
+    }
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """Get cache statistics for debugging."""
+    from odds_api import get_odds_response_cache, get_quota_state
+    return {
+        "cache": api_cache.stats(),
+        "odds_api_response_cache": get_odds_response_cache().stats(),
+        "public_payload_store": get_payload_store().stats(),
+        "odds_api_quota": get_quota_state(),
+        "scoring_offload": get_offload_stats(),
+        "best_bets_warmer": get_best_bets_warmer().stats(),
+        "request_coalescing": get_request_coalescer().stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.get("/cache/clear")
+async def cache_clear():
+    """Clear the API cache."""
+    api_cache.clear()
+    from odds_api import get_odds_response_cache
+    get_odds_response_cache().invalidate()
+    get_payload_store().invalidate()
+    get_request_coalescer().invalidate()
+    return {"status": "cache_cleared", "timestamp": datetime.now().isoformat()}
+
+
+@router.get("/playbook/usage")
+async def get_playbook_usage():
+    """
+    Get Playbook API plan and usage info.
+    Useful for monitoring API quota.
+    """
+    if not PLAYBOOK_API_KEY:
+        return {"error": "PLAYBOOK_API_KEY not configured", "status": "unavailable"}
+
+    try:
+        playbook_url = f"{PLAYBOOK_API_BASE}/me"
+        resp = await fetch_with_retries(
+            "GET", playbook_url,
+            params={"api_key": PLAYBOOK_API_KEY}
+        )
+
+        if resp and resp.status_code == 200:
+            data = resp.json()
+            return {
+                "status": "ok",
+                "source": "playbook",
+                "data": data,
+                "timestamp": datetime.now().isoformat()
+            }
+        else:
+            return {
+                "status": "error",
+                "error": f"Playbook returned {resp.status_code if resp else 'no response'}",
+                "timestamp": datetime.now().isoformat()
+            }
+
+    except Exception as e:
+        logger.exception("Failed to fetch Playbook usage: %s", e)
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }
+
+
+@router.get("/playbook/health")
+async def get_playbook_health():
+    """Check Playbook API health status."""
+    try:
+        playbook_url = f"{PLAYBOOK_API_BASE}/health"
+        resp = await fetch_with_retries("GET", playbook_url)
+
+        if resp and resp.status_code == 200:
+            return {"status": "healthy", "playbook_status": resp.json() if resp.text else "ok"}
+        else:
+            return {"status": "unhealthy", "code": resp.status_code if resp else None}
+
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+def calculate_usage_warning(remaining: int, used: int) -> Dict[str, Any]:
+    """
+    Calculate usage warning level based on remaining vs used.
+
+    Returns warning levels:
+    - HEALTHY: < 25% used
+    - CAUTION_25: 25-49% used
+    - CAUTION_50: 50-74% used
+    - CAUTION_75: 75-89% used
+    - CRITICAL: >= 90% used (10% or less remaining)
+    """
+    if remaining is None or used is None:
+        return {"level": "UNKNOWN", "message": "Could not determine usage", "percent_used": None}
+
+    total = remaining + used
+    if total == 0:
+        return {"level": "UNKNOWN", "message": "No quota data", "percent_used": None}
+
+    percent_used = round((used / total) * 100, 1)
+    percent_remaining = round((remaining / total) * 100, 1)
+
+    if percent_remaining <= 10:
+        return {
+            "level": "CRITICAL",
+            "emoji": "🚨",
+            "message": f"CRITICAL: Only {percent_remaining}% remaining! Consider upgrading NOW.",
+            "percent_used": percent_used,
+            "percent_remaining": percent_remaining,
+            "action_needed": True
+        }
+    elif percent_used >= 75:
+        return {
+            "level": "CAUTION_75",
+            "emoji": "🟠",
+            "message": f"Warning: {percent_used}% used. Running low on API calls.",
+            "percent_used": percent_used,
+            "percent_remaining": percent_remaining,
+            "action_needed": True
+        }
+    elif percent_used >= 50:
+        return {
+            "level": "CAUTION_50",
+            "emoji": "🟡",
+            "message": f"Notice: {percent_used}% used. Half of monthly quota consumed.",
+            "percent_used": percent_used,
+            "percent_remaining": percent_remaining,
+            "action_needed": False
+        }
+    elif percent_used >= 25:
+        return {
+            "level": "CAUTION_25",
+            "emoji": "🟢",
+            "message": f"Info: {percent_used}% used. Healthy usage so far.",
+            "percent_used": percent_used,
+            "percent_remaining": percent_remaining,
+            "action_needed": False
+        }
+    else:
+        return {
+            "level": "HEALTHY",
+            "emoji": "✅",
+            "message": f"Healthy: Only {percent_used}% used. Plenty of quota remaining.",
+            "percent_used": percent_used,
+            "percent_remaining": percent_remaining,
+            "action_needed": False
+        }
+
+
+@router.get("/odds-api/usage")
+async def get_odds_api_usage():
+    """
+    Get Odds API usage info from response headers with threshold warnings.
+
+    Warning Levels:
+    - HEALTHY: < 25% used
+    - CAUTION_25: 25-49% used
+    - CAUTION_50: 50-74% used
+    - CAUTION_75: 75-89% used
+    - CRITICAL: >= 90% used (10% or less remaining)
+    """
+    if not ODDS_API_KEY:
+        return {"error": "ODDS_API_KEY not configured", "status": "unavailable"}
+
+    try:
+        # Make a lightweight request to get usage headers
+        odds_url = f"{ODDS_API_BASE}/sports"
+        resp = await fetch_with_retries(
+            "GET", odds_url,
+            params={"apiKey": ODDS_API_KEY}
+        )
+
+        if resp:
+            from odds_api import get_odds_response_cache
+            # Extract usage from headers
+            requests_remaining = resp.headers.get("x-requests-remaining")
+            requests_used = resp.headers.get("x-requests-used")
+
+            remaining = int(requests_remaining) if requests_remaining else None
+            used = int(requests_used) if requests_used else None
+
+            # Calculate warning level
+            warning = calculate_usage_warning(remaining, used)
+
+            return {
+                "status": "ok",
+                "source": "odds_api",
+                "usage": {
+                    "requests_remaining": remaining,
+                    "requests_used": used,
+                    "total_quota": (remaining + used) if remaining and used else None,
+                    "note": "Resets monthly. Check https://the-odds-api.com for plan limits."
+                },
+                "warning": warning,
+                "response_cache": get_odds_response_cache().stats(),
+                "timestamp": datetime.now().isoformat()
+            }
+        else:
+            return {
+                "status": "error",
+                "error": "No response from Odds API",
+                "timestamp": datetime.now().isoformat()
+            }
+
+    except Exception as e:
+        logger.exception("Failed to fetch Odds API usage: %s", e)
+        return {
+            "status": "error",
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }
+
+
+@router.get("/api-usage")
+async def get_all_api_usage():
+    """
+    Get combined usage for all paid APIs (Playbook + Odds API) with threshold warnings.
+
+    Warning Levels for each API:
+    - HEALTHY: < 25% used
+    - CAUTION_25: 25-49% used
+    - CAUTION_50: 50-74% used
+    - CAUTION_75: 75-89% used
+    - CRITICAL: >= 90% used (10% or less remaining)
+
+    Overall status shows the WORST status across all APIs.
+    """
+    result = {
+        "timestamp": datetime.now().isoformat(),
+        "apis": {},
+        "overall_status": "HEALTHY",
+        "action_needed": False,
+        "alerts": []
+    }
+
+    warning_priority = {"CRITICAL": 5, "CAUTION_75": 4, "CAUTION_50": 3, "CAUTION_25": 2, "HEALTHY": 1, "UNKNOWN": 0}
+    worst_level = "HEALTHY"
+
+    # Get Playbook usage
+    if PLAYBOOK_API_KEY:
+        try:
+            playbook_url = f"{PLAYBOOK_API_BASE}/me"
+            resp = await fetch_with_retries(
+                "GET", playbook_url,
+                params={"api_key": PLAYBOOK_API_KEY}
+            )
+            if resp and resp.status_code == 200:
+                data = resp.json()
+                result["apis"]["playbook"] = {"status": "ok", "data": data}
+                # Check if Playbook returns usage info
+                if "usage" in data or "requests" in data:
+                    pb_used = data.get("usage", {}).get("used", data.get("requests", {}).get("used", 0))
+                    pb_limit = data.get("usage", {}).get("limit", data.get("requests", {}).get("limit", 1000))
+                    pb_remaining = pb_limit - pb_used
+                    pb_warning = calculate_usage_warning(pb_remaining, pb_used)
+                    result["apis"]["playbook"]["warning"] = pb_warning
+                    if warning_priority.get(pb_warning["level"], 0) > warning_priority.get(worst_level, 0):
+                        worst_level = pb_warning["level"]
+                    if pb_warning.get("action_needed"):
+                        result["alerts"].append(f"Playbook: {pb_warning['message']}")
+            elif resp and resp.status_code == 429:
+                result["apis"]["playbook"] = {"status": "rate_limited", "warning": {"level": "CRITICAL", "message": "Rate limited!"}}
+                worst_level = "CRITICAL"
+                result["alerts"].append("🚨 Playbook API is RATE LIMITED!")
+            else:
+                result["apis"]["playbook"] = {"status": "error", "code": resp.status_code if resp else None}
+        except Exception as e:
+            result["apis"]["playbook"] = {"status": "error", "error": str(e)}
+    else:
+        result["apis"]["playbook"] = {"status": "not_configured"}
+
+    # Get Odds API usage
+    if ODDS_API_KEY:
+        try:
+            odds_url = f"{ODDS_API_BASE}/sports"
+            resp = await fetch_with_retries(
+                "GET", odds_url,
+                params={"apiKey": ODDS_API_KEY}
+            )
+            if resp:
+                remaining = int(resp.headers.get("x-requests-remaining", 0))
+                used = int(resp.headers.get("x-requests-used", 0))
+                warning = calculate_usage_warning(remaining, used)
+
+                result["apis"]["odds_api"] = {
+                    "status": "ok",
+                    "requests_remaining": remaining,
+                    "requests_used": used,
+                    "total_quota": remaining + used,
+                    "warning": warning
+                }
+
+                if warning_priority.get(warning["level"], 0) > warning_priority.get(worst_level, 0):
+                    worst_level = warning["level"]
+                if warning.get("action_needed"):
+                    result["alerts"].append(f"Odds API: {warning['message']}")
+            else:
+                result["apis"]["odds_api"] = {"status": "error", "error": "No response"}
+        except Exception as e:
+            result["apis"]["odds_api"] = {"status": "error", "error": str(e)}
+    else:
+        result["apis"]["odds_api"] = {"status": "not_configured"}
+
+    # Set overall status
+    result["overall_status"] = worst_level
+    result["action_needed"] = worst_level in ["CRITICAL", "CAUTION_75"]
+
+    # Add summary message
+    if worst_level == "CRITICAL":
+        result["summary"] = "🚨 CRITICAL: One or more APIs running very low! Upgrade needed."
+    elif worst_level == "CAUTION_75":
+        result["summary"] = "🟠 WARNING: High API usage. Consider upgrading soon."
+    elif worst_level == "CAUTION_50":
+        result["summary"] = "🟡 NOTICE: 50%+ of API quota used this month."
+    elif worst_level == "CAUTION_25":
+        result["summary"] = "🟢 HEALTHY: Normal API usage levels."
+    else:
+        result["summary"] = "✅ HEALTHY: API usage looks good!"
+
+    return result
+
+
+@router.get("/api-health")
+async def get_api_health_quick():
+    """
+    Quick health check for all APIs - lightweight status for dashboards.
+
+    Returns simple status:
+    - overall: HEALTHY | CAUTION | CRITICAL
+    - action_needed: true/false
+    - alerts: list of any warnings
+
+    Use /api-usage for full details.
+    """
+    # Get full usage data
+    full_usage = await get_all_api_usage()
+
+    return {
+        "overall_status": full_usage["overall_status"],
+        "action_needed": full_usage["action_needed"],
+        "summary": full_usage.get("summary", ""),
+        "alerts": full_usage["alerts"],
+        "timestamp": full_usage["timestamp"],
+        "detail_endpoint": "/live/api-usage"
+    }
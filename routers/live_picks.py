@@ -0,0 +1,689 @@
+"""
+LIVE PICKS ROUTER - Pick logger, result fetching and grading endpoints
+
+Extracted from live_data_router.py. Served by grader workers; reads and grades
+persisted picks without loading the scoring pipeline.
+
+Endpoints (all under /live):
+    GET /picks/today
+    GET /picks/graded
+    POST /picks/grade
+    POST /picks/bulk-grade
+    GET /picks/audit-report
+    GET /picks/validation-status
+    POST /picks/auto-grade
+    GET /picks/grading-summary
+    GET /results/completed-games
+    GET /results/player-stats
+    GET /scheduler/status
+    POST /ml/train-ensemble
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from core.live_contract import _sanitize_public, live_router
+
+logger = logging.getLogger("live_data")
+
+# Import grader_store - SINGLE SOURCE OF TRUTH for persistence
+try:
+    import grader_store
+    GRADER_STORE_AVAILABLE = True
+except ImportError:
+    GRADER_STORE_AVAILABLE = False
+
+# Import Pick Logger - Production pick persistence and grading (v14.9)
+try:
+    from pick_logger import (
+        grade_pick as grade_logged_pick,
+        run_daily_audit_report,
+        get_today_picks
+    )
+    PICK_LOGGER_AVAILABLE = True
+except ImportError:
+    PICK_LOGGER_AVAILABLE = False
+
+# Import Result Fetcher - Automatic result fetching and grading (v14.9)
+try:
+    from result_fetcher import (
+        fetch_completed_games,
+        fetch_nba_player_stats,
+    )
+    RESULT_FETCHER_AVAILABLE = True
+except ImportError:
+    RESULT_FETCHER_AVAILABLE = False
+
+router = live_router()
+
+
+# ============================================================================
+# PICK LOGGER ENDPOINTS (v14.9) - Production Pick Persistence & Audit
+# ============================================================================
+
+@router.get("/picks/today")
+async def get_logged_picks_today(sport: Optional[str] = None):
+    """
+    Get all picks logged today.
+
+    Used for monitoring what picks have been published.
+    """
+    if not PICK_LOGGER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Pick logger not available")
+
+    try:
+        picks = get_today_picks(sport)
+        payload = {
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "sport": sport.upper() if sport else "ALL",
+            "count": len(picks),
+            "picks": [
+                {
+                    "pick_id": p.pick_id,
+                    "sport": p.sport,
+                    "player": p.player_name,
+                    "matchup": p.matchup,
+                    "line": p.line,
+                    "side": p.side,
+                    "tier": p.tier,
+                    "final_score": p.final_score,
+                    "already_started": p.already_started,
+                    "book_validated": p.book_validated,
+                    "result": p.result
+                }
+                for p in picks
+            ],
+            "timestamp": datetime.now().isoformat()
+        }
+        return JSONResponse(_sanitize_public(payload))
+    except Exception as e:
+        logger.exception("Failed to get today's picks: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/picks/graded")
+async def get_graded_picks(date: Optional[str] = None, sport: Optional[str] = None):
+    """
+    Get all picks with grading status for the Grading page.
+
+    Returns both pending and graded picks from grader_store.
+    Frontend uses the 'graded' boolean to split into tabs.
+
+    Query params:
+    - date: Date filter (YYYY-MM-DD), defaults to today ET
+    - sport: Sport filter (NBA, NFL, etc.), defaults to all
+    """
+    if not GRADER_STORE_AVAILABLE:
+        return {"picks": [], "error": "Grader store not available"}
+
+    try:
+        # Default to today in ET
+        if not date:
+            from core.time_et import now_et
+            date = now_et().strftime("%Y-%m-%d")
+
+        # Load all predictions with grade records merged
+        all_picks = grader_store.load_predictions(date_et=date)
+
+        # Optional sport filter
+        if sport:
+            all_picks = [p for p in all_picks if p.get("sport", "").upper() == sport.upper()]
+
+        # Map to frontend format expected by Grading.jsx
+        picks_out = []
+        for p in all_picks:
+            is_graded = p.get("grade_status") == "GRADED"
+            side = p.get("side", "")
+            recommendation = side if side else ""
+            # Build recommendation string (OVER/UNDER for props)
+            if not recommendation and p.get("market", ""):
+                market = p.get("market", "").upper()
+                if "OVER" in market:
+                    recommendation = "OVER"
+                elif "UNDER" in market:
+                    recommendation = "UNDER"
+
+            picks_out.append({
+                "id": p.get("pick_id"),
+                "pick_id": p.get("pick_id"),
+                "player": p.get("player_name") or p.get("side") or "Game",
+                "team": p.get("home_team") or p.get("team", ""),
+                "opponent": p.get("away_team") or "",
+                "matchup": p.get("matchup", ""),
+                "sport": p.get("sport", ""),
+                "stat": p.get("stat_type") or p.get("market", ""),
+                "line": p.get("line"),
+                "projection": p.get("projection") or p.get("line"),
+                "edge": p.get("edge") or 0,
+                "recommendation": recommendation,
+                "final_score": p.get("final_score"),
+                "tier": p.get("tier", "STANDARD"),
+                "units": p.get("units", 1.0),
+                "graded": is_graded,
+                "result": p.get("result") if is_graded else None,
+                "actual": p.get("actual_value") if is_graded else None,
+                "graded_at": p.get("graded_at") if is_graded else None,
+                "date_et": p.get("date_et"),
+                "pick_type": p.get("pick_type", ""),
+            })
+
+        return {
+            "picks": picks_out,
+            "date": date,
+            "total": len(picks_out),
+            "graded_count": sum(1 for p in picks_out if p["graded"]),
+            "pending_count": sum(1 for p in picks_out if not p["graded"]),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    except Exception as e:
+        logger.exception("Failed to get graded picks: %s", e)
+        return {"picks": [], "error": str(e)}
+
+
+@router.post("/picks/grade")
+async def grade_published_pick(grade_data: Dict[str, Any]):
+    """
+    Grade a published pick with actual result.
+
+    Request body:
+    {
+        "pick_id": "abc123def456",
+        "result": "WIN",  // WIN, LOSS, or PUSH
+        "actual_value": 27.5  // Optional: actual stat value for props
+    }
+    """
+    if not PICK_LOGGER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Pick logger not available")
+
+    pick_id = grade_data.get("pick_id")
+    result = grade_data.get("result")
+    actual_value = grade_data.get("actual_value")
+
+    if not pick_id or not result:
+        raise HTTPException(status_code=400, detail="pick_id and result are required")
+
+    if result.upper() not in ("WIN", "LOSS", "PUSH"):
+        raise HTTPException(status_code=400, detail="result must be WIN, LOSS, or PUSH")
+
+    try:
+        grade_result = grade_logged_pick(pick_id, result, actual_value)
+
+        if grade_result:
+            return {
+                "status": "graded",
+                **grade_result,
+                "timestamp": datetime.now().isoformat()
+            }
+        else:
+            raise HTTPException(status_code=404, detail=f"Pick not found: {pick_id}")
+
+    except Exception as e:
+        logger.exception("Failed to grade pick: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/picks/bulk-grade")
+async def bulk_grade_picks(grade_data: Dict[str, Any]):
+    """
+    Grade multiple picks at once.
+
+    Request body:
+    {
+        "grades": [
+            {"pick_id": "abc123", "result": "WIN"},
+            {"pick_id": "def456", "result": "LOSS", "actual_value": 22.5}
+        ]
+    }
+    """
+    if not PICK_LOGGER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Pick logger not available")
+
+    grades = grade_data.get("grades", [])
+    if not grades:
+        raise HTTPException(status_code=400, detail="grades array is required")
+
+    results = []
+    errors = []
+
+    for grade in grades:
+        pick_id = grade.get("pick_id")
+        result = grade.get("result")
+        actual_value = grade.get("actual_value")
+
+        if not pick_id or not result:
+            errors.append({"pick_id": pick_id, "error": "Missing required fields"})
+            continue
+
+        try:
+            grade_result = grade_logged_pick(pick_id, result, actual_value)
+            if grade_result:
+                results.append(grade_result)
+            else:
+                errors.append({"pick_id": pick_id, "error": "Pick not found"})
+        except Exception as e:
+            errors.append({"pick_id": pick_id, "error": str(e)})
+
+    return {
+        "status": "bulk_grade_complete",
+        "graded": len(results),
+        "errors": len(errors),
+        "results": results,
+        "error_details": errors,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@router.get("/picks/audit-report")
+async def get_pick_audit_report(date: Optional[str] = None):
+    """
+    Generate comprehensive audit report for pick performance.
+
+    Includes:
+    - Record by tier and sport
+    - ROI by tier
+    - Top 10 false positives (high score loses)
+    - Top 10 missed opportunities (low score wins)
+    - Pillar hit-rate breakdown
+    - Jarvis trigger performance
+    - Jason sim accuracy
+
+    Date format: YYYY-MM-DD (defaults to yesterday)
+    """
+    if not PICK_LOGGER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Pick logger not available")
+
+    try:
+        report = run_daily_audit_report(date)
+        return report
+    except Exception as e:
+        logger.exception("Failed to generate audit report: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/picks/validation-status")
+async def get_pick_validation_status():
+    """
+    Get validation status for today's picks.
+
+    Shows:
+    - Total picks logged
+    - Picks with validation errors (injury/book issues)
+    - Already started (late pull) picks
+    """
+    if not PICK_LOGGER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Pick logger not available")
+
+    try:
+        picks = get_today_picks()
+
+        validation_errors = [p for p in picks if p.validation_errors]
+        late_pulls = [p for p in picks if p.already_started]
+        graded = [p for p in picks if p.result is not None]
+
+        return {
+            "date": datetime.now().strftime("%Y-%m-%d"),
+            "total_logged": len(picks),
+            "valid_picks": len(picks) - len(validation_errors),
+            "validation_errors": {
+                "count": len(validation_errors),
+                "picks": [
+                    {
+                        "pick_id": p.pick_id,
+                        "player": p.player_name,
+                        "errors": p.validation_errors
+                    }
+                    for p in validation_errors
+                ]
+            },
+            "late_pulls": {
+                "count": len(late_pulls),
+                "picks": [
+                    {
+                        "pick_id": p.pick_id,
+                        "matchup": p.matchup,
+                        "reason": p.late_pull_reason
+                    }
+                    for p in late_pulls
+                ]
+            },
+            "grading_status": {
+                "graded": len(graded),
+                "pending": len(picks) - len(graded)
+            },
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.exception("Failed to get validation status: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# =============================================================================
+# AUTO-GRADING ENDPOINTS (v14.9)
+# =============================================================================
+
+@router.post("/picks/auto-grade")
+async def trigger_auto_grade(
+    date: Optional[str] = None,
+    sports: Optional[str] = None
+):
+    """
+    Trigger automatic grading of picks against actual game results.
+
+    This endpoint:
+    1. Fetches completed game scores from Odds API
+    2. Fetches actual player stats (NBA from balldontlie/ESPN)
+    3. Grades all pending picks for the specified date
+    4. Updates pick_logger with WIN/LOSS/PUSH results
+
+    Query params:
+    - date: Date to grade (default: today in ET). Format: YYYY-MM-DD
+    - sports: Comma-separated sports to grade (default: NBA,NHL,NFL,MLB)
+
+    Returns a queued job id; the job result is the grading summary.
+    """
+    if not RESULT_FETCHER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Result fetcher not available")
+
+    if not PICK_LOGGER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Pick logger not available")
+
+    # v20.30: Grading runs in the scheduler worker; poll GET /live/jobs/{job_id} for the summary
+    from core.heavy_jobs import JOB_AUTO_GRADE, enqueue_heavy_job
+    sports_list = sports.split(",") if sports else None
+    return enqueue_heavy_job(JOB_AUTO_GRADE, {"date": date, "sports": sports_list})
+
+
+@router.get("/picks/grading-summary")
+async def get_grading_summary(date: Optional[str] = None):
+    """
+    Get a summary of grading results for a date.
+
+    Shows:
+    - Total picks graded
+    - Record (wins/losses/pushes)
+    - Hit rate by tier
+    - Units profit/loss
+
+    Query params:
+    - date: Date to summarize (default: today in ET)
+    """
+    if not GRADER_STORE_AVAILABLE:
+        return {
+            "error": "Grader store not available",
+            "date": date or "unknown",
+            "total_picks": 0,
+            "graded": 0,
+            "pending": 0
+        }
+
+    try:
+        # Get date (default to today in ET)
+        if not date:
+            from core.time_et import now_et
+            date = now_et().strftime("%Y-%m-%d")
+
+        # Load picks from grader_store (SINGLE SOURCE OF TRUTH)
+        picks = grader_store.load_predictions(date_et=date)
+        graded = [p for p in picks if p.get("grade_status") == "GRADED"]
+        pending = [p for p in picks if p.get("grade_status") != "GRADED"]
+
+        # Calculate by tier
+        tier_results = {}
+        for pick in graded:
+            tier = pick.get("tier", "UNKNOWN")
+            if tier not in tier_results:
+                tier_results[tier] = {"wins": 0, "losses": 0, "pushes": 0, "units_won": 0, "units_lost": 0}
+
+            result = pick.get("result")
+            units = pick.get("units", 1.0)
+
+            if result == "WIN":
+                tier_results[tier]["wins"] += 1
+                tier_results[tier]["units_won"] += units
+            elif result == "LOSS":
+                tier_results[tier]["losses"] += 1
+                tier_results[tier]["units_lost"] += units
+            else:
+                tier_results[tier]["pushes"] += 1
+
+        # Overall summary
+        total_wins = sum(t["wins"] for t in tier_results.values())
+        total_losses = sum(t["losses"] for t in tier_results.values())
+        total_pushes = sum(t["pushes"] for t in tier_results.values())
+        units_won = sum(t["units_won"] for t in tier_results.values())
+        units_lost = sum(t["units_lost"] for t in tier_results.values())
+
+        return {
+            "date": date,
+            "total_picks": len(picks),
+            "graded": len(graded),
+            "pending": len(pending),
+            "overall": {
+                "record": f"{total_wins}-{total_losses}-{total_pushes}",
+                "wins": total_wins,
+                "losses": total_losses,
+                "pushes": total_pushes,
+                "hit_rate": f"{(total_wins / (total_wins + total_losses) * 100):.1f}%" if (total_wins + total_losses) > 0 else "N/A",
+                "units_profit": round(units_won - units_lost, 2),
+                "units_won": round(units_won, 2),
+                "units_lost": round(units_lost, 2)
+            },
+            "by_tier": tier_results,
+            "graded_picks": [
+                {
+                    "pick_id": p.get("pick_id"),
+                    "player": p.get("player_name") or "Game",
+                    "matchup": p.get("matchup"),
+                    "line": p.get("line"),
+                    "side": p.get("side"),
+                    "tier": p.get("tier"),
+                    "result": p.get("result"),
+                    "actual_value": p.get("actual_value"),
+                    "units": p.get("units", 1.0)
+                }
+                for p in graded
+            ],
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.exception("Failed to get grading summary: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/results/completed-games")
+async def get_completed_games(sport: str = "NBA", days_back: int = 1):
+    """
+    Fetch completed games from Odds API.
+
+    Query params:
+    - sport: Sport code (NBA, NFL, NHL, MLB)
+    - days_back: How many days back to fetch (default: 1)
+    """
+    if not RESULT_FETCHER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Result fetcher not available")
+
+    try:
+        games = await fetch_completed_games(sport, days_back)
+        return {
+            "sport": sport.upper(),
+            "days_back": days_back,
+            "count": len(games),
+            "games": [
+                {
+                    "game_id": g.game_id,
+                    "home_team": g.home_team,
+                    "away_team": g.away_team,
+                    "home_score": g.home_score,
+                    "away_score": g.away_score,
+                    "commence_time": g.commence_time
+                }
+                for g in games
+            ],
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.exception("Failed to fetch completed games: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/results/player-stats")
+async def get_player_stats(sport: str = "NBA", date: Optional[str] = None):
+    """
+    Fetch actual player stats from external APIs.
+
+    Query params:
+    - sport: Sport code (currently only NBA supported)
+    - date: Date to fetch stats for (default: today in ET)
+    """
+    if not RESULT_FETCHER_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Result fetcher not available")
+
+    if sport.upper() != "NBA":
+        raise HTTPException(status_code=400, detail="Only NBA player stats currently supported")
+
+    try:
+        if not date:
+            import pytz
+            ET = pytz.timezone("America/New_York")
+            date = datetime.now(ET).strftime("%Y-%m-%d")
+
+        stats = await fetch_nba_player_stats(date)
+        return {
+            "sport": sport.upper(),
+            "date": date,
+            "count": len(stats),
+            "players": [
+                {
+                    "player_name": s.player_name,
+                    "team": s.team,
+                    "points": s.points,
+                    "rebounds": s.rebounds,
+                    "assists": s.assists,
+                    "pra": s.points + s.rebounds + s.assists,
+                    "threes": s.three_pointers_made,
+                    "steals": s.steals,
+                    "blocks": s.blocks
+                }
+                for s in stats[:100]  # Limit to 100 for response size
+            ],
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.exception("Failed to fetch player stats: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/scheduler/status")
+async def scheduler_status():
+    """
+    Check daily scheduler status with detailed job information.
+
+    v20.16.3: Enhanced to show all registered jobs with next_run_time,
+    last_run_time, trigger, and misfire_grace_time.
+
+    Returns:
+        - available: bool
+        - jobs: list of job details (id, name, next_run_time_et, trigger, etc.)
+        - training_job_registered: bool - confirms team_model_train job exists
+    """
+    try:
+        from daily_scheduler import SCHEDULER_AVAILABLE, SchedulerConfig, get_scheduler
+        import pytz
+
+        ET = pytz.timezone("America/New_York")
+        scheduler_instance = get_scheduler()
+
+        jobs_info = []
+        training_job_registered = False
+
+        if scheduler_instance and scheduler_instance.scheduler:
+            for job in scheduler_instance.scheduler.get_jobs():
+                # Convert next_run_time to ET for display
+                next_run_et = None
+                if job.next_run_time:
+                    next_run_et = job.next_run_time.astimezone(ET).isoformat()
+
+                # Get trigger type
+                trigger_type = type(job.trigger).__name__ if job.trigger else "unknown"
+                trigger_str = str(job.trigger) if job.trigger else "N/A"
+
+                # Get misfire grace time
+                misfire_grace = getattr(job, 'misfire_grace_time', None)
+
+                job_info = {
+                    "id": job.id,
+                    "name": job.name,
+                    "next_run_time_et": next_run_et,
+                    "trigger_type": trigger_type,
+                    "trigger": trigger_str,
+                    "misfire_grace_time": misfire_grace,
+                }
+                jobs_info.append(job_info)
+
+                # Check if training job is registered
+                if job.id == "team_model_train":
+                    training_job_registered = True
+
+        # v20.30: Scheduler may run in the worker process - report what its lease holder published
+        from core.scheduler_worker import scheduler_summary
+        summary = scheduler_summary()
+        if not summary["local"] and summary.get("leader"):
+            remote = summary["leader"].get("info", {}).get("scheduler") or {}
+            for job in remote.get("scheduled_jobs", []):
+                jobs_info.append({"id": job["id"], "name": job["name"], "next_run_time_et": job["next_run"]})
+                if job["id"] == "team_model_train":
+                    training_job_registered = True
+
+        return {
+            "available": True,
+            "apscheduler_available": SCHEDULER_AVAILABLE,
+            "scheduler_running": summary["running"],
+            "scheduler_role": summary["role"],
+            "scheduler_leader": summary.get("leader"),
+            "audit_time": f"{SchedulerConfig.AUDIT_HOUR:02d}:{SchedulerConfig.AUDIT_MINUTE:02d} ET",
+            "supported_sports": list(SchedulerConfig.SPORT_STATS.keys()),
+            "retrain_thresholds": {
+                "mae": SchedulerConfig.RETRAIN_MAE_THRESHOLD,
+                "hit_rate": SchedulerConfig.RETRAIN_HIT_RATE_THRESHOLD
+            },
+            "jobs": jobs_info,
+            "jobs_count": len(jobs_info),
+            "training_job_registered": training_job_registered,
+            "note": "Daily audit at 6 AM ET, team model training at 7 AM ET",
+            "timestamp": datetime.now().isoformat()
+        }
+    except ImportError as e:
+        return {
+            "available": False,
+            "note": f"Scheduler module not available: {e}",
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.warning("Scheduler status error: %s", e)
+        return {
+            "available": False,
+            "error": str(e),
+            "timestamp": datetime.now().isoformat()
+        }
+
+
+# /debug/training-status endpoint MOVED to routers/debug.py
+
+# ENGINE 3 ESOTERIC SEMANTIC AUDIT ENDPOINT: Moved to routers/esoteric.py
+
+
+@router.post("/ml/train-ensemble")
+async def trigger_ensemble_training(min_picks: int = 100):
+    """
+    Queue ensemble model training (runs in the scheduler worker, not this request).
+
+    Requires at least min_picks graded picks. Poll GET /live/jobs/{job_id}
+    for progress and the training output.
+    """
+    from core.heavy_jobs import JOB_TRAIN_ENSEMBLE, enqueue_heavy_job
+    return enqueue_heavy_job(JOB_TRAIN_ENSEMBLE, {"min_picks": min_picks})
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+BENCH BEST BETS - Offline record/replay benchmark for the best-bets pipeline
+
+perf_audit_best_bets.sh and golden_run.py can only time the deployed API.
+This runner records every upstream response of a real slate once, then
+replays it through the real _best_bets_inner locally (or in CI) with a
+shifted clock, so performance regressions show up before deploy.
+
+Each (sport, slate size) cell runs in a fresh subprocess and reports:
+- wall time (median / min / max over --repeat runs, after one cold run)
+- per-stage _timings (debug_timings, median per stage)
+- Python allocations (tracemalloc peak and net, one extra traced run)
+- peak RSS of the cell process
+
+Usage:
+    # Record today's slate (real API keys required; records at the "large" size)
+    ODDS_API_KEY=... PLAYBOOK_API_KEY=... python3 scripts/bench_best_bets.py record --sport NBA
+
+    # Replay every recorded sport x size offline
+    python3 scripts/bench_best_bets.py run
+
+    # CI: compare with a committed baseline, fail on >25% median wall regression
+    python3 scripts/bench_best_bets.py run --sizes small,medium --repeat 3 \\
+        --baseline tests/fixtures/replay/bench_baseline.json --max-regression 0.25
+
+    # Refresh the baseline
+    python3 scripts/bench_best_bets.py run --json tests/fixtures/replay/bench_baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+REPLAY_DIR = ROOT / "tests" / "fixtures" / "replay"
+SPORTS = ["NBA", "NHL", "NFL", "MLB", "NCAAB"]
+
+# size -> (max_events, max_props, max_games)
+SLATE_SIZES = {
+    "small": (4, 5, 5),
+    "medium": (12, 10, 10),
+    "large": (30, 25, 25),
+}
+RECORD_SIZE = "large"
+
+# Replay never sends these, but integrations skip their calls when a key is unset
+REPLAY_PLACEHOLDER_KEYS = [
+    "ODDS_API_KEY", "PLAYBOOK_API_KEY", "BALLDONTLIE_API_KEY", "BDL_API_KEY",
+    "SERPAPI_KEY", "SERP_API_KEY", "WEATHER_API_KEY",
+]
+
+
+def cassette_path(sport: str) -> Path:
+    return REPLAY_DIR / f"best_bets_{sport.upper()}.json.gz"
+
+
+# =============================================================================
+# IN-PROCESS (cell) SIDE
+# =============================================================================
+
+def _prepare_env(replay: bool) -> None:
+    """Must run before the pipeline is imported: modules read config at import time."""
+    os.environ["REDIS_URL"] = ""
+    os.environ["SCORING_OFFLOAD_MODE"] = "inline"
+    os.environ["WARM_REFRESH_AHEAD_ENABLED"] = "false"
+    os.environ.setdefault("RAILWAY_VOLUME_MOUNT_PATH", tempfile.mkdtemp(prefix="bench_volume_"))
+    if replay:
+        for name in REPLAY_PLACEHOLDER_KEYS:
+            os.environ[name] = os.environ.get(name) or "replay"
+
+
+def _reset_caches() -> None:
+    """Every measured run starts cold, like the first request after a deploy."""
+    import live_data_router as ldr
+    from core.prop_score_memo import get_prop_score_memo
+    from odds_api import get_odds_response_cache
+
+    # Each run gets a new event loop: drop clients and futures bound to the last one
+    ldr._reset_loop_state_in_worker()
+    ldr.api_cache.clear()
+    ldr.get_payload_store().invalidate()
+    get_odds_response_cache().invalidate()
+    get_prop_score_memo().clear()
+
+
+async def _run_pipeline(sport: str, size: str, date_str: Optional[str]) -> Dict[str, Any]:
+    from live_data_router import _best_bets_inner
+
+    max_events, max_props, max_games = SLATE_SIZES[size]
+    return await _best_bets_inner(
+        sport, sport.lower(), False, None, 6.5, True,
+        date_str=date_str, max_events=max_events, max_props=max_props, max_games=max_games,
+    )
+
+
+def _pick_counts(result: Dict[str, Any]) -> Dict[str, int]:
+    def count(section):
+        value = result.get(section)
+        if isinstance(value, dict):
+            value = value.get("picks", [])
+        return len(value or [])
+    return {"props": count("props"), "games": count("game_picks")}
+
+
+def run_cell(sport: str, size: str, repeat: int, allocations: bool) -> Dict[str, Any]:
+    """Replay one cassette at one slate size inside this process."""
+    _prepare_env(replay=True)
+    from core.http_replay import Cassette, ShiftedClock, replay_http
+
+    cassette = Cassette.load(str(cassette_path(sport)))
+    date_str = cassette.meta.get("date_et")
+
+    def timed_run():
+        _reset_caches()
+        with replay_http(cassette), ShiftedClock(cassette.recorded_at):
+            start = time.perf_counter()
+            result = asyncio.run(_run_pipeline(sport, size, date_str))
+            return time.perf_counter() - start, result
+
+    import live_data_router  # noqa: F401  (import cost is not part of a request)
+
+    # Cold run: also imports lazily-loaded modules before the clock is shifted again
+    cold_wall, result = timed_run()
+    walls, stage_samples = [], {}
+    for _ in range(repeat):
+        wall, result = timed_run()
+        walls.append(wall)
+        for stage, seconds in (result.get("debug", {}).get("debug_timings") or {}).items():
+            stage_samples.setdefault(stage, []).append(seconds)
+
+    cell = {
+        "sport": sport,
+        "size": size,
+        "slate": dict(zip(("max_events", "max_props", "max_games"), SLATE_SIZES[size])),
+        "repeat": repeat,
+        "cold_wall_s": round(cold_wall, 3),
+        "wall_s": {
+            "median": round(statistics.median(walls), 3),
+            "min": round(min(walls), 3),
+            "max": round(max(walls), 3),
+        },
+        "stages_s": {stage: round(statistics.median(v), 3) for stage, v in sorted(stage_samples.items())},
+        "picks": _pick_counts(result),
+        "replay_hits": cassette.hits,
+        "replay_misses": len(set(cassette.misses)),
+    }
+
+    if allocations:
+        import tracemalloc
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        timed_run()
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        cell["alloc"] = {"peak_mb": round(peak / 1e6, 2), "net_mb": round((after - before) / 1e6, 2)}
+
+    try:
+        import resource
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        cell["peak_rss_mb"] = round(rss / (1e6 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        cell["peak_rss_mb"] = None
+    return cell
+
+
+def record(sport: str) -> Path:
+    """Run the live pipeline once and save every upstream response."""
+    _prepare_env(replay=False)
+    from core.http_replay import Cassette, record_http
+    from core.time_et import format_et_day
+
+    date_et = format_et_day()
+    cassette = Cassette(meta={"sport": sport, "date_et": date_et, "size": RECORD_SIZE})
+    _reset_caches()
+    with record_http(cassette):
+        result = asyncio.run(_run_pipeline(sport, RECORD_SIZE, date_et))
+    cassette.meta["picks"] = _pick_counts(result)
+
+    REPLAY_DIR.mkdir(parents=True, exist_ok=True)
+    path = cassette_path(sport)
+    cassette.save(str(path))
+    print(f"Recorded {cassette.request_count} responses for {sport} ({date_et}) -> {path}")
+    for host, n in sorted(cassette.hosts().items()):
+        print(f"  {host}: {n}")
+    return path
+
+
+# =============================================================================
+# MATRIX (parent) SIDE
+# =============================================================================
+
+def _spawn_cell(sport: str, size: str, repeat: int, allocations: bool, timeout: int) -> Dict[str, Any]:
+    cmd = [sys.executable, __file__, "_cell", "--sport", sport, "--size", size, "--repeat", str(repeat)]
+    if not allocations:
+        cmd.append("--no-alloc")
+    proc = subprocess.run(cmd, cwd=str(ROOT), capture_output=True, text=True, timeout=timeout)
+    if proc.returncode != 0:
+        return {"sport": sport, "size": size, "error": proc.stderr.strip().splitlines()[-1:] or ["failed"]}
+    # The pipeline logs to stdout too; the result is the last line
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(cells: List[Dict[str, Any]], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Cells whose median wall time regressed by more than max_regression."""
+    base = {(c["sport"], c["size"]): c for c in baseline.get("cells", []) if "wall_s" in c}
+    failures = []
+    for cell in cells:
+        ref = base.get((cell["sport"], cell["size"]))
+        if ref is None or "wall_s" not in cell:
+            continue
+        old, new = ref["wall_s"]["median"], cell["wall_s"]["median"]
+        cell["vs_baseline"] = round(new / old - 1, 3) if old else None
+        if old and new > old * (1 + max_regression):
+            failures.append(f"{cell['sport']}/{cell['size']}: {old:.3f}s -> {new:.3f}s (+{new / old - 1:.0%})")
+    return failures
+
+
+def _print_table(cells: List[Dict[str, Any]]) -> None:
+    print(f"{'sport':6} {'size':7} {'cold_s':>7} {'med_s':>7} {'alloc_mb':>9} {'rss_mb':>7} {'picks':>7} {'miss':>5}  top stages")
+    for c in cells:
+        if "error" in c:
+            print(f"{c['sport']:6} {c['size']:7} ERROR {c['error']}")
+            continue
+        top = sorted(c["stages_s"].items(), key=lambda kv: -kv[1])[:3]
+        picks = c["picks"]["props"] + c["picks"]["games"]
+        print(f"{c['sport']:6} {c['size']:7} {c['cold_wall_s']:7.3f} {c['wall_s']['median']:7.3f} "
+              f"{c.get('alloc', {}).get('peak_mb', '-'):>9} {c.get('peak_rss_mb') or '-':>7} {picks:7d} "
+              f"{c['replay_misses']:5d}  " + ", ".join(f"{k}={v}" for k, v in top))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="record a live slate into tests/fixtures/replay")
+    rec.add_argument("--sport", action="append", required=True, choices=SPORTS)
+
+    run = sub.add_parser("run", help="replay the sport x size matrix")
+    run.add_argument("--sport", action="append", choices=SPORTS,
+                     help="default: every sport with a cassette")
+    run.add_argument("--sizes", default=",".join(SLATE_SIZES))
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--no-alloc", action="store_true", help="skip the tracemalloc run")
+    run.add_argument("--timeout", type=int, default=600, help="per-cell timeout (seconds)")
+    run.add_argument("--json", help="write results here")
+    run.add_argument("--baseline", help="results JSON to compare against")
+    run.add_argument("--max-regression", type=float, default=0.25)
+
+    cell = sub.add_parser("_cell")  # internal: one cell in a fresh process
+    cell.add_argument("--sport", required=True)
+    cell.add_argument("--size", required=True, choices=list(SLATE_SIZES))
+    cell.add_argument("--repeat", type=int, default=3)
+    cell.add_argument("--no-alloc", action="store_true")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        for sport in args.sport:
+            record(sport)
+        return 0
+
+    if args.command == "_cell":
+        print(json.dumps(run_cell(args.sport, args.size, args.repeat, not args.no_alloc)))
+        return 0
+
+    sports = args.sport or [s for s in SPORTS if cassette_path(s).exists()]
+    if not sports:
+        print(f"No cassettes in {REPLAY_DIR}; record one first (see --help)")
+        return 1
+    sizes = [s for s in args.sizes.split(",") if s]
+    cells = [_spawn_cell(sport, size, args.repeat, not args.no_alloc, args.timeout)
+             for sport in sports for size in sizes]
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(cells, json.load(f), args.max_regression)
+    _print_table(cells)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                       "python": sys.version.split()[0], "cells": cells}, f, indent=2)
+    if failures:
+        print("\nREGRESSIONS:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    return 1 if any("error" in c for c in cells) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,7 @@ This script:
 
 Usage:
     python scripts/train_ensemble.py [--min-picks N] [--output-dir DIR]
+    python scripts/train_ensemble.py --from-feature-store [--days-back N]
 
 Requirements:
     - At least 100 graded picks (configurable)
@@ -202,6 +203,21 @@ def load_predictions(predictions_path: str) -> List[Dict]:
     return predictions
 
 
+def load_from_feature_store(days_back: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Load (X, y) from the materialized feature store (same columns as FEATURE_NAMES)."""
+    from services.feature_store import FEATURE_COLUMNS, get_feature_store
+
+    if FEATURE_COLUMNS != FEATURE_NAMES:
+        raise ValueError(f"Feature store schema {FEATURE_COLUMNS} is out of sync with FEATURE_NAMES {FEATURE_NAMES}")
+    X, y = get_feature_store().training_matrix(days_back=days_back)
+    if X.ndim != 2 or X.shape[1] != len(FEATURE_NAMES):
+        raise ValueError(f"Feature store matrix has shape {X.shape}, expected (n, {len(FEATURE_NAMES)})")
+    if len(X) != len(y):
+        raise ValueError(f"Feature store returned {len(X)} feature rows but {len(y)} labels")
+    logger.info(f"Loaded {len(y)} graded picks from feature store")
+    return X, y
+
+
 def prepare_dataset(predictions: List[Dict]) -> Tuple[np.ndarray, np.ndarray, List[Dict]]:
     """
     Prepare feature matrix and label vector from predictions.
@@ -355,20 +371,29 @@ def main():
                        help='Output directory for model files')
     parser.add_argument('--dry-run', action='store_true',
                        help='Analyze data without training')
+    parser.add_argument('--from-feature-store', action='store_true',
+                       help='Read materialized features instead of parsing predictions JSONL')
+    parser.add_argument('--days-back', type=int, default=365,
+                       help='Training window for --from-feature-store (default: 365)')
     args = parser.parse_args()
 
     if not ML_LIBS_AVAILABLE:
         logger.error("Required ML libraries not available. Exiting.")
         sys.exit(1)
 
-    # Load predictions
-    predictions = load_predictions(args.predictions_path)
-    if not predictions:
-        logger.error("No predictions found. Exiting.")
-        sys.exit(1)
+    if args.from_feature_store:
+        X, y = load_from_feature_store(args.days_back)
+        total_predictions = len(y)
+    else:
+        # Load predictions
+        predictions = load_predictions(args.predictions_path)
+        if not predictions:
+            logger.error("No predictions found. Exiting.")
+            sys.exit(1)
 
-    # Prepare dataset
-    X, y, valid_picks = prepare_dataset(predictions)
+        # Prepare dataset
+        X, y, valid_picks = prepare_dataset(predictions)
+        total_predictions = len(predictions)
 
     if len(y) < args.min_picks:
         logger.error(f"Only {len(y)} graded picks available. Need at least {args.min_picks}.")
@@ -377,7 +402,7 @@ def main():
 
     if args.dry_run:
         logger.info("Dry run complete. Data analysis:")
-        logger.info(f"  - Total predictions: {len(predictions)}")
+        logger.info(f"  - Total predictions: {total_predictions}")
         logger.info(f"  - Graded picks: {len(y)}")
         logger.info(f"  - Hit rate: {100*np.mean(y):.1f}%")
         logger.info(f"  - Features: {len(FEATURE_NAMES)}")
@@ -368,7 +368,9 @@ def update_matchup_matrix(picks: list) -> dict:
                 home_score = base - margin / 2
                 away_score = base + margin / 2
 
-        matchup.record_matchup(sport, home_team, away_team, float(home_score), float(away_score))
+        # v20.30: event_id keys the game so games already applied online are not counted twice
+        matchup.record_matchup(sport, home_team, away_team, float(home_score), float(away_score),
+                               game_key=pick.get('event_id'))
         updated += 1
 
     # Save matchups
@@ -35,6 +35,18 @@ except ImportError:
     PlayerContext = None
     calculate_line_difficulty = None
 
+# v20.29: Concurrent per-event props fetch
+from .props_fetcher import fetch_props_for_events, iter_event_props, get_event_props_cache
+
+# v20.30: Materialized ML feature store
+try:
+    from .feature_store import FeatureStore, get_feature_store
+    FEATURE_STORE_AVAILABLE = True
+except ImportError:
+    FEATURE_STORE_AVAILABLE = False
+    FeatureStore = None
+    get_feature_store = None
+
 __all__ = [
     "OfficialsTracker",
     "officials_tracker",
@@ -50,4 +62,12 @@ __all__ = [
     "PlayerContext",
     "calculate_line_difficulty",
     "PLAYER_DATA_SERVICE_AVAILABLE",
+    # v20.29
+    "fetch_props_for_events",
+    "iter_event_props",
+    "get_event_props_cache",
+    # v20.30
+    "FeatureStore",
+    "get_feature_store",
+    "FEATURE_STORE_AVAILABLE",
 ]
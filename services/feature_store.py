@@ -0,0 +1,502 @@
+"""
+Feature Store - Materialized ML features for training and inference (v20.30)
+============================================================================
+
+Graded picks are turned into model features once, when they are graded, and
+appended to columnar partitions:
+
+    ${STORE_DIR}/features/sport=NBA/date=2026-10-18/part-<ns>.parquet
+
+Training jobs (MLDataPipeline, scripts/train_ensemble*.py) read the
+partitions they need instead of re-parsing predictions.jsonl and rebuilding
+features row by row. The feature definitions are the same ones used online:
+ensemble_inputs() maps a stored pick to the inputs of
+ml_integration.encode_ensemble_features(), which EnsembleModelManager uses
+at inference, so training and serving cannot drift apart.
+
+Parts are Parquet when pyarrow is installed, otherwise .npz. Partitions are
+append-only; re-graded picks are resolved at read time (last write wins per
+pick_id). Picks stored without an id get a content-derived one (pick_key) so
+they neither collapse into one row nor duplicate on re-sync. A partition that
+reaches FEATURE_COMPACT_PARTS part files is compacted into one part.
+
+sync_jsonl() catches the store up with a predictions JSONL from the byte
+offset it reached last time (kept in ${STORE_DIR}/features/_sync.json), so
+only lines appended since then are parsed.
+
+Usage:
+    from services.feature_store import get_feature_store
+
+    store = get_feature_store()
+    store.append(graded_picks)                  # at grade time
+    store.sync(load_predictions())              # one-off backfill / catch-up
+    store.sync_jsonl(predictions_path)          # incremental catch-up
+    X, y = store.training_matrix(sport="NBA", days_back=90)
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ml_integration import encode_ensemble_features
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+FEATURE_STORE_ENABLED = os.getenv("FEATURE_STORE_ENABLED", "true").lower() == "true"
+FEATURE_SCHEMA_VERSION = 1
+# Compact a sport/date partition once it holds this many part files
+FEATURE_COMPACT_PARTS = max(2, int(os.getenv("FEATURE_COMPACT_PARTS", "16")))
+
+# Same order as scripts/train_ensemble.FEATURE_NAMES and encode_ensemble_features()
+FEATURE_COLUMNS = [
+    "ai_score", "research_score", "esoteric_score", "jarvis_score",
+    "line", "odds_american", "confluence_boost", "jason_sim_boost",
+    "titanium_triggered", "sport_encoded", "pick_type_encoded", "side_encoded",
+]
+SCORE_COLUMNS = ["final_score", "context_score"]
+META_COLUMNS = ["pick_id", "date_et", "sport", "pick_type", "market", "side", "created_at"]
+LABEL_COLUMN = "outcome"
+
+WIN_RESULTS = {"WIN", "HIT", "1"}
+LOSS_RESULTS = {"LOSS", "MISS", "0"}
+
+
+# =============================================================================
+# FEATURE DEFINITIONS
+# =============================================================================
+
+def outcome_label(pick: Dict[str, Any]) -> Optional[int]:
+    """1 = hit, 0 = miss, None = ungraded/push."""
+    result = str(pick.get("result", pick.get("grade_result", "")) or "").upper()
+    if result in WIN_RESULTS:
+        return 1
+    if result in LOSS_RESULTS:
+        return 0
+    return None
+
+
+def ensemble_inputs(pick: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a stored pick to the ensemble predictor's inference inputs.
+
+    Handles the stored-field aliases (jarvis_rs, odds_american, pick_side,
+    selection_home_away) so the same encoder serves training and inference.
+    """
+    side = pick.get("side", pick.get("pick_side")) or "Over"
+    if side not in ("Over", "OVER", "Under", "UNDER"):
+        side = "Home" if pick.get("selection_home_away") == "HOME" else "Away"
+    pick_type = str(pick.get("pick_type") or pick.get("market") or "PROP").upper()
+    if "PLAYER" in pick_type:
+        pick_type = "PROP"
+
+    def number(*keys, default):
+        for key in keys:
+            value = pick.get(key)
+            if value is not None:
+                return value
+        return default
+
+    return {
+        "ai_score": number("ai_score", default=5.0),
+        "research_score": number("research_score", default=5.0),
+        "esoteric_score": number("esoteric_score", default=5.0),
+        "jarvis_score": number("jarvis_score", "jarvis_rs", default=5.0),
+        "line": number("line", default=0.0),
+        "odds": number("odds", "odds_american", default=-110),
+        "confluence_boost": number("confluence_boost", default=0.0),
+        "jason_sim_boost": number("jason_sim_boost", default=0.0),
+        "titanium_triggered": bool(pick.get("titanium_triggered", False)),
+        "sport": str(pick.get("sport") or "NBA").upper(),
+        "pick_type": pick_type,
+        "side": side,
+    }
+
+
+# Fields that identify a pick independent of its grading
+_IDENTITY_FIELDS = ("sport", "date_et", "created_at", "matchup", "game_id", "event_id",
+                    "player_name", "player", "pick_type", "market", "prop_type", "side", "line", "odds")
+
+
+def pick_key(pick: Dict[str, Any]) -> str:
+    """pick_id / prediction_id, else a stable hash of the pick's identifying fields."""
+    pick_id = pick.get("pick_id") or pick.get("prediction_id")
+    if pick_id:
+        return str(pick_id)
+    identity = "|".join(f"{k}={pick.get(k)}" for k in _IDENTITY_FIELDS if pick.get(k) is not None)
+    return "anon-" + hashlib.sha1(identity.encode()).hexdigest()[:16]
+
+
+def _pick_date(pick: Dict[str, Any]) -> str:
+    for key in ("date_et", "created_at", "graded_at"):
+        value = pick.get(key)
+        if value:
+            return str(value)[:10]
+    return "unknown"
+
+
+def materialize(picks: Iterable[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Build feature columns for graded picks (ungraded and pushes are skipped)."""
+    rows, labels = [], []
+    for pick in picks:
+        label = outcome_label(pick)
+        if label is None:
+            continue
+        rows.append(pick)
+        labels.append(label)
+
+    columns: Dict[str, np.ndarray] = {}
+    if rows:
+        X = encode_ensemble_features([ensemble_inputs(p) for p in rows])
+    else:
+        X = np.zeros((0, len(FEATURE_COLUMNS)), dtype=np.float32)
+    for i, name in enumerate(FEATURE_COLUMNS):
+        columns[name] = X[:, i]
+    for name in SCORE_COLUMNS:
+        columns[name] = np.array([float(p.get(name) or 0.0) for p in rows], dtype=np.float32)
+    columns["pick_id"] = np.array([pick_key(p) for p in rows], dtype=str)
+    columns["date_et"] = np.array([_pick_date(p) for p in rows], dtype=str)
+    columns["sport"] = np.array([str(p.get("sport") or "").upper() for p in rows], dtype=str)
+    columns["pick_type"] = np.array([str(p.get("pick_type") or p.get("market_type") or "").upper() for p in rows],
+                                    dtype=str)
+    columns["market"] = np.array([str(p.get("market") or p.get("prop_type") or "") for p in rows], dtype=str)
+    columns["side"] = np.array([str(p.get("side") or "") for p in rows], dtype=str)
+    columns["created_at"] = np.array([str(p.get("created_at") or "") for p in rows], dtype=str)
+    columns[LABEL_COLUMN] = np.array(labels, dtype=np.int8)
+    return columns
+
+
+# =============================================================================
+# PART FILES
+# =============================================================================
+
+def _write_part(path: str, columns: Dict[str, np.ndarray]) -> None:
+    tmp = f"{path}.tmp"
+    if path.endswith(".parquet"):
+        table = pa.table({name: pa.array(values) for name, values in columns.items()})
+        pq.write_table(table, tmp)
+    else:
+        with open(tmp, "wb") as f:
+            np.savez(f, **columns)
+    os.replace(tmp, path)
+
+
+def _read_part(path: str, columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+    if path.endswith(".parquet"):
+        # ParquetFile, not read_table: the hive-style directory names must not become columns
+        table = pq.ParquetFile(path).read(columns=columns)
+        return {name: table.column(name).to_numpy(zero_copy_only=False) for name in table.column_names}
+    with np.load(path, allow_pickle=False) as data:
+        names = columns or list(data.files)
+        return {name: data[name] for name in names if name in data.files}
+
+
+def _concat(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    if not parts:
+        return {}
+    names = [n for n in parts[0] if all(n in p for p in parts)]
+    return {name: np.concatenate([np.asarray(p[name]) for p in parts]) for name in names}
+
+
+def _latest_rows(ids: np.ndarray) -> np.ndarray:
+    """Mask keeping the last row for each pick_id (rows ordered oldest-first)."""
+    _, last_from_end = np.unique(ids[::-1], return_index=True)
+    mask = np.zeros(len(ids), dtype=bool)
+    mask[len(ids) - 1 - last_from_end] = True
+    return mask
+
+
+def _parse_jsonl(chunk: bytes) -> List[Dict[str, Any]]:
+    records = []
+    for line in chunk.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+    return records
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class FeatureStore:
+    """Append-only, partitioned store of materialized pick features."""
+
+    def __init__(self, root: Optional[str] = None, use_arrow: bool = ARROW_AVAILABLE):
+        if root is None:
+            from storage_paths import get_features_dir
+            root = get_features_dir()
+        self.root = root
+        self.use_arrow = use_arrow and ARROW_AVAILABLE
+        self._known_ids: Optional[Set[str]] = None
+        self._lock = threading.Lock()
+
+    # ---- write path -------------------------------------------------------
+
+    def _part_path(self, sport: str, day: str) -> str:
+        directory = os.path.join(self.root, f"sport={sport or 'UNKNOWN'}", f"date={day}")
+        os.makedirs(directory, exist_ok=True)
+        ext = "parquet" if self.use_arrow else "npz"
+        return os.path.join(directory, f"part-{time.time_ns()}-{os.getpid()}.{ext}")
+
+    def _load_known_ids(self) -> Set[str]:
+        if self._known_ids is None:
+            ids: Set[str] = set()
+            for path in self._parts():
+                try:
+                    ids.update(_read_part(path, ["pick_id"]).get("pick_id", []).tolist())
+                except Exception as e:
+                    logger.warning("Unreadable feature part %s: %s", path, e)
+            self._known_ids = ids
+        return self._known_ids
+
+    def append(self, picks: Iterable[Dict[str, Any]], replace: bool = True) -> int:
+        """
+        Materialize graded picks and append them (one part per sport/date).
+
+        With replace=False picks whose pick_id is already stored are skipped
+        (backfill); otherwise a new row supersedes the old one at read time.
+        """
+        columns = materialize(picks)
+        n = len(columns[LABEL_COLUMN])
+        if n == 0:
+            return 0
+        with self._lock:
+            known = self._load_known_ids()
+            keep = np.ones(n, dtype=bool)
+            if not replace:
+                keep = np.array([pid not in known for pid in columns["pick_id"]], dtype=bool)
+            if not keep.any():
+                return 0
+            groups: Dict[Tuple[str, str], List[int]] = {}
+            for i in np.flatnonzero(keep):
+                groups.setdefault((columns["sport"][i], columns["date_et"][i]), []).append(i)
+            for (sport, day), idx in groups.items():
+                path = self._part_path(sport, day)
+                _write_part(path, {name: values[idx] for name, values in columns.items()})
+                self._maybe_compact(os.path.dirname(path))
+            known.update(columns["pick_id"][keep].tolist())
+        written = int(keep.sum())
+        logger.debug("Feature store: appended %d rows in %d partitions", written, len(groups))
+        return written
+
+    def _partition_parts(self, directory: str) -> List[str]:
+        return sorted(glob.glob(os.path.join(directory, "part-*.parquet")) +
+                      glob.glob(os.path.join(directory, "part-*.npz")))
+
+    def _maybe_compact(self, directory: str) -> None:
+        if len(self._partition_parts(directory)) >= FEATURE_COMPACT_PARTS:
+            try:
+                self._compact_partition(directory)
+            except Exception as e:
+                logger.warning("Feature partition compaction failed for %s: %s", directory, e)
+
+    def _compact_partition(self, directory: str) -> int:
+        """Rewrite a partition's parts as one part (latest row per pick_id); returns parts removed."""
+        paths = self._partition_parts(directory)
+        if len(paths) < 2:
+            return 0
+        data = _concat([_read_part(path) for path in paths])
+        data = {name: values[_latest_rows(data["pick_id"])] for name, values in data.items()}
+        # Named after the newest input so parts appended meanwhile still sort after it
+        stem, _ = os.path.splitext(os.path.basename(paths[-1]))
+        ext = "parquet" if self.use_arrow else "npz"
+        _write_part(os.path.join(directory, f"{stem}-c.{ext}"), data)
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # another process compacted it first
+        logger.info("Feature store: compacted %d parts in %s", len(paths), directory)
+        return len(paths)
+
+    def compact(self) -> int:
+        """Compact every partition holding more than one part; returns parts removed."""
+        removed = 0
+        with self._lock:
+            for directory in {os.path.dirname(p) for p in self._parts()}:
+                removed += self._compact_partition(directory)
+        return removed
+
+    def sync(self, predictions: Iterable[Dict[str, Any]]) -> int:
+        """Materialize graded predictions that are not in the store yet."""
+        with self._lock:
+            known = set(self._load_known_ids())
+        graded = [p for p in predictions
+                  if str(p.get("grade_status", "")).upper() == "GRADED" and pick_key(p) not in known]
+        return self.append(graded, replace=False) if graded else 0
+
+    def _sync_state_path(self) -> str:
+        return os.path.join(self.root, "_sync.json")
+
+    def _read_sync_state(self) -> Dict[str, Any]:
+        try:
+            with open(self._sync_state_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def sync_jsonl(self, path: str) -> int:
+        """
+        Catch up with a predictions JSONL from the offset reached last time.
+
+        Only lines appended since the last sync are parsed (a trailing line
+        that is not yet valid JSON is left for the next sync). A file
+        that was replaced or truncated is re-read from the start (already
+        stored picks are skipped). The offset advances only after the new
+        rows are stored, so a failed sync is retried from the same place.
+        """
+        if not os.path.exists(path):
+            return 0
+        key = os.path.abspath(path)
+        state = self._read_sync_state()
+        entry = state.get(key) or {}
+        st = os.stat(path)
+        offset = int(entry.get("offset", 0))
+        if entry.get("inode") != st.st_ino or offset > st.st_size:
+            offset = 0
+        if offset == st.st_size:
+            return 0
+
+        with open(path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read(st.st_size - offset)
+        tail = chunk.rfind(b"\n") + 1
+        if tail < len(chunk) and not _parse_jsonl(chunk[tail:]):
+            chunk = chunk[:tail]  # a partial trailing line waits for the next sync
+        if not chunk:
+            return 0
+        added = self.sync(_parse_jsonl(chunk))
+
+        with self._lock:
+            state = self._read_sync_state()
+            state[key] = {"offset": offset + len(chunk), "inode": st.st_ino}
+            os.makedirs(self.root, exist_ok=True)
+            tmp = f"{self._sync_state_path()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, self._sync_state_path())
+        return added
+
+    # ---- read path --------------------------------------------------------
+
+    def _parts(self, sport: Optional[str] = None, start_date: Optional[date] = None,
+               end_date: Optional[date] = None) -> List[str]:
+        sport_glob = f"sport={sport.upper()}" if sport else "sport=*"
+        paths = []
+        for directory in sorted(glob.glob(os.path.join(self.root, sport_glob, "date=*"))):
+            day = os.path.basename(directory)[len("date="):]
+            if (start_date and day < start_date.isoformat()) or (end_date and day > end_date.isoformat()):
+                continue
+            paths.extend(self._partition_parts(directory))
+        return paths
+
+    def read(
+        self,
+        sport: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        pick_type: Optional[str] = None,
+        min_final_score: Optional[float] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Columns for the matching rows (latest row per pick_id)."""
+        parts = []
+        wanted = None
+        if columns is not None:
+            wanted = list(dict.fromkeys(columns + ["pick_id", "pick_type", "final_score"]))
+        for path in self._parts(sport, start_date, end_date):
+            try:
+                parts.append(_read_part(path, wanted))
+            except Exception as e:
+                logger.warning("Skipping unreadable feature part %s: %s", path, e)
+        data = _concat(parts)
+        if not data:
+            return {}
+
+        # Parts are read oldest-first; keep the last row for each pick_id
+        mask = _latest_rows(data["pick_id"])
+        if pick_type:
+            mask &= np.char.find(data["pick_type"].astype(str), pick_type.upper()) >= 0
+        if min_final_score:
+            mask &= data["final_score"] >= min_final_score
+        order = np.flatnonzero(mask)
+        result = {name: values[order] for name, values in data.items()}
+        if columns is not None:
+            result = {name: result[name] for name in columns if name in result}
+        return result
+
+    def training_matrix(
+        self,
+        sport: Optional[str] = None,
+        days_back: int = 180,
+        pick_type: Optional[str] = None,
+        min_final_score: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(X, y) for the ensemble hit predictor, X in FEATURE_COLUMNS order."""
+        end = date.today()
+        data = self.read(sport=sport, start_date=end - timedelta(days=days_back), end_date=end,
+                         pick_type=pick_type, min_final_score=min_final_score,
+                         columns=FEATURE_COLUMNS + [LABEL_COLUMN])
+        if not data:
+            return np.zeros((0, len(FEATURE_COLUMNS)), dtype=np.float32), np.zeros(0, dtype=np.int32)
+        X = np.column_stack([data[name] for name in FEATURE_COLUMNS]).astype(np.float32)
+        return X, data[LABEL_COLUMN].astype(np.int32)
+
+    def stats(self) -> Dict[str, Any]:
+        parts = self._parts()
+        partitions = {os.path.dirname(p) for p in parts}
+        return {
+            "enabled": FEATURE_STORE_ENABLED,
+            "root": self.root,
+            "format": "parquet" if self.use_arrow else "npz",
+            "schema_version": FEATURE_SCHEMA_VERSION,
+            "parts": len(parts),
+            "partitions": len(partitions),
+            "rows": len(self._load_known_ids()),
+        }
+
+
+_feature_store: Optional[FeatureStore] = None
+
+
+def get_feature_store() -> FeatureStore:
+    """Get or create the global feature store."""
+    global _feature_store
+    if _feature_store is None:
+        _feature_store = FeatureStore()
+    return _feature_store
+
+
+if __name__ == "__main__":
+    # Backfill: python -m services.feature_store
+    logging.basicConfig(level=logging.INFO)
+    from grader_store import load_predictions
+
+    store = get_feature_store()
+    added = store.sync(load_predictions())
+    print(f"Backfilled {added} rows -> {store.stats()}")
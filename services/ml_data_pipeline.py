@@ -5,6 +5,12 @@ ML Data Pipeline - Training Data Preparation (v18.1)
 Prepares enriched training data for LSTM and Ensemble model retraining.
 Loads graded predictions and adds contextual features from various sources.
 
+v20.30: Reads materialized features from services.feature_store. The
+first read catches the store up with predictions.jsonl (graded picks not
+materialized yet), so the store covers every requested window; parsing
+predictions.jsonl row by row is only the fallback when the store is
+unavailable or empty.
+
 Usage:
     from services.ml_data_pipeline import MLDataPipeline
 
@@ -47,14 +53,26 @@ class MLDataPipeline:
     - Return clean DataFrame ready for training
     """
 
-    def __init__(self, predictions_path: str = None):
+    def __init__(self, predictions_path: str = None, feature_store=None):
         """
         Initialize the ML data pipeline.
 
         Args:
             predictions_path: Path to predictions JSONL file.
                             Defaults to /data/grader/predictions.jsonl
+            feature_store: FeatureStore to read first. Defaults to the global
+                           store unless an explicit predictions_path is given.
         """
+        if feature_store is None and predictions_path is None:
+            try:
+                from services.feature_store import FEATURE_STORE_ENABLED, get_feature_store
+                if FEATURE_STORE_ENABLED:
+                    feature_store = get_feature_store()
+            except ImportError:
+                feature_store = None
+        self.feature_store = feature_store
+        self._feature_store_synced = False
+
         if predictions_path is None:
             # Use Railway volume or local fallback
             base_dir = os.getenv("RAILWAY_VOLUME_MOUNT_PATH", "/data")
@@ -94,18 +112,30 @@ class MLDataPipeline:
             logger.warning("pandas not available - cannot prepare training data")
             return None
 
-        # Load raw predictions
-        predictions = self._load_predictions()
-        if not predictions:
-            logger.warning("No predictions found")
-            return None
-
         # Calculate date range
         if end_date is None:
             end_date = date.today()
         if start_date is None:
             start_date = end_date - timedelta(days=days_back)
 
+        # Materialized features first
+        df = self._load_from_feature_store(
+            sport=sport,
+            start_date=start_date,
+            end_date=end_date,
+            min_final_score=min_final_score,
+            pick_type=pick_type,
+            include_context=include_context
+        )
+        if df is not None:
+            return df
+
+        # Load raw predictions
+        predictions = self._load_predictions()
+        if not predictions:
+            logger.warning("No predictions found")
+            return None
+
         # Filter predictions
         filtered = self._filter_predictions(
             predictions=predictions,
@@ -308,6 +338,59 @@ class MLDataPipeline:
 
         return predictions
 
+    def _load_from_feature_store(
+        self,
+        sport: str = None,
+        start_date: date = None,
+        end_date: date = None,
+        min_final_score: float = None,
+        pick_type: str = None,
+        include_context: bool = True
+    ) -> Optional["pd.DataFrame"]:
+        """Build the training DataFrame from materialized features, or None if the store has no rows."""
+        if self.feature_store is None:
+            return None
+        # Picks graded before the store existed, or by a process that could
+        # not append, are only in predictions.jsonl; catch up from the offset
+        # the last sync reached. A failed sync leaves the offset (and the
+        # flag) untouched, so the next load retries it
+        try:
+            added = self.feature_store.sync_jsonl(self.predictions_path)
+            if added:
+                logger.info("Feature store caught up with %d graded picks", added)
+            self._feature_store_synced = True
+        except Exception as e:
+            logger.warning("Feature store sync failed: %s", e)
+        try:
+            columns = self.feature_store.read(
+                sport=sport,
+                start_date=start_date,
+                end_date=end_date,
+                pick_type=pick_type,
+                min_final_score=min_final_score
+            )
+        except Exception as e:
+            logger.warning("Feature store read failed, using predictions file: %s", e)
+            return None
+        if not columns or len(columns["outcome"]) == 0:
+            return None
+
+        df = pd.DataFrame(columns)
+        df["outcome"] = df["outcome"].astype(int)
+        df["odds"] = df["odds_american"]
+        df["titanium"] = df["titanium_triggered"].astype(int)
+        df["prediction_id"] = df["pick_id"]
+        if include_context:
+            created = pd.to_datetime(df["created_at"], errors="coerce", utc=True)
+            df["days_ago"] = (pd.Timestamp.now(tz="UTC") - created).dt.days
+
+        df = self._clean_dataframe(df)
+        logger.info(
+            "Training data from feature store: %d samples, sport=%s",
+            len(df), sport or "ALL"
+        )
+        return df
+
     def _filter_predictions(
         self,
         predictions: List[Dict],
@@ -0,0 +1,359 @@
+"""
+Props Fetcher Service (v20.29)
+
+Concurrent per-event player props fetch for /live/props and best-bets.
+
+The Odds API only serves player props per event (/events/{id}/odds), so a
+12-game slate is 12 round-trips. This service fans them out under a
+semaphore, gives every event its own deadline, and yields each event's
+props as soon as it lands so callers can start work on early events while
+later ones are still downloading.
+
+Features:
+- Bounded concurrency (PROPS_FETCH_CONCURRENCY)
+- Per-event deadline (PROPS_EVENT_DEADLINE_S) + overall deadline (PROPS_TOTAL_DEADLINE_S)
+- Streaming delivery via iter_event_props() (completion order)
+- Per-event parsed-props cache, so one slow or failed event falls back to its
+  last good props instead of dropping out of the slate. Entry TTLs come from
+  odds_api.compute_adaptive_ttl (the same commence-time ladder and quota
+  stretch as the raw Odds API response cache)
+
+Integration Points:
+- live_data_router.get_props(): fetch_props_for_events() replaces the
+  sequential events[:5] loop
+- best-bets starts the props fetch alongside game odds/injuries/ESPN and
+  awaits it only where the props pipeline begins. Props scoring itself still
+  needs the assembled slate (ET gate, batched player resolution, cross-event
+  dedup), so per-event streaming is not fed into the scoring loop
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("props_fetcher")
+
+try:
+    from odds_api import compute_adaptive_ttl
+    ADAPTIVE_TTL_AVAILABLE = True
+except ImportError:
+    ADAPTIVE_TTL_AVAILABLE = False
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+PROPS_FETCH_CONCURRENCY = int(os.getenv("PROPS_FETCH_CONCURRENCY", "6"))
+PROPS_EVENT_DEADLINE_S = float(os.getenv("PROPS_EVENT_DEADLINE_S", "8"))
+PROPS_TOTAL_DEADLINE_S = float(os.getenv("PROPS_TOTAL_DEADLINE_S", "20"))
+PROPS_MAX_EVENTS = int(os.getenv("PROPS_MAX_EVENTS", "15"))
+
+# Fallback per-event props TTLs (pre-game vs in-play) when odds_api is unavailable
+PROPS_EVENT_CACHE_TTL_S = int(os.getenv("PROPS_EVENT_CACHE_TTL_S", "300"))
+PROPS_EVENT_CACHE_TTL_IN_PLAY_S = int(os.getenv("PROPS_EVENT_CACHE_TTL_IN_PLAY_S", "30"))
+# How long a last-good entry may be served when a refresh times out or fails
+PROPS_EVENT_STALE_GRACE_S = int(os.getenv("PROPS_EVENT_STALE_GRACE_S", "900"))
+
+# v20.15: Expanded prop markets - bet on all available prop types for complete learning
+DEFAULT_PROP_MARKETS = "player_points,player_rebounds,player_assists,player_threes,player_blocks,player_steals,player_turnovers"
+PROP_MARKETS_BY_SPORT = {
+    "nfl": "player_pass_tds,player_pass_yds,player_rush_yds,player_reception_yds,player_receptions,player_anytime_td",
+    "mlb": "batter_total_bases,batter_hits,batter_rbis,batter_runs,batter_home_runs,pitcher_strikeouts,pitcher_outs",
+    "nhl": "player_points,player_shots_on_goal,player_assists,player_goals,player_saves",
+}
+
+
+def prop_markets_for_sport(sport_lower: str) -> str:
+    """Odds API markets parameter for a sport's player props."""
+    return PROP_MARKETS_BY_SPORT.get(sport_lower, DEFAULT_PROP_MARKETS)
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def parse_event_props(event: Dict[str, Any], event_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten one /events/{id}/odds payload into the get_props game shape."""
+    game_props = {
+        "game_id": event_data.get("id"),
+        "home_team": event_data.get("home_team"),
+        "away_team": event_data.get("away_team"),
+        "commence_time": event.get("commence_time"),  # From events list, not event_data
+        "props": []
+    }
+
+    for bm in event_data.get("bookmakers", []):
+        for market in bm.get("markets", []):
+            market_key = market.get("key", "")
+            if "player" in market_key or "batter" in market_key or "pitcher" in market_key:
+                for outcome in market.get("outcomes", []):
+                    game_props["props"].append({
+                        "player": outcome.get("description", ""),
+                        "market": market_key,
+                        "line": outcome.get("point", 0),
+                        "odds": outcome.get("price", -110),
+                        "side": outcome.get("name"),
+                        "book": bm.get("key")
+                    })
+
+    return game_props
+
+
+def _is_in_play(commence_time: Any) -> bool:
+    if not commence_time or not isinstance(commence_time, str):
+        return False
+    try:
+        dt = datetime.fromisoformat(commence_time.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt <= datetime.now(timezone.utc)
+
+
+# =============================================================================
+# PER-EVENT CACHE
+# =============================================================================
+
+class EventPropsCache:
+    """Parsed props per (sport, event_id) with independent, commence-time adaptive TTLs."""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[Dict[str, Any], float, float]] = {}  # -> (props, stored_at, ttl)
+
+    def get(self, sport: str, event_id: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get((sport, event_id))
+        if entry is None:
+            return None
+        game_props, stored_at, ttl = entry
+        age = time.monotonic() - stored_at
+        if age <= ttl:
+            return game_props
+        if allow_stale and age <= ttl + PROPS_EVENT_STALE_GRACE_S:
+            return game_props
+        if age > ttl + PROPS_EVENT_STALE_GRACE_S:
+            del self._entries[(sport, event_id)]
+        return None
+
+    def put(self, sport: str, event_id: str, game_props: Dict[str, Any]) -> None:
+        if ADAPTIVE_TTL_AVAILABLE:
+            ttl = compute_adaptive_ttl({"commence_time": game_props.get("commence_time")})
+        elif _is_in_play(game_props.get("commence_time")):
+            ttl = PROPS_EVENT_CACHE_TTL_IN_PLAY_S
+        else:
+            ttl = PROPS_EVENT_CACHE_TTL_S
+        self._entries[(sport, event_id)] = (game_props, time.monotonic(), ttl)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_event_cache = EventPropsCache()
+
+
+def get_event_props_cache() -> EventPropsCache:
+    return _event_cache
+
+
+# =============================================================================
+# FETCH PIPELINE
+# =============================================================================
+
+@dataclass
+class EventPropsResult:
+    """Outcome of one event's props fetch."""
+    event_id: str
+    status: str  # FETCHED, CACHED, STALE, TIMEOUT, ERROR, EMPTY
+    game_props: Optional[Dict[str, Any]] = None
+    latency_ms: float = 0.0
+
+
+@dataclass
+class PropsFetchStats:
+    """Aggregate telemetry for one fetch_props_for_events() call."""
+    events_total: int = 0
+    events_requested: int = 0
+    fetched: int = 0
+    cached: int = 0
+    stale: int = 0
+    timed_out: int = 0
+    errors: int = 0
+    empty: int = 0
+    elapsed_ms: float = 0.0
+    concurrency: int = PROPS_FETCH_CONCURRENCY
+    first_event_ms: Optional[float] = None
+    statuses: Dict[str, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "events_total": self.events_total,
+            "events_requested": self.events_requested,
+            "fetched": self.fetched,
+            "cached": self.cached,
+            "stale": self.stale,
+            "timed_out": self.timed_out,
+            "errors": self.errors,
+            "empty": self.empty,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "first_event_ms": round(self.first_event_ms, 1) if self.first_event_ms is not None else None,
+            "concurrency": self.concurrency,
+        }
+
+
+FetchEvent = Callable[[str], Awaitable[Any]]
+
+
+async def _fetch_one(
+    sport: str,
+    event: Dict[str, Any],
+    fetch_event: FetchEvent,
+    semaphore: asyncio.Semaphore,
+    event_deadline_s: float,
+    cache: EventPropsCache,
+) -> EventPropsResult:
+    event_id = str(event.get("id"))
+    cached = cache.get(sport, event_id)
+    if cached is not None:
+        return EventPropsResult(event_id, "CACHED", cached)
+
+    start = time.monotonic()
+    try:
+        async with semaphore:
+            resp = await asyncio.wait_for(fetch_event(event_id), timeout=event_deadline_s)
+    except asyncio.TimeoutError:
+        stale = cache.get(sport, event_id, allow_stale=True)
+        logger.warning("Props fetch timed out for event %s after %.1fs%s",
+                       event_id, event_deadline_s, " (serving stale)" if stale else "")
+        return EventPropsResult(event_id, "STALE" if stale else "TIMEOUT", stale, (time.monotonic() - start) * 1000)
+    except Exception as e:
+        stale = cache.get(sport, event_id, allow_stale=True)
+        logger.warning("Props fetch failed for event %s: %s", event_id, e)
+        return EventPropsResult(event_id, "STALE" if stale else "ERROR", stale, (time.monotonic() - start) * 1000)
+
+    latency_ms = (time.monotonic() - start) * 1000
+    if not resp or getattr(resp, "status_code", None) != 200:
+        stale = cache.get(sport, event_id, allow_stale=True)
+        logger.debug("No props for event %s (status %s)", event_id, resp.status_code if resp else "no response")
+        return EventPropsResult(event_id, "STALE" if stale else "ERROR", stale, latency_ms)
+
+    try:
+        game_props = parse_event_props(event, resp.json())
+    except ValueError as e:
+        logger.warning("Failed to parse event %s props: %s", event_id, e)
+        return EventPropsResult(event_id, "ERROR", None, latency_ms)
+
+    if not game_props["props"]:
+        return EventPropsResult(event_id, "EMPTY", None, latency_ms)
+    cache.put(sport, event_id, game_props)
+    return EventPropsResult(event_id, "FETCHED", game_props, latency_ms)
+
+
+async def iter_event_props(
+    sport: str,
+    events: List[Dict[str, Any]],
+    fetch_event: FetchEvent,
+    *,
+    concurrency: int = PROPS_FETCH_CONCURRENCY,
+    event_deadline_s: float = PROPS_EVENT_DEADLINE_S,
+    total_deadline_s: float = PROPS_TOTAL_DEADLINE_S,
+    cache: Optional[EventPropsCache] = None,
+) -> AsyncIterator[EventPropsResult]:
+    """
+    Yield EventPropsResult per event in completion order.
+
+    Events still outstanding when total_deadline_s elapses are cancelled and
+    yielded as TIMEOUT (or STALE when a last-good copy exists).
+    """
+    cache = cache if cache is not None else _event_cache
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    events = [e for e in events if e.get("id")]
+    tasks = {
+        asyncio.ensure_future(_fetch_one(sport, e, fetch_event, semaphore, event_deadline_s, cache)): e
+        for e in events
+    }
+    deadline = time.monotonic() + total_deadline_s
+    pending = set(tasks)
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+    for task in pending:
+        event_id = str(tasks[task].get("id"))
+        stale = cache.get(sport, event_id, allow_stale=True)
+        yield EventPropsResult(event_id, "STALE" if stale else "TIMEOUT", stale)
+
+
+async def fetch_props_for_events(
+    sport: str,
+    events: List[Dict[str, Any]],
+    fetch_event: FetchEvent,
+    *,
+    max_events: int = PROPS_MAX_EVENTS,
+    concurrency: int = PROPS_FETCH_CONCURRENCY,
+    event_deadline_s: float = PROPS_EVENT_DEADLINE_S,
+    total_deadline_s: float = PROPS_TOTAL_DEADLINE_S,
+    on_event: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    cache: Optional[EventPropsCache] = None,
+) -> Tuple[List[Dict[str, Any]], PropsFetchStats]:
+    """
+    Collect props for up to max_events events, preserving the events order.
+
+    on_event (optional) is called with each game_props as soon as it arrives,
+    for callers that want to start processing before the slate completes.
+    Returns (data, stats); data holds only events that produced props.
+    """
+    stats = PropsFetchStats(events_total=len(events), concurrency=concurrency)
+    selected = events[:max_events]
+    stats.events_requested = len(selected)
+    order = {str(e.get("id")): i for i, e in enumerate(selected)}
+    by_event: Dict[str, Dict[str, Any]] = {}
+
+    start = time.monotonic()
+    async for result in iter_event_props(
+        sport, selected, fetch_event,
+        concurrency=concurrency,
+        event_deadline_s=event_deadline_s,
+        total_deadline_s=total_deadline_s,
+        cache=cache,
+    ):
+        stats.statuses[result.event_id] = result.status
+        if result.status == "FETCHED":
+            stats.fetched += 1
+        elif result.status == "CACHED":
+            stats.cached += 1
+        elif result.status == "STALE":
+            stats.stale += 1
+        elif result.status == "TIMEOUT":
+            stats.timed_out += 1
+        elif result.status == "EMPTY":
+            stats.empty += 1
+        else:
+            stats.errors += 1
+
+        if result.game_props:
+            if stats.first_event_ms is None:
+                stats.first_event_ms = (time.monotonic() - start) * 1000
+            by_event[result.event_id] = result.game_props
+            if on_event is not None:
+                try:
+                    on_event(result.game_props)
+                except Exception as e:
+                    logger.debug("props on_event callback failed: %s", e)
+
+    stats.elapsed_ms = (time.monotonic() - start) * 1000
+    data = [by_event[eid] for eid in sorted(by_event, key=lambda k: order.get(k, len(order)))]
+    return data, stats
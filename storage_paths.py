@@ -142,6 +142,11 @@ def get_graded_picks_file() -> str:
     return os.path.join(get_store_dir(), "graded_picks.jsonl")
 
 
+def get_features_dir() -> str:
+    """Get feature store root (append-only partitions by sport/date)."""
+    return os.path.join(get_store_dir(), "features")
+
+
 def get_weights_file() -> str:
     """Get weights.json path."""
     mount_root = get_mount_root()
@@ -11,11 +11,21 @@ Data sources:
 - Playbook API for team game logs
 - Graded picks for ensemble training
 - Persistent storage in /data/models/
+
+v20.30: Online learning. apply_graded_picks() updates the matchup matrix
+(running sufficient statistics per matchup) and the ensemble weights
+(exponentially weighted / Hedge updates) as each game is graded, in
+constant time per pick. A Page-Hinkley test on the ensemble's error flags
+drift; the daily scheduler only runs full retrains when drift is flagged
+or the last full retrain is too old.
 """
 
 import os
 import json
+import math
 import logging
+import tempfile
+import time
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -53,6 +63,63 @@ def _resolve_models_dir() -> str:
 
 MODELS_DIR = _resolve_models_dir()
 
+# v20.30: Online learning configuration
+TEAM_MODEL_ONLINE_UPDATES = os.getenv("TEAM_MODEL_ONLINE_UPDATES", "true").lower() == "true"
+ONLINE_ENSEMBLE_ETA = float(os.getenv("ONLINE_ENSEMBLE_ETA", "0.5"))
+ONLINE_MIN_WEIGHT = float(os.getenv("ONLINE_MIN_WEIGHT", "0.05"))
+ONLINE_SAVE_INTERVAL_SECONDS = float(os.getenv("ONLINE_SAVE_INTERVAL_SECONDS", "60"))
+DRIFT_MIN_SAMPLES = int(os.getenv("DRIFT_MIN_SAMPLES", "30"))
+DRIFT_PH_DELTA = float(os.getenv("DRIFT_PH_DELTA", "0.005"))
+DRIFT_PH_THRESHOLD = float(os.getenv("DRIFT_PH_THRESHOLD", "2.0"))
+TEAM_MODEL_MAX_RETRAIN_AGE_DAYS = int(os.getenv("TEAM_MODEL_MAX_RETRAIN_AGE_DAYS", "7"))
+
+
+def _atomic_write_json(path: str, data: Dict):
+    """Write JSON via a temp file + rename so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _welford_update(stats: Dict, name: str, value: float):
+    """Update running count/mean/M2 for `name` in place (Welford)."""
+    n = stats.get(f"{name}_n", 0) + 1
+    mean = stats.get(f"{name}_mean", 0.0)
+    delta = value - mean
+    mean += delta / n
+    stats[f"{name}_n"] = n
+    stats[f"{name}_mean"] = mean
+    stats[f"{name}_m2"] = stats.get(f"{name}_m2", 0.0) + delta * (value - mean)
+
+
+def _welford_std(stats: Dict, name: str) -> float:
+    n = stats.get(f"{name}_n", 0)
+    return math.sqrt(stats.get(f"{name}_m2", 0.0) / (n - 1)) if n > 1 else 0.0
+
+
+def _page_hinkley_update(state: Dict, value: float) -> bool:
+    """
+    Page-Hinkley test for an increase in the mean of `value` (updated in place).
+
+    Returns True when the cumulative deviation above the running mean exceeds
+    DRIFT_PH_THRESHOLD; the state is reset so the next alarm needs new evidence.
+    """
+    n = state.get("n", 0) + 1
+    mean = state.get("mean", 0.0) + (value - state.get("mean", 0.0)) / n
+    cumulative = state.get("cumulative", 0.0) + value - mean - DRIFT_PH_DELTA
+    minimum = min(state.get("minimum", 0.0), cumulative)
+    state.update(n=n, mean=mean, cumulative=cumulative, minimum=minimum)
+    if n >= DRIFT_MIN_SAMPLES and cumulative - minimum > DRIFT_PH_THRESHOLD:
+        state.clear()
+        return True
+    return False
+
 
 class TeamDataCache:
     """
@@ -282,6 +349,8 @@ class TeamMatchupModel:
     def __init__(self):
         self.matchups_path = os.path.join(MODELS_DIR, "matchup_matrix.json")
         self.matchups = self._load_matchups()
+        self._dirty = False
+        self._last_save = 0.0
 
     def _load_matchups(self) -> Dict:
         """Load matchup history from disk."""
@@ -296,8 +365,9 @@ class TeamMatchupModel:
     def _save_matchups(self):
         """Save matchup data to disk."""
         try:
-            with open(self.matchups_path, 'w') as f:
-                json.dump(self.matchups, f)
+            _atomic_write_json(self.matchups_path, self.matchups)
+            self._dirty = False
+            self._last_save = time.time()
             logger.info(f"Matchup matrix saved with {len(self.matchups)} matchups")
         except Exception as e:
             logger.error(f"Failed to save matchups: {e}")
@@ -308,8 +378,16 @@ class TeamMatchupModel:
         return f"{sport.lower()}_{teams[0]}_vs_{teams[1]}"
 
     def record_matchup(self, sport: str, home_team: str, away_team: str,
-                       home_score: float, away_score: float):
-        """Record a game result for matchup learning."""
+                       home_score: float, away_score: float, game_key: str = None) -> bool:
+        """
+        Record a game result for matchup learning.
+
+        Constant time: appends to the recent-games window and updates the
+        matchup's running statistics. With a game_key, a game that is already
+        in the window (e.g. replayed by the nightly job) is skipped.
+
+        Returns True if the game was recorded.
+        """
         key = self._get_matchup_key(home_team, away_team, sport)
 
         if key not in self.matchups:
@@ -318,16 +396,39 @@ class TeamMatchupModel:
                 "team_a": sorted([home_team.lower(), away_team.lower()])[0],
                 "team_b": sorted([home_team.lower(), away_team.lower()])[1]
             }
+        entry = self.matchups[key]
+
+        if game_key is not None and any(g.get("game_key") == game_key for g in entry["games"]):
+            return False
 
         # Record game (keep last 10)
-        self.matchups[key]["games"].append({
+        game = {
             "home": home_team.lower(),
             "away": away_team.lower(),
             "home_score": home_score,
             "away_score": away_score,
             "date": datetime.now().isoformat()
-        })
-        self.matchups[key]["games"] = self.matchups[key]["games"][-10:]
+        }
+        if game_key is not None:
+            game["game_key"] = game_key
+        entry["games"].append(game)
+        entry["games"] = entry["games"][-10:]
+
+        # v20.30: Running sufficient statistics over all recorded games
+        stats = entry.setdefault("stats", {})
+        team_a_score = home_score if home_team.lower() == entry["team_a"] else away_score
+        team_b_score = home_score + away_score - team_a_score
+        _welford_update(stats, "total", home_score + away_score)
+        _welford_update(stats, "margin", team_a_score - team_b_score)
+        stats["team_a_wins"] = stats.get("team_a_wins", 0) + (1 if team_a_score > team_b_score else 0)
+
+        self._dirty = True
+        return True
+
+    def flush(self, force: bool = False):
+        """Persist pending online updates (at most every ONLINE_SAVE_INTERVAL_SECONDS unless forced)."""
+        if self._dirty and (force or time.time() - self._last_save >= ONLINE_SAVE_INTERVAL_SECONDS):
+            self._save_matchups()
 
     def predict(self, sport: str, home_team: str, away_team: str,
                 features: np.ndarray = None, is_totals: bool = False) -> float:
@@ -376,7 +477,7 @@ class TeamMatchupModel:
                        if (g["home"] == home_team_lower and g["home_score"] > g["away_score"]) or
                           (g["away"] == home_team_lower and g["away_score"] > g["home_score"]))
 
-        return {
+        result = {
             "games_played": len(games),
             "home_team_wins": home_wins,
             "away_team_wins": len(games) - home_wins,
@@ -384,6 +485,21 @@ class TeamMatchupModel:
             "avg_margin": np.mean([abs(g["home_score"] - g["away_score"]) for g in games])
         }
 
+        # v20.30: All-time running statistics (oriented to home_team)
+        stats = self.matchups[key].get("stats")
+        if stats:
+            sign = 1 if home_team_lower == self.matchups[key]["team_a"] else -1
+            n = stats["total_n"]
+            result["all_time"] = {
+                "games": n,
+                "home_team_wins": stats["team_a_wins"] if sign > 0 else n - stats["team_a_wins"],
+                "avg_total": round(stats["total_mean"], 2),
+                "total_std": round(_welford_std(stats, "total"), 2),
+                "avg_home_team_margin": round(sign * stats["margin_mean"], 2),
+                "margin_std": round(_welford_std(stats, "margin"), 2),
+            }
+        return result
+
     @property
     def is_trained(self) -> bool:
         """Check if we have matchup data."""
@@ -406,6 +522,8 @@ class GameEnsembleModel:
         self.weights_path = os.path.join(MODELS_DIR, "ensemble_weights.json")
         self.weights = self._load_weights()
         self.model = None  # Optional XGBoost model
+        self._dirty = False
+        self._last_save = 0.0
         self._load_model()
 
     def _load_weights(self) -> Dict:
@@ -433,8 +551,9 @@ class GameEnsembleModel:
     def _save_weights(self):
         """Save ensemble weights."""
         try:
-            with open(self.weights_path, 'w') as f:
-                json.dump(self.weights, f)
+            _atomic_write_json(self.weights_path, self.weights)
+            self._dirty = False
+            self._last_save = time.time()
         except Exception as e:
             logger.error(f"Failed to save ensemble weights: {e}")
 
@@ -531,6 +650,71 @@ class GameEnsembleModel:
         if self.weights["_trained_samples"] % 10 == 0:
             self._save_weights()
 
+    def observe(self, hit_probabilities: Dict[str, float], hit_label: float) -> Dict:
+        """
+        v20.30: Online update from one graded pick (constant time).
+
+        Same objective as the nightly update_ensemble_weights: the binary hit
+        label (WIN=1, LOSS=0). Each model's loss is |P(hit) - label| for the
+        probability it gave the pick (see _model_hit_probabilities). Weights
+        follow the exponentially weighted (Hedge) rule w *= exp(-eta * loss),
+        floored at ONLINE_MIN_WEIGHT so no model is switched off for good. The
+        ensemble's own loss feeds a Page-Hinkley drift test.
+        """
+        losses = {
+            name: min(abs(min(max(p, 0.0), 1.0) - hit_label), 1.0)
+            for name, p in hit_probabilities.items()
+            if p is not None and name in self.weights and not name.startswith("_")
+        }
+        if not losses:
+            return {"updated": False}
+
+        ensemble_p = self.predict({m: hit_probabilities[m] for m in losses})
+        ensemble_loss = min(abs(ensemble_p - hit_label), 1.0)
+
+        for name, loss in losses.items():
+            self.weights[name] *= math.exp(-ONLINE_ENSEMBLE_ETA * loss)
+        model_names = [k for k in self.weights if not k.startswith("_")]
+        # Normalize with a floor: floored models keep ONLINE_MIN_WEIGHT, the rest share what is left
+        floor = min(ONLINE_MIN_WEIGHT, 1.0 / len(model_names))
+        floored = set()
+        while True:
+            free = [k for k in model_names if k not in floored]
+            free_sum = sum(self.weights[k] for k in free)
+            share = 1.0 - floor * len(floored)
+            below = [k for k in free if self.weights[k] / free_sum * share < floor]
+            if not below:
+                break
+            floored.update(below)
+        for k in model_names:
+            self.weights[k] = floor if k in floored else self.weights[k] / free_sum * share
+
+        online = self.weights.setdefault("_online", {})
+        online["updates"] = online.get("updates", 0) + 1
+        online["last_update_at"] = datetime.now().isoformat()
+        ewma = online.setdefault("ewma_loss", {})
+        for name, loss in list(losses.items()) + [("ensemble", ensemble_loss)]:
+            ewma[name] = loss if name not in ewma else 0.95 * ewma[name] + 0.05 * loss
+        drift = _page_hinkley_update(online.setdefault("page_hinkley", {}), ensemble_loss)
+        if drift and not online.get("drift_detected"):
+            online["drift_detected"] = True
+            online["drift_detected_at"] = datetime.now().isoformat()
+            logger.warning("Ensemble drift detected after %d online updates (ewma loss %.3f)",
+                           online["updates"], ewma["ensemble"])
+
+        self.weights["_trained_samples"] = self.weights.get("_trained_samples", 0) + 1
+        self._dirty = True
+        return {"updated": True, "ensemble_loss": ensemble_loss, "drift": drift}
+
+    def flush(self, force: bool = False):
+        """Persist pending online updates (at most every ONLINE_SAVE_INTERVAL_SECONDS unless forced)."""
+        if self._dirty and (force or time.time() - self._last_save >= ONLINE_SAVE_INTERVAL_SECONDS):
+            self._save_weights()
+
+    @property
+    def drift_detected(self) -> bool:
+        return bool(self.weights.get("_online", {}).get("drift_detected"))
+
     def record_training_run(
         self,
         graded_samples_seen: int,
@@ -572,6 +756,12 @@ class GameEnsembleModel:
         if training_signatures:
             self.weights["_training_signatures"] = training_signatures
 
+        # v20.30: A full retrain resolves any pending drift alarm
+        online = self.weights.get("_online")
+        if online and online.get("drift_detected"):
+            online["drift_detected"] = False
+            online["drift_resolved_at"] = self.weights["_last_train_run_at"]
+
         self._save_weights()
         logger.info(f"Training run recorded: seen={graded_samples_seen}, used={samples_used}")
 
@@ -642,6 +832,136 @@ def get_game_ensemble() -> GameEnsembleModel:
     return _game_ensemble
 
 
+# ============================================
+# ONLINE LEARNING (v20.30)
+# ============================================
+
+GAME_PICK_TYPES = {"SPREAD", "SPREADS", "TOTAL", "TOTALS", "MONEYLINE"}
+
+
+def _model_predictions_from_pick(pick: Dict) -> Optional[Dict[str, float]]:
+    """Per-model predictions stored with the pick (ai_breakdown model_preds, same order as training)."""
+    breakdown = pick.get("ai_breakdown") or {}
+    values = breakdown.get("raw_inputs", {}).get("model_preds", {}).get("values", [])
+    if len(values) < 4:
+        return None
+    return dict(zip(["ensemble", "lstm", "matchup", "monte_carlo"], values[:4]))
+
+
+def _hit_label(pick: Dict) -> Optional[float]:
+    """WIN = 1, LOSS = 0; PUSH and ungraded are excluded (as in update_ensemble_weights)."""
+    result = str(pick.get("result") or "").upper()
+    return {"WIN": 1.0, "LOSS": 0.0}.get(result)
+
+
+def _model_hit_probabilities(predictions: Dict[str, float], pick: Dict) -> Dict[str, float]:
+    """
+    Each model's P(pick hits).
+
+    Values already in [0, 1] are probabilities. Point predictions only have
+    a hit probability for totals, where they back the pick when they land on
+    the picked side of the line; other point-scale values are skipped.
+    """
+    side = str(pick.get("side") or pick.get("pick_side") or "").upper()
+    line = pick.get("line")
+    probabilities = {}
+    for name, pred in predictions.items():
+        if pred is None:
+            continue
+        if 0.0 <= pred <= 1.0:
+            probabilities[name] = float(pred)
+        elif line is not None and side in ("OVER", "UNDER") and pred != line:
+            probabilities[name] = 1.0 if (pred > line) == (side == "OVER") else 0.0
+    return probabilities
+
+
+def apply_graded_pick(pick: Dict) -> Dict[str, bool]:
+    """
+    Apply one graded game pick to the matchup matrix and ensemble weights.
+
+    Matchups need the final scores (actual_home_score/actual_away_score);
+    the game is keyed by event_id so the spread and total picks for one
+    game count once. Ensemble weights need the stored model predictions and
+    a WIN/LOSS result. Props are skipped. Nothing is persisted here; see
+    apply_graded_picks().
+    """
+    applied = {"matchup": False, "ensemble": False}
+
+    pick_type = str(pick.get("pick_type", "")).upper()
+    if pick_type not in GAME_PICK_TYPES:
+        return applied
+
+    home_team, away_team = pick.get("home_team"), pick.get("away_team")
+    home_score, away_score = pick.get("actual_home_score"), pick.get("actual_away_score")
+    if home_team and away_team and home_score is not None and away_score is not None:
+        game_key = pick.get("event_id") or f"{pick.get('date_et', '')}:{home_team}:{away_team}".lower()
+        applied["matchup"] = get_team_matchup().record_matchup(
+            pick.get("sport", "NBA"), home_team, away_team,
+            float(home_score), float(away_score), game_key=str(game_key)
+        )
+
+    predictions = _model_predictions_from_pick(pick)
+    hit_label = _hit_label(pick)
+    if predictions and hit_label is not None:
+        probabilities = _model_hit_probabilities(predictions, pick)
+        if probabilities:
+            applied["ensemble"] = get_game_ensemble().observe(probabilities, hit_label)["updated"]
+
+    return applied
+
+
+def apply_graded_picks(picks: List[Dict]) -> Dict:
+    """Online update for a batch of newly graded picks, then persist once."""
+    counts = {"picks": len(picks), "matchup_updates": 0, "ensemble_updates": 0}
+    if not TEAM_MODEL_ONLINE_UPDATES or not picks:
+        return counts
+    for pick in picks:
+        try:
+            applied = apply_graded_pick(pick)
+        except Exception as e:
+            logger.debug("Online update skipped for %s: %s", pick.get("pick_id"), e)
+            continue
+        counts["matchup_updates"] += int(applied["matchup"])
+        counts["ensemble_updates"] += int(applied["ensemble"])
+    get_team_matchup().flush(force=True)
+    get_game_ensemble().flush(force=True)
+    counts["drift_detected"] = get_game_ensemble().drift_detected
+    # Grading runs in the scheduler lease holder; other processes reload from disk
+    updated = [name for name, n in (("team_matchup", counts["matchup_updates"]),
+                                    ("game_ensemble", counts["ensemble_updates"])) if n]
+    if updated:
+        from core.scheduler_worker import publish_model_update
+        publish_model_update(*updated)
+    logger.info("Online model updates: %d matchup, %d ensemble (%d picks)",
+                counts["matchup_updates"], counts["ensemble_updates"], counts["picks"])
+    return counts
+
+
+def needs_full_retrain() -> Tuple[bool, str]:
+    """
+    Whether the scheduled jobs should run a full retrain.
+
+    Always True when online updates are disabled. Otherwise only on drift,
+    before the first full retrain, or when the last one is older than
+    TEAM_MODEL_MAX_RETRAIN_AGE_DAYS.
+    """
+    if not TEAM_MODEL_ONLINE_UPDATES:
+        return True, "online_updates_disabled"
+    ensemble = get_game_ensemble()
+    if ensemble.drift_detected:
+        return True, "drift_detected"
+    last_run = ensemble.weights.get("_last_train_run_at")
+    if not last_run:
+        return True, "never_trained"
+    try:
+        age = datetime.now() - datetime.fromisoformat(last_run)
+    except ValueError:
+        return True, "invalid_last_train_run_at"
+    if age > timedelta(days=TEAM_MODEL_MAX_RETRAIN_AGE_DAYS):
+        return True, "stale"
+    return False, "online_current"
+
+
 def _get_sklearn_status() -> Dict:
     """Get sklearn regressor status from EnsembleStackingModel.
 
@@ -732,6 +1052,13 @@ def get_model_status() -> Dict:
             "training_signature": training_signatures.get("ensemble", {}),
             # v20.22: Sklearn regressor status (shadow mode by default)
             "sklearn_status": _get_sklearn_status(),
+            # v20.30: Online learning / drift state
+            "online": {
+                "enabled": TEAM_MODEL_ONLINE_UPDATES,
+                "updates": ensemble.weights.get("_online", {}).get("updates", 0),
+                "drift_detected": ensemble.drift_detected,
+                "ewma_loss": ensemble.weights.get("_online", {}).get("ewma_loss", {}),
+            },
         },
         # v20.17.0: Mechanically checkable training telemetry
         "training_telemetry": {
@@ -73,20 +73,28 @@ def test_error_returns_structured_code_in_debug():
 def test_warm_skips_cache_hot():
     """warm_best_bets_cache skips sports with warm cache."""
     import asyncio
+    import contextlib
+    from datetime import datetime, timedelta, timezone
+    from cache_warmer import BestBetsWarmer
+
+    @contextlib.asynccontextmanager
+    async def no_client():
+        yield None
+
+    async def fetch_events(client, sport):
+        soon = datetime.now(timezone.utc) + timedelta(minutes=1)
+        return [{"commence_time": soon.strftime("%Y-%m-%dT%H:%M:%SZ")}]
+
+    mock_cache = MagicMock()
+    # Simulate cache hot for nba
+    mock_cache.ttl_remaining.side_effect = lambda key: 3600 if key == "best-bets:nba" else None
+    mock_cache.acquire_lock.return_value = True
+    mock_compute = AsyncMock()
+    warmer = BestBetsWarmer(sports=["nba", "nhl"], cache=mock_cache, compute=mock_compute,
+                            fetch_events=fetch_events, http_client=no_client, quota_remaining=lambda: None)
 
     with patch("daily_scheduler.WARM_AVAILABLE", True), \
-         patch("daily_scheduler.api_cache") as mock_cache, \
-         patch("daily_scheduler._best_bets_inner", new_callable=AsyncMock) as mock_inner:
-
-        # Simulate cache hot for nba
-        def fake_get(key):
-            if key == "best-bets:nba":
-                return {"cached": True}
-            return None
-        mock_cache.get.side_effect = fake_get
-        mock_cache.acquire_lock.return_value = True
-        mock_cache.release_lock.return_value = None
-
+         patch("daily_scheduler.get_best_bets_warmer", return_value=warmer):
         from daily_scheduler import warm_best_bets_cache
 
         loop = asyncio.new_event_loop()
@@ -95,7 +103,6 @@ def test_warm_skips_cache_hot():
         finally:
             loop.close()
 
-        # _best_bets_inner should NOT have been called for nba (cache hot)
-        for call in mock_inner.call_args_list:
-            assert call[0][0].lower() != "nba", \
-                "_best_bets_inner should not be called for nba when cache is hot"
+    # Best-bets should NOT have been computed for nba (cache hot)
+    computed = [call[0][0].lower() for call in mock_compute.call_args_list]
+    assert "nba" not in computed, "nba should not be warmed when its cache is hot"
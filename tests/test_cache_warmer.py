@@ -0,0 +1,229 @@
+"""
+Tests for cache_warmer.py - concurrent, priority-ordered best-bets warming.
+"""
+import asyncio
+import contextlib
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import cache_warmer
+from cache_warmer import BestBetsWarmer, LatencyHistogram, RequestRateTracker
+
+
+class FakeCache:
+    def __init__(self):
+        self.expiry = {}
+        self.values = {}
+        self.locks = set()
+
+    def get(self, key):
+        return self.values.get(key) if self.ttl_remaining(key) else None
+
+    def set(self, key, value, ttl=None):
+        self.values[key] = value
+        self.expiry[key] = time.time() + (ttl or 300)
+
+    def ttl_remaining(self, key):
+        remaining = self.expiry.get(key, 0) - time.time()
+        return remaining if remaining > 0 else None
+
+    def acquire_lock(self, key, ttl=900):
+        if key in self.locks:
+            return False
+        self.locks.add(key)
+        return True
+
+    def release_lock(self, key):
+        self.locks.discard(key)
+
+
+def _event_in(hours):
+    when = datetime.now(timezone.utc) + timedelta(hours=hours)
+    return {"commence_time": when.strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+
+@contextlib.asynccontextmanager
+async def _no_client():
+    yield None
+
+
+def _warmer(schedule, cache=None, rates=None, quota=None, concurrency=2, delay=0.02):
+    cache = cache or FakeCache()
+    state = {"order": [], "in_flight": 0, "max_in_flight": 0}
+
+    async def compute(sport):
+        state["order"].append(sport)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(delay)
+        state["in_flight"] -= 1
+        cache.set(f"best-bets:{sport}", {"sport": sport}, ttl=120)
+
+    async def fetch_events(client, sport):
+        return schedule.get(sport)
+
+    warmer = BestBetsWarmer(
+        sports=list(schedule), cache=cache, compute=compute, fetch_events=fetch_events,
+        http_client=_no_client, quota_remaining=lambda: quota,
+        request_rates=rates or RequestRateTracker(), max_concurrency=concurrency,
+    )
+    return warmer, cache, state
+
+
+@pytest.fixture
+def today_hours():
+    # Keep every test game on today's ET date regardless of when the suite runs
+    now_et = datetime.now(cache_warmer._et())
+    hours_left = 24 - now_et.hour - now_et.minute / 60
+    if hours_left < 0.75:
+        pytest.skip("too close to ET midnight for same-day fixtures")
+    return lambda fraction: hours_left * fraction
+
+
+def test_warm_all_is_concurrent_and_priority_ordered(today_hours):
+    schedule = {
+        "nba": [_event_in(today_hours(0.6))],
+        "nhl": [_event_in(today_hours(0.1))],
+        "nfl": [_event_in(today_hours(0.3))],
+        "mlb": [],
+        "ncaab": None,  # schedule unavailable
+    }
+    warmer, cache, state = _warmer(schedule)
+    results = asyncio.run(warmer.warm_all())
+
+    assert state["order"] == ["nhl", "nfl", "nba"]
+    assert results == {"nhl": True, "nfl": True, "nba": True}
+    assert state["max_in_flight"] == 2  # concurrent, but within the budget
+    assert cache.locks == set()
+    assert cache.values["warm_meta:nhl"]["reason"] == "scheduled"
+    assert warmer.stats()["sports"]["nba"]["latency"]["count"] == 1
+
+
+def test_request_rate_raises_priority(today_hours):
+    rates = RequestRateTracker(window_s=60)
+    for _ in range(30):
+        rates.record("nba")
+    schedule = {"nba": [_event_in(today_hours(0.6))], "nhl": [_event_in(today_hours(0.1))]}
+    warmer, _, state = _warmer(schedule, rates=rates, concurrency=1)
+    asyncio.run(warmer.warm_all())
+    assert state["order"] == ["nba", "nhl"]
+
+
+def test_hot_cache_and_locked_sports_are_skipped(today_hours):
+    schedule = {"nba": [_event_in(today_hours(0.5))], "nhl": [_event_in(today_hours(0.5))]}
+    cache = FakeCache()
+    cache.set("best-bets:nba", {"warm": True}, ttl=120)
+    cache.acquire_lock("warm_best_bets:nhl")
+    warmer, _, state = _warmer(schedule, cache=cache)
+    assert asyncio.run(warmer.warm_all()) == {"nhl": False}
+    assert state["order"] == []
+    assert warmer.stats()["skipped_locked"] == 1
+
+
+def test_low_quota_skips_warming(today_hours):
+    warmer, _, state = _warmer({"nba": [_event_in(today_hours(0.5))]}, quota=10)
+    assert asyncio.run(warmer.warm_all()) == {"nba": False}
+    assert state["order"] == [] and warmer.stats()["skipped_quota"] == 1
+
+
+def test_refresh_ahead_rewarms_active_sports_near_expiry(today_hours, monkeypatch):
+    monkeypatch.setattr(cache_warmer, "WARM_TIPOFF_HORIZON_HOURS", today_hours(0.2))
+    rates = RequestRateTracker()
+    rates.record("nfl")
+    schedule = {
+        "nba": [_event_in(today_hours(0.1))],  # tips soon -> active
+        "nfl": [_event_in(today_hours(0.9))],  # requested recently -> active
+        "mlb": [_event_in(today_hours(0.9))],  # neither -> left alone
+    }
+    cache = FakeCache()
+    cache.set("best-bets:nba", {}, ttl=10)   # about to expire
+    cache.set("best-bets:nfl", {}, ttl=110)  # still fresh
+    warmer, _, state = _warmer(schedule, cache=cache, rates=rates)
+
+    assert asyncio.run(warmer.refresh_due()) == {"nba": True}
+    cache.expiry["best-bets:nfl"] = time.time() + 5
+    assert asyncio.run(warmer.refresh_due()) == {"nfl": True}
+    assert state["order"] == ["nba", "nfl"]
+    assert cache.values["warm_meta:nfl"]["reason"] == "refresh_ahead"
+
+
+def test_latency_histogram_buckets():
+    hist = LatencyHistogram(buckets=(1, 5, 10))
+    for seconds in (0.5, 2, 3, 7, 30):
+        hist.observe(seconds)
+    snap = hist.snapshot()
+    assert snap["buckets"] == {"1": 1, "5": 3, "10": 4, "+Inf": 5}
+    assert snap["p50_le_s"] == 5 and snap["p95_le_s"] is None
+    assert snap["max_s"] == 30
+
+
+def test_refresh_ahead_lead_follows_warm_latency(monkeypatch):
+    monkeypatch.setattr(cache_warmer, "WARM_REFRESH_AHEAD_S", 30)
+    warmer, _, _ = _warmer({"nba": []})
+    assert warmer.refresh_ahead_s("nba") == 30  # no samples yet -> floor
+
+    hist = warmer._histograms.setdefault("nba", LatencyHistogram())
+    for _ in range(20):
+        hist.observe(3)
+    assert warmer.refresh_ahead_s("nba") == 30  # fast warms keep the floor
+
+    for _ in range(20):
+        hist.observe(55)
+    assert warmer.refresh_ahead_s("nba") == 90  # p95 bucket 60s x 1.5
+    hist.observe(500)
+    hist.observe(500)
+    hist.observe(500)
+    assert warmer.refresh_ahead_s("nba") == cache_warmer.BEST_BETS_CACHE_TTL_S
+
+
+def test_slots_are_shared_across_event_loops():
+    import threading
+
+    warmer, _, _ = _warmer({"nba": []}, concurrency=1)
+    order = []
+
+    async def hold(name, seconds):
+        await warmer._acquire_slot()
+        order.append((name, "start"))
+        await asyncio.sleep(seconds)
+        order.append((name, "end"))
+        warmer._release_slot()
+
+    first_in = threading.Event()
+
+    async def first():
+        await warmer._acquire_slot()
+        first_in.set()
+        order.append(("a", "start"))
+        await asyncio.sleep(0.1)
+        order.append(("a", "end"))
+        warmer._release_slot()
+
+    thread = threading.Thread(target=lambda: asyncio.run(first()))
+    thread.start()
+    first_in.wait(2)
+    asyncio.run(hold("b", 0.01))
+    thread.join(2)
+
+    assert order == [("a", "start"), ("a", "end"), ("b", "start"), ("b", "end")]
+    assert warmer.stats()["in_flight"] == 0
+
+
+def test_cancelled_slot_waiter_does_not_leak_a_slot():
+    warmer, _, _ = _warmer({"nba": []}, concurrency=1)
+
+    async def scenario():
+        await warmer._acquire_slot()
+        waiter = asyncio.ensure_future(warmer._acquire_slot())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        warmer._release_slot()
+        await asyncio.wait_for(warmer._acquire_slot(), 1)
+        warmer._release_slot()
+
+    asyncio.run(scenario())
+    assert warmer.stats()["in_flight"] == 0 and not warmer._slot_waiters
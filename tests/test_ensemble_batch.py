@@ -0,0 +1,128 @@
+"""
+Tests for batched ensemble hit-probability scoring in ml_integration.py.
+"""
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ml_integration import EnsembleModelManager, encode_ensemble_features  # noqa: E402
+
+
+class _FakeClassifier:
+    """predict_proba = sigmoid of the feature sum; counts calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_proba(self, X):
+        self.calls.append(X.shape)
+        p = 1 / (1 + np.exp(-(X[:, :4].sum(axis=1) - 20) / 5))
+        return np.column_stack([1 - p, p])
+
+
+def _manager():
+    manager = EnsembleModelManager(models_dir="/nonexistent")
+    manager.model = _FakeClassifier()
+    return manager
+
+
+def _picks():
+    return [
+        {"ai_score": 6.0, "research_score": 5.5, "esoteric_score": 4.0, "jarvis_score": 5.0,
+         "sport": "NFL", "pick_type": "SPREAD", "side": "Home", "line": -3.5},
+        {"ai_score": 3.0, "research_score": 4.0, "esoteric_score": 2.0, "jarvis_score": 4.5,
+         "sport": "nhl", "pick_type": "TOTAL", "side": "Under", "odds": 120},
+        {"ai_score": 7.5, "research_score": 7.0, "esoteric_score": 6.5, "jarvis_score": 6.0,
+         "sport": "XFL", "pick_type": "MONEYLINE", "side": "Away", "titanium_triggered": True},
+    ]
+
+
+def test_encoding_matches_per_pick_codes():
+    X = encode_ensemble_features(_picks())
+    assert X.shape == (3, 12)
+    assert X.dtype == np.float32
+    # sport, pick_type, side codes
+    assert X[:, 9].tolist() == [1, 3, 0]
+    assert X[:, 10].tolist() == [1, 2, 3]
+    assert X[:, 11].tolist() == [2, 1, 3]
+    # defaults and booleans
+    assert X[:, 5].tolist() == [-110, 120, -110]
+    assert X[:, 8].tolist() == [0, 0, 1]
+
+
+def test_column_input_broadcasts_scalars():
+    X = encode_ensemble_features({
+        "ai_score": [5.0, 6.0], "research_score": [5.0, 6.0],
+        "esoteric_score": 4.0, "jarvis_score": 4.5, "sport": "MLB",
+    })
+    assert X.shape == (2, 12)
+    assert X[:, 2].tolist() == [4.0, 4.0]
+    assert X[:, 9].tolist() == [2, 2]
+
+
+def test_column_length_mismatch_rejected():
+    with pytest.raises(ValueError):
+        encode_ensemble_features({"ai_score": [1, 2], "research_score": [1, 2, 3],
+                                  "esoteric_score": 0, "jarvis_score": 0})
+
+
+def test_batch_uses_one_predict_proba_call_and_matches_single():
+    manager = _manager()
+    batch = manager.predict_hit_probability_batch(_picks())
+    assert manager.model.calls == [(3, 12)]
+
+    singles = [manager.predict_hit_probability(**pick) for pick in _picks()]
+    assert [r["hit_probability"] for r in batch] == [r["hit_probability"] for r in singles]
+    assert batch[2]["predicted_hit"] is True
+
+
+def test_batch_matches_unbatched_per_row_model_calls():
+    manager = _manager()
+    batch = manager.predict_hit_probability_batch(_picks())
+    for pick, result in zip(_picks(), batch):
+        row = encode_ensemble_features([pick])
+        p = float(_FakeClassifier().predict_proba(row)[0, 1])
+        assert result["hit_probability"] == round(p, 4)
+        assert result["predicted_hit"] is (p >= 0.5)
+
+
+def test_batch_stats_reported_in_status():
+    manager = _manager()
+    manager.predict_hit_probability_batch(_picks())
+    manager.predict_hit_probability(ai_score=5, research_score=5, esoteric_score=5, jarvis_score=5)
+    stats = manager.get_status()["batching"]
+    assert stats["batches"] == 2
+    assert stats["rows"] == 4
+    assert stats["max_batch_size"] == 3
+    assert stats["last_batch_size"] == 1
+    assert stats["avg_latency_ms"] is not None
+    assert manager.get_status()["predictions"] == 4
+
+
+def test_batch_returns_none_without_model():
+    manager = EnsembleModelManager(models_dir="/nonexistent")
+    assert manager.predict_hit_probability_batch(_picks()) is None
+
+
+def test_ai_scores_batch_matches_single_pick_scores(monkeypatch):
+    import ml_integration
+
+    manager = _manager()
+    monkeypatch.setattr(ml_integration, "_ensemble_manager", manager)
+    rows = [dict(pick, base_ai=base) for pick, base in zip(_picks(), (4.5, 5.0, 6.0))]
+
+    batch = ml_integration.get_ensemble_ai_scores_batch(rows)
+    assert manager.model.calls == [(3, 12)]
+    assert batch == [ml_integration.get_ensemble_ai_score(**row) for row in rows]
+    assert all(meta["source"] == "ensemble" and 2.0 <= ai <= 8.0 for ai, meta in batch)
+
+
+def test_ai_scores_batch_falls_back_to_base_ai_without_model(monkeypatch):
+    import ml_integration
+
+    monkeypatch.setattr(ml_integration, "_ensemble_manager", EnsembleModelManager(models_dir="/nonexistent"))
+    rows = [dict(pick, base_ai=5.5) for pick in _picks()]
+    results = ml_integration.get_ensemble_ai_scores_batch(rows)
+    assert [ai for ai, _ in results] == [5.5, 5.5, 5.5]
+    assert {meta["source"] for _, meta in results} == {"heuristic"}
+    assert ml_integration.get_ensemble_ai_scores_batch([]) == []
@@ -0,0 +1,192 @@
+"""
+Tests for services/feature_store.py - materialized training features.
+"""
+import importlib.util
+import json
+import os
+import sys
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ml_integration import encode_ensemble_features  # noqa: E402
+from services.feature_store import (  # noqa: E402
+    ARROW_AVAILABLE,
+    FEATURE_COLUMNS,
+    FeatureStore,
+    ensemble_inputs,
+    materialize,
+)
+
+
+def _pick(pick_id, sport="NBA", day="2026-10-01", result="WIN", **extra):
+    pick = {
+        "pick_id": pick_id, "sport": sport, "date_et": day, "created_at": f"{day}T19:00:00",
+        "pick_type": "PROP", "side": "Over", "line": 24.5, "odds_american": -115,
+        "ai_score": 7.1, "research_score": 6.4, "esoteric_score": 5.2, "jarvis_rs": 6.0,
+        "final_score": 7.4, "grade_status": "GRADED", "result": result,
+    }
+    pick.update(extra)
+    return pick
+
+
+@pytest.fixture(params=[True, False] if ARROW_AVAILABLE else [False], ids=lambda a: "parquet" if a else "npz")
+def store(request, tmp_path):
+    return FeatureStore(root=str(tmp_path / "features"), use_arrow=request.param)
+
+
+def test_materialized_features_match_inference_encoder():
+    picks = [
+        _pick("a"),
+        _pick("b", sport="NFL", pick_type="SPREAD", side="Chiefs", selection_home_away="HOME", result="LOSS"),
+        _pick("c", pick_type="PLAYER_POINTS", side="Under", titanium_triggered=True),
+    ]
+    columns = materialize(picks)
+    X = np.column_stack([columns[name] for name in FEATURE_COLUMNS])
+    np.testing.assert_allclose(X, encode_ensemble_features([ensemble_inputs(p) for p in picks]))
+    assert list(columns["outcome"]) == [1, 0, 1]
+    # Stored-field aliases resolve like scripts/train_ensemble.extract_features
+    assert columns["jarvis_score"][0] == pytest.approx(6.0)
+    assert columns["odds_american"][0] == -115
+    assert list(columns["side_encoded"]) == [0, 2, 1]
+    assert columns["pick_type_encoded"][2] == 0
+
+
+def test_feature_schema_matches_training_script():
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts", "train_ensemble.py")
+    spec = importlib.util.spec_from_file_location("train_ensemble_for_test", path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.modules.pop("train_ensemble_for_test", None)
+    assert module.FEATURE_NAMES == FEATURE_COLUMNS
+
+
+def test_ungraded_and_push_picks_are_skipped(store):
+    assert store.append([_pick("p", result="PUSH"), _pick("q", result=None)]) == 0
+    assert store.read() == {}
+
+
+def test_append_partitions_and_filters(store):
+    store.append([_pick("a"), _pick("b", day="2026-10-02"), _pick("c", sport="NFL", pick_type="SPREAD")])
+    assert store.stats()["partitions"] == 3
+
+    nba = store.read(sport="nba")
+    assert sorted(nba["pick_id"]) == ["a", "b"]
+    window = store.read(start_date=date(2026, 10, 2), end_date=date(2026, 10, 2))
+    assert list(window["pick_id"]) == ["b"]
+    spreads = store.read(pick_type="spread", columns=["pick_id", "line"])
+    assert set(spreads) == {"pick_id", "line"} and list(spreads["pick_id"]) == ["c"]
+
+
+def test_regrade_supersedes_and_sync_skips_known(store):
+    store.append([_pick("a", result="LOSS")])
+    store.append([_pick("a", result="WIN")])
+    data = store.read()
+    assert list(data["pick_id"]) == ["a"] and list(data["outcome"]) == [1]
+
+    assert store.sync([_pick("a"), _pick("b"), _pick("c", grade_status="PENDING")]) == 1
+    assert sorted(store.read()["pick_id"]) == ["a", "b"]
+
+
+def test_picks_without_id_keep_distinct_rows(store):
+    picks = [_pick(None, line=24.5), _pick(None, line=26.5), _pick(None, side="Under")]
+    assert store.append(picks) == 3
+    assert len(store.read()["pick_id"]) == 3
+    assert store.sync(picks) == 0
+
+
+def test_pipeline_catches_store_up_with_predictions_file(store, tmp_path):
+    pytest.importorskip("pandas")
+    from services.ml_data_pipeline import MLDataPipeline
+
+    today = date.today().isoformat()
+    store.append([_pick("a", day=today)])
+    path = tmp_path / "predictions.jsonl"
+    path.write_text("\n".join(json.dumps(p) for p in [_pick("a", day=today), _pick("b", day=today)]))
+
+    df = MLDataPipeline(predictions_path=str(path), feature_store=store).get_training_data(days_back=30)
+    assert sorted(df["prediction_id"]) == ["a", "b"]
+
+
+def test_training_matrix_uses_feature_order(store):
+    today = date.today().isoformat()
+    store.append([_pick("a", day=today), _pick("b", day=today, result="LOSS"), _pick("old", day="2000-01-01")])
+    X, y = store.training_matrix(days_back=30)
+    assert X.shape == (2, len(FEATURE_COLUMNS)) and X.dtype == np.float32
+    assert sorted(y.tolist()) == [0, 1]
+    assert X[0, FEATURE_COLUMNS.index("line")] == pytest.approx(24.5)
+
+
+def test_sync_jsonl_resumes_from_stored_offset(store, tmp_path, monkeypatch):
+    path = tmp_path / "predictions.jsonl"
+    path.write_text(json.dumps(_pick("a")) + "\n" + json.dumps(_pick("b", grade_status="PENDING")) + "\n")
+    assert store.sync_jsonl(str(path)) == 1
+
+    parsed = []
+    import services.feature_store as feature_store
+    real_parse = feature_store._parse_jsonl
+    monkeypatch.setattr(feature_store, "_parse_jsonl", lambda chunk: parsed.append(chunk) or real_parse(chunk))
+    with open(path, "a") as f:
+        f.write(json.dumps(_pick("b")) + "\n" + json.dumps(_pick("c"))[:20])  # c is still being written
+    assert store.sync_jsonl(str(path)) == 1
+    assert b'"a"' not in b"".join(parsed)  # only the appended bytes were parsed
+
+    with open(path, "a") as f:
+        f.write(json.dumps(_pick("c"))[20:] + "\n")
+    assert FeatureStore(root=store.root, use_arrow=store.use_arrow).sync_jsonl(str(path)) == 1
+    assert sorted(store.read()["pick_id"]) == ["a", "b", "c"]
+    assert store.sync_jsonl(str(path)) == 0
+
+
+def test_failed_sync_does_not_advance_offset(store, tmp_path, monkeypatch):
+    path = tmp_path / "predictions.jsonl"
+    path.write_text(json.dumps(_pick("a")) + "\n")
+
+    def boom(picks, replace=True):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "append", boom)
+    with pytest.raises(OSError):
+        store.sync_jsonl(str(path))
+    monkeypatch.undo()
+    assert store.sync_jsonl(str(path)) == 1
+
+
+def test_partitions_are_compacted(store, monkeypatch):
+    import services.feature_store as feature_store
+
+    monkeypatch.setattr(feature_store, "FEATURE_COMPACT_PARTS", 3)
+    store.append([_pick("a", result="LOSS")])
+    store.append([_pick("b")])
+    assert store.stats()["parts"] == 2
+    store.append([_pick("a", result="WIN")])
+    assert store.stats()["parts"] == 1
+    store.append([_pick("c")])
+    data = store.read()
+    assert sorted(data["pick_id"]) == ["a", "b", "c"]
+    assert dict(zip(data["pick_id"], data["outcome"]))["a"] == 1
+
+    assert store.compact() == 2 and store.stats()["parts"] == 1
+    assert sorted(store.read()["pick_id"]) == ["a", "b", "c"]
+
+
+def test_pipeline_retries_failed_catch_up(store, tmp_path, monkeypatch):
+    pytest.importorskip("pandas")
+    from services.ml_data_pipeline import MLDataPipeline
+
+    today = date.today().isoformat()
+    path = tmp_path / "predictions.jsonl"
+    path.write_text(json.dumps(_pick("a", day=today)) + "\n")
+    pipeline = MLDataPipeline(predictions_path=str(path), feature_store=store)
+
+    real_sync = store.sync_jsonl
+    monkeypatch.setattr(store, "sync_jsonl", lambda p: (_ for _ in ()).throw(OSError("busy")))
+    assert pipeline._load_from_feature_store() is None
+    assert pipeline._feature_store_synced is False
+    monkeypatch.setattr(store, "sync_jsonl", real_sync)
+    assert list(pipeline._load_from_feature_store()["prediction_id"]) == ["a"]
+    assert pipeline._feature_store_synced is True
@@ -0,0 +1,103 @@
+"""
+Tests for game_simulator.py - vectorized Monte Carlo game simulation.
+"""
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from game_simulator import (  # noqa: E402
+    get_stream_cache_stats,
+    simulate_game,
+    simulate_slate,
+    slate_summaries,
+    standard_normals,
+)
+
+
+def _normal_cdf(x):
+    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+
+
+def test_same_game_id_is_deterministic_and_reuses_stream():
+    a = simulate_game(110, 105, game_id="g-det", num_sims=5000)
+    before = get_stream_cache_stats()["hits"]
+    b = simulate_game(112, 101, game_id="g-det", num_sims=5000)
+    assert get_stream_cache_stats()["hits"] == before + 1
+    # Same base draws, re-scaled: the shift shows up exactly in the margin
+    np.testing.assert_allclose(b.margin - a.margin, 6.0, atol=1e-4)
+    assert simulate_game(110, 105, game_id="g-det", num_sims=5000).cover_probability(-3.5) == \
+        a.cover_probability(-3.5)
+    assert not np.array_equal(standard_normals("g-other", 5000), standard_normals("g-det", 5000))
+
+
+def test_probabilities_match_normal_theory():
+    sim = simulate_game(110, 104, home_std=10, away_std=10, game_id="g-theory", num_sims=200_000)
+    margin_std = math.sqrt(200)
+    assert sim.win_probability() == pytest.approx(_normal_cdf(6 / margin_std), abs=0.005)
+    assert sim.cover_probability(-3.5) == pytest.approx(_normal_cdf(2.5 / margin_std), abs=0.005)
+    assert sim.over_probability(220) == pytest.approx(1 - _normal_cdf(6 / margin_std), abs=0.005)
+    assert sim.cover_probability(-3.5, "away") == pytest.approx(1 - sim.cover_probability(-3.5))
+
+
+def test_many_lines_from_one_draw_are_monotone():
+    sim = simulate_game(110, 104, game_id="g-lines")
+    covers = sim.cover_probability([-1.5, -3.5, -6.5, -9.5])
+    overs = sim.over_probability([200, 210, 220, 230])
+    assert covers.shape == (4,) and overs.shape == (4,)
+    assert np.all(np.diff(covers) < 0)
+    assert np.all(np.diff(overs) < 0)
+
+
+def test_correlation_widens_total_and_narrows_margin():
+    sim = simulate_game(110, 110, correlation=0.6, game_id="g-corr", num_sims=100_000)
+    assert np.corrcoef(sim.home, sim.away)[0, 1] == pytest.approx(0.6, abs=0.02)
+    assert sim.total.std() == pytest.approx(math.sqrt(200 * 1.6), rel=0.02)
+    assert sim.margin.std() == pytest.approx(math.sqrt(200 * 0.4), rel=0.02)
+
+
+def test_discrete_scores_allow_pushes():
+    sim = simulate_game(100, 97, game_id="g-push", discrete=True)
+    assert np.all(sim.home == np.rint(sim.home)) and sim.home.min() >= 0
+    push = sim.spread_push_probability(-3)
+    assert push > 0
+    assert sim.cover_probability(-3) + sim.cover_probability(-3, "away") + push == pytest.approx(1.0)
+
+
+def test_slate_matches_individual_games():
+    games = [
+        {"game_id": "s1", "home_mean": 110, "away_mean": 104, "spread": -5.5, "total": 214.5},
+        {"game_id": "s2", "home_mean": 24, "away_mean": 21, "home_std": 7, "away_std": 7,
+         "correlation": 0.3, "spread": -2.5, "total": 44.5},
+    ]
+    slate = simulate_slate(games, num_sims=4000)
+    assert slate.home.shape == (2, 4000)
+    np.testing.assert_allclose(slate.cover_probability([-5.5, -2.5]), [
+        simulate_game(110, 104, game_id="s1", num_sims=4000).cover_probability(-5.5),
+        simulate_game(24, 21, 7, 7, correlation=0.3, game_id="s2", num_sims=4000).cover_probability(-2.5),
+    ])
+
+    summaries = slate_summaries(games, num_sims=4000)
+    assert [s["game_id"] for s in summaries] == ["s1", "s2"]
+    assert summaries[1]["over_pct"] + summaries[1]["under_pct"] == pytest.approx(100.0, abs=0.2)
+
+
+def test_summary_rejects_slate():
+    with pytest.raises(ValueError):
+        simulate_slate([{"home_mean": 1, "away_mean": 1}], num_sims=10).summary()
+
+
+def test_jason_sim_prices_lines_from_simulation_when_enabled():
+    from jason_sim_confluence import JasonSimConfluence
+
+    jason = JasonSimConfluence()
+    closed = jason.simulate_game("Home", "Away", spread=-4.5, total=44.5)
+    assert closed["num_sims"] == 0
+    assert "_margin" not in closed
+
+    simulated = jason.simulate_game("Home", "Away", spread=-4.5, total=44.5, num_sims=5000)
+    assert simulated["num_sims"] == 5000
+    assert simulated["home_cover_pct"] + simulated["away_cover_pct"] == pytest.approx(100.0, abs=0.1)
+    assert simulated["over_pct"] == pytest.approx(50.0, abs=3.0)
+    assert simulated == jason.simulate_game("Home", "Away", spread=-4.5, total=44.5, num_sims=5000)
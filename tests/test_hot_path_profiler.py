@@ -0,0 +1,99 @@
+"""
+Tests for core/hot_path_profiler.py - engine spans and the sampling profiler.
+"""
+import time
+
+import pytest
+
+from core.hot_path_profiler import EngineSpans, SamplingProfiler
+from core.latency_sketch import LatencySketch
+
+
+class StepClock:
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.steps.pop(0)
+
+
+def test_laps_record_per_engine_samples_and_summary():
+    # Two picks: research 2ms/4ms, jarvis 1ms/1ms
+    clock = StepClock([0.000, 0.002, 0.003, 1.000, 1.004, 1.005])
+    spans = EngineSpans(enabled=True, clock=clock)
+    for _ in range(2):
+        t = spans.start()
+        t = spans.lap("research", t)
+        spans.lap("jarvis", t)
+
+    summary = spans.summary()
+    assert list(summary) == ["research", "jarvis"]  # slowest total first
+    assert summary["research"]["count"] == 2
+    assert summary["research"]["max_ms"] == 4.0
+    assert summary["research"]["p50_ms"] == pytest.approx(2.0, rel=0.01)
+    assert abs(summary["jarvis"]["total_ms"] - 2.0) < 1e-6
+
+
+def test_percentiles_come_from_the_sketch():
+    spans = EngineSpans(enabled=True)
+    for ms in range(1, 101):
+        spans.add("serp", ms / 1000)
+    assert isinstance(spans.sketches["serp"], LatencySketch)
+    stats = spans.summary()["serp"]
+    assert stats["p50_ms"] == pytest.approx(50.0, rel=0.01)
+    assert stats["p95_ms"] == pytest.approx(95.0, rel=0.01)
+    assert stats["max_ms"] == 100.0 and stats["count"] == 100
+
+
+def test_disabled_spans_never_read_the_clock():
+    clock = StepClock([])
+    spans = EngineSpans(enabled=False, clock=clock)
+    t = spans.start()
+    spans.lap("research", t)
+    spans.add("jarvis", 0.1)
+    assert clock.calls == 0 and spans.summary() == {}
+
+
+def _busy_hot_loop(seconds):
+    end = time.perf_counter() + seconds
+    n = 0
+    while time.perf_counter() < end:
+        n += 1
+    return n
+
+
+def test_sampling_profiler_finds_the_hot_function():
+    with SamplingProfiler(interval_ms=1) as prof:
+        _busy_hot_loop(0.2)
+    report = prof.report(top_n=5)
+
+    assert report["samples"] > 10
+    hot = [row["function"] for row in report["top_self"]]
+    assert any(name.endswith(":_busy_hot_loop:" + str(_busy_hot_loop.__code__.co_firstlineno)) for name in hot)
+    assert all(" " in line for line in report["collapsed_stacks"])
+
+
+def test_track_engine_spans_is_safe_without_prometheus():
+    from metrics import track_engine_spans
+
+    spans = EngineSpans(enabled=True)
+    spans.add("research", 0.001)
+    track_engine_spans("NBA", spans.sketches)
+
+
+def test_engine_latency_buckets_are_cumulative_counts():
+    from metrics import ENGINE_LATENCY_BUCKETS, _engine_latency_buckets
+
+    sketch = LatencySketch()
+    for seconds in (0.0002, 0.0002, 0.003, 0.04, 2.0):
+        sketch.add(seconds)
+    buckets = dict(_engine_latency_buckets(sketch))
+
+    assert len(buckets) == len(ENGINE_LATENCY_BUCKETS) + 1
+    assert buckets["0.0001"] == 0
+    assert buckets["0.00025"] == 2
+    assert buckets["0.005"] == 3
+    assert buckets["0.05"] == 4
+    assert buckets["1.0"] == 4 and buckets["+Inf"] == 5
@@ -0,0 +1,93 @@
+"""
+Tests for core/http_replay.py and the scripts/bench_best_bets.py baseline check.
+"""
+import asyncio
+import datetime as dt
+
+import pytest
+
+import scripts.bench_best_bets as bench_best_bets
+from core.http_replay import Cassette, ShiftedClock, record_http, replay_http, request_key, scrub_url
+
+
+def test_scrub_url_drops_credentials_and_sorts_query():
+    url = "https://api.the-odds-api.com/v4/sports/nba/odds?regions=us&apiKey=SECRET&markets=h2h"
+    assert scrub_url(url) == "https://api.the-odds-api.com/v4/sports/nba/odds?markets=h2h&regions=us"
+    assert request_key("get", url) == request_key("GET", url.replace("SECRET", "other"))
+    assert request_key("POST", url, b'{"a":1}') != request_key("POST", url, b'{"a":2}')
+
+
+def test_cassette_round_trip_replays_in_order(tmp_path):
+    cassette = Cassette(meta={"sport": "NBA"}, recorded_at="2026-02-14T23:00:00+00:00")
+    key = request_key("GET", "https://example.test/injuries?api_key=x")
+    cassette.add(key, 200, {"Content-Type": "application/json", "Set-Cookie": "drop"}, b'{"n": 1}')
+    cassette.add(key, 200, {"content-type": "application/json"}, b'{"n": 2}')
+
+    path = tmp_path / "c.json.gz"
+    cassette.save(str(path))
+    assert b"api_key" not in path.read_bytes()
+    loaded = Cassette.load(str(path))
+
+    assert loaded.meta == {"sport": "NBA"}
+    assert loaded.next_response(key) == (200, {"content-type": "application/json"}, b'{"n": 1}')
+    assert loaded.next_response(key)[2] == b'{"n": 2}'
+    assert loaded.next_response(key)[2] == b'{"n": 2}'  # last response repeats
+    assert loaded.next_response("GET https://example.test/missing") is None
+    assert loaded.hits == 3 and loaded.misses == ["GET https://example.test/missing"]
+    assert loaded.hosts() == {"example.test": 2}
+
+
+def test_shifted_clock_moves_wall_clock_only():
+    import core.time_et as time_et
+
+    before = time_et.now_et()
+    with ShiftedClock("2026-02-14T23:30:00+00:00"):
+        shifted = time_et.now_et()
+        assert shifted.strftime("%Y-%m-%d %H") == "2026-02-14 18"  # ET
+        assert isinstance(shifted, time_et.datetime)
+        # Datetimes from the real class still pass isinstance checks
+        assert isinstance(dt.datetime(2026, 1, 1), time_et.datetime)
+    assert time_et.datetime is dt.datetime
+    assert abs((time_et.now_et() - before).total_seconds()) < 60
+
+
+def test_httpx_record_then_replay():
+    httpx = pytest.importorskip("httpx")
+
+    def handler(request):
+        return httpx.Response(200, json={"path": request.url.path, "q": dict(request.url.params)})
+
+    async def call(client):
+        resp = await client.get("https://example.test/odds", params={"apiKey": "k", "sport": "nba"})
+        return resp.status_code, resp.json()
+
+    cassette = Cassette()
+    with record_http(cassette):
+        async def live():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await call(client)
+        recorded = asyncio.run(live())
+
+    with replay_http(cassette):
+        async def offline():
+            async with httpx.AsyncClient() as client:
+                return await call(client), (await client.get("https://example.test/other")).status_code
+        replayed, missing = asyncio.run(offline())
+
+    assert replayed == recorded
+    assert missing == 599 and len(cassette.misses) == 1
+
+
+def test_compare_flags_median_wall_regressions():
+    baseline = {"cells": [
+        {"sport": "NBA", "size": "small", "wall_s": {"median": 1.0}},
+        {"sport": "NBA", "size": "large", "wall_s": {"median": 4.0}},
+    ]}
+    cells = [
+        {"sport": "NBA", "size": "small", "wall_s": {"median": 1.4}},
+        {"sport": "NBA", "size": "large", "wall_s": {"median": 4.2}},
+        {"sport": "NHL", "size": "small", "wall_s": {"median": 9.0}},  # no baseline yet
+    ]
+    failures = bench_best_bets.compare(cells, baseline, max_regression=0.25)
+    assert failures == ["NBA/small: 1.000s -> 1.400s (+40%)"]
+    assert cells[1]["vs_baseline"] == 0.05
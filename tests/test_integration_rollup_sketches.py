@@ -0,0 +1,102 @@
+"""
+Tests for core/latency_sketch.py and its use in core/integration_rollup.py.
+"""
+import json
+import os
+import random
+
+import pytest
+
+import core.integration_rollup as rollup
+from core.latency_sketch import LatencySketch
+
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_sketch_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(5, 1.2) for _ in range(20000)]
+    sketch = LatencySketch(alpha=0.01)
+    for v in values:
+        sketch.add(v)
+
+    for q in (0.5, 0.9, 0.95, 0.99):
+        assert sketch.quantile(q) == pytest.approx(_exact(values, q), rel=0.011)
+    assert sketch.count == 20000 and sketch.max == max(values)
+    assert len(sketch.bins) < 1000
+
+
+def test_merged_sketches_match_a_single_sketch():
+    rng = random.Random(3)
+    days = [[rng.randint(20, 3000) for _ in range(500)] for _ in range(3)]
+    merged, single = LatencySketch(), LatencySketch()
+    for day in days:
+        part = LatencySketch()
+        for v in day:
+            part.add(v)
+            single.add(v)
+        merged.merge(LatencySketch.from_dict(json.loads(json.dumps(part.to_dict()))))
+
+    assert merged.bins == single.bins and merged.count == single.count
+    assert merged.quantile(0.95) == single.quantile(0.95)
+    other = LatencySketch(alpha=0.05)
+    other.add(10)
+    with pytest.raises(ValueError):
+        merged.merge(other)
+
+
+def test_bin_cap_collapses_lowest_buckets():
+    sketch = LatencySketch(alpha=0.01, max_bins=50)
+    for v in range(1, 5000):
+        sketch.add(v)
+    assert len(sketch.bins) == 50
+    assert sketch.quantile(0.99) == pytest.approx(4950, rel=0.011)
+
+
+@pytest.fixture
+def fresh_rollup(tmp_path, monkeypatch):
+    monkeypatch.setattr(rollup, "ROLLUP_DIR", str(tmp_path))
+    monkeypatch.setattr(rollup, "_current_day_stats", {})
+    monkeypatch.setattr(rollup, "_current_date_et", None)
+    monkeypatch.setattr(rollup, "_history", {})
+    monkeypatch.setattr(rollup, "_history_misses", {})
+    monkeypatch.setattr(rollup, "_history_summary_cache", {})
+    monkeypatch.setattr(rollup, "_get_et_date", lambda: "2026-02-14")
+    return tmp_path
+
+
+def test_rollup_merges_past_day_sketches_from_memory(fresh_rollup, monkeypatch):
+    for ms in range(100, 200):
+        rollup.record_integration_event("odds_api", "SUCCESS", latency_ms=ms)
+    rollup.flush_daily_rollup()
+    saved = json.loads((fresh_rollup / "rollup_2026-02-14.json").read_text())
+    assert saved["integrations"]["odds_api"]["latency_sketch"]["count"] == 100
+
+    # Next day: yesterday comes from the in-memory history, not the file
+    monkeypatch.setattr(rollup, "_get_et_date", lambda: "2026-02-15")
+    for ms in range(1000, 1100):
+        rollup.record_integration_event("odds_api", "SUCCESS", latency_ms=ms)
+    os.remove(fresh_rollup / "rollup_2026-02-14.json")
+
+    result = rollup.get_rollup(days=2)
+    assert [d["date_et"] for d in result["daily_rollups"]] == ["2026-02-15", "2026-02-14"]
+    assert "latency_sketch" not in result["daily_rollups"][1]["integrations"]["odds_api"]
+    summary = result["integration_summary"]["odds_api"]
+    assert summary["total_calls"] == 200
+    assert summary["p50_latency_ms"] == pytest.approx(199, rel=0.02)
+    assert summary["p95_latency_ms"] == pytest.approx(1089, rel=0.02)
+    # Cached past-day merge is reused, today's numbers stay live
+    rollup.record_integration_event("odds_api", "ERROR", latency_ms=5000, error_code="TIMEOUT")
+    assert rollup.get_rollup(days=2)["integration_summary"]["odds_api"]["error_count"] == 1
+
+
+def test_health_uses_latest_outcome(fresh_rollup):
+    rollup.record_integration_event("odds_api", "ERROR", error_code="TIMEOUT")
+    health = rollup.get_integration_health_for_health_endpoint()
+    assert health["ok"] is False and health["integrations"]["odds_api"]["ok"] is False
+
+    rollup.record_integration_event("odds_api", "CACHE_HIT")
+    assert rollup.get_integration_health_for_health_endpoint()["integrations"]["odds_api"]["ok"] is True
@@ -0,0 +1,115 @@
+"""
+Tests for core/job_queue.py (SQLite backend) and the heavy-job registry.
+"""
+import time
+
+import pytest
+
+import core.job_queue as job_queue
+from core.job_queue import JobQueue, JobRunner
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"))
+
+
+def test_queue_claims_oldest_job_once(queue):
+    first = queue.enqueue("grader.run_audit", {"days_back": 1})
+    queue.enqueue("scheduler.run_cleanup")
+
+    job = queue.claim(["grader.run_audit", "scheduler.run_cleanup"], worker="w1")
+    assert job["id"] == first and job["status"] == "running" and job["payload"] == {"days_back": 1}
+
+    queue.complete(first, {"graded": 3})
+    done = queue.get(first)
+    assert done["status"] == "succeeded" and done["result"] == {"graded": 3}
+    assert done["attempts"] == 1 and done["progress"] == 1.0
+    assert [j["type"] for j in queue.list(status="queued")] == ["scheduler.run_cleanup"]
+
+
+def test_identical_pending_jobs_are_deduplicated(queue):
+    first = queue.enqueue("ml.train_ensemble", {"min_picks": 100})
+    assert queue.enqueue("ml.train_ensemble", {"min_picks": 100}) == first
+    assert queue.enqueue("ml.train_ensemble", {"min_picks": 50}) != first
+
+    queue.claim(["ml.train_ensemble"])
+    queue.complete(first)
+    assert queue.enqueue("ml.train_ensemble", {"min_picks": 100}) != first
+
+
+def test_claim_respects_per_type_concurrency(queue, monkeypatch):
+    monkeypatch.setattr(job_queue, "JOB_CONCURRENCY", {"grader.auto_grade": 2})
+    for date in ("2026-01-01", "2026-01-02", "2026-01-03"):
+        queue.enqueue("grader.auto_grade", {"date": date})
+    queue.enqueue("ml.train_ensemble", {"min_picks": 1})
+    queue.enqueue("ml.train_ensemble", {"min_picks": 2})
+
+    types = ["grader.auto_grade", "ml.train_ensemble"]
+    claimed = [queue.claim(types)["type"] for _ in range(3)]
+    assert sorted(claimed) == ["grader.auto_grade", "grader.auto_grade", "ml.train_ensemble"]
+    assert queue.claim(types) is None  # both types at their limit
+
+
+def test_stale_running_jobs_are_requeued(queue, monkeypatch):
+    job_id = queue.enqueue("grader.run_audit")
+    queue.claim(["grader.run_audit"], worker="dead-worker")
+    assert queue.claim(["grader.run_audit"]) is None
+
+    monkeypatch.setattr(job_queue, "JOB_STALE_AFTER_S", 0.0)
+    time.sleep(0.01)
+    job = queue.claim(["grader.run_audit"], worker="new-worker")
+    assert job["id"] == job_id and job["worker"] == "new-worker" and job["attempts"] == 2
+
+
+def test_runner_reports_progress_results_and_failures(queue):
+    def graded(payload, progress):
+        progress(0.5, "half way")
+        assert queue.get(job_ids[0])["progress_message"] == "half way"
+        return payload["n"] * 2
+
+    def boom(payload, progress):
+        raise ValueError("bad input")
+
+    runner = JobRunner({"ok": graded, "boom": boom}, queue=queue)
+    job_ids = [queue.enqueue("ok", {"n": 21}), queue.enqueue("boom")]
+
+    assert runner.run_once() == job_ids[0]
+    assert runner.run_once() == job_ids[1]
+    assert runner.run_once() is None
+    assert queue.get(job_ids[0])["result"] == 42
+    failed = queue.get(job_ids[1])
+    assert failed["status"] == "failed" and "ValueError: bad input" in failed["error"]
+
+
+def test_runner_only_consumes_while_allowed(queue):
+    leader = {"is": False}
+    runner = JobRunner({"ok": lambda payload, progress: None}, queue=queue, should_run=lambda: leader["is"])
+    job_id = queue.enqueue("ok")
+    assert runner.run_once() is None and queue.get(job_id)["status"] == "queued"
+    leader["is"] = True
+    assert runner.run_once() == job_id
+
+
+def test_runner_thread_runs_jobs_in_background(queue):
+    runner = JobRunner({"ok": lambda payload, progress: "done"}, queue=queue, poll_s=0.01).start()
+    try:
+        job_id = queue.enqueue("ok")
+        deadline = time.time() + 5
+        while queue.get(job_id)["status"] != "succeeded" and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        runner.stop()
+    assert queue.get(job_id)["result"] == "done"
+
+
+def test_concurrency_setting_parses_env_format():
+    assert job_queue._parse_concurrency("a=2, b=0,bad,c=x") == {"a": 2, "b": 1}
+
+
+def test_heavy_job_types_are_served_by_the_scheduler_worker():
+    from core.heavy_jobs import HEAVY_JOB_HANDLERS
+    from core.scheduler_worker import SCHEDULER_JOB_HANDLERS
+    assert not set(HEAVY_JOB_HANDLERS) & set(SCHEDULER_JOB_HANDLERS)
+    assert {"ml.train_ensemble", "grader.train_team_models", "grader.run_audit",
+            "grader.auto_grade", "ops.auto_grade"} <= set(HEAVY_JOB_HANDLERS)
@@ -0,0 +1,144 @@
+"""
+Tests for lstm_runtime.py - TensorFlow-free LSTM inference.
+
+The reference below is a deliberately naive per-sample, per-gate transcription
+of the Keras LSTM/Bidirectional/BatchNormalization/Dense inference math, used
+to pin the vectorized runtime to it.
+"""
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lstm_runtime import (  # noqa: E402
+    BN_EPSILON,
+    H5PY_AVAILABLE,
+    NumpyLSTMModel,
+    convert_to_npz,
+    load_weights,
+)
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "models")
+NBA_POINTS = os.path.join(MODELS_DIR, "lstm_nba_points.weights.h5")
+
+
+def _random_weights(seed=0, features=6, u1=8, u2=4):
+    rng = np.random.default_rng(seed)
+    w = {}
+
+    def rand(*shape):
+        return rng.normal(0, 0.4, size=shape).astype(np.float32)
+
+    for name, inp, units in (("bidirectional", features, u1), ("bidirectional_1", 2 * u1, u2)):
+        for direction in ("forward_layer", "backward_layer"):
+            w[f"{name}/{direction}/cell/0"] = rand(inp, 4 * units)
+            w[f"{name}/{direction}/cell/1"] = rand(units, 4 * units)
+            w[f"{name}/{direction}/cell/2"] = rand(4 * units)
+    for name, dim in (("batch_normalization", 2 * u1), ("batch_normalization_1", 2 * u2)):
+        w[f"{name}/0"] = 1 + rand(dim)
+        w[f"{name}/1"] = rand(dim)
+        w[f"{name}/2"] = rand(dim)
+        w[f"{name}/3"] = np.abs(rand(dim)) + 0.5
+    for name, inp, out in (("dense", 2 * u2, 5), ("dense_1", 5, 3), ("dense_2", 3, 1)):
+        w[f"{name}/0"] = rand(inp, out)
+        w[f"{name}/1"] = rand(out)
+    return w
+
+
+def _ref_lstm(seq, kernel, rec, bias, go_backwards):
+    """One sample; returns hidden states in processing order."""
+    units = rec.shape[0]
+    h = np.zeros(units)
+    c = np.zeros(units)
+    steps = list(range(len(seq)))[::-1] if go_backwards else list(range(len(seq)))
+    out = []
+    sig = lambda v: 1 / (1 + np.exp(-v))  # noqa: E731
+    for t in steps:
+        z = seq[t] @ kernel + h @ rec + bias
+        i, f, g, o = (z[k * units:(k + 1) * units] for k in range(4))
+        c = sig(f) * c + sig(i) * np.tanh(g)
+        h = sig(o) * np.tanh(c)
+        out.append(h)
+    return out
+
+
+def _ref_predict(w, seq):
+    seq = seq.astype(np.float64)
+
+    def cell(name, direction):
+        return [w[f"{name}/{direction}/cell/{i}"].astype(np.float64) for i in range(3)]
+
+    def bn(name, x):
+        gamma, beta, mean, var = (w[f"{name}/{i}"] for i in range(4))
+        return gamma * (x - mean) / np.sqrt(var + BN_EPSILON) + beta
+
+    fwd = _ref_lstm(seq, *cell("bidirectional", "forward_layer"), go_backwards=False)
+    bwd = _ref_lstm(seq, *cell("bidirectional", "backward_layer"), go_backwards=True)[::-1]
+    x = np.stack([bn("batch_normalization", np.concatenate([f, b])) for f, b in zip(fwd, bwd)])
+    fwd = _ref_lstm(x, *cell("bidirectional_1", "forward_layer"), go_backwards=False)[-1]
+    bwd = _ref_lstm(x, *cell("bidirectional_1", "backward_layer"), go_backwards=True)[-1]
+    x = bn("batch_normalization_1", np.concatenate([fwd, bwd]))
+    x = np.maximum(x @ w["dense/0"] + w["dense/1"], 0)
+    x = np.maximum(x @ w["dense_1/0"] + w["dense_1/1"], 0)
+    return float(np.tanh(x @ w["dense_2/0"] + w["dense_2/1"])[0])
+
+
+def test_matches_reference_forward_pass():
+    w = _random_weights()
+    model = NumpyLSTMModel(w)
+    batch = np.random.default_rng(1).random((5, 15, 6)).astype(np.float32)
+    got = model.predict(batch)
+    expected = [_ref_predict(w, seq) for seq in batch]
+    np.testing.assert_allclose(got, expected, atol=1e-5)
+
+
+def test_batch_equals_single_predictions():
+    model = NumpyLSTMModel(_random_weights(seed=3))
+    batch = np.random.default_rng(2).random((4, 15, 6)).astype(np.float32)
+    together = model.predict(batch)
+    one_by_one = [model.predict(seq)[0] for seq in batch]
+    np.testing.assert_allclose(together, one_by_one, atol=1e-6)
+
+
+def test_rejects_wrong_feature_count():
+    model = NumpyLSTMModel(_random_weights())
+    with pytest.raises(ValueError):
+        model.predict(np.zeros((1, 15, 5)))
+
+
+def test_npz_roundtrip(tmp_path):
+    w = _random_weights(seed=4)
+    path = tmp_path / "lstm_test.weights.npz"
+    np.savez(path, **w)
+    loaded = load_weights(str(path))
+    assert set(loaded) == set(w)
+    x = np.random.default_rng(5).random((2, 15, 6))
+    np.testing.assert_allclose(NumpyLSTMModel(loaded).predict(x), NumpyLSTMModel(w).predict(x))
+
+
+@pytest.mark.skipif(not H5PY_AVAILABLE or not os.path.exists(NBA_POINTS), reason="h5py or weights missing")
+def test_loads_shipped_weights_and_converts(tmp_path):
+    model = NumpyLSTMModel.load(NBA_POINTS)
+    x = np.random.default_rng(6).random((3, 15, 6))
+    out = model.predict(x)
+    assert out.shape == (3,)
+    assert np.all(np.abs(out) <= 1.0)
+
+    npz = convert_to_npz(NBA_POINTS, str(tmp_path / "nba_points.weights.npz"))
+    np.testing.assert_allclose(NumpyLSTMModel.load(npz).predict(x), out, atol=1e-6)
+
+
+@pytest.mark.skipif(not H5PY_AVAILABLE or not os.path.exists(NBA_POINTS), reason="h5py or weights missing")
+def test_lstm_brain_uses_numpy_runtime():
+    import lstm_brain
+
+    if lstm_brain.LSTM_RUNTIME == "tensorflow":
+        pytest.skip("LSTM_RUNTIME=tensorflow")
+    brain = lstm_brain.LSTMBrain(model_path=NBA_POINTS, sport="NBA")
+    assert brain.is_trained
+    x = np.random.default_rng(7).random((4, 15, 6))
+    results = brain.predict_batch(x, scale_factor=3.0)
+    assert [r["method"] for r in results] == ["numpy_lstm"] * 4
+    single = brain.predict(x[2], scale_factor=3.0)
+    assert single["raw_output"] == pytest.approx(results[2]["raw_output"], abs=1e-6)
@@ -0,0 +1,73 @@
+"""
+Tests for the metrics.py instrumentation surface (upstream calls, cache lookups, scheduler jobs).
+"""
+import threading
+
+import pytest
+
+import metrics
+
+
+def test_cache_namespace_and_http_outcome():
+    assert metrics.cache_namespace("best-bets:nba:live") == "best-bets"
+    assert metrics.cache_namespace("plain") == "plain"
+    assert metrics._http_outcome(200) == "ok"
+    assert metrics._http_outcome(429) == "rate_limited"
+    assert metrics._http_outcome(503) == "http_error"
+
+
+def test_upstream_call_propagates_errors():
+    with pytest.raises(RuntimeError):
+        with metrics.upstream_call("fred_api") as call:
+            call.status(200)
+            raise RuntimeError("boom")
+
+
+def test_track_job_counts_overlapping_runs():
+    release = threading.Event()
+    entered = threading.Semaphore(0)
+    seen = []
+
+    @metrics.track_job("test_overlap_job")
+    def job():
+        seen.append(metrics.jobs_running()["test_overlap_job"])
+        entered.release()
+        release.wait(2)
+        return "done"
+
+    threads = [threading.Thread(target=job) for _ in range(2)]
+    for t in threads:
+        t.start()
+        assert entered.acquire(timeout=2)
+    assert metrics.jobs_running()["test_overlap_job"] == 2
+
+    release.set()
+    for t in threads:
+        t.join(2)
+    assert seen == [1, 2]
+    assert "test_overlap_job" not in metrics.jobs_running()
+
+
+def test_track_job_reraises_and_releases():
+    @metrics.track_job("test_failing_job")
+    def job():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError):
+        job()
+    assert "test_failing_job" not in metrics.jobs_running()
+
+
+def test_prometheus_series_when_available():
+    pytest.importorskip("prometheus_client")
+    from prometheus_client import REGISTRY
+
+    with metrics.upstream_call("test_api") as call:
+        call.status(429)
+    metrics.track_cache_lookup("api_cache", "sharp:nba", hit=True)
+
+    assert REGISTRY.get_sample_value(
+        "bookie_upstream_latency_seconds_count", {"api": "test_api", "outcome": "rate_limited"}) == 1
+    assert REGISTRY.get_sample_value("bookie_upstream_inflight", {"api": "test_api"}) == 0
+    assert REGISTRY.get_sample_value(
+        "bookie_cache_lookups_total", {"cache": "api_cache", "namespace": "sharp", "result": "hit"}) >= 1
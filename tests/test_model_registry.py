@@ -0,0 +1,97 @@
+"""
+Tests for model_registry.py - eager preload, warm-up and hot-swap.
+"""
+import asyncio
+
+from model_registry import FAILED, READY, ModelRegistry
+
+
+class _Model:
+    def __init__(self, version):
+        self.version = version
+        self.warmed = False
+
+
+def _registry_with(loader, published):
+    registry = ModelRegistry()
+    registry.register(
+        "m",
+        loader,
+        warmup=lambda m: setattr(m, "warmed", True),
+        install=lambda m: published.__setitem__("m", m),
+    )
+    return registry
+
+
+def test_preload_loads_warms_and_installs():
+    published = {}
+    registry = _registry_with(lambda: _Model(1), published)
+    assert not registry.is_ready()
+
+    results = asyncio.run(registry.preload_async())
+
+    assert results == {"m": True}
+    assert registry.is_ready()
+    assert published["m"].warmed is True
+    assert registry.get("m") is published["m"]
+    status = registry.status()["models"]["m"]
+    assert status["state"] == READY
+    assert status["version"] == 1
+    assert status["load_ms"] is not None and status["warmup_ms"] is not None
+
+
+def test_install_only_after_warmup():
+    seen = []
+    registry = ModelRegistry()
+    registry.register(
+        "m",
+        lambda: _Model(1),
+        warmup=lambda m: seen.append(("warmup", m.warmed)) or setattr(m, "warmed", True),
+        install=lambda m: seen.append(("install", m.warmed)),
+    )
+    registry.preload()
+    assert seen == [("warmup", False), ("install", True)]
+
+
+def test_reload_hot_swaps_and_bumps_version():
+    published = {}
+    versions = iter([1, 2])
+    registry = _registry_with(lambda: _Model(next(versions)), published)
+    registry.preload()
+    first = published["m"]
+
+    assert registry.reload("m") == {"m": True}
+    assert published["m"] is not first
+    assert published["m"].version == 2
+    assert registry.status()["models"]["m"]["version"] == 2
+
+
+def test_failed_reload_keeps_previous_model():
+    published = {}
+    calls = {"n": 0}
+
+    def _loader():
+        calls["n"] += 1
+        if calls["n"] > 1:
+            raise RuntimeError("corrupt weights")
+        return _Model(1)
+
+    registry = _registry_with(_loader, published)
+    registry.preload()
+    live = published["m"]
+
+    assert registry.reload("m") == {"m": False}
+    assert published["m"] is live
+    status = registry.status()["models"]["m"]
+    assert status["state"] == READY
+    assert "corrupt weights" in status["error"]
+
+
+def test_failed_first_load_is_reported_but_not_blocking():
+    registry = ModelRegistry()
+    registry.register("broken", lambda: 1 / 0)
+    registry.register("ok", lambda: _Model(1))
+    results = registry.preload()
+    assert results == {"broken": False, "ok": True}
+    assert registry.is_ready()
+    assert registry.status()["models"]["broken"]["state"] == FAILED
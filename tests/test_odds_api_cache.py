@@ -0,0 +1,156 @@
+"""
+Tests for the Odds API response cache in odds_api.py
+(adaptive TTLs, quota tracking, single-flight coalescing).
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import odds_api
+from odds_api import (
+    OddsResponseCache,
+    compute_adaptive_ttl,
+    is_cacheable_url,
+    make_cache_key,
+    record_quota_headers,
+)
+
+
+class _Resp:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload if payload is not None else []
+        self.content = json.dumps(self._payload).encode()
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+@pytest.fixture(autouse=True)
+def _reset_quota(monkeypatch):
+    monkeypatch.setattr(odds_api, "_quota_state", {
+        "requests_remaining": None,
+        "requests_used": None,
+        "requests_last": None,
+        "updated_at": None,
+    })
+
+
+def _event(hours_from_now):
+    ts = datetime.now(timezone.utc) + timedelta(hours=hours_from_now)
+    return {"id": "e1", "commence_time": ts.isoformat().replace("+00:00", "Z")}
+
+
+def test_ttl_in_play_is_shortest():
+    assert compute_adaptive_ttl([_event(-1)]) == odds_api.ODDS_CACHE_TTL_IN_PLAY_S
+
+
+def test_ttl_grows_with_time_to_commence():
+    soon = compute_adaptive_ttl([_event(0.5)])
+    later = compute_adaptive_ttl([_event(12)])
+    far = compute_adaptive_ttl([_event(24 * 7)])
+    assert soon < later < far
+    assert far == odds_api.ODDS_CACHE_TTL_FAR_S
+
+
+def test_ttl_uses_earliest_game_in_slate():
+    assert compute_adaptive_ttl([_event(48), _event(0.5)]) == compute_adaptive_ttl([_event(0.5)])
+
+
+def test_ttl_stretches_when_quota_low():
+    base = compute_adaptive_ttl([_event(12)])
+    record_quota_headers(_Resp(headers={"x-requests-remaining": "100", "x-requests-used": "19900"}))
+    assert compute_adaptive_ttl([_event(12)]) == int(base * odds_api.ODDS_QUOTA_CRITICAL_MULTIPLIER)
+    assert odds_api.get_quota_state()["requests_remaining"] == 100
+
+
+def test_cache_key_ignores_api_key_and_param_order():
+    a = make_cache_key("https://x/odds", {"apiKey": "A", "markets": "h2h", "regions": "us"})
+    b = make_cache_key("https://x/odds", {"regions": "us", "markets": "h2h", "apiKey": "B"})
+    assert a == b
+    assert a != make_cache_key("https://x/odds", {"markets": "spreads", "regions": "us"})
+
+
+def test_sports_listing_not_cacheable():
+    assert not is_cacheable_url("https://api.the-odds-api.com/v4/sports")
+    assert is_cacheable_url("https://api.the-odds-api.com/v4/sports/basketball_nba/odds")
+
+
+def test_concurrent_identical_requests_share_one_fetch():
+    cache = OddsResponseCache(enabled=True)
+    calls = {"n": 0}
+
+    async def _fetch():
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return _Resp(200, [_event(3)])
+
+    async def _run():
+        return await asyncio.gather(*[cache.get_or_fetch("k", _fetch) for _ in range(5)])
+
+    results = asyncio.run(_run())
+    assert calls["n"] == 1
+    assert sum(1 for _, from_cache in results if from_cache) == 4
+    assert all(r.json()[0]["id"] == "e1" for r, _ in results)
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_hit_served_from_cache_after_first_fetch():
+    cache = OddsResponseCache(enabled=True)
+    calls = {"n": 0}
+
+    async def _fetch():
+        calls["n"] += 1
+        return _Resp(200, [_event(3)])
+
+    async def _run():
+        await cache.get_or_fetch("k", _fetch)
+        return await cache.get_or_fetch("k", _fetch)
+
+    resp, from_cache = asyncio.run(_run())
+    assert from_cache is True
+    assert resp.status_code == 200
+    assert calls["n"] == 1
+
+
+def test_error_responses_not_cached():
+    cache = OddsResponseCache(enabled=True)
+    calls = {"n": 0}
+
+    async def _fetch():
+        calls["n"] += 1
+        return _Resp(429, {"message": "rate limited"})
+
+    async def _run():
+        await cache.get_or_fetch("k", _fetch)
+        return await cache.get_or_fetch("k", _fetch)
+
+    resp, from_cache = asyncio.run(_run())
+    assert from_cache is False
+    assert resp.status_code == 429
+    assert calls["n"] == 2
+
+
+def test_cached_get_marks_used_on_hit(monkeypatch):
+    monkeypatch.setattr(odds_api, "_response_cache", OddsResponseCache(enabled=True))
+    marked = {"n": 0}
+    monkeypatch.setattr("integration_registry.mark_integration_used", lambda _: marked.__setitem__("n", marked["n"] + 1))
+
+    async def _fake_get(url, params, client=None, timeout_s=10.0, retries=2, backoff_s=0.5):
+        return _Resp(200, [_event(3)], headers={"x-requests-remaining": "4000"}), True
+
+    monkeypatch.setattr(odds_api, "odds_api_get", _fake_get)
+
+    async def _run():
+        first = await odds_api.odds_api_get_cached("https://x/sports/nba/odds", {"apiKey": "k"})
+        second = await odds_api.odds_api_get_cached("https://x/sports/nba/odds", {"apiKey": "k"})
+        return first, second
+
+    (r1, used1), (r2, used2) = asyncio.run(_run())
+    assert used1 is True and used2 is True
+    assert getattr(r2, "from_cache", False) is True
+    assert marked["n"] == 1
+    assert odds_api.get_quota_state()["requests_remaining"] == 4000
@@ -0,0 +1,197 @@
+"""
+Tests for core/parlay_pricing.py - correlation-aware parlay pricing.
+"""
+import itertools
+import random
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.parlay_pricing import (  # noqa: E402
+    HistoricalCorrelations,
+    clear_price_cache,
+    correlation_matrix,
+    joint_hit_probability,
+    pair_correlation,
+    price_parlay,
+    search_parlays,
+    set_history_correlations,
+)
+
+
+def _leg(player, prop_type, side="Over", game="g1", p=0.55, odds=-110):
+    return {"game_id": game, "player_name": player, "prop_type": prop_type,
+            "side": side, "odds": odds, "probability": p}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_price_cache()
+    yield
+    clear_price_cache()
+
+
+def test_rule_correlation_follows_sides_and_games():
+    qb = _leg("Burrow", "player_pass_yds")
+    wr = _leg("Chase", "player_reception_yds")
+    rb = _leg("Mixon", "player_rush_yds")
+    assert pair_correlation("NFL", qb, wr)["correlation"] > 0
+    assert pair_correlation("NFL", qb, rb)["correlation"] < 0
+    # Under on one side flips the sign of the hit correlation
+    assert pair_correlation("NFL", qb, dict(rb, side="Under"))["correlation"] > 0
+    # Different games are independent
+    assert pair_correlation("NFL", qb, dict(wr, game_id="g2"))["correlation"] == 0
+
+
+def test_game_total_leg_correlates_with_offensive_prop():
+    total = {"game_id": "g1", "market": "totals", "side": "Over", "line": 230.5, "odds": -110}
+    points = _leg("Tatum", "player_points")
+    assert pair_correlation("NBA", total, points)["correlation"] > 0
+    assert pair_correlation("NBA", total, dict(points, side="Under"))["correlation"] < 0
+
+
+def test_positive_correlation_raises_joint_probability():
+    legs = [_leg("Burrow", "player_pass_yds"), _leg("Chase", "player_reception_yds")]
+    priced = price_parlay(legs, sport="NFL", use_history=False)
+    assert priced["method"] == "gaussian_copula"
+    assert priced["joint_probability"] > priced["independent_probability"] == pytest.approx(0.3025)
+    assert priced["expected_value"] == pytest.approx(priced["joint_probability"] * priced["book_decimal"] - 1,
+                                                     abs=1e-3)
+
+
+def test_independent_legs_skip_simulation():
+    legs = [_leg("A", "player_points", game="g1"), _leg("B", "player_points", game="g2")]
+    priced = price_parlay(legs, sport="NBA", use_history=False)
+    assert priced["method"] == "independent"
+    assert priced["joint_probability"] == pytest.approx(0.3025)
+
+
+def test_prices_are_cached_per_leg_set_regardless_of_order():
+    legs = [_leg("Burrow", "player_pass_yds"), _leg("Chase", "player_reception_yds")]
+    first = price_parlay(legs, sport="NFL", use_history=False)
+    second = price_parlay(list(reversed(legs)), sport="NFL", use_history=False)
+    assert first["cached"] is False and second["cached"] is True
+    assert first["joint_probability"] == second["joint_probability"]
+
+
+def test_history_reload_reprices_cached_leg_sets():
+    legs = [_leg("Jokic", "player_points"), _leg("Jokic", "player_rebounds")]
+    table = HistoricalCorrelations()
+    table.loaded_at = time.time()
+    set_history_correlations(table)
+    try:
+        assert price_parlay(legs, sport="NBA")["cached"] is False
+        assert price_parlay(legs, sport="NBA")["cached"] is True
+        table.loaded_at += 1.0  # stands in for a TTL rebuild
+        assert price_parlay(legs, sport="NBA")["cached"] is False
+    finally:
+        set_history_correlations(None)
+
+
+def test_history_load_never_runs_on_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    from core import parlay_pricing
+
+    loads = []
+    released = threading.Event()
+
+    def slow_load():
+        loads.append(threading.current_thread().name)
+        released.wait(2)
+        table = HistoricalCorrelations()
+        table.loaded_at = time.time()
+        return table
+
+    monkeypatch.setattr(parlay_pricing, "_load_history", slow_load)
+    set_history_correlations(None)
+    try:
+        async def on_loop():
+            return parlay_pricing.get_history_correlations()
+
+        cold = asyncio.run(on_loop())  # returns at once with an empty table
+        assert len(cold) == 0 and cold.loaded_at is None
+        released.set()
+        for _ in range(200):
+            if parlay_pricing._history is not None and not parlay_pricing._history_refreshing:
+                break
+            time.sleep(0.01)
+        assert loads == ["parlay-history-refresh"]
+
+        stale = parlay_pricing._history
+        stale.loaded_at -= parlay_pricing.PARLAY_HISTORY_TTL_SECONDS + 1
+        assert parlay_pricing.get_history_correlations() is stale  # served while rebuilding
+        for _ in range(200):
+            if parlay_pricing._history is not stale:
+                break
+            time.sleep(0.01)
+        assert len(loads) == 2 and parlay_pricing._history is not stale
+    finally:
+        released.set()
+        set_history_correlations(None)
+
+
+def test_copula_matches_bivariate_normal_orthant():
+    # P(Z1 < 0, Z2 < 0) = 1/4 + asin(rho) / (2 pi)
+    rho = 0.5
+    matrix = np.array([[1.0, rho], [rho, 1.0]])
+    joint = joint_hit_probability([0.5, 0.5], matrix, num_sims=200_000, seed=1)
+    assert joint == pytest.approx(0.25 + np.arcsin(rho) / (2 * np.pi), abs=0.005)
+
+
+def test_correlation_matrix_is_repaired_to_valid():
+    legs = [_leg("QB", "player_pass_yds"), _leg("WR", "player_reception_yds"),
+            _leg("RB", "player_rush_yds"), _leg("WR2", "player_receptions")]
+    matrix, pairs = correlation_matrix(legs, sport="NFL")
+    assert pairs
+    np.testing.assert_allclose(np.diag(matrix), 1.0)
+    assert np.linalg.eigvalsh(matrix).min() > 0
+
+
+def test_history_blends_with_rules():
+    picks = []
+    for event in range(60):
+        # Points and rebounds always go the same way in these graded games
+        went_over = event % 2 == 0
+        for prop in ("player_points", "player_rebounds"):
+            picks.append({"sport": "NBA", "event_id": f"e{event}", "prop_type": prop,
+                          "side": "Over", "result": "WIN" if went_over else "LOSS"})
+    history = HistoricalCorrelations.from_picks(picks)
+    phi, n = history.lookup("NBA", "player_rebounds", "player_points")
+    assert n == 60 and phi == pytest.approx(1.0)
+
+    a, b = _leg("Jokic", "player_points"), _leg("Jokic", "player_rebounds")
+    rule_only = pair_correlation("NBA", a, b)["correlation"]
+    blended = pair_correlation("NBA", a, b, history)
+    assert blended["source"] == "rule+history"
+    assert blended["correlation"] > rule_only
+
+
+def test_search_matches_brute_force_pricing():
+    rng = random.Random(3)
+    types = ["player_points", "player_assists", "player_rebounds", "player_threes"]
+    pool = [_leg(f"p{i}", rng.choice(types), rng.choice(["Over", "Under"]), game=f"g{i % 3}",
+                 p=rng.uniform(0.48, 0.6), odds=rng.choice([-120, -110, 100])) for i in range(10)]
+    result = search_parlays(pool, num_legs=3, sport="NBA", top=3, use_history=False, num_sims=40_000)
+    assert result["combinations_evaluated"] == 120
+    best = result["parlays"][0]
+
+    brute = max(
+        (price_parlay(list(c), sport="NBA", use_history=False, num_sims=40_000)["expected_value"]
+         for c in itertools.combinations(pool, 3)),
+    )
+    assert best["expected_value"] == pytest.approx(brute, abs=0.05)
+    evs = [p["expected_value"] for p in result["parlays"]]
+    assert evs == sorted(evs, reverse=True)
+
+
+def test_search_skips_conflicting_legs():
+    pool = [_leg("A", "player_points", "Over"), _leg("A", "player_points", "Under"),
+            _leg("B", "player_assists"), _leg("C", "player_rebounds", game="g2")]
+    result = search_parlays(pool, num_legs=2, sport="NBA", top=10, use_history=False)
+    assert result["combinations_evaluated"] == 5
+    for parlay in result["parlays"]:
+        assert len({leg["player_name"] for leg in parlay["legs"]}) == 2
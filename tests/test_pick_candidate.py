@@ -0,0 +1,82 @@
+"""
+Tests for core/pick_candidate.py - compact candidate records in best-bets.
+"""
+import pytest
+
+from core.pick_candidate import GAME_ALIASES, PROP_ALIASES, PickCandidate, materialize
+from utils.contradiction_gate import make_unique_key
+
+
+def _prop(score=None, late=None):
+    fields = {
+        "sport": "NBA",
+        "event_id": "evt1",
+        "player": "LeBron James",
+        "market": "player_points",
+        "line": 25.5,
+        "side": "Over",
+        "book": "DraftKings",
+        "book_key": "draftkings",
+        "book_link": "https://dk.test/1",
+        "game": "Lakers @ Celtics",
+        "has_started": False,
+        "is_live": False,
+        "signals_fired": ["AI_STRONG"],
+        "book_count": 3,
+    }
+    score = score if score is not None else {
+        "total_score": 7.4, "tier": "GOLD_STAR", "pillars_passed": ["AI_STRONG"],
+        "smash_reasons": ["x"], "book_count": 5,
+    }
+    return PickCandidate(fields, score, late=late or {"sharp_signal": "STRONG"}, aliases=PROP_ALIASES)
+
+
+def test_materialized_shape_matches_legacy_dict_literal():
+    cand = _prop()
+    fields, score = dict(cand._fields), cand._score
+    legacy = {
+        **fields,
+        "league": "NBA", "player_name": "LeBron James", "stat_type": "player_points",
+        "prop_type": "player_points", "over_under": "Over", "sportsbook_name": "DraftKings",
+        "best_book": "DraftKings", "sportsbook_event_url": "https://dk.test/1",
+        "best_book_link": "https://dk.test/1", "matchup": "Lakers @ Celtics",
+        "is_started_already": False, "is_live_bet_candidate": False,
+        "signals_firing": ["AI_STRONG"], "pillars_hit": ["AI_STRONG"], "titanium_reasons": ["x"],
+        **score,
+        "sharp_signal": "STRONG",
+    }
+    assert cand.to_dict() == legacy
+    assert materialize(cand) == legacy
+    assert materialize(legacy) is legacy
+
+
+def test_layer_precedence_and_mutation():
+    score = {"total_score": 7.4, "book_count": 5}
+    cand = _prop(score=score, late={"sharp_signal": "NONE", "total_score": 1.0})
+    assert cand["book_count"] == 5          # score_data wins over candidate fields
+    assert cand["total_score"] == 1.0       # late fields win over score_data
+    assert cand.get("pillars_hit") == []    # score alias falls back to its default
+
+    cand["pick_id"] = "abc"
+    cand["total_score"] = 9.0
+    assert cand.setdefault("pick_id", "zzz") == "abc"
+    assert cand.setdefault("date_et", "2026-02-14") == "2026-02-14"
+    assert cand["total_score"] == 9.0 and "date_et" in cand
+    assert score == {"total_score": 7.4, "book_count": 5}  # shared score_data is never mutated
+    with pytest.raises(KeyError):
+        cand["missing"]
+
+
+def test_object_access_for_gates():
+    cand = _prop()
+    assert getattr(cand, "player_name", "") == "LeBron James"
+    assert getattr(cand, "nope", "dflt") == "dflt"
+    assert make_unique_key(cand) == make_unique_key(cand.to_dict())
+
+
+def test_game_aliases_keep_raw_best_book():
+    cand = PickCandidate({"sport": "NBA", "book": "consensus", "sportsbook_name": None, "book_link": ""},
+                         {}, aliases=GAME_ALIASES)
+    out = cand.to_dict()
+    assert out["book"] == "consensus" and out["best_book"] is None
+    assert out["league"] == "NBA" and out["sportsbook_event_url"] == ""
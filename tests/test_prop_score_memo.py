@@ -0,0 +1,136 @@
+"""
+Tests for core/prop_score_memo.py - incremental props rescoring.
+"""
+import time
+
+from core.prop_score_memo import PropScoreMemo, bookmaker_lines, fingerprint_inputs, get_prop_score_memo, prop_memo_key
+
+
+def _key(player="LeBron James", book="draftkings"):
+    return prop_memo_key("evt1", player, "player_points", "Over", book)
+
+
+def test_fingerprint_stable_across_dict_order():
+    a = fingerprint_inputs(line=25.5, sharp={"a": 1, "b": 2})
+    b = fingerprint_inputs(sharp={"b": 2, "a": 1}, line=25.5)
+    assert a == b
+
+
+def test_fingerprint_changes_when_line_moves():
+    assert fingerprint_inputs(line=25.5) != fingerprint_inputs(line=26.5)
+
+
+def _book(key, markets):
+    return {"key": key, "markets": [
+        {"key": market, "outcomes": [{"name": "Over", "description": "LeBron James", "point": point, "price": price}]}
+        for market, point, price in markets
+    ]}
+
+
+def test_bookmaker_lines_ignore_book_order_and_other_markets():
+    dk = _book("draftkings", [("player_points", 25.5, -110), ("player_rebounds", 7.5, -115)])
+    fd = _book("fanduel", [("player_points", 25.5, -105)])
+    points = bookmaker_lines([dk, fd], ("player_points",))
+    assert points == bookmaker_lines([fd, dk], ("player_points",))
+    assert len(points) == 2
+
+    moved = _book("fanduel", [("player_points", 25.5, -120)])
+    assert fingerprint_inputs(books=points) != fingerprint_inputs(books=bookmaker_lines([dk, moved], ("player_points",)))
+    rebounds_moved = _book("draftkings", [("player_points", 25.5, -110), ("player_rebounds", 8.5, -115)])
+    assert bookmaker_lines([rebounds_moved, fd], ("player_points",)) == points
+
+
+def test_prop_lstm_hot_swap_clears_memo(monkeypatch):
+    import ml_integration
+    from model_registry import _install_prop_lstm
+
+    monkeypatch.setattr(ml_integration, "_lstm_manager", ml_integration._lstm_manager)  # restored after
+
+    memo = get_prop_score_memo()
+    memo.clear()
+    memo.begin_run("NBA").store(_key(), fingerprint_inputs(line=25.5), {"final_score": 7.0})
+    assert memo.size("NBA") == 1
+    _install_prop_lstm(object())
+    assert memo.size() == 0
+
+
+def test_key_is_case_insensitive():
+    assert prop_memo_key("e", "LeBron James", "PTS", "Over", "DK") == prop_memo_key("e", "lebron james ", "pts", "OVER", "dk")
+
+
+def test_unchanged_prop_is_reused():
+    memo = PropScoreMemo(max_age_s=60, enabled=True)
+    fp = fingerprint_inputs(line=25.5, odds=-110)
+
+    run1 = memo.begin_run("nba")
+    assert run1.lookup(_key(), fp) is None
+    run1.store(_key(), fp, {"total_score": 7.1})
+    run1.finish()
+
+    run2 = memo.begin_run("nba")
+    hit = run2.lookup(_key(), fp)
+    assert hit == {"total_score": 7.1}
+    assert run2.to_dict()["reused"] == 1
+    assert run2.to_dict()["rescored"] == 0
+
+
+def test_changed_prop_is_rescored():
+    memo = PropScoreMemo(max_age_s=60, enabled=True)
+    run1 = memo.begin_run("nba")
+    run1.store(_key(), fingerprint_inputs(line=25.5), {"total_score": 7.1})
+
+    run2 = memo.begin_run("nba")
+    assert run2.lookup(_key(), fingerprint_inputs(line=26.5)) is None
+
+
+def test_reused_copy_is_isolated_from_memo():
+    memo = PropScoreMemo(max_age_s=60, enabled=True)
+    fp = fingerprint_inputs(line=25.5)
+    memo.begin_run("nba").store(_key(), fp, {"total_score": 7.1, "penalties": []})
+
+    hit = memo.begin_run("nba").lookup(_key(), fp)
+    hit["total_score"] = 1.0
+    hit["penalties"].append("x")
+
+    again = memo.begin_run("nba").lookup(_key(), fp)
+    assert again == {"total_score": 7.1, "penalties": []}
+
+
+def test_expired_entries_are_rescored():
+    memo = PropScoreMemo(max_age_s=0, enabled=True)
+    fp = fingerprint_inputs(line=25.5)
+    memo.begin_run("nba").store(_key(), fp, {"total_score": 7.1})
+    time.sleep(0.01)
+
+    run = memo.begin_run("nba")
+    assert run.lookup(_key(), fp) is None
+    assert run.expired == 1
+
+
+def test_finish_drops_props_no_longer_on_slate():
+    memo = PropScoreMemo(max_age_s=60, enabled=True)
+    fp = fingerprint_inputs(line=25.5)
+    run1 = memo.begin_run("nba")
+    run1.store(_key("A"), fp, {"total_score": 7.0})
+    run1.store(_key("B"), fp, {"total_score": 7.0})
+
+    run2 = memo.begin_run("nba")
+    run2.lookup(_key("A"), fp)
+    run2.finish()
+    assert memo.size("nba") == 1
+
+
+def test_disabled_memo_always_rescores():
+    memo = PropScoreMemo(max_age_s=60, enabled=False)
+    fp = fingerprint_inputs(line=25.5)
+    memo.begin_run("nba").store(_key(), fp, {"total_score": 7.1})
+    run = memo.begin_run("nba")
+    assert run.lookup(_key(), fp) is None
+    assert memo.size() == 0
+
+
+def test_sports_are_partitioned():
+    memo = PropScoreMemo(max_age_s=60, enabled=True)
+    fp = fingerprint_inputs(line=25.5)
+    memo.begin_run("nba").store(_key(), fp, {"total_score": 7.1})
+    assert memo.begin_run("nhl").lookup(_key(), fp) is None
@@ -0,0 +1,171 @@
+"""
+Tests for services/props_fetcher.py - concurrent per-event props fetch.
+"""
+import asyncio
+
+from services.props_fetcher import (
+    EventPropsCache,
+    fetch_props_for_events,
+    iter_event_props,
+    parse_event_props,
+    prop_markets_for_sport,
+)
+
+
+class _Resp:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+def _event_payload(event_id, player="Player A"):
+    return {
+        "id": event_id,
+        "home_team": "Home",
+        "away_team": "Away",
+        "bookmakers": [{
+            "key": "draftkings",
+            "markets": [{
+                "key": "player_points",
+                "outcomes": [
+                    {"description": player, "point": 20.5, "price": -115, "name": "Over"},
+                    {"description": player, "point": 20.5, "price": -105, "name": "Under"},
+                ],
+            }],
+        }],
+    }
+
+
+def _events(n):
+    return [{"id": f"e{i}", "commence_time": "2099-01-01T00:00:00Z"} for i in range(n)]
+
+
+def test_parse_event_props_flattens_outcomes():
+    game = parse_event_props({"commence_time": "T"}, _event_payload("e1"))
+    assert game["game_id"] == "e1"
+    assert game["commence_time"] == "T"
+    assert len(game["props"]) == 2
+    assert game["props"][0] == {
+        "player": "Player A", "market": "player_points", "line": 20.5,
+        "odds": -115, "side": "Over", "book": "draftkings",
+    }
+
+
+def test_prop_markets_per_sport():
+    assert "pitcher_strikeouts" in prop_markets_for_sport("mlb")
+    assert "player_points" in prop_markets_for_sport("nba")
+
+
+def test_concurrency_is_bounded_and_order_preserved():
+    state = {"active": 0, "peak": 0}
+
+    async def _fetch(event_id):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        # Later events finish first to prove output order follows input order
+        await asyncio.sleep(0.02 if event_id == "e0" else 0.001)
+        state["active"] -= 1
+        return _Resp(_event_payload(event_id))
+
+    data, stats = asyncio.run(fetch_props_for_events(
+        "nba", _events(8), _fetch, concurrency=3, cache=EventPropsCache(),
+    ))
+    assert state["peak"] <= 3
+    assert [g["game_id"] for g in data] == [f"e{i}" for i in range(8)]
+    assert stats.fetched == 8
+
+
+def test_max_events_cap():
+    async def _fetch(event_id):
+        return _Resp(_event_payload(event_id))
+
+    data, stats = asyncio.run(fetch_props_for_events(
+        "nba", _events(20), _fetch, max_events=12, cache=EventPropsCache(),
+    ))
+    assert len(data) == 12
+    assert stats.events_total == 20
+    assert stats.events_requested == 12
+
+
+def test_slow_event_times_out_without_blocking_others():
+    async def _fetch(event_id):
+        if event_id == "e1":
+            await asyncio.sleep(1.0)
+        return _Resp(_event_payload(event_id))
+
+    data, stats = asyncio.run(fetch_props_for_events(
+        "nba", _events(3), _fetch, event_deadline_s=0.05, cache=EventPropsCache(),
+    ))
+    assert [g["game_id"] for g in data] == ["e0", "e2"]
+    assert stats.timed_out == 1
+
+
+def test_timed_out_event_falls_back_to_last_good_props():
+    cache = EventPropsCache()
+    cache.put("nba", "e1", parse_event_props({"commence_time": "2099-01-01T00:00:00Z"}, _event_payload("e1")))
+    # Force the entry past its TTL but inside the stale grace window
+    props, stored_at, ttl = cache._entries[("nba", "e1")]
+    cache._entries[("nba", "e1")] = (props, stored_at - ttl - 1, ttl)
+
+    async def _fetch(event_id):
+        await asyncio.sleep(1.0)
+
+    data, stats = asyncio.run(fetch_props_for_events(
+        "nba", [{"id": "e1"}], _fetch, event_deadline_s=0.05, cache=cache,
+    ))
+    assert len(data) == 1
+    assert stats.stale == 1
+
+
+def test_cached_events_skip_upstream():
+    cache = EventPropsCache()
+    calls = {"n": 0}
+
+    async def _fetch(event_id):
+        calls["n"] += 1
+        return _Resp(_event_payload(event_id))
+
+    asyncio.run(fetch_props_for_events("nba", _events(2), _fetch, cache=cache))
+    _, stats = asyncio.run(fetch_props_for_events("nba", _events(2), _fetch, cache=cache))
+    assert calls["n"] == 2
+    assert stats.cached == 2
+
+
+def test_streaming_yields_in_completion_order():
+    async def _fetch(event_id):
+        await asyncio.sleep(0.03 if event_id == "e0" else 0.0)
+        return _Resp(_event_payload(event_id))
+
+    async def _run():
+        return [r.event_id async for r in iter_event_props("nba", _events(2), _fetch, cache=EventPropsCache())]
+
+    assert asyncio.run(_run()) == ["e1", "e0"]
+
+
+def test_error_status_counts_as_error():
+    async def _fetch(event_id):
+        return _Resp({}, status_code=422)
+
+    data, stats = asyncio.run(fetch_props_for_events("nba", _events(1), _fetch, cache=EventPropsCache()))
+    assert data == []
+    assert stats.errors == 1
+
+
+def test_event_cache_ttl_follows_adaptive_odds_policy(monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    import odds_api
+
+    monkeypatch.setattr(odds_api, "quota_ttl_multiplier", lambda: 1.0)
+    now = datetime.now(timezone.utc)
+    cache = EventPropsCache()
+    for event_id, offset in (("live", -600), ("soon", 1800), ("tonight", 5 * 3600), ("later", 5 * 86400)):
+        commence = (now + timedelta(seconds=offset)).isoformat()
+        cache.put("nba", event_id, {"commence_time": commence, "props": [{}]})
+        expected = odds_api.compute_adaptive_ttl({"commence_time": commence})
+        assert cache._entries[("nba", event_id)][2] == expected
+    ttls = {eid: cache._entries[("nba", eid)][2] for eid in ("live", "soon", "tonight", "later")}
+    assert ttls == {"live": 30, "soon": 60, "tonight": 180, "later": 1800}
@@ -0,0 +1,155 @@
+"""
+Tests for core/request_coalescer.py - single-flight fetches with per-function TTLs.
+"""
+import asyncio
+
+import pytest
+
+from core.request_coalescer import RequestCoalescer
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_fetch(calls, value="ok", delay=0.01, error=None):
+    async def fetch():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return {"value": value, "n": len(calls)}
+    return fetch
+
+
+def test_concurrent_callers_share_one_fetch():
+    coalescer = RequestCoalescer(ttls={"sharp": 0})
+    calls = []
+
+    async def scenario():
+        return await asyncio.gather(*[
+            coalescer.run("sharp", "NBA", _counting_fetch(calls), day="2026-02-14") for _ in range(5)
+        ])
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    counts = coalescer.stats()["by_function"]["sharp"]
+    assert counts["fetches"] == 1 and counts["coalesced"] == 4
+
+
+def test_keys_separate_function_sport_and_day():
+    coalescer = RequestCoalescer(ttls={})
+    calls = []
+
+    async def scenario():
+        await asyncio.gather(
+            coalescer.run("sharp", "nba", _counting_fetch(calls), day="2026-02-14"),
+            coalescer.run("lines", "nba", _counting_fetch(calls), day="2026-02-14"),
+            coalescer.run("sharp", "nhl", _counting_fetch(calls), day="2026-02-14"),
+            coalescer.run("sharp", "nba", _counting_fetch(calls), day="2026-02-15"),
+        )
+
+    asyncio.run(scenario())
+    assert len(calls) == 4
+
+
+def test_memo_respects_per_function_ttl():
+    clock = Clock()
+    coalescer = RequestCoalescer(ttls={"injuries": 300, "lines": 30}, clock=clock)
+    calls = []
+
+    def call(name):
+        return asyncio.run(coalescer.run(name, "nba", _counting_fetch(calls, value=name), day="d"))
+
+    call("injuries"), call("lines")
+    clock.now += 60
+    call("injuries"), call("lines")
+    assert calls == ["injuries", "lines", "lines"]  # lines memo expired, injuries still live
+    assert coalescer.stats()["by_function"]["injuries"]["memo_hits"] == 1
+
+    assert coalescer.invalidate(name="injuries") == 1
+    call("injuries")
+    assert calls[-1] == "injuries"
+
+
+def test_errors_reach_every_waiter_and_are_not_memoized():
+    coalescer = RequestCoalescer(ttls={"props": 60})
+    calls = []
+
+    async def scenario():
+        return await asyncio.gather(*[
+            coalescer.run("props", "nba", _counting_fetch(calls, error=RuntimeError("upstream 502")), day="d")
+            for _ in range(3)
+        ], return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert coalescer.stats()["live_entries"] == 0 and coalescer.stats()["inflight"] == 0
+
+    asyncio.run(coalescer.run("props", "nba", _counting_fetch(calls), day="d"))
+    assert len(calls) == 2
+
+
+def test_cancelled_leader_hands_off_to_waiter():
+    coalescer = RequestCoalescer(ttls={})
+    calls = []
+
+    async def scenario():
+        leader = asyncio.create_task(coalescer.run("lines", "nba", _counting_fetch(calls, delay=1), day="d"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(coalescer.run("lines", "nba", _counting_fetch(calls, delay=0.01), day="d"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await waiter
+
+    result = asyncio.run(scenario())
+    assert result["n"] == 2 and len(calls) == 2
+
+
+def test_disabled_coalescer_always_fetches():
+    coalescer = RequestCoalescer(enabled=False)
+    calls = []
+
+    async def scenario():
+        await asyncio.gather(*[coalescer.run("sharp", "nba", _counting_fetch(calls)) for _ in range(3)])
+
+    asyncio.run(scenario())
+    assert len(calls) == 3
+
+
+def test_flights_on_different_event_loops_do_not_share_futures():
+    import threading
+
+    coalescer = RequestCoalescer(ttls={"sharp": 0})
+    started = threading.Event()
+    release = threading.Event()
+    results = {}
+
+    async def slow_fetch():
+        started.set()
+        await asyncio.get_running_loop().run_in_executor(None, release.wait)
+        return "scheduler"
+
+    def scheduler_thread():
+        results["scheduler"] = asyncio.run(coalescer.run("sharp", "nba", slow_fetch))
+
+    thread = threading.Thread(target=scheduler_thread)
+    thread.start()
+    started.wait(5)
+    try:
+        # Same key while the other loop's flight is open: must not await its future
+        results["api"] = asyncio.run(coalescer.run("sharp", "nba", _counting_fetch([], value="api")))
+    finally:
+        release.set()
+        thread.join(5)
+    assert results["api"]["value"] == "api"
+    assert results["scheduler"] == "scheduler"
+    assert coalescer.stats()["inflight"] == 0
@@ -0,0 +1,138 @@
+"""
+Tests for core/response_cache.py - precomputed public payload bytes + ETags.
+"""
+import gzip
+import json
+
+import pytest
+
+from core.response_cache import (
+    PayloadStore,
+    PrecomputedPayload,
+    compute_etag,
+    dumps_bytes,
+    etag_matches,
+    loads_bytes,
+    select_encoding,
+)
+
+
+def _big_payload(n=200):
+    return {"props": {"picks": [{"pick_id": f"p{i}", "final_score": 7.25, "player": "Ünïcode"} for i in range(n)]}}
+
+
+def test_dumps_roundtrip_matches_stdlib():
+    payload = {"a": 1, "b": [1.5, None, True], "c": {"d": "é"}}
+    assert loads_bytes(dumps_bytes(payload)) == json.loads(json.dumps(payload))
+
+
+def test_dumps_handles_sets_and_non_str_keys():
+    out = loads_bytes(dumps_bytes({"tags": {"x"}, 1: "one"}))
+    assert out == {"tags": ["x"], "1": "one"}
+
+
+def test_etag_is_content_hash():
+    assert compute_etag(b"abc") == compute_etag(b"abc")
+    assert compute_etag(b"abc") != compute_etag(b"abd")
+    assert compute_etag(b"abc").startswith('"')
+
+
+@pytest.mark.parametrize("header,expected", [
+    (None, False),
+    ("", False),
+    ("*", True),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"zzz", "abc"', True),
+    ('"zzz"', False),
+])
+def test_etag_matching(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_select_encoding_prefers_gzip_and_respects_q0():
+    assert select_encoding("gzip, deflate") == "gzip"
+    assert select_encoding("gzip;q=0") is None
+    assert select_encoding(None) is None
+    assert select_encoding("identity") is None
+
+
+def test_render_200_then_304():
+    pre = PrecomputedPayload.from_payload({"ok": True})
+    status, body, headers = pre.render()
+    assert status == 200
+    assert loads_bytes(body) == {"ok": True}
+    assert headers["ETag"] == pre.etag
+
+    status, body, headers = pre.render(if_none_match=pre.etag)
+    assert status == 304
+    assert body == b""
+    assert headers["ETag"] == pre.etag
+
+
+def test_render_gzip_variant_built_once():
+    pre = PrecomputedPayload.from_payload(_big_payload())
+    status, body, headers = pre.render(accept_encoding="gzip")
+    assert headers["Content-Encoding"] == "gzip"
+    assert loads_bytes(gzip.decompress(body)) == pre.payload()
+    _, body2, _ = pre.render(accept_encoding="gzip")
+    assert body2 is body
+
+
+def test_small_bodies_not_compressed():
+    pre = PrecomputedPayload.from_payload({"ok": True})
+    _, _, headers = pre.render(accept_encoding="gzip")
+    assert "Content-Encoding" not in headers
+
+
+def test_store_ttl_and_invalidate():
+    store = PayloadStore()
+    store.put("best-bets:nba", {"a": 1}, ttl=60)
+    store.put("best-bets:nhl", {"a": 2}, ttl=0)
+    assert store.get("best-bets:nba").payload() == {"a": 1}
+    assert store.get("best-bets:nhl") is None
+    assert store.invalidate("best-bets:") == 1
+    assert store.get("best-bets:nba") is None
+    assert store.stats()["hits"] == 1
+
+
+def test_store_bounded():
+    store = PayloadStore(max_entries=2)
+    for i in range(5):
+        store.put(f"k{i}", {"i": i}, ttl=60 + i)
+    assert store.stats()["entries"] == 2
+
+
+def test_scope_version_bumps_only_on_changed_bytes():
+    store = PayloadStore()
+    v0 = store.version("nba")
+    store.put("sharp:nba", {"a": 1}, ttl=60)
+    v1 = store.version("NBA")
+    assert v1["seq"] == v0["seq"] + 1
+    assert v1["version"] != v0["version"]
+
+    # Same bytes again (e.g. rehydrated from Redis) is not a change
+    store.put("sharp:nba", {"a": 1}, ttl=60)
+    assert store.version("nba") == v1
+
+    store.put("lines:nba", {"b": 2}, ttl=60)
+    store.put("lines:nhl", {"b": 2}, ttl=60)
+    v2 = store.version("nba")
+    assert v2["seq"] == 2
+    assert set(v2["etags"]) == {"sharp:nba", "lines:nba"}
+
+
+def test_scope_version_matches_across_stores():
+    a, b = PayloadStore(), PayloadStore()
+    for store in (a, b):
+        store.put("props:mlb", {"x": [1, 2]}, ttl=60)
+    assert a.version("mlb")["version"] == b.version("mlb")["version"]
+
+
+def test_discard_drops_single_key():
+    store = PayloadStore()
+    store.put("lines:nba", {"b": 2}, ttl=60)
+    store.put("lines:nba:live", {"b": 3}, ttl=60)
+    store.discard("lines:nba")
+    assert store.get("lines:nba") is None
+    assert store.get("lines:nba:live") is not None
@@ -0,0 +1,96 @@
+"""
+Guards for the live_data_router split into routers/live_*.py and core modules.
+"""
+import ast
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+LIVE_ROUTERS = sorted(p.stem for p in (ROOT / "routers").glob("live_*.py"))
+ROUTE_RE = re.compile(r'@router\.(get|post|put|delete)\("([^"]+)"')
+
+
+def _top_level_imports(path: Path) -> set:
+    imported = set()
+    for node in ast.parse(path.read_text()).body:
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imported.add(node.module)
+    return imported
+
+
+def test_sub_routers_and_core_modules_never_import_the_monolith():
+    paths = [ROOT / "routers" / f"{name}.py" for name in LIVE_ROUTERS]
+    paths += [ROOT / "core" / f"{name}.py" for name in ("live_http", "hybrid_cache", "live_contract", "esoteric_engines")]
+    for path in paths:
+        assert "live_data_router" not in _top_level_imports(path), path.name
+
+
+def _unbound_names(path: Path) -> set:
+    """Names loaded in a module that nothing in it binds (a cheap undefined-name check)."""
+    import builtins
+
+    tree = ast.parse(path.read_text())
+    bound = set(dir(builtins))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            bound.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, ast.alias):
+            bound.add((node.asname or node.name).split(".")[0])
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+    loaded = {n.id for n in ast.walk(tree) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+    return loaded - bound
+
+
+def test_sub_routers_have_no_unbound_names():
+    for name in LIVE_ROUTERS:
+        assert not _unbound_names(ROOT / "routers" / f"{name}.py"), name
+
+
+def test_moved_endpoints_are_served_by_their_router():
+    source = (ROOT / "live_data_router.py").read_text()
+    monolith_routes = {m.group(2) for m in ROUTE_RE.finditer(source)}
+    for name in LIVE_ROUTERS:
+        routes = {(m.group(1).upper(), m.group(2)) for m in ROUTE_RE.finditer((ROOT / "routers" / f"{name}.py").read_text())}
+        listed = re.search(rf"# MOVED to routers/{name}\.py\n# =+\n((?:# - .+\n)+)", source)
+        assert listed, name
+        moved = {tuple(line[4:].split(" ", 1)) for line in listed.group(1).splitlines()}
+        assert routes and moved == routes
+        assert not {path for _, path in routes} & monolith_routes
+
+
+def test_main_registers_every_live_router():
+    tree = ast.parse((ROOT / "main.py").read_text())
+    heavy = next(node.value for node in tree.body
+                 if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "HEAVY_ROUTERS")
+    modules = [ast.literal_eval(entry)[0] for entry in heavy.elts]
+    assert modules[0] == "live_data_router"
+    # Sub-routers register right after the monolith, where their routes used to be
+    assert sorted(modules[1:1 + len(LIVE_ROUTERS)]) == [f"routers.{name}" for name in LIVE_ROUTERS]
+
+
+def test_routers_package_is_lazy():
+    code = (
+        "import sys, routers\n"
+        "print(sorted(m for m in sys.modules if m.startswith('routers.')))\n"
+        "print('community_router' in dir(routers))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr[-2000:]
+    loaded, listed = out.stdout.strip().splitlines()
+    assert loaded == "[]" and listed == "True"
+
+
+def test_shared_cache_loads_without_the_monolith():
+    code = "import sys, core.hybrid_cache, core.esoteric_engines; print('live_data_router' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert out.returncode == 0, out.stderr[-2000:]
+    assert out.stdout.strip() == "False"
@@ -0,0 +1,138 @@
+"""
+Tests for core/coordination.py and the scheduler worker roles.
+"""
+import time
+
+import pytest
+
+from core.coordination import LeaderLease, LeaseKeeper, SQLiteCoordinationStore
+from core.scheduler_worker import role_runs_scheduler, role_serves_http, get_worker_role
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteCoordinationStore(str(tmp_path / "coord.sqlite3"))
+
+
+def test_lease_is_exclusive_until_released(store, tmp_path):
+    # Second store on the same file stands in for another process
+    other_store = SQLiteCoordinationStore(str(tmp_path / "coord.sqlite3"))
+    a = LeaderLease("scheduler", ttl_s=30, store=store, holder="a")
+    b = LeaderLease("scheduler", ttl_s=30, store=other_store, holder="b")
+
+    assert a.try_acquire({"role": "worker"})
+    assert not b.try_acquire()
+    assert not b.renew()
+    assert a.renew({"role": "worker"})
+    assert b.holder()["holder"] == "a" and b.holder()["info"] == {"role": "worker"}
+
+    a.release()
+    assert a.holder() is None
+    assert b.try_acquire()
+
+
+def test_expired_lease_is_taken_over(store):
+    a = LeaderLease("scheduler", ttl_s=0.05, store=store, holder="a")
+    b = LeaderLease("scheduler", ttl_s=30, store=store, holder="b")
+    assert a.try_acquire()
+    time.sleep(0.1)
+    assert a.holder() is None
+    assert b.try_acquire()
+    assert not a.renew()
+
+
+def test_keeper_fires_callbacks_on_acquire_and_loss(store):
+    events = []
+    lease = LeaderLease("scheduler", ttl_s=30, store=store, holder="a")
+    keeper = LeaseKeeper(lease, on_acquired=lambda: events.append("up"), on_lost=lambda: events.append("down"))
+
+    assert keeper.tick() and events == ["up"]
+    assert keeper.tick() and events == ["up"]  # renew, no callback
+
+    # Another holder steals the lease (e.g. ours expired during a long GC pause)
+    store.lease_release("scheduler", "a")
+    LeaderLease("scheduler", ttl_s=30, store=store, holder="b").try_acquire()
+    assert not keeper.tick() and events == ["up", "down"]
+
+    keeper.stop()
+    assert store.lease_get("scheduler")["holder"] == "b"
+
+
+def test_keeper_stop_releases_lease(store):
+    keeper = LeaseKeeper(LeaderLease("scheduler", ttl_s=30, store=store, holder="a"))
+    keeper.tick()
+    keeper.stop(release=True)
+    assert store.lease_get("scheduler") is None
+
+
+def test_markers_round_trip(store):
+    assert store.get_marker("model_updated:x") is None
+    store.put_marker("model_updated:x", {"at": 1.5, "by": "a"})
+    assert store.get_marker("model_updated:x") == {"at": 1.5, "by": "a"}
+
+
+def test_worker_roles(monkeypatch):
+    monkeypatch.setenv("WORKER_ROLE", "api")
+    assert get_worker_role() == "api" and not role_runs_scheduler() and role_serves_http()
+    monkeypatch.setenv("WORKER_ROLE", "worker")
+    assert role_runs_scheduler() and not role_serves_http()
+    monkeypatch.setenv("WORKER_ROLE", "bogus")
+    assert get_worker_role() == "all" and role_runs_scheduler() and role_serves_http()
+
+
+def test_model_watcher_reloads_models_published_by_other_processes(store, monkeypatch):
+    import core.scheduler_worker as scheduler_worker
+    import model_registry
+
+    class _Registry:
+        names = ["team_matchup", "game_ensemble"]
+        reloaded = []
+
+        def reload(self, *names):
+            self.reloaded.extend(names)
+            return {name: True for name in names}
+
+    registry = _Registry()
+    monkeypatch.setattr(model_registry, "get_model_registry", lambda: registry)
+    monkeypatch.setattr(scheduler_worker, "get_coordination_store", lambda: store)
+
+    watcher = scheduler_worker.ModelUpdateWatcher()
+    store.put_marker("model_updated:team_matchup", {"at": 1.0, "by": "other"})
+    watcher.poll_once(reload=False)  # startup: already current
+    store.put_marker("model_updated:game_ensemble", {"at": 2.0, "by": "other"})
+    store.put_marker("model_updated:team_matchup", {"at": 3.0, "by": scheduler_worker.process_id()})
+    assert watcher.poll_once() == {"game_ensemble": True}
+    assert registry.reloaded == ["game_ensemble"]
+
+
+def test_worker_role_publishes_without_reloading_locally(store, monkeypatch):
+    import core.scheduler_worker as scheduler_worker
+    import model_registry
+
+    monkeypatch.setenv("WORKER_ROLE", "worker")
+    monkeypatch.setattr(scheduler_worker, "get_coordination_store", lambda: store)
+    monkeypatch.setattr(model_registry, "get_model_registry",
+                        lambda: pytest.fail("worker must not reload models locally"))
+    scheduler_worker.hot_swap_models("master_prediction")
+    assert store.get_marker("model_updated:master_prediction")["by"] == scheduler_worker.process_id()
+
+
+def test_jobs_stop_once_the_lease_is_lost(store, monkeypatch):
+    import core.scheduler_worker as scheduler_worker
+
+    class _Leadership:
+        def __init__(self):
+            self.lease = LeaderLease("scheduler", ttl_s=30, store=store, holder="a")
+            self.is_leader = self.lease.try_acquire()
+
+    leadership = _Leadership()
+    monkeypatch.setattr(scheduler_worker, "_leadership", leadership)
+    assert scheduler_worker.holds_scheduler_lease()
+
+    # Our lease expired (e.g. a long pause) and another worker took it
+    store.lease_release("scheduler", "a")
+    LeaderLease("scheduler", ttl_s=30, store=store, holder="b").try_acquire()
+    assert not scheduler_worker.holds_scheduler_lease()
+
+    monkeypatch.setattr(scheduler_worker, "_leadership", None)
+    assert scheduler_worker.holds_scheduler_lease()  # no lease in use: jobs run
@@ -0,0 +1,63 @@
+"""
+Tests for upper-bound pruning (core.scoring_pipeline.compute_score_ceiling).
+
+The ceiling must never be below the score compute_final_score_option_a()
+can produce for the same BASE_4 and context modifier, otherwise pruning
+would drop picks that could have qualified.
+"""
+import itertools
+import os
+import re
+
+from core.scoring_contract import (
+    EXPERT_CONSENSUS_CAP,
+    HOOK_PENALTY_CAP,
+    JASON_SIM_BOOST_CAP,
+    MSRF_BOOST_CAP,
+    PROP_CORRELATION_CAP,
+    SERP_BOOST_CAP_TOTAL,
+    TOTAL_BOOST_CAP,
+)
+from core.scoring_pipeline import compute_final_score_option_a, compute_score_ceiling
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_ceiling_bounds_final_score_under_max_boosts():
+    for base, ctx in itertools.product([0.0, 3.2, 5.5, 6.8, 8.9, 10.0], [-1.0, -0.2, 0.0, 0.3, 2.0]):
+        final, _ = compute_final_score_option_a(
+            base_score=base,
+            context_modifier=ctx,
+            confluence_boost=10.0,
+            msrf_boost=MSRF_BOOST_CAP,
+            jason_sim_boost=JASON_SIM_BOOST_CAP,
+            serp_boost=SERP_BOOST_CAP_TOTAL,
+            ensemble_adjustment=5.0,
+            totals_calibration_adj=5.0,
+            hook_penalty=0.0,
+            expert_consensus_boost=EXPERT_CONSENSUS_CAP,
+            prop_correlation_adjustment=PROP_CORRELATION_CAP,
+        )
+        assert final <= compute_score_ceiling(base, ctx) + 1e-9
+
+
+def test_ceiling_is_tight_and_clamped():
+    slack = TOTAL_BOOST_CAP + EXPERT_CONSENSUS_CAP + PROP_CORRELATION_CAP
+    assert abs(compute_score_ceiling(4.0, 0.0) - (4.0 + slack)) < 1e-9
+    assert compute_score_ceiling(9.5, 0.3) == 10.0
+    assert compute_score_ceiling(0.0, -5.0) >= 0.0
+    # A penalised candidate is still bounded by the un-penalised ceiling
+    final, _ = compute_final_score_option_a(4.0, 0.0, 0.0, 0.0, 0.0, 0.0, hook_penalty=-HOOK_PENALTY_CAP)
+    assert final < compute_score_ceiling(4.0, 0.0)
+
+
+def test_pruning_only_skips_post_base_enrichment():
+    with open(os.path.join(REPO_ROOT, "live_data_router.py")) as f:
+        src = f.read()
+    prune_at = src.index("score_ceiling = compute_score_ceiling(")
+    # BASE_4 engines run before the prune point; enrichment runs after and is gated
+    assert src.index("base_score =") < prune_at
+    for block in ("JASON_SIM_AVAILABLE and not _score_pruned", "ensemble_skipped_reason = f\"pruned"):
+        assert src.index(block) > prune_at
+    # Rank-pruned results depend on the slate and must not enter the prop memo
+    assert re.search(r'if score_data.get\("pruned"\) != "rank":\s+_prop_memo_run.store', src)
@@ -0,0 +1,114 @@
+"""
+Tests for core/scoring_offload.py - cooperative yielding and scoring worker processes.
+"""
+import asyncio
+import os
+import time
+
+import pytest
+
+from core import scoring_offload
+from core.scoring_offload import (
+    ScoringYielder,
+    get_offload_stats,
+    recycle_scoring_pool,
+    register_worker_reset,
+    run_coroutine_in_worker,
+    shutdown_scoring_pool,
+)
+
+_WORKER_STATE = {"reset": False}
+
+
+def _mark_reset():
+    _WORKER_STATE["reset"] = True
+
+
+async def _worker_info(x, scale=1):
+    await asyncio.sleep(0)
+    return {"pid": os.getpid(), "value": x * scale, "reset": _WORKER_STATE["reset"],
+            "loop_id": id(asyncio.get_running_loop())}
+
+
+async def _boom():
+    raise ValueError("scoring failed")
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(scoring_offload, "SCORING_OFFLOAD_WORKERS", 1)
+    register_worker_reset(_mark_reset)
+    yield
+    shutdown_scoring_pool()
+    scoring_offload._reset_hooks.remove(_mark_reset)
+
+
+def test_yielder_lets_other_tasks_run_during_sync_loop():
+    async def scenario():
+        ticks = []
+
+        async def heartbeat():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0)
+        yielder = ScoringYielder(interval_ms=5)
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:  # simulated CPU-bound scoring
+            await yielder.maybe_yield()
+        task.cancel()
+        return ticks, yielder.yields
+
+    ticks, yields = asyncio.run(scenario())
+    assert yields >= 5
+    assert len(ticks) > yields  # heartbeat ran while "scoring"
+
+
+def test_yielder_disabled_with_zero_interval():
+    async def scenario():
+        yielder = ScoringYielder(interval_ms=0)
+        return [await yielder.maybe_yield() for _ in range(3)]
+
+    assert asyncio.run(scenario()) == [False, False, False]
+
+
+def test_coroutine_runs_in_worker_with_persistent_loop(pool):
+    async def scenario():
+        first = await run_coroutine_in_worker(_worker_info, 21, scale=2)
+        second = await run_coroutine_in_worker(_worker_info, 1)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first["pid"] != os.getpid()
+    assert first["value"] == 42 and first["reset"] is True
+    # Same single worker, same event loop for every dispatched coroutine
+    assert first["pid"] == second["pid"] and first["loop_id"] == second["loop_id"]
+    assert get_offload_stats()["completed"] >= 2
+
+
+def test_worker_exceptions_propagate(pool):
+    with pytest.raises(ValueError, match="scoring failed"):
+        asyncio.run(run_coroutine_in_worker(_boom))
+
+
+def test_model_hot_swap_recycles_scoring_workers(pool):
+    from model_registry import ModelRegistry
+
+    registry = ModelRegistry()
+    registry.register("m", lambda: object())
+
+    async def scenario():
+        before = await run_coroutine_in_worker(_worker_info, 1)
+        assert registry.reload("m") == {"m": True}
+        after = await run_coroutine_in_worker(_worker_info, 1)
+        return before, after
+
+    recycles = get_offload_stats()["pool_recycles"]
+    before, after = asyncio.run(scenario())
+    assert before["pid"] != after["pid"]  # new workers load the new models
+    assert get_offload_stats()["pool_recycles"] == recycles + 1
+    shutdown_scoring_pool()
+    recycle_scoring_pool()  # no pool running: no-op
+    assert get_offload_stats()["pool_recycles"] == recycles + 1
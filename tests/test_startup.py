@@ -0,0 +1,100 @@
+"""
+Tests for core/startup.py and the main.py fast-startup path.
+"""
+import ast
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from core.startup import ImportProfiler, StartupReport, STARTUP_BUDGET_SECONDS
+
+ROOT = Path(__file__).resolve().parent.parent
+HEAVY = {"live_data_router", "routers", "daily_scheduler", "trap_router", "streaming_router", "auto_grader"}
+
+
+def test_report_records_phases_imports_and_readiness():
+    report = StartupReport(fast_startup=True, profile_imports=False)
+    with report.phase("database"):
+        pass
+    assert not report.is_loaded("json")
+    report.import_modules(["json", "json"])
+    report.mark_ready()
+
+    out = report.to_dict()
+    assert [p["phase"] for p in out["phases"]] == ["database"]
+    assert report.is_loaded("json") and list(out["heavy_imports"]) == ["json"]
+    assert out["ready"] is True and out["ready_after_s"] >= 0
+    assert "import_profile" not in out
+
+
+def test_import_profiler_reports_self_and_cumulative(tmp_path, monkeypatch):
+    (tmp_path / "startup_probe_child.py").write_text("import time\ntime.sleep(0.03)\n")
+    (tmp_path / "startup_probe_parent.py").write_text(textwrap.dedent("""
+        import time
+        time.sleep(0.01)
+        import startup_probe_child
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profiler = ImportProfiler().install()
+    try:
+        import startup_probe_parent  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("startup_probe_parent", None)
+        sys.modules.pop("startup_probe_child", None)
+
+    parent = profiler.modules["startup_probe_parent"]
+    child = profiler.modules["startup_probe_child"]
+    assert parent["cumulative_ms"] >= child["cumulative_ms"] + parent["self_ms"] - 1
+    assert child["self_ms"] >= 25 and parent["self_ms"] < child["self_ms"]
+    assert profiler.report(top_n=1)["top_cumulative"][0]["module"] == "startup_probe_parent"
+    assert profiler not in sys.meta_path
+
+
+def test_main_has_no_top_level_heavy_imports():
+    tree = ast.parse((ROOT / "main.py").read_text())
+    imported = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imported.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imported.add(node.module.split(".")[0])
+    assert not imported & HEAVY
+
+
+def test_fast_startup_import_stays_within_budget():
+    pytest.importorskip("fastapi")
+    code = textwrap.dedent("""
+        import json, sys, time
+        t = time.perf_counter()
+        import main
+        elapsed = time.perf_counter() - t
+        heavy = [m for m in %r if m in sys.modules]
+        print(json.dumps({"elapsed": elapsed, "heavy": heavy}))
+    """ % sorted(HEAVY))
+    env = dict(os.environ, FAST_STARTUP="true")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                         capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0, out.stderr[-2000:]
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    assert result["heavy"] == []
+    assert result["elapsed"] < STARTUP_BUDGET_SECONDS
+
+
+def test_failed_heavy_load_fails_health_checks(monkeypatch):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    import main
+
+    monkeypatch.setattr(main._startup, "error", "ImportError: boom")
+    client = TestClient(main.app)  # no lifespan: heavy subsystems never load
+    resp = client.get("/health")
+    assert resp.status_code == 503
+    body = resp.json()
+    assert body["startup_error"] == "ImportError: boom"
+    assert "heavy_subsystems_failed" in body["errors"] and body["ok"] is False
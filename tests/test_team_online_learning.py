@@ -0,0 +1,138 @@
+"""
+Tests for online learning in team_ml_models (running matchup stats, Hedge
+ensemble weights, Page-Hinkley drift and the retrain gate).
+"""
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import team_ml_models as tm  # noqa: E402
+
+
+@pytest.fixture
+def models(tmp_path, monkeypatch):
+    monkeypatch.setattr(tm, "MODELS_DIR", str(tmp_path))
+    monkeypatch.setattr(tm, "TEAM_MODEL_ONLINE_UPDATES", True)
+    matchup, ensemble = tm.TeamMatchupModel(), tm.GameEnsembleModel()
+    monkeypatch.setattr(tm, "_team_matchup", matchup)
+    monkeypatch.setattr(tm, "_game_ensemble", ensemble)
+    return matchup, ensemble
+
+
+def _graded(event_id, home_score, away_score, preds=(220, 210, 240, 221), pick_type="TOTAL",
+            side="Over", line=215.5, result="WIN"):
+    return {
+        "pick_id": f"{event_id}-{pick_type}", "event_id": event_id, "sport": "NBA", "pick_type": pick_type,
+        "home_team": "Lakers", "away_team": "Celtics", "side": side, "line": line, "result": result,
+        "actual_home_score": home_score, "actual_away_score": away_score,
+        "actual_value": home_score + away_score,
+        "ai_breakdown": {"raw_inputs": {"model_preds": {"values": list(preds)}}},
+    }
+
+
+def test_running_stats_match_full_history(models):
+    matchup, _ = models
+    games = [(110, 100), (98, 105), (120, 118), (101, 99), (95, 111)] * 3
+    for i, (home, away) in enumerate(games):
+        # Alternate venues: Celtics host every other game
+        if i % 2:
+            matchup.record_matchup("NBA", "Celtics", "Lakers", away, home, game_key=f"g{i}")
+        else:
+            matchup.record_matchup("NBA", "Lakers", "Celtics", home, away, game_key=f"g{i}")
+
+    stats = matchup.get_matchup_stats("NBA", "Lakers", "Celtics")
+    assert stats["games_played"] == 10  # recent window is unchanged
+    all_time = stats["all_time"]
+    totals = np.array([h + a for h, a in games])
+    lakers_margin = np.array([h - a for h, a in games])
+    assert all_time["games"] == len(games)
+    assert all_time["avg_total"] == pytest.approx(totals.mean(), abs=0.01)
+    assert all_time["total_std"] == pytest.approx(totals.std(ddof=1), abs=0.01)
+    assert all_time["avg_home_team_margin"] == pytest.approx(lakers_margin.mean(), abs=0.01)
+    assert all_time["home_team_wins"] == int((lakers_margin > 0).sum())
+    flipped = matchup.get_matchup_stats("NBA", "Celtics", "Lakers")["all_time"]
+    assert flipped["avg_home_team_margin"] == pytest.approx(-lakers_margin.mean(), abs=0.01)
+
+
+def test_game_key_makes_replays_idempotent(models):
+    matchup, _ = models
+    assert matchup.record_matchup("NBA", "Lakers", "Celtics", 110, 100, game_key="e1")
+    assert not matchup.record_matchup("NBA", "Lakers", "Celtics", 110, 100, game_key="e1")
+    # Spread and total picks on the same game count once
+    result = tm.apply_graded_picks([_graded("e2", 101, 99),
+                                    _graded("e2", 101, 99, pick_type="SPREAD", preds=(0.6, 0.4, 0.7, 0.5))])
+    assert result["matchup_updates"] == 1 and result["ensemble_updates"] == 2
+    assert matchup.get_matchup_stats("NBA", "Lakers", "Celtics")["all_time"]["games"] == 2
+
+
+def test_hedge_update_moves_weight_to_accurate_model(models):
+    _, ensemble = models
+    for _ in range(20):
+        ensemble.observe({"ensemble": 0.6, "lstm": 0.3, "matchup": 0.5, "monte_carlo": 0.9}, 1.0)
+    weights = {k: v for k, v in ensemble.weights.items() if not k.startswith("_")}
+    assert sum(weights.values()) == pytest.approx(1.0)
+    assert max(weights, key=weights.get) == "monte_carlo"
+    assert min(weights.values()) >= tm.ONLINE_MIN_WEIGHT - 1e-9
+    assert ensemble.weights["_online"]["updates"] == 20
+
+
+def test_ensemble_learns_from_hit_label_only_for_game_picks(models):
+    _, ensemble = models
+    # Totals: point predictions back the pick when on the picked side of the line
+    assert tm._model_hit_probabilities({"lstm": 220, "matchup": 210}, _graded("e1", 110, 100)) == \
+        {"lstm": 1.0, "matchup": 0.0}
+    # Point-scale spread predictions have no hit probability
+    assert tm.apply_graded_pick(_graded("e1", 110, 100, pick_type="SPREAD", side="Lakers", line=-3.5)) == \
+        {"matchup": True, "ensemble": False}
+    assert not tm.apply_graded_pick(_graded("e2", 110, 100, result="PUSH"))["ensemble"]
+    assert tm.apply_graded_pick(_graded("e3", 110, 100, pick_type="PLAYER_POINTS")) == \
+        {"matchup": False, "ensemble": False}
+    assert "_online" not in ensemble.weights
+
+
+def test_batch_is_persisted_atomically(models):
+    matchup, ensemble = models
+    tm.apply_graded_picks([_graded("e1", 110, 100)])
+    with open(ensemble.weights_path) as f:
+        assert json.load(f)["_online"]["updates"] == 1
+    with open(matchup.matchups_path) as f:
+        assert len(json.load(f)) == 1
+    assert not [p for p in os.listdir(tm.MODELS_DIR) if p.endswith(".tmp")]
+
+
+def test_batch_publishes_model_update_for_other_processes(models, monkeypatch):
+    import core.scheduler_worker as scheduler_worker
+    published = []
+    monkeypatch.setattr(scheduler_worker, "publish_model_update", lambda *names: published.extend(names))
+    tm.apply_graded_picks([_graded("e1", 110, 100)])
+    assert published == ["team_matchup", "game_ensemble"]
+
+    published.clear()
+    tm.apply_graded_picks([_graded("e1", 110, 100, preds=())])  # replayed game, no model preds
+    assert published == []
+
+
+def test_drift_flags_full_retrain_until_recorded(models, monkeypatch):
+    _, ensemble = models
+    ensemble.weights["_last_train_run_at"] = datetime.now().isoformat()
+    assert tm.needs_full_retrain() == (False, "online_current")
+
+    preds = {"ensemble": 0.9, "lstm": 0.9, "matchup": 0.9, "monte_carlo": 0.9}
+    for _ in range(40):
+        ensemble.observe(preds, 1.0)  # confident picks hit
+    assert not ensemble.drift_detected
+    for _ in range(40):
+        ensemble.observe(preds, 0.0)  # regime change: they stop hitting
+    assert ensemble.drift_detected
+    assert tm.needs_full_retrain() == (True, "drift_detected")
+
+    monkeypatch.setattr(ensemble, "_save_weights", lambda: None)
+    ensemble.record_training_run(graded_samples_seen=10, samples_used=10)
+    assert tm.needs_full_retrain() == (False, "online_current")
+
+    ensemble.weights["_last_train_run_at"] = (datetime.now() - timedelta(days=30)).isoformat()
+    assert tm.needs_full_retrain() == (True, "stale")